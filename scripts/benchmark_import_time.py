@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Cold-start import-time benchmark for package and CLI/MCP entry points.
+
+Each entry point is imported in a fresh interpreter with ``python -X
+importtime`` and the cumulative import time of everything the ``import``
+statement loaded is reported (interpreter start-up imports are excluded by
+subtracting a ``python -c pass`` run). The heaviest top-level packages
+pulled in are listed so that a regression can be traced to the dependency
+that caused it.
+
+Results can be saved as JSON and later compared against, which makes the
+script usable as a regression check:
+
+Usage:
+    uv run python scripts/benchmark_import_time.py
+    uv run python scripts/benchmark_import_time.py rss.cli.main market --runs 5
+    uv run python scripts/benchmark_import_time.py --json data/import_time.json
+    uv run python scripts/benchmark_import_time.py --baseline data/import_time.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess  # nosec B404
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# パッケージ本体と、セッションごとに起動される CLI / MCP サーバー
+DEFAULT_ENTRY_POINTS = [
+    "market",
+    "analyze",
+    "factor",
+    "strategy",
+    "news",
+    "edgar",
+    "rss",
+    "notebooklm",
+    "rss.cli.main",
+    "rss.mcp.server",
+    "notebooklm.mcp.server",
+]
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Import-time profile of one entry point.
+
+    Attributes
+    ----------
+    module : str
+        Imported module
+    total_ms : float
+        Median cumulative import time in milliseconds
+    heaviest : list[tuple[str, float]]
+        Top-level packages with the largest cumulative time (ms), from the
+        median run
+    error : str | None
+        Last line of stderr if the import failed
+    """
+
+    module: str
+    total_ms: float
+    heaviest: list[tuple[str, float]]
+    error: str | None = None
+
+
+def _run_importtime(code: str) -> tuple[list[tuple[int, str, int]], str | None]:
+    """Run ``code`` with ``-X importtime``.
+
+    Returns
+    -------
+    tuple[list[tuple[int, str, int]], str | None]
+        (depth, module, cumulative us) per imported module, and the error
+        line if the process failed
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(SRC_DIR), env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    records: list[tuple[int, str, int]] = []
+    other: list[str] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append((depth, name.strip(), int(cumulative)))
+    error = other[-1] if proc.returncode != 0 and other else None
+    return records, error
+
+
+def _top_level_total(records: list[tuple[int, str, int]]) -> int:
+    """Sum of cumulative time of the modules imported at depth 0."""
+    return sum(us for depth, _, us in records if depth == 0)
+
+
+def profile(
+    module: str, runs: int, top: int, startup: tuple[int, set[str]]
+) -> ImportProfile:
+    """Profile the cold-start import of ``module``.
+
+    Parameters
+    ----------
+    module : str
+        Module to import
+    runs : int
+        Number of fresh interpreters; the median is reported
+    top : int
+        Number of heaviest top-level packages to keep
+    startup : tuple[int, set[str]]
+        Import time and modules of interpreter start-up, excluded from
+        each run
+
+    Returns
+    -------
+    ImportProfile
+        Median total and heaviest packages
+    """
+    startup_us, startup_modules = startup
+    samples: list[tuple[int, list[tuple[int, str, int]]]] = []
+    for _ in range(runs):
+        records, error = _run_importtime(f"import {module}")
+        if error is not None:
+            return ImportProfile(module=module, total_ms=0.0, heaviest=[], error=error)
+        samples.append((_top_level_total(records) - startup_us, records))
+
+    samples.sort(key=lambda sample: sample[0])
+    total_us, records = samples[len(samples) // 2]
+
+    own_package = module.split(".", maxsplit=1)[0]
+    by_package: dict[str, int] = defaultdict(int)
+    for _, name, us in records:
+        package = name.split(".")[0]
+        if "." not in name and package not in {own_package, *startup_modules}:
+            by_package[package] = max(by_package[package], us)
+    heaviest = sorted(by_package.items(), key=lambda item: -item[1])[:top]
+
+    return ImportProfile(
+        module=module,
+        total_ms=total_us / 1000,
+        heaviest=[(name, us / 1000) for name, us in heaviest],
+    )
+
+
+def compare(
+    profiles: list[ImportProfile], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Return the entry points slower than ``baseline`` by more than tolerance."""
+    regressions = []
+    for p in profiles:
+        before = baseline.get(p.module)
+        if before and p.error is None and p.total_ms > before * (1 + tolerance):
+            regressions.append(
+                f"{p.module}: {before:.0f} ms -> {p.total_ms:.0f} ms "
+                f"(+{p.total_ms / before - 1:.0%})"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Run the import-time benchmark.
+
+    Returns
+    -------
+    int
+        Exit code (1 if a regression against --baseline was found)
+    """
+    parser = argparse.ArgumentParser(description="Cold-start import-time benchmark")
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=DEFAULT_ENTRY_POINTS,
+        help="Entry points to import (default: packages and CLI/MCP servers)",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=3, help="Fresh interpreters per entry (default: 3)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=3, help="Heaviest packages to list (default: 3)"
+    )
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare against a JSON file from --json"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown against --baseline (default: 0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    startup_runs = [_run_importtime("pass")[0] for _ in range(args.runs)]
+    startup = (
+        int(statistics.median(_top_level_total(run) for run in startup_runs)),
+        {name for _, name, _ in startup_runs[0]},
+    )
+    profiles = [
+        profile(module, args.runs, args.top, startup) for module in args.modules
+    ]
+
+    print(f"\n{'Entry point':<26} {'Import (ms)':>12}  Heaviest dependencies (ms)")
+    print("-" * 80)
+    for p in profiles:
+        if p.error is not None:
+            print(f"{p.module:<26} {'error':>12}  {p.error[:40]}")
+            continue
+        heaviest = ", ".join(f"{name} {ms:.0f}" for name, ms in p.heaviest)
+        print(f"{p.module:<26} {p.total_ms:>12.1f}  {heaviest}")
+    print()
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(p) for p in profiles], indent=2, ensure_ascii=False)
+        )
+
+    if args.baseline:
+        baseline = {
+            entry["module"]: entry["total_ms"]
+            for entry in json.loads(args.baseline.read_text())
+            if entry["error"] is None
+        }
+        regressions = compare(profiles, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
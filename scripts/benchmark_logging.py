@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for per-event logging overhead.
+
+Compares the caller-info processor and the file sink before and after the
+low-overhead implementation in ``utils_core.logging``:
+
+1. Caller info: ``inspect.stack()`` based lookup (before) vs
+   ``sys._getframe`` walk with per-code-object cache (after)
+2. End-to-end ``logger.debug`` to a JSON log file: the old processor with a
+   synchronous FileHandler (before) vs the new processor with a synchronous
+   FileHandler and with ``AsyncLogHandler`` (after)
+
+Usage:
+    uv run python scripts/benchmark_logging.py
+    uv run python scripts/benchmark_logging.py --events 20000
+"""
+
+import argparse
+import inspect
+import logging
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from utils_core.logging import config
+from utils_core.logging.config import add_caller_info, get_logger, setup_logging
+
+# 実際のアプリケーションと同程度の呼び出しの深さ
+CALL_DEPTH = 10
+
+
+def legacy_add_caller_info(
+    _: Any, __: Any, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """Caller-info processor as implemented before (inspect.stack based)."""
+    try:
+        frame = None
+        stack = inspect.stack()
+
+        for f in stack[4:12]:
+            if f.filename and f.function:
+                module = inspect.getmodule(f.frame)
+                if (
+                    module
+                    and not module.__name__.startswith("structlog")
+                    and not module.__name__.startswith("logging")
+                    and "site-packages" not in f.filename
+                ):
+                    frame = f
+                    break
+
+        if frame:
+            event_dict["caller"] = {
+                "filename": Path(frame.filename).name,
+                "function": frame.function,
+                "line": frame.lineno,
+            }
+    except Exception:  # nosec B110
+        pass
+
+    return event_dict
+
+
+def _nested(depth: int, func: Callable[[], Any]) -> Any:
+    """Call func at the given stack depth."""
+    if depth == 0:
+        return func()
+    return _nested(depth - 1, func)
+
+
+def measure_us(func: Callable[[], Any], events: int) -> float:
+    """Return the mean time per call in microseconds."""
+    for _ in range(min(events, 100)):
+        func()
+    start = time.perf_counter()
+    for _ in range(events):
+        func()
+    return (time.perf_counter() - start) / events * 1e6
+
+
+def bench_caller_info(events: int) -> tuple[float, float]:
+    """Per-event cost of the caller-info processor (before, after)."""
+
+    def run(processor: Callable[..., Any]) -> float:
+        def call() -> None:
+            processor(None, None, {"event": "bench"})
+
+        return _nested(CALL_DEPTH, lambda: measure_us(call, events))
+
+    return run(legacy_add_caller_info), run(add_caller_info)
+
+
+def bench_file_sink(
+    events: int,
+    log_file: Path,
+    processor: Callable[..., Any],
+    *,
+    async_file: bool,
+) -> float:
+    """Per-event cost of logger.debug to a JSON log file."""
+    # setup_logging はモジュール属性の add_caller_info をプロセッサーとして登録する
+    original = config.add_caller_info
+    config.add_caller_info = processor
+    try:
+        setup_logging(
+            level="WARNING",
+            file_level="DEBUG",
+            format="json",
+            log_file=log_file,
+            async_file=async_file,
+            force=True,
+        )
+    finally:
+        config.add_caller_info = original
+    logger = get_logger("bench.logging")
+
+    def call() -> None:
+        logger.debug("Cache hit", key="AAPL", size=128)
+
+    per_event = _nested(CALL_DEPTH, lambda: measure_us(call, events))
+    # 非同期ハンドラーのキューを書き出してから次の計測に移る
+    setup_logging(level="WARNING", log_file=log_file.with_suffix(".reset"), force=True)
+    return per_event
+
+
+def main() -> int:
+    """Run the logging micro-benchmark.
+
+    Returns
+    -------
+    int
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=5000,
+        help="Number of log events per measurement (default: 5000)",
+    )
+    args = parser.parse_args()
+
+    caller_before, caller_after = bench_caller_info(args.events)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        sink_before = bench_file_sink(
+            args.events,
+            log_dir / "before.log",
+            legacy_add_caller_info,
+            async_file=False,
+        )
+        sink_sync = bench_file_sink(
+            args.events, log_dir / "sync.log", add_caller_info, async_file=False
+        )
+        sink_async = bench_file_sink(
+            args.events, log_dir / "async.log", add_caller_info, async_file=True
+        )
+        logging.shutdown()
+
+    print(f"\n{'Benchmark':<44} {'Before (us)':>12} {'After (us)':>12} {'Speedup':>9}")
+    print("-" * 80)
+    for name, before, after in (
+        ("caller info processor", caller_before, caller_after),
+        ("logger.debug -> JSON file (sync handler)", sink_before, sink_sync),
+        ("logger.debug -> JSON file (AsyncLogHandler)", sink_before, sink_async),
+    ):
+        print(f"{name:<44} {before:>12.2f} {after:>12.2f} {before / after:>8.1f}x")
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
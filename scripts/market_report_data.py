@@ -29,6 +29,8 @@ Examples
 Notes
 -----
 - 各モジュールのエラーは独立して処理され、一つのモジュールが失敗しても他は続行
+- 騰落率とセクター分析の価格データは共有の取得計画（ReportDataPlan）から読み出され、
+  重複するティッカーは1回のバッチダウンロードで取得される
 - 出力ディレクトリは自動作成される
 - 終了コード 0 は少なくとも1つのファイル作成成功、1 は全て失敗
 
@@ -49,15 +51,42 @@ from pathlib import Path
 from typing import Any
 
 from analyze import generate_returns_report, get_upcoming_earnings
-from analyze.sector import analyze_sector_performance
+from analyze.reporting.data_plan import ReportDataPlan
+from analyze.returns import request_returns_data
+from analyze.sector import analyze_sector_performance, request_sector_data
 from database.utils import get_logger
 
 logger = get_logger(__name__)
 
 
-def collect_returns_data() -> dict[str, Any]:
+def build_data_plan() -> ReportDataPlan:
+    """Declare the price data of every report section in one data plan.
+
+    Returns
+    -------
+    ReportDataPlan
+        Data plan covering the returns and sector sections. Prices are
+        downloaded on first read, in as few batches as possible.
+    """
+    data_plan = ReportDataPlan()
+    request_returns_data(data_plan)
+    request_sector_data(data_plan)
+    logger.debug(
+        "Data plan built",
+        sections=[request.section for request in data_plan.requests],
+        batches=len(data_plan.batches()),
+    )
+    return data_plan
+
+
+def collect_returns_data(data_plan: ReportDataPlan | None = None) -> dict[str, Any]:
     """Collect returns data using generate_returns_report.
 
+    Parameters
+    ----------
+    data_plan : ReportDataPlan | None, optional
+        Shared data plan to read prices from.
+
     Returns
     -------
     dict[str, Any]
@@ -70,14 +99,19 @@ def collect_returns_data() -> dict[str, Any]:
     True
     """
     logger.debug("Collecting returns data")
-    result = generate_returns_report()
+    result = generate_returns_report(data_plan=data_plan)
     logger.info("Returns data collected", indices_count=len(result.get("indices", [])))
     return result
 
 
-def collect_sector_data() -> dict[str, Any]:
+def collect_sector_data(data_plan: ReportDataPlan | None = None) -> dict[str, Any]:
     """Collect sector analysis data using analyze_sector_performance.
 
+    Parameters
+    ----------
+    data_plan : ReportDataPlan | None, optional
+        Shared data plan to read sector ETF prices from.
+
     Returns
     -------
     dict[str, Any]
@@ -90,7 +124,7 @@ def collect_sector_data() -> dict[str, Any]:
     True
     """
     logger.debug("Collecting sector data")
-    result = analyze_sector_performance()
+    result = analyze_sector_performance(data_plan=data_plan)
     data = result.to_dict()
     logger.info(
         "Sector data collected",
@@ -152,10 +186,11 @@ def save_all_reports(output_dir: Path) -> None:
 
     success_count = 0
     total_count = 3
+    data_plan = build_data_plan()
 
     # Collect returns data
     try:
-        returns_data = collect_returns_data()
+        returns_data = collect_returns_data(data_plan)
         returns_file = output_dir / "returns.json"
         with returns_file.open("w", encoding="utf-8") as f:
             json.dump(returns_data, f, ensure_ascii=False, indent=2)
@@ -166,7 +201,7 @@ def save_all_reports(output_dir: Path) -> None:
 
     # Collect sector data
     try:
-        sector_data = collect_sector_data()
+        sector_data = collect_sector_data(data_plan)
         sectors_file = output_dir / "sectors.json"
         with sectors_file.open("w", encoding="utf-8") as f:
             json.dump(sector_data, f, ensure_ascii=False, indent=2)
@@ -26,7 +26,8 @@ Specify custom date range:
 Notes
 -----
 - Period is calculated as Tuesday-to-Tuesday (previous week's Tuesday to this week's Tuesday)
-- Uses yf.download for batch data retrieval
+- Uses yf.download for batch data retrieval; save_all_data declares every
+  section in one ReportDataPlan so all tickers are downloaded in a single batch
 - All returns are calculated as (end_price - start_price) / start_price
 """
 
@@ -42,6 +43,7 @@ from typing import Any
 import pandas as pd
 import yfinance as yf
 
+from analyze.reporting.data_plan import ReportDataPlan
 from database.utils import (
     calculate_weekly_comment_period,
     format_date_japanese,
@@ -149,10 +151,56 @@ def calculate_period_return(
     return float((end_price - start_price) / start_price)
 
 
+def fetch_window(start_date: date, end_date: date) -> tuple[date, date]:
+    """Return the price window needed for a weekly period.
+
+    Parameters
+    ----------
+    start_date : date
+        Start date of the period
+    end_date : date
+        End date of the period
+
+    Returns
+    -------
+    tuple[date, date]
+        First and last (inclusive) date to fetch, with a buffer on both sides
+    """
+    return start_date - timedelta(days=7), end_date + timedelta(days=2)
+
+
+def build_data_plan(start_date: date, end_date: date) -> ReportDataPlan:
+    """Declare the tickers of every section in one data plan.
+
+    Parameters
+    ----------
+    start_date : date
+        Start date of the period
+    end_date : date
+        End date of the period
+
+    Returns
+    -------
+    ReportDataPlan
+        Data plan covering indices, MAG7, SOX and sector ETFs. Prices are
+        downloaded in one batch on first read.
+    """
+    fetch_start, fetch_end = fetch_window(start_date, end_date)
+    data_plan = ReportDataPlan(as_of=fetch_end)
+    for section, tickers in (
+        ("indices", INDICES_TICKERS),
+        ("mag7", {**MAG7_TICKERS, SOX_TICKER: SOX_NAME}),
+        ("sectors", SECTOR_ETFS),
+    ):
+        data_plan.request(section, tickers, start=fetch_start, end=fetch_end)
+    return data_plan
+
+
 def fetch_weekly_returns(
     tickers: dict[str, str],
     start_date: date,
     end_date: date,
+    data_plan: ReportDataPlan | None = None,
 ) -> list[dict[str, Any]]:
     """Fetch weekly returns for a list of tickers.
 
@@ -164,6 +212,9 @@ def fetch_weekly_returns(
         Start date of the period
     end_date : date
         End date of the period
+    data_plan : ReportDataPlan | None, optional
+        Shared data plan to read prices from. If None, the tickers are
+        downloaded directly.
 
     Returns
     -------
@@ -185,22 +236,25 @@ def fetch_weekly_returns(
 
     try:
         # Fetch data with some buffer before start_date
-        fetch_start = start_date - timedelta(days=7)
-        fetch_end = end_date + timedelta(days=3)
-
-        logger.debug(
-            "Downloading data",
-            tickers=ticker_list,
-            fetch_start=str(fetch_start),
-            fetch_end=str(fetch_end),
-        )
-
-        df = yf.download(
-            ticker_list,
-            start=fetch_start.isoformat(),
-            end=fetch_end.isoformat(),
-            progress=False,
-        )
+        fetch_start, fetch_end = fetch_window(start_date, end_date)
+
+        if data_plan is not None:
+            df = pd.concat({"Close": data_plan.close_prices(ticker_list)}, axis=1)
+        else:
+            logger.debug(
+                "Downloading data",
+                tickers=ticker_list,
+                fetch_start=str(fetch_start),
+                fetch_end=str(fetch_end),
+            )
+
+            df = yf.download(
+                ticker_list,
+                start=fetch_start.isoformat(),
+                # yfinance end date is exclusive
+                end=(fetch_end + timedelta(days=1)).isoformat(),
+                progress=False,
+            )
 
         if df is None or df.empty:
             logger.warning("No data returned from yfinance")
@@ -287,7 +341,11 @@ def fetch_weekly_returns(
     return results
 
 
-def collect_indices_data(start_date: date, end_date: date) -> dict[str, Any]:
+def collect_indices_data(
+    start_date: date,
+    end_date: date,
+    data_plan: ReportDataPlan | None = None,
+) -> dict[str, Any]:
     """Collect indices data for weekly comment.
 
     Parameters
@@ -296,6 +354,8 @@ def collect_indices_data(start_date: date, end_date: date) -> dict[str, Any]:
         Start date of the period
     end_date : date
         End date of the period
+    data_plan : ReportDataPlan | None, optional
+        Shared data plan to read prices from
 
     Returns
     -------
@@ -309,7 +369,7 @@ def collect_indices_data(start_date: date, end_date: date) -> dict[str, Any]:
     """
     logger.info("Collecting indices data")
 
-    indices = fetch_weekly_returns(INDICES_TICKERS, start_date, end_date)
+    indices = fetch_weekly_returns(INDICES_TICKERS, start_date, end_date, data_plan)
 
     return {
         "as_of": end_date.isoformat(),
@@ -321,7 +381,11 @@ def collect_indices_data(start_date: date, end_date: date) -> dict[str, Any]:
     }
 
 
-def collect_mag7_data(start_date: date, end_date: date) -> dict[str, Any]:
+def collect_mag7_data(
+    start_date: date,
+    end_date: date,
+    data_plan: ReportDataPlan | None = None,
+) -> dict[str, Any]:
     """Collect MAG7 data for weekly comment.
 
     Parameters
@@ -330,6 +394,8 @@ def collect_mag7_data(start_date: date, end_date: date) -> dict[str, Any]:
         Start date of the period
     end_date : date
         End date of the period
+    data_plan : ReportDataPlan | None, optional
+        Shared data plan to read prices from
 
     Returns
     -------
@@ -345,7 +411,7 @@ def collect_mag7_data(start_date: date, end_date: date) -> dict[str, Any]:
     logger.info("Collecting MAG7 data")
 
     # Fetch MAG7 returns
-    mag7 = fetch_weekly_returns(MAG7_TICKERS, start_date, end_date)
+    mag7 = fetch_weekly_returns(MAG7_TICKERS, start_date, end_date, data_plan)
 
     # Sort by weekly return (descending)
     mag7_sorted = sorted(
@@ -355,7 +421,9 @@ def collect_mag7_data(start_date: date, end_date: date) -> dict[str, Any]:
     )
 
     # Fetch SOX index
-    sox_data = fetch_weekly_returns({SOX_TICKER: SOX_NAME}, start_date, end_date)
+    sox_data = fetch_weekly_returns(
+        {SOX_TICKER: SOX_NAME}, start_date, end_date, data_plan
+    )
     sox = sox_data[0] if sox_data else None
 
     return {
@@ -369,7 +437,11 @@ def collect_mag7_data(start_date: date, end_date: date) -> dict[str, Any]:
     }
 
 
-def collect_sectors_data(start_date: date, end_date: date) -> dict[str, Any]:
+def collect_sectors_data(
+    start_date: date,
+    end_date: date,
+    data_plan: ReportDataPlan | None = None,
+) -> dict[str, Any]:
     """Collect sector data for weekly comment.
 
     Parameters
@@ -378,6 +450,8 @@ def collect_sectors_data(start_date: date, end_date: date) -> dict[str, Any]:
         Start date of the period
     end_date : date
         End date of the period
+    data_plan : ReportDataPlan | None, optional
+        Shared data plan to read prices from
 
     Returns
     -------
@@ -393,7 +467,7 @@ def collect_sectors_data(start_date: date, end_date: date) -> dict[str, Any]:
     """
     logger.info("Collecting sector data")
 
-    sectors = fetch_weekly_returns(SECTOR_ETFS, start_date, end_date)
+    sectors = fetch_weekly_returns(SECTOR_ETFS, start_date, end_date, data_plan)
 
     # Sort by weekly return
     sectors_sorted = sorted(
@@ -461,10 +535,11 @@ def save_all_data(
 
     output_dir.mkdir(parents=True, exist_ok=True)
     results: dict[str, bool] = {}
+    data_plan = build_data_plan(start_date, end_date)
 
     # Collect indices data
     try:
-        indices_data = collect_indices_data(start_date, end_date)
+        indices_data = collect_indices_data(start_date, end_date, data_plan)
         save_json(indices_data, output_dir / "indices.json")
         results["indices.json"] = True
     except Exception as e:
@@ -473,7 +548,7 @@ def save_all_data(
 
     # Collect MAG7 data
     try:
-        mag7_data = collect_mag7_data(start_date, end_date)
+        mag7_data = collect_mag7_data(start_date, end_date, data_plan)
         save_json(mag7_data, output_dir / "mag7.json")
         results["mag7.json"] = True
     except Exception as e:
@@ -482,7 +557,7 @@ def save_all_data(
 
     # Collect sectors data
     try:
-        sectors_data = collect_sectors_data(start_date, end_date)
+        sectors_data = collect_sectors_data(start_date, end_date, data_plan)
         save_json(sectors_data, output_dir / "sectors.json")
         results["sectors.json"] = True
     except Exception as e:
@@ -29,41 +29,81 @@ integration
     Market data integration module (fetch from market package and analyze)
 """
 
-from analyze import sector
-from analyze.earnings import EarningsCalendar, EarningsData, get_upcoming_earnings
-from analyze.integration import (
-    MarketDataAnalyzer,
-    analyze_market_data,
-    fetch_and_analyze,
-)
-from analyze.returns import (
-    RETURN_PERIODS,
-    TICKERS_GLOBAL_INDICES,
-    TICKERS_MAG7,
-    TICKERS_SECTORS,
-    TICKERS_US_INDICES,
-    calculate_multi_period_returns,
-    calculate_return,
-    fetch_topix_data,
-    generate_returns_report,
-)
-from analyze.statistics.types import (
-    CorrelationMethod,
-    CorrelationResult,
-    DescriptiveStats,
-)
-from analyze.technical import (
-    BollingerBandsParams,
-    BollingerBandsResult,
-    EMAParams,
-    MACDParams,
-    MACDResult,
-    ReturnParams,
-    RSIParams,
-    SMAParams,
-    VolatilityParams,
-)
-from analyze.types import TickerInfo
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from analyze import sector
+    from analyze.earnings import EarningsCalendar, EarningsData, get_upcoming_earnings
+    from analyze.integration import (
+        MarketDataAnalyzer,
+        analyze_market_data,
+        fetch_and_analyze,
+    )
+    from analyze.returns import (
+        RETURN_PERIODS,
+        TICKERS_GLOBAL_INDICES,
+        TICKERS_MAG7,
+        TICKERS_SECTORS,
+        TICKERS_US_INDICES,
+        calculate_multi_period_returns,
+        calculate_return,
+        fetch_topix_data,
+        generate_returns_report,
+    )
+    from analyze.statistics.types import (
+        CorrelationMethod,
+        CorrelationResult,
+        DescriptiveStats,
+    )
+    from analyze.technical import (
+        BollingerBandsParams,
+        BollingerBandsResult,
+        EMAParams,
+        MACDParams,
+        MACDResult,
+        ReturnParams,
+        RSIParams,
+        SMAParams,
+        VolatilityParams,
+    )
+    from analyze.types import TickerInfo
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "sector": "analyze.sector",
+    "EarningsCalendar": "analyze.earnings",
+    "EarningsData": "analyze.earnings",
+    "get_upcoming_earnings": "analyze.earnings",
+    "MarketDataAnalyzer": "analyze.integration",
+    "analyze_market_data": "analyze.integration",
+    "fetch_and_analyze": "analyze.integration",
+    "RETURN_PERIODS": "analyze.returns",
+    "TICKERS_GLOBAL_INDICES": "analyze.returns",
+    "TICKERS_MAG7": "analyze.returns",
+    "TICKERS_SECTORS": "analyze.returns",
+    "TICKERS_US_INDICES": "analyze.returns",
+    "calculate_multi_period_returns": "analyze.returns",
+    "calculate_return": "analyze.returns",
+    "fetch_topix_data": "analyze.returns",
+    "generate_returns_report": "analyze.returns",
+    "CorrelationMethod": "analyze.statistics.types",
+    "CorrelationResult": "analyze.statistics.types",
+    "DescriptiveStats": "analyze.statistics.types",
+    "BollingerBandsParams": "analyze.technical",
+    "BollingerBandsResult": "analyze.technical",
+    "EMAParams": "analyze.technical",
+    "MACDParams": "analyze.technical",
+    "MACDResult": "analyze.technical",
+    "ReturnParams": "analyze.technical",
+    "RSIParams": "analyze.technical",
+    "SMAParams": "analyze.technical",
+    "VolatilityParams": "analyze.technical",
+    "TickerInfo": "analyze.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "RETURN_PERIODS",
@@ -3,24 +3,49 @@
 This module provides configuration loading utilities and symbol group definitions.
 """
 
-from analyze.config.loader import (
-    get_return_periods,
-    get_symbol_group,
-    get_symbols,
-    load_symbols_config,
-)
-from analyze.config.models import (
-    CommoditySymbol,
-    CurrencyPairSymbol,
-    IndexSymbol,
-    IndicesConfig,
-    Mag7Symbol,
-    ReturnPeriodsConfig,
-    SectorStocksConfig,
-    SectorStockSymbol,
-    SectorSymbol,
-    SymbolsConfig,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from analyze.config.loader import (
+        get_return_periods,
+        get_symbol_group,
+        get_symbols,
+        load_symbols_config,
+    )
+    from analyze.config.models import (
+        CommoditySymbol,
+        CurrencyPairSymbol,
+        IndexSymbol,
+        IndicesConfig,
+        Mag7Symbol,
+        ReturnPeriodsConfig,
+        SectorStocksConfig,
+        SectorStockSymbol,
+        SectorSymbol,
+        SymbolsConfig,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "get_return_periods": "analyze.config.loader",
+    "get_symbol_group": "analyze.config.loader",
+    "get_symbols": "analyze.config.loader",
+    "load_symbols_config": "analyze.config.loader",
+    "CommoditySymbol": "analyze.config.models",
+    "CurrencyPairSymbol": "analyze.config.models",
+    "IndexSymbol": "analyze.config.models",
+    "IndicesConfig": "analyze.config.models",
+    "Mag7Symbol": "analyze.config.models",
+    "ReturnPeriodsConfig": "analyze.config.models",
+    "SectorStocksConfig": "analyze.config.models",
+    "SectorStockSymbol": "analyze.config.models",
+    "SectorSymbol": "analyze.config.models",
+    "SymbolsConfig": "analyze.config.models",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "CommoditySymbol",
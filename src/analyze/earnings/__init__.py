@@ -32,8 +32,22 @@ Examples
 >>> results = calendar.get_upcoming_earnings(days_ahead=14)
 """
 
-from analyze.earnings.earnings import EarningsCalendar, get_upcoming_earnings
-from analyze.earnings.types import EarningsData
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from analyze.earnings.earnings import EarningsCalendar, get_upcoming_earnings
+    from analyze.earnings.types import EarningsData
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "EarningsCalendar": "analyze.earnings.earnings",
+    "get_upcoming_earnings": "analyze.earnings.earnings",
+    "EarningsData": "analyze.earnings.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "EarningsCalendar",
@@ -16,11 +16,25 @@ fetch_and_analyze
     Convenience function to fetch and analyze market data
 """
 
-from analyze.integration.market_integration import (
-    MarketDataAnalyzer,
-    analyze_market_data,
-    fetch_and_analyze,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from analyze.integration.market_integration import (
+        MarketDataAnalyzer,
+        analyze_market_data,
+        fetch_and_analyze,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "MarketDataAnalyzer": "analyze.integration.market_integration",
+    "analyze_market_data": "analyze.integration.market_integration",
+    "fetch_and_analyze": "analyze.integration.market_integration",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "MarketDataAnalyzer",
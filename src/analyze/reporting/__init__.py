@@ -1,30 +1,63 @@
 """reporting - パフォーマンスレポート生成モジュール."""
 
-from analyze.reporting import metal, us_treasury, vix
-from analyze.reporting.currency import CurrencyAnalyzer
-from analyze.reporting.currency_agent import CurrencyAnalyzer4Agent, CurrencyResult
-from analyze.reporting.interest_rate import InterestRateAnalyzer
-from analyze.reporting.interest_rate_agent import (
-    InterestRateAnalyzer4Agent,
-    InterestRateResult,
-)
-from analyze.reporting.performance import PerformanceAnalyzer
-from analyze.reporting.performance_agent import (
-    PerformanceAnalyzer4Agent,
-    PerformanceResult,
-)
-from analyze.reporting.upcoming_events import (
-    MAJOR_RELEASES,
-    EarningsDateInfo,
-    EconomicReleaseInfo,
-    UpcomingEventsAnalyzer,
-    get_upcoming_earnings,
-    get_upcoming_economic_releases,
-)
-from analyze.reporting.upcoming_events_agent import (
-    UpcomingEvents4Agent,
-    UpcomingEventsResult,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from analyze.reporting import metal, us_treasury, vix
+    from analyze.reporting.currency import CurrencyAnalyzer
+    from analyze.reporting.currency_agent import CurrencyAnalyzer4Agent, CurrencyResult
+    from analyze.reporting.data_plan import ReportDataPlan
+    from analyze.reporting.interest_rate import InterestRateAnalyzer
+    from analyze.reporting.interest_rate_agent import (
+        InterestRateAnalyzer4Agent,
+        InterestRateResult,
+    )
+    from analyze.reporting.performance import PerformanceAnalyzer
+    from analyze.reporting.performance_agent import (
+        PerformanceAnalyzer4Agent,
+        PerformanceResult,
+    )
+    from analyze.reporting.upcoming_events import (
+        MAJOR_RELEASES,
+        EarningsDateInfo,
+        EconomicReleaseInfo,
+        UpcomingEventsAnalyzer,
+        get_upcoming_earnings,
+        get_upcoming_economic_releases,
+    )
+    from analyze.reporting.upcoming_events_agent import (
+        UpcomingEvents4Agent,
+        UpcomingEventsResult,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "metal": "analyze.reporting.metal",
+    "us_treasury": "analyze.reporting.us_treasury",
+    "vix": "analyze.reporting.vix",
+    "CurrencyAnalyzer": "analyze.reporting.currency",
+    "CurrencyAnalyzer4Agent": "analyze.reporting.currency_agent",
+    "CurrencyResult": "analyze.reporting.currency_agent",
+    "ReportDataPlan": "analyze.reporting.data_plan",
+    "InterestRateAnalyzer": "analyze.reporting.interest_rate",
+    "InterestRateAnalyzer4Agent": "analyze.reporting.interest_rate_agent",
+    "InterestRateResult": "analyze.reporting.interest_rate_agent",
+    "PerformanceAnalyzer": "analyze.reporting.performance",
+    "PerformanceAnalyzer4Agent": "analyze.reporting.performance_agent",
+    "PerformanceResult": "analyze.reporting.performance_agent",
+    "MAJOR_RELEASES": "analyze.reporting.upcoming_events",
+    "EarningsDateInfo": "analyze.reporting.upcoming_events",
+    "EconomicReleaseInfo": "analyze.reporting.upcoming_events",
+    "UpcomingEventsAnalyzer": "analyze.reporting.upcoming_events",
+    "get_upcoming_earnings": "analyze.reporting.upcoming_events",
+    "get_upcoming_economic_releases": "analyze.reporting.upcoming_events",
+    "UpcomingEvents4Agent": "analyze.reporting.upcoming_events_agent",
+    "UpcomingEventsResult": "analyze.reporting.upcoming_events_agent",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "MAJOR_RELEASES",
@@ -39,6 +72,7 @@ __all__ = [
     "PerformanceAnalyzer",
     "PerformanceAnalyzer4Agent",
     "PerformanceResult",
+    "ReportDataPlan",
     "UpcomingEvents4Agent",
     "UpcomingEventsAnalyzer",
     "UpcomingEventsResult",
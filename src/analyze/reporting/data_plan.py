@@ -0,0 +1,400 @@
+"""data_plan.py
+
+レポート各セクションの価格データ取得を1つの取得計画にまとめる。
+
+各セクションは必要なシンボルと期間（lookback）を宣言するだけで、
+実際のダウンロードは計画全体を見て最小のバッチにまとめて行う。
+同じシンボルを複数セクションが要求しても取得は1回で、
+全セクションは共有のメモリ上パネル（日付 × シンボルの終値）から読み出す。
+
+Examples
+--------
+>>> plan = ReportDataPlan()
+>>> plan.request("indices", ["^GSPC", "^DJI"], lookback_days=365 * 6)
+>>> plan.request("sectors", ["XLK", "XLF"], lookback_days=31)
+>>> close = plan.close_prices(["^GSPC", "XLK"])  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import pandas as pd
+
+from market.yfinance import FetchOptions, YFinanceFetcher
+from utils_core.logging import get_logger
+
+logger = get_logger(__name__, module="data_plan")
+
+type PriceDownloader = Callable[[list[str], date, date], pd.DataFrame]
+"""(symbols, start, end) を受け取り、日付 × シンボルの終値を返す関数（end を含む）."""
+
+
+@dataclass(frozen=True)
+class SectionRequest:
+    """レポートセクションが必要とする価格データの宣言.
+
+    Attributes
+    ----------
+    section : str
+        セクション名（ログ用）
+    symbols : tuple[str, ...]
+        必要なシンボル
+    start : date
+        取得開始日
+    end : date
+        取得終了日（この日を含む）
+    """
+
+    section: str
+    symbols: tuple[str, ...]
+    start: date
+    end: date
+
+
+@dataclass(frozen=True)
+class DownloadBatch:
+    """1回のバッチダウンロード.
+
+    Attributes
+    ----------
+    symbols : tuple[str, ...]
+        まとめて取得するシンボル
+    start : date
+        取得開始日
+    end : date
+        取得終了日（この日を含む）
+    """
+
+    symbols: tuple[str, ...]
+    start: date
+    end: date
+
+
+def plan_downloads(requests: Iterable[SectionRequest]) -> list[DownloadBatch]:
+    """セクション要求を最小のバッチダウンロードにまとめる.
+
+    シンボルごとに全要求の期間を包含する範囲を求め、
+    同じ範囲になったシンボルを1つのバッチにまとめる。
+    各シンボルはちょうど1つのバッチに含まれる。
+
+    Parameters
+    ----------
+    requests : Iterable[SectionRequest]
+        セクション要求
+
+    Returns
+    -------
+    list[DownloadBatch]
+        開始日・終了日順のバッチ（シンボルは初出順）
+    """
+    spans: dict[str, tuple[date, date]] = {}
+    for request in requests:
+        for symbol in request.symbols:
+            if symbol in spans:
+                start, end = spans[symbol]
+                spans[symbol] = (min(start, request.start), max(end, request.end))
+            else:
+                spans[symbol] = (request.start, request.end)
+
+    grouped: dict[tuple[date, date], list[str]] = {}
+    for symbol, span in spans.items():
+        grouped.setdefault(span, []).append(symbol)
+
+    return [
+        DownloadBatch(symbols=tuple(symbols), start=start, end=end)
+        for (start, end), symbols in sorted(grouped.items())
+    ]
+
+
+def download_close_prices(symbols: list[str], start: date, end: date) -> pd.DataFrame:
+    """YFinanceFetcher で複数シンボルの終値を一括取得する.
+
+    計画なしの取得経路と同じく ``YFinanceFetcher.fetch`` を通すため、
+    リトライ・HTTP セッション・キャッシュの扱いも共通になる。
+
+    Parameters
+    ----------
+    symbols : list[str]
+        シンボル
+    start : date
+        取得開始日
+    end : date
+        取得終了日（この日を含む）
+
+    Returns
+    -------
+    pd.DataFrame
+        日付 × シンボルの終値（取得できなかったシンボルは含まない）
+    """
+    results = YFinanceFetcher().fetch(
+        FetchOptions(
+            symbols=symbols,
+            start_date=start.isoformat(),
+            # yfinance の end は当日を含まない
+            end_date=(end + timedelta(days=1)).isoformat(),
+        )
+    )
+    closes = {
+        result.symbol: result.data["close"]
+        for result in results
+        if not result.is_empty and "close" in result.data.columns
+    }
+    if not closes:
+        return pd.DataFrame()
+    return pd.DataFrame(closes)
+
+
+class ReportDataPlan:
+    """レポート全体の価格データ取得計画と共有パネル.
+
+    ``request`` で各セクションの必要データを宣言し、最初の読み出し時に
+    計画全体を ``plan_downloads`` でまとめたバッチとして一度だけ取得する。
+    計画にないシンボルが読み出された場合は、その分だけ追加で取得する。
+
+    Parameters
+    ----------
+    downloader : PriceDownloader | None, optional
+        価格取得関数。None の場合は ``download_close_prices``（YFinanceFetcher）
+    as_of : date | None, optional
+        lookback の基準日。None の場合は今日
+
+    Examples
+    --------
+    >>> plan = ReportDataPlan()
+    >>> plan.request("mag7", ["AAPL", "MSFT"], lookback_days=365 * 5)
+    >>> plan.request("weekly", ["AAPL", "^SOX"], lookback_days=14)
+    >>> [len(batch.symbols) for batch in plan.batches()]
+    [2, 1]
+    """
+
+    def __init__(
+        self,
+        downloader: PriceDownloader | None = None,
+        *,
+        as_of: date | None = None,
+    ) -> None:
+        self._downloader = downloader or download_close_prices
+        self.as_of = as_of or date.today()
+        self._requests: list[SectionRequest] = []
+        self._frames: list[pd.DataFrame] = []
+        self._fetched: set[str] = set()
+        self._panel: pd.DataFrame | None = None
+        self.download_count = 0
+
+    @property
+    def requests(self) -> list[SectionRequest]:
+        """宣言済みのセクション要求."""
+        return list(self._requests)
+
+    def request(
+        self,
+        section: str,
+        symbols: Iterable[str],
+        *,
+        lookback_days: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> None:
+        """セクションが必要とするシンボルと期間を宣言する.
+
+        Parameters
+        ----------
+        section : str
+            セクション名
+        symbols : Iterable[str]
+            必要なシンボル
+        lookback_days : int | None, optional
+            ``end`` から遡る日数（``start`` 未指定時に使用）
+        start : date | None, optional
+            取得開始日
+        end : date | None, optional
+            取得終了日。None の場合は ``as_of``
+
+        Raises
+        ------
+        ValueError
+            ``start`` と ``lookback_days`` のどちらも指定されていない場合
+        """
+        end_date = end or self.as_of
+        if start is None:
+            if lookback_days is None:
+                msg = "Either start or lookback_days must be specified"
+                raise ValueError(msg)
+            start = end_date - timedelta(days=lookback_days)
+
+        request = SectionRequest(
+            section=section,
+            symbols=tuple(dict.fromkeys(symbols)),
+            start=start,
+            end=end_date,
+        )
+        self._requests.append(request)
+        logger.debug(
+            "Section data requested",
+            section=section,
+            symbol_count=len(request.symbols),
+            start=str(request.start),
+            end=str(request.end),
+        )
+
+    def batches(self) -> list[DownloadBatch]:
+        """まだ取得していないシンボルのバッチダウンロード計画を返す."""
+        pending = [
+            SectionRequest(
+                section=request.section,
+                symbols=tuple(s for s in request.symbols if s not in self._fetched),
+                start=request.start,
+                end=request.end,
+            )
+            for request in self._requests
+        ]
+        return plan_downloads(request for request in pending if request.symbols)
+
+    def execute(self) -> pd.DataFrame:
+        """計画済みで未取得のバッチを取得し、共有パネルを返す.
+
+        Returns
+        -------
+        pd.DataFrame
+            日付 × シンボルの終値パネル
+        """
+        batches = self.batches()
+        for batch in batches:
+            logger.info(
+                "Downloading planned batch",
+                symbol_count=len(batch.symbols),
+                start=str(batch.start),
+                end=str(batch.end),
+            )
+            frame = self._downloader(list(batch.symbols), batch.start, batch.end)
+            self.download_count += 1
+            self._fetched.update(batch.symbols)
+            if not frame.empty:
+                self._frames.append(frame)
+                self._panel = None
+
+        if self._panel is None:
+            self._panel = (
+                pd.concat(self._frames, axis=1).sort_index()
+                if self._frames
+                else pd.DataFrame()
+            )
+        return self._panel
+
+    def close_prices(
+        self,
+        symbols: Iterable[str],
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        lookback_days: int | None = None,
+    ) -> pd.DataFrame:
+        """共有パネルから終値を読み出す.
+
+        計画にないシンボルは追加で取得する。取得開始日は ``start``、
+        未指定なら計画全体の開始日と ``end`` から ``lookback_days`` 遡った日の
+        早い方とする。
+
+        Parameters
+        ----------
+        symbols : Iterable[str]
+            読み出すシンボル
+        start : date | None, optional
+            開始日（None の場合は取得済みの全期間）
+        end : date | None, optional
+            終了日（この日を含む）
+        lookback_days : int | None, optional
+            計画外シンボルを取得する、``end`` から遡る日数
+
+        Returns
+        -------
+        pd.DataFrame
+            日付 × シンボルの終値。データのないシンボルは列に含まない
+
+        Raises
+        ------
+        ValueError
+            計画外シンボルがあり、取得期間を決められない場合
+        """
+        symbols = list(dict.fromkeys(symbols))
+        unplanned = [
+            s
+            for s in symbols
+            if s not in self._fetched
+            and not any(s in request.symbols for request in self._requests)
+        ]
+        if unplanned:
+            logger.warning(
+                "Symbols not in data plan, fetching separately",
+                symbols=unplanned,
+            )
+            # 期間指定がなければ計画全体の期間と lookback_days の長い方で取得する
+            fetch_end = end or max((r.end for r in self._requests), default=None)
+            fetch_start = start
+            if fetch_start is None:
+                starts = [r.start for r in self._requests]
+                if lookback_days is not None:
+                    starts.append(
+                        (fetch_end or self.as_of) - timedelta(days=lookback_days)
+                    )
+                fetch_start = min(starts, default=None)
+            self.request(
+                "unplanned",
+                unplanned,
+                start=fetch_start,
+                end=fetch_end,
+                lookback_days=lookback_days,
+            )
+
+        panel = self.execute()
+        columns = [s for s in symbols if s in panel.columns]
+        close = panel.loc[:, columns]
+        if close.empty:
+            return close
+        if start is not None:
+            close = close.loc[close.index >= pd.Timestamp(start)]
+        if end is not None:
+            close = close.loc[close.index < pd.Timestamp(end + timedelta(days=1))]
+        return close
+
+    def close_long(
+        self, symbols: Iterable[str], *, lookback_days: int | None = None
+    ) -> pd.DataFrame:
+        """共有パネルの終値を縦持ち形式で読み出す.
+
+        ``PerformanceAnalyzer.get_close_dataframe`` と同じ形式を返す。
+
+        Parameters
+        ----------
+        symbols : Iterable[str]
+            読み出すシンボル
+        lookback_days : int | None, optional
+            計画外シンボルを取得する日数（``close_prices`` 参照）
+
+        Returns
+        -------
+        pd.DataFrame
+            Date, symbol, variable, value カラムを持つ終値データ
+        """
+        close = self.close_prices(symbols, lookback_days=lookback_days)
+        close = close.rename_axis(index="Date", columns="symbol")
+        long_df = (
+            close.reset_index()
+            .melt(id_vars="Date", var_name="symbol", value_name="value")
+            .dropna(subset=["value"])
+            .assign(variable="close")
+        )
+        return long_df.reindex(columns=["Date", "symbol", "variable", "value"])
+
+
+__all__ = [
+    "DownloadBatch",
+    "PriceDownloader",
+    "ReportDataPlan",
+    "SectionRequest",
+    "download_close_prices",
+    "plan_downloads",
+]
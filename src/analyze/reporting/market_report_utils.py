@@ -16,6 +16,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 import yfinance as yf
 
+from analyze.statistics.kalman import BatchKalmanBeta
+from analyze.statistics.regression import rolling_regression
 from utils_core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -740,8 +742,6 @@ def calculate_kalman_beta(
     Returns:
         pd.DataFrame: カルマンフィルタで推定された時変ベータ値
     """
-    from statsmodels.tsa.statespace.mlemodel import MLEModel
-
     # Date列をDatetime型にし、インデックスに設定
     df_price["Date"] = pd.to_datetime(df_price["Date"])
 
@@ -775,125 +775,37 @@ def calculate_kalman_beta(
         df_return, index="Date", columns="Ticker", values="returns"
     ).dropna(how="all")
 
-    # 2. カルマンフィルタによるベータ推定
-    market_returns = rtn[target_col].dropna()
+    # 2. カルマンフィルタによるベータ推定（全銘柄を一括で推定）
+    rtn = rtn.loc[rtn[target_col].notna()]
     tickers = [col for col in rtn.columns if col != target_col]
 
-    # カスタム状態空間モデルクラス
-    class TimevaryingBetaModel(MLEModel):
-        def __init__(self, endog, exog):
-            # endog: 個別銘柄リターン
-            # exog: 市場リターン
-            super().__init__(
-                endog, k_states=1, exog=exog, initialization="approximate_diffuse"
-            )
-
-            # 状態空間表現の設定
-            # 観測方程式: y_t = d + Z * β_t + ε_t
-            self["design"] = np.array([[1.0]])  # Z (1x1)
-            self["obs_intercept"] = np.array([0.0])  # d
-            self["obs_cov"] = np.array([[1.0]])  # H (観測誤差分散)
-
-            # 状態方程式: β_t = c + T * β_{t-1} + η_t
-            self["transition"] = np.array([[1.0]])  # T (ランダムウォーク)
-            self["state_intercept"] = np.array([0.0])  # c
-            self["state_cov"] = np.array([[0.01]])  # Q (状態誤差分散、初期値)
-
-        @property
-        def param_names(self):
-            return ["obs_var", "state_var"]
-
-        @property
-        def start_params(self):
-            return np.array([1.0, 0.01])
-
-        def update(self, params, **kwargs):  # type: ignore[override]
-            params = super().update(params, **kwargs)
-            # パラメータを状態空間モデルに反映
-            self["obs_cov", 0, 0] = params[0]  # 観測誤差分散
-            self["state_cov", 0, 0] = params[1]  # 状態誤差分散
-
-    # 各銘柄に対してカルマンフィルタを適用
-    beta_results = []
-
-    for ticker in tickers:
-        # 共通のインデックスでデータを揃える
-        stock_returns = rtn[ticker].dropna()
-        common_idx = stock_returns.index.intersection(market_returns.index)
-
-        if len(common_idx) < rolling_window:
-            # データが不足している場合はスキップ
-            continue
-
-        y = stock_returns.loc[common_idx].values
-        X = market_returns.loc[common_idx].values.reshape(-1, 1)
-
-        # 初期値の推定（最初のrolling_window期間でOLS）
-        warmup_y = y[:rolling_window]
-        warmup_X = X[:rolling_window]
-
-        # 説明変数に市場リターンを含める（外生変数として）
-        # 観測方程式を y_t = α + β_t * X_t + ε_t の形にするため、
-        # 観測値を y_t - α と変換し、design行列をX_tにする
-
-        # OLSで初期アルファとベータを推定
-        from scipy.stats import linregress
-
-        slope_init, _intercept_init, _, _, _ = linregress(warmup_X.flatten(), warmup_y)
-
-        # モデルの構築（外生変数を使わず、観測値を調整する方法）
-        # y_adjusted = y - intercept (アルファを除去)
-        # 観測方程式: y_adjusted_t = β_t * X_t + ε_t
-
-        # design行列をX_tに設定するため、時変にする必要がある
-        # statsmodelsのカルマンフィルタは時変design行列をサポート
-
-        # より簡単な実装: カルマンフィルタを手動実装
-        # または、pykalmanを使用
-
-        try:
-            from pykalman import KalmanFilter  # type: ignore[import-not-found]
-
-            # 観測行列を市場リターンに設定（時変）
-            observation_matrices = X.reshape(-1, 1, 1)  # (T, 1, 1)
-
-            # カルマンフィルタの設定
-            kf = KalmanFilter(
-                transition_matrices=np.array([[1.0]]),  # ランダムウォーク
-                observation_matrices=observation_matrices,
-                transition_covariance=np.array([[0.001]]),  # 状態ノイズ（小さい値）
-                observation_covariance=np.array([[np.var(y)]]),  # 観測ノイズ
-                initial_state_mean=np.array([slope_init]),
-                initial_state_covariance=np.array([[1.0]]),
-                n_dim_state=1,
-                n_dim_obs=1,
-            )
-
-            # EMアルゴリズムでパラメータを学習
-            kf = kf.em(y.reshape(-1, 1), n_iter=10)
-
-            # フィルタリングとスムージング
-            state_means, _ = kf.filter(y.reshape(-1, 1))
-
-            # 結果を格納
-            for i, date in enumerate(common_idx):
-                beta_results.append(
-                    {"Date": date, "Ticker": ticker, "value": state_means[i, 0]}
-                )
-
-        except ImportError:
-            logger.warning(
-                "pykalman not installed, skipping Kalman beta",
-                ticker=ticker,
-            )
-            continue
+    # データが不足している銘柄は除外
+    n_common = rtn[tickers].notna().sum()
+    tickers = [ticker for ticker in tickers if n_common[ticker] >= rolling_window]
 
-    # 結果をDataFrameに変換
-    if not beta_results:
+    if not tickers:
         # 空の場合は、rolling_betaと同じ形式の空DataFrameを返す
         return pd.DataFrame(columns=["Date", "Ticker", "value", "variable"])  # type: ignore[arg-type]
 
-    df_beta = pd.DataFrame(beta_results)
+    # 初期ベータは各銘柄の最初のrolling_window期間のOLS、観測ノイズ等はEMで推定
+    engine = BatchKalmanBeta(
+        transition_covariance=0.001,
+        em_iterations=10,
+        warmup=rolling_window,
+    )
+    kalman = engine.fit(rtn[tickers].to_numpy(dtype=np.float64), rtn[target_col])
+
+    # 結果をDataFrameに変換（観測のある日付のみ）
+    df_beta = (
+        pd.DataFrame(
+            np.where(kalman.observed, kalman.beta, np.nan),
+            index=rtn.index.rename("Date"),
+            columns=pd.Index(tickers, name="Ticker"),
+        )
+        .reset_index()
+        .melt(id_vars="Date", var_name="Ticker", value_name="value")
+        .dropna(subset=["value"])
+    )
     df_beta["variable"] = f"beta_{freq_label}_kalman_{window_years}years"
     df_beta = df_beta.sort_values(["Date", "Ticker"], ignore_index=True)
 
@@ -961,34 +873,17 @@ def rolling_beta(
     ).dropna(how="all")
 
     # 2. ローリング・ベータの計算ロジック
-    market_returns = rtn[target_col]
-
-    def beta_function(window_data):
-        # window_dataは個別銘柄のリターンを含むSeries
-        rs = window_data
-        rm = market_returns[window_data.index]  # 同じ期間の市場リターンを取得
-
-        # ベータ = Cov(Rs, Rm) / Var(Rm)
-        covariance = rs.cov(rm)
-        market_variance = rm.var()
-
-        if market_variance == 0 or pd.isna(market_variance):  # type: ignore[comparison-overlap]
-            return np.nan
-
-        return covariance / market_variance
-
-    # 3. ローリング関数を適用
+    # 全銘柄を市場リターンに対して一括でローリング回帰（ベータ = Cov(Rs, Rm) / Var(Rm)）
     # min_periodsを rolling_window // 3 などに設定し、データ不足でも計算できるようにするのも一般的
     MIN_PERIODS = 20
 
-    beta_results = (
-        # Ticker列（個別銘柄リターン）に対してローリングウィンドウを適用
-        rtn.drop(columns=[target_col])
-        .rolling(window=rolling_window, min_periods=MIN_PERIODS)
-        .apply(beta_function, raw=False)
-        .dropna(how="all")
-        .reset_index()
+    regression = rolling_regression(
+        rtn.drop(columns=[target_col]),
+        rtn.loc[:, target_col],
+        window=rolling_window,
+        min_periods=MIN_PERIODS,
     )
+    beta_results = regression.beta.dropna(how="all").reset_index()
 
     # 4. 結果の整形
     df_beta = pd.melt(
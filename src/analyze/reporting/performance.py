@@ -5,16 +5,25 @@ performance.py
 
 """
 
+from __future__ import annotations
+
 from datetime import datetime, timedelta
-from typing import cast
+from typing import TYPE_CHECKING
 
 import pandas as pd
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame
 
 from analyze.config import get_return_periods, get_symbol_group, get_symbols
+from analyze.returns.period_returns import calculate_period_returns, pivot_prices
 from market.yfinance import FetchOptions, YFinanceFetcher
 from utils_core.logging import get_logger, setup_logging
 
+if TYPE_CHECKING:
+    from analyze.reporting.data_plan import ReportDataPlan
+
+# 終値データの取得期間（5Y 騰落率 + 余裕分）
+CLOSE_LOOKBACK_DAYS = 365 * 5 + 30
+
 
 class PerformanceAnalyzer:
     """symbols.yamlで定義したシンボルグループのパフォーマンスを計測する.
@@ -22,6 +31,15 @@ class PerformanceAnalyzer:
     symbols.yamlで定義された任意のグループ（indices, mag7, sectors等）に対して、
     複数期間（1D, 1W, MTD, 1M, 3M, 6M, YTD, 1Y, 3Y, 5Y）の騰落率を一括計算する。
 
+    ``data_plan`` を指定すると、終値は共有の取得計画から読み出される。
+    ``request_group_data`` で使用するグループを先に宣言しておくと、
+    全グループの終値が最小回数のバッチダウンロードで取得される。
+
+    Parameters
+    ----------
+    data_plan : ReportDataPlan | None, optional
+        レポート共有の取得計画。None の場合はメソッド呼び出しごとに取得する
+
     Examples
     --------
     >>> analyzer = PerformanceAnalyzer()
@@ -33,18 +51,46 @@ class PerformanceAnalyzer:
     >>> sector_returns = analyzer.get_group_performance("sectors")
     """
 
-    def __init__(self) -> None:
+    def __init__(self, data_plan: ReportDataPlan | None = None) -> None:
         self.logger = get_logger(__name__, component="PerformanceAnalyzer")
+        self.data_plan = data_plan
+
+    def request_group_data(self, group: str, subgroup: str | None = None) -> None:
+        """指定グループの終値を取得計画に宣言する.
+
+        Parameters
+        ----------
+        group : str
+            シンボルグループ名（"indices", "mag7", "sectors" 等）
+        subgroup : str | None, optional
+            サブグループ名（"us", "global" 等、indicesの場合に使用）
+
+        Raises
+        ------
+        ValueError
+            data_plan が設定されていない場合
+        """
+        if self.data_plan is None:
+            msg = "data_plan is not set"
+            raise ValueError(msg)
+        section = f"{group}/{subgroup}" if subgroup else group
+        self.data_plan.request(
+            section,
+            get_symbols(group, subgroup),
+            lookback_days=CLOSE_LOOKBACK_DAYS,
+        )
 
     def calculate_returns(
         self,
         price_df: DataFrame,
         return_periods: dict[str, int | str],
     ) -> DataFrame:
-        """各シンボル・各期間の騰落率を pct_change で計算する.
+        """各シンボル・各期間の騰落率を一括計算する.
 
-        pandas の groupby + pct_change を使用することで、
-        データ欠損時にも堅牢に騰落率を計算できる。
+        縦持ちの価格データを日付 × シンボルの横持ち行列に一度だけ変換し、
+        営業日数ベース（1D, 1W, 1Y 等）と日付ベース（MTD, YTD, WoW）の
+        全期間を全シンボルについてベクトル演算で計算する。
+        グローバル市場の休日などによる欠損はシンボルごとに除外される。
 
         Parameters
         ----------
@@ -56,10 +102,12 @@ class PerformanceAnalyzer:
         Returns
         -------
         DataFrame
-            騰落率データ（symbol, period, return_pct カラムを持つ）
+            騰落率データ（symbol, period, return_pct カラムを持つ）。
+            営業日数ベースの期間が期間順に先に並び、日付ベースの期間が
+            シンボル順に続く。計算できない組み合わせは含まれない。
         """
         self.logger.info(
-            "Calculating returns with pct_change",
+            "Calculating returns",
             symbols=price_df["symbol"].nunique(),
             periods=list(return_periods.keys()),
         )
@@ -67,209 +115,52 @@ class PerformanceAnalyzer:
         if price_df.empty:
             return DataFrame({"symbol": [], "period": [], "return_pct": []})
 
-        # 日付でソートし、銘柄でグループ化
-        sorted_df = price_df.sort_values(["symbol", "Date"]).reset_index(drop=True)
-
-        results: list[dict[str, str | float]] = []
-
-        # 営業日数ベースの期間を pct_change で一括計算
-        int_periods = {k: v for k, v in return_periods.items() if isinstance(v, int)}
-        str_periods = {k: v for k, v in return_periods.items() if isinstance(v, str)}
-
-        # 営業日数ベースの騰落率を計算
-        if int_periods:
-            results.extend(self._calculate_int_period_returns(sorted_df, int_periods))
-
-        # MTD/YTD/WoW などの日付ベースの騰落率を計算
-        if str_periods:
-            results.extend(self._calculate_str_period_returns(sorted_df, str_periods))
-
-        return DataFrame(results)
-
-    def _calculate_int_period_returns(
-        self,
-        sorted_df: DataFrame,
-        int_periods: dict[str, int],
-    ) -> list[dict[str, str | float]]:
-        """営業日数ベースの騰落率を pct_change で計算する.
-
-        グローバル市場の休日などで NaN が含まれる場合があるため、
-        銘柄ごとに NaN を除去してから pct_change を計算する。
-
-        Parameters
-        ----------
-        sorted_df : DataFrame
-            日付・銘柄でソート済みの価格データ
-        int_periods : dict[str, int]
-            営業日数ベースの期間定義
-
-        Returns
-        -------
-        list[dict[str, str | float]]
-            騰落率の結果リスト
-        """
-        results: list[dict[str, str | float]] = []
-
-        for period_name, period_days in int_periods.items():
-            # 各銘柄ごとに NaN を除去して pct_change を計算
-            for symbol in sorted_df["symbol"].unique():
-                symbol_data = sorted_df[sorted_df["symbol"] == symbol].copy()
-
-                # NaN を含む行を除去（休日やデータ欠損対応）
-                symbol_data = symbol_data.dropna(subset=["value"])
-
-                if len(symbol_data) <= period_days:
-                    self.logger.debug(
-                        "Insufficient data after dropna",
-                        symbol=symbol,
-                        period=period_name,
-                        period_days=period_days,
-                        available_rows=len(symbol_data),
-                    )
-                    continue
-
-                # pct_change で騰落率を計算
-                pct_changes = symbol_data["value"].pct_change(
-                    periods=period_days,
-                    fill_method=None,
-                )
-
-                # 最新の値を取得
-                latest_pct = pct_changes.iloc[-1]
-
-                if pd.notna(latest_pct):
-                    results.append(
-                        {
-                            "symbol": str(symbol),
-                            "period": period_name,
-                            "return_pct": round(latest_pct * 100, 2),
-                        }
-                    )
-                else:
-                    self.logger.debug(
-                        "pct_change returned NaN",
-                        symbol=symbol,
-                        period=period_name,
-                        period_days=period_days,
-                    )
-
-        return results
-
-    def _calculate_str_period_returns(
-        self,
-        sorted_df: DataFrame,
-        str_periods: dict[str, str],
-    ) -> list[dict[str, str | float]]:
-        """日付ベースの騰落率（MTD/YTD/WoW）を計算する.
-
-        グローバル市場の休日などで NaN が含まれる場合があるため、
-        銘柄ごとに NaN を除去してから計算する。
-
-        Parameters
-        ----------
-        sorted_df : DataFrame
-            日付・銘柄でソート済みの価格データ
-        str_periods : dict[str, str]
-            日付ベースの期間定義
+        wide = pivot_prices(price_df)
+        wide = wide.reindex(columns=sorted(wide.columns, key=str))
+        returns_pct = (calculate_period_returns(wide, return_periods) * 100).round(2)
+        returns_pct.index = returns_pct.index.map(str)
+
+        int_periods = [k for k, v in return_periods.items() if isinstance(v, int)]
+        str_periods = [k for k, v in return_periods.items() if isinstance(v, str)]
+
+        long_df = returns_pct.rename_axis("symbol").reset_index()
+        # 営業日数ベースは期間 → シンボルの順
+        int_long = long_df.melt(
+            id_vars="symbol",
+            value_vars=int_periods,
+            var_name="period",
+            value_name="return_pct",
+        )
+        # 日付ベースはシンボル → 期間の順
+        str_long = long_df.melt(
+            id_vars="symbol",
+            value_vars=str_periods,
+            var_name="period",
+            value_name="return_pct",
+        ).sort_values("symbol", kind="stable")
+
+        result = pd.concat([int_long, str_long], ignore_index=True)
+        result = result.dropna(subset=["return_pct"]).reset_index(drop=True)
+        return result.loc[:, ["symbol", "period", "return_pct"]]
 
-        Returns
-        -------
-        list[dict[str, str | float]]
-            騰落率の結果リスト
-        """
-        results: list[dict[str, str | float]] = []
-
-        for symbol in sorted_df["symbol"].unique():
-            symbol_data = cast("DataFrame", sorted_df[sorted_df["symbol"] == symbol])
-
-            # NaN を含む行を除去（休日やデータ欠損対応）
-            symbol_data = symbol_data.dropna(subset=["value"])
-
-            if symbol_data.empty:
-                continue
-
-            latest_row = symbol_data.iloc[-1]
-            latest_date = cast("Timestamp", pd.Timestamp(latest_row["Date"]))
-            latest_price = float(latest_row["value"])
-
-            for period_name, period_value in str_periods.items():
-                try:
-                    return_pct = self._calculate_date_based_return(
-                        symbol_data=symbol_data,
-                        latest_date=latest_date,
-                        latest_price=latest_price,
-                        period_value=period_value,
-                    )
-
-                    if return_pct is not None:
-                        results.append(
-                            {
-                                "symbol": str(symbol),
-                                "period": period_name,
-                                "return_pct": return_pct,
-                            }
-                        )
-                except (IndexError, ValueError) as e:
-                    self.logger.warning(
-                        "Failed to calculate date-based return",
-                        symbol=symbol,
-                        period=period_name,
-                        error=str(e),
-                    )
-
-        return results
-
-    def _calculate_date_based_return(
-        self,
-        symbol_data: DataFrame,
-        latest_date: datetime | Timestamp,
-        latest_price: float,
-        period_value: str,
-    ) -> float | None:
-        """日付ベースの騰落率を計算する.
+    def get_close_dataframe(self, list_symbol: list[str]) -> DataFrame:
+        """終値データを縦持ち形式で取得する.
 
         Parameters
         ----------
-        symbol_data : DataFrame
-            シンボルの価格データ
-        latest_date : datetime | Timestamp
-            最新日付
-        latest_price : float
-            最新価格
-        period_value : str
-            期間値（"mtd", "ytd", "prev_tue"）
+        list_symbol : list[str]
+            シンボルのリスト
 
         Returns
         -------
-        float | None
-            騰落率（パーセント）、計算不可の場合は None
+        DataFrame
+            終値データ（Date, symbol, variable, value カラムを持つ）
         """
-        if period_value == "mtd":
-            start_of_period = latest_date.replace(day=1)
-        elif period_value == "ytd":
-            start_of_period = latest_date.replace(month=1, day=1)
-        elif period_value == "prev_tue":
-            # 先週火曜日を計算（週は月曜始まり）
-            weekday = latest_date.weekday()
-            days_to_prev_tue = weekday + 6
-            start_of_period = latest_date - timedelta(days=days_to_prev_tue)
-        else:
-            self.logger.warning("Unknown period value", period_value=period_value)
-            return None
-
-        # 期間開始日以降の最初のデータを取得
-        period_data = symbol_data[symbol_data["Date"] >= start_of_period]
-        if period_data.empty:
-            return None
-
-        start_price = float(period_data.iloc[0]["value"])
-        if start_price == 0:
-            return None
-
-        return_pct = ((latest_price - start_price) / start_price) * 100
-        return round(return_pct, 2)
+        if self.data_plan is not None:
+            return self.data_plan.close_long(
+                list_symbol, lookback_days=CLOSE_LOOKBACK_DAYS
+            ).sort_values("Date", ignore_index=True)
 
-    def get_close_dataframe(self, list_symbol: list[str]) -> DataFrame:
         fetch_options = FetchOptions(
             symbols=list_symbol,
             start_date=(datetime.today() - timedelta(days=365 * 5 + 30)).strftime(
@@ -4,26 +4,57 @@ This module provides functions for calculating returns over multiple periods
 including dynamic periods like MTD (Month-to-Date) and YTD (Year-to-Date).
 """
 
-from analyze.returns.returns import (
-    RETURN_PERIODS,
-    TICKERS_GLOBAL_INDICES,
-    TICKERS_MAG7,
-    TICKERS_SECTORS,
-    TICKERS_US_INDICES,
-    calculate_multi_period_returns,
-    calculate_return,
-    fetch_topix_data,
-    generate_returns_report,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from analyze.returns.period_returns import calculate_period_returns, pivot_prices
+    from analyze.returns.returns import (
+        RETURN_PERIODS,
+        RETURNS_LOOKBACK_DAYS,
+        TICKERS_GLOBAL_INDICES,
+        TICKERS_MAG7,
+        TICKERS_SECTORS,
+        TICKERS_US_INDICES,
+        calculate_multi_period_returns,
+        calculate_return,
+        fetch_topix_data,
+        generate_returns_report,
+        request_returns_data,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "calculate_period_returns": "analyze.returns.period_returns",
+    "pivot_prices": "analyze.returns.period_returns",
+    "RETURN_PERIODS": "analyze.returns.returns",
+    "RETURNS_LOOKBACK_DAYS": "analyze.returns.returns",
+    "TICKERS_GLOBAL_INDICES": "analyze.returns.returns",
+    "TICKERS_MAG7": "analyze.returns.returns",
+    "TICKERS_SECTORS": "analyze.returns.returns",
+    "TICKERS_US_INDICES": "analyze.returns.returns",
+    "calculate_multi_period_returns": "analyze.returns.returns",
+    "calculate_return": "analyze.returns.returns",
+    "fetch_topix_data": "analyze.returns.returns",
+    "generate_returns_report": "analyze.returns.returns",
+    "request_returns_data": "analyze.returns.returns",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "RETURNS_LOOKBACK_DAYS",
     "RETURN_PERIODS",
     "TICKERS_GLOBAL_INDICES",
     "TICKERS_MAG7",
     "TICKERS_SECTORS",
     "TICKERS_US_INDICES",
     "calculate_multi_period_returns",
+    "calculate_period_returns",
     "calculate_return",
     "fetch_topix_data",
     "generate_returns_report",
+    "pivot_prices",
+    "request_returns_data",
 ]
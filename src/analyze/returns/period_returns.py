@@ -0,0 +1,216 @@
+"""Vectorized multi-period returns over a wide (date x symbol) price matrix.
+
+The long price frame used by the reporting layer (``Date``, ``symbol``,
+``value``) is pivoted to a wide matrix once, and every period of
+``RETURN_PERIODS`` is computed for every symbol in one pass:
+
+- Integer periods are counted in each symbol's own valid observations, so
+  holidays (NaN cells) of one market never shift another symbol's window.
+- Calendar periods (``mtd``, ``ytd``, ``prev_tue``) are anchored to each
+  symbol's own latest observation and use the first valid price on or after
+  the anchor date.
+
+Functions
+---------
+pivot_prices : Pivot a long price frame to a wide date x symbol matrix
+calculate_period_returns : Returns for every symbol and period in one pass
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from utils_core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy.typing as npt
+
+logger = get_logger(__name__, module="period_returns")
+
+
+def pivot_prices(
+    price_df: pd.DataFrame,
+    date_col: str = "Date",
+    symbol_col: str = "symbol",
+    value_col: str = "value",
+) -> pd.DataFrame:
+    """Pivot a long price frame to a wide date x symbol matrix.
+
+    Rows with a missing value are dropped before pivoting, so holidays show
+    up as NaN cells. When a (date, symbol) pair occurs more than once the
+    last row wins.
+
+    Parameters
+    ----------
+    price_df : pd.DataFrame
+        Long price data with date, symbol and value columns
+    date_col : str, default="Date"
+        Date column name
+    symbol_col : str, default="symbol"
+        Symbol column name
+    value_col : str, default="value"
+        Price column name
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices indexed by ascending date with one column per symbol
+
+    Examples
+    --------
+    >>> long_df = pd.DataFrame(
+    ...     {
+    ...         "Date": pd.to_datetime(["2024-01-02", "2024-01-02", "2024-01-03"]),
+    ...         "symbol": ["A", "B", "A"],
+    ...         "value": [100.0, 50.0, 101.0],
+    ...     }
+    ... )
+    >>> pivot_prices(long_df).shape
+    (2, 2)
+    """
+    valid = price_df.dropna(subset=[value_col]).drop_duplicates(
+        subset=[date_col, symbol_col], keep="last"
+    )
+    wide = valid.pivot(index=date_col, columns=symbol_col, values=value_col)
+    wide.columns.name = None
+    return wide.sort_index().astype(np.float64)
+
+
+def calculate_period_returns(
+    prices: pd.DataFrame,
+    periods: Mapping[str, int | str],
+) -> pd.DataFrame:
+    """Calculate returns for every symbol and period in one vectorized pass.
+
+    Parameters
+    ----------
+    prices : pd.DataFrame
+        Wide prices with a date index and one column per symbol (see
+        ``pivot_prices``). NaN cells are treated as missing observations.
+    periods : Mapping[str, int | str]
+        Period name to a number of observations or one of ``"mtd"``,
+        ``"ytd"`` and ``"prev_tue"`` (previous week's Tuesday)
+
+    Returns
+    -------
+    pd.DataFrame
+        Returns as decimals (0.05 for 5%) indexed by symbol with one column
+        per period. NaN where a symbol has too little data, the base price
+        is zero, or the period value is unknown.
+
+    Raises
+    ------
+    ValueError
+        If an integer period is not positive
+
+    Examples
+    --------
+    >>> prices = pd.DataFrame(
+    ...     {"A": [100.0, 110.0, 121.0]},
+    ...     index=pd.date_range("2024-01-01", periods=3),
+    ... )
+    >>> calculate_period_returns(prices, {"1D": 1, "2D": 2}).round(2)
+        1D    2D
+    A  0.1  0.21
+    """
+    for name, value in periods.items():
+        if isinstance(value, int) and value <= 0:
+            msg = f"period must be positive, got {value} for {name}"
+            logger.error("Invalid period", period=name, value=value)
+            raise ValueError(msg)
+
+    symbols = prices.columns
+    result = pd.DataFrame(
+        np.nan, index=symbols, columns=pd.Index(list(periods)), dtype=np.float64
+    )
+    if prices.empty or not periods:
+        return result
+
+    prices = prices.sort_index()
+    values = prices.to_numpy(dtype=np.float64)
+    n_rows, n_symbols = values.shape
+    valid = ~np.isnan(values)
+    n_valid = valid.sum(axis=0)
+    has_data = n_valid > 0
+    columns = np.arange(n_symbols)
+
+    # Valid observations of each column moved to the top, in date order
+    compact_rows = np.argsort(~valid, axis=0, kind="stable")
+    compact = np.take_along_axis(values, compact_rows, axis=0)
+    last_row = compact_rows[np.maximum(n_valid - 1, 0), columns]
+    latest = np.where(has_data, values[last_row, columns], np.nan)
+
+    int_names = [name for name, value in periods.items() if isinstance(value, int)]
+    if int_names:
+        lags = np.array([periods[name] for name in int_names])
+        base_pos = n_valid[None, :] - 1 - lags[:, None]
+        base = np.where(
+            base_pos >= 0, compact[np.maximum(base_pos, 0), columns], np.nan
+        )
+        result[int_names] = _growth(latest, base).T
+
+    calendar_names = [name for name, value in periods.items() if isinstance(value, str)]
+    if calendar_names:
+        dates = pd.DatetimeIndex(pd.to_datetime(prices.index))
+        latest_dates = dates[last_row]
+        # First valid row at or after each row, per column (n_rows if none)
+        next_valid = np.flip(
+            np.minimum.accumulate(
+                np.flip(np.where(valid, np.arange(n_rows)[:, None], n_rows), axis=0),
+                axis=0,
+            ),
+            axis=0,
+        )
+        for name in calendar_names:
+            anchors = _anchor_dates(latest_dates, str(periods[name]).lower())
+            if anchors is None:
+                logger.warning("Unknown period value", period=name, value=periods[name])
+                continue
+            start = np.minimum(dates.searchsorted(anchors, side="left"), n_rows - 1)
+            start_row = np.minimum(next_valid[start, columns], n_rows - 1)
+            base = np.where(has_data, values[start_row, columns], np.nan)
+            result[name] = _growth(latest, base)
+
+    logger.debug(
+        "Period returns calculated",
+        symbols=n_symbols,
+        periods=list(periods),
+        rows=n_rows,
+    )
+    return result
+
+
+def _growth(
+    latest: npt.NDArray[np.float64], base: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Simple return from ``base`` to ``latest``; NaN for a zero base."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = (latest - base) / base
+    return np.where(base == 0, np.nan, growth)
+
+
+def _anchor_dates(
+    latest_dates: pd.DatetimeIndex, period: str
+) -> pd.DatetimeIndex | None:
+    """Start date of a calendar period for each symbol's latest date."""
+    if period == "mtd":
+        offset_days = latest_dates.day - 1
+    elif period == "ytd":
+        offset_days = latest_dates.dayofyear - 1
+    elif period == "prev_tue":
+        # Tuesday of the previous week (weeks start on Monday)
+        offset_days = latest_dates.weekday + 6
+    else:
+        return None
+    return latest_dates - pd.to_timedelta(np.asarray(offset_days), unit="D")
+
+
+__all__ = [
+    "calculate_period_returns",
+    "pivot_prices",
+]
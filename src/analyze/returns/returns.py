@@ -10,14 +10,18 @@ Migrated from market_analysis.analysis.returns (Issue #956)
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
 import pandas as pd
 import yfinance as yf
 
 from analyze.config.loader import get_return_periods, get_symbols
+from analyze.returns.period_returns import calculate_period_returns
 from utils_core.logging import get_logger
 
+if TYPE_CHECKING:
+    from analyze.reporting.data_plan import ReportDataPlan
+
 logger = get_logger(__name__, module="returns")
 
 # =============================================================================
@@ -30,6 +34,9 @@ TICKERS_US_INDICES: list[str] = get_symbols("indices", "us")
 TICKERS_MAG7: list[str] = get_symbols("mag7")
 TICKERS_SECTORS: list[str] = get_symbols("sectors")
 
+# History needed by generate_returns_report (covers the 5Y period)
+RETURNS_LOOKBACK_DAYS = 6 * 366
+
 
 # =============================================================================
 # Functions
@@ -203,6 +210,8 @@ def _calculate_ytd_return(prices: pd.Series) -> float | None:
 def calculate_multi_period_returns(prices: pd.Series) -> dict[str, float | None]:
     """Calculate returns for all periods in RETURN_PERIODS.
 
+    All periods are computed in one pass by ``calculate_period_returns``.
+
     Parameters
     ----------
     prices : pd.Series
@@ -222,24 +231,15 @@ def calculate_multi_period_returns(prices: pd.Series) -> dict[str, float | None]
     """
     logger.debug("Calculating multi-period returns", data_length=len(prices))
 
-    results: dict[str, float | None] = {}
+    if prices.dropna().empty:
+        return dict.fromkeys(RETURN_PERIODS)
 
-    for period_name, period_value in RETURN_PERIODS.items():
-        try:
-            result = calculate_return(prices, period_value)
-            results[period_name] = result
-            logger.debug(
-                "Period return calculated",
-                period_name=period_name,
-                result=result,
-            )
-        except (ValueError, TypeError) as e:
-            logger.warning(
-                "Failed to calculate period return",
-                period_name=period_name,
-                error=str(e),
-            )
-            results[period_name] = None
+    wide = prices.to_frame(name="price")
+    row = calculate_period_returns(wide, RETURN_PERIODS).loc["price"]
+    results: dict[str, float | None] = {
+        period_name: None if pd.isna(value) else float(value)
+        for period_name, value in row.items()
+    }
 
     logger.info(
         "Multi-period returns calculated",
@@ -306,13 +306,36 @@ def fetch_topix_data(
     return None
 
 
-def generate_returns_report(as_of: datetime | None = None) -> dict[str, Any]:
+def request_returns_data(data_plan: ReportDataPlan) -> None:
+    """Declare the price data generate_returns_report needs in a data plan.
+
+    Parameters
+    ----------
+    data_plan : ReportDataPlan
+        Shared report data plan
+    """
+    data_plan.request(
+        "returns",
+        TICKERS_US_INDICES + TICKERS_MAG7 + TICKERS_SECTORS + TICKERS_GLOBAL_INDICES,
+        lookback_days=RETURNS_LOOKBACK_DAYS,
+    )
+
+
+def generate_returns_report(
+    as_of: datetime | None = None,
+    *,
+    data_plan: ReportDataPlan | None = None,
+) -> dict[str, Any]:
     """Generate comprehensive returns report.
 
     Parameters
     ----------
     as_of : datetime | None
         Reference datetime for the report. Defaults to current time.
+    data_plan : ReportDataPlan | None
+        Shared report data plan to read prices from (declare the data with
+        ``request_returns_data`` first). When None, each category is
+        downloaded separately.
 
     Returns
     -------
@@ -341,11 +364,13 @@ def generate_returns_report(as_of: datetime | None = None) -> dict[str, Any]:
     logger.debug("Report as_of time", as_of=as_of_str)
 
     # Calculate returns for each category
-    indices_data = _fetch_and_calculate_returns(TICKERS_US_INDICES, "indices")
-    mag7_data = _fetch_and_calculate_returns(TICKERS_MAG7, "mag7")
-    sectors_data = _fetch_and_calculate_returns(TICKERS_SECTORS, "sectors")
+    indices_data = _fetch_and_calculate_returns(
+        TICKERS_US_INDICES, "indices", data_plan
+    )
+    mag7_data = _fetch_and_calculate_returns(TICKERS_MAG7, "mag7", data_plan)
+    sectors_data = _fetch_and_calculate_returns(TICKERS_SECTORS, "sectors", data_plan)
     global_indices_data = _fetch_and_calculate_returns(
-        TICKERS_GLOBAL_INDICES, "global_indices"
+        TICKERS_GLOBAL_INDICES, "global_indices", data_plan
     )
 
     report = {
@@ -370,10 +395,12 @@ def generate_returns_report(as_of: datetime | None = None) -> dict[str, Any]:
 def _fetch_and_calculate_returns(
     tickers: list[str],
     category: str,
+    data_plan: ReportDataPlan | None = None,
 ) -> list[dict[str, Any]]:
     """Fetch price data and calculate returns for a list of tickers.
 
-    Uses batch download with yf.download for efficiency.
+    Uses batch download with yf.download for efficiency, or the shared
+    panel of ``data_plan`` when given.
 
     Parameters
     ----------
@@ -381,6 +408,8 @@ def _fetch_and_calculate_returns(
         List of ticker symbols
     category : str
         Category name for logging
+    data_plan : ReportDataPlan | None
+        Shared report data plan to read prices from
 
     Returns
     -------
@@ -399,82 +428,44 @@ def _fetch_and_calculate_returns(
     results: list[dict[str, Any]] = []
 
     try:
-        # Batch download all tickers at once
-        logger.debug("Batch downloading data", tickers=tickers, category=category)
-        df = yf.download(tickers, period="6y", progress=False)
+        if data_plan is not None:
+            close_prices = data_plan.close_prices(
+                tickers, lookback_days=RETURNS_LOOKBACK_DAYS
+            )
+        else:
+            # Batch download all tickers at once
+            logger.debug("Batch downloading data", tickers=tickers, category=category)
+            df = yf.download(tickers, period="6y", progress=False)
+
+            if df is None or df.empty:
+                logger.warning("No data returned for batch download", category=category)
+                return []
 
-        if df is None or df.empty:
-            logger.warning("No data returned for batch download", category=category)
+            close_prices = _extract_close_prices(df, tickers, category)
+
+        if close_prices.empty:
             return []
 
-        # Process each ticker
-        for ticker in tickers:
-            try:
-                # Extract Close prices for this ticker
-                prices: pd.Series
-                if isinstance(df.columns, pd.MultiIndex):
-                    # Multi-ticker download returns MultiIndex columns
-                    if "Close" in df.columns.get_level_values(0):
-                        close_df = df["Close"]
-                        if ticker in close_df.columns:
-                            ticker_data = close_df[ticker].dropna()
-                            if isinstance(ticker_data, pd.DataFrame):
-                                prices = ticker_data.iloc[:, 0]
-                            else:
-                                prices = ticker_data
-                        else:
-                            logger.debug(
-                                "Ticker not found in batch data",
-                                ticker=ticker,
-                                category=category,
-                            )
-                            continue
-                    else:
-                        logger.debug(
-                            "No Close column in MultiIndex",
-                            ticker=ticker,
-                            category=category,
-                        )
-                        continue
-                # Single ticker case (when only 1 ticker in list)
-                elif "Close" in df.columns:
-                    close_data = df["Close"]
-                    if isinstance(close_data, pd.DataFrame):
-                        prices = close_data.iloc[:, 0].dropna()
-                    else:
-                        prices = close_data.dropna()
-                else:
-                    logger.warning("No Close column found", ticker=ticker)
-                    continue
-
-                if prices.empty:
-                    logger.debug("Empty price data after dropna", ticker=ticker)
-                    continue
-
-                # Calculate multi-period returns
-                returns = calculate_multi_period_returns(prices)
-
-                result = {
-                    "ticker": ticker,
-                    **returns,
-                }
-                results.append(result)
-
-                logger.debug(
-                    "Returns calculated for ticker",
-                    ticker=ticker,
-                    valid_periods=sum(1 for v in returns.values() if v is not None),
-                )
-
-            except Exception as e:
-                logger.warning(
-                    "Failed to process ticker",
-                    ticker=ticker,
-                    category=category,
-                    error=str(e),
-                )
+        # All tickers and periods in one vectorized pass
+        period_returns = calculate_period_returns(close_prices, RETURN_PERIODS)
+
+        for ticker in close_prices.columns:
+            if close_prices[ticker].dropna().empty:
+                logger.debug("Empty price data after dropna", ticker=ticker)
                 continue
 
+            returns: dict[str, float | None] = {
+                period_name: None if pd.isna(value) else float(value)
+                for period_name, value in period_returns.loc[ticker].items()
+            }
+            results.append({"ticker": ticker, **returns})
+
+            logger.debug(
+                "Returns calculated for ticker",
+                ticker=ticker,
+                valid_periods=sum(1 for v in returns.values() if v is not None),
+            )
+
     except Exception as e:
         logger.error(
             "Batch download failed",
@@ -492,3 +483,56 @@ def _fetch_and_calculate_returns(
     )
 
     return results
+
+
+def _extract_close_prices(
+    df: pd.DataFrame,
+    tickers: list[str],
+    category: str,
+) -> pd.DataFrame:
+    """Extract a wide close price matrix (date x ticker) from yf.download output.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Result of ``yf.download``
+    tickers : list[str]
+        Requested ticker symbols
+    category : str
+        Category name for logging
+
+    Returns
+    -------
+    pd.DataFrame
+        Close prices with one column per ticker found in ``df``
+    """
+    if isinstance(df.columns, pd.MultiIndex):
+        # Multi-ticker download returns MultiIndex columns
+        if "Close" not in df.columns.get_level_values(0):
+            logger.debug("No Close column in MultiIndex", category=category)
+            return pd.DataFrame()
+        close_df = cast("pd.DataFrame", df["Close"])
+        missing = [ticker for ticker in tickers if ticker not in close_df.columns]
+        if missing:
+            logger.debug(
+                "Tickers not found in batch data", tickers=missing, category=category
+            )
+        found = [ticker for ticker in tickers if ticker in close_df.columns]
+        # Duplicate column labels keep their first column
+        return pd.DataFrame(
+            {ticker: _first_column(close_df[ticker]) for ticker in found}
+        )
+
+    # Single ticker case (when only 1 ticker in list)
+    if "Close" not in df.columns:
+        logger.warning("No Close column found", category=category)
+        return pd.DataFrame()
+    close = _first_column(df["Close"])
+    return pd.DataFrame(dict.fromkeys(tickers, close))
+
+
+def _first_column(data: pd.Series | pd.DataFrame) -> pd.Series:
+    """Return ``data`` itself or its first column when it is a DataFrame."""
+    if isinstance(data, pd.DataFrame):
+        return data.iloc[:, 0]
+    return data
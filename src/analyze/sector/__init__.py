@@ -4,24 +4,52 @@ This module provides functions for analyzing sector performance,
 including ETF returns, top/bottom sector rankings, and contributor stocks.
 """
 
-from analyze.sector.sector import (
-    SECTOR_ETF_MAP,
-    SECTOR_KEYS,
-    SECTOR_NAMES,
-    SectorAnalysisResult,
-    SectorContributor,
-    SectorInfo,
-    _build_contributors,
-    _build_sector_info_list,
-    analyze_sector_performance,
-    fetch_sector_etf_returns,
-    fetch_top_companies,
-    get_top_bottom_sectors,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from analyze.sector.sector import (
+        SECTOR_ETF_MAP,
+        SECTOR_KEYS,
+        SECTOR_LOOKBACK_DAYS,
+        SECTOR_NAMES,
+        SectorAnalysisResult,
+        SectorContributor,
+        SectorInfo,
+        _build_contributors,
+        _build_sector_info_list,
+        analyze_sector_performance,
+        fetch_sector_etf_returns,
+        fetch_top_companies,
+        get_top_bottom_sectors,
+        request_sector_data,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "SECTOR_ETF_MAP": "analyze.sector.sector",
+    "SECTOR_KEYS": "analyze.sector.sector",
+    "SECTOR_LOOKBACK_DAYS": "analyze.sector.sector",
+    "SECTOR_NAMES": "analyze.sector.sector",
+    "SectorAnalysisResult": "analyze.sector.sector",
+    "SectorContributor": "analyze.sector.sector",
+    "SectorInfo": "analyze.sector.sector",
+    "_build_contributors": "analyze.sector.sector",
+    "_build_sector_info_list": "analyze.sector.sector",
+    "analyze_sector_performance": "analyze.sector.sector",
+    "fetch_sector_etf_returns": "analyze.sector.sector",
+    "fetch_top_companies": "analyze.sector.sector",
+    "get_top_bottom_sectors": "analyze.sector.sector",
+    "request_sector_data": "analyze.sector.sector",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "SECTOR_ETF_MAP",
     "SECTOR_KEYS",
+    "SECTOR_LOOKBACK_DAYS",
     "SECTOR_NAMES",
     "SectorAnalysisResult",
     "SectorContributor",
@@ -32,4 +60,5 @@ __all__ = [
     "fetch_sector_etf_returns",
     "fetch_top_companies",
     "get_top_bottom_sectors",
+    "request_sector_data",
 ]
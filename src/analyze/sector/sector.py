@@ -18,6 +18,8 @@ import yfinance as yf
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from analyze.reporting.data_plan import ReportDataPlan
+
 from analyze.returns import calculate_return
 from utils_core.logging import get_logger
 
@@ -55,6 +57,9 @@ SECTOR_ETF_MAP: dict[str, str] = {
     "utilities": "XLU",
 }
 
+# History needed by fetch_sector_etf_returns (yfinance period="1mo")
+SECTOR_LOOKBACK_DAYS = 31
+
 SECTOR_NAMES: dict[str, str] = {
     "basic-materials": "Basic Materials",
     "communication-services": "Communication Services",
@@ -189,13 +194,35 @@ class SectorAnalysisResult:
 # =============================================================================
 
 
-def fetch_sector_etf_returns(period: int = 5) -> dict[str, float | None]:
+def request_sector_data(data_plan: ReportDataPlan) -> None:
+    """Declare the sector ETF prices fetch_sector_etf_returns needs.
+
+    Parameters
+    ----------
+    data_plan : ReportDataPlan
+        Shared report data plan
+    """
+    data_plan.request(
+        "sectors",
+        SECTOR_ETF_MAP.values(),
+        lookback_days=SECTOR_LOOKBACK_DAYS,
+    )
+
+
+def fetch_sector_etf_returns(
+    period: int = 5,
+    *,
+    data_plan: ReportDataPlan | None = None,
+) -> dict[str, float | None]:
     """Fetch ETF returns for all 11 sectors.
 
     Parameters
     ----------
     period : int, default=5
         Number of business days for return calculation (5 = 1 week)
+    data_plan : ReportDataPlan | None
+        Shared report data plan to read prices from (declare the data with
+        ``request_sector_data`` first). When None, the ETFs are downloaded.
 
     Returns
     -------
@@ -223,8 +250,15 @@ def fetch_sector_etf_returns(period: int = 5) -> dict[str, float | None]:
             ticker_count=len(etf_tickers),
         )
 
-        # Download all ETF data at once
-        df = yf.download(tickers_str, period="1mo", progress=False)
+        if data_plan is not None:
+            # Same column layout as a multi-ticker yf.download
+            close = data_plan.close_prices(
+                etf_tickers, lookback_days=SECTOR_LOOKBACK_DAYS
+            )
+            df = pd.concat({"Close": close}, axis=1)
+        else:
+            # Download all ETF data at once
+            df = yf.download(tickers_str, period="1mo", progress=False)
 
         if df is None or df.empty:
             logger.warning("No data returned from yfinance")
@@ -453,6 +487,8 @@ def fetch_top_companies(sector_key: str) -> list[dict[str, Any]] | None:
 def analyze_sector_performance(
     as_of: datetime | None = None,
     n_sectors: int = 3,
+    *,
+    data_plan: ReportDataPlan | None = None,
 ) -> SectorAnalysisResult:
     """Analyze sector performance and identify top/bottom sectors with contributors.
 
@@ -468,6 +504,8 @@ def analyze_sector_performance(
         Reference datetime for the analysis. Defaults to current time.
     n_sectors : int, default=3
         Number of top/bottom sectors to include
+    data_plan : ReportDataPlan | None
+        Shared report data plan to read sector ETF prices from
 
     Returns
     -------
@@ -487,7 +525,7 @@ def analyze_sector_performance(
 
     # Step 1: Fetch ETF returns for all sectors
     logger.debug("Step 1: Fetching ETF returns for all sectors")
-    etf_returns = fetch_sector_etf_returns()
+    etf_returns = fetch_sector_etf_returns(data_plan=data_plan)
 
     # Step 2: Rank sectors by return
     logger.debug("Step 2: Ranking sectors by return")
@@ -14,6 +14,18 @@ Examples
 ...         return not df.empty
 """
 
-from .base import StatisticalAnalyzer
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import StatisticalAnalyzer
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "StatisticalAnalyzer": ".base",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["StatisticalAnalyzer"]
@@ -28,6 +28,8 @@ import pandas as pd
 from utils_core.logging import get_logger
 
 from .base import StatisticalAnalyzer
+from .kalman import BatchKalmanBeta
+from .regression import rolling_regression
 
 logger = get_logger(__name__)
 
@@ -279,43 +281,15 @@ class RollingBetaAnalyzer(StatisticalAnalyzer):
             input_columns=len(df.columns),
         )
 
-        # Get target (benchmark) series
-        benchmark = df[target_column]
-
         # Get numeric columns excluding target
         numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
         other_cols = [col for col in numeric_cols if col != target_column]
 
-        # Calculate rolling beta for each column
-        result_data: dict[str, pd.Series] = {}
-        for col in other_cols:
-            asset = df[col]
-
-            # Calculate rolling covariance and variance
-            rolling_cov = cast(
-                "pd.Series",
-                asset.rolling(window=self._window).cov(benchmark),
-            )
-            rolling_var = cast(
-                "pd.Series",
-                benchmark.rolling(window=self._window).var(),
-            )
-
-            # Handle zero variance by replacing with NaN
-            rolling_var = rolling_var.replace(0, np.nan)
-
-            # Beta = Cov(asset, benchmark) / Var(benchmark)
-            rolling_beta = cast("pd.Series", rolling_cov / rolling_var)
-            result_data[col] = rolling_beta
-
-            logger.debug(
-                "Rolling beta calculated",
-                column=col,
-                target_column=target_column,
-                valid_values=rolling_beta.notna().sum(),
-            )
-
-        result = pd.DataFrame(result_data, index=df.index)
+        # Beta = Cov(asset, benchmark) / Var(benchmark), all columns in one pass
+        regression = rolling_regression(
+            df[other_cols], df.loc[:, target_column], window=self._window
+        )
+        result = regression.beta
 
         logger.info(
             "Rolling beta calculation completed",
@@ -359,10 +333,10 @@ class KalmanBetaAnalyzer(StatisticalAnalyzer):
 
     Notes
     -----
-    This analyzer requires the optional `pykalman` package. If not installed,
-    an ImportError will be raised when calling calculate().
-
-    Install with: ``pip install pykalman`` or ``uv add pykalman``
+    All columns are filtered together by ``analyze.statistics.kalman.BatchKalmanBeta``,
+    a NumPy implementation that estimates the noise covariances and initial
+    state by EM with the same defaults as pykalman. Dates where a column's
+    return is missing are NaN in the result.
 
     Examples
     --------
@@ -526,8 +500,6 @@ class KalmanBetaAnalyzer(StatisticalAnalyzer):
         ------
         ValueError
             If target_column is not provided or not found in the DataFrame.
-        ImportError
-            If pykalman is not installed.
 
         Examples
         --------
@@ -563,71 +535,34 @@ class KalmanBetaAnalyzer(StatisticalAnalyzer):
             input_columns=len(df.columns),
         )
 
-        # Import pykalman (optional dependency)
-        try:
-            from pykalman import KalmanFilter  # type: ignore[import-not-found]
-        except ImportError as e:
-            msg = (
-                "pykalman is required for KalmanBetaAnalyzer. "
-                "Install with: pip install pykalman"
-            )
-            logger.error(msg)
-            raise ImportError(msg) from e
-
-        # Get target (benchmark) series as numpy array
-        benchmark = np.asarray(df[target_column].values, dtype=np.float64)
-
         # Get numeric columns excluding target
         numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
         other_cols = [col for col in numeric_cols if col != target_column]
 
-        # Calculate Kalman beta for each column
-        result_data: dict[str, pd.Series] = {}
-        for col in other_cols:
-            # Convert to numpy array explicitly to avoid type issues
-            asset = np.asarray(df[col].values, dtype=np.float64)
-
-            # Use scipy.stats.linregress for initial beta estimate
-            from scipy.stats import linregress
-
-            slope_init, _, _, _, _ = linregress(benchmark, asset)
-
-            # Set up observation matrices (time-varying)
-            # Observation equation: y_t = beta_t * X_t + epsilon_t
-            observation_matrices = benchmark.reshape(-1, 1, 1)
-
-            # Calculate observation covariance from asset variance
-            asset_variance = float(np.var(asset))
-
-            # Initialize Kalman filter
-            kf = KalmanFilter(
-                transition_matrices=np.array([[1.0]]),  # Random walk
-                observation_matrices=observation_matrices,
-                transition_covariance=np.array([[self._transition_covariance]]),
-                observation_covariance=np.array([[asset_variance]]),
-                initial_state_mean=np.array([slope_init]),
-                initial_state_covariance=np.array([[1.0]]),
-                n_dim_state=1,
-                n_dim_obs=1,
-            )
-
-            # Use EM algorithm to refine parameters
-            kf = kf.em(asset.reshape(-1, 1), n_iter=self._em_iterations)
-
-            # Apply Kalman filter
-            state_means, _ = kf.filter(asset.reshape(-1, 1))
+        # Fit all columns at once with the batched NumPy Kalman filter
+        engine = BatchKalmanBeta(
+            transition_covariance=self._transition_covariance,
+            em_iterations=self._em_iterations,
+        )
+        kalman = engine.fit(
+            df[other_cols].to_numpy(dtype=np.float64), df[target_column]
+        )
 
-            # Store results as a Series with the original index
-            result_data[col] = pd.Series(
-                state_means.flatten(), index=df.index, name=col
-            )
+        # Dates without an observation for a column have no estimate
+        betas = np.where(kalman.observed, kalman.beta, np.nan)
+        result_data: dict[str, pd.Series] = {
+            col: pd.Series(betas[:, i], index=df.index, name=col)
+            for i, col in enumerate(other_cols)
+        }
 
-            logger.debug(
-                "Kalman beta calculated",
-                column=col,
-                target_column=target_column,
-                final_beta=float(state_means[-1, 0]),
-            )
+        logger.debug(
+            "Kalman beta calculated",
+            target_column=target_column,
+            columns=len(other_cols),
+            final_betas=dict(
+                zip(other_cols, kalman.state.state_mean[:, -1].tolist(), strict=True)
+            ),
+        )
 
         result = pd.DataFrame(result_data, index=df.index)
 
@@ -32,6 +32,7 @@ import pandas as pd
 from utils_core.logging import get_logger
 
 from .base import StatisticalAnalyzer
+from .regression import rolling_regression
 from .types import CorrelationMethod, CorrelationResult
 
 logger = get_logger(__name__)
@@ -416,20 +417,9 @@ def calculate_rolling_beta(
         logger.error("Invalid min_periods", min_periods=min_periods)
         raise ValueError(f"min_periods must be at least 2, got {min_periods}")
 
-    # Calculate rolling covariance and variance
-    rolling_cov = cast(
-        "pd.Series",
-        returns.rolling(window=window, min_periods=min_periods).cov(benchmark_returns),
-    )
-    rolling_var = cast(
-        "pd.Series",
-        benchmark_returns.rolling(window=window, min_periods=min_periods).var(),
-    )
-
-    # Handle zero variance
-    rolling_var = rolling_var.replace(0, np.nan)
-
-    result = cast("pd.Series", rolling_cov / rolling_var)
+    # Cov(asset, benchmark) / Var(benchmark) over paired observations
+    beta = rolling_regression(returns, benchmark_returns, window, min_periods).beta
+    result = cast("pd.Series", beta.iloc[:, 0].rename(returns.name))
 
     logger.debug(
         "Rolling beta calculated",
@@ -0,0 +1,580 @@
+"""Batched Kalman filter for time-varying beta (and alpha) estimation.
+
+This module provides a NumPy implementation of the random-walk regression
+Kalman filter that estimates the time-varying beta of many assets against a
+single benchmark at once. The recursion loops over time only; every step
+updates all N assets with batched array operations.
+
+State-space model (per asset i):
+- Observation equation: r_i,t = [alpha_i,t +] beta_i,t * r_m,t + epsilon_i,t
+- State equation: state_i,t = state_i,t-1 + eta_i,t
+
+Noise parameters can be fixed or estimated by EM, and the filter can be
+continued from a previous ``KalmanBetaState`` when new returns arrive,
+without refitting from scratch.
+
+Classes
+-------
+BatchKalmanBeta : Batched Kalman filter/smoother with optional EM
+KalmanBetaState : Filter state after the last observation
+KalmanBetaResult : State estimates for every time step
+
+Examples
+--------
+>>> import numpy as np
+>>> from analyze.statistics.kalman import BatchKalmanBeta
+>>> rng = np.random.default_rng(42)
+>>> market = rng.normal(0, 0.01, 250)
+>>> assets = np.column_stack([b * market for b in (0.8, 1.0, 1.5)])
+>>> assets += rng.normal(0, 0.001, assets.shape)
+>>> engine = BatchKalmanBeta(transition_covariance=1e-4)
+>>> result = engine.fit(assets[:200], market[:200])
+>>> result.beta.shape
+(200, 3)
+>>> update = engine.update(result.state, assets[200:], market[200:])
+>>> update.beta.shape
+(50, 3)
+"""
+
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from utils_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+type EMVariable = Literal[
+    "transition_covariance",
+    "observation_covariance",
+    "initial_state_mean",
+    "initial_state_covariance",
+]
+
+DEFAULT_EM_VARS: frozenset[EMVariable] = frozenset(
+    {
+        "transition_covariance",
+        "observation_covariance",
+        "initial_state_mean",
+        "initial_state_covariance",
+    }
+)
+
+# Lower bound for estimated variances, keeps the filter well-conditioned
+_MIN_VARIANCE = 1e-12
+
+
+@dataclass(frozen=True)
+class KalmanBetaState:
+    """Filter state of N assets after their last processed observation.
+
+    Attributes
+    ----------
+    state_mean : np.ndarray
+        State means, shape (N, k). k is 1 (beta) or 2 (alpha, beta).
+    state_covariance : np.ndarray
+        State covariances, shape (N, k, k).
+    transition_covariance : np.ndarray
+        Diagonal of the state noise covariance, shape (N, k).
+    observation_covariance : np.ndarray
+        Observation noise variance, shape (N,).
+    started : np.ndarray
+        Whether each asset has had at least one observation, shape (N,).
+    """
+
+    state_mean: npt.NDArray[np.float64]
+    state_covariance: npt.NDArray[np.float64]
+    transition_covariance: npt.NDArray[np.float64]
+    observation_covariance: npt.NDArray[np.float64]
+    started: npt.NDArray[np.bool_]
+
+    @property
+    def include_alpha(self) -> bool:
+        """Return whether the state includes alpha."""
+        return self.state_mean.shape[1] == 2
+
+
+@dataclass(frozen=True)
+class KalmanBetaResult:
+    """State estimates of N assets over T time steps.
+
+    Attributes
+    ----------
+    state_means : np.ndarray
+        Filtered (or smoothed) state means, shape (T, N, k).
+    state_covariances : np.ndarray
+        Filtered (or smoothed) state covariances, shape (T, N, k, k).
+    observed : np.ndarray
+        Whether asset i had a valid observation at step t, shape (T, N).
+    state : KalmanBetaState
+        Filter state after the last step, usable with ``BatchKalmanBeta.update``.
+    """
+
+    state_means: npt.NDArray[np.float64]
+    state_covariances: npt.NDArray[np.float64]
+    observed: npt.NDArray[np.bool_]
+    state: KalmanBetaState
+
+    @property
+    def beta(self) -> npt.NDArray[np.float64]:
+        """Return beta estimates, shape (T, N)."""
+        return self.state_means[..., -1]
+
+    @property
+    def alpha(self) -> npt.NDArray[np.float64] | None:
+        """Return alpha estimates, shape (T, N), or None without alpha."""
+        if self.state_means.shape[-1] < 2:
+            return None
+        return self.state_means[..., 0]
+
+
+@dataclass(frozen=True)
+class _FilterPass:
+    """Intermediate arrays of one forward pass, needed by the smoother."""
+
+    filtered_means: npt.NDArray[np.float64]
+    filtered_covs: npt.NDArray[np.float64]
+    predicted_means: npt.NDArray[np.float64]
+    predicted_covs: npt.NDArray[np.float64]
+    state: KalmanBetaState
+
+
+class BatchKalmanBeta:
+    """Batched Kalman filter/smoother for random-walk beta of many assets.
+
+    Missing observations (NaN asset or benchmark returns) leave that
+    asset's state untouched: no measurement update and no state noise is
+    added, so each asset evolves only on the dates it is observed. Each
+    asset's first observation is treated as time zero.
+
+    Parameters
+    ----------
+    transition_covariance : float, default=0.001
+        State noise variance (Q). Used as the fixed value, or as the EM
+        starting value if "transition_covariance" is in ``em_vars``.
+    observation_covariance : float | None, default=None
+        Observation noise variance (R). None uses each asset's return
+        variance. Fixed or EM starting value like ``transition_covariance``.
+    include_alpha : bool, default=False
+        Estimate a time-varying alpha together with beta.
+    em_iterations : int, default=10
+        Number of EM iterations. 0 keeps all noise parameters fixed.
+    em_vars : frozenset[str] | None, default=None
+        Parameters estimated by EM. None estimates all of them: the
+        transition and observation covariances and the initial state mean
+        and covariance (the same defaults as pykalman).
+    initial_state_covariance : float, default=1.0
+        Diagonal of the initial state covariance.
+    warmup : int | None, default=None
+        Number of leading observations per asset used for the OLS initial
+        state mean. None uses every observation.
+
+    Examples
+    --------
+    >>> engine = BatchKalmanBeta(transition_covariance=0.001, em_iterations=0)
+    >>> result = engine.fit(asset_returns, market_returns)
+    >>> result.beta[-1]  # Latest beta of every asset
+    """
+
+    def __init__(
+        self,
+        transition_covariance: float = 0.001,
+        observation_covariance: float | None = None,
+        *,
+        include_alpha: bool = False,
+        em_iterations: int = 10,
+        em_vars: frozenset[EMVariable] | None = None,
+        initial_state_covariance: float = 1.0,
+        warmup: int | None = None,
+    ) -> None:
+        """Initialize BatchKalmanBeta.
+
+        Raises
+        ------
+        ValueError
+            If a covariance is not positive or em_iterations is negative.
+        """
+        if transition_covariance <= 0:
+            msg = f"transition_covariance must be positive, got {transition_covariance}"
+            raise ValueError(msg)
+        if observation_covariance is not None and observation_covariance <= 0:
+            msg = (
+                f"observation_covariance must be positive, got {observation_covariance}"
+            )
+            raise ValueError(msg)
+        if initial_state_covariance <= 0:
+            msg = (
+                "initial_state_covariance must be positive, "
+                f"got {initial_state_covariance}"
+            )
+            raise ValueError(msg)
+        if em_iterations < 0:
+            msg = f"em_iterations must be non-negative, got {em_iterations}"
+            raise ValueError(msg)
+
+        self.transition_covariance = transition_covariance
+        self.observation_covariance = observation_covariance
+        self.include_alpha = include_alpha
+        self.em_iterations = em_iterations
+        self.em_vars = DEFAULT_EM_VARS if em_vars is None else frozenset(em_vars)
+        self.initial_state_covariance = initial_state_covariance
+        self.warmup = warmup
+
+    @property
+    def n_dim_state(self) -> int:
+        """Return the state dimension (1 for beta, 2 for alpha and beta)."""
+        return 2 if self.include_alpha else 1
+
+    def fit(
+        self,
+        asset_returns: npt.ArrayLike,
+        market_returns: npt.ArrayLike,
+        *,
+        smooth: bool = False,
+    ) -> KalmanBetaResult:
+        """Estimate noise parameters and run the filter over a full sample.
+
+        Parameters
+        ----------
+        asset_returns : array-like
+            Asset returns, shape (T, N) or (T,). NaN marks a missing value.
+        market_returns : array-like
+            Benchmark returns, shape (T,).
+        smooth : bool, default=False
+            Return RTS-smoothed instead of filtered estimates. The returned
+            ``state`` is always the filtered state after the last step.
+
+        Returns
+        -------
+        KalmanBetaResult
+            State estimates for every time step.
+        """
+        y, x, observed = self._prepare(asset_returns, market_returns)
+        n_assets = y.shape[1]
+        k = self.n_dim_state
+
+        initial_mean = self._initial_state_mean(y, x, observed)
+        initial_cov = np.broadcast_to(
+            np.eye(k) * self.initial_state_covariance, (n_assets, k, k)
+        ).copy()
+        transition_cov = np.full((n_assets, k), self.transition_covariance)
+        if self.observation_covariance is not None:
+            observation_cov = np.full(n_assets, self.observation_covariance)
+        else:
+            observation_cov = _masked_variance(y, observed)
+
+        logger.debug(
+            "Fitting batched Kalman beta",
+            n_obs=y.shape[0],
+            n_assets=n_assets,
+            include_alpha=self.include_alpha,
+            em_iterations=self.em_iterations,
+        )
+
+        em_vars = self.em_vars if self.em_iterations > 0 else frozenset()
+        for _ in range(self.em_iterations if em_vars else 0):
+            initial_state = KalmanBetaState(
+                state_mean=initial_mean,
+                state_covariance=initial_cov,
+                transition_covariance=transition_cov,
+                observation_covariance=observation_cov,
+                started=np.zeros(n_assets, dtype=bool),
+            )
+            forward = _forward(y, x, observed, initial_state)
+            smoothed_means, smoothed_covs, lag_one_covs = _rts_smooth(forward)
+
+            if "initial_state_mean" in em_vars:
+                initial_mean = smoothed_means[0]
+            if "initial_state_covariance" in em_vars:
+                deviation = smoothed_means[0] - initial_mean
+                initial_cov = smoothed_covs[0] + np.einsum(
+                    "ni,nj->nij", deviation, deviation
+                )
+            if "observation_covariance" in em_vars:
+                observation_cov = _estimate_observation_covariance(
+                    y, x, observed, smoothed_means, smoothed_covs
+                )
+            if "transition_covariance" in em_vars:
+                transition_cov = _estimate_transition_covariance(
+                    observed, smoothed_means, smoothed_covs, lag_one_covs
+                )
+
+        initial_state = KalmanBetaState(
+            state_mean=initial_mean,
+            state_covariance=initial_cov,
+            transition_covariance=transition_cov,
+            observation_covariance=observation_cov,
+            started=np.zeros(n_assets, dtype=bool),
+        )
+        forward = _forward(y, x, observed, initial_state)
+
+        if smooth:
+            means, covs, _ = _rts_smooth(forward)
+        else:
+            means, covs = forward.filtered_means, forward.filtered_covs
+
+        return KalmanBetaResult(
+            state_means=means,
+            state_covariances=covs,
+            observed=observed,
+            state=forward.state,
+        )
+
+    def update(
+        self,
+        state: KalmanBetaState,
+        asset_returns: npt.ArrayLike,
+        market_returns: npt.ArrayLike,
+    ) -> KalmanBetaResult:
+        """Continue filtering from a previous state with new observations.
+
+        Noise parameters are taken from ``state`` and kept fixed, so only
+        the new time steps are processed.
+
+        Parameters
+        ----------
+        state : KalmanBetaState
+            State returned by a previous ``fit`` or ``update``.
+        asset_returns : array-like
+            New asset returns, shape (T_new, N) or (T_new,).
+        market_returns : array-like
+            New benchmark returns, shape (T_new,).
+
+        Returns
+        -------
+        KalmanBetaResult
+            Filtered estimates for the new time steps and the updated state.
+
+        Raises
+        ------
+        ValueError
+            If the number of assets or the state dimension does not match.
+        """
+        y, x, observed = self._prepare(asset_returns, market_returns)
+        if y.shape[1] != state.state_mean.shape[0]:
+            msg = (
+                f"asset_returns has {y.shape[1]} assets, "
+                f"state has {state.state_mean.shape[0]}"
+            )
+            raise ValueError(msg)
+        if state.include_alpha != self.include_alpha:
+            msg = "state include_alpha does not match this filter"
+            raise ValueError(msg)
+
+        forward = _forward(y, x, observed, state)
+        return KalmanBetaResult(
+            state_means=forward.filtered_means,
+            state_covariances=forward.filtered_covs,
+            observed=observed,
+            state=forward.state,
+        )
+
+    # =========================================================================
+    # Private Methods
+    # =========================================================================
+
+    def _prepare(
+        self, asset_returns: npt.ArrayLike, market_returns: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        """Convert inputs to float arrays and build the observation mask."""
+        y = np.asarray(asset_returns, dtype=np.float64)
+        if y.ndim == 1:
+            y = y[:, np.newaxis]
+        x = np.asarray(market_returns, dtype=np.float64).reshape(-1)
+
+        if y.ndim != 2 or y.shape[0] != x.shape[0]:
+            msg = (
+                "asset_returns must have shape (T, N) and market_returns (T,), "
+                f"got {y.shape} and {x.shape}"
+            )
+            raise ValueError(msg)
+
+        observed = np.isfinite(y) & np.isfinite(x)[:, np.newaxis]
+        return np.where(observed, y, 0.0), np.where(np.isfinite(x), x, 0.0), observed
+
+    def _initial_state_mean(
+        self,
+        y: npt.NDArray[np.float64],
+        x: npt.NDArray[np.float64],
+        observed: npt.NDArray[np.bool_],
+    ) -> npt.NDArray[np.float64]:
+        """Estimate initial states by masked OLS over the warmup observations."""
+        mask = observed
+        if self.warmup is not None:
+            mask = observed & (np.cumsum(observed, axis=0) <= self.warmup)
+
+        weight = mask.astype(np.float64)
+        xb = x[:, np.newaxis]
+        n = weight.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_x = (weight * xb).sum(axis=0) / n
+            mean_y = (weight * y).sum(axis=0) / n
+            cov_xy = (weight * (xb - mean_x) * (y - mean_y)).sum(axis=0)
+            var_x = (weight * (xb - mean_x) ** 2).sum(axis=0)
+            beta = np.where(var_x > 0, cov_xy / var_x, 0.0)
+        beta = np.nan_to_num(beta)
+
+        if not self.include_alpha:
+            return beta[:, np.newaxis]
+        alpha = np.nan_to_num(mean_y - beta * mean_x)
+        return np.column_stack([alpha, beta])
+
+
+def _design(x_t: float, n_assets: int, k: int) -> npt.NDArray[np.float64]:
+    """Return the observation row H_t broadcast to all assets, shape (N, k)."""
+    row = np.array([1.0, x_t]) if k == 2 else np.array([x_t])
+    return np.broadcast_to(row, (n_assets, k))
+
+
+def _forward(
+    y: npt.NDArray[np.float64],
+    x: npt.NDArray[np.float64],
+    observed: npt.NDArray[np.bool_],
+    state: KalmanBetaState,
+) -> _FilterPass:
+    """Run the Kalman filter over all time steps for all assets at once."""
+    n_obs, n_assets = y.shape
+    k = state.state_mean.shape[1]
+    q = np.einsum("ni,ij->nij", state.transition_covariance, np.eye(k))
+    r = state.observation_covariance
+
+    filtered_means = np.empty((n_obs, n_assets, k))
+    filtered_covs = np.empty((n_obs, n_assets, k, k))
+    predicted_means = np.empty((n_obs, n_assets, k))
+    predicted_covs = np.empty((n_obs, n_assets, k, k))
+
+    mean = state.state_mean.copy()
+    cov = state.state_covariance.copy()
+    started = state.started.copy()
+
+    for t in range(n_obs):
+        obs = observed[t]
+
+        # Predict: add state noise only to assets observed now and before
+        step = (obs & started)[:, np.newaxis, np.newaxis]
+        pred_cov = cov + np.where(step, q, 0.0)
+        pred_mean = mean
+
+        # Update with the observation row H_t = [1, x_t] or [x_t]
+        h = _design(x[t], n_assets, k)
+        ph = np.einsum("nij,nj->ni", pred_cov, h)
+        innovation_var = np.einsum("ni,ni->n", h, ph) + r
+        gain = ph / innovation_var[:, np.newaxis]
+        innovation = y[t] - np.einsum("ni,ni->n", h, pred_mean)
+
+        upd_mean = pred_mean + gain * innovation[:, np.newaxis]
+        upd_cov = pred_cov - np.einsum("ni,nj->nij", gain, ph)
+
+        mean = np.where(obs[:, np.newaxis], upd_mean, pred_mean)
+        cov = np.where(obs[:, np.newaxis, np.newaxis], upd_cov, pred_cov)
+        started |= obs
+
+        predicted_means[t] = pred_mean
+        predicted_covs[t] = pred_cov
+        filtered_means[t] = mean
+        filtered_covs[t] = cov
+
+    return _FilterPass(
+        filtered_means=filtered_means,
+        filtered_covs=filtered_covs,
+        predicted_means=predicted_means,
+        predicted_covs=predicted_covs,
+        state=KalmanBetaState(
+            state_mean=mean,
+            state_covariance=cov,
+            transition_covariance=state.transition_covariance,
+            observation_covariance=state.observation_covariance,
+            started=started,
+        ),
+    )
+
+
+def _rts_smooth(
+    forward: _FilterPass,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Run the Rauch-Tung-Striebel smoother on a forward pass.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Smoothed means (T, N, k), smoothed covariances (T, N, k, k) and
+        lag-one covariances Cov(state_t, state_t-1) (T, N, k, k), the
+        first of which is zero.
+    """
+    means = forward.filtered_means.copy()
+    covs = forward.filtered_covs.copy()
+    lag_one = np.zeros_like(covs)
+
+    for t in range(means.shape[0] - 2, -1, -1):
+        gain = forward.filtered_covs[t] @ np.linalg.inv(forward.predicted_covs[t + 1])
+        gain_t = np.swapaxes(gain, -1, -2)
+        means[t] = forward.filtered_means[t] + np.einsum(
+            "nij,nj->ni", gain, means[t + 1] - forward.predicted_means[t + 1]
+        )
+        covs[t] = (
+            forward.filtered_covs[t]
+            + gain @ (covs[t + 1] - forward.predicted_covs[t + 1]) @ gain_t
+        )
+        lag_one[t + 1] = covs[t + 1] @ gain_t
+
+    return means, covs, lag_one
+
+
+def _estimate_observation_covariance(
+    y: npt.NDArray[np.float64],
+    x: npt.NDArray[np.float64],
+    observed: npt.NDArray[np.bool_],
+    means: npt.NDArray[np.float64],
+    covs: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """EM M-step for the observation noise variance of every asset."""
+    k = means.shape[-1]
+    h = np.stack([_design(x_t, 1, k)[0] for x_t in x])  # (T, k)
+    fitted = np.einsum("tk,tnk->tn", h, means)
+    spread = np.einsum("tk,tnkl,tl->tn", h, covs, h)
+    contribution = np.where(observed, (y - fitted) ** 2 + spread, 0.0)
+    n = np.maximum(observed.sum(axis=0), 1)
+    return np.maximum(contribution.sum(axis=0) / n, _MIN_VARIANCE)
+
+
+def _estimate_transition_covariance(
+    observed: npt.NDArray[np.bool_],
+    means: npt.NDArray[np.float64],
+    covs: npt.NDArray[np.float64],
+    lag_one: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """EM M-step for the diagonal state noise covariance of every asset.
+
+    Steps without a transition (before the first observation or while an
+    asset is unobserved) contribute exactly zero, so the sum is divided by
+    the number of actual transitions.
+    """
+    diff = means[1:] - means[:-1]
+    var_t = np.diagonal(covs[1:], axis1=-2, axis2=-1)
+    var_prev = np.diagonal(covs[:-1], axis1=-2, axis2=-1)
+    cov_lag = np.diagonal(lag_one[1:], axis1=-2, axis2=-1)
+    contribution = diff**2 + var_t + var_prev - 2.0 * cov_lag
+    transitions = np.maximum(observed.sum(axis=0) - 1, 1)
+    return np.maximum(
+        contribution.sum(axis=0) / transitions[:, np.newaxis], _MIN_VARIANCE
+    )
+
+
+def _masked_variance(
+    y: npt.NDArray[np.float64], observed: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.float64]:
+    """Return the population variance of each column over observed rows."""
+    n = np.maximum(observed.sum(axis=0), 1)
+    mean = np.where(observed, y, 0.0).sum(axis=0) / n
+    var = np.where(observed, (y - mean) ** 2, 0.0).sum(axis=0) / n
+    return np.maximum(var, _MIN_VARIANCE)
+
+
+__all__ = [
+    "DEFAULT_EM_VARS",
+    "BatchKalmanBeta",
+    "KalmanBetaResult",
+    "KalmanBetaState",
+]
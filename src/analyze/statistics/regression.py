@@ -0,0 +1,218 @@
+"""Vectorized rolling OLS regression against a benchmark.
+
+This module provides a rolling single-factor regression kernel that computes
+beta, alpha, R-squared and residual volatility for every column of a
+DataFrame against one benchmark series in a single pass. Window moments are
+obtained from differences of cumulative sums, so the cost is O(T * N)
+regardless of the window length and no Python function is called per window.
+
+Observations are used pairwise: a row enters the window statistics of an
+asset only when both the asset and the benchmark are observed, and
+``min_periods`` counts those paired observations.
+
+Functions
+---------
+rolling_regression : Rolling OLS of each column on a benchmark
+
+Classes
+-------
+RollingRegressionResult : Rolling beta, alpha, R-squared and residual volatility
+
+Examples
+--------
+>>> import pandas as pd
+>>> from analyze.statistics.regression import rolling_regression
+>>> df = pd.DataFrame({
+...     "AAPL": [0.02, 0.04, -0.02, 0.06, 0.02, 0.04],
+...     "MSFT": [0.01, 0.03, -0.01, 0.04, 0.02, 0.03],
+... })
+>>> spy = pd.Series([0.01, 0.02, -0.01, 0.03, 0.01, 0.02])
+>>> result = rolling_regression(df, spy, window=5)
+>>> result.beta.columns.tolist()
+['AAPL', 'MSFT']
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from utils_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Window variances below this fraction of the series' overall variance are
+# treated as zero (cumulative-sum differences leave rounding residue)
+_ZERO_VARIANCE_TOL = 1e-10
+
+
+@dataclass(frozen=True)
+class RollingRegressionResult:
+    """Rolling OLS estimates of each asset on a benchmark.
+
+    All frames share the index and columns of the input assets. Windows with
+    fewer than ``min_periods`` paired observations, or with zero benchmark
+    variance, are NaN.
+
+    Attributes
+    ----------
+    beta : pd.DataFrame
+        Slope, Cov(asset, benchmark) / Var(benchmark).
+    alpha : pd.DataFrame
+        Intercept, mean(asset) - beta * mean(benchmark).
+    r_squared : pd.DataFrame
+        Coefficient of determination of the window regression.
+    residual_vol : pd.DataFrame
+        Standard deviation of the regression residuals (ddof=2).
+    n_obs : pd.DataFrame
+        Number of paired observations in each window.
+    """
+
+    beta: pd.DataFrame
+    alpha: pd.DataFrame
+    r_squared: pd.DataFrame
+    residual_vol: pd.DataFrame
+    n_obs: pd.DataFrame
+
+
+def rolling_regression(
+    assets: pd.DataFrame | pd.Series,
+    benchmark: pd.Series,
+    window: int,
+    min_periods: int | None = None,
+) -> RollingRegressionResult:
+    """Regress every asset on a benchmark over a rolling window.
+
+    Parameters
+    ----------
+    assets : pd.DataFrame | pd.Series
+        Asset return series, one column per asset. A Series is treated as a
+        single-column DataFrame.
+    benchmark : pd.Series
+        Benchmark return series. Aligned to the index of ``assets``.
+    window : int
+        Rolling window size (number of rows).
+    min_periods : int | None, default=None
+        Minimum paired observations required. Defaults to ``window``.
+
+    Returns
+    -------
+    RollingRegressionResult
+        Rolling beta, alpha, R-squared, residual volatility and counts.
+
+    Raises
+    ------
+    ValueError
+        If window or min_periods is invalid.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> asset = pd.Series([0.02, 0.04, -0.02, 0.06, 0.02, 0.04])
+    >>> spy = pd.Series([0.01, 0.02, -0.01, 0.03, 0.01, 0.02])
+    >>> result = rolling_regression(asset, spy, window=5)
+    >>> round(float(result.beta.iloc[-1, 0]), 6)
+    2.0
+    """
+    if window < 2:
+        msg = f"Window must be at least 2, got {window}"
+        logger.error(msg, window=window)
+        raise ValueError(msg)
+
+    if min_periods is None:
+        min_periods = window
+
+    if min_periods < 2:
+        msg = f"min_periods must be at least 2, got {min_periods}"
+        logger.error(msg, min_periods=min_periods)
+        raise ValueError(msg)
+
+    frame = assets.to_frame() if isinstance(assets, pd.Series) else assets
+    x = benchmark.reindex(frame.index).to_numpy(dtype=np.float64)
+    y = frame.to_numpy(dtype=np.float64)
+
+    logger.debug(
+        "Calculating rolling regression",
+        window=window,
+        min_periods=min_periods,
+        rows=y.shape[0],
+        columns=y.shape[1],
+    )
+
+    mask = ~np.isnan(y) & ~np.isnan(x)[:, np.newaxis]
+
+    # Centre each series on its mean so the cumulative sums stay small
+    x_shift = _masked_mean(x[:, np.newaxis], ~np.isnan(x)[:, np.newaxis])
+    y_shift = _masked_mean(y, mask)
+    x_paired = np.where(mask, x[:, np.newaxis] - x_shift, 0.0)
+    y_paired = np.where(mask, y - y_shift, 0.0)
+
+    n = _window_sum(mask.astype(np.float64), window)
+    sum_x = _window_sum(x_paired, window)
+    sum_y = _window_sum(y_paired, window)
+    sum_xx = _window_sum(x_paired * x_paired, window)
+    sum_yy = _window_sum(y_paired * y_paired, window)
+    sum_xy = _window_sum(x_paired * y_paired, window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_x = sum_x / n
+        mean_y = sum_y / n
+        ss_x = sum_xx - sum_x * mean_x
+        ss_y = sum_yy - sum_y * mean_y
+        ss_xy = sum_xy - sum_x * mean_y
+
+        x_flat = ss_x <= _ZERO_VARIANCE_TOL * n * _masked_mean(x_paired**2, mask)
+        y_flat = ss_y <= _ZERO_VARIANCE_TOL * n * _masked_mean(y_paired**2, mask)
+        valid = (n >= min_periods) & ~x_flat
+
+        beta = np.where(valid, ss_xy / ss_x, np.nan)
+        alpha = (mean_y + y_shift) - beta * (mean_x + x_shift)
+        explained = beta * ss_xy
+        r_squared = np.where(y_flat, np.nan, explained / ss_y)
+        residual_var = np.maximum(ss_y - explained, 0.0) / (n - 2)
+        residual_vol = np.where(n > 2, np.sqrt(residual_var), np.nan)
+
+    def _frame(values: npt.NDArray[np.float64]) -> pd.DataFrame:
+        return pd.DataFrame(values, index=frame.index, columns=frame.columns)
+
+    result = RollingRegressionResult(
+        beta=_frame(beta),
+        alpha=_frame(alpha),
+        r_squared=_frame(np.where(valid, r_squared, np.nan)),
+        residual_vol=_frame(np.where(valid, residual_vol, np.nan)),
+        n_obs=_frame(n),
+    )
+
+    logger.debug(
+        "Rolling regression calculated",
+        window=window,
+        valid_values=int(np.count_nonzero(~np.isnan(beta))),
+    )
+
+    return result
+
+
+def _masked_mean(
+    values: npt.NDArray[np.float64], mask: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.float64]:
+    """Column means of ``values`` over ``mask``; 0 for empty columns."""
+    counts = mask.sum(axis=0)
+    totals = np.where(mask, values, 0.0).sum(axis=0)
+    return np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+
+
+def _window_sum(
+    values: npt.NDArray[np.float64], window: int
+) -> npt.NDArray[np.float64]:
+    """Trailing window sums along axis 0 via cumulative-sum differences."""
+    cumulative = np.cumsum(values, axis=0)
+    result = cumulative.copy()
+    result[window:] -= cumulative[:-window]
+    return result
+
+
+__all__ = [
+    "RollingRegressionResult",
+    "rolling_regression",
+]
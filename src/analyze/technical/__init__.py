@@ -30,18 +30,39 @@ MACDResult
     Result of MACD calculation
 """
 
-from .indicators import TechnicalIndicators
-from .types import (
-    BollingerBandsParams,
-    BollingerBandsResult,
-    EMAParams,
-    MACDParams,
-    MACDResult,
-    ReturnParams,
-    RSIParams,
-    SMAParams,
-    VolatilityParams,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .indicators import TechnicalIndicators
+    from .types import (
+        BollingerBandsParams,
+        BollingerBandsResult,
+        EMAParams,
+        MACDParams,
+        MACDResult,
+        ReturnParams,
+        RSIParams,
+        SMAParams,
+        VolatilityParams,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "TechnicalIndicators": ".indicators",
+    "BollingerBandsParams": ".types",
+    "BollingerBandsResult": ".types",
+    "EMAParams": ".types",
+    "MACDParams": ".types",
+    "MACDResult": ".types",
+    "ReturnParams": ".types",
+    "RSIParams": ".types",
+    "SMAParams": ".types",
+    "VolatilityParams": ".types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BollingerBandsParams",
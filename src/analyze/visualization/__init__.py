@@ -31,34 +31,81 @@ Examples
 
 >>> from analyze.visualization import plot_dollar_index_and_metals
 >>> fig = plot_dollar_index_and_metals(df_cum_return)
+
+>>> from analyze.visualization import ChartExporter
+>>> with ChartExporter(workers=4) as exporter:
+...     exporter.add(chart, "report/price.png").add(fig, "report/dxy.png")
+...     report = exporter.export()
 """
 
-from .beta import plot_rolling_beta
-from .charts import (
-    DARK_THEME_COLORS,
-    DEFAULT_HEIGHT,
-    DEFAULT_WIDTH,
-    JAPANESE_FONT_STACK,
-    LIGHT_THEME_COLORS,
-    ChartBuilder,
-    ChartConfig,
-    ChartTheme,
-    ExportFormat,
-    ThemeColors,
-    get_theme_colors,
-)
-from .correlation import plot_rolling_correlation
-from .currency import plot_dollar_index_and_metals
-from .heatmap import HeatmapChart
-from .performance import apply_df_style, plot_cumulative_returns
-from .price_charts import (
-    CandlestickChart,
-    IndicatorOverlay,
-    LineChart,
-    PriceChartBuilder,
-    PriceChartData,
-)
-from .volatility import plot_vix_and_high_yield_spread, plot_vix_and_uncertainty_index
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .beta import plot_rolling_beta
+    from .charts import (
+        DARK_THEME_COLORS,
+        DEFAULT_HEIGHT,
+        DEFAULT_WIDTH,
+        JAPANESE_FONT_STACK,
+        LIGHT_THEME_COLORS,
+        ChartBuilder,
+        ChartConfig,
+        ChartTheme,
+        ExportFormat,
+        ThemeColors,
+        get_theme_colors,
+    )
+    from .correlation import plot_rolling_correlation
+    from .currency import plot_dollar_index_and_metals
+    from .export import ChartExporter, ExportReport, figure_spec_hash
+    from .heatmap import HeatmapChart
+    from .performance import apply_df_style, plot_cumulative_returns
+    from .price_charts import (
+        CandlestickChart,
+        IndicatorOverlay,
+        LineChart,
+        PriceChartBuilder,
+        PriceChartData,
+    )
+    from .volatility import (
+        plot_vix_and_high_yield_spread,
+        plot_vix_and_uncertainty_index,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "plot_rolling_beta": ".beta",
+    "DARK_THEME_COLORS": ".charts",
+    "DEFAULT_HEIGHT": ".charts",
+    "DEFAULT_WIDTH": ".charts",
+    "JAPANESE_FONT_STACK": ".charts",
+    "LIGHT_THEME_COLORS": ".charts",
+    "ChartBuilder": ".charts",
+    "ChartConfig": ".charts",
+    "ChartTheme": ".charts",
+    "ExportFormat": ".charts",
+    "ThemeColors": ".charts",
+    "get_theme_colors": ".charts",
+    "plot_rolling_correlation": ".correlation",
+    "plot_dollar_index_and_metals": ".currency",
+    "ChartExporter": ".export",
+    "ExportReport": ".export",
+    "figure_spec_hash": ".export",
+    "HeatmapChart": ".heatmap",
+    "apply_df_style": ".performance",
+    "plot_cumulative_returns": ".performance",
+    "CandlestickChart": ".price_charts",
+    "IndicatorOverlay": ".price_charts",
+    "LineChart": ".price_charts",
+    "PriceChartBuilder": ".price_charts",
+    "PriceChartData": ".price_charts",
+    "plot_vix_and_high_yield_spread": ".volatility",
+    "plot_vix_and_uncertainty_index": ".volatility",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "DARK_THEME_COLORS",
@@ -69,8 +116,10 @@ __all__ = [
     "CandlestickChart",
     "ChartBuilder",
     "ChartConfig",
+    "ChartExporter",
     "ChartTheme",
     "ExportFormat",
+    "ExportReport",
     "HeatmapChart",
     "IndicatorOverlay",
     "LineChart",
@@ -78,6 +127,7 @@ __all__ = [
     "PriceChartData",
     "ThemeColors",
     "apply_df_style",
+    "figure_spec_hash",
     "get_theme_colors",
     "plot_cumulative_returns",
     "plot_dollar_index_and_metals",
@@ -190,6 +190,40 @@ def get_theme_colors(theme: ChartTheme | str) -> ThemeColors:
     return LIGHT_THEME_COLORS
 
 
+def resolve_export_format(
+    path: str | Path, format: ExportFormat | str | None = None
+) -> ExportFormat:
+    """Resolve the export format of an output file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Output file path
+    format : ExportFormat | str | None
+        Export format. If None, inferred from file extension.
+
+    Returns
+    -------
+    ExportFormat
+        Resolved export format
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported or cannot be inferred
+    """
+    if format is None:
+        ext = Path(path).suffix.lower().lstrip(".")
+        try:
+            return ExportFormat(ext)
+        except ValueError as err:
+            raise ValueError(
+                f"Cannot infer format from extension '{ext}'. "
+                f"Supported formats: {[f.value for f in ExportFormat]}"
+            ) from err
+    return ExportFormat(format)
+
+
 # =============================================================================
 # Chart Configuration
 # =============================================================================
@@ -573,19 +607,7 @@ class ChartBuilder(ABC):
             raise RuntimeError("Chart not built. Call build() first.")
 
         path = Path(path)
-
-        # Infer format from extension if not specified
-        if format is None:
-            ext = path.suffix.lower().lstrip(".")
-            try:
-                format = ExportFormat(ext)
-            except ValueError as err:
-                raise ValueError(
-                    f"Cannot infer format from extension '{ext}'. "
-                    f"Supported formats: {[f.value for f in ExportFormat]}"
-                ) from err
-        elif isinstance(format, str):  # type: ignore[reportUnnecessaryIsInstance]
-            format = ExportFormat(format)
+        format = resolve_export_format(path, format)
 
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -683,4 +705,5 @@ __all__ = [
     "ExportFormat",
     "ThemeColors",
     "get_theme_colors",
+    "resolve_export_format",
 ]
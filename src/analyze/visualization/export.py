@@ -0,0 +1,457 @@
+"""Batch chart export through a persistent Kaleido renderer.
+
+``ChartBuilder.save`` renders each image with ``pio.write_image``, which
+starts a fresh headless Chrome for every figure. Reports export dozens of
+charts, so that start-up dominates. ``ChartExporter`` queues figures and
+renders all images of a batch in one browser, spread over several tabs in
+parallel; used as a context manager, the browser stays open across
+batches. Every output directory keeps a manifest of the figure spec hash
+of each exported file, and a figure whose spec has not changed since its
+last export is not rendered again.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+import kaleido
+import plotly
+import plotly.graph_objects as go
+import plotly.io as pio
+from kaleido.errors import ChromeNotFoundError
+
+from utils_core.logging import get_logger
+
+from .charts import ChartBuilder, ExportFormat, resolve_export_format
+
+logger = get_logger(__name__)
+
+# Manifest file written to each output directory
+MANIFEST_NAME = ".chart_manifest.json"
+
+
+@dataclass(frozen=True)
+class ExportJob:
+    """One queued chart export.
+
+    Attributes
+    ----------
+    figure : go.Figure
+        Figure to export
+    path : Path
+        Output file path
+    format : ExportFormat
+        Export format
+    scale : float
+        Scale factor for raster formats
+    """
+
+    figure: go.Figure
+    path: Path
+    format: ExportFormat
+    scale: float
+
+    @property
+    def spec_hash(self) -> str:
+        """Hash of everything that determines the output file.
+
+        Returns
+        -------
+        str
+            SHA-256 of the figure JSON, export options and plotly version
+        """
+        return figure_spec_hash(self.figure, self.format, self.scale)
+
+
+@dataclass
+class ExportReport:
+    """Outcome of a batch export.
+
+    Attributes
+    ----------
+    rendered : list[Path]
+        Files written in this batch
+    skipped : list[Path]
+        Files left as is because their spec hash was unchanged
+    """
+
+    rendered: list[Path] = field(default_factory=list)
+    skipped: list[Path] = field(default_factory=list)
+
+
+def figure_spec_hash(
+    figure: go.Figure, format: ExportFormat | str, scale: float = 2.0
+) -> str:
+    """Compute the spec hash of a figure export.
+
+    Parameters
+    ----------
+    figure : go.Figure
+        Figure to export
+    format : ExportFormat | str
+        Export format
+    scale : float
+        Scale factor for raster formats (ignored for SVG and HTML)
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest
+    """
+    format = ExportFormat(format)
+    options = {
+        "format": format.value,
+        "scale": scale if format == ExportFormat.PNG else None,
+        "plotly": plotly.__version__,
+    }
+    digest = hashlib.sha256(json.dumps(options, sort_keys=True).encode())
+    digest.update((pio.to_json(figure, validate=False) or "").encode())
+    return digest.hexdigest()
+
+
+class _KaleidoRenderer:
+    """Kaleido browser kept open on a private event loop thread.
+
+    Kaleido's own ``start_sync_server`` reports start-up failures (e.g. no
+    Chrome) only on its worker thread and then blocks forever, so the
+    browser is opened here and any error is raised to the caller.
+    """
+
+    def __init__(self, workers: int, timeout: int | None) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="kaleido-renderer", daemon=True
+        )
+        self._thread.start()
+        try:
+            self._kaleido = self._call(self._open(workers, timeout))
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    async def _open(self, workers: int, timeout: int | None) -> kaleido.Kaleido:
+        try:
+            browser = kaleido.Kaleido(n=workers, timeout=timeout)
+        except ChromeNotFoundError as err:
+            msg = (
+                "Chart image export requires Chrome. Install it with "
+                "`kaleido_get_chrome` or `plotly_get_chrome`."
+            )
+            raise RuntimeError(msg) from err
+        await browser.open()
+        return browser
+
+    def _call(self, coroutine: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def render(self, jobs: list[ExportJob]) -> None:
+        """Render image jobs concurrently; raise on the first failure."""
+        specs = [
+            {
+                "fig": job.figure.to_dict(),
+                "path": job.path,
+                "opts": {
+                    "format": job.format.value,
+                    "scale": job.scale if job.format == ExportFormat.PNG else 1,
+                },
+            }
+            for job in jobs
+        ]
+        errors: list[Any] = []
+        self._call(self._kaleido.write_fig_from_object(specs, error_log=errors))
+        if errors:
+            raise RuntimeError(f"Chart rendering failed: {errors[0]}")
+
+    def close(self) -> None:
+        """Close the browser and stop the event loop."""
+        try:
+            self._call(self._kaleido.close())
+        finally:
+            self._stop_loop()
+
+
+class ChartExporter:
+    """Queue charts and export them in one batch.
+
+    HTML files are written directly. PNG and SVG files are rendered by one
+    Kaleido browser with ``workers`` tabs in parallel. Inside a ``with``
+    block the browser is opened on the first batch with images and reused
+    until the block exits; otherwise each ``export()`` opens and closes
+    its own.
+
+    Parameters
+    ----------
+    workers : int
+        Number of browser tabs rendering in parallel (default: 4)
+    timeout : int | None
+        Seconds allowed to render one image, None for no limit
+        (default: 90)
+    skip_unchanged : bool
+        Skip files whose spec hash matches the manifest of their directory
+        (default: True)
+
+    Raises
+    ------
+    ValueError
+        If workers is less than 1
+
+    Examples
+    --------
+    >>> with ChartExporter(workers=4) as exporter:
+    ...     exporter.add(CandlestickChart(data).build(), "out/price.png")
+    ...     exporter.add(HeatmapChart(corr).build(), "out/heatmap.svg")
+    ...     exporter.add(plot_vix_and_high_yield_spread(df), "out/vix.png")
+    ...     report = exporter.export()
+    >>> report.skipped
+    [PosixPath('out/heatmap.svg')]
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        timeout: int | None = 90,
+        skip_unchanged: bool = True,
+    ) -> None:
+        """Initialize ChartExporter.
+
+        Parameters
+        ----------
+        workers : int
+            Number of browser tabs rendering in parallel (default: 4)
+        timeout : int | None
+            Seconds allowed to render one image, None for no limit
+            (default: 90)
+        skip_unchanged : bool
+            Skip files whose spec hash matches the manifest of their
+            directory (default: True)
+
+        Raises
+        ------
+        ValueError
+            If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        self._workers = workers
+        self._timeout = timeout
+        self._skip_unchanged = skip_unchanged
+        self._jobs: dict[Path, ExportJob] = {}
+        self._renderer: _KaleidoRenderer | None = None
+        self._persistent = False
+
+    def __enter__(self) -> Self:
+        self._persistent = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._persistent = False
+        self.close()
+
+    @property
+    def pending(self) -> list[ExportJob]:
+        """Get the queued jobs in insertion order.
+
+        Returns
+        -------
+        list[ExportJob]
+            Jobs waiting for ``export()``
+        """
+        return list(self._jobs.values())
+
+    def add(
+        self,
+        chart: ChartBuilder | go.Figure,
+        path: str | Path,
+        format: ExportFormat | str | None = None,
+        *,
+        scale: float = 2.0,
+    ) -> "ChartExporter":
+        """Queue a chart for export.
+
+        Parameters
+        ----------
+        chart : ChartBuilder | go.Figure
+            Built chart builder or a Plotly figure
+        path : str | Path
+            Output file path. Queuing the same path again replaces the
+            earlier job.
+        format : ExportFormat | str | None
+            Export format. If None, inferred from file extension.
+        scale : float
+            Scale factor for raster formats (default: 2.0 for high DPI)
+
+        Returns
+        -------
+        ChartExporter
+            Self for method chaining
+
+        Raises
+        ------
+        RuntimeError
+            If a chart builder has not been built yet
+        ValueError
+            If the export format is not supported
+        """
+        figure = chart.figure if isinstance(chart, ChartBuilder) else chart
+        if figure is None:
+            logger.error("Cannot queue chart: figure not built. Call build() first.")
+            raise RuntimeError("Chart not built. Call build() first.")
+
+        path = Path(path)
+        job = ExportJob(
+            figure=figure,
+            path=path,
+            format=resolve_export_format(path, format),
+            scale=scale,
+        )
+        self._jobs[path.resolve()] = job
+        return self
+
+    def export(self) -> ExportReport:
+        """Export every queued chart and clear the queue.
+
+        Returns
+        -------
+        ExportReport
+            Rendered and skipped files
+
+        Raises
+        ------
+        RuntimeError
+            If images are queued and Chrome is not available, or rendering
+            fails. Manifests are updated only for files written before the
+            failure.
+        """
+        jobs, self._jobs = list(self._jobs.values()), {}
+        report = ExportReport()
+        if not jobs:
+            return report
+
+        manifests = _Manifests()
+        hashes = {job.path: job.spec_hash for job in jobs}
+        todo: list[ExportJob] = []
+        for job in jobs:
+            if (
+                self._skip_unchanged
+                and job.path.exists()
+                and manifests.get(job.path) == hashes[job.path]
+            ):
+                report.skipped.append(job.path)
+            else:
+                todo.append(job)
+
+        logger.info(
+            "Exporting charts",
+            queued=len(jobs),
+            to_render=len(todo),
+            skipped=len(report.skipped),
+        )
+
+        for job in todo:
+            job.path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            for job in todo:
+                if job.format == ExportFormat.HTML:
+                    job.figure.write_html(str(job.path), include_plotlyjs=True)
+                    manifests.set(job.path, hashes[job.path])
+                    report.rendered.append(job.path)
+
+            images = [job for job in todo if job.format != ExportFormat.HTML]
+            if images:
+                self._render(images)
+                for job in images:
+                    manifests.set(job.path, hashes[job.path])
+                    report.rendered.append(job.path)
+        finally:
+            manifests.save()
+
+        logger.info(
+            "Charts exported",
+            rendered=len(report.rendered),
+            skipped=len(report.skipped),
+        )
+        return report
+
+    def _render(self, images: list[ExportJob]) -> None:
+        """Render images with the shared renderer, opening it if needed."""
+        if self._renderer is None:
+            logger.debug("Opening Kaleido renderer", workers=self._workers)
+            self._renderer = _KaleidoRenderer(self._workers, self._timeout)
+        try:
+            self._renderer.render(images)
+        finally:
+            if not self._persistent:
+                self.close()
+
+    def close(self) -> None:
+        """Close the renderer if it is open."""
+        if self._renderer is not None:
+            logger.debug("Closing Kaleido renderer")
+            renderer, self._renderer = self._renderer, None
+            renderer.close()
+
+
+class _Manifests:
+    """Spec hashes per exported file, stored as one JSON file per directory."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, dict[str, str]] = {}
+        self._dirty: set[Path] = set()
+
+    def _load(self, directory: Path) -> dict[str, str]:
+        if directory not in self._entries:
+            manifest = directory / MANIFEST_NAME
+            entries: dict[str, str] = {}
+            if manifest.exists():
+                try:
+                    entries = json.loads(manifest.read_text(encoding="utf-8"))
+                except (OSError, json.JSONDecodeError) as err:
+                    logger.warning(
+                        "Ignoring unreadable chart manifest",
+                        path=str(manifest),
+                        error=str(err),
+                    )
+            self._entries[directory] = entries
+        return self._entries[directory]
+
+    def get(self, path: Path) -> str | None:
+        return self._load(path.parent).get(path.name)
+
+    def set(self, path: Path, spec_hash: str) -> None:
+        self._load(path.parent)[path.name] = spec_hash
+        self._dirty.add(path.parent)
+
+    def save(self) -> None:
+        for directory in self._dirty:
+            (directory / MANIFEST_NAME).write_text(
+                json.dumps(self._entries[directory], indent=2, sort_keys=True),
+                encoding="utf-8",
+            )
+        self._dirty.clear()
+
+
+__all__ = [
+    "MANIFEST_NAME",
+    "ChartExporter",
+    "ExportJob",
+    "ExportReport",
+    "figure_spec_hash",
+]
@@ -0,0 +1,27 @@
+"""Shared cache engine for cross-package caching.
+
+Provides ``CacheStore``, a SQLite-backed key/value cache with TTL, byte and
+entry budgets and LRU/LFU eviction, and the value serializers it uses.
+"""
+
+from database.cache.serializers import (
+    DATAFRAME_FORMATS,
+    deserialize_value,
+    serialize_value,
+)
+from database.cache.store import (
+    CacheStats,
+    CacheStore,
+    CacheStoreConfig,
+    EvictionPolicy,
+)
+
+__all__ = [
+    "DATAFRAME_FORMATS",
+    "CacheStats",
+    "CacheStore",
+    "CacheStoreConfig",
+    "EvictionPolicy",
+    "deserialize_value",
+    "serialize_value",
+]
@@ -0,0 +1,346 @@
+"""Value serializers for the shared cache engine.
+
+This module provides the codecs used by ``CacheStore`` to turn cached values
+into BLOBs. Tabular values (``pd.DataFrame`` / ``pd.Series``) are stored in a
+columnar format (Parquet with zstd, or Arrow IPC) so that a cache hit can read
+only the requested columns and date range instead of unpickling the whole
+object. JSON is used for plain ``dict``/``list`` values and pickle only for
+everything else.
+
+The ``value_type`` stored next to each BLOB identifies the codec. Entries
+written by older versions (``"dataframe"``, ``"series"``, ``"pickle"``) are
+pickles and remain readable.
+"""
+
+import io
+import json
+import pickle  # nosec B403
+from datetime import datetime
+from typing import Any, Literal, Protocol
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from utils_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+type DataFrameFormat = Literal["parquet", "arrow", "pickle"]
+type DateBound = datetime | pd.Timestamp | str | None
+
+# Supported DataFrame formats for CacheStoreConfig.dataframe_format
+DATAFRAME_FORMATS: tuple[str, ...] = ("parquet", "arrow", "pickle")
+
+# Parquet row group size; smaller groups let date filters skip more data
+PARQUET_ROW_GROUP_SIZE = 16_384
+
+# Column name used when a Series is stored as a single-column table
+_SERIES_COLUMN = "__series__"
+_SERIES_NAME_KEY = b"market.cache.series_name"  # kept for stored entries
+
+
+class TabularCodec(Protocol):
+    """Protocol for columnar DataFrame codecs."""
+
+    name: str
+
+    def dumps(self, table: pa.Table) -> bytes:
+        """Encode an Arrow table."""
+        ...
+
+    def loads(
+        self,
+        data: bytes,
+        columns: list[str] | None = None,
+        start: DateBound = None,
+        end: DateBound = None,
+    ) -> pa.Table:
+        """Decode an Arrow table, reading only the requested columns/dates."""
+        ...
+
+
+class ParquetCodec:
+    """Parquet codec with zstd compression.
+
+    Date bounds are pushed down as a row filter, so row groups outside the
+    requested range are skipped using their statistics.
+
+    Parameters
+    ----------
+    compression : str
+        Parquet compression codec (default: "zstd")
+    row_group_size : int
+        Maximum rows per row group (default: PARQUET_ROW_GROUP_SIZE)
+    """
+
+    name = "parquet"
+
+    def __init__(
+        self,
+        compression: str = "zstd",
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+    ) -> None:
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def dumps(self, table: pa.Table) -> bytes:
+        sink = io.BytesIO()
+        pq.write_table(
+            table,
+            sink,
+            compression=self.compression,
+            row_group_size=self.row_group_size,
+        )
+        return sink.getvalue()
+
+    def loads(
+        self,
+        data: bytes,
+        columns: list[str] | None = None,
+        start: DateBound = None,
+        end: DateBound = None,
+    ) -> pa.Table:
+        date_filter = None
+        if columns is not None or start is not None or end is not None:
+            # Only the footer is parsed here; column data is read below
+            schema = pq.read_schema(pa.BufferReader(data))
+            date_filter = _date_filter(schema, start, end)
+            if columns is not None:
+                columns = [c for c in columns if c in schema.names]
+        return pq.read_table(
+            pa.BufferReader(data),
+            columns=columns,
+            filters=date_filter,
+            use_pandas_metadata=True,
+        )
+
+
+class ArrowIPCCodec:
+    """Arrow IPC (Feather v2) codec with zstd-compressed buffers.
+
+    Parameters
+    ----------
+    compression : str | None
+        IPC buffer compression (default: "zstd")
+    """
+
+    name = "arrow"
+
+    def __init__(self, compression: str | None = "zstd") -> None:
+        self.compression = compression
+
+    def dumps(self, table: pa.Table) -> bytes:
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def loads(
+        self,
+        data: bytes,
+        columns: list[str] | None = None,
+        start: DateBound = None,
+        end: DateBound = None,
+    ) -> pa.Table:
+        table = pa.ipc.open_file(pa.BufferReader(data)).read_all()
+        if columns is not None:
+            keep = dict.fromkeys([*_index_columns(table.schema), *columns])
+            table = table.select([c for c in keep if c in table.schema.names])
+        date_filter = _date_filter(table.schema, start, end)
+        return table if date_filter is None else table.filter(date_filter)
+
+
+_CODECS: dict[str, TabularCodec] = {
+    "parquet": ParquetCodec(),
+    "arrow": ArrowIPCCodec(),
+}
+
+
+def _index_columns(schema: pa.Schema) -> list[str]:
+    """Get the physical index column names from pandas metadata."""
+    metadata = schema.pandas_metadata or {}
+    return [c for c in metadata.get("index_columns", []) if isinstance(c, str)]
+
+
+def _to_bound(value: DateBound, field_type: pa.DataType) -> pa.Scalar | None:
+    """Convert a date bound to an Arrow scalar matching ``field_type``."""
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    tz = getattr(field_type, "tz", None)
+    if tz is not None and ts.tzinfo is None:
+        ts = ts.tz_localize(tz)
+    elif tz is None and ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return pa.scalar(ts.to_pydatetime(), type=field_type)
+
+
+def _date_filter(
+    schema: pa.Schema,
+    start: DateBound,
+    end: DateBound,
+) -> pc.Expression | None:
+    """Build an inclusive filter on the first (datetime) index column."""
+    if start is None and end is None:
+        return None
+    index_cols = _index_columns(schema)
+    if not index_cols or not pa.types.is_timestamp(schema.field(index_cols[0]).type):
+        return None
+
+    field = schema.field(index_cols[0])
+    expr = None
+    lower = _to_bound(start, field.type)
+    upper = _to_bound(end, field.type)
+    if lower is not None:
+        expr = pc.field(field.name) >= lower
+    if upper is not None:
+        upper_expr = pc.field(field.name) <= upper
+        expr = upper_expr if expr is None else expr & upper_expr
+    return expr
+
+
+def _slice_frame(
+    value: pd.DataFrame | pd.Series,
+    columns: list[str] | None,
+    start: DateBound,
+    end: DateBound,
+) -> pd.DataFrame | pd.Series:
+    """Apply column/date selection to an already materialized value."""
+    if columns is not None and isinstance(value, pd.DataFrame):
+        value = value[[c for c in columns if c in value.columns]]
+    if (start is not None or end is not None) and isinstance(
+        value.index, pd.DatetimeIndex
+    ):
+        value = value.loc[start:end]
+    return value
+
+
+def serialize_value(
+    value: Any,
+    dataframe_format: str = "parquet",
+) -> tuple[bytes, str]:
+    """Serialize a value for cache storage.
+
+    Parameters
+    ----------
+    value : Any
+        The value to serialize
+    dataframe_format : str
+        Format for DataFrame/Series values: "parquet", "arrow" or "pickle"
+
+    Returns
+    -------
+    tuple[bytes, str]
+        Serialized bytes and the value type identifying the codec
+
+    Raises
+    ------
+    ValueError
+        If ``dataframe_format`` is not supported
+
+    Examples
+    --------
+    >>> data, value_type = serialize_value(df)
+    >>> value_type
+    'parquet'
+    """
+    if dataframe_format not in DATAFRAME_FORMATS:
+        raise ValueError(
+            f"dataframe_format must be one of {DATAFRAME_FORMATS}, "
+            f"got {dataframe_format!r}"
+        )
+
+    if isinstance(value, pd.DataFrame | pd.Series) and dataframe_format != "pickle":
+        codec = _CODECS[dataframe_format]
+        try:
+            if isinstance(value, pd.Series):
+                # Tuple names would round-trip through JSON as lists
+                if not isinstance(value.name, str | int | float | bool | None):
+                    raise TypeError(f"Series name is not a JSON scalar: {value.name!r}")
+                table = pa.Table.from_pandas(value.to_frame(name=_SERIES_COLUMN))
+                metadata = dict(table.schema.metadata or {})
+                metadata[_SERIES_NAME_KEY] = json.dumps(value.name).encode()
+                table = table.replace_schema_metadata(metadata)
+                return codec.dumps(table), f"{codec.name}-series"
+            return codec.dumps(pa.Table.from_pandas(value)), codec.name
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            # Mixed-type object columns etc. cannot be represented in Arrow
+            logger.debug(
+                "Columnar serialization failed, falling back to pickle",
+                format=dataframe_format,
+                error=str(e),
+            )
+
+    if isinstance(value, pd.DataFrame):
+        return pickle.dumps(value), "dataframe"
+    if isinstance(value, pd.Series):
+        return pickle.dumps(value), "series"
+    if isinstance(value, dict | list):
+        return json.dumps(value).encode(), "json"
+    return pickle.dumps(value), "pickle"
+
+
+def deserialize_value(
+    data: bytes,
+    value_type: str,
+    columns: list[str] | None = None,
+    start: DateBound = None,
+    end: DateBound = None,
+) -> Any:
+    """Deserialize a stored value.
+
+    For columnar entries only the requested columns are decoded and the
+    date range is applied on the Arrow table before conversion to pandas.
+
+    Parameters
+    ----------
+    data : bytes
+        The stored bytes
+    value_type : str
+        The value type returned by ``serialize_value``
+    columns : list[str] | None
+        DataFrame columns to read (default: all)
+    start : DateBound
+        Inclusive lower bound on a DatetimeIndex (default: no bound)
+    end : DateBound
+        Inclusive upper bound on a DatetimeIndex (default: no bound)
+
+    Returns
+    -------
+    Any
+        The deserialized value
+    """
+    if value_type == "json":
+        return json.loads(data.decode())
+
+    codec_name, _, kind = value_type.partition("-")
+    codec = _CODECS.get(codec_name)
+    if codec is None:
+        value = pickle.loads(data)  # nosec B301
+        if isinstance(value, pd.DataFrame | pd.Series):
+            return _slice_frame(value, columns, start, end)
+        return value
+
+    if kind == "series":
+        table = codec.loads(data, start=start, end=end)
+        name = json.loads((table.schema.metadata or {})[_SERIES_NAME_KEY])
+        series = table.to_pandas()[_SERIES_COLUMN]
+        series.name = name
+        return series
+
+    return codec.loads(data, columns=columns, start=start, end=end).to_pandas()
+
+
+__all__ = [
+    "DATAFRAME_FORMATS",
+    "ArrowIPCCodec",
+    "DataFrameFormat",
+    "DateBound",
+    "ParquetCodec",
+    "TabularCodec",
+    "deserialize_value",
+    "serialize_value",
+]
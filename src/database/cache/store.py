@@ -0,0 +1,753 @@
+"""SQLite-backed cache engine shared by all finance packages.
+
+This module provides ``CacheStore``, the single cache implementation behind
+``market.cache.SQLiteCache``, ``market.fred.cache.SQLiteCache``,
+``edgar.cache.CacheManager`` and ``factor.providers.cache.Cache``.
+
+Features
+--------
+- Namespaces, so several caches can share one database file
+- TTL-based expiration
+- Byte-size and/or entry-count budgets with LRU or LFU eviction
+- Usage totals maintained by triggers, so budget checks are O(1)
+- Batch ``get_many`` / ``set_many`` in a single transaction
+- Hit / miss / eviction / expiration counters
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from utils_core.logging import get_logger
+
+from .serializers import (
+    DATAFRAME_FORMATS,
+    DateBound,
+    deserialize_value,
+    serialize_value,
+)
+
+logger = get_logger(__name__)
+
+type EvictionPolicy = Literal["lru", "lfu"]
+
+# Number of victims selected per eviction query
+_EVICTION_BATCH = 64
+
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    value_type TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    metadata TEXT,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed
+    ON cache_entries (namespace, accessed_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires
+    ON cache_entries (namespace, expires_at);
+
+CREATE TABLE IF NOT EXISTS cache_usage (
+    namespace TEXT PRIMARY KEY,
+    entries INTEGER NOT NULL DEFAULT 0,
+    bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TRIGGER IF NOT EXISTS cache_entries_after_insert
+AFTER INSERT ON cache_entries BEGIN
+    INSERT INTO cache_usage (namespace, entries, bytes)
+    VALUES (NEW.namespace, 1, NEW.size_bytes)
+    ON CONFLICT (namespace) DO UPDATE SET
+        entries = entries + 1,
+        bytes = bytes + NEW.size_bytes;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_after_delete
+AFTER DELETE ON cache_entries BEGIN
+    UPDATE cache_usage SET
+        entries = entries - 1,
+        bytes = bytes - OLD.size_bytes
+    WHERE namespace = OLD.namespace;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_after_update
+AFTER UPDATE OF size_bytes ON cache_entries BEGIN
+    UPDATE cache_usage SET
+        bytes = bytes - OLD.size_bytes + NEW.size_bytes
+    WHERE namespace = NEW.namespace;
+END;
+"""
+
+
+@dataclass(frozen=True)
+class CacheStoreConfig:
+    """Configuration for a ``CacheStore``.
+
+    Parameters
+    ----------
+    db_path : str | Path | None
+        Path to the SQLite database file (default: None, uses in-memory)
+    namespace : str
+        Logical cache name; budgets and counters are per namespace
+    ttl_seconds : float | None
+        Default time-to-live in seconds. None means entries never expire.
+    max_bytes : int | None
+        Maximum total size of stored values in bytes (default: no limit)
+    max_entries : int | None
+        Maximum number of entries (default: no limit)
+    eviction_policy : EvictionPolicy
+        "lru" evicts the least recently accessed entries, "lfu" the least
+        frequently accessed ones (ties broken by access time)
+    dataframe_format : str
+        Storage format for DataFrame/Series values ("parquet", "arrow" or
+        "pickle")
+
+    Examples
+    --------
+    >>> config = CacheStoreConfig(
+    ...     db_path="data/cache/market_data.db",
+    ...     namespace="market",
+    ...     max_bytes=512 * 1024**2,
+    ... )
+    """
+
+    db_path: str | Path | None = None
+    namespace: str = "default"
+    ttl_seconds: float | None = 3600
+    max_bytes: int | None = None
+    max_entries: int | None = None
+    eviction_policy: EvictionPolicy = "lru"
+    dataframe_format: str = "parquet"
+
+    def __post_init__(self) -> None:
+        """Validate configuration values after initialization.
+
+        Raises
+        ------
+        ValueError
+            If a budget is not positive, the TTL is negative, or the
+            eviction policy / DataFrame format is not supported
+        """
+        if self.ttl_seconds is not None and self.ttl_seconds < 0:
+            raise ValueError(
+                f"ttl_seconds must be non-negative, got {self.ttl_seconds}"
+            )
+        if self.max_bytes is not None and self.max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {self.max_bytes}")
+        if self.max_entries is not None and self.max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {self.max_entries}")
+        if self.eviction_policy not in ("lru", "lfu"):
+            raise ValueError(
+                f"eviction_policy must be 'lru' or 'lfu', got {self.eviction_policy!r}"
+            )
+        if self.dataframe_format not in DATAFRAME_FORMATS:
+            raise ValueError(
+                f"dataframe_format must be one of {DATAFRAME_FORMATS}, "
+                f"got {self.dataframe_format!r}"
+            )
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache usage and counters.
+
+    Counters (hits, misses, evictions, expirations) are per ``CacheStore``
+    instance; entry and byte totals reflect the database.
+    """
+
+    namespace: str
+    entries: int
+    total_bytes: int
+    expired_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    max_bytes: int | None
+    max_entries: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dictionary."""
+        return {
+            "namespace": self.namespace,
+            "entries": self.entries,
+            "total_bytes": self.total_bytes,
+            "expired_entries": self.expired_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hit_rate,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+        }
+
+
+class CacheStore:
+    """SQLite-backed key/value cache with TTL and LRU/LFU eviction.
+
+    Values are serialized with ``database.cache.serializers``: DataFrames and
+    Series in a columnar format, dict/list as JSON and anything else with
+    pickle. Budgets are enforced after every write by evicting expired
+    entries first, then the least recently (LRU) or least frequently (LFU)
+    accessed ones.
+
+    SQLite errors are propagated as ``sqlite3.Error`` after rollback;
+    callers wrap them in their package-specific exceptions.
+
+    Parameters
+    ----------
+    config : CacheStoreConfig | None
+        Cache configuration. Uses an in-memory store if not specified.
+
+    Examples
+    --------
+    >>> store = CacheStore(CacheStoreConfig(namespace="demo", max_entries=2))
+    >>> store.set("a", 1)
+    >>> store.set("b", 2)
+    >>> store.get("a")
+    1
+    >>> store.set("c", 3)  # evicts "b", the least recently used entry
+    >>> store.get_many(["a", "b", "c"])
+    {'a': 1, 'c': 3}
+    """
+
+    def __init__(self, config: CacheStoreConfig | None = None) -> None:
+        self.config = config or CacheStoreConfig()
+        self.namespace = self.config.namespace
+        self.db_path = (
+            str(self.config.db_path) if self.config.db_path is not None else ":memory:"
+        )
+        self._local = threading.local()
+        self._shared_connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+        logger.debug(
+            "Initializing cache store",
+            db_path=self.db_path,
+            namespace=self.namespace,
+            ttl_seconds=self.config.ttl_seconds,
+            max_bytes=self.config.max_bytes,
+            max_entries=self.config.max_entries,
+            eviction_policy=self.config.eviction_policy,
+        )
+
+        with self._lock:
+            self._get_connection().executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=30.0,
+            isolation_level=None,
+        )
+        conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the connection for the current thread.
+
+        In-memory stores share one connection (a separate connection would
+        see a separate database); file stores use one connection per thread.
+        """
+        if self.db_path == ":memory:":
+            if self._shared_connection is None:
+                self._shared_connection = self._connect()
+            return self._shared_connection
+
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.connection = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Run a block in a single write transaction.
+
+        Yields
+        ------
+        sqlite3.Connection
+            The database connection with an active transaction.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Read operations
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        key: str,
+        default: Any = None,
+        *,
+        columns: list[str] | None = None,
+        start: DateBound = None,
+        end: DateBound = None,
+    ) -> Any:
+        """Get a value from the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+        default : Any
+            Value returned on a miss (default: None)
+        columns : list[str] | None
+            For DataFrame values, the columns to read (default: all)
+        start : DateBound
+            For time-indexed values, inclusive lower date bound
+        end : DateBound
+            For time-indexed values, inclusive upper date bound
+
+        Returns
+        -------
+        Any
+            The cached value, or ``default`` if not found or expired
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = self._fetch_live(conn, key, now)
+
+        if row is None:
+            self._count("misses")
+            logger.debug("Cache miss", namespace=self.namespace, key=key[:32])
+            return default
+
+        self._count("hits")
+        logger.debug("Cache hit", namespace=self.namespace, key=key[:32])
+        return deserialize_value(row["value"], row["value_type"], columns, start, end)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several values in one transaction.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            Cache keys to look up
+
+        Returns
+        -------
+        dict[str, Any]
+            Values for the keys that were found and not expired
+        """
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        rows: dict[str, sqlite3.Row] = {}
+        with self._transaction() as conn:
+            for key in keys:
+                row = self._fetch_live(conn, key, now)
+                if row is not None:
+                    rows[key] = row
+
+        self._count("hits", len(rows))
+        self._count("misses", len(keys) - len(rows))
+        logger.debug(
+            "Cache get_many",
+            namespace=self.namespace,
+            requested=len(keys),
+            hits=len(rows),
+        )
+        return {
+            key: deserialize_value(row["value"], row["value_type"])
+            for key, row in rows.items()
+        }
+
+    def contains(self, key: str) -> bool:
+        """Check whether a live (non-expired) entry exists.
+
+        Does not count as an access for eviction or hit statistics.
+        """
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT expires_at FROM cache_entries "
+                    "WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                .fetchone()
+            )
+        return row is not None and not self._is_expired(row["expires_at"], time.time())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.contains(key)
+
+    def get_metadata(self, key: str) -> dict[str, Any] | None:
+        """Get the metadata stored with an entry.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The metadata, or None if the entry has none or does not exist
+        """
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT metadata FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                .fetchone()
+            )
+        if row is None or row["metadata"] is None:
+            return None
+        return json.loads(row["metadata"])
+
+    def _fetch_live(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        now: float,
+    ) -> sqlite3.Row | None:
+        """Fetch an entry, dropping it if expired and recording the access."""
+        row = conn.execute(
+            "SELECT value, value_type, expires_at FROM cache_entries "
+            "WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+        if self._is_expired(row["expires_at"], now):
+            conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+            self._count("expirations")
+            return None
+        conn.execute(
+            "UPDATE cache_entries SET accessed_at = ?, access_count = access_count + 1 "
+            "WHERE namespace = ? AND key = ?",
+            (now, self.namespace, key),
+        )
+        return row
+
+    @staticmethod
+    def _is_expired(expires_at: float | None, now: float) -> bool:
+        return expires_at is not None and expires_at <= now
+
+    # ------------------------------------------------------------------
+    # Write operations
+    # ------------------------------------------------------------------
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Store a value in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+        value : Any
+            The value to cache
+        ttl : float | None
+            Time-to-live in seconds. Uses ``config.ttl_seconds`` if None.
+        metadata : dict[str, Any] | None
+            Optional JSON-serializable metadata stored with the entry
+        """
+        self.set_many({key: value}, ttl=ttl, metadata=metadata)
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: float | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Store several values in one transaction.
+
+        Serialization happens before the transaction starts, so the write
+        lock is held only for the inserts and the budget check.
+
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            Keys and values to cache
+        ttl : float | None
+            Time-to-live in seconds. Uses ``config.ttl_seconds`` if None.
+        metadata : dict[str, Any] | None
+            Optional metadata stored with every entry
+        """
+        if not items:
+            return
+
+        effective_ttl = ttl if ttl is not None else self.config.ttl_seconds
+        now = time.time()
+        expires_at = now + effective_ttl if effective_ttl is not None else None
+        metadata_json = json.dumps(metadata) if metadata else None
+
+        records = []
+        for key, value in items.items():
+            data, value_type = serialize_value(value, self.config.dataframe_format)
+            records.append(
+                (
+                    self.namespace,
+                    key,
+                    data,
+                    value_type,
+                    len(data),
+                    now,
+                    expires_at,
+                    now,
+                    metadata_json,
+                )
+            )
+
+        with self._transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO cache_entries (
+                    namespace, key, value, value_type, size_bytes,
+                    created_at, expires_at, accessed_at, access_count, metadata
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+                ON CONFLICT (namespace, key) DO UPDATE SET
+                    value = excluded.value,
+                    value_type = excluded.value_type,
+                    size_bytes = excluded.size_bytes,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at,
+                    accessed_at = excluded.accessed_at,
+                    metadata = excluded.metadata
+                """,
+                records,
+            )
+            self._enforce_budget(conn, now, frozenset(r[1] for r in records))
+
+        logger.debug(
+            "Cache set",
+            namespace=self.namespace,
+            count=len(records),
+            total_bytes=sum(r[4] for r in records),
+            ttl_seconds=effective_ttl,
+        )
+
+    def delete(self, key: str) -> bool:
+        """Delete an entry.
+
+        Returns
+        -------
+        bool
+            True if an entry was deleted, False otherwise
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+        return cursor.rowcount > 0
+
+    def clear(self) -> int:
+        """Delete all entries in this namespace.
+
+        Returns
+        -------
+        int
+            Number of entries deleted
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            )
+        logger.info("Cache cleared", namespace=self.namespace, count=cursor.rowcount)
+        return cursor.rowcount
+
+    def cleanup_expired(self) -> int:
+        """Delete all expired entries in this namespace.
+
+        Returns
+        -------
+        int
+            Number of entries deleted
+        """
+        with self._transaction() as conn:
+            removed = self._delete_expired(conn, time.time())
+        logger.debug("Expired entries removed", namespace=self.namespace, count=removed)
+        return removed
+
+    def _delete_expired(self, conn: sqlite3.Connection, now: float) -> int:
+        cursor = conn.execute(
+            "DELETE FROM cache_entries "
+            "WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+            (self.namespace, now),
+        )
+        self._count("expirations", cursor.rowcount)
+        return cursor.rowcount
+
+    def _usage(self, conn: sqlite3.Connection) -> tuple[int, int]:
+        row = conn.execute(
+            "SELECT entries, bytes FROM cache_usage WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        return (row["entries"], row["bytes"]) if row else (0, 0)
+
+    def _over_budget(self, entries: int, total_bytes: int) -> bool:
+        max_entries = self.config.max_entries
+        max_bytes = self.config.max_bytes
+        return (max_entries is not None and entries > max_entries) or (
+            max_bytes is not None and total_bytes > max_bytes
+        )
+
+    def _enforce_budget(
+        self,
+        conn: sqlite3.Connection,
+        now: float,
+        protected: frozenset[str],
+    ) -> None:
+        """Evict entries until the namespace fits its budget.
+
+        Expired entries go first, then victims by the eviction policy.
+        Keys written in the current call are never evicted.
+        """
+        if self.config.max_entries is None and self.config.max_bytes is None:
+            return
+        if not self._over_budget(*self._usage(conn)):
+            return
+
+        self._delete_expired(conn, now)
+
+        order = (
+            "access_count ASC, accessed_at ASC"
+            if self.config.eviction_policy == "lfu"
+            else "accessed_at ASC"
+        )
+        evicted = 0
+        while self._over_budget(*self._usage(conn)):
+            victims = [
+                row["key"]
+                for row in conn.execute(
+                    f"SELECT key FROM cache_entries WHERE namespace = ? "  # nosec B608
+                    f"ORDER BY {order} LIMIT ?",
+                    (self.namespace, _EVICTION_BATCH + len(protected)),
+                )
+                if row["key"] not in protected
+            ]
+            if not victims:
+                break
+
+            entries, total_bytes = self._usage(conn)
+            for key in victims:
+                if not self._over_budget(entries, total_bytes):
+                    break
+                size = conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ? "
+                    "RETURNING size_bytes",
+                    (self.namespace, key),
+                ).fetchone()["size_bytes"]
+                entries -= 1
+                total_bytes -= size
+                evicted += 1
+
+        if evicted:
+            self._count("evictions", evicted)
+            logger.debug(
+                "Cache entries evicted",
+                namespace=self.namespace,
+                count=evicted,
+                policy=self.config.eviction_policy,
+            )
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        if amount:
+            with self._lock:
+                self._counters[name] += amount
+
+    def stats(self) -> CacheStats:
+        """Get usage totals and counters for this namespace.
+
+        Returns
+        -------
+        CacheStats
+            Snapshot of entries, bytes and hit/miss/eviction counters
+        """
+        with self._lock:
+            conn = self._get_connection()
+            entries, total_bytes = self._usage(conn)
+            expired = conn.execute(
+                "SELECT COUNT(*) AS count FROM cache_entries "
+                "WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (self.namespace, time.time()),
+            ).fetchone()["count"]
+            counters = dict(self._counters)
+
+        return CacheStats(
+            namespace=self.namespace,
+            entries=entries,
+            total_bytes=total_bytes,
+            expired_entries=expired,
+            max_bytes=self.config.max_bytes,
+            max_entries=self.config.max_entries,
+            **counters,
+        )
+
+    def close(self) -> None:
+        """Close the database connection of the current thread."""
+        with self._lock:
+            if self._shared_connection is not None:
+                self._shared_connection.close()
+                self._shared_connection = None
+            conn = getattr(self._local, "connection", None)
+            if conn is not None:
+                conn.close()
+                self._local.connection = None
+
+    def __enter__(self) -> "CacheStore":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"CacheStore(db_path={self.db_path!r}, namespace={self.namespace!r})"
+
+
+__all__ = [
+    "CacheStats",
+    "CacheStore",
+    "CacheStoreConfig",
+    "EvictionPolicy",
+]
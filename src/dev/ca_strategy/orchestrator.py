@@ -57,6 +57,7 @@ from dev.ca_strategy.types import (
     ScoredClaim,
     StockScore,
 )
+from strategy.backtest import BacktestEngine
 from utils_core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -245,6 +246,9 @@ class Orchestrator:
     def run_equal_weight_pipeline(
         self,
         thresholds: list[float] | None = None,
+        prices: pd.DataFrame | None = None,
+        benchmark_returns: pd.Series | None = None,
+        transaction_cost_bps: float = 0.0,
     ) -> list[tuple[PortfolioResult, EvaluationResult]]:
         """Execute Phase 1-3 then loop equal-weight + evaluation per threshold.
 
@@ -254,11 +258,23 @@ class Orchestrator:
         (Phase 6), and generates output files (Phase 5 extended) under
         ``{workspace_dir}/output/threshold_{threshold:.2f}/``.
 
+        When ``prices`` is given, all threshold portfolios are simulated
+        together by :class:`strategy.backtest.BacktestEngine` (bought on the
+        first trading date on or after ``as_of_date`` and held), and each
+        evaluation receives its portfolio's daily returns.
+
         Parameters
         ----------
         thresholds : list[float] | None, optional
             Score thresholds for equal-weight portfolio construction.
             If None, uses ``[0.3, 0.4, 0.5, 0.6, 0.7]``.
+        prices : pd.DataFrame | None, optional
+            Daily prices (index: dates, columns: tickers) covering every
+            holding. If None, evaluations receive empty return series.
+        benchmark_returns : pd.Series | None, optional
+            Daily benchmark returns passed to the evaluator.
+        transaction_cost_bps : float, default=0.0
+            Transaction cost per unit of turnover used by the backtest.
 
         Returns
         -------
@@ -282,15 +298,36 @@ class Orchestrator:
 
         _, scored_claims, scores, ranked = self._run_phases_1_to_3()
 
-        # Phase 4b → Phase 6 → Phase 5 extended (per threshold)
-        results: list[tuple[PortfolioResult, EvaluationResult]] = []
+        # Phase 4b (all thresholds) → backtest → Phase 6 → Phase 5 extended
         ranked_list = ranked.to_dict("records")
-        for threshold in thresholds:
-            portfolio, evaluation = self._run_equal_weight_threshold(
-                ranked_list=ranked_list,
+        portfolios = [
+            self._build_equal_weight_portfolio(ranked_list, threshold)
+            for threshold in thresholds
+        ]
+
+        empty_returns: pd.Series = pd.Series([], dtype=float)
+        if prices is None:
+            # AIDEV-NOTE: Without prices the evaluator receives empty Series,
+            # which it handles gracefully (performance metrics are zero).
+            portfolio_returns = [empty_returns] * len(portfolios)
+        else:
+            portfolio_returns = self._backtest_portfolios(
+                portfolios, thresholds, prices, transaction_cost_bps
+            )
+        if benchmark_returns is None:
+            benchmark_returns = empty_returns
+
+        results: list[tuple[PortfolioResult, EvaluationResult]] = []
+        for threshold, portfolio, returns in zip(
+            thresholds, portfolios, portfolio_returns, strict=True
+        ):
+            evaluation = self._evaluate_equal_weight_threshold(
+                portfolio=portfolio,
                 scored_claims=scored_claims,
                 scores=scores,
                 threshold=threshold,
+                portfolio_returns=returns,
+                benchmark_returns=benchmark_returns,
             )
             results.append((portfolio, evaluation))
 
@@ -366,35 +403,28 @@ class Orchestrator:
         cost_path = self._workspace_dir / "cost_tracking.json"
         self._cost_tracker.save(cost_path)
 
-    def _run_equal_weight_threshold(
+    def _build_equal_weight_portfolio(
         self,
         ranked_list: list[dict[str, Any]],
-        scored_claims: dict[str, list[ScoredClaim]],
-        scores: dict[str, StockScore],
         threshold: float,
-    ) -> tuple[PortfolioResult, EvaluationResult]:
-        """Run Phase 4b, 6, 5-ext for a single threshold.
+    ) -> PortfolioResult:
+        """Run Phase 4b for a single threshold.
 
         Parameters
         ----------
         ranked_list : list[dict[str, Any]]
             Ranked stocks as list of dicts from Phase 3 DataFrame.
-        scored_claims : dict[str, list[ScoredClaim]]
-            Scored claims from Phase 2.
-        scores : dict[str, StockScore]
-            Aggregated stock scores from Phase 3.
         threshold : float
             Score threshold for equal-weight portfolio construction.
 
         Returns
         -------
-        tuple[PortfolioResult, EvaluationResult]
-            Portfolio and evaluation results for this threshold.
+        PortfolioResult
+            Equal-weight portfolio for this threshold.
         """
         phase_label = f"phase4b_threshold_{threshold:.2f}"
         logger.info("Phase 4b started", threshold=threshold)
 
-        # Phase 4b: Equal-weight portfolio construction
         builder = PortfolioBuilder()
         portfolio = builder.build_equal_weight(
             ranked=ranked_list,  # type: ignore[arg-type]
@@ -408,22 +438,98 @@ class Orchestrator:
             threshold=threshold,
             holdings_count=len(portfolio.holdings),
         )
+        return portfolio
 
+    def _backtest_portfolios(
+        self,
+        portfolios: list[PortfolioResult],
+        thresholds: list[float],
+        prices: pd.DataFrame,
+        transaction_cost_bps: float,
+    ) -> list[pd.Series]:
+        """Simulate all threshold portfolios in a single backtest.
+
+        Each portfolio is bought at the first trading date on or after its
+        ``as_of_date`` and held until the last price.
+
+        Parameters
+        ----------
+        portfolios : list[PortfolioResult]
+            Portfolios from Phase 4b, one per threshold.
+        thresholds : list[float]
+            Thresholds matching ``portfolios``.
+        prices : pd.DataFrame
+            Daily prices (index: dates, columns: tickers).
+        transaction_cost_bps : float
+            Transaction cost per unit of turnover.
+
+        Returns
+        -------
+        list[pd.Series]
+            Daily portfolio returns, in the order of ``portfolios``.
+        """
+        schedules = {
+            f"threshold_{threshold:.2f}": pd.DataFrame(
+                {h.ticker: [h.weight] for h in portfolio.holdings},
+                index=pd.DatetimeIndex([pd.Timestamp(portfolio.as_of_date)]),
+            )
+            for threshold, portfolio in zip(thresholds, portfolios, strict=True)
+        }
+        engine = BacktestEngine(transaction_cost_bps=transaction_cost_bps)
+        backtest = engine.run(prices, schedules)
+
+        logger.info(
+            "Backtest completed",
+            portfolio_count=len(schedules),
+            period_count=len(backtest.returns),
+        )
+        # Drop the NaN returns before each portfolio's own purchase date
+        return [
+            cast("pd.Series", backtest.returns[name]).dropna() for name in schedules
+        ]
+
+    def _evaluate_equal_weight_threshold(
+        self,
+        *,
+        portfolio: PortfolioResult,
+        scored_claims: dict[str, list[ScoredClaim]],
+        scores: dict[str, StockScore],
+        threshold: float,
+        portfolio_returns: pd.Series,
+        benchmark_returns: pd.Series,
+    ) -> EvaluationResult:
+        """Run Phase 6 and 5-ext for a single threshold.
+
+        Parameters
+        ----------
+        portfolio : PortfolioResult
+            Equal-weight portfolio from Phase 4b.
+        scored_claims : dict[str, list[ScoredClaim]]
+            Scored claims from Phase 2.
+        scores : dict[str, StockScore]
+            Aggregated stock scores from Phase 3.
+        threshold : float
+            Score threshold the portfolio was built with.
+        portfolio_returns : pd.Series
+            Daily portfolio returns (empty when no prices were given).
+        benchmark_returns : pd.Series
+            Daily benchmark returns (may be empty).
+
+        Returns
+        -------
+        EvaluationResult
+            Evaluation result for this threshold.
+        """
         # Phase 6: Evaluation
         phase6_label = f"phase6_threshold_{threshold:.2f}"
         logger.info("Phase 6 started", threshold=threshold)
 
         evaluator = StrategyEvaluator()
-        # AIDEV-NOTE: portfolio_returns and benchmark_returns are empty Series
-        # in the PoC because yfinance fetching is out of scope here.
-        # The StrategyEvaluator handles empty Series gracefully.
-
-        empty_returns: pd.Series = pd.Series([], dtype=float)
         evaluation = evaluator.evaluate(
             portfolio=portfolio,
             scores=scores,
-            portfolio_returns=empty_returns,
-            benchmark_returns=empty_returns,
+            portfolio_returns=portfolio_returns,
+            benchmark_returns=benchmark_returns,
             analyst_scores={},
             threshold=threshold,
         )
@@ -455,7 +561,7 @@ class Orchestrator:
             output_dir=str(output_dir),
         )
 
-        return portfolio, evaluation
+        return evaluation
 
     # -----------------------------------------------------------------------
     # Execution log
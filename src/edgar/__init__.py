@@ -29,6 +29,8 @@ TextExtractor
     Extractor for clean text content from Filing objects
 SectionExtractor
     Extractor for section-level text from filings
+SectionIndex
+    Parsed filing text with the span of every section
 BatchFetcher
     Batch fetcher for parallel filing retrieval
 BatchExtractor
@@ -47,28 +49,58 @@ CacheManager
     SQLite-based cache manager for filing text
 """
 
-from .batch import BatchExtractor, BatchFetcher
-from .cache import CacheManager
-from .config import (
-    EdgarConfig,
-    load_config,
-    set_identity,
-)
-from .errors import (
-    CacheError,
-    EdgarError,
-    FilingNotFoundError,
-    RateLimitError,
-    SectionNotFoundError,
-)
-from .extractors import SectionExtractor, TextExtractor
-from .fetcher import EdgarFetcher
-from .rate_limiter import RateLimiter
-from .types import (
-    EdgarResult,
-    FilingType,
-    SectionKey,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .batch import BatchExtractor, BatchFetcher
+    from .cache import CacheManager
+    from .config import (
+        EdgarConfig,
+        load_config,
+        set_identity,
+    )
+    from .errors import (
+        CacheError,
+        EdgarError,
+        FilingNotFoundError,
+        RateLimitError,
+        SectionNotFoundError,
+    )
+    from .extractors import SectionExtractor, SectionIndex, TextExtractor
+    from .fetcher import EdgarFetcher
+    from .rate_limiter import RateLimiter
+    from .types import (
+        EdgarResult,
+        FilingType,
+        SectionKey,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BatchExtractor": ".batch",
+    "BatchFetcher": ".batch",
+    "CacheManager": ".cache",
+    "EdgarConfig": ".config",
+    "load_config": ".config",
+    "set_identity": ".config",
+    "CacheError": ".errors",
+    "EdgarError": ".errors",
+    "FilingNotFoundError": ".errors",
+    "RateLimitError": ".errors",
+    "SectionNotFoundError": ".errors",
+    "SectionExtractor": ".extractors",
+    "SectionIndex": ".extractors",
+    "TextExtractor": ".extractors",
+    "EdgarFetcher": ".fetcher",
+    "RateLimiter": ".rate_limiter",
+    "EdgarResult": ".types",
+    "FilingType": ".types",
+    "SectionKey": ".types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BatchExtractor",
@@ -84,6 +116,7 @@ __all__ = [
     "RateLimitError",
     "RateLimiter",
     "SectionExtractor",
+    "SectionIndex",
     "SectionKey",
     "SectionNotFoundError",
     "TextExtractor",
@@ -406,7 +406,10 @@ class BatchExtractor:
         Uses ThreadPoolExecutor to parallelize section extraction. Each
         filing's result is keyed by its accession number and contains a
         dict mapping section keys to extracted text (or None if not found).
-        If extraction fails for a filing, the exception is stored.
+        Cached section indexes are read up front in one transaction, and
+        each remaining filing is downloaded and scanned once for all
+        requested sections. If extraction fails for a filing, the
+        exception is stored.
 
         Parameters
         ----------
@@ -441,15 +444,14 @@ class BatchExtractor:
 
         indexed_filings = list(enumerate(filings))
 
+        # One cache transaction for every filing's section index; the
+        # workers then only download and parse the filings that missed.
+        self._section_extractor.load_cached_indexes(filings)
+
         def _extract_sections(item: tuple[int, Any]) -> dict[str, str | None]:
-            """Extract all requested sections from a single filing."""
+            """Extract all requested sections from one parse of a filing."""
             _index, filing = item
-            sections: dict[str, str | None] = {}
-            for section_key in section_keys:
-                sections[section_key] = self._section_extractor.extract_section(
-                    filing, section_key
-                )
-            return sections
+            return self._section_extractor.extract_sections(filing, section_keys)
 
         results = _run_batch(
             items=indexed_filings,
@@ -9,7 +9,19 @@ CacheManager
     SQLite-based cache manager for filing text
 """
 
-from .manager import CacheManager
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import CacheManager
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "CacheManager": ".manager",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "CacheManager",
@@ -5,20 +5,23 @@ for storing extracted filing text with TTL (time-to-live) support.
 
 Features
 --------
-- SQLite-backed persistent storage
+- SQLite-backed persistent storage via the shared ``database.cache`` engine
+- zlib-compressed values (filing text is typically 5-10x smaller)
 - TTL-based expiration (default 90 days)
-- UPSERT (INSERT OR REPLACE) for idempotent saves
-- Thread-safe operations via threading.Lock
+- Optional byte budget with least-recently-used eviction
+- Thread-safe operations
 - Automatic expired entry cleanup
+- One-time migration of the legacy ``edgar_cache`` table
 """
 
 import sqlite3
-import threading
 import time
-from contextlib import contextmanager
+import zlib
+from contextlib import closing
 from pathlib import Path
-from typing import Generator
+from typing import Any
 
+from database.cache import CacheStore, CacheStoreConfig
 from utils_core.errors import log_and_reraise
 from utils_core.logging import get_logger
 
@@ -30,6 +33,24 @@ logger = get_logger(__name__)
 # Default TTL for cached filing text (90 days)
 DEFAULT_TTL_DAYS = 90
 
+# Namespace of EDGAR entries in the cache database
+CACHE_NAMESPACE = "edgar"
+
+_SECONDS_PER_DAY = 86400
+
+# zlib level for cached values; 6 is zlib's default speed/size trade-off
+COMPRESSION_LEVEL = 6
+
+# Table used before the cache moved to the shared engine
+_LEGACY_TABLE = "edgar_cache"
+
+
+def _decode_text(value: Any) -> str | None:
+    """Decode a cached text value (compressed bytes or legacy plain str)."""
+    if value is None or isinstance(value, str):
+        return value
+    return zlib.decompress(value).decode("utf-8")
+
 
 class CacheManager:
     """SQLite-based cache manager for SEC EDGAR filing text.
@@ -44,6 +65,9 @@ class CacheManager:
         if not specified. The directory is created if it does not exist.
     ttl_days : int
         Default time-to-live for cached entries in days.
+    max_bytes : int | None
+        Maximum total size of cached text in bytes. Least recently used
+        filings are evicted beyond this budget (default: no limit).
 
     Attributes
     ----------
@@ -66,61 +90,21 @@ class CacheManager:
         self,
         cache_dir: Path | None = None,
         ttl_days: int = DEFAULT_TTL_DAYS,
+        max_bytes: int | None = None,
     ) -> None:
         self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
         self.ttl_days = ttl_days
+        self.max_bytes = max_bytes
         self.db_path = self.cache_dir / "edgar_cache.db"
-        self._lock = threading.Lock()
 
         logger.debug(
             "Initializing CacheManager",
             cache_dir=str(self.cache_dir),
             ttl_days=self.ttl_days,
+            max_bytes=self.max_bytes,
             db_path=str(self.db_path),
         )
 
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._init_db()
-
-    @contextmanager
-    def _connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connection with transaction handling.
-
-        Yields
-        ------
-        sqlite3.Connection
-            A database connection with autocommit disabled.
-
-        Raises
-        ------
-        CacheError
-            If the database transaction fails.
-        """
-        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except sqlite3.Error as e:
-            conn.rollback()
-            raise CacheError(
-                f"Database transaction failed: {e}",
-                context={"operation": "transaction", "db_path": str(self.db_path)},
-            ) from e
-        finally:
-            conn.close()
-
-    def _init_db(self) -> None:
-        """Initialize the database schema.
-
-        Creates the edgar_cache table and indexes if they do not exist.
-
-        Raises
-        ------
-        CacheError
-            If schema initialization fails.
-        """
-        logger.debug("Initializing cache database schema", db_path=str(self.db_path))
         with log_and_reraise(
             logger,
             "initialize cache database",
@@ -129,21 +113,56 @@ class CacheManager:
             skip_types=(CacheError,),
             log_level="warning",
         ):
-            with self._connection() as conn:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS edgar_cache (
-                        filing_id TEXT PRIMARY KEY,
-                        text TEXT NOT NULL,
-                        cached_at INTEGER NOT NULL,
-                        expires_at INTEGER NOT NULL
-                    )
-                """)
-                conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_edgar_cache_expires_at
-                    ON edgar_cache (expires_at)
-                """)
-
-            logger.debug("Cache database schema initialized", db_path=str(self.db_path))
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._store = CacheStore(
+                CacheStoreConfig(
+                    db_path=self.db_path,
+                    namespace=CACHE_NAMESPACE,
+                    ttl_seconds=ttl_days * _SECONDS_PER_DAY,
+                    max_bytes=max_bytes,
+                )
+            )
+            self._migrate_legacy_table()
+            logger.debug("Cache database initialized", db_path=str(self.db_path))
+
+    def _migrate_legacy_table(self) -> None:
+        """Move entries of the legacy ``edgar_cache`` table into the store.
+
+        Unexpired rows keep their remaining TTL and do not replace entries
+        already in the store. The legacy table is dropped afterwards, so
+        the migration runs once per database.
+        """
+        with closing(sqlite3.connect(self.db_path, timeout=30.0)) as conn:
+            legacy = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (_LEGACY_TABLE,),
+            ).fetchone()
+            if legacy is None:
+                return
+
+            now = time.time()
+            rows = conn.execute(
+                f"SELECT filing_id, text, expires_at FROM {_LEGACY_TABLE} "  # nosec B608
+                "WHERE expires_at > ?",
+                (now,),
+            ).fetchall()
+            migrated = 0
+            for filing_id, text, expires_at in rows:
+                if filing_id in self._store:
+                    continue
+                data = zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+                self._store.set(filing_id, data, ttl=expires_at - now)
+                migrated += 1
+
+            conn.execute(f"DROP TABLE {_LEGACY_TABLE}")
+            conn.commit()
+
+        logger.info(
+            "Legacy cache table migrated",
+            db_path=str(self.db_path),
+            migrated=migrated,
+            skipped_existing=len(rows) - migrated,
+        )
 
     def get_cached_text(self, filing_id: str) -> str | None:
         """Retrieve cached text for a filing.
@@ -184,38 +203,46 @@ class CacheManager:
             skip_types=(CacheError,),
             log_level="warning",
         ):
-            now = int(time.time())
-
-            with self._connection() as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT text, expires_at
-                    FROM edgar_cache
-                    WHERE filing_id = ?
-                    """,
-                    (filing_id,),
-                )
-                row = cursor.fetchone()
-
-                if row is None:
-                    logger.debug("Cache miss", filing_id=filing_id)
-                    return None
-
-                if row["expires_at"] < now:
-                    logger.debug(
-                        "Cache expired",
-                        filing_id=filing_id,
-                        expired_at=row["expires_at"],
-                        now=now,
-                    )
-                    conn.execute(
-                        "DELETE FROM edgar_cache WHERE filing_id = ?",
-                        (filing_id,),
-                    )
-                    return None
-
-                logger.debug("Cache hit", filing_id=filing_id)
-                return row["text"]
+            return _decode_text(self._store.get(filing_id))
+
+    def get_many_cached_texts(self, filing_ids: list[str]) -> dict[str, str]:
+        """Retrieve cached text for several filings in one transaction.
+
+        Parameters
+        ----------
+        filing_ids : list[str]
+            Filing identifiers (accession numbers)
+
+        Returns
+        -------
+        dict[str, str]
+            Cached text keyed by filing ID, for the filings that were found
+            and not expired
+
+        Raises
+        ------
+        CacheError
+            If the database query fails
+
+        Examples
+        --------
+        >>> cache = CacheManager()
+        >>> cache.get_many_cached_texts(["0001234567-24-000001", "missing"])
+        {'0001234567-24-000001': 'Filing text content'}
+        """
+        with log_and_reraise(
+            logger,
+            f"get cached text for {len(filing_ids)} filings",
+            context={"operation": "get_many_cached_texts", "count": len(filing_ids)},
+            reraise_as=CacheError,
+            skip_types=(CacheError,),
+            log_level="warning",
+        ):
+            return {
+                key: text
+                for key, value in self._store.get_many(filing_ids).items()
+                if (text := _decode_text(value)) is not None
+            }
 
     def save_text(
         self,
@@ -225,7 +252,9 @@ class CacheManager:
     ) -> None:
         """Save filing text to the cache.
 
-        Uses INSERT OR REPLACE (UPSERT) to update existing entries.
+        Existing entries for the same filing are replaced. When
+        ``max_bytes`` is set, the least recently used filings are evicted
+        once the cache grows past the budget.
 
         Parameters
         ----------
@@ -248,15 +277,12 @@ class CacheManager:
         >>> cache.save_text("0001234567-24-000001", "Updated text", ttl_days=180)
         """
         effective_ttl = ttl_days if ttl_days is not None else self.ttl_days
-        now = int(time.time())
-        expires_at = now + (effective_ttl * 86400)
 
         logger.debug(
             "Cache save",
             filing_id=filing_id,
             text_length=len(text),
             ttl_days=effective_ttl,
-            expires_at=expires_at,
         )
 
         with log_and_reraise(
@@ -271,20 +297,126 @@ class CacheManager:
             skip_types=(CacheError,),
             log_level="warning",
         ):
-            with self._lock, self._connection() as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO edgar_cache
-                    (filing_id, text, cached_at, expires_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (filing_id, text, now, expires_at),
-                )
+            data = zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+            self._store.set(filing_id, data, ttl=effective_ttl * _SECONDS_PER_DAY)
 
             logger.info(
                 "Cache entry saved",
                 filing_id=filing_id,
                 text_length=len(text),
+                stored_bytes=len(data),
+                ttl_days=effective_ttl,
+            )
+
+    def get_cached_bytes(self, key: str) -> bytes | None:
+        """Retrieve a cached binary payload saved with ``save_bytes``.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+
+        Returns
+        -------
+        bytes | None
+            The decompressed payload, or None if not found or expired
+
+        Raises
+        ------
+        CacheError
+            If the database query or decompression fails
+        """
+        logger.debug("Cache get bytes", key=key)
+
+        with log_and_reraise(
+            logger,
+            f"get cached bytes for '{key}'",
+            context={"operation": "get_cached_bytes", "key": key},
+            reraise_as=CacheError,
+            skip_types=(CacheError,),
+            log_level="warning",
+        ):
+            value = self._store.get(key)
+            return zlib.decompress(value) if isinstance(value, bytes) else None
+
+    def get_many_cached_bytes(self, keys: list[str]) -> dict[str, bytes]:
+        """Retrieve several binary payloads in one transaction.
+
+        Parameters
+        ----------
+        keys : list[str]
+            Cache keys
+
+        Returns
+        -------
+        dict[str, bytes]
+            Decompressed payloads keyed by cache key, for the keys that
+            were found and not expired
+
+        Raises
+        ------
+        CacheError
+            If the database query or decompression fails
+        """
+        with log_and_reraise(
+            logger,
+            f"get cached bytes for {len(keys)} keys",
+            context={"operation": "get_many_cached_bytes", "count": len(keys)},
+            reraise_as=CacheError,
+            skip_types=(CacheError,),
+            log_level="warning",
+        ):
+            return {
+                key: zlib.decompress(value)
+                for key, value in self._store.get_many(keys).items()
+                if isinstance(value, bytes)
+            }
+
+    def save_bytes(
+        self,
+        key: str,
+        data: bytes,
+        ttl_days: int | None = None,
+    ) -> None:
+        """Save a binary payload to the cache, zlib-compressed.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+        data : bytes
+            The payload to cache
+        ttl_days : int | None
+            Time-to-live in days. Uses instance default if not specified.
+
+        Raises
+        ------
+        CacheError
+            If the save operation fails
+
+        Examples
+        --------
+        >>> cache = CacheManager()
+        >>> cache.save_bytes("section_index_0001234567-24-000001", payload)
+        """
+        effective_ttl = ttl_days if ttl_days is not None else self.ttl_days
+
+        with log_and_reraise(
+            logger,
+            f"save bytes for '{key}'",
+            context={"operation": "save_bytes", "key": key, "size": len(data)},
+            reraise_as=CacheError,
+            skip_types=(CacheError,),
+            log_level="warning",
+        ):
+            compressed = zlib.compress(data, COMPRESSION_LEVEL)
+            self._store.set(key, compressed, ttl=effective_ttl * _SECONDS_PER_DAY)
+
+            logger.info(
+                "Cache entry saved",
+                key=key,
+                size=len(data),
+                stored_bytes=len(compressed),
                 ttl_days=effective_ttl,
             )
 
@@ -318,20 +450,7 @@ class CacheManager:
             skip_types=(CacheError,),
             log_level="warning",
         ):
-            now = int(time.time())
-
-            with self._lock, self._connection() as conn:
-                cursor = conn.execute(
-                    "SELECT COUNT(*) as count FROM edgar_cache WHERE expires_at < ?",
-                    (now,),
-                )
-                expired_count = cursor.fetchone()["count"]
-
-                if expired_count > 0:
-                    conn.execute(
-                        "DELETE FROM edgar_cache WHERE expires_at < ?",
-                        (now,),
-                    )
+            expired_count = self._store.cleanup_expired()
 
             logger.info(
                 "Expired cache entries cleared",
@@ -339,12 +458,29 @@ class CacheManager:
             )
             return expired_count
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache usage statistics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Entry count, stored bytes and hit/miss/eviction counters
+
+        Examples
+        --------
+        >>> CacheManager().get_stats()["entries"]
+        12
+        """
+        return self._store.stats().to_dict()
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"CacheManager(cache_dir={self.cache_dir!r}, ttl_days={self.ttl_days})"
 
 
 __all__ = [
+    "CACHE_NAMESPACE",
+    "COMPRESSION_LEVEL",
     "DEFAULT_TTL_DAYS",
     "CacheManager",
 ]
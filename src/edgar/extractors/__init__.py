@@ -7,14 +7,31 @@ Public API
 ----------
 SectionExtractor
     Extract section-level text from filings (Item 1, Item 1A, etc.)
+SectionIndex
+    Parsed filing text with the span of every section
 TextExtractor
     Extract clean text and Markdown from Filing objects
 """
 
-from .section import SectionExtractor
-from .text import TextExtractor
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .section import SectionExtractor, SectionIndex
+    from .text import TextExtractor
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "SectionExtractor": ".section",
+    "SectionIndex": ".section",
+    "TextExtractor": ".text",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "SectionExtractor",
+    "SectionIndex",
     "TextExtractor",
 ]
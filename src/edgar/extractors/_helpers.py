@@ -35,13 +35,14 @@ def get_accession_number(filing: Any) -> str | None:
     Returns
     -------
     str | None
-        The accession number, or None if not available
+        The accession number, or None if not available (an attribute set
+        to None counts as not available)
     """
     try:
-        if hasattr(filing, "accession_number"):
-            return str(filing.accession_number)
-        if hasattr(filing, "accession_no"):
-            return str(filing.accession_no)
+        for attr in ("accession_number", "accession_no"):
+            value = getattr(filing, attr, None)
+            if value is not None:
+                return str(value)
         logger.debug("Filing object has no accession number attribute")
         return None
     except Exception:
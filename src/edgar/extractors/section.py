@@ -4,11 +4,17 @@ This module provides the SectionExtractor class for extracting section-level
 text from SEC EDGAR filings. It identifies sections (Item 1, Item 1A, Item 7,
 Item 8) using regex-based pattern matching on filing full text.
 
+Each filing is fetched and scanned once: ``SectionIndex`` records the span
+of every recognised section, and any section is then served as a slice of
+the indexed text. The index (full text plus offset map) is cached as a
+single compressed entry per filing.
+
 Features
 --------
 - Extract specific sections by SectionKey
+- Extract several sections, or sections of many filings, from one parse
 - List available sections in a filing
-- CacheManager integration with section-specific cache keys
+- CacheManager integration with one compressed index entry per filing
 - Graceful handling of missing sections (returns None, no exceptions)
 
 Notes
@@ -22,7 +28,12 @@ attributes and methods.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from utils_core.logging import get_logger
@@ -32,6 +43,8 @@ from ..types import SectionKey
 from ._helpers import get_accession_number, get_filing_text
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..cache import CacheManager
 
 logger = get_logger(__name__)
@@ -70,22 +83,41 @@ _DEFAULT_ORDERED_SECTION_KEYS: list[str] = [
 ]
 
 
-def _build_cache_key(accession_number: str, section_key: str) -> str:
-    """Build a cache key for a specific section of a filing.
+# Number of parsed filings kept in memory per SectionExtractor
+DEFAULT_INDEX_MEMO_SIZE = 32
+
+# Separator between the JSON offset map and the text in a serialized index
+_INDEX_SEPARATOR = b"\x00"
+
+
+def _build_index_cache_key(accession_number: str, fingerprint: str) -> str:
+    """Build the cache key of a filing's section index.
 
     Parameters
     ----------
     accession_number : str
         The filing's accession number
-    section_key : str
-        The section key identifier (e.g., "item_1")
+    fingerprint : str
+        Fingerprint of the section patterns the index was built with
 
     Returns
     -------
     str
-        The cache key in format ``section_{accession_number}_{section_key}``
+        The cache key in format ``section_index_{accession_number}_{fingerprint}``
+    """
+    return f"section_index_{accession_number}_{fingerprint}"
+
+
+def _patterns_fingerprint(patterns: dict[str, re.Pattern[str]]) -> str:
+    """Return a short stable hash of section keys and their regexes.
+
+    Indexes built with different patterns have different spans, so the
+    fingerprint is part of the index cache key.
     """
-    return f"section_{accession_number}_{section_key}"
+    digest = hashlib.sha256()
+    for key, pattern in patterns.items():
+        digest.update(f"{key}\x00{pattern.pattern}\x00{pattern.flags}\x00".encode())
+    return digest.hexdigest()[:12]
 
 
 def _find_section_positions(
@@ -177,6 +209,109 @@ def _extract_section_text(
     return section_text
 
 
+@dataclass(frozen=True)
+class SectionIndex:
+    """Full text of one filing with the span of every recognised section.
+
+    A section spans from its header to the start of the next recognised
+    section (or the end of the document), as in ``_extract_section_text``.
+
+    Parameters
+    ----------
+    text : str
+        The full filing text
+    spans : dict[str, tuple[int, int]]
+        Mapping of section key to ``(start, end)`` offsets in ``text``
+
+    Examples
+    --------
+    >>> index = SectionIndex.parse(filing_text)
+    >>> index.section("item_1a")[:40]
+    'Item 1A. Risk Factors ...'
+    >>> SectionIndex.from_bytes(index.to_bytes()) == index
+    True
+    """
+
+    text: str
+    spans: dict[str, tuple[int, int]]
+
+    @classmethod
+    def parse(
+        cls,
+        text: str,
+        patterns: dict[str, re.Pattern[str]] | None = None,
+    ) -> SectionIndex:
+        """Scan the text once and record the span of every section.
+
+        Parameters
+        ----------
+        text : str
+            The full filing text content
+        patterns : dict[str, re.Pattern[str]] | None
+            Section patterns to use. If None, defaults to
+            ``DEFAULT_SECTION_PATTERNS``.
+
+        Returns
+        -------
+        SectionIndex
+            The parsed index
+        """
+        positions = _find_section_positions(text, patterns)
+        ordered = sorted(positions.items(), key=lambda item: item[1])
+        spans: dict[str, tuple[int, int]] = {}
+        for i, (key, start) in enumerate(ordered):
+            end = ordered[i + 1][1] if i + 1 < len(ordered) else len(text)
+            spans[key] = (start, end)
+        return cls(text=text, spans=spans)
+
+    def section(self, section_key: str) -> str | None:
+        """Return the stripped text of a section.
+
+        Parameters
+        ----------
+        section_key : str
+            The section key to extract
+
+        Returns
+        -------
+        str | None
+            The section text, or None if the section was not found or is empty
+        """
+        span = self.spans.get(section_key)
+        if span is None:
+            return None
+        return self.text[span[0] : span[1]].strip() or None
+
+    def to_bytes(self) -> bytes:
+        """Serialize the offset map and text (uncompressed).
+
+        Returns
+        -------
+        bytes
+            JSON offset map, a NUL separator and the UTF-8 text
+        """
+        header = json.dumps({key: list(span) for key, span in self.spans.items()})
+        return header.encode() + _INDEX_SEPARATOR + self.text.encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> SectionIndex:
+        """Deserialize an index produced by ``to_bytes``.
+
+        Parameters
+        ----------
+        data : bytes
+            Serialized index
+
+        Returns
+        -------
+        SectionIndex
+            The restored index
+        """
+        header, _, body = data.partition(_INDEX_SEPARATOR)
+        spans = {key: (span[0], span[1]) for key, span in json.loads(header).items()}
+        return cls(text=body.decode("utf-8"), spans=spans)
+
+
 class SectionExtractor:
     """Extractor for section-level text from SEC EDGAR filings.
 
@@ -186,7 +321,10 @@ class SectionExtractor:
     patterns can be supplied to support additional filing types (10-Q,
     etc.) without modifying this class (Open/Closed Principle).
 
-    Optionally integrates with CacheManager for caching extracted sections.
+    Each filing is parsed once into a ``SectionIndex``; recently parsed
+    filings are kept in memory and, with a CacheManager, the index is
+    cached as one compressed entry per filing, so extracting several
+    sections downloads and scans the filing only once.
 
     Parameters
     ----------
@@ -203,6 +341,9 @@ class SectionExtractor:
         to compiled regex patterns. When provided, these patterns
         **replace** the defaults entirely. Pass ``None`` (default)
         to use the built-in 10-K section patterns.
+    index_memo_size : int
+        Number of parsed filings kept in memory. Defaults to
+        ``DEFAULT_INDEX_MEMO_SIZE``.
 
     Attributes
     ----------
@@ -218,6 +359,7 @@ class SectionExtractor:
     >>> extractor = SectionExtractor()
     >>> text = extractor.extract_section(filing, "item_1")
     >>> sections = extractor.list_sections(filing)
+    >>> extractor.extract_sections(filing, ["item_1", "item_1a", "item_7"])
 
     Using custom patterns for 10-Q filings:
 
@@ -234,6 +376,7 @@ class SectionExtractor:
         cache: CacheManager | None = None,
         max_filing_size_bytes: int = DEFAULT_MAX_FILING_SIZE_BYTES,
         custom_patterns: dict[str, re.Pattern[str]] | None = None,
+        index_memo_size: int = DEFAULT_INDEX_MEMO_SIZE,
     ) -> None:
         """Initialize SectionExtractor.
 
@@ -247,12 +390,18 @@ class SectionExtractor:
         custom_patterns : dict[str, re.Pattern[str]] | None
             Custom section patterns. When provided, replaces the
             default patterns. Pass ``None`` to use defaults.
+        index_memo_size : int
+            Number of parsed filings kept in memory (0 disables it).
         """
         self._cache = cache
         self._max_filing_size_bytes = max_filing_size_bytes
         self._patterns: dict[str, re.Pattern[str]] = (
             custom_patterns if custom_patterns is not None else DEFAULT_SECTION_PATTERNS
         )
+        self._fingerprint = _patterns_fingerprint(self._patterns)
+        self._index_memo_size = index_memo_size
+        self._index_memo: OrderedDict[str, SectionIndex] = OrderedDict()
+        self._memo_lock = threading.Lock()
         logger.debug(
             "Initializing SectionExtractor",
             cache_enabled=cache is not None,
@@ -304,61 +453,23 @@ class SectionExtractor:
             )
             return None
 
-        # Check cache
-        accession_number = get_accession_number(filing)
-        if self._cache is not None and accession_number is not None:
-            cache_key = _build_cache_key(accession_number, section_key)
-            cached = self._cache.get_cached_text(cache_key)
-            if cached is not None:
-                logger.info(
-                    "Section retrieved from cache",
-                    section_key=section_key,
-                    accession_number=accession_number,
-                    text_length=len(cached),
-                )
-                return cached
-
-        # Extract full text from filing
-        text = get_filing_text(filing)
-        if text is None:
+        index = self.index_filing(filing)
+        if index is None:
             logger.warning(
                 "Could not extract text from filing for section extraction",
                 section_key=section_key,
             )
             return None
 
-        # Check filing size and warn if exceeding limit
-        self._check_filing_size(text)
-
-        # Find section positions and extract target section
-        positions = _find_section_positions(text, self._patterns)
-        section_text = _extract_section_text(text, section_key, positions)
-
+        section_text = index.section(section_key)
         if section_text is None:
             logger.warning(
                 "Section not found in filing",
                 section_key=section_key,
-                available_sections=list(positions.keys()),
+                available_sections=list(index.spans),
             )
             return None
 
-        # Save to cache
-        if self._cache is not None and accession_number is not None:
-            try:
-                cache_key = _build_cache_key(accession_number, section_key)
-                self._cache.save_text(cache_key, section_text)
-                logger.debug(
-                    "Section text saved to cache",
-                    cache_key=cache_key,
-                    text_length=len(section_text),
-                )
-            except Exception:
-                logger.warning(
-                    "Failed to save section text to cache",
-                    section_key=section_key,
-                    exc_info=True,
-                )
-
         logger.info(
             "Section extracted successfully",
             section_key=section_key,
@@ -366,6 +477,229 @@ class SectionExtractor:
         )
         return section_text
 
+    def extract_sections(
+        self, filing: Any, section_keys: Iterable[str]
+    ) -> dict[str, str | None]:
+        """Extract several sections from one parse of a filing.
+
+        Parameters
+        ----------
+        filing : Any
+            An edgartools Filing object (or compatible object)
+        section_keys : Iterable[str]
+            Section identifiers to extract (e.g., ["item_1", "item_7"])
+
+        Returns
+        -------
+        dict[str, str | None]
+            Section text keyed by section key; None for sections that are
+            unknown, not found, or when text extraction fails
+
+        Examples
+        --------
+        >>> extractor = SectionExtractor()
+        >>> sections = extractor.extract_sections(filing, ["item_1", "item_1a"])
+        >>> sorted(sections)
+        ['item_1', 'item_1a']
+        """
+        keys = list(section_keys)
+        unknown = [key for key in keys if key not in self._patterns]
+        if unknown:
+            logger.warning(
+                "Unknown section keys",
+                section_keys=unknown,
+                valid_keys=list(self._patterns.keys()),
+            )
+
+        index = self.index_filing(filing) if len(unknown) < len(keys) else None
+        sections = {
+            key: index.section(key)
+            if index is not None and key not in unknown
+            else None
+            for key in keys
+        }
+        logger.info(
+            "Sections extracted",
+            requested=len(keys),
+            found=sum(text is not None for text in sections.values()),
+        )
+        return sections
+
+    def extract_sections_batch(
+        self, filings: list[Any], section_keys: Iterable[str]
+    ) -> dict[str, dict[str, str | None]]:
+        """Extract the same sections from many filings.
+
+        Cached indexes of all filings are read in a single cache
+        transaction; only the remaining filings are downloaded and parsed.
+
+        Parameters
+        ----------
+        filings : list[Any]
+            Filing objects
+        section_keys : Iterable[str]
+            Section identifiers to extract
+
+        Returns
+        -------
+        dict[str, dict[str, str | None]]
+            Sections per filing, keyed by accession number (or the filing's
+            position in ``filings`` when it has none)
+
+        Examples
+        --------
+        >>> extractor = SectionExtractor(cache=CacheManager())
+        >>> results = extractor.extract_sections_batch(filings, ["item_1", "item_7"])
+        """
+        keys = list(section_keys)
+        self.load_cached_indexes(filings)
+        return {
+            _filing_key(filing, position): self.extract_sections(filing, keys)
+            for position, filing in enumerate(filings)
+        }
+
+    def index_filing(self, filing: Any) -> SectionIndex | None:
+        """Return the section index of a filing, parsing it at most once.
+
+        The in-memory memo is checked first, then the cache; on a miss the
+        filing text is fetched, scanned once, and the index is cached.
+
+        Parameters
+        ----------
+        filing : Any
+            An edgartools Filing object (or compatible object)
+
+        Returns
+        -------
+        SectionIndex | None
+            The index, or None if the filing text cannot be obtained
+        """
+        accession_number = get_accession_number(filing)
+        if accession_number is not None:
+            index = self._memo_get(accession_number)
+            if index is None:
+                index = self._load_cached_index(accession_number)
+            if index is not None:
+                self._memo_put(accession_number, index)
+                return index
+
+        text = get_filing_text(filing)
+        if text is None:
+            return None
+
+        # Check filing size and warn if exceeding limit
+        self._check_filing_size(text)
+
+        index = SectionIndex.parse(text, self._patterns)
+        if accession_number is not None:
+            self._save_index(accession_number, index)
+            self._memo_put(accession_number, index)
+        return index
+
+    def load_cached_indexes(self, filings: list[Any]) -> dict[str, SectionIndex]:
+        """Read the cached indexes of many filings in one cache transaction.
+
+        Loaded indexes are also placed in the in-memory memo.
+
+        Parameters
+        ----------
+        filings : list[Any]
+            Filing objects
+
+        Returns
+        -------
+        dict[str, SectionIndex]
+            Cached indexes keyed by accession number
+        """
+        if self._cache is None:
+            return {}
+
+        accessions = {
+            _build_index_cache_key(accession, self._fingerprint): accession
+            for filing in filings
+            if (accession := get_accession_number(filing)) is not None
+        }
+        if not accessions:
+            return {}
+
+        try:
+            payloads = self._cache.get_many_cached_bytes(list(accessions))
+        except Exception:
+            logger.warning("Failed to read section indexes from cache", exc_info=True)
+            return {}
+
+        indexes = {
+            accessions[key]: SectionIndex.from_bytes(data)
+            for key, data in payloads.items()
+        }
+        for accession, index in indexes.items():
+            self._memo_put(accession, index)
+        logger.info(
+            "Section indexes loaded from cache",
+            requested=len(accessions),
+            found=len(indexes),
+        )
+        return indexes
+
+    def _load_cached_index(self, accession_number: str) -> SectionIndex | None:
+        """Read one filing's index from the cache (None on miss or error)."""
+        if self._cache is None:
+            return None
+        try:
+            data = self._cache.get_cached_bytes(
+                _build_index_cache_key(accession_number, self._fingerprint)
+            )
+        except Exception:
+            logger.warning(
+                "Failed to read section index from cache",
+                accession_number=accession_number,
+                exc_info=True,
+            )
+            return None
+        if data is None:
+            return None
+        logger.debug(
+            "Section index retrieved from cache", accession_number=accession_number
+        )
+        return SectionIndex.from_bytes(data)
+
+    def _save_index(self, accession_number: str, index: SectionIndex) -> None:
+        """Cache a filing's index; cache write errors are logged and ignored."""
+        if self._cache is None:
+            return
+        cache_key = _build_index_cache_key(accession_number, self._fingerprint)
+        try:
+            self._cache.save_bytes(cache_key, index.to_bytes())
+            logger.debug(
+                "Section index saved to cache",
+                cache_key=cache_key,
+                section_count=len(index.spans),
+            )
+        except Exception:
+            logger.warning(
+                "Failed to save section index to cache",
+                accession_number=accession_number,
+                exc_info=True,
+            )
+
+    def _memo_get(self, accession_number: str) -> SectionIndex | None:
+        """Look up a recently parsed filing."""
+        with self._memo_lock:
+            index = self._index_memo.get(accession_number)
+            if index is not None:
+                self._index_memo.move_to_end(accession_number)
+            return index
+
+    def _memo_put(self, accession_number: str, index: SectionIndex) -> None:
+        """Remember a parsed filing, evicting the least recently used one."""
+        if self._index_memo_size <= 0:
+            return
+        with self._memo_lock:
+            self._index_memo[accession_number] = index
+            self._index_memo.move_to_end(accession_number)
+            while len(self._index_memo) > self._index_memo_size:
+                self._index_memo.popitem(last=False)
+
     def list_sections(self, filing: Any) -> list[str]:
         """List the sections available in a filing.
 
@@ -395,23 +729,18 @@ class SectionExtractor:
         """
         logger.info("Listing sections in filing")
 
-        text = get_filing_text(filing)
-        if text is None:
+        index = self.index_filing(filing)
+        if index is None:
             logger.warning(
                 "Could not extract text from filing for section listing",
             )
             return []
 
-        # Check filing size and warn if exceeding limit
-        self._check_filing_size(text)
-
-        positions = _find_section_positions(text, self._patterns)
-
         # Return keys in the order defined by the active patterns.
         # For default patterns this matches the canonical 10-K order;
         # for custom patterns the insertion order of the dict is used.
         ordered_keys = list(self._patterns.keys())
-        found_keys = [key for key in ordered_keys if key in positions]
+        found_keys = [key for key in ordered_keys if key in index.spans]
 
         logger.info(
             "Sections listed",
@@ -446,8 +775,14 @@ class SectionExtractor:
         return f"SectionExtractor(cache_enabled={self._cache is not None})"
 
 
+def _filing_key(filing: Any, position: int) -> str:
+    """Result key of a filing in batch results (accession number or position)."""
+    return get_accession_number(filing) or str(position)
+
+
 __all__ = [
     "DEFAULT_SECTION_PATTERNS",
     "SECTION_PATTERNS",
     "SectionExtractor",
+    "SectionIndex",
 ]
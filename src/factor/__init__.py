@@ -4,6 +4,7 @@ This package provides a comprehensive framework for factor analysis:
 
 Core:
     - Factor: Abstract base class for factor implementations
+    - BatchFactorEngine: Compute many factors from one shared data load
     - Normalizer: Factor normalization algorithms (z-score, percentile, quintile)
     - Orthogonalizer: Factor orthogonalization using OLS residuals
     - YieldCurvePCA: PCA analysis for yield curves with sign alignment
@@ -19,6 +20,7 @@ Providers:
     - DataProvider: Abstract protocol for data sources
     - YFinanceProvider: Yahoo Finance data provider
     - Cache: Caching utility for providers
+    - FactorDataPanel: In-memory provider shared by batch factor computations
 
 Integration:
     - MarketDataProvider: Adapter for market package's YFinanceFetcher
@@ -30,70 +32,169 @@ Integration:
 Validation:
     - ICAnalyzer: IC/IR analysis for factor evaluation
     - QuantileAnalyzer: Quantile-based factor analysis
+    - BatchFactorValidator: IC and quantile analysis for many factors and horizons
 """
 
-# Core
-from .core.base import Factor, FactorComputeOptions, FactorMetadata
-from .core.normalizer import Normalizer
-from .core.orthogonalization import Orthogonalizer
-from .core.pca import PCAResult, YieldCurvePCA
-from .core.registry import (
-    FactorNotFoundError,
-    FactorRegistry,
-    get_registry,
-    register_factor,
-)
-from .core.return_calculator import ReturnCalculator, ReturnConfig
-
-# Enums
-from .enums import FactorCategory, NormalizationMethod
-
-# Errors
-from .errors import (
-    DataFetchError,
-    FactorError,
-    InsufficientDataError,
-    NormalizationError,
-    OrthogonalizationError,
-    ValidationError,
-)
-
-# Price Factors
-from .factors.price import MomentumFactor, ReversalFactor, VolatilityFactor
-
-# Quality Factors
-from .factors.quality import (
-    CompositeQualityFactor,
-    QualityFactor,
-    ROICFactor,
-    ROICTransitionLabeler,
-)
-
-# Size Factors
-from .factors.size import SizeFactor
-
-# Value Factors
-from .factors.value import CompositeValueFactor, ValueFactor
-
-# Integration (market + analyze packages)
-from .integration import (
-    EnhancedFactorAnalyzer,
-    MarketDataProvider,
-    calculate_factor_with_indicators,
-    create_enhanced_analyzer,
-    create_market_provider,
-)
-
-# Providers
-from .providers import Cache, DataProvider, YFinanceProvider
-
-# Types
-from .types import FactorConfig, FactorResult, OrthogonalizationResult, QuantileResult
-
-# Validation
-from .validation import ICAnalyzer, ICResult, QuantileAnalyzer
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Core
+    from .core.base import Factor, FactorComputeOptions, FactorMetadata
+    from .core.batch import BatchComputeResult, BatchFactorEngine
+    from .core.normalizer import Normalizer
+    from .core.orthogonalization import Orthogonalizer
+    from .core.pca import PCAResult, YieldCurvePCA
+    from .core.registry import (
+        FactorNotFoundError,
+        FactorRegistry,
+        get_registry,
+        register_factor,
+    )
+    from .core.return_calculator import ReturnCalculator, ReturnConfig
+
+    # Enums
+    from .enums import FactorCategory, NormalizationMethod
+
+    # Errors
+    from .errors import (
+        DataFetchError,
+        FactorError,
+        InsufficientDataError,
+        NormalizationError,
+        OrthogonalizationError,
+        ValidationError,
+    )
+
+    # Price Factors
+    from .factors.price import MomentumFactor, ReversalFactor, VolatilityFactor
+
+    # Quality Factors
+    from .factors.quality import (
+        CompositeQualityFactor,
+        QualityFactor,
+        ROICFactor,
+        ROICTransitionLabeler,
+    )
+
+    # Size Factors
+    from .factors.size import SizeFactor
+
+    # Value Factors
+    from .factors.value import CompositeValueFactor, ValueFactor
+
+    # Integration (market + analyze packages)
+    from .integration import (
+        EnhancedFactorAnalyzer,
+        MarketDataProvider,
+        calculate_factor_with_indicators,
+        create_enhanced_analyzer,
+        create_market_provider,
+    )
+
+    # Providers
+    from .providers import (
+        Cache,
+        DataProvider,
+        DataRequirements,
+        FactorDataPanel,
+        YFinanceProvider,
+    )
+
+    # Types
+    from .types import (
+        FactorConfig,
+        FactorResult,
+        OrthogonalizationResult,
+        QuantileResult,
+    )
+
+    # Validation
+    from .validation import (
+        BatchFactorValidator,
+        BatchValidationResult,
+        ICAnalyzer,
+        ICResult,
+        QuantileAnalyzer,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    # Core
+    "Factor": ".core.base",
+    "FactorComputeOptions": ".core.base",
+    "FactorMetadata": ".core.base",
+    "BatchComputeResult": ".core.batch",
+    "BatchFactorEngine": ".core.batch",
+    "Normalizer": ".core.normalizer",
+    "Orthogonalizer": ".core.orthogonalization",
+    "PCAResult": ".core.pca",
+    "YieldCurvePCA": ".core.pca",
+    "FactorNotFoundError": ".core.registry",
+    "FactorRegistry": ".core.registry",
+    "get_registry": ".core.registry",
+    "register_factor": ".core.registry",
+    "ReturnCalculator": ".core.return_calculator",
+    "ReturnConfig": ".core.return_calculator",
+    # Enums
+    "FactorCategory": ".enums",
+    "NormalizationMethod": ".enums",
+    # Errors
+    "DataFetchError": ".errors",
+    "FactorError": ".errors",
+    "InsufficientDataError": ".errors",
+    "NormalizationError": ".errors",
+    "OrthogonalizationError": ".errors",
+    "ValidationError": ".errors",
+    # Price Factors
+    "MomentumFactor": ".factors.price",
+    "ReversalFactor": ".factors.price",
+    "VolatilityFactor": ".factors.price",
+    # Quality Factors
+    "CompositeQualityFactor": ".factors.quality",
+    "QualityFactor": ".factors.quality",
+    "ROICFactor": ".factors.quality",
+    "ROICTransitionLabeler": ".factors.quality",
+    # Size Factors
+    "SizeFactor": ".factors.size",
+    # Value Factors
+    "CompositeValueFactor": ".factors.value",
+    "ValueFactor": ".factors.value",
+    # Integration (market + analyze packages)
+    "EnhancedFactorAnalyzer": ".integration",
+    "MarketDataProvider": ".integration",
+    "calculate_factor_with_indicators": ".integration",
+    "create_enhanced_analyzer": ".integration",
+    "create_market_provider": ".integration",
+    # Providers
+    "Cache": ".providers",
+    "DataProvider": ".providers",
+    "DataRequirements": ".providers",
+    "FactorDataPanel": ".providers",
+    "YFinanceProvider": ".providers",
+    # Types
+    "FactorConfig": ".types",
+    "FactorResult": ".types",
+    "OrthogonalizationResult": ".types",
+    "QuantileResult": ".types",
+    # Validation
+    "BatchFactorValidator": ".validation",
+    "BatchValidationResult": ".validation",
+    "ICAnalyzer": ".validation",
+    "ICResult": ".validation",
+    "QuantileAnalyzer": ".validation",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    # Core
+    "BatchComputeResult",
+    "BatchFactorEngine",
+    # Validation
+    "BatchFactorValidator",
+    "BatchValidationResult",
     # Providers
     "Cache",
     # Quality Factors
@@ -103,6 +204,7 @@ __all__ = [
     # Errors
     "DataFetchError",
     "DataProvider",
+    "DataRequirements",
     # Integration
     "EnhancedFactorAnalyzer",
     # Core
@@ -112,6 +214,7 @@ __all__ = [
     "FactorComputeOptions",
     # Types
     "FactorConfig",
+    "FactorDataPanel",
     "FactorError",
     "FactorMetadata",
     "FactorNotFoundError",
@@ -2,6 +2,7 @@
 
 This module exports the main classes for factor analysis:
 - Factor: Abstract base class for factor implementations
+- BatchFactorEngine: Compute many factors from one shared data load
 - FactorComputeOptions: Options for factor computation
 - FactorMetadata: Metadata for factor definitions
 - Normalizer: Factor normalization algorithms (z-score, percentile, quintile, winsorize)
@@ -11,14 +12,48 @@ This module exports the main classes for factor analysis:
 - FactorRegistry: Centralized registry for factor class management
 """
 
-from .base import Factor, FactorComputeOptions, FactorMetadata
-from .normalizer import Normalizer
-from .orthogonalization import Orthogonalizer
-from .pca import PCAResult, YieldCurvePCA
-from .registry import FactorNotFoundError, FactorRegistry, get_registry, register_factor
-from .return_calculator import ReturnCalculator, ReturnConfig
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import Factor, FactorComputeOptions, FactorMetadata
+    from .batch import BatchComputeResult, BatchFactorEngine
+    from .normalizer import Normalizer
+    from .orthogonalization import Orthogonalizer
+    from .pca import PCAResult, YieldCurvePCA
+    from .registry import (
+        FactorNotFoundError,
+        FactorRegistry,
+        get_registry,
+        register_factor,
+    )
+    from .return_calculator import ReturnCalculator, ReturnConfig
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "Factor": ".base",
+    "FactorComputeOptions": ".base",
+    "FactorMetadata": ".base",
+    "BatchComputeResult": ".batch",
+    "BatchFactorEngine": ".batch",
+    "Normalizer": ".normalizer",
+    "Orthogonalizer": ".orthogonalization",
+    "PCAResult": ".pca",
+    "YieldCurvePCA": ".pca",
+    "FactorNotFoundError": ".registry",
+    "FactorRegistry": ".registry",
+    "get_registry": ".registry",
+    "register_factor": ".registry",
+    "ReturnCalculator": ".return_calculator",
+    "ReturnConfig": ".return_calculator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "BatchComputeResult",
+    "BatchFactorEngine",
     "Factor",
     "FactorComputeOptions",
     "FactorMetadata",
@@ -36,6 +36,7 @@ import pandas as pd
 from factor.enums import FactorCategory
 from factor.errors import ValidationError
 from factor.providers.base import DataProvider
+from factor.providers.panel import DataRequirements
 from factor.types import (
     CategoryLiteral,
     FactorMetadata,
@@ -215,6 +216,36 @@ class Factor(ABC):
             default_parameters=dict(default_parameters),  # Ensure it's a dict copy
         )
 
+    @property
+    def data_requirements(self) -> DataRequirements:
+        """Return the datasets this factor instance fetches from a provider.
+
+        Derived from ``_required_data`` ("price", "volume", "market_cap",
+        "fundamentals"). Fundamental metrics are taken from the instance's
+        ``metrics`` or ``metric`` attribute. Used by ``BatchFactorEngine`` to
+        load the union of all requirements once; override when a factor
+        fetches data that cannot be inferred this way.
+
+        Returns
+        -------
+        DataRequirements
+            Required datasets and fundamental metrics.
+        """
+        required = set(getattr(self, "_required_data", ["price"]))
+        metrics: list[str] = []
+        if "fundamentals" in required:
+            metrics = list(getattr(self, "metrics", None) or [])
+            metric = getattr(self, "metric", None)
+            if isinstance(metric, str):
+                metrics.append(metric)
+
+        return DataRequirements(
+            prices="price" in required,
+            volumes="volume" in required,
+            market_cap="market_cap" in required,
+            fundamentals=frozenset(metrics),
+        )
+
     @abstractmethod
     def compute(
         self,
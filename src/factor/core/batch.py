@@ -0,0 +1,305 @@
+"""Batch computation of many factors over one shared data load.
+
+This module provides the BatchFactorEngine class, which computes a set of
+factors for the same universe and date range. The union of the factors'
+data requirements is loaded once from the provider into a FactorDataPanel,
+and every factor is computed against that panel, so prices and fundamentals
+are fetched once instead of once per factor. Factors can be spread over a
+process pool; the panel is sent to each worker once by the pool initializer.
+"""
+
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import reduce
+
+import pandas as pd
+
+from factor.errors import ValidationError
+from factor.providers.base import DataProvider
+from factor.providers.panel import DataRequirements, FactorDataPanel
+from utils_core.logging import get_logger
+
+from .base import Factor
+from .registry import FactorRegistry, get_registry
+
+logger = get_logger(__name__)
+
+# Panel shared by the factors computed in a pool worker process
+_worker_panel: FactorDataPanel | None = None
+
+
+@dataclass
+class BatchComputeResult:
+    """Result of a batch factor computation.
+
+    Parameters
+    ----------
+    values : dict[str, pd.DataFrame]
+        Factor values keyed by factor key (index: Date, columns: symbols).
+        Can be passed directly to ``BatchFactorValidator.validate``.
+    errors : dict[str, str]
+        Error messages of factors that failed, keyed by factor key
+    requirements : DataRequirements
+        Union of the data requirements that was loaded
+    elapsed_seconds : float
+        Wall-clock time of the whole batch (load and compute)
+
+    Examples
+    --------
+    >>> result = engine.compute(factors, universe, "2023-01-01", "2024-01-01")
+    >>> result.values["momentum"].tail()
+    >>> result.succeeded
+    True
+    """
+
+    values: dict[str, pd.DataFrame]
+    errors: dict[str, str] = field(default_factory=dict)
+    requirements: DataRequirements = field(default_factory=DataRequirements)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every factor was computed without error."""
+        return not self.errors
+
+
+class BatchFactorEngine:
+    """Compute many factors from one shared load of provider data.
+
+    Parameters
+    ----------
+    provider : DataProvider
+        Upstream data provider
+    max_workers : int | None, default=1
+        Number of worker processes. 1 computes sequentially in the calling
+        process; None uses one worker per CPU.
+    registry : FactorRegistry | None, default=None
+        Registry used to resolve factor names. Defaults to the global
+        registry returned by ``get_registry()``.
+
+    Examples
+    --------
+    >>> engine = BatchFactorEngine(YFinanceProvider(), max_workers=4)
+    >>> result = engine.compute(
+    ...     {
+    ...         "mom_12_1": MomentumFactor(lookback=252, skip_recent=21),
+    ...         "vol_20": VolatilityFactor(lookback=20),
+    ...         "per": ValueFactor(metric="per"),
+    ...     },
+    ...     universe=["AAPL", "MSFT", "GOOGL"],
+    ...     start_date="2023-01-01",
+    ...     end_date="2024-01-01",
+    ... )
+    >>> sorted(result.values)
+    ['mom_12_1', 'per', 'vol_20']
+    """
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        max_workers: int | None = 1,
+        registry: FactorRegistry | None = None,
+    ) -> None:
+        """Initialize BatchFactorEngine.
+
+        Parameters
+        ----------
+        provider : DataProvider
+            Upstream data provider
+        max_workers : int | None, default=1
+            Number of worker processes (None: one per CPU)
+        registry : FactorRegistry | None, default=None
+            Registry used to resolve factor names
+
+        Raises
+        ------
+        ValidationError
+            If max_workers is less than 1
+        """
+        if max_workers is not None and max_workers < 1:
+            logger.error("Invalid max_workers value", max_workers=max_workers)
+            raise ValidationError(
+                f"max_workers must be at least 1, got {max_workers}",
+                field="max_workers",
+                value=max_workers,
+            )
+
+        self.provider = provider
+        self.max_workers = max_workers
+        self.registry = registry
+        logger.debug("BatchFactorEngine initialized", max_workers=max_workers)
+
+    def compute(
+        self,
+        factors: Mapping[str, Factor | str] | Sequence[Factor | str],
+        universe: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> BatchComputeResult:
+        """Load the union of requirements once and compute every factor.
+
+        Parameters
+        ----------
+        factors : Mapping[str, Factor | str] | Sequence[Factor | str]
+            Factors to compute. Names are resolved through the registry and
+            instantiated with default parameters. A sequence is keyed by
+            factor name; use a mapping to compute several parameterizations
+            of the same factor.
+        universe : list[str]
+            Symbols to compute factors for
+        start_date : datetime | str
+            Start date of the computation period
+        end_date : datetime | str
+            End date of the computation period
+
+        Returns
+        -------
+        BatchComputeResult
+            Factor values, per-factor errors and the loaded requirements
+
+        Raises
+        ------
+        ValidationError
+            If no factors are given or a sequence contains duplicate names
+        FactorNotFoundError
+            If a factor name is not registered
+        """
+        started = time.perf_counter()
+        resolved = self._resolve(factors)
+        requirements = reduce(
+            lambda acc, factor: acc | factor.data_requirements,
+            resolved.values(),
+            DataRequirements(),
+        )
+        logger.info(
+            "Starting batch factor computation",
+            factor_count=len(resolved),
+            universe_size=len(universe),
+            datasets=requirements.datasets,
+            max_workers=self.max_workers,
+        )
+
+        panel = FactorDataPanel.load(
+            self.provider, requirements, universe, start_date, end_date
+        )
+        if self.max_workers == 1 or len(resolved) == 1:
+            outcomes = {
+                key: _compute_one(panel, factor, universe, start_date, end_date)
+                for key, factor in resolved.items()
+            }
+        else:
+            outcomes = self._compute_parallel(
+                panel, resolved, universe, start_date, end_date
+            )
+
+        values = {k: v for k, v in outcomes.items() if isinstance(v, pd.DataFrame)}
+        errors = {k: v for k, v in outcomes.items() if isinstance(v, str)}
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Batch factor computation completed",
+            computed=len(values),
+            failed=len(errors),
+            elapsed_seconds=round(elapsed, 3),
+        )
+        return BatchComputeResult(
+            values=values,
+            errors=errors,
+            requirements=requirements,
+            elapsed_seconds=elapsed,
+        )
+
+    def _resolve(
+        self,
+        factors: Mapping[str, Factor | str] | Sequence[Factor | str],
+    ) -> dict[str, Factor]:
+        """Instantiate registry names and assign a unique key to each factor."""
+        if isinstance(factors, Mapping):
+            items = list(factors.items())
+        else:
+            items = [(None, factor) for factor in factors]
+
+        if not items:
+            raise ValidationError(
+                "factors must not be empty", field="factors", value=factors
+            )
+
+        registry = self.registry if self.registry is not None else get_registry()
+        resolved: dict[str, Factor] = {}
+        for key, factor in items:
+            instance = registry.get(factor)() if isinstance(factor, str) else factor
+            name = key if key is not None else instance.name
+            if name in resolved:
+                raise ValidationError(
+                    f"duplicate factor key {name!r}; pass a mapping to compute "
+                    "several parameterizations of the same factor",
+                    field="factors",
+                    value=name,
+                )
+            resolved[name] = instance
+        return resolved
+
+    def _compute_parallel(
+        self,
+        panel: FactorDataPanel,
+        factors: dict[str, Factor],
+        universe: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> dict[str, pd.DataFrame | str]:
+        """Compute factors in a process pool sharing one copy of the panel."""
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(panel,),
+        ) as executor:
+            futures = {
+                key: executor.submit(
+                    _compute_in_worker, factor, universe, start_date, end_date
+                )
+                for key, factor in factors.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+
+def _init_worker(panel: FactorDataPanel) -> None:
+    """Store the shared panel in a pool worker process."""
+    global _worker_panel
+    _worker_panel = panel
+
+
+def _compute_in_worker(
+    factor: Factor,
+    universe: list[str],
+    start_date: datetime | str,
+    end_date: datetime | str,
+) -> pd.DataFrame | str:
+    """Compute one factor against the panel of the current worker."""
+    if _worker_panel is None:
+        return "worker panel is not initialized"
+    return _compute_one(_worker_panel, factor, universe, start_date, end_date)
+
+
+def _compute_one(
+    panel: FactorDataPanel,
+    factor: Factor,
+    universe: list[str],
+    start_date: datetime | str,
+    end_date: datetime | str,
+) -> pd.DataFrame | str:
+    """Compute one factor, returning the error message instead of raising."""
+    try:
+        return factor.compute(panel, universe, start_date, end_date)
+    except Exception as e:
+        logger.warning(
+            "Factor computation failed in batch",
+            factor_name=factor.name,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return f"{type(e).__name__}: {e}"
+
+
+__all__ = ["BatchComputeResult", "BatchFactorEngine"]
@@ -6,22 +6,32 @@ This module provides various normalization methods for factor values including:
 - Quintile rank transformation
 - Winsorization (outlier clipping)
 - Group-based (sector-neutral) normalization
+
+Every method runs on the whole input at once: columns, dates or
+(date, sector) groups are segments of one flat array, normalized by the
+kernels in ``factor.core.segments`` without a Python loop per series.
 """
 
-from typing import Any
+from typing import Any, Literal
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from utils_core.logging import get_logger
 
 from ..errors import ValidationError
+from . import segments
+from .segments import SegmentLayout
 
 logger = get_logger(__name__)
 
+type NormalizeMethod = Literal[
+    "zscore", "percentile_rank", "quintile_rank", "winsorize"
+]
+type Axis = Literal[0, 1]
 
-# Constants
-_MAD_SCALE_FACTOR = 1.4826  # Scale factor to convert MAD to standard deviation
+_VALID_METHODS = {"zscore", "percentile_rank", "quintile_rank", "winsorize"}
 
 
 class Normalizer:
@@ -31,6 +41,11 @@ class Normalizer:
     All methods support both Series and DataFrame inputs, and can operate
     on groups for sector-neutral normalization.
 
+    DataFrame inputs are normalized per column by default (``axis=0``); pass
+    ``axis=1`` to normalize each row, i.e. each date of a date x symbol
+    panel. ``normalize_panel`` adds sector-neutral normalization of such
+    panels.
+
     Parameters
     ----------
     min_samples : int, default=5
@@ -41,6 +56,7 @@ class Normalizer:
     >>> normalizer = Normalizer(min_samples=10)
     >>> zscore_data = normalizer.zscore(factor_series)
     >>> rank_data = normalizer.percentile_rank(factor_series)
+    >>> cross_sectional = normalizer.zscore(factor_panel, axis=1)
     """
 
     def __init__(self, min_samples: int = 5) -> None:
@@ -70,6 +86,7 @@ class Normalizer:
         data: pd.Series | pd.DataFrame,
         *,
         robust: bool = True,
+        axis: Axis = 0,
     ) -> pd.Series | pd.DataFrame:
         """Calculate Z-score normalization.
 
@@ -80,18 +97,15 @@ class Normalizer:
         robust : bool, default=True
             If True, use median and MAD (robust to outliers).
             If False, use mean and standard deviation.
+        axis : {0, 1}, default=0
+            For DataFrame input, normalize each column (0) or each row (1)
 
         Returns
         -------
         pd.Series | pd.DataFrame
-            Z-score normalized data with same shape as input
-
-        Raises
-        ------
-        InsufficientDataError
-            If fewer than min_samples valid values exist
-        NormalizationError
-            If standard deviation or MAD is zero
+            Z-score normalized data with same shape as input. Series (columns
+            or rows) with fewer than min_samples valid values, or with zero
+            standard deviation or MAD, are NaN.
 
         Examples
         --------
@@ -103,61 +117,27 @@ class Normalizer:
         logger.debug(
             "Calculating zscore",
             robust=robust,
+            axis=axis,
             data_shape=data.shape if hasattr(data, "shape") else len(data),
         )
-
-        if isinstance(data, pd.DataFrame):
-            return data.apply(lambda x: self._zscore_series(x, robust=robust))
-        return self._zscore_series(data, robust=robust)
-
-    def _zscore_series(self, series: pd.Series, *, robust: bool) -> pd.Series:
-        """Calculate Z-score for a single series."""
-        valid_count = series.notna().sum()
-
-        if valid_count < self.min_samples:
-            logger.warning(
-                "Insufficient data for zscore",
-                valid_count=valid_count,
-                min_samples=self.min_samples,
-            )
-            return pd.Series(np.nan, index=series.index)
-
-        if robust:
-            center = series.median()
-            mad = (series - center).abs().median()
-            scale = mad * _MAD_SCALE_FACTOR
-        else:
-            center = series.mean()
-            scale = series.std()
-
-        if scale == 0 or bool(pd.isna(scale)):
-            logger.warning(
-                "Zero or NaN scale in zscore calculation",
-                robust=robust,
-                center=center,
-                scale=scale,
-            )
-            return pd.Series(np.nan, index=series.index)
-
-        zscore = (series - center) / scale
-        logger.debug(
-            "Zscore calculated",
-            center=float(center),
-            scale=float(scale),
-            valid_count=valid_count,
-        )
-        return zscore
+        return self._transform(data, "zscore", axis=axis, robust=robust)
 
     def percentile_rank(
         self,
         data: pd.Series | pd.DataFrame,
+        *,
+        axis: Axis = 0,
     ) -> pd.Series | pd.DataFrame:
         """Calculate percentile rank transformation (0-1 scale).
 
+        Tied values share the average of their ranks.
+
         Parameters
         ----------
         data : pd.Series | pd.DataFrame
             Input data to transform
+        axis : {0, 1}, default=0
+            For DataFrame input, rank within each column (0) or each row (1)
 
         Returns
         -------
@@ -173,35 +153,24 @@ class Normalizer:
         """
         logger.debug(
             "Calculating percentile rank",
+            axis=axis,
             data_shape=data.shape if hasattr(data, "shape") else len(data),
         )
-
-        if isinstance(data, pd.DataFrame):
-            return data.apply(self._percentile_rank_series)
-        return self._percentile_rank_series(data)
-
-    def _percentile_rank_series(self, series: pd.Series) -> pd.Series:
-        """Calculate percentile rank for a single series."""
-        valid_count = series.notna().sum()
-
-        if valid_count < self.min_samples:
-            logger.warning(
-                "Insufficient data for percentile rank",
-                valid_count=valid_count,
-                min_samples=self.min_samples,
-            )
-            return pd.Series(np.nan, index=series.index)
-
-        return series.rank(pct=True)
+        return self._transform(data, "percentile_rank", axis=axis)
 
     def quintile_rank(
         self,
         data: pd.Series | pd.DataFrame,
         *,
         labels: list[str] | None = None,
+        axis: Axis = 0,
     ) -> pd.Series | pd.DataFrame:
         """Calculate quintile rank transformation (5 groups).
 
+        Buckets match ``pd.qcut(..., q=5, duplicates="drop")``: heavily tied
+        series get fewer buckets and series with a single distinct value
+        are NaN.
+
         Parameters
         ----------
         data : pd.Series | pd.DataFrame
@@ -209,6 +178,8 @@ class Normalizer:
         labels : list[str] | None, default=None
             Labels for quintile groups (1-5). If None, uses numeric values 1-5.
             Must have exactly 5 elements if provided.
+        axis : {0, 1}, default=0
+            For DataFrame input, bucket within each column (0) or each row (1)
 
         Returns
         -------
@@ -229,63 +200,22 @@ class Normalizer:
         >>> quintiles.unique()
         array([1, 2, 3, 4, 5])
         """
-        if labels is not None and len(labels) != 5:
-            raise ValidationError(
-                f"labels must have exactly 5 elements, got {len(labels)}",
-                field="labels",
-                value=labels,
-            )
+        _validate_labels(labels)
 
         logger.debug(
             "Calculating quintile rank",
+            axis=axis,
             data_shape=data.shape if hasattr(data, "shape") else len(data),
             custom_labels=labels is not None,
         )
-
-        if isinstance(data, pd.DataFrame):
-            return data.apply(lambda x: self._quintile_rank_series(x, labels=labels))
-        return self._quintile_rank_series(data, labels=labels)
-
-    def _quintile_rank_series(
-        self, series: pd.Series, *, labels: list[str] | None
-    ) -> pd.Series:
-        """Calculate quintile rank for a single series."""
-        valid_count = series.notna().sum()
-
-        if valid_count < self.min_samples:
-            logger.warning(
-                "Insufficient data for quintile rank",
-                valid_count=valid_count,
-                min_samples=self.min_samples,
-            )
-            return pd.Series(np.nan, index=series.index)
-
-        try:
-            # Use pd.qcut with labels=False to get numeric bins, then add 1
-            qcut_result = pd.qcut(series, q=5, labels=False, duplicates="drop")
-            quintile_numeric = pd.Series(qcut_result, index=series.index) + 1
-
-            if labels is not None:
-                # Map numeric values to custom labels
-                label_map = {i: labels[i - 1] for i in range(1, 6)}
-                return quintile_numeric.map(label_map)
-
-            return quintile_numeric
-
-        except ValueError as e:
-            # Handle case where there are too few unique values for 5 bins
-            logger.warning(
-                "Could not create 5 quintiles",
-                error=str(e),
-                unique_values=series.nunique(),
-            )
-            return pd.Series(np.nan, index=series.index)
+        return self._transform(data, "quintile_rank", axis=axis, labels=labels)
 
     def winsorize(
         self,
         data: pd.Series | pd.DataFrame,
         *,
         limits: tuple[float, float] = (0.01, 0.01),
+        axis: Axis = 0,
     ) -> pd.Series | pd.DataFrame:
         """Winsorize data by clipping extreme values.
 
@@ -297,6 +227,8 @@ class Normalizer:
             Lower and upper percentile limits for clipping.
             (0.01, 0.01) means clip at 1st and 99th percentiles.
             (0.05, 0.05) means clip at 5th and 95th percentiles.
+        axis : {0, 1}, default=0
+            For DataFrame input, clip within each column (0) or each row (1)
 
         Returns
         -------
@@ -314,35 +246,103 @@ class Normalizer:
         >>> data = pd.Series([1, 2, 3, 100, 5])  # 100 is an outlier
         >>> winsorized = normalizer.winsorize(data, limits=(0.1, 0.1))
         """
-        lower_limit, upper_limit = limits
-
-        if not (0 <= lower_limit <= 0.5 and 0 <= upper_limit <= 0.5):
-            raise ValidationError(
-                f"limits must be in range [0, 0.5], got ({lower_limit}, {upper_limit})",
-                field="limits",
-                value=limits,
-            )
+        _validate_limits(limits)
 
         logger.debug(
             "Winsorizing data",
+            axis=axis,
             data_shape=data.shape if hasattr(data, "shape") else len(data),
             limits=limits,
         )
+        return self._transform(data, "winsorize", axis=axis, limits=limits)
+
+    def normalize_panel(
+        self,
+        panel: pd.DataFrame,
+        *,
+        method: NormalizeMethod = "zscore",
+        groups: pd.Series | pd.DataFrame | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Normalize every date of a date x symbol panel, optionally per group.
+
+        Each row is one cross-section. With ``groups`` each row is split by
+        group label (e.g. sector) and every (date, group) cell is normalized
+        on its own, which is sector-neutral normalization of the whole panel
+        in one pass.
+
+        Parameters
+        ----------
+        panel : pd.DataFrame
+            Factor values (index: dates, columns: symbols)
+        method : str, default="zscore"
+            One of "zscore", "percentile_rank", "quintile_rank", "winsorize"
+        groups : pd.Series | pd.DataFrame | None, default=None
+            Group label per symbol (Series indexed by symbol) or per date and
+            symbol (DataFrame aligned with panel). Symbols without a label
+            get NaN. None normalizes each date as a whole.
+        **kwargs : Any
+            Method options: ``robust`` (zscore), ``labels`` (quintile_rank),
+            ``limits`` (winsorize)
 
-        if isinstance(data, pd.DataFrame):
-            return data.apply(lambda x: self._winsorize_series(x, limits=limits))
-        return self._winsorize_series(data, limits=limits)
+        Returns
+        -------
+        pd.DataFrame
+            Normalized panel with the same index and columns
 
-    def _winsorize_series(
-        self, series: pd.Series, *, limits: tuple[float, float]
-    ) -> pd.Series:
-        """Winsorize a single series."""
-        lower_limit, upper_limit = limits
+        Raises
+        ------
+        ValidationError
+            If method, labels or limits are invalid
 
-        lower_quantile = series.quantile(lower_limit)
-        upper_quantile = series.quantile(1 - upper_limit)
+        Examples
+        --------
+        >>> normalizer = Normalizer(min_samples=3)
+        >>> sectors = pd.Series({"AAPL": "Tech", "MSFT": "Tech", "JPM": "Fin"})
+        >>> neutral = normalizer.normalize_panel(
+        ...     factor_panel, method="zscore", groups=sectors
+        ... )
+        """
+        _validate_method(method)
+        _validate_labels(kwargs.get("labels"))
+        _validate_limits(kwargs.get("limits", (0.01, 0.01)))
+
+        n_rows, n_cols = panel.shape
+        rows = np.repeat(np.arange(n_rows), n_cols)
+        if groups is None:
+            segment_ids = rows
+            n_segments = n_rows
+        else:
+            if isinstance(groups, pd.DataFrame):
+                labels = groups.reindex(index=panel.index, columns=panel.columns)
+                codes, uniques = pd.factorize(labels.to_numpy().ravel())
+            else:
+                # Factorize one row of labels and repeat the codes for every date
+                codes, uniques = pd.factorize(groups.reindex(panel.columns))
+                codes = np.tile(codes, n_rows)
+            n_groups = max(len(uniques), 1)
+            segment_ids = np.where(codes >= 0, rows * n_groups + codes, -1)
+            n_segments = n_rows * n_groups
 
-        return series.clip(lower=lower_quantile, upper=upper_quantile)
+        logger.debug(
+            "Normalizing panel",
+            method=method,
+            shape=panel.shape,
+            grouped=groups is not None,
+            segments=n_segments,
+        )
+        values = self._run(
+            panel.to_numpy(dtype=np.float64).ravel(),
+            segment_ids,
+            n_segments,
+            method,
+            **kwargs,
+        )
+        return pd.DataFrame(
+            _with_labels(values, kwargs.get("labels")).reshape(n_rows, n_cols),
+            index=panel.index,
+            columns=panel.columns,
+        )
 
     def normalize_by_group(
         self,
@@ -405,13 +405,7 @@ class Normalizer:
                 value=missing_cols,
             )
 
-        valid_methods = {"zscore", "percentile_rank", "quintile_rank", "winsorize"}
-        if method not in valid_methods:
-            raise ValidationError(
-                f"Unknown method '{method}'. Must be one of: {valid_methods}",
-                field="method",
-                value=method,
-            )
+        _validate_method(method)
 
         logger.debug(
             "Normalizing by group",
@@ -423,31 +417,176 @@ class Normalizer:
         result = data.copy()
         output_column = f"{value_column}_{method}"
 
-        # Define normalization function based on method
-        def normalize_func(group: pd.Series) -> pd.Series:
-            if method == "zscore":
-                return self._zscore_series(group, robust=kwargs.get("robust", True))
-            elif method == "percentile_rank":
-                return self._percentile_rank_series(group)
-            elif method == "quintile_rank":
-                return self._quintile_rank_series(group, labels=kwargs.get("labels"))
-            else:  # winsorize
-                return self._winsorize_series(
-                    group, limits=kwargs.get("limits", (0.01, 0.01))
-                )
-
-        result[output_column] = data.groupby(group_columns)[value_column].transform(
-            normalize_func
+        # Rows with a missing group key get -1 and stay NaN, as with groupby
+        group_ids = (
+            data.groupby(group_columns, sort=False)
+            .ngroup()
+            .fillna(-1)
+            .to_numpy(dtype=np.intp)
         )
+        n_groups = int(group_ids.max(initial=-1)) + 1
+        values = self._run(
+            data[value_column].to_numpy(dtype=np.float64),
+            group_ids,
+            n_groups,
+            method,
+            **kwargs,
+        )
+        output = pd.Series(_with_labels(values, kwargs.get("labels")), index=data.index)
+        if method == "quintile_rank":
+            output = _match_qcut_dtype(output)
+        result[output_column] = output
 
         logger.info(
             "Group normalization completed",
             method=method,
             output_column=output_column,
-            groups=len(data.groupby(group_columns)),
+            groups=n_groups,
         )
 
         return result
 
+    def _transform(
+        self,
+        data: pd.Series | pd.DataFrame,
+        method: str,
+        *,
+        axis: Axis,
+        **kwargs: Any,
+    ) -> pd.Series | pd.DataFrame:
+        """Normalize a Series, or each column or row of a DataFrame."""
+        labels = kwargs.get("labels")
+        if isinstance(data, pd.Series):
+            values = self._run(
+                data.to_numpy(dtype=np.float64),
+                np.zeros(len(data), dtype=np.intp),
+                1,
+                method,
+                **kwargs,
+            )
+            series = pd.Series(_with_labels(values, labels), index=data.index)
+            return _match_qcut_dtype(series) if method == "quintile_rank" else series
+
+        if axis not in (0, 1):
+            raise ValidationError(
+                f"axis must be 0 or 1, got {axis}", field="axis", value=axis
+            )
+
+        n_rows, n_cols = data.shape
+        if axis == 0:
+            segment_ids = np.tile(np.arange(n_cols), n_rows)
+            n_segments = n_cols
+        else:
+            segment_ids = np.repeat(np.arange(n_rows), n_cols)
+            n_segments = n_rows
+
+        values = self._run(
+            data.to_numpy(dtype=np.float64).ravel(),
+            segment_ids,
+            n_segments,
+            method,
+            **kwargs,
+        )
+        frame = pd.DataFrame(
+            _with_labels(values, labels).reshape(n_rows, n_cols),
+            index=data.index,
+            columns=data.columns,
+        )
+        if method == "quintile_rank" and axis == 0:
+            return frame.apply(_match_qcut_dtype)
+        return frame
+
+    def _run(
+        self,
+        values: npt.NDArray[np.float64],
+        segment_ids: npt.NDArray[np.intp],
+        n_segments: int,
+        method: str,
+        **kwargs: Any,
+    ) -> npt.NDArray[np.float64]:
+        """Apply one normalization kernel to every segment of a flat array."""
+        layout = SegmentLayout.build(values, segment_ids, n_segments)
+        insufficient = int(
+            ((layout.counts > 0) & (layout.counts < self.min_samples)).sum()
+        )
+        if insufficient and method != "winsorize":
+            logger.warning(
+                "Insufficient data for normalization",
+                method=method,
+                insufficient_segments=insufficient,
+                min_samples=self.min_samples,
+            )
+
+        if method == "zscore":
+            result, failed = segments.zscore(
+                layout,
+                robust=kwargs.get("robust", True),
+                min_samples=self.min_samples,
+            )
+            if len(failed) > insufficient:
+                logger.warning(
+                    "Zero or NaN scale in zscore calculation",
+                    robust=kwargs.get("robust", True),
+                    segments=len(failed) - insufficient,
+                )
+            return result
+        if method == "percentile_rank":
+            return segments.percentile_rank(layout, min_samples=self.min_samples)
+        if method == "quintile_rank":
+            return segments.quintile_rank(layout, min_samples=self.min_samples)
+        return segments.winsorize(layout, limits=kwargs.get("limits", (0.01, 0.01)))
+
+
+def _validate_method(method: str) -> None:
+    """Raise ValidationError for an unknown normalization method."""
+    if method not in _VALID_METHODS:
+        raise ValidationError(
+            f"Unknown method '{method}'. Must be one of: {_VALID_METHODS}",
+            field="method",
+            value=method,
+        )
+
+
+def _validate_labels(labels: list[str] | None) -> None:
+    """Raise ValidationError unless labels is None or has five elements."""
+    if labels is not None and len(labels) != 5:
+        raise ValidationError(
+            f"labels must have exactly 5 elements, got {len(labels)}",
+            field="labels",
+            value=labels,
+        )
+
+
+def _validate_limits(limits: tuple[float, float]) -> None:
+    """Raise ValidationError unless both winsorize limits are in [0, 0.5]."""
+    lower_limit, upper_limit = limits
+    if not (0 <= lower_limit <= 0.5 and 0 <= upper_limit <= 0.5):
+        raise ValidationError(
+            f"limits must be in range [0, 0.5], got ({lower_limit}, {upper_limit})",
+            field="limits",
+            value=limits,
+        )
+
+
+def _with_labels(
+    values: npt.NDArray[np.float64], labels: list[str] | None
+) -> npt.NDArray[Any]:
+    """Map quintile numbers 1-5 to custom labels (NaN stays NaN)."""
+    if labels is None:
+        return values
+    mapped = np.full(values.shape, np.nan, dtype=object)
+    valid = ~np.isnan(values)
+    mapped[valid] = np.asarray(labels, dtype=object)[values[valid].astype(np.intp) - 1]
+    return mapped
+
+
+def _match_qcut_dtype(series: pd.Series) -> pd.Series:
+    """Give quintiles the dtype qcut produces: int64 without NaN, else float."""
+    if series.isna().all():
+        return series.astype(np.float64)
+    if series.dtype == np.float64 and series.notna().all():
+        return series.astype(np.int64)
+    return series
+
 
 __all__ = ["Normalizer"]
@@ -0,0 +1,320 @@
+"""Segmented NumPy kernels for cross-sectional normalization.
+
+This module provides the array implementations behind ``Normalizer``. Every
+function takes a flat array of values and an integer segment id per value
+(a column, a date, or a (date, sector) pair) and normalizes all segments at
+once: one sort by (segment, value) gives per-segment order statistics,
+ranks and quantiles, and per-segment sums come from ``np.bincount``. There
+is no Python loop over segments.
+
+Results match the pandas per-series operations they replace
+(``Series.median``, ``Series.std``, ``Series.rank(pct=True)``,
+``Series.quantile``, ``pd.qcut(..., duplicates="drop")``): quantiles use
+NumPy's linear interpolation on the same sorted values and ties are ranked
+by averaging, as in ``rank_cross_section``.
+
+Functions
+---------
+zscore : Standard or robust (median/MAD) z-score per segment
+percentile_rank : Average-tie percentile rank (0-1] per segment
+quintile_rank : qcut quintile number (1-5) per segment
+winsorize : Clip each segment at its lower/upper quantiles
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+# Scale factor to convert MAD to standard deviation
+MAD_SCALE_FACTOR = 1.4826
+
+# qcut edges for five equal-frequency buckets
+_QUINTILE_EDGES = np.linspace(0, 1, 6)
+
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.intp]
+
+
+@dataclass(frozen=True)
+class SegmentLayout:
+    """Valid values sorted by (segment, value).
+
+    Parameters
+    ----------
+    positions : IntArray
+        Flat position of each sorted value in the input array
+    values : FloatArray
+        Sorted valid values
+    segments : IntArray
+        Segment id of each sorted value
+    counts : IntArray
+        Number of valid values per segment
+    starts : IntArray
+        Offset of each segment's first value in the sorted arrays
+    size : int
+        Length of the input array
+    """
+
+    positions: IntArray
+    values: FloatArray
+    segments: IntArray
+    counts: IntArray
+    starts: IntArray
+    size: int
+
+    @classmethod
+    def build(
+        cls, values: npt.ArrayLike, segments: npt.ArrayLike, n_segments: int
+    ) -> "SegmentLayout":
+        """Sort the valid values of every segment.
+
+        Parameters
+        ----------
+        values : npt.ArrayLike
+            Flat values; NaN is treated as missing
+        segments : npt.ArrayLike
+            Flat segment ids in ``[0, n_segments)``; negative ids are excluded
+        n_segments : int
+            Number of segments
+
+        Returns
+        -------
+        SegmentLayout
+            Sorted layout
+        """
+        array = np.asarray(values, dtype=np.float64).ravel()
+        ids = np.asarray(segments, dtype=np.intp).ravel()
+        positions = np.flatnonzero(~np.isnan(array) & (ids >= 0))
+        valid_values = array[positions]
+        valid_ids = ids[positions]
+
+        order = _segment_order(valid_values, valid_ids)
+        counts = np.bincount(valid_ids, minlength=n_segments)
+        starts = np.zeros(n_segments, dtype=np.intp)
+        np.cumsum(counts[:-1], out=starts[1:])
+        return cls(
+            positions=positions[order],
+            values=valid_values[order],
+            segments=valid_ids[order],
+            counts=counts,
+            starts=starts,
+            size=array.size,
+        )
+
+    def scatter(self, sorted_result: FloatArray) -> FloatArray:
+        """Place per-value results back at their input positions (NaN elsewhere)."""
+        result = np.full(self.size, np.nan)
+        result[self.positions] = sorted_result
+        return result
+
+    def quantile(self, q: float) -> FloatArray:
+        """Linear-interpolation quantile of every segment.
+
+        Reproduces ``Series.quantile(q)``, which calls ``np.percentile`` with
+        ``q * 100``.
+
+        Parameters
+        ----------
+        q : float
+            Quantile in [0, 1]
+
+        Returns
+        -------
+        FloatArray
+            Quantile per segment; NaN for empty segments
+        """
+        q_effective = np.true_divide(np.float64(q) * 100.0, 100)
+        n = self.counts
+        virtual = (n - 1) * q_effective
+        previous = np.floor(virtual).astype(np.intp)
+        above = virtual >= n - 1
+        previous = np.where(above, n - 1, np.maximum(previous, 0))
+        following = np.where(above, n - 1, previous + 1)
+        gamma = virtual - np.floor(virtual)
+
+        empty = n == 0
+        a = self.values[np.where(empty, 0, self.starts + previous)] if n.any() else 0
+        b = self.values[np.where(empty, 0, self.starts + following)] if n.any() else 0
+        # Same formula as NumPy's _lerp so results are bit-identical
+        diff = np.subtract(b, a)
+        result = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+        return np.where(empty, np.nan, result)
+
+    def median(self) -> FloatArray:
+        """Median of every segment (NaN for empty segments)."""
+        return _median(self.values, self.starts, self.counts)
+
+    def sums(self, weights: FloatArray) -> FloatArray:
+        """Sum of per-value weights for every segment."""
+        sums = np.bincount(self.segments, weights=weights, minlength=len(self.counts))
+        return sums.astype(np.float64, copy=False)
+
+
+def _segment_order(values: FloatArray, segments: IntArray) -> IntArray:
+    """Indices that sort ``values`` by (segment, value).
+
+    Same order as ``np.lexsort((values, segments))``, but done as two
+    integer-friendly argsorts: global value ranks are combined with the
+    segment id into a single int64 key, which is several times faster than
+    lexsort on large panels.
+    """
+    n = values.size
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[np.argsort(values)] = np.arange(n, dtype=np.int64)
+    return np.argsort(segments.astype(np.int64) * n + ranks)
+
+
+def _median(
+    sorted_values: FloatArray, starts: IntArray, counts: IntArray
+) -> FloatArray:
+    """Median per segment of values already sorted within each segment."""
+    if sorted_values.size == 0:
+        return np.full(len(counts), np.nan)
+    low = np.minimum(starts + (counts - 1) // 2, sorted_values.size - 1)
+    high = np.minimum(starts + counts // 2, sorted_values.size - 1)
+    median = (sorted_values[low] + sorted_values[high]) / 2
+    return np.where(counts > 0, median, np.nan)
+
+
+def zscore(
+    layout: SegmentLayout,
+    *,
+    robust: bool,
+    min_samples: int,
+) -> tuple[FloatArray, IntArray]:
+    """Z-score every segment.
+
+    Parameters
+    ----------
+    layout : SegmentLayout
+        Sorted values
+    robust : bool
+        Use median and MAD (scaled by 1.4826) instead of mean and sample std
+    min_samples : int
+        Segments with fewer valid values are NaN
+
+    Returns
+    -------
+    tuple[FloatArray, IntArray]
+        Z-scores at the input positions, and the ids of segments that were
+        left NaN (too few samples or zero/NaN scale)
+    """
+    counts = layout.counts
+    seg = layout.segments
+    if robust:
+        center = layout.median()
+        deviation = np.abs(layout.values - center[seg])
+        order = _segment_order(deviation, seg)
+        scale = _median(deviation[order], layout.starts, counts) * MAD_SCALE_FACTOR
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            center = layout.sums(layout.values) / counts
+            squares = layout.sums((layout.values - center[seg]) ** 2)
+            scale = np.sqrt(squares / (counts - 1))
+
+    usable = (counts >= min_samples) & (counts > 0) & (scale != 0) & ~np.isnan(scale)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (layout.values - center[seg]) / scale[seg]
+    scores = np.where(usable[seg], scores, np.nan)
+    return layout.scatter(scores), np.flatnonzero(~usable & (counts > 0))
+
+
+def percentile_rank(layout: SegmentLayout, *, min_samples: int) -> FloatArray:
+    """Percentile rank (average rank of ties / valid count) of every segment.
+
+    Parameters
+    ----------
+    layout : SegmentLayout
+        Sorted values
+    min_samples : int
+        Segments with fewer valid values are NaN
+
+    Returns
+    -------
+    FloatArray
+        Percentile ranks at the input positions
+    """
+    n = layout.values.size
+    if n == 0:
+        return layout.scatter(layout.values)
+
+    seg = layout.segments
+    index = np.arange(n)
+    starts_tie = np.ones(n, dtype=bool)
+    starts_tie[1:] = (seg[1:] != seg[:-1]) | (layout.values[1:] != layout.values[:-1])
+    ends_tie = np.ones(n, dtype=bool)
+    ends_tie[:-1] = starts_tie[1:]
+
+    first = np.maximum.accumulate(np.where(starts_tie, index, 0))
+    last = np.minimum.accumulate(np.where(ends_tie, index, n - 1)[::-1])[::-1]
+    offset = layout.starts[seg]
+    ranks = (first - offset + last - offset) / 2.0 + 1.0
+
+    counts = layout.counts[seg]
+    return layout.scatter(np.where(counts >= min_samples, ranks / counts, np.nan))
+
+
+def quintile_rank(layout: SegmentLayout, *, min_samples: int) -> FloatArray:
+    """Equal-frequency quintile number (1-5) of every segment.
+
+    Matches ``pd.qcut(series, 5, labels=False, duplicates="drop") + 1``:
+    duplicate quantile edges are dropped, so heavily tied segments get fewer
+    buckets, and segments with a single distinct value are NaN.
+
+    Parameters
+    ----------
+    layout : SegmentLayout
+        Sorted values
+    min_samples : int
+        Segments with fewer valid values are NaN
+
+    Returns
+    -------
+    FloatArray
+        Quintile numbers as floats at the input positions
+    """
+    seg = layout.segments
+    x = layout.values
+    edges = np.stack([layout.quantile(q)[seg] for q in _QUINTILE_EDGES], axis=-1)
+    distinct = np.ones(edges.shape, dtype=bool)
+    distinct[:, 1:] = edges[:, 1:] != edges[:, :-1]
+    n_edges = distinct.sum(axis=-1)
+
+    # searchsorted(side="left") on the distinct edges, lowest edge included
+    ids = (distinct & (edges < x[:, None])).sum(axis=-1)
+    ids = np.where(x == edges[:, 0], 1, ids)
+
+    usable = (layout.counts[seg] >= min_samples) & (ids > 0) & (ids < n_edges)
+    return layout.scatter(np.where(usable, ids, np.nan).astype(np.float64))
+
+
+def winsorize(layout: SegmentLayout, *, limits: tuple[float, float]) -> FloatArray:
+    """Clip every segment at its ``limits[0]`` and ``1 - limits[1]`` quantiles.
+
+    Parameters
+    ----------
+    layout : SegmentLayout
+        Sorted values
+    limits : tuple[float, float]
+        Lower and upper tail fractions
+
+    Returns
+    -------
+    FloatArray
+        Clipped values at the input positions
+    """
+    seg = layout.segments
+    lower = layout.quantile(limits[0])[seg]
+    upper = layout.quantile(1 - limits[1])[seg]
+    return layout.scatter(np.minimum(np.maximum(layout.values, lower), upper))
+
+
+__all__ = [
+    "MAD_SCALE_FACTOR",
+    "SegmentLayout",
+    "percentile_rank",
+    "quintile_rank",
+    "winsorize",
+    "zscore",
+]
@@ -8,10 +8,27 @@ This package contains factor implementations organized by category:
 - value: Value factors (PER, PBR, dividend yield, EV/EBITDA)
 """
 
-from .price import MomentumFactor
-from .quality import QualityFactor, ROICFactor, ROICTransitionLabeler
-from .size import SizeFactor
-from .value import ValueFactor
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .price import MomentumFactor
+    from .quality import QualityFactor, ROICFactor, ROICTransitionLabeler
+    from .size import SizeFactor
+    from .value import ValueFactor
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "MomentumFactor": ".price",
+    "QualityFactor": ".quality",
+    "ROICFactor": ".quality",
+    "ROICTransitionLabeler": ".quality",
+    "SizeFactor": ".size",
+    "ValueFactor": ".value",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "MomentumFactor",
@@ -8,11 +8,27 @@ This package provides implementations for macroeconomic factors:
 - MacroFactorBuilder: Orchestrates construction of all macro factors
 """
 
-from .base import BaseMacroFactor
-from .flight_to_quality import FlightToQualityFactor
-from .inflation import InflationFactor
-from .interest_rate import InterestRateFactor
-from .macro_builder import MacroFactorBuilder
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseMacroFactor
+    from .flight_to_quality import FlightToQualityFactor
+    from .inflation import InflationFactor
+    from .interest_rate import InterestRateFactor
+    from .macro_builder import MacroFactorBuilder
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BaseMacroFactor": ".base",
+    "FlightToQualityFactor": ".flight_to_quality",
+    "InflationFactor": ".inflation",
+    "InterestRateFactor": ".interest_rate",
+    "MacroFactorBuilder": ".macro_builder",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BaseMacroFactor",
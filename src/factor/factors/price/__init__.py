@@ -13,9 +13,23 @@ Examples
 >>> volatility = VolatilityFactor(lookback=20)
 """
 
-from factor.factors.price.momentum import MomentumFactor
-from factor.factors.price.reversal import ReversalFactor
-from factor.factors.price.volatility import VolatilityFactor
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from factor.factors.price.momentum import MomentumFactor
+    from factor.factors.price.reversal import ReversalFactor
+    from factor.factors.price.volatility import VolatilityFactor
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "MomentumFactor": "factor.factors.price.momentum",
+    "ReversalFactor": "factor.factors.price.reversal",
+    "VolatilityFactor": "factor.factors.price.volatility",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "MomentumFactor",
@@ -30,6 +30,7 @@ import pandas as pd
 from factor.core.base import Factor
 from factor.enums import FactorCategory
 from factor.providers.base import DataProvider
+from factor.providers.panel import FactorDataPanel
 from utils_core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -233,12 +234,16 @@ class MomentumFactor(Factor):
         # Validate inputs using base class method
         self.validate_inputs(universe, start_date, end_date)
 
-        # Fetch price data from provider
-        logger.debug("Fetching price data from provider")
-        prices_df = provider.get_prices(universe, start_date, end_date)
+        if isinstance(provider, FactorDataPanel):
+            # Reuse close prices shared with other factors in a batch
+            close_prices = provider.close_prices(universe, start_date, end_date)
+        else:
+            # Fetch price data from provider
+            logger.debug("Fetching price data from provider")
+            prices_df = provider.get_prices(universe, start_date, end_date)
 
-        # Extract close prices for each symbol
-        close_prices = self._extract_close_prices(prices_df, universe)
+            # Extract close prices for each symbol
+            close_prices = self._extract_close_prices(prices_df, universe)
 
         # Calculate momentum
         momentum_df = self._calculate_momentum(close_prices)
@@ -33,6 +33,7 @@ import pandas as pd
 from factor.core.base import Factor
 from factor.enums import FactorCategory
 from factor.providers.base import DataProvider
+from factor.providers.panel import FactorDataPanel
 from utils_core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -181,14 +182,18 @@ class VolatilityFactor(Factor):
         # 入力バリデーション
         self.validate_inputs(universe, start_date, end_date)
 
-        # 価格データを取得
-        prices_df = provider.get_prices(universe, start_date, end_date)
+        if isinstance(provider, FactorDataPanel):
+            # バッチ計算では他ファクターと共有する日次リターンを再利用
+            returns = provider.returns(universe, start_date, end_date)
+        else:
+            # 価格データを取得
+            prices_df = provider.get_prices(universe, start_date, end_date)
 
-        # Close価格を抽出してDataFrameに変換
-        close_prices = self._extract_close_prices(prices_df, universe)
+            # Close価格を抽出してDataFrameに変換
+            close_prices = self._extract_close_prices(prices_df, universe)
 
-        # 日次リターンを計算
-        returns = close_prices.pct_change()
+            # 日次リターンを計算
+            returns = close_prices.pct_change()
 
         # ローリング標準偏差を計算
         volatility_result = returns.rolling(window=self.lookback).std()
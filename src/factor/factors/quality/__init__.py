@@ -7,10 +7,25 @@ This module provides quality factor implementations including:
 - Transition labeling for factor analysis.
 """
 
-from .composite import CompositeQualityFactor
-from .quality import QualityFactor
-from .roic import ROICFactor
-from .roic_label import ROICTransitionLabeler
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .composite import CompositeQualityFactor
+    from .quality import QualityFactor
+    from .roic import ROICFactor
+    from .roic_label import ROICTransitionLabeler
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "CompositeQualityFactor": ".composite",
+    "QualityFactor": ".quality",
+    "ROICFactor": ".roic",
+    "ROICTransitionLabeler": ".roic_label",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "CompositeQualityFactor",
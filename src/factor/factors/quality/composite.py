@@ -30,6 +30,7 @@ Examples
 """
 
 from datetime import datetime
+from typing import cast
 
 import pandas as pd
 
@@ -396,13 +397,7 @@ class CompositeQualityFactor(Factor):
         """
         # Apply z-score normalization row by row (cross-sectional)
         # Each row is normalized independently
-        normalized_rows = []
-        for idx in data.index:
-            row = data.loc[idx]
-            zscore_row = self._normalizer.zscore(row, robust=True)
-            normalized_rows.append(zscore_row)
-
-        return pd.DataFrame(normalized_rows, index=data.index)
+        return cast("pd.DataFrame", self._normalizer.zscore(data, robust=True, axis=1))
 
 
 __all__ = ["CompositeQualityFactor"]
@@ -1,5 +1,17 @@
 """Size factor module for computing size-based factor values."""
 
-from factor.factors.size.size import SizeFactor
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from factor.factors.size.size import SizeFactor
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "SizeFactor": "factor.factors.size.size",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["SizeFactor"]
@@ -34,6 +34,7 @@ from factor.core.base import Factor
 from factor.enums import FactorCategory
 from factor.errors import ValidationError
 from factor.providers.base import DataProvider
+from factor.providers.panel import DataRequirements
 from utils_core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -176,6 +177,20 @@ class SizeFactor(Factor):
             log_transform=log_transform,
         )
 
+    @property
+    def data_requirements(self) -> DataRequirements:
+        """Return only the dataset used by the configured metric.
+
+        Returns
+        -------
+        DataRequirements
+            Market cap for ``metric="market_cap"``, otherwise the single
+            fundamental metric.
+        """
+        if self.metric == "market_cap":
+            return DataRequirements(market_cap=True)
+        return DataRequirements(fundamentals=frozenset({self.metric}))
+
     def compute(
         self,
         provider: DataProvider,
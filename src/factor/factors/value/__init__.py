@@ -21,7 +21,20 @@ Examples
 ... )
 """
 
-from .composite import CompositeValueFactor
-from .value import ValueFactor
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .composite import CompositeValueFactor
+    from .value import ValueFactor
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "CompositeValueFactor": ".composite",
+    "ValueFactor": ".value",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["CompositeValueFactor", "ValueFactor"]
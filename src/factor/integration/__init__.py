@@ -11,15 +11,31 @@ analyze_integration
     Integration with analyze package for technical analysis
 """
 
-from factor.integration.analyze_integration import (
-    EnhancedFactorAnalyzer,
-    calculate_factor_with_indicators,
-    create_enhanced_analyzer,
-)
-from factor.integration.market_integration import (
-    MarketDataProvider,
-    create_market_provider,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from factor.integration.analyze_integration import (
+        EnhancedFactorAnalyzer,
+        calculate_factor_with_indicators,
+        create_enhanced_analyzer,
+    )
+    from factor.integration.market_integration import (
+        MarketDataProvider,
+        create_market_provider,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "EnhancedFactorAnalyzer": "factor.integration.analyze_integration",
+    "calculate_factor_with_indicators": "factor.integration.analyze_integration",
+    "create_enhanced_analyzer": "factor.integration.analyze_integration",
+    "MarketDataProvider": "factor.integration.market_integration",
+    "create_market_provider": "factor.integration.market_integration",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "EnhancedFactorAnalyzer",
@@ -4,8 +4,31 @@ This package contains data provider interfaces, implementations,
 and caching functionality for fetching financial data.
 """
 
-from factor.providers.base import DataProvider
-from factor.providers.cache import Cache
-from factor.providers.yfinance import YFinanceProvider
+from typing import TYPE_CHECKING
 
-__all__ = ["Cache", "DataProvider", "YFinanceProvider"]
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from factor.providers.base import DataProvider
+    from factor.providers.cache import Cache
+    from factor.providers.panel import DataRequirements, FactorDataPanel
+    from factor.providers.yfinance import YFinanceProvider
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "DataProvider": "factor.providers.base",
+    "Cache": "factor.providers.cache",
+    "DataRequirements": "factor.providers.panel",
+    "FactorDataPanel": "factor.providers.panel",
+    "YFinanceProvider": "factor.providers.yfinance",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "Cache",
+    "DataProvider",
+    "DataRequirements",
+    "FactorDataPanel",
+    "YFinanceProvider",
+]
@@ -1,25 +1,31 @@
 """Cache class for data provider results.
 
 This module provides caching functionality for data fetched from providers.
-Data is stored in Parquet format with TTL-based invalidation.
+Entries are stored in the shared ``database.cache`` engine (one SQLite file
+per cache directory, DataFrames encoded as Parquet) with TTL-based
+invalidation and an optional byte budget with LRU eviction. Per-key
+Parquet files written by the previous layout are not read or removed.
 """
 
-import hashlib
-import time
 from pathlib import Path
 
 import pandas as pd
 
+from database.cache import CacheStore, CacheStoreConfig
 from utils_core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Name of the SQLite database file inside the cache directory
+CACHE_DB_FILENAME = "factor_cache.db"
+
 
 class Cache:
     """Data cache with TTL-based invalidation.
 
-    Caches data fetched from providers in Parquet format with
-    configurable Time To Live (TTL) for automatic invalidation.
+    Caches data fetched from providers in a SQLite database inside
+    ``cache_path`` (DataFrames encoded as Parquet) with configurable Time
+    To Live (TTL) for automatic invalidation.
 
     Parameters
     ----------
@@ -27,6 +33,9 @@ class Cache:
         Directory path for cache storage
     ttl_hours : int, default=24
         Time To Live in hours for cache entries
+    max_bytes : int | None, default=None
+        Maximum total size of cached data in bytes. Least recently used
+        entries are evicted beyond this budget.
 
     Examples
     --------
@@ -35,7 +44,12 @@ class Cache:
     >>> data = cache.get("key")
     """
 
-    def __init__(self, cache_path: str | Path, ttl_hours: int = 24) -> None:
+    def __init__(
+        self,
+        cache_path: str | Path,
+        ttl_hours: int = 24,
+        max_bytes: int | None = None,
+    ) -> None:
         """Initialize Cache.
 
         Parameters
@@ -44,6 +58,8 @@ class Cache:
             Directory path for cache storage
         ttl_hours : int, default=24
             Time To Live in hours for cache entries
+        max_bytes : int | None, default=None
+            Maximum total size of cached data in bytes
         """
         self.cache_path = Path(cache_path)
         self.ttl_hours = ttl_hours
@@ -51,10 +67,20 @@ class Cache:
         # Create cache directory if it doesn't exist
         self.cache_path.mkdir(parents=True, exist_ok=True)
 
+        self._store = CacheStore(
+            CacheStoreConfig(
+                db_path=self.cache_path / CACHE_DB_FILENAME,
+                namespace="factor",
+                ttl_seconds=ttl_hours * 3600,
+                max_bytes=max_bytes,
+            )
+        )
+
         logger.debug(
             "Cache initialized",
             cache_path=str(self.cache_path),
             ttl_hours=self.ttl_hours,
+            max_bytes=max_bytes,
         )
 
     def get(self, key: str) -> pd.DataFrame | None:
@@ -72,30 +98,19 @@ class Cache:
         pd.DataFrame | None
             Cached data if valid, None otherwise
         """
-        if not self.is_valid(key):
-            logger.debug("Cache miss or expired", key=key)
-            return None
-
-        file_path = self._key_to_path(key)
-
         try:
-            data = pd.read_parquet(file_path)
-            logger.debug(
-                "Cache hit",
-                key=key,
-                file_path=str(file_path),
-                rows=len(data),
-            )
-            return data
+            data = self._store.get(key)
         except Exception as e:
-            logger.error(
-                "Failed to read cache",
-                key=key,
-                file_path=str(file_path),
-                error=str(e),
-            )
+            logger.error("Failed to read cache", key=key, error=str(e))
             return None
 
+        if data is None:
+            logger.debug("Cache miss or expired", key=key)
+            return None
+
+        logger.debug("Cache hit", key=key, rows=len(data))
+        return data
+
     def set(self, key: str, data: pd.DataFrame) -> None:
         """Store data in cache.
 
@@ -106,23 +121,11 @@ class Cache:
         data : pd.DataFrame
             Data to cache
         """
-        file_path = self._key_to_path(key)
-
-        logger.debug(
-            "Saving data to cache",
-            key=key,
-            file_path=str(file_path),
-            rows=len(data),
-        )
+        logger.debug("Saving data to cache", key=key, rows=len(data))
 
-        data.to_parquet(file_path)
+        self._store.set(key, data)
 
-        logger.info(
-            "Cache entry saved",
-            key=key,
-            file_path=str(file_path),
-            rows=len(data),
-        )
+        logger.info("Cache entry saved", key=key, rows=len(data))
 
     def invalidate(self, key: str) -> None:
         """Invalidate (delete) cached entry.
@@ -134,11 +137,8 @@ class Cache:
         key : str
             Cache key to invalidate
         """
-        file_path = self._key_to_path(key)
-
-        if file_path.exists():
-            file_path.unlink()
-            logger.info("Cache entry invalidated", key=key, file_path=str(file_path))
+        if self._store.delete(key):
+            logger.info("Cache entry invalidated", key=key)
         else:
             logger.debug("Cache entry not found for invalidation", key=key)
 
@@ -155,50 +155,13 @@ class Cache:
         bool
             True if cache is valid, False otherwise
         """
-        file_path = self._key_to_path(key)
-
-        if not file_path.exists():
-            logger.debug("Cache file does not exist", key=key)
-            return False
-
-        # Check TTL
-        file_mtime = file_path.stat().st_mtime
-        current_time = time.time()
-        age_hours = (current_time - file_mtime) / 3600
-
-        is_valid = age_hours < self.ttl_hours
+        is_valid = self._store.contains(key)
 
         logger.debug(
             "Cache validity check",
             key=key,
-            age_hours=round(age_hours, 2),
             ttl_hours=self.ttl_hours,
             is_valid=is_valid,
         )
 
         return is_valid
-
-    def _key_to_path(self, key: str) -> Path:
-        """Convert cache key to file path.
-
-        Uses SHA256 hash to create a filesystem-safe filename from
-        the cache key. This handles special characters, long keys,
-        and non-ASCII characters safely.
-
-        Parameters
-        ----------
-        key : str
-            Cache key
-
-        Returns
-        -------
-        Path
-            File path for the cache entry
-        """
-        # Hash the key to create a safe filename
-        key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
-        # Sanitize key for logging/debugging (keep first 20 chars)
-        safe_key = "".join(c if c.isalnum() or c in "_-" else "_" for c in key[:20])
-        filename = f"{safe_key}_{key_hash}.parquet"
-
-        return self.cache_path / filename
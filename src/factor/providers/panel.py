@@ -0,0 +1,440 @@
+"""Shared in-memory data panel for computing many factors from one load.
+
+This module provides ``FactorDataPanel``, a ``DataProvider`` that loads the
+union of the datasets needed by a set of factors from an upstream provider
+once, and serves every later request as a slice of the loaded frames.
+Derived intermediates used by several price factors (close prices, daily
+returns, log-prices) are computed once per (symbols, date range) and reused.
+
+The panel can be pickled without its upstream provider, so it can be shipped
+once to each worker of a process pool.
+
+Examples
+--------
+>>> requirements = DataRequirements(prices=True, fundamentals=frozenset({"per"}))
+>>> panel = FactorDataPanel.load(
+...     provider, requirements, ["AAPL", "MSFT"], "2023-01-01", "2024-01-01"
+... )
+>>> MomentumFactor().compute(panel, ["AAPL", "MSFT"], "2023-01-01", "2024-01-01")
+"""
+
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+
+from factor.errors import DataFetchError
+from factor.providers.base import DataProvider
+from utils_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class DataRequirements:
+    """Datasets needed to compute one or more factors.
+
+    Parameters
+    ----------
+    prices : bool, default=False
+        Whether OHLCV prices are needed (``get_prices``)
+    volumes : bool, default=False
+        Whether volumes are needed (``get_volumes``)
+    market_cap : bool, default=False
+        Whether market capitalization is needed (``get_market_cap``)
+    fundamentals : frozenset[str], default=frozenset()
+        Fundamental metrics needed (``get_fundamentals``)
+
+    Examples
+    --------
+    >>> a = DataRequirements(prices=True)
+    >>> b = DataRequirements(fundamentals=frozenset({"roe"}))
+    >>> (a | b).datasets
+    ['prices', 'fundamentals']
+    """
+
+    prices: bool = False
+    volumes: bool = False
+    market_cap: bool = False
+    fundamentals: frozenset[str] = field(default_factory=frozenset)
+
+    def __or__(self, other: "DataRequirements") -> "DataRequirements":
+        """Return the union of two requirements."""
+        return DataRequirements(
+            prices=self.prices or other.prices,
+            volumes=self.volumes or other.volumes,
+            market_cap=self.market_cap or other.market_cap,
+            fundamentals=self.fundamentals | other.fundamentals,
+        )
+
+    @property
+    def datasets(self) -> list[str]:
+        """Names of the required datasets in load order."""
+        flags = {
+            "prices": self.prices,
+            "volumes": self.volumes,
+            "market_cap": self.market_cap,
+            "fundamentals": bool(self.fundamentals),
+        }
+        return [name for name, needed in flags.items() if needed]
+
+
+class FactorDataPanel:
+    """DataProvider serving factor computations from pre-loaded frames.
+
+    Use ``FactorDataPanel.load()`` to build a panel. Requests inside the
+    loaded symbols and date range are answered from memory; other requests
+    are forwarded to the upstream provider when one is attached and raise
+    ``DataFetchError`` otherwise (e.g. inside a worker process).
+
+    Frames returned for the full loaded universe and date range are the
+    cached objects themselves and must not be modified in place.
+
+    Parameters
+    ----------
+    frames : dict[str, pd.DataFrame]
+        Loaded frames keyed by dataset name (see ``DataRequirements.datasets``)
+    universe : list[str]
+        Symbols the frames were loaded for
+    start_date : datetime | str
+        Start of the loaded date range
+    end_date : datetime | str
+        End of the loaded date range
+    provider : DataProvider | None, default=None
+        Upstream provider used for requests outside the loaded data
+    """
+
+    def __init__(
+        self,
+        frames: dict[str, pd.DataFrame],
+        universe: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+        provider: DataProvider | None = None,
+    ) -> None:
+        self._frames = frames
+        self.universe = list(universe)
+        self.start = pd.Timestamp(start_date)
+        self.end = pd.Timestamp(end_date)
+        self._provider = provider
+        self._derived: dict[tuple[Hashable, ...], pd.DataFrame] = {}
+
+    @classmethod
+    def load(
+        cls,
+        provider: DataProvider,
+        requirements: DataRequirements,
+        universe: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> "FactorDataPanel":
+        """Load every required dataset once from an upstream provider.
+
+        Parameters
+        ----------
+        provider : DataProvider
+            Upstream data provider
+        requirements : DataRequirements
+            Datasets to load
+        universe : list[str]
+            Symbols to load
+        start_date : datetime | str
+            Start date of the loaded range
+        end_date : datetime | str
+            End date of the loaded range
+
+        Returns
+        -------
+        FactorDataPanel
+            Panel holding the loaded frames
+        """
+        frames: dict[str, pd.DataFrame] = {}
+        if requirements.prices:
+            frames["prices"] = provider.get_prices(universe, start_date, end_date)
+        if requirements.volumes:
+            frames["volumes"] = provider.get_volumes(universe, start_date, end_date)
+        if requirements.market_cap:
+            frames["market_cap"] = provider.get_market_cap(
+                universe, start_date, end_date
+            )
+        if requirements.fundamentals:
+            frames["fundamentals"] = provider.get_fundamentals(
+                universe, sorted(requirements.fundamentals), start_date, end_date
+            )
+
+        logger.info(
+            "Factor data panel loaded",
+            datasets=list(frames),
+            universe_size=len(universe),
+            shapes={name: frame.shape for name, frame in frames.items()},
+        )
+        return cls(frames, universe, start_date, end_date, provider=provider)
+
+    # ------------------------------------------------------------------
+    # DataProvider interface
+    # ------------------------------------------------------------------
+
+    def get_prices(
+        self,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        """Return OHLCV prices (MultiIndex columns: symbol, price_type)."""
+        frame = self._cached("prices", symbols, start_date, end_date)
+        if frame is None:
+            return self._upstream().get_prices(symbols, start_date, end_date)
+        return frame
+
+    def get_volumes(
+        self,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        """Return volumes (columns: symbols)."""
+        frame = self._cached("volumes", symbols, start_date, end_date)
+        if frame is None:
+            return self._upstream().get_volumes(symbols, start_date, end_date)
+        return frame
+
+    def get_fundamentals(
+        self,
+        symbols: list[str],
+        metrics: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        """Return fundamental metrics (MultiIndex columns: symbol, metric)."""
+        frame = self._cached(
+            "fundamentals", symbols, start_date, end_date, metrics=metrics
+        )
+        if frame is None:
+            return self._upstream().get_fundamentals(
+                symbols, metrics, start_date, end_date
+            )
+        return frame
+
+    def get_market_cap(
+        self,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        """Return market capitalization (columns: symbols)."""
+        frame = self._cached("market_cap", symbols, start_date, end_date)
+        if frame is None:
+            return self._upstream().get_market_cap(symbols, start_date, end_date)
+        return frame
+
+    # ------------------------------------------------------------------
+    # Derived intermediates
+    # ------------------------------------------------------------------
+
+    def close_prices(
+        self,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        """Return close prices (columns: symbols in the given order).
+
+        Symbols without price data are returned as all-NaN columns.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Symbols to return
+        start_date : datetime | str
+            Start date
+        end_date : datetime | str
+            End date
+
+        Returns
+        -------
+        pd.DataFrame
+            Close prices (index: Date)
+        """
+
+        def build() -> pd.DataFrame:
+            prices = self.get_prices(symbols, start_date, end_date)
+            if isinstance(prices.columns, pd.MultiIndex):
+                close = prices.xs("Close", axis=1, level=-1)
+            else:
+                close = prices
+            close = close.reindex(columns=symbols).astype(float)
+            close.index.name = "Date"
+            return close
+
+        return self._memoize("close", symbols, start_date, end_date, build)
+
+    def returns(
+        self,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        """Return simple daily returns of close prices.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Symbols to return
+        start_date : datetime | str
+            Start date
+        end_date : datetime | str
+            End date
+
+        Returns
+        -------
+        pd.DataFrame
+            ``close.pct_change()`` (first row is NaN)
+        """
+        return self._memoize(
+            "returns",
+            symbols,
+            start_date,
+            end_date,
+            lambda: self.close_prices(symbols, start_date, end_date).pct_change(),
+        )
+
+    def log_prices(
+        self,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        """Return natural log of close prices.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Symbols to return
+        start_date : datetime | str
+            Start date
+        end_date : datetime | str
+            End date
+
+        Returns
+        -------
+        pd.DataFrame
+            ``log(close)``; log-returns over k days are ``diff(k)`` of this
+        """
+        return self._memoize(
+            "log_prices",
+            symbols,
+            start_date,
+            end_date,
+            lambda: cast(
+                "pd.DataFrame", np.log(self.close_prices(symbols, start_date, end_date))
+            ),
+        )
+
+    def clear_derived(self) -> None:
+        """Drop all memoized intermediates."""
+        self._derived.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _covers(
+        self,
+        symbols: Iterable[str],
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        frame: pd.DataFrame,
+        metrics: list[str] | None,
+    ) -> bool:
+        if not (self.start <= start and end <= self.end):
+            return False
+        if not set(symbols) <= set(self.universe):
+            return False
+        if metrics is not None:
+            return set(metrics) <= set(frame.columns.get_level_values(-1))
+        return True
+
+    def _cached(
+        self,
+        dataset: str,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+        *,
+        metrics: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """Slice a loaded frame, or return None if the request is not covered."""
+        frame = self._frames.get(dataset)
+        start = cast("pd.Timestamp", pd.Timestamp(start_date))
+        end = cast("pd.Timestamp", pd.Timestamp(end_date))
+        if frame is None or not self._covers(symbols, start, end, frame, metrics):
+            logger.debug(
+                "Factor data panel miss",
+                dataset=dataset,
+                loaded=frame is not None,
+                start=str(start_date),
+                end=str(end_date),
+            )
+            return None
+
+        full_range = start == self.start and end == self.end
+        full_universe = list(symbols) == self.universe
+        if full_range and full_universe and metrics is None:
+            return frame
+
+        if not full_range:
+            frame = frame.loc[start:end]
+        if isinstance(frame.columns, pd.MultiIndex):
+            mask = frame.columns.get_level_values(0).isin(symbols)
+            if metrics is not None:
+                mask &= frame.columns.get_level_values(-1).isin(metrics)
+            return frame.loc[:, mask]
+        if not full_universe:
+            return frame.loc[:, [s for s in symbols if s in frame.columns]]
+        return frame
+
+    def _memoize(
+        self,
+        kind: str,
+        symbols: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+        build: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        key = (kind, tuple(symbols), pd.Timestamp(start_date), pd.Timestamp(end_date))
+        cached = self._derived.get(key)
+        if cached is None:
+            cached = build()
+            self._derived[key] = cached
+        return cached
+
+    def _upstream(self) -> DataProvider:
+        if self._provider is None:
+            raise DataFetchError(
+                "Requested data is outside the loaded factor data panel "
+                "and no upstream provider is attached",
+                symbols=self.universe,
+                details={"start": str(self.start), "end": str(self.end)},
+            )
+        return self._provider
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the upstream provider and memoized intermediates."""
+        state = self.__dict__.copy()
+        state["_provider"] = None
+        state["_derived"] = {}
+        return state
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"FactorDataPanel(datasets={list(self._frames)}, "
+            f"symbols={len(self.universe)}, "
+            f"range={self.start.date()}..{self.end.date()})"
+        )
+
+
+__all__ = ["DataRequirements", "FactorDataPanel"]
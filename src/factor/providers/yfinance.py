@@ -14,7 +14,9 @@ Examples
 ... )
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -25,6 +27,7 @@ import yfinance as yf
 from factor.errors import DataFetchError
 from factor.providers.cache import Cache
 from utils_core.logging import get_logger
+from utils_core.rate_limit import get_rate_scheduler
 
 logger = get_logger(__name__)
 
@@ -42,6 +45,13 @@ METRIC_MAPPING: dict[str, str] = {
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_BASE_DELAY = 1.0  # seconds
 
+# Default concurrency for per-symbol ticker info requests
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+
+# Scheduler key shared by every Yahoo Finance client in the process
+RATE_LIMIT_KEY = "finance.yahoo.com"
+
 
 class YFinanceProvider:
     """Yahoo Finance data provider.
@@ -50,6 +60,13 @@ class YFinanceProvider:
     Supports caching with TTL-based invalidation and retry logic with
     exponential backoff.
 
+    Per-symbol ``Ticker.info`` requests (used by ``get_fundamentals`` and
+    ``get_market_cap``) run on a bounded thread pool and are spaced by the
+    process-wide request scheduler (``utils_core.rate_limit``), which all
+    Yahoo Finance clients share. Each symbol's info payload is kept in
+    memory for the lifetime of the provider, so one request serves every
+    metric and every factor that needs it in the same run.
+
     Parameters
     ----------
     cache_path : str | Path | None, default=None
@@ -60,6 +77,11 @@ class YFinanceProvider:
         Maximum number of retry attempts for failed requests.
     retry_base_delay : float, default=1.0
         Base delay in seconds for exponential backoff.
+    max_workers : int, default=8
+        Maximum number of concurrent ticker info requests.
+    requests_per_second : float | None, default=5.0
+        Maximum ticker info request rate shared by all workers.
+        None disables rate limiting.
 
     Attributes
     ----------
@@ -69,6 +91,12 @@ class YFinanceProvider:
         Maximum retry attempts.
     retry_base_delay : float
         Base delay for exponential backoff.
+    max_workers : int
+        Maximum concurrent ticker info requests.
+    last_failed_symbols : dict[str, str]
+        Symbols whose ticker info could not be fetched in the most recent
+        ``get_fundamentals`` / ``get_market_cap`` call, mapped to the
+        error message. Their values are NaN in the returned DataFrame.
 
     Examples
     --------
@@ -90,6 +118,9 @@ class YFinanceProvider:
         cache_ttl_hours: int = 24,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        requests_per_second: float | None = DEFAULT_REQUESTS_PER_SECOND,
     ) -> None:
         """Initialize YFinanceProvider.
 
@@ -103,6 +134,15 @@ class YFinanceProvider:
             Maximum number of retry attempts for failed requests.
         retry_base_delay : float, default=1.0
             Base delay in seconds for exponential backoff.
+        max_workers : int, default=8
+            Maximum number of concurrent ticker info requests.
+        requests_per_second : float | None, default=5.0
+            Maximum ticker info request rate. None disables rate limiting.
+
+        Raises
+        ------
+        ValueError
+            If max_workers or requests_per_second is not positive.
         """
         logger.debug(
             "Initializing YFinanceProvider",
@@ -110,14 +150,30 @@ class YFinanceProvider:
             cache_ttl_hours=cache_ttl_hours,
             max_retries=max_retries,
             retry_base_delay=retry_base_delay,
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
         )
 
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError(
+                f"requests_per_second must be positive, got {requests_per_second}"
+            )
+
         self.cache: Cache | None = None
         if cache_path is not None:
             self.cache = Cache(cache_path=cache_path, ttl_hours=cache_ttl_hours)
 
         self.max_retries = max_retries
         self.retry_base_delay = retry_base_delay
+        self.max_workers = max_workers
+        self._request_interval: float | None = (
+            1.0 / requests_per_second if requests_per_second is not None else None
+        )
+        self._info_cache: dict[str, dict[str, Any]] = {}
+        self._info_cache_lock = threading.Lock()
+        self.last_failed_symbols: dict[str, str] = {}
 
         logger.info(
             "YFinanceProvider initialized",
@@ -504,6 +560,9 @@ class YFinanceProvider:
         yfinance provides point-in-time fundamental data, so the same
         values are replicated across the date range.
 
+        Symbols whose ticker info cannot be fetched after retries are
+        reported in ``last_failed_symbols`` and their metrics are NaN.
+
         Examples
         --------
         >>> provider = YFinanceProvider()
@@ -543,11 +602,12 @@ class YFinanceProvider:
                 )
                 return cached_data
 
-        # Fetch fundamental data for each symbol
+        # Fetch ticker info for all symbols concurrently
+        ticker_infos = self._get_ticker_infos(symbols)
         fundamentals: dict[tuple[str, str], list[float | None]] = {}
 
         for symbol in symbols:
-            ticker_info = self._get_ticker_info(symbol)
+            ticker_info = ticker_infos.get(symbol)
 
             for metric in metrics:
                 yf_key = METRIC_MAPPING.get(metric)
@@ -591,6 +651,9 @@ class YFinanceProvider:
     def _get_ticker_info(self, symbol: str) -> dict[str, Any] | None:
         """Get ticker info from yfinance with retry logic.
 
+        Successful payloads are cached in memory, so repeated calls for
+        the same symbol do not hit the network again.
+
         Parameters
         ----------
         symbol : str
@@ -602,12 +665,7 @@ class YFinanceProvider:
             Ticker info dictionary or None if failed.
         """
         try:
-
-            def fetch_info() -> dict[str, Any]:
-                ticker = yf.Ticker(symbol)
-                return ticker.info
-
-            return self._retry_with_backoff(fetch_info, [symbol])
+            return self._fetch_ticker_info(symbol)
         except DataFetchError:
             logger.warning(
                 "Failed to fetch ticker info",
@@ -615,6 +673,111 @@ class YFinanceProvider:
             )
             return None
 
+    def _fetch_ticker_info(self, symbol: str) -> dict[str, Any]:
+        """Fetch ticker info through the info cache and rate limiter.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol.
+
+        Returns
+        -------
+        dict[str, Any]
+            Ticker info dictionary.
+
+        Raises
+        ------
+        DataFetchError
+            If all retry attempts fail.
+        """
+        with self._info_cache_lock:
+            cached = self._info_cache.get(symbol)
+        if cached is not None:
+            return cached
+
+        def fetch_info() -> dict[str, Any]:
+            if self._request_interval is not None:
+                get_rate_scheduler().acquire(
+                    RATE_LIMIT_KEY, interval=self._request_interval
+                )
+            ticker = yf.Ticker(symbol)
+            return ticker.info
+
+        info = self._retry_with_backoff(fetch_info, [symbol])
+
+        with self._info_cache_lock:
+            self._info_cache[symbol] = info
+        return info
+
+    def _get_ticker_infos(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """Get ticker info for several symbols concurrently.
+
+        Cached symbols are served from memory; the rest are fetched on a
+        thread pool of at most ``max_workers`` threads, each request going
+        through the shared rate limiter and its own retry loop. Failures
+        are collected per symbol instead of aborting the batch.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Ticker symbols.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Ticker info for the symbols that were fetched successfully.
+            Failed symbols are recorded in ``last_failed_symbols``.
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        with self._info_cache_lock:
+            infos = {
+                symbol: self._info_cache[symbol]
+                for symbol in unique_symbols
+                if symbol in self._info_cache
+            }
+        pending = [symbol for symbol in unique_symbols if symbol not in infos]
+        failures: dict[str, str] = {}
+
+        logger.debug(
+            "Fetching ticker info",
+            total=len(unique_symbols),
+            cached=len(infos),
+            pending=len(pending),
+        )
+
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="yfinance-info"
+            ) as executor:
+                futures = {
+                    symbol: executor.submit(self._fetch_ticker_info, symbol)
+                    for symbol in pending
+                }
+                for symbol, future in futures.items():
+                    try:
+                        infos[symbol] = future.result()
+                    except DataFetchError as e:
+                        cause = e.cause if e.cause is not None else e
+                        failures[symbol] = str(cause)
+
+        self.last_failed_symbols = failures
+        if failures:
+            logger.warning(
+                "Failed to fetch ticker info for some symbols",
+                failed_count=len(failures),
+                total=len(unique_symbols),
+                failed_symbols=sorted(failures),
+            )
+
+        return infos
+
+    def clear_info_cache(self) -> None:
+        """Discard all cached ticker info payloads."""
+        with self._info_cache_lock:
+            self._info_cache.clear()
+
     def get_market_cap(
         self,
         symbols: list[str],
@@ -651,6 +814,9 @@ class YFinanceProvider:
         yfinance provides point-in-time market cap, so the same
         values are replicated across the date range.
 
+        Symbols whose ticker info cannot be fetched after retries are
+        reported in ``last_failed_symbols`` and their values are NaN.
+
         Examples
         --------
         >>> provider = YFinanceProvider()
@@ -685,11 +851,12 @@ class YFinanceProvider:
                 )
                 return cached_data
 
-        # Fetch market cap for each symbol
+        # Fetch ticker info for all symbols concurrently
+        ticker_infos = self._get_ticker_infos(symbols)
         market_caps: dict[str, float | None] = {}
 
         for symbol in symbols:
-            ticker_info = self._get_ticker_info(symbol)
+            ticker_info = ticker_infos.get(symbol)
             if ticker_info is not None:
                 market_caps[symbol] = ticker_info.get("marketCap")
             else:
@@ -4,9 +4,34 @@ This module provides tools for validating and analyzing factor effectiveness:
 - ICAnalyzer: IC/IR analysis for factor predictive power
 - ICResult: Result dataclass for IC/IR analysis
 - QuantileAnalyzer: Quantile portfolio analysis
+- BatchFactorValidator: IC and quantile analysis for many factors and horizons
+- BatchValidationResult: Result dataclass for batch validation
 """
 
-from .ic_analyzer import ICAnalyzer, ICResult
-from .quantile_analyzer import QuantileAnalyzer
+from typing import TYPE_CHECKING
 
-__all__ = ["ICAnalyzer", "ICResult", "QuantileAnalyzer"]
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .batch_validator import BatchFactorValidator, BatchValidationResult
+    from .ic_analyzer import ICAnalyzer, ICResult
+    from .quantile_analyzer import QuantileAnalyzer
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BatchFactorValidator": ".batch_validator",
+    "BatchValidationResult": ".batch_validator",
+    "ICAnalyzer": ".ic_analyzer",
+    "ICResult": ".ic_analyzer",
+    "QuantileAnalyzer": ".quantile_analyzer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "BatchFactorValidator",
+    "BatchValidationResult",
+    "ICAnalyzer",
+    "ICResult",
+    "QuantileAnalyzer",
+]
@@ -0,0 +1,444 @@
+"""Batch IC and quantile validation for many factors and horizons.
+
+This module provides the BatchFactorValidator class, which validates a set of
+factors against forward returns at several horizons in one call. All
+factors are stacked into a (factor x date x symbol) array, so ranking, IC and
+quantile assignment run as array operations over the whole panel, and
+quantile returns are aggregated with one keyed sum per horizon.
+"""
+
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, cast
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from scipy import stats
+
+from ..errors import InsufficientDataError, ValidationError
+from .cross_section import (
+    MIN_SYMBOLS_FOR_IC,
+    CorrelationMethod,
+    assign_quantile_buckets,
+    cross_sectional_ic,
+    quantile_mean_returns,
+    rank_cross_section,
+)
+
+
+def _get_logger() -> Any:
+    """Get logger with lazy initialization to avoid circular imports."""
+    try:
+        from utils_core.logging import get_logger
+
+        return get_logger(__name__, module="batch_validator")
+    except ImportError:
+        import logging
+
+        return logging.getLogger(__name__)
+
+
+logger: Any = _get_logger()
+
+
+@dataclass
+class BatchValidationResult:
+    """Result of batch IC/quantile validation.
+
+    Parameters
+    ----------
+    ic : pd.DataFrame
+        IC per date (index: date, columns: MultiIndex of factor and horizon)
+    ic_summary : pd.DataFrame
+        IC statistics per factor and horizon (index: MultiIndex of factor and
+        horizon, columns: mean_ic, std_ic, ir, t_stat, p_value, n_periods)
+    quantile_returns : pd.DataFrame
+        Mean forward return per quantile (index: MultiIndex of factor,
+        horizon and date, columns: quantile number)
+    quantile_summary : pd.DataFrame
+        Mean return per quantile plus long_short_return and
+        monotonicity_score (index: MultiIndex of factor and horizon)
+    method : str
+        Correlation method used for IC ("spearman" or "pearson")
+    n_quantiles : int
+        Number of quantiles
+
+    Examples
+    --------
+    >>> result = validator.validate(factors, forward_returns)
+    >>> result.ic_summary.loc[("momentum", 21), "ir"]
+    0.42
+    """
+
+    ic: pd.DataFrame
+    ic_summary: pd.DataFrame
+    quantile_returns: pd.DataFrame
+    quantile_summary: pd.DataFrame
+    method: str
+    n_quantiles: int
+
+
+class BatchFactorValidator:
+    """Validate many factors at many horizons in one vectorized pass.
+
+    Produces the same IC and quantile statistics as ICAnalyzer and
+    QuantileAnalyzer, for every (factor, horizon) pair at once.
+
+    Parameters
+    ----------
+    method : Literal["spearman", "pearson"], default="spearman"
+        Correlation method for IC
+    n_quantiles : int, default=5
+        Number of quantiles. Must be at least 2.
+
+    Examples
+    --------
+    >>> validator = BatchFactorValidator(method="spearman", n_quantiles=5)
+    >>> forward_returns = BatchFactorValidator.compute_forward_returns(
+    ...     prices, horizons=[1, 5, 21]
+    ... )
+    >>> result = validator.validate(
+    ...     {"momentum": momentum, "value": value}, forward_returns
+    ... )
+    >>> result.ic_summary["ir"]
+    """
+
+    def __init__(
+        self,
+        method: Literal["spearman", "pearson"] = "spearman",
+        n_quantiles: int = 5,
+    ) -> None:
+        """Initialize BatchFactorValidator.
+
+        Parameters
+        ----------
+        method : Literal["spearman", "pearson"], default="spearman"
+            Correlation method for IC
+        n_quantiles : int, default=5
+            Number of quantiles. Must be >= 2.
+
+        Raises
+        ------
+        ValidationError
+            If method or n_quantiles is invalid
+        """
+        valid_methods = ("spearman", "pearson")
+        if method not in valid_methods:
+            logger.error(
+                "Invalid correlation method",
+                method=method,
+                valid_methods=valid_methods,
+            )
+            raise ValidationError(
+                f"method must be one of {valid_methods}, got {method!r}",
+                field="method",
+                value=method,
+            )
+
+        if n_quantiles < 2:
+            logger.error("Invalid n_quantiles value", n_quantiles=n_quantiles)
+            raise ValidationError(
+                f"n_quantiles must be at least 2, got {n_quantiles}",
+                field="n_quantiles",
+                value=n_quantiles,
+            )
+
+        self.method: CorrelationMethod = method
+        self.n_quantiles = n_quantiles
+        logger.debug(
+            "BatchFactorValidator initialized",
+            method=method,
+            n_quantiles=n_quantiles,
+        )
+
+    @staticmethod
+    def compute_forward_returns(
+        prices: pd.DataFrame,
+        horizons: Sequence[int],
+    ) -> dict[int, pd.DataFrame]:
+        """Compute forward returns for several horizons.
+
+        Parameters
+        ----------
+        prices : pd.DataFrame
+            Price data (index: date, columns: symbols)
+        horizons : Sequence[int]
+            Forward return periods, e.g. [1, 5, 21]
+
+        Returns
+        -------
+        dict[int, pd.DataFrame]
+            Forward returns keyed by horizon. The last ``horizon`` rows of
+            each frame are NaN.
+        """
+        return {h: prices.shift(-h) / prices - 1 for h in horizons}
+
+    def validate(
+        self,
+        factors: Mapping[str, pd.DataFrame],
+        forward_returns: Mapping[Any, pd.DataFrame] | pd.DataFrame,
+    ) -> BatchValidationResult:
+        """Compute IC and quantile statistics for every factor and horizon.
+
+        Parameters
+        ----------
+        factors : Mapping[str, pd.DataFrame]
+            Factor values keyed by factor name (index: date, columns: symbols)
+        forward_returns : Mapping[Any, pd.DataFrame] | pd.DataFrame
+            Forward returns keyed by horizon label, or a single frame
+            (stored under horizon label 1)
+
+        Returns
+        -------
+        BatchValidationResult
+            IC series, IC statistics, quantile returns and quantile summary
+
+        Raises
+        ------
+        ValidationError
+            If no factors or horizons are given, or inputs share no dates
+            or symbols
+        InsufficientDataError
+            If fewer than MIN_SYMBOLS_FOR_IC symbols are shared
+        """
+        horizon_returns: dict[Hashable, pd.DataFrame] = (
+            {1: forward_returns}
+            if isinstance(forward_returns, pd.DataFrame)
+            else dict(forward_returns)
+        )
+        dates, symbols = self._align(factors, horizon_returns)
+
+        factor_names = list(factors)
+        horizons = list(horizon_returns)
+        logger.debug(
+            "Starting batch validation",
+            n_factors=len(factor_names),
+            n_horizons=len(horizons),
+            n_dates=len(dates),
+            n_symbols=len(symbols),
+        )
+
+        factor_panel = np.stack(
+            [_to_array(factors[name], dates, symbols) for name in factor_names]
+        )
+        return_panel = np.stack(
+            [_to_array(horizon_returns[h], dates, symbols) for h in horizons]
+        )
+
+        ic = self._ic(factor_panel, return_panel)
+        pairs = pd.MultiIndex.from_product(
+            [factor_names, horizons], names=["factor", "horizon"]
+        )
+        ic_frame = pd.DataFrame(
+            ic.transpose(2, 0, 1).reshape(len(dates), -1),
+            index=dates,
+            columns=pairs,
+        )
+
+        quantile_returns = self._quantile_returns(
+            factor_panel, return_panel, pairs, dates
+        )
+
+        result = BatchValidationResult(
+            ic=ic_frame,
+            ic_summary=_summarize_ic(ic_frame),
+            quantile_returns=quantile_returns,
+            quantile_summary=_summarize_quantiles(quantile_returns, pairs),
+            method=self.method,
+            n_quantiles=self.n_quantiles,
+        )
+
+        logger.info(
+            "Batch validation completed",
+            n_factors=len(factor_names),
+            n_horizons=len(horizons),
+            n_dates=len(dates),
+        )
+
+        return result
+
+    def _ic(
+        self,
+        factor_panel: npt.NDArray[np.float64],
+        return_panel: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """IC per (factor, horizon, date), shape (F, H, T).
+
+        Each panel is ranked once; a (factor, horizon) pair only re-ranks the
+        dates where their missing values differ. Looping over factors keeps
+        the working set of every step small enough to stay in cache.
+        """
+        spearman = self.method == "spearman"
+        return_ranks = [
+            rank_cross_section(r) if spearman else None for r in return_panel
+        ]
+        ic = np.empty((*factor_panel.shape[:2], return_panel.shape[0]))
+        for f, factor in enumerate(factor_panel):
+            factor_ranks = rank_cross_section(factor) if spearman else None
+            for h, returns in enumerate(return_panel):
+                ic[f, :, h] = cross_sectional_ic(
+                    factor,
+                    returns,
+                    self.method,
+                    factor_ranks=factor_ranks,
+                    return_ranks=return_ranks[h],
+                )
+        return ic.transpose(0, 2, 1)
+
+    def _quantile_returns(
+        self,
+        factor_panel: npt.NDArray[np.float64],
+        return_panel: npt.NDArray[np.float64],
+        pairs: pd.MultiIndex,
+        dates: pd.Index,
+    ) -> pd.DataFrame:
+        """Mean return per (factor, horizon, date) and quantile."""
+        buckets = assign_quantile_buckets(factor_panel, self.n_quantiles)
+
+        # (F, H, T, q): buckets are shared by all horizons of a factor
+        means = np.stack(
+            [
+                quantile_mean_returns(buckets, returns[np.newaxis], self.n_quantiles)
+                for returns in return_panel
+            ],
+            axis=1,
+        )
+
+        n_pairs = len(pairs)
+        pair_codes = np.repeat(np.arange(n_pairs), len(dates))
+        index = pd.MultiIndex.from_arrays(
+            [
+                pairs.get_level_values("factor")[pair_codes],
+                pairs.get_level_values("horizon")[pair_codes],
+                np.tile(dates, n_pairs),
+            ],
+            names=["factor", "horizon", dates.name or "date"],
+        )
+        return pd.DataFrame(
+            means.reshape(-1, self.n_quantiles),
+            index=index,
+            columns=pd.Index(list(range(1, self.n_quantiles + 1))),
+        )
+
+    @staticmethod
+    def _align(
+        factors: Mapping[str, pd.DataFrame],
+        horizon_returns: Mapping[Hashable, pd.DataFrame],
+    ) -> tuple[pd.Index, pd.Index]:
+        """Return the shared dates and symbols of factors and returns."""
+        if not factors:
+            raise ValidationError("factors cannot be empty", field="factors")
+        if not horizon_returns:
+            raise ValidationError(
+                "forward_returns cannot be empty", field="forward_returns"
+            )
+
+        factor_dates = _union(frame.index for frame in factors.values())
+        return_dates = _union(frame.index for frame in horizon_returns.values())
+        factor_symbols = _union(frame.columns for frame in factors.values())
+        return_symbols = _union(frame.columns for frame in horizon_returns.values())
+
+        dates = factor_dates.intersection(return_dates).sort_values()
+        symbols = factor_symbols.intersection(return_symbols)
+
+        if len(dates) == 0:
+            logger.error("No common dates between factors and forward_returns")
+            raise ValidationError(
+                "factors and forward_returns have no common dates", field="index"
+            )
+        if len(symbols) < MIN_SYMBOLS_FOR_IC:
+            logger.error(
+                "Insufficient symbols for batch validation",
+                available=len(symbols),
+                required=MIN_SYMBOLS_FOR_IC,
+            )
+            raise InsufficientDataError(
+                f"At least {MIN_SYMBOLS_FOR_IC} common symbols required, "
+                f"got {len(symbols)}",
+                required=MIN_SYMBOLS_FOR_IC,
+                available=len(symbols),
+            )
+
+        return dates, symbols
+
+
+def _union(indexes: Any) -> pd.Index:
+    """Union of several pandas indexes, preserving first-seen order."""
+    result: pd.Index | None = None
+    for index in indexes:
+        result = index if result is None else result.union(index, sort=False)
+    return result if result is not None else pd.Index([])
+
+
+def _to_array(
+    frame: pd.DataFrame, dates: pd.Index, symbols: pd.Index
+) -> npt.NDArray[np.float64]:
+    """Reindex a (date x symbol) frame onto the shared grid as floats."""
+    return frame.reindex(index=dates, columns=symbols).to_numpy(dtype=np.float64)
+
+
+def _summarize_ic(ic: pd.DataFrame) -> pd.DataFrame:
+    """Mean/std IC, IR, t-statistic and p-value for every IC column."""
+    values = ic.to_numpy()
+    n_periods = (~np.isnan(values)).sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_ic = np.nansum(values, axis=0) / n_periods
+        deviations = np.where(np.isnan(values), 0.0, values - mean_ic)
+        std_ic = np.sqrt((deviations**2).sum(axis=0) / (n_periods - 1))
+        std_ic = np.where(n_periods > 1, std_ic, np.nan)
+
+        ir = np.where(
+            (std_ic == 0) | np.isnan(std_ic),
+            np.where(mean_ic != 0, np.inf, np.nan),
+            mean_ic / std_ic,
+        )
+        # Zero dispersion with non-zero mean IC gives t = +/-inf and p = 0
+        testable = (n_periods > 1) & ((std_ic > 0) | (mean_ic != 0))
+        t_stat = np.where(testable, mean_ic / (std_ic / np.sqrt(n_periods)), np.nan)
+        p_value = np.where(
+            testable,
+            2 * stats.t.sf(np.abs(t_stat), df=np.maximum(n_periods - 1, 1)),
+            np.nan,
+        )
+
+    return pd.DataFrame(
+        {
+            "mean_ic": mean_ic,
+            "std_ic": std_ic,
+            "ir": ir,
+            "t_stat": t_stat,
+            "p_value": p_value,
+            "n_periods": n_periods,
+        },
+        index=ic.columns,
+    )
+
+
+def _summarize_quantiles(
+    quantile_returns: pd.DataFrame, pairs: pd.MultiIndex
+) -> pd.DataFrame:
+    """Mean quantile returns, long-short return and monotonicity score."""
+    mean_returns = cast(
+        "pd.DataFrame",
+        quantile_returns.groupby(level=["factor", "horizon"], sort=False)
+        .mean()
+        .reindex(pairs),
+    )
+    values = mean_returns.to_numpy()
+    quantile_numbers = np.asarray(mean_returns.columns, dtype=np.float64)
+
+    # Spearman correlation of quantile number and mean return, rescaled to 0-1
+    correlation = cross_sectional_ic(
+        np.broadcast_to(quantile_numbers, values.shape), values, min_symbols=2
+    )
+    summary = mean_returns.copy()
+    summary["long_short_return"] = values[:, -1] - values[:, 0]
+    summary["monotonicity_score"] = np.where(
+        np.isnan(correlation), 0.0, (correlation + 1.0) / 2.0
+    )
+    return summary
+
+
+__all__ = ["BatchFactorValidator", "BatchValidationResult"]
@@ -0,0 +1,314 @@
+"""Array-level cross-sectional kernels for factor validation.
+
+This module provides NumPy implementations of the per-date operations used by
+IC and quantile analysis. Every function works on a whole (date x symbol)
+panel at once: ranking, IC and quantile bucketing are computed along the
+last axis with no Python loop over dates.
+
+Functions
+---------
+rank_cross_section : Rank each row of a panel, ignoring NaN
+cross_sectional_ic : Pearson/Spearman IC for every date of a panel
+assign_quantile_buckets : Equal-frequency quantile numbers for every date
+quantile_mean_returns : Mean forward return per date and quantile (one aggregation)
+"""
+
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+# Minimum number of symbols required for IC calculation
+MIN_SYMBOLS_FOR_IC = 5
+
+type CorrelationMethod = Literal["spearman", "pearson"]
+type RankMethod = Literal["average", "min"]
+
+
+def _get_logger() -> Any:
+    """Get logger with lazy initialization to avoid circular imports."""
+    try:
+        from utils_core.logging import get_logger
+
+        return get_logger(__name__, module="cross_section")
+    except ImportError:
+        import logging
+
+        return logging.getLogger(__name__)
+
+
+logger: Any = _get_logger()
+
+
+def rank_cross_section(
+    values: npt.ArrayLike,
+    method: RankMethod = "average",
+) -> npt.NDArray[np.float64]:
+    """Rank values along the last axis, leaving NaN in place.
+
+    Parameters
+    ----------
+    values : npt.ArrayLike
+        Panel of values, e.g. shape (dates, symbols).
+    method : {"average", "min"}, default="average"
+        How ties are ranked: the mean of the tied positions (as in
+        ``scipy.stats.rankdata``) or the lowest one.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        1-based ranks with the same shape as ``values``; NaN where the
+        input is NaN.
+
+    Examples
+    --------
+    >>> rank_cross_section([[3.0, 1.0, np.nan, 1.0]])
+    array([[3. , 1.5, nan, 1.5]])
+    """
+    array = np.asarray(values, dtype=np.float64)
+    if array.size == 0:
+        return array.copy()
+
+    missing = np.isnan(array)
+    # Missing values are sorted last so valid values occupy positions
+    # 0..n_valid-1. argsort is several times faster on +inf than on NaN, but
+    # real +inf values would then mix with missing ones, so keep NaN for them.
+    keys = array if np.isposinf(array).any() else np.where(missing, np.inf, array)
+    # Tie order does not matter because tied values share one rank
+    order = np.argsort(keys, axis=-1)
+    ordered = np.take_along_axis(keys, order, axis=-1)
+    positions = np.broadcast_to(np.arange(array.shape[-1]), array.shape)
+
+    starts_group = np.ones(array.shape, dtype=bool)
+    starts_group[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+    n_valid = (~missing).sum(axis=-1, keepdims=True)
+    tied = ~starts_group & (positions < n_valid)
+
+    if not tied.any():
+        # Continuous data rarely ties: the sorted position is the rank
+        ordered_ranks = positions + 1.0
+    elif method == "min":
+        ordered_ranks = _group_start(starts_group, positions) + 1.0
+    else:
+        ends_group = np.ones(array.shape, dtype=bool)
+        ends_group[..., :-1] = starts_group[..., 1:]
+        last = array.shape[-1] - 1
+        group_end = np.flip(
+            np.minimum.accumulate(
+                np.flip(np.where(ends_group, positions, last), axis=-1), axis=-1
+            ),
+            axis=-1,
+        )
+        group_start = _group_start(starts_group, positions)
+        ordered_ranks = (group_start + group_end) / 2.0 + 1.0
+
+    ranks = np.empty(array.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, ordered_ranks, axis=-1)
+    ranks[missing] = np.nan
+    return ranks
+
+
+def _group_start(
+    starts_group: npt.NDArray[np.bool_], positions: npt.NDArray[np.int64]
+) -> npt.NDArray[np.int64]:
+    """Sorted position of the first member of each element's tie group."""
+    return np.maximum.accumulate(np.where(starts_group, positions, 0), axis=-1)
+
+
+def cross_sectional_ic(
+    factor_values: npt.ArrayLike,
+    forward_returns: npt.ArrayLike,
+    method: CorrelationMethod = "spearman",
+    min_symbols: int = MIN_SYMBOLS_FOR_IC,
+    *,
+    factor_ranks: npt.NDArray[np.float64] | None = None,
+    return_ranks: npt.NDArray[np.float64] | None = None,
+) -> npt.NDArray[np.float64]:
+    """Compute the IC of every date in one pass.
+
+    For each row only symbols with both a factor value and a forward return
+    are used. Spearman IC is the Pearson correlation of the ranks within
+    those paired symbols.
+
+    Parameters
+    ----------
+    factor_values : npt.ArrayLike
+        Factor panel, shape (..., dates, symbols).
+    forward_returns : npt.ArrayLike
+        Forward return panel, broadcastable to ``factor_values``.
+    method : {"spearman", "pearson"}, default="spearman"
+        Correlation method.
+    min_symbols : int, default=MIN_SYMBOLS_FOR_IC
+        Minimum number of paired symbols; rows with fewer are NaN.
+    factor_ranks : npt.NDArray[np.float64] | None, default=None
+        ``rank_cross_section(factor_values)``, when the same factor panel is
+        correlated with several return panels. Only rows where pairing drops
+        a value are re-ranked.
+    return_ranks : npt.NDArray[np.float64] | None, default=None
+        ``rank_cross_section(forward_returns)``, reused in the same way.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        IC per row, shape (..., dates). NaN where there are too few symbols
+        or either side is constant.
+    """
+    factors = np.asarray(factor_values, dtype=np.float64)
+    returns = np.asarray(forward_returns, dtype=np.float64)
+    factors, returns = np.broadcast_arrays(factors, returns)
+
+    paired = ~np.isnan(factors) & ~np.isnan(returns)
+    if method == "spearman":
+        x = _paired_ranks(factors, paired, factor_ranks)
+        y = _paired_ranks(returns, paired, return_ranks)
+    else:
+        x = np.where(paired, factors, np.nan)
+        y = np.where(paired, returns, np.nan)
+
+    n = paired.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_dev = np.where(
+            paired, x - np.nansum(x, axis=-1, keepdims=True) / n[..., None], 0.0
+        )
+        y_dev = np.where(
+            paired, y - np.nansum(y, axis=-1, keepdims=True) / n[..., None], 0.0
+        )
+        cov = (x_dev * y_dev).sum(axis=-1)
+        ic = cov / np.sqrt((x_dev * x_dev).sum(axis=-1) * (y_dev * y_dev).sum(axis=-1))
+
+    # Constant rows have an undefined correlation
+    constant = _is_constant(x, paired) | _is_constant(y, paired)
+    ic = np.where((n >= min_symbols) & ~constant, ic, np.nan)
+    return np.clip(ic, -1.0, 1.0)
+
+
+def assign_quantile_buckets(
+    factor_values: npt.ArrayLike,
+    n_quantiles: int,
+) -> npt.NDArray[np.float64]:
+    """Assign equal-frequency quantile numbers to every row of a panel.
+
+    Each row is split into ``min(n_quantiles, n_valid)`` buckets numbered
+    from 1 (lowest values). The bucket is derived from the value's rank and
+    equals the ``pd.qcut`` bucket computed in exact arithmetic (qcut itself
+    can flip values lying exactly on a bucket edge through rounding). Tied
+    values always share a bucket, so rows whose tied values would produce
+    duplicate qcut edges are still bucketed.
+
+    Parameters
+    ----------
+    factor_values : npt.ArrayLike
+        Factor panel, shape (..., dates, symbols).
+    n_quantiles : int
+        Number of quantiles.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Quantile numbers as floats; NaN for missing values and for rows
+        with fewer than two valid values.
+
+    Examples
+    --------
+    >>> assign_quantile_buckets([[0.1, 0.4, 0.2, np.nan, 0.3]], n_quantiles=2)
+    array([[ 1.,  2.,  1., nan,  2.]])
+    """
+    values = np.asarray(factor_values, dtype=np.float64)
+    # Lowest position of each value, so ties land in the qcut bucket of the tie
+    position = rank_cross_section(values, method="min") - 1.0
+    n_valid = (~np.isnan(values)).sum(axis=-1, keepdims=True)
+    buckets_per_row = np.minimum(n_quantiles, n_valid)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        buckets = np.ceil(position * buckets_per_row / (n_valid - 1))
+    buckets = np.maximum(buckets, 1.0)
+    return np.where(n_valid >= 2, buckets, np.nan)
+
+
+def quantile_mean_returns(
+    quantile_assignments: npt.ArrayLike,
+    forward_returns: npt.ArrayLike,
+    n_quantiles: int,
+) -> npt.NDArray[np.float64]:
+    """Average forward returns per row and quantile with one keyed aggregation.
+
+    Every valid (row, quantile) pair is mapped to a single integer key and
+    summed with ``np.bincount``, which is a group-by over the whole panel.
+
+    Parameters
+    ----------
+    quantile_assignments : npt.ArrayLike
+        Quantile numbers 1..n_quantiles, shape (..., dates, symbols).
+        NaN and values outside that range are ignored.
+    forward_returns : npt.ArrayLike
+        Forward returns, broadcastable to ``quantile_assignments``.
+    n_quantiles : int
+        Number of quantiles.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Mean return per quantile, shape (..., dates, n_quantiles). NaN where
+        a quantile has no symbol with a return on that date.
+
+    Examples
+    --------
+    >>> quantile_mean_returns([[1.0, 2.0, 2.0]], [[0.01, 0.02, 0.04]], 2)
+    array([[0.01, 0.03]])
+    """
+    buckets = np.asarray(quantile_assignments, dtype=np.float64)
+    returns = np.asarray(forward_returns, dtype=np.float64)
+    buckets, returns = np.broadcast_arrays(buckets, returns)
+
+    row_shape = buckets.shape[:-1]
+    n_rows = int(np.prod(row_shape))
+    buckets = buckets.reshape(n_rows, -1)
+    returns = returns.reshape(n_rows, -1)
+
+    # Out-of-range buckets would spill into a neighbouring row's keys
+    in_range = (buckets >= 1) & (buckets < n_quantiles + 1)
+    observed = in_range & ~np.isnan(returns)
+    rows = np.nonzero(observed)[0]
+    keys = rows * n_quantiles + buckets[observed].astype(np.int64) - 1
+    size = n_rows * n_quantiles
+    totals = np.bincount(keys, weights=returns[observed], minlength=size)
+    counts = np.bincount(keys, minlength=size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.where(counts > 0, totals / counts, np.nan)
+    return means.reshape(*row_shape, n_quantiles)
+
+
+def _paired_ranks(
+    values: npt.NDArray[np.float64],
+    paired: npt.NDArray[np.bool_],
+    ranks: npt.NDArray[np.float64] | None,
+) -> npt.NDArray[np.float64]:
+    """Ranks of ``values`` among the paired symbols of each row."""
+    if ranks is None:
+        return rank_cross_section(np.where(paired, values, np.nan))
+
+    result = np.where(paired, np.broadcast_to(ranks, values.shape), np.nan)
+    # Rows where pairing dropped a valid value must be ranked again
+    dropped = (~np.isnan(values) & ~paired).any(axis=-1)
+    if dropped.any():
+        result[dropped] = rank_cross_section(np.where(paired, values, np.nan)[dropped])
+    return result
+
+
+def _is_constant(
+    values: npt.NDArray[np.float64], mask: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.bool_]:
+    """Whether the masked values of each row are all equal."""
+    high = np.where(mask, values, -np.inf).max(axis=-1, initial=-np.inf)
+    low = np.where(mask, values, np.inf).min(axis=-1, initial=np.inf)
+    return high <= low
+
+
+__all__ = [
+    "MIN_SYMBOLS_FOR_IC",
+    "assign_quantile_buckets",
+    "cross_sectional_ic",
+    "quantile_mean_returns",
+    "rank_cross_section",
+]
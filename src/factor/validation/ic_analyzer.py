@@ -13,8 +13,7 @@ from scipy import stats
 
 from factor.errors import InsufficientDataError, ValidationError
 
-# Minimum number of symbols required for IC calculation
-MIN_SYMBOLS_FOR_IC = 5
+from .cross_section import MIN_SYMBOLS_FOR_IC, CorrelationMethod, cross_sectional_ic
 
 
 def _get_logger() -> Any:
@@ -143,7 +142,7 @@ class ICAnalyzer:
                 value=method,
             )
 
-        self.method = method
+        self.method: CorrelationMethod = method
         logger.debug(
             "ICAnalyzer initialized",
             method=method,
@@ -225,6 +224,10 @@ class ICAnalyzer:
             t_stat = mean_ic / (std_ic / np.sqrt(n_periods))
             # Two-tailed t-test
             p_value = float(2 * (1 - stats.t.cdf(abs(t_stat), df=n_periods - 1)))
+        elif n_periods > 1 and std_ic == 0 and mean_ic != 0:
+            # Identical non-zero IC in every period: the limit of the t-test
+            t_stat = float(np.copysign(np.inf, mean_ic))
+            p_value = 0.0
         else:
             t_stat = float("nan")
             p_value = float("nan")
@@ -284,38 +287,16 @@ class ICAnalyzer:
             return_dates=len(forward_returns),
         )
 
-        # Find common dates
+        # Align on common dates and symbols; each date uses the symbols that
+        # have both a factor value and a return
         common_dates = factor_values.index.intersection(forward_returns.index)
-        ic_series = pd.Series(index=common_dates, dtype=float)
-
-        for date in common_dates:
-            factors = factor_values.loc[date].dropna()
-            returns = forward_returns.loc[date].dropna()
-
-            # Find common symbols
-            common_symbols = factors.index.intersection(returns.index)
-
-            if len(common_symbols) < MIN_SYMBOLS_FOR_IC:
-                ic_series.loc[date] = float("nan")
-                continue
-
-            f = factors.loc[common_symbols]
-            r = returns.loc[common_symbols]
-
-            # Check for constant values (would result in undefined correlation)
-            if f.std() == 0 or r.std() == 0:
-                ic_series.loc[date] = float("nan")
-                continue
-
-            # Compute correlation
-            if self.method == "spearman":
-                result = stats.spearmanr(f, r)
-                ic = float(result.statistic)
-            else:
-                result = stats.pearsonr(f, r)
-                ic = float(result.statistic)
-
-            ic_series.loc[date] = ic
+        common_symbols = factor_values.columns.intersection(forward_returns.columns)
+        ic_values = cross_sectional_ic(
+            factor_values.loc[common_dates, common_symbols].to_numpy(dtype=float),
+            forward_returns.loc[common_dates, common_symbols].to_numpy(dtype=float),
+            method=self.method,
+        )
+        ic_series = pd.Series(ic_values, index=common_dates, dtype=float)
 
         logger.debug(
             "IC series computed",
@@ -13,6 +13,7 @@ from scipy import stats
 
 from ..errors import InsufficientDataError, ValidationError
 from ..types import QuantileResult
+from .cross_section import assign_quantile_buckets, quantile_mean_returns
 
 
 def _get_logger() -> Any:
@@ -146,33 +147,13 @@ class QuantileAnalyzer:
             n_quantiles=self.n_quantiles,
         )
 
-        def _assign_quantile_row(row: pd.Series) -> pd.Series:
-            """Assign quantiles for a single row."""
-            valid = row.dropna()
-            if len(valid) < 2:
-                # Need at least 2 valid values to create quantiles
-                return pd.Series(np.nan, index=row.index)
-
-            # Use the minimum of n_quantiles and number of valid values
-            effective_n_quantiles = min(self.n_quantiles, len(valid))
-
-            try:
-                # Use qcut for equal-frequency binning
-                quantiles = pd.qcut(
-                    valid,
-                    q=effective_n_quantiles,
-                    labels=list(range(1, effective_n_quantiles + 1)),
-                    duplicates="drop",
-                )
-                result = pd.Series(np.nan, index=row.index)
-                result.loc[valid.index] = quantiles.astype(float)
-                return result
-            except ValueError:
-                # Handle edge cases where qcut fails
-                return pd.Series(np.nan, index=row.index)
-
-        result_df = cast(
-            "pd.DataFrame", factor_values.apply(_assign_quantile_row, axis=1)
+        # Rank-based equal-frequency buckets for every date at once
+        result_df = pd.DataFrame(
+            assign_quantile_buckets(
+                factor_values.to_numpy(dtype=float), self.n_quantiles
+            ),
+            index=factor_values.index,
+            columns=factor_values.columns,
         )
 
         logger.debug(
@@ -247,26 +228,18 @@ class QuantileAnalyzer:
                 field="columns",
             )
 
-        # Initialize result DataFrame
-        column_labels = pd.Index(list(range(1, self.n_quantiles + 1)))
+        # Mean return of each quantile at each date in one aggregation
+        aligned_returns = forward_returns[quantile_assignments.columns]
         result = pd.DataFrame(
+            quantile_mean_returns(
+                quantile_assignments.to_numpy(dtype=float),
+                aligned_returns.to_numpy(dtype=float),
+                self.n_quantiles,
+            ),
             index=forward_returns.index,
-            columns=column_labels,
-            dtype=float,
+            columns=pd.Index(list(range(1, self.n_quantiles + 1))),
         )
 
-        # Compute mean return for each quantile at each date
-        for date in forward_returns.index:
-            assignments = quantile_assignments.loc[date]
-            returns = forward_returns.loc[date]
-
-            for q in range(1, self.n_quantiles + 1):
-                stocks_in_quantile = assignments[assignments == q].index
-                common = stocks_in_quantile.intersection(returns.dropna().index)
-
-                if len(common) > 0:
-                    result.loc[date, q] = returns.loc[common].mean()
-
         logger.debug(
             "Quantile returns computed",
             result_shape=result.shape,
@@ -52,59 +52,113 @@ ScreenerFilter
     Filter conditions for the NASDAQ Stock Screener API
 """
 
-from .errors import (
-    BloombergConnectionError,
-    BloombergDataError,
-    BloombergError,
-    BloombergSessionError,
-    BloombergValidationError,
-    CacheError,
-    DataFetchError,
-    ErrorCode,
-    ExportError,
-    FREDError,
-    FREDFetchError,
-    FREDValidationError,
-    MarketError,
-    NasdaqAPIError,
-    NasdaqError,
-    NasdaqParseError,
-    NasdaqRateLimitError,
-    ValidationError,
-)
-from .etfcom import (
-    ETFComBlockedError,
-    ETFComError,
-    ETFComScrapingError,
-    ETFComTimeoutError,
-    FundamentalsCollector,
-    FundFlowsCollector,
-    TickerCollector,
-)
-from .export import DataExporter
-from .nasdaq import (
-    ScreenerCollector,
-    ScreenerFilter,
-)
-from .schema import (
-    CacheConfig,
-    DataSourceConfig,
-    DateRange,
-    EconomicDataMetadata,
-    ExportConfig,
-    MarketConfig,
-    StockDataMetadata,
-    validate_config,
-    validate_economic_metadata,
-    validate_stock_metadata,
-)
-from .types import (
-    AgentOutput,
-    AgentOutputMetadata,
-    AnalysisResult,
-    DataSource,
-    MarketDataResult,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .errors import (
+        BloombergConnectionError,
+        BloombergDataError,
+        BloombergError,
+        BloombergSessionError,
+        BloombergValidationError,
+        CacheError,
+        DataFetchError,
+        ErrorCode,
+        ExportError,
+        FREDError,
+        FREDFetchError,
+        FREDValidationError,
+        MarketError,
+        NasdaqAPIError,
+        NasdaqError,
+        NasdaqParseError,
+        NasdaqRateLimitError,
+        ValidationError,
+    )
+    from .etfcom import (
+        ETFComBlockedError,
+        ETFComError,
+        ETFComScrapingError,
+        ETFComTimeoutError,
+        FundamentalsCollector,
+        FundFlowsCollector,
+        TickerCollector,
+    )
+    from .export import DataExporter
+    from .nasdaq import (
+        ScreenerCollector,
+        ScreenerFilter,
+    )
+    from .schema import (
+        CacheConfig,
+        DataSourceConfig,
+        DateRange,
+        EconomicDataMetadata,
+        ExportConfig,
+        MarketConfig,
+        StockDataMetadata,
+        validate_config,
+        validate_economic_metadata,
+        validate_stock_metadata,
+    )
+    from .types import (
+        AgentOutput,
+        AgentOutputMetadata,
+        AnalysisResult,
+        DataSource,
+        MarketDataResult,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BloombergConnectionError": ".errors",
+    "BloombergDataError": ".errors",
+    "BloombergError": ".errors",
+    "BloombergSessionError": ".errors",
+    "BloombergValidationError": ".errors",
+    "CacheError": ".errors",
+    "DataFetchError": ".errors",
+    "ErrorCode": ".errors",
+    "ExportError": ".errors",
+    "FREDError": ".errors",
+    "FREDFetchError": ".errors",
+    "FREDValidationError": ".errors",
+    "MarketError": ".errors",
+    "NasdaqAPIError": ".errors",
+    "NasdaqError": ".errors",
+    "NasdaqParseError": ".errors",
+    "NasdaqRateLimitError": ".errors",
+    "ValidationError": ".errors",
+    "ETFComBlockedError": ".etfcom",
+    "ETFComError": ".etfcom",
+    "ETFComScrapingError": ".etfcom",
+    "ETFComTimeoutError": ".etfcom",
+    "FundamentalsCollector": ".etfcom",
+    "FundFlowsCollector": ".etfcom",
+    "TickerCollector": ".etfcom",
+    "DataExporter": ".export",
+    "ScreenerCollector": ".nasdaq",
+    "ScreenerFilter": ".nasdaq",
+    "CacheConfig": ".schema",
+    "DataSourceConfig": ".schema",
+    "DateRange": ".schema",
+    "EconomicDataMetadata": ".schema",
+    "ExportConfig": ".schema",
+    "MarketConfig": ".schema",
+    "StockDataMetadata": ".schema",
+    "validate_config": ".schema",
+    "validate_economic_metadata": ".schema",
+    "validate_stock_metadata": ".schema",
+    "AgentOutput": ".types",
+    "AgentOutputMetadata": ".types",
+    "AnalysisResult": ".types",
+    "DataSource": ".types",
+    "MarketDataResult": ".types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "AgentOutput",
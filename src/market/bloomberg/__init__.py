@@ -22,25 +22,51 @@ Example
 >>> results = fetcher.get_historical_data(options)
 """
 
-from market.bloomberg.fetcher import BloombergFetcher
-from market.bloomberg.types import (
-    BloombergDataResult,
-    BloombergFetchOptions,
-    DataSource,
-    FieldInfo,
-    IDType,
-    NewsStory,
-    OverrideOption,
-    Periodicity,
-)
-from market.errors import (
-    BloombergConnectionError,
-    BloombergDataError,
-    BloombergError,
-    BloombergSessionError,
-    BloombergValidationError,
-    ErrorCode,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from market.bloomberg.fetcher import BloombergFetcher
+    from market.bloomberg.types import (
+        BloombergDataResult,
+        BloombergFetchOptions,
+        DataSource,
+        FieldInfo,
+        IDType,
+        NewsStory,
+        OverrideOption,
+        Periodicity,
+    )
+    from market.errors import (
+        BloombergConnectionError,
+        BloombergDataError,
+        BloombergError,
+        BloombergSessionError,
+        BloombergValidationError,
+        ErrorCode,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BloombergFetcher": "market.bloomberg.fetcher",
+    "BloombergDataResult": "market.bloomberg.types",
+    "BloombergFetchOptions": "market.bloomberg.types",
+    "DataSource": "market.bloomberg.types",
+    "FieldInfo": "market.bloomberg.types",
+    "IDType": "market.bloomberg.types",
+    "NewsStory": "market.bloomberg.types",
+    "OverrideOption": "market.bloomberg.types",
+    "Periodicity": "market.bloomberg.types",
+    "BloombergConnectionError": "market.errors",
+    "BloombergDataError": "market.errors",
+    "BloombergError": "market.errors",
+    "BloombergSessionError": "market.errors",
+    "BloombergValidationError": "market.errors",
+    "ErrorCode": "market.errors",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BloombergConnectionError",
@@ -6,6 +6,7 @@ This module provides caching functionality for market data including:
 - generate_cache_key: Generate unique cache keys for market data
 - get_cache/reset_cache: Global cache instance management
 - create_persistent_cache: Create file-based persistent cache
+- BarStore: Range-aware OHLCV store that only fetches missing date ranges
 
 Public API
 ----------
@@ -27,26 +28,61 @@ DEFAULT_CACHE_DB_PATH
     Default path for persistent cache database
 PERSISTENT_CACHE_CONFIG
     Default persistent cache configuration
+BarStore
+    SQLite-based OHLCV store with per-series date-range coverage
+create_persistent_bar_store
+    Create a persistent file-based bar store
 """
 
-from .cache import (
-    DEFAULT_CACHE_CONFIG,
-    DEFAULT_CACHE_DB_PATH,
-    PERSISTENT_CACHE_CONFIG,
-    SQLiteCache,
-    create_persistent_cache,
-    generate_cache_key,
-    get_cache,
-    reset_cache,
-)
-from .types import CacheConfig
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bar_store import (
+        DEFAULT_BAR_STORE_DB_PATH,
+        BarStore,
+        create_persistent_bar_store,
+    )
+    from .cache import (
+        DEFAULT_CACHE_CONFIG,
+        DEFAULT_CACHE_DB_PATH,
+        PERSISTENT_CACHE_CONFIG,
+        SQLiteCache,
+        create_persistent_cache,
+        generate_cache_key,
+        get_cache,
+        reset_cache,
+    )
+    from .types import CacheConfig
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "DEFAULT_BAR_STORE_DB_PATH": ".bar_store",
+    "BarStore": ".bar_store",
+    "create_persistent_bar_store": ".bar_store",
+    "DEFAULT_CACHE_CONFIG": ".cache",
+    "DEFAULT_CACHE_DB_PATH": ".cache",
+    "PERSISTENT_CACHE_CONFIG": ".cache",
+    "SQLiteCache": ".cache",
+    "create_persistent_cache": ".cache",
+    "generate_cache_key": ".cache",
+    "get_cache": ".cache",
+    "reset_cache": ".cache",
+    "CacheConfig": ".types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "DEFAULT_BAR_STORE_DB_PATH",
     "DEFAULT_CACHE_CONFIG",
     "DEFAULT_CACHE_DB_PATH",
     "PERSISTENT_CACHE_CONFIG",
+    "BarStore",
     "CacheConfig",
     "SQLiteCache",
+    "create_persistent_bar_store",
     "create_persistent_cache",
     "generate_cache_key",
     "get_cache",
@@ -0,0 +1,705 @@
+"""Range-aware OHLCV bar store for market data.
+
+This module provides a SQLite-backed store that keeps OHLCV bars per
+(source, symbol, interval) together with the date ranges it already covers.
+Unlike the key/value ``SQLiteCache``, a request for any sub-range of the
+covered history is served locally, and only the missing gaps need to be
+fetched from the upstream API.
+
+Ranges are half-open ``[start, end)`` to match the ``end`` semantics of
+yfinance.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from market.errors import CacheError
+from utils_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default bar store database path (relative to project root)
+# bar_store.py is at src/market/cache/bar_store.py
+DEFAULT_BAR_STORE_DB_PATH = (
+    Path(__file__).parent.parent.parent.parent / "data" / "cache" / "market_bars.db"
+)
+
+# OHLCV columns persisted by the store
+BAR_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Timestamp format used for stored bars and coverage bounds
+_TS_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+type DateLike = datetime | pd.Timestamp | str
+type DateRange = tuple[pd.Timestamp, pd.Timestamp]
+
+
+def _to_timestamp(value: DateLike) -> pd.Timestamp:
+    """Convert a date-like value to a timezone-naive Timestamp.
+
+    Timezone-aware values keep their wall-clock time so that daily bars
+    stay on their exchange-local date.
+
+    Raises
+    ------
+    ValueError
+        If the value is missing or parses to NaT
+    """
+    ts = pd.Timestamp(value)
+    if not isinstance(ts, pd.Timestamp):
+        raise ValueError(f"Invalid date: {value!r}")
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts
+
+
+def _format_ts(ts: pd.Timestamp) -> str:
+    return ts.strftime(_TS_FORMAT)
+
+
+def merge_ranges(ranges: list[DateRange]) -> list[DateRange]:
+    """Merge overlapping or adjacent half-open ranges.
+
+    Parameters
+    ----------
+    ranges : list[DateRange]
+        Ranges as ``(start, end)`` tuples (end exclusive)
+
+    Returns
+    -------
+    list[DateRange]
+        Sorted, non-overlapping ranges
+
+    Examples
+    --------
+    >>> merge_ranges([
+    ...     (pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01")),
+    ...     (pd.Timestamp("2024-01-15"), pd.Timestamp("2024-03-01")),
+    ... ])
+    [(Timestamp('2024-01-01 00:00:00'), Timestamp('2024-03-01 00:00:00'))]
+    """
+    merged: list[DateRange] = []
+    for start, end in sorted(r for r in ranges if r[0] < r[1]):
+        if merged and start <= merged[-1][1]:
+            prev_start, prev_end = merged[-1]
+            merged[-1] = (prev_start, max(prev_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(target: DateRange, covered: list[DateRange]) -> list[DateRange]:
+    """Return the parts of ``target`` not included in ``covered``.
+
+    Parameters
+    ----------
+    target : DateRange
+        The requested ``(start, end)`` range (end exclusive)
+    covered : list[DateRange]
+        Ranges already available
+
+    Returns
+    -------
+    list[DateRange]
+        Missing sub-ranges of ``target`` in ascending order
+
+    Examples
+    --------
+    >>> subtract_ranges(
+    ...     (pd.Timestamp("2024-01-01"), pd.Timestamp("2024-12-31")),
+    ...     [(pd.Timestamp("2024-03-01"), pd.Timestamp("2024-06-01"))],
+    ... )
+    [(Timestamp('2024-01-01 00:00:00'), Timestamp('2024-03-01 00:00:00')),
+     (Timestamp('2024-06-01 00:00:00'), Timestamp('2024-12-31 00:00:00'))]
+    """
+    start, end = target
+    gaps: list[DateRange] = []
+    cursor = start
+    for cov_start, cov_end in merge_ranges(covered):
+        if cov_end <= cursor:
+            continue
+        if cov_start >= end:
+            break
+        if cov_start > cursor:
+            gaps.append((cursor, cov_start))
+        cursor = max(cursor, cov_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class BarStore:
+    """SQLite-backed OHLCV store with date-range coverage tracking.
+
+    Bars are stored per (source, symbol, interval). Each successful fetch
+    records the range it covered, so later requests can be split into
+    locally available data and missing gaps.
+
+    Parameters
+    ----------
+    db_path : str | Path | None
+        Path to the SQLite database file.
+        If None, an in-memory database is used.
+
+    Attributes
+    ----------
+    db_path : str
+        Path to the SQLite database (":memory:" for in-memory)
+
+    Examples
+    --------
+    >>> store = BarStore()
+    >>> store.missing_ranges("AAPL", "2020-01-01", "2025-01-01")
+    [(Timestamp('2020-01-01 00:00:00'), Timestamp('2025-01-01 00:00:00'))]
+    >>> store.write("AAPL", df, "2020-01-01", "2025-01-01")
+    >>> store.missing_ranges("AAPL", "2023-01-01", "2024-01-01")
+    []
+    >>> store.read("AAPL", "2023-01-01", "2024-01-01")
+    """
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        self.db_path = str(db_path) if db_path is not None else ":memory:"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        logger.debug("Initializing bar store", db_path=self.db_path)
+
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a thread-local database connection."""
+        if not hasattr(self._local, "connection") or self._local.connection is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                timeout=30.0,
+            )
+            conn.row_factory = sqlite3.Row
+            if self.db_path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+
+        return self._local.connection
+
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for database transactions.
+
+        Yields
+        ------
+        sqlite3.Connection
+            The database connection with an active transaction.
+
+        Raises
+        ------
+        CacheError
+            If the transaction fails.
+        """
+        conn = self._get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise CacheError(
+                f"Database transaction failed: {e}",
+                operation="transaction",
+                cause=e,
+            ) from e
+
+    def _init_db(self) -> None:
+        """Initialize the database schema."""
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS bars (
+                    source TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    interval TEXT NOT NULL,
+                    ts TEXT NOT NULL,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL,
+                    volume REAL,
+                    PRIMARY KEY (source, symbol, interval, ts)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS coverage (
+                    source TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    interval TEXT NOT NULL,
+                    start_ts TEXT NOT NULL,
+                    end_ts TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (source, symbol, interval, start_ts)
+                )
+            """)
+
+        logger.debug("Bar store database initialized")
+
+    def coverage(
+        self,
+        symbol: str,
+        *,
+        interval: str = "1d",
+        source: str = "yfinance",
+    ) -> list[DateRange]:
+        """Get the date ranges covered for a series.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol
+        interval : str
+            Data interval (default: "1d")
+        source : str
+            Data source (default: "yfinance")
+
+        Returns
+        -------
+        list[DateRange]
+            Sorted, non-overlapping ``(start, end)`` ranges (end exclusive)
+        """
+        try:
+            with self._transaction() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT start_ts, end_ts FROM coverage
+                    WHERE source = ? AND symbol = ? AND interval = ?
+                    ORDER BY start_ts
+                    """,
+                    (source, symbol.upper(), interval),
+                ).fetchall()
+        except CacheError:
+            raise
+        except Exception as e:
+            raise CacheError(
+                f"Failed to read coverage: {e}",
+                operation="coverage",
+                key=symbol,
+                cause=e,
+            ) from e
+
+        return [
+            (_to_timestamp(r["start_ts"]), _to_timestamp(r["end_ts"])) for r in rows
+        ]
+
+    def missing_ranges(
+        self,
+        symbol: str,
+        start: DateLike,
+        end: DateLike,
+        *,
+        interval: str = "1d",
+        source: str = "yfinance",
+    ) -> list[DateRange]:
+        """Get the sub-ranges of ``[start, end)`` that are not stored yet.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol
+        start : DateLike
+            Start of the requested range (inclusive)
+        end : DateLike
+            End of the requested range (exclusive)
+        interval : str
+            Data interval (default: "1d")
+        source : str
+            Data source (default: "yfinance")
+
+        Returns
+        -------
+        list[DateRange]
+            Gaps that must be fetched, in ascending order
+        """
+        target = (_to_timestamp(start), _to_timestamp(end))
+        if target[0] >= target[1]:
+            return []
+        gaps = subtract_ranges(
+            target, self.coverage(symbol, interval=interval, source=source)
+        )
+
+        logger.debug(
+            "Computed missing ranges",
+            symbol=symbol,
+            interval=interval,
+            gap_count=len(gaps),
+        )
+        return gaps
+
+    def read(
+        self,
+        symbol: str,
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        *,
+        interval: str = "1d",
+        source: str = "yfinance",
+    ) -> pd.DataFrame:
+        """Read stored bars for ``[start, end)``.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol
+        start : DateLike | None
+            Start of the range (inclusive). None reads from the first bar.
+        end : DateLike | None
+            End of the range (exclusive). None reads up to the last bar.
+        interval : str
+            Data interval (default: "1d")
+        source : str
+            Data source (default: "yfinance")
+
+        Returns
+        -------
+        pd.DataFrame
+            OHLCV DataFrame indexed by a DatetimeIndex, sorted by date
+        """
+        query = (
+            "SELECT ts, open, high, low, close, volume FROM bars "
+            "WHERE source = ? AND symbol = ? AND interval = ?"
+        )
+        params: list[Any] = [source, symbol.upper(), interval]
+        if start is not None:
+            query += " AND ts >= ?"
+            params.append(_format_ts(_to_timestamp(start)))
+        if end is not None:
+            query += " AND ts < ?"
+            params.append(_format_ts(_to_timestamp(end)))
+        query += " ORDER BY ts"
+
+        try:
+            with self._transaction() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except CacheError:
+            raise
+        except Exception as e:
+            raise CacheError(
+                f"Failed to read bars: {e}",
+                operation="read",
+                key=symbol,
+                cause=e,
+            ) from e
+
+        df = pd.DataFrame(
+            [tuple(r)[1:] for r in rows],
+            columns=pd.Index(BAR_COLUMNS),
+            index=pd.DatetimeIndex([r["ts"] for r in rows]),
+            dtype="float64",
+        )
+
+        logger.debug("Bars read from store", symbol=symbol, rows=len(df))
+        return df
+
+    def last_bar(
+        self,
+        symbol: str,
+        *,
+        interval: str = "1d",
+        source: str = "yfinance",
+    ) -> pd.Timestamp | None:
+        """Get the timestamp of the most recent stored bar.
+
+        Useful for incremental "append since last bar" updates.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol
+        interval : str
+            Data interval (default: "1d")
+        source : str
+            Data source (default: "yfinance")
+
+        Returns
+        -------
+        pd.Timestamp | None
+            Timestamp of the last bar, or None if nothing is stored
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                """
+                SELECT MAX(ts) AS last_ts FROM bars
+                WHERE source = ? AND symbol = ? AND interval = ?
+                """,
+                (source, symbol.upper(), interval),
+            ).fetchone()
+
+        if row is None or row["last_ts"] is None:
+            return None
+        return _to_timestamp(row["last_ts"])
+
+    def write(
+        self,
+        symbol: str,
+        data: pd.DataFrame,
+        start: DateLike,
+        end: DateLike,
+        *,
+        interval: str = "1d",
+        source: str = "yfinance",
+    ) -> int:
+        """Store bars and mark ``[start, end)`` as covered.
+
+        Existing bars with the same timestamp are replaced. Bars outside
+        ``[start, end)`` are stored as well but do not extend coverage.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol
+        data : pd.DataFrame
+            OHLCV data indexed by date (may be empty if the range has no bars)
+        start : DateLike
+            Start of the fetched range (inclusive)
+        end : DateLike
+            End of the fetched range (exclusive). Coverage is only recorded
+            when ``end`` is after ``start``.
+        interval : str
+            Data interval (default: "1d")
+        source : str
+            Data source (default: "yfinance")
+
+        Returns
+        -------
+        int
+            Number of bars written
+
+        Raises
+        ------
+        CacheError
+            If the write fails
+        """
+        sym = symbol.upper()
+        start_ts = _to_timestamp(start)
+        end_ts = _to_timestamp(end)
+
+        records: list[tuple[Any, ...]] = []
+        if not data.empty:
+            frame = data.reindex(columns=BAR_COLUMNS)
+            index = pd.DatetimeIndex(pd.to_datetime(frame.index))
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            values = frame.astype("float64").to_numpy()
+            for ts, row in zip(index, values, strict=True):
+                if pd.isna(ts):
+                    continue
+                records.append(
+                    (
+                        source,
+                        sym,
+                        interval,
+                        _format_ts(ts),
+                        *(None if pd.isna(v) else float(v) for v in row),
+                    )
+                )
+
+        try:
+            with self._lock, self._transaction() as conn:
+                if records:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO bars
+                        (source, symbol, interval, ts, open, high, low, close, volume)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        records,
+                    )
+                if start_ts < end_ts:
+                    self._add_coverage(
+                        conn,
+                        source=source,
+                        symbol=sym,
+                        interval=interval,
+                        start=start_ts,
+                        end=end_ts,
+                    )
+        except CacheError:
+            raise
+        except Exception as e:
+            logger.error("Bar store write failed", symbol=symbol, error=str(e))
+            raise CacheError(
+                f"Failed to write bars: {e}",
+                operation="write",
+                key=symbol,
+                cause=e,
+            ) from e
+
+        logger.debug(
+            "Bars written to store",
+            symbol=sym,
+            interval=interval,
+            rows=len(records),
+            start=str(start_ts),
+            end=str(end_ts),
+        )
+        return len(records)
+
+    def _add_coverage(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        source: str,
+        symbol: str,
+        interval: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> None:
+        """Merge a new range into the stored coverage of a series."""
+        rows = conn.execute(
+            """
+            SELECT start_ts, end_ts FROM coverage
+            WHERE source = ? AND symbol = ? AND interval = ?
+            """,
+            (source, symbol, interval),
+        ).fetchall()
+        existing = [
+            (_to_timestamp(r["start_ts"]), _to_timestamp(r["end_ts"])) for r in rows
+        ]
+        merged = merge_ranges([*existing, (start, end)])
+
+        now = datetime.now().isoformat()
+        conn.execute(
+            "DELETE FROM coverage WHERE source = ? AND symbol = ? AND interval = ?",
+            (source, symbol, interval),
+        )
+        conn.executemany(
+            """
+            INSERT INTO coverage
+            (source, symbol, interval, start_ts, end_ts, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (source, symbol, interval, _format_ts(s), _format_ts(e), now)
+                for s, e in merged
+            ],
+        )
+
+    def delete(
+        self,
+        symbol: str,
+        *,
+        interval: str | None = None,
+        source: str = "yfinance",
+    ) -> int:
+        """Delete stored bars and coverage for a symbol.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol
+        interval : str | None
+            Interval to delete. If None, all intervals are deleted.
+        source : str
+            Data source (default: "yfinance")
+
+        Returns
+        -------
+        int
+            Number of bars deleted
+        """
+        where = "source = ? AND symbol = ?"
+        params: list[Any] = [source, symbol.upper()]
+        if interval is not None:
+            where += " AND interval = ?"
+            params.append(interval)
+
+        with self._lock, self._transaction() as conn:
+            cursor = conn.execute(f"DELETE FROM bars WHERE {where}", params)
+            deleted = cursor.rowcount
+            conn.execute(f"DELETE FROM coverage WHERE {where}", params)
+
+        logger.debug("Bars deleted", symbol=symbol, interval=interval, count=deleted)
+        return deleted
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Number of stored bars, series and coverage ranges
+        """
+        with self._transaction() as conn:
+            bars = conn.execute("SELECT COUNT(*) AS count FROM bars").fetchone()
+            series = conn.execute(
+                "SELECT COUNT(*) AS count FROM "
+                "(SELECT DISTINCT source, symbol, interval FROM coverage)"
+            ).fetchone()
+            ranges = conn.execute("SELECT COUNT(*) AS count FROM coverage").fetchone()
+
+        return {
+            "total_bars": bars["count"],
+            "total_series": series["count"],
+            "coverage_ranges": ranges["count"],
+            "db_path": self.db_path,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if hasattr(self._local, "connection") and self._local.connection:
+            self._local.connection.close()
+            self._local.connection = None
+            logger.debug("Bar store connection closed")
+
+    def __enter__(self) -> "BarStore":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"BarStore(db_path={self.db_path!r})"
+
+
+def create_persistent_bar_store(db_path: str | Path | None = None) -> BarStore:
+    """Create a file-based bar store.
+
+    Parameters
+    ----------
+    db_path : str | Path | None
+        Path to the SQLite database file.
+        If None, uses the default path: data/cache/market_bars.db
+
+    Returns
+    -------
+    BarStore
+        A bar store with file-based storage
+
+    Examples
+    --------
+    >>> store = create_persistent_bar_store()
+    >>> fetcher = YFinanceFetcher(bar_store=store)
+    """
+    if db_path is None:
+        db_path = DEFAULT_BAR_STORE_DB_PATH
+
+    logger.info("Creating persistent bar store", db_path=str(db_path))
+    return BarStore(db_path)
+
+
+__all__ = [
+    "BAR_COLUMNS",
+    "DEFAULT_BAR_STORE_DB_PATH",
+    "BarStore",
+    "DateRange",
+    "create_persistent_bar_store",
+    "merge_ranges",
+    "subtract_ranges",
+]
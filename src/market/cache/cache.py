@@ -1,25 +1,24 @@
 """SQLite-based caching for market data.
 
 This module provides a persistent cache implementation using SQLite
-for storing fetched market data with TTL (time-to-live) support.
+for storing fetched market data with TTL (time-to-live) support and
+LRU/LFU eviction, built on the shared ``database.cache.CacheStore`` engine.
 """
 
 import hashlib
-import json
-import pickle  # nosec B403
 import sqlite3
 import threading
-from collections.abc import Generator
+from collections.abc import Iterable, Iterator, Mapping
 from contextlib import contextmanager
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-
+from database.cache import CacheStore, CacheStoreConfig
 from market.errors import CacheError
 from utils_core.logging import get_logger
 
+from .serializers import DateBound
 from .types import CacheConfig
 
 logger = get_logger(__name__)
@@ -94,8 +93,12 @@ def generate_cache_key(
 class SQLiteCache:
     """SQLite-based cache for market data.
 
-    Provides persistent caching with TTL support, automatic cleanup
-    of expired entries, and thread-safe operations.
+    A thin wrapper over the shared ``database.cache.CacheStore`` engine that
+    keeps the market cache API and converts storage failures into
+    ``market.errors.CacheError``. Entries expire after their TTL and, once
+    ``max_entries`` or ``max_bytes`` is exceeded, the least recently used
+    entries are evicted (least frequently used with
+    ``eviction_policy="lfu"``).
 
     Parameters
     ----------
@@ -117,82 +120,73 @@ class SQLiteCache:
     {'price': 150.0}
     """
 
+    namespace: str = "market"
+    """Namespace of the entries in the shared cache database."""
+
     def __init__(self, config: CacheConfig | None = None) -> None:
         self.config = config or DEFAULT_CACHE_CONFIG
         self.db_path = self.config.db_path or ":memory:"
-        self._local = threading.local()
-        self._lock = threading.Lock()
 
         logger.debug(
             "Initializing SQLite cache",
             db_path=self.db_path,
             ttl_seconds=self.config.ttl_seconds,
             max_entries=self.config.max_entries,
+            max_bytes=self.config.max_bytes,
         )
 
-        self._init_db()
-
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a thread-local database connection."""
-        if not hasattr(self._local, "connection") or self._local.connection is None:
-            if self.db_path != ":memory:":
-                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-
-            self._local.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                timeout=30.0,
+        try:
+            self._store = CacheStore(
+                CacheStoreConfig(
+                    db_path=self.config.db_path,
+                    namespace=self.namespace,
+                    ttl_seconds=self.config.ttl_seconds,
+                    max_entries=self.config.max_entries,
+                    max_bytes=self.config.max_bytes,
+                    eviction_policy=self.config.eviction_policy,
+                    dataframe_format=self.config.dataframe_format,
+                )
             )
-            self._local.connection.row_factory = sqlite3.Row
-
-        return self._local.connection
+        except sqlite3.Error as e:
+            raise CacheError(
+                f"Failed to initialize cache database: {e}",
+                operation="init",
+                cause=e,
+            ) from e
 
     @contextmanager
-    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database transactions.
+    def _errors(self, operation: str, key: str | None = None) -> Iterator[None]:
+        """Convert storage failures into ``CacheError``.
 
-        Yields
-        ------
-        sqlite3.Connection
-            The database connection with an active transaction.
+        Parameters
+        ----------
+        operation : str
+            Name of the cache operation, used in the error message
+        key : str | None
+            The cache key involved in the operation
 
         Raises
         ------
         CacheError
-            If the transaction fails.
+            If the wrapped block raises any exception other than CacheError.
         """
-        conn = self._get_connection()
         try:
-            yield conn
-            conn.commit()
-        except sqlite3.Error as e:
-            conn.rollback()
+            yield
+        except CacheError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Cache {operation} failed",
+                key=key[:16] + "..." if key else None,
+                error=str(e),
+            )
             raise CacheError(
-                f"Database transaction failed: {e}",
-                operation="transaction",
+                f"Failed to {operation} cache entry: {e}",
+                operation=operation,
+                key=key,
                 cause=e,
             ) from e
 
-    def _init_db(self) -> None:
-        """Initialize the database schema."""
-        with self._transaction() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value BLOB NOT NULL,
-                    value_type TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    expires_at TEXT NOT NULL,
-                    metadata TEXT
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_expires_at
-                ON cache (expires_at)
-            """)
-
-        logger.debug("Cache database initialized")
-
     def get(self, key: str) -> Any | None:
         """Get a value from the cache.
 
@@ -211,45 +205,64 @@ class SQLiteCache:
         >>> cache.get("nonexistent_key")
         None
         """
-        logger.debug("Cache get", key=key[:16] + "...")
+        with self._errors("get", key):
+            return self._store.get(key)
 
-        try:
-            with self._transaction() as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT value, value_type, expires_at
-                    FROM cache
-                    WHERE key = ?
-                    """,
-                    (key,),
-                )
-                row = cursor.fetchone()
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several values in a single transaction.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The cache keys
+
+        Returns
+        -------
+        dict[str, Any]
+            Cached values for the keys that were found and not expired
 
-                if row is None:
-                    logger.debug("Cache miss", key=key[:16] + "...")
-                    return None
+        Examples
+        --------
+        >>> cache.get_many(["AAPL", "MSFT"])
+        {'AAPL': ...}
+        """
+        with self._errors("get_many"):
+            return self._store.get_many(keys)
 
-                expires_at = datetime.fromisoformat(row["expires_at"])
-                if expires_at < datetime.now(UTC):
-                    logger.debug("Cache expired", key=key[:16] + "...")
-                    # Delete expired entry
-                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                    return None
+    def get_frame(
+        self,
+        key: str,
+        columns: list[str] | None = None,
+        start: DateBound = None,
+        end: DateBound = None,
+    ) -> Any | None:
+        """Get part of a cached DataFrame or Series.
 
-                value = self._deserialize(row["value"], row["value_type"])
-                logger.debug("Cache hit", key=key[:16] + "...")
-                return value
+        Entries stored in a columnar format decode only the requested
+        columns and rows; pickled entries are loaded in full and sliced.
 
-        except CacheError:
-            raise
-        except Exception as e:
-            logger.error("Cache get failed", key=key[:16] + "...", error=str(e))
-            raise CacheError(
-                f"Failed to get cache entry: {e}",
-                operation="get",
-                key=key,
-                cause=e,
-            ) from e
+        Parameters
+        ----------
+        key : str
+            The cache key
+        columns : list[str] | None
+            Columns to read (default: all columns)
+        start : DateBound
+            Inclusive lower bound on the DatetimeIndex (default: no bound)
+        end : DateBound
+            Inclusive upper bound on the DatetimeIndex (default: no bound)
+
+        Returns
+        -------
+        Any | None
+            The selected data, or None if not found or expired
+
+        Examples
+        --------
+        >>> cache.get_frame("AAPL_5y", columns=["close"], start="2024-01-01")
+        """
+        with self._errors("get_frame", key):
+            return self._store.get(key, columns=columns, start=start, end=end)
 
     def set(
         self,
@@ -275,64 +288,32 @@ class SQLiteCache:
         --------
         >>> cache.set("key1", {"data": [1, 2, 3]}, ttl=7200)
         """
-        if ttl is None:
-            ttl = self.config.ttl_seconds
+        with self._errors("set", key):
+            self._store.set(key, value, ttl=ttl, metadata=metadata)
 
-        logger.debug(
-            "Cache set",
-            key=key[:16] + "...",
-            ttl_seconds=ttl,
-            value_type=type(value).__name__,
-        )
-
-        try:
-            now = datetime.now(UTC)
-            expires_at = now + timedelta(seconds=ttl)
-            serialized, value_type = self._serialize(value)
-            metadata_json = json.dumps(metadata) if metadata else None
-
-            with self._lock, self._transaction() as conn:
-                # Check entry count and cleanup if needed
-                cursor = conn.execute("SELECT COUNT(*) as count FROM cache")
-                count = cursor.fetchone()["count"]
-
-                if count >= self.config.max_entries:
-                    logger.debug(
-                        "Max entries reached, cleaning up",
-                        current=count,
-                        max=self.config.max_entries,
-                    )
-                    self._cleanup_oldest(conn, count - self.config.max_entries + 1)
-
-                # Insert or replace the entry
-                conn.execute(
-                    """
-                        INSERT OR REPLACE INTO cache
-                        (key, value, value_type, created_at, expires_at, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                    (
-                        key,
-                        serialized,
-                        value_type,
-                        now.isoformat(),
-                        expires_at.isoformat(),
-                        metadata_json,
-                    ),
-                )
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: int | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Set several values in a single transaction.
 
-            logger.debug("Cache entry stored", key=key[:16] + "...")
+        Parameters
+        ----------
+        items : Mapping[str, Any]
+            Cache keys and values
+        ttl : int | None
+            Time-to-live in seconds. Uses config.ttl_seconds if not specified.
+        metadata : dict[str, Any] | None
+            Optional metadata to store with every entry
 
-        except CacheError:
-            raise
-        except Exception as e:
-            logger.error("Cache set failed", key=key[:16] + "...", error=str(e))
-            raise CacheError(
-                f"Failed to set cache entry: {e}",
-                operation="set",
-                key=key,
-                cause=e,
-            ) from e
+        Examples
+        --------
+        >>> cache.set_many({"AAPL": df_aapl, "MSFT": df_msft})
+        """
+        with self._errors("set_many"):
+            self._store.set_many(items, ttl=ttl, metadata=metadata)
 
     def delete(self, key: str) -> bool:
         """Delete an entry from the cache.
@@ -352,28 +333,8 @@ class SQLiteCache:
         >>> cache.delete("key1")
         True
         """
-        logger.debug("Cache delete", key=key[:16] + "...")
-
-        try:
-            with self._transaction() as conn:
-                cursor = conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                deleted = cursor.rowcount > 0
-
-            if deleted:
-                logger.debug("Cache entry deleted", key=key[:16] + "...")
-            else:
-                logger.debug("Cache entry not found", key=key[:16] + "...")
-
-            return deleted
-
-        except Exception as e:
-            logger.error("Cache delete failed", key=key[:16] + "...", error=str(e))
-            raise CacheError(
-                f"Failed to delete cache entry: {e}",
-                operation="delete",
-                key=key,
-                cause=e,
-            ) from e
+        with self._errors("delete", key):
+            return self._store.delete(key)
 
     def clear(self) -> int:
         """Clear all entries from the cache.
@@ -388,24 +349,8 @@ class SQLiteCache:
         >>> cache.clear()
         5
         """
-        logger.info("Clearing cache")
-
-        try:
-            with self._lock, self._transaction() as conn:
-                cursor = conn.execute("SELECT COUNT(*) as count FROM cache")
-                count = cursor.fetchone()["count"]
-                conn.execute("DELETE FROM cache")
-
-            logger.info("Cache cleared", entries_removed=count)
-            return count
-
-        except Exception as e:
-            logger.error("Cache clear failed", error=str(e))
-            raise CacheError(
-                f"Failed to clear cache: {e}",
-                operation="clear",
-                cause=e,
-            ) from e
+        with self._errors("clear"):
+            return self._store.clear()
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries from the cache.
@@ -420,68 +365,8 @@ class SQLiteCache:
         >>> cache.cleanup_expired()
         3
         """
-        logger.debug("Cleaning up expired cache entries")
-
-        try:
-            now = datetime.now(UTC).isoformat()
-
-            with self._lock, self._transaction() as conn:
-                cursor = conn.execute(
-                    "SELECT COUNT(*) as count FROM cache WHERE expires_at < ?",
-                    (now,),
-                )
-                expired_count = cursor.fetchone()["count"]
-
-                if expired_count > 0:
-                    conn.execute(
-                        "DELETE FROM cache WHERE expires_at < ?",
-                        (now,),
-                    )
-
-            logger.debug("Expired entries cleaned up", count=expired_count)
-            return expired_count
-
-        except Exception as e:
-            logger.error("Cache cleanup failed", error=str(e))
-            raise CacheError(
-                f"Failed to cleanup expired entries: {e}",
-                operation="cleanup_expired",
-                cause=e,
-            ) from e
-
-    def _cleanup_oldest(self, conn: sqlite3.Connection, count: int) -> None:
-        """Remove the oldest entries to make room for new ones."""
-        conn.execute(
-            """
-            DELETE FROM cache
-            WHERE key IN (
-                SELECT key FROM cache
-                ORDER BY created_at ASC
-                LIMIT ?
-            )
-            """,
-            (count,),
-        )
-
-    def _serialize(self, value: Any) -> tuple[bytes, str]:
-        """Serialize a value for storage."""
-        if isinstance(value, pd.DataFrame):
-            return pickle.dumps(value), "dataframe"
-        elif isinstance(value, pd.Series):
-            return pickle.dumps(value), "series"
-        elif isinstance(value, (dict, list)):
-            return json.dumps(value).encode(), "json"
-        else:
-            return pickle.dumps(value), "pickle"
-
-    def _deserialize(self, data: bytes, value_type: str) -> Any:
-        """Deserialize a stored value."""
-        if value_type in ("dataframe", "series", "pickle"):
-            return pickle.loads(data)  # nosec B301
-        elif value_type == "json":
-            return json.loads(data.decode())
-        else:
-            return pickle.loads(data)  # nosec B301
+        with self._errors("cleanup_expired"):
+            return self._store.cleanup_expired()
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -489,7 +374,8 @@ class SQLiteCache:
         Returns
         -------
         dict[str, Any]
-            Cache statistics including entry count, size, etc.
+            Cache statistics including entry counts, stored bytes and
+            hit/miss/eviction counters
 
         Examples
         --------
@@ -497,37 +383,30 @@ class SQLiteCache:
         {'total_entries': 10, 'expired_entries': 2, ...}
         """
         try:
-            now = datetime.now(UTC).isoformat()
-
-            with self._transaction() as conn:
-                cursor = conn.execute("SELECT COUNT(*) as count FROM cache")
-                total = cursor.fetchone()["count"]
-
-                cursor = conn.execute(
-                    "SELECT COUNT(*) as count FROM cache WHERE expires_at < ?",
-                    (now,),
-                )
-                expired = cursor.fetchone()["count"]
-
-            return {
-                "total_entries": total,
-                "expired_entries": expired,
-                "active_entries": total - expired,
-                "max_entries": self.config.max_entries,
-                "ttl_seconds": self.config.ttl_seconds,
-                "db_path": self.db_path,
-            }
-
+            stats = self._store.stats()
         except Exception as e:
             logger.error("Failed to get cache stats", error=str(e))
             return {"error": str(e)}
 
+        return {
+            "total_entries": stats.entries,
+            "expired_entries": stats.expired_entries,
+            "active_entries": stats.entries - stats.expired_entries,
+            "total_bytes": stats.total_bytes,
+            "max_entries": self.config.max_entries,
+            "max_bytes": self.config.max_bytes,
+            "ttl_seconds": self.config.ttl_seconds,
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "evictions": stats.evictions,
+            "hit_rate": stats.hit_rate,
+            "db_path": self.db_path,
+        }
+
     def close(self) -> None:
         """Close the database connection."""
-        if hasattr(self._local, "connection") and self._local.connection:
-            self._local.connection.close()
-            self._local.connection = None
-            logger.debug("Cache connection closed")
+        self._store.close()
+        logger.debug("Cache connection closed")
 
     def __enter__(self) -> "SQLiteCache":
         return self
@@ -590,6 +469,7 @@ def create_persistent_cache(
     db_path: str | Path | None = None,
     ttl_seconds: int = 86400,
     max_entries: int = 10000,
+    max_bytes: int | None = None,
 ) -> SQLiteCache:
     """Create a persistent file-based cache.
 
@@ -605,6 +485,8 @@ def create_persistent_cache(
         Time-to-live for cache entries in seconds (default: 86400 = 24 hours)
     max_entries : int
         Maximum number of cache entries (default: 10000)
+    max_bytes : int | None
+        Maximum total size of cached values in bytes (default: no limit)
 
     Returns
     -------
@@ -625,6 +507,7 @@ def create_persistent_cache(
         enabled=True,
         ttl_seconds=ttl_seconds,
         max_entries=max_entries,
+        max_bytes=max_bytes,
         db_path=str(db_path),
     )
 
@@ -633,6 +516,7 @@ def create_persistent_cache(
         db_path=str(db_path),
         ttl_seconds=ttl_seconds,
         max_entries=max_entries,
+        max_bytes=max_bytes,
     )
 
     return SQLiteCache(config)
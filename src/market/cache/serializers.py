@@ -0,0 +1,27 @@
+"""Value serializers for the market SQLite caches.
+
+The implementation lives in ``database.cache.serializers`` so that every
+package shares the same codecs; this module re-exports it.
+"""
+
+from database.cache.serializers import (
+    DATAFRAME_FORMATS,
+    ArrowIPCCodec,
+    DataFrameFormat,
+    DateBound,
+    ParquetCodec,
+    TabularCodec,
+    deserialize_value,
+    serialize_value,
+)
+
+__all__ = [
+    "DATAFRAME_FORMATS",
+    "ArrowIPCCodec",
+    "DataFrameFormat",
+    "DateBound",
+    "ParquetCodec",
+    "TabularCodec",
+    "deserialize_value",
+    "serialize_value",
+]
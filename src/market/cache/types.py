@@ -6,6 +6,8 @@ This module provides type definitions for cache operations including:
 
 from dataclasses import dataclass
 
+from database.cache import EvictionPolicy
+
 __all__ = [
     "CacheConfig",
 ]
@@ -31,6 +33,15 @@ class CacheConfig:
     db_path : str | None
         Path to SQLite database file (default: None, uses in-memory).
         When None, an in-memory SQLite database is used.
+    dataframe_format : str
+        Storage format for DataFrame/Series values: "parquet" (default,
+        zstd-compressed), "arrow" (Arrow IPC) or "pickle".
+    max_bytes : int | None
+        Maximum total size of cached values in bytes (default: None, no
+        limit). Must be positive when set.
+    eviction_policy : EvictionPolicy
+        Which entries to evict when a budget is exceeded: "lru" (default,
+        least recently used) or "lfu" (least frequently used).
 
     Examples
     --------
@@ -58,6 +69,9 @@ class CacheConfig:
     ttl_seconds: int = 3600
     max_entries: int = 1000
     db_path: str | None = None
+    dataframe_format: str = "parquet"
+    max_bytes: int | None = None
+    eviction_policy: EvictionPolicy = "lru"
 
     def __post_init__(self) -> None:
         """Validate configuration values after initialization.
@@ -65,9 +79,21 @@ class CacheConfig:
         Raises
         ------
         ValueError
-            If ttl_seconds or max_entries is not positive
+            If ttl_seconds, max_entries or max_bytes is not positive, or
+            dataframe_format or eviction_policy is not supported
         """
         if self.ttl_seconds <= 0:
             raise ValueError(f"ttl_seconds must be positive, got {self.ttl_seconds}")
         if self.max_entries <= 0:
             raise ValueError(f"max_entries must be positive, got {self.max_entries}")
+        if self.max_bytes is not None and self.max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {self.max_bytes}")
+        if self.eviction_policy not in ("lru", "lfu"):
+            raise ValueError(
+                f"eviction_policy must be 'lru' or 'lfu', got {self.eviction_policy!r}"
+            )
+        if self.dataframe_format not in ("parquet", "arrow", "pickle"):
+            raise ValueError(
+                "dataframe_format must be 'parquet', 'arrow' or 'pickle', "
+                f"got {self.dataframe_format!r}"
+            )
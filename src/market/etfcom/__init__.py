@@ -61,29 +61,57 @@ Examples
 ...     response = session.get_with_retry("https://www.etf.com/SPY")
 """
 
-from market.etfcom.collectors import (
-    FundamentalsCollector,
-    FundFlowsCollector,
-    HistoricalFundFlowsCollector,
-    TickerCollector,
-)
-from market.etfcom.errors import (
-    ETFComAPIError,
-    ETFComBlockedError,
-    ETFComError,
-    ETFComScrapingError,
-    ETFComTimeoutError,
-)
-from market.etfcom.session import ETFComSession
-from market.etfcom.types import (
-    ETFRecord,
-    FundamentalsRecord,
-    FundFlowRecord,
-    HistoricalFundFlowRecord,
-    RetryConfig,
-    ScrapingConfig,
-    TickerInfo,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from market.etfcom.collectors import (
+        FundamentalsCollector,
+        FundFlowsCollector,
+        HistoricalFundFlowsCollector,
+        TickerCollector,
+    )
+    from market.etfcom.errors import (
+        ETFComAPIError,
+        ETFComBlockedError,
+        ETFComError,
+        ETFComScrapingError,
+        ETFComTimeoutError,
+    )
+    from market.etfcom.session import ETFComSession
+    from market.etfcom.types import (
+        ETFRecord,
+        FundamentalsRecord,
+        FundFlowRecord,
+        HistoricalFundFlowRecord,
+        RetryConfig,
+        ScrapingConfig,
+        TickerInfo,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "FundamentalsCollector": "market.etfcom.collectors",
+    "FundFlowsCollector": "market.etfcom.collectors",
+    "HistoricalFundFlowsCollector": "market.etfcom.collectors",
+    "TickerCollector": "market.etfcom.collectors",
+    "ETFComAPIError": "market.etfcom.errors",
+    "ETFComBlockedError": "market.etfcom.errors",
+    "ETFComError": "market.etfcom.errors",
+    "ETFComScrapingError": "market.etfcom.errors",
+    "ETFComTimeoutError": "market.etfcom.errors",
+    "ETFComSession": "market.etfcom.session",
+    "ETFRecord": "market.etfcom.types",
+    "FundamentalsRecord": "market.etfcom.types",
+    "FundFlowRecord": "market.etfcom.types",
+    "HistoricalFundFlowRecord": "market.etfcom.types",
+    "RetryConfig": "market.etfcom.types",
+    "ScrapingConfig": "market.etfcom.types",
+    "TickerInfo": "market.etfcom.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "ETFComAPIError",
@@ -41,6 +41,7 @@ from __future__ import annotations
 import asyncio
 import random
 from typing import Any
+from urllib.parse import urlparse
 
 from market.etfcom.constants import (
     COOKIE_CONSENT_SELECTOR,
@@ -52,6 +53,7 @@ from market.etfcom.constants import (
 from market.etfcom.errors import ETFComTimeoutError
 from market.etfcom.types import RetryConfig, ScrapingConfig
 from utils_core.logging import get_logger
+from utils_core.rate_limit import RateScheduler, get_rate_scheduler
 
 logger = get_logger(__name__)
 
@@ -111,6 +113,8 @@ class ETFComBrowserMixin:
         The current stealth browser context (None until created).
     _user_agents : list[str]
         User-Agent strings for rotation.
+    _scheduler : RateScheduler
+        Per-host request scheduler applying the polite delay.
 
     Examples
     --------
@@ -127,6 +131,7 @@ class ETFComBrowserMixin:
         self,
         config: ScrapingConfig | None = None,
         retry_config: RetryConfig | None = None,
+        scheduler: RateScheduler | None = None,
     ) -> None:
         """Initialize ETFComBrowserMixin with configuration.
 
@@ -136,9 +141,13 @@ class ETFComBrowserMixin:
             Scraping configuration. Defaults to ``ScrapingConfig()``.
         retry_config : RetryConfig | None
             Retry configuration. Defaults to ``RetryConfig()``.
+        scheduler : RateScheduler | None
+            Request scheduler shared with ``ETFComSession``. Defaults to
+            ``get_rate_scheduler()``.
         """
         self._config: ScrapingConfig = config or ScrapingConfig()
         self._retry_config: RetryConfig = retry_config or RetryConfig()
+        self._scheduler: RateScheduler = scheduler or get_rate_scheduler()
 
         # Resolve user agents: use config value or fall back to defaults
         self._user_agents: list[str] = (
@@ -295,11 +304,13 @@ class ETFComBrowserMixin:
         ETFComTimeoutError
             If the page load exceeds the configured timeout.
         """
-        # Apply polite delay
-        delay = self._config.polite_delay + random.uniform(  # nosec B311
+        # Apply polite delay (residual wait on the shared per-host schedule)
+        interval = self._config.polite_delay + random.uniform(  # nosec B311
             0, self._config.delay_jitter
         )
-        await asyncio.sleep(delay)
+        delay = await self._scheduler.acquire_async(
+            urlparse(url).netloc, interval=interval, burst=self._config.burst
+        )
         logger.debug("Polite delay applied", delay_seconds=delay, url=url)
 
         # Create stealth context and page
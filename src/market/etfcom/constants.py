@@ -90,6 +90,15 @@ Adds randomness to request timing to appear more human-like.
 The actual delay is ``DEFAULT_POLITE_DELAY + random(0, DEFAULT_DELAY_JITTER)``.
 """
 
+DEFAULT_BURST: Final[int] = 1
+"""Default number of requests allowed back to back after an idle period.
+
+Requests to the ETF.com host are scheduled through the shared
+``utils_core.rate_limit`` scheduler, which waits only for the remainder of
+the polite delay since the previous request. A burst of 1 keeps every pair
+of consecutive requests at least one polite delay apart.
+"""
+
 DEFAULT_TIMEOUT: Final[float] = 30.0
 """Default HTTP request timeout in seconds.
 
@@ -311,6 +320,7 @@ __all__ = [
     "BROWSER_IMPERSONATE_TARGETS",
     "CLASSIFICATION_DATA_ID",
     "COOKIE_CONSENT_SELECTOR",
+    "DEFAULT_BURST",
     "DEFAULT_DELAY_JITTER",
     "DEFAULT_HEADERS",
     "DEFAULT_MAX_CONCURRENCY",
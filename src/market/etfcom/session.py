@@ -49,6 +49,7 @@ market.etfcom.errors : ETFComBlockedError for bot-block detection.
 import random
 import time
 from typing import Any, cast
+from urllib.parse import urlparse
 
 from curl_cffi import requests as curl_requests
 from curl_cffi.requests import BrowserTypeLiteral, HttpMethod
@@ -63,6 +64,7 @@ from market.etfcom.constants import (
 from market.etfcom.errors import ETFComBlockedError
 from market.etfcom.types import RetryConfig, ScrapingConfig
 from utils_core.logging import get_logger
+from utils_core.rate_limit import RateScheduler, get_rate_scheduler
 
 logger = get_logger(__name__)
 
@@ -84,6 +86,9 @@ class ETFComSession:
         Scraping configuration. If None, defaults are used.
     retry_config : RetryConfig | None
         Retry configuration. If None, defaults are used.
+    scheduler : RateScheduler | None
+        Request scheduler. If None, the process-wide scheduler shared by
+        all sessions is used.
 
     Attributes
     ----------
@@ -95,6 +100,8 @@ class ETFComSession:
         The underlying curl_cffi session instance.
     _user_agents : list[str]
         User-Agent strings for rotation.
+    _scheduler : RateScheduler
+        Per-host request scheduler applying the polite delay.
 
     Examples
     --------
@@ -110,6 +117,7 @@ class ETFComSession:
         self,
         config: ScrapingConfig | None = None,
         retry_config: RetryConfig | None = None,
+        scheduler: RateScheduler | None = None,
     ) -> None:
         """Initialize ETFComSession with configuration.
 
@@ -119,9 +127,12 @@ class ETFComSession:
             Scraping configuration. Defaults to ``ScrapingConfig()``.
         retry_config : RetryConfig | None
             Retry configuration. Defaults to ``RetryConfig()``.
+        scheduler : RateScheduler | None
+            Request scheduler. Defaults to ``get_rate_scheduler()``.
         """
         self._config: ScrapingConfig = config or ScrapingConfig()
         self._retry_config: RetryConfig = retry_config or RetryConfig()
+        self._scheduler: RateScheduler = scheduler or get_rate_scheduler()
 
         # Resolve user agents: use config value or fall back to defaults
         self._user_agents: list[str] = (
@@ -152,7 +163,9 @@ class ETFComSession:
         This is the shared implementation for ``get()`` and ``post()``.
         Applies the following before each request:
 
-        1. Polite delay (``config.polite_delay`` + random jitter)
+        1. Polite delay (``config.polite_delay`` + random jitter), waiting
+           only for the part of it not yet elapsed since the previous
+           request to the same host from any session
         2. Random User-Agent header selection
         3. Referer header set to ``ETFCOM_BASE_URL``
         4. Default browser-like headers from ``DEFAULT_HEADERS``
@@ -180,11 +193,13 @@ class ETFComSession:
         ETFComBlockedError
             If the response status code is 403 or 429.
         """
-        # 1. Apply polite delay
-        delay = self._config.polite_delay + random.uniform(  # nosec B311
+        # 1. Apply polite delay (residual wait on the shared per-host schedule)
+        interval = self._config.polite_delay + random.uniform(  # nosec B311
             0, self._config.delay_jitter
         )
-        time.sleep(delay)
+        delay = self._scheduler.acquire(
+            urlparse(url).netloc, interval=interval, burst=self._config.burst
+        )
         logger.debug("Polite delay applied", delay_seconds=delay, url=url)
 
         # 2. Build headers with User-Agent rotation and Referer
@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from datetime import date
 
 from market.etfcom.constants import (
+    DEFAULT_BURST,
     DEFAULT_DELAY_JITTER,
     DEFAULT_POLITE_DELAY,
     DEFAULT_STABILITY_WAIT,
@@ -68,6 +69,9 @@ class ScrapingConfig:
     max_page_retries : int
         Maximum number of page-level retries for scraping operations
         (default: 5).
+    burst : int
+        Number of requests allowed back to back after an idle period
+        (default: ``DEFAULT_BURST`` = 1).
 
     Examples
     --------
@@ -84,6 +88,7 @@ class ScrapingConfig:
     headless: bool = True
     stability_wait: float = DEFAULT_STABILITY_WAIT
     max_page_retries: int = 5
+    burst: int = DEFAULT_BURST
 
 
 @dataclass(frozen=True)
@@ -7,7 +7,19 @@ This module provides data export functionality including:
 - AI agent-optimized JSON output
 """
 
-from .exporter import DataExporter
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .exporter import DataExporter
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "DataExporter": ".exporter",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "DataExporter",
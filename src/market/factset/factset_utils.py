@@ -731,26 +731,101 @@ def format_factset_downloaded_data(
 
 
 # ============================================================================================
-def store_to_database(
+# 一括UPSERT(一時テーブル + 集合演算の INSERT ... ON CONFLICT)
+# ============================================================================================
+_LONG_TABLE_COLUMNS = ["date", "P_SYMBOL", "variable", "value"]
+_DUPLICATE_MODES = ("skip", "update")
+_UPSERT_METHODS = ("auto", "upsert", "delete_insert")
+
+
+@dataclass(frozen=True)
+class UpsertResult:
+    """一括UPSERTの結果を格納するデータクラス。
+
+    Attributes:
+        inserted (int): 新規に追加された行数。
+        updated (int): 既存キーと重複し、上書きされた行数。
+        skipped (int): 既存キーと重複し、スキップされた行数。
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+    @property
+    def written(self) -> int:
+        """書き込まれた行数(追加 + 上書き)。"""
+        return self.inserted + self.updated
+
+
+def apply_write_pragmas(conn: sqlite3.Connection) -> None:
+    """
+    一括書き込み向けのPRAGMAを接続に設定する。
+
+    - journal_mode=WAL: 読み込みと書き込みの並行性を確保
+    - synchronous=NORMAL: WALモードでは安全なままfsync回数を削減
+    - temp_store=MEMORY: ステージング用の一時テーブルをメモリに配置
+
+    ジャーナルモードはトランザクション中に変更できないため、その場合はWAL設定を省略する。
+
+    :param conn: データベース接続
+    """
+    if not conn.in_transaction:
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+
+def _to_sql_rows(df: pd.DataFrame, columns: list[str]) -> list[tuple]:
+    """DataFrameをSQLiteに渡すタプルのリストに変換する(日時はTEXT、欠損値はNULL)。"""
+    df_sql = df[columns].copy()
+    for col in columns:
+        if pd.api.types.is_datetime64_any_dtype(df_sql[col]):
+            # DataFrame.to_sql と同じ形式で保存し、既存行のキーと一致させる
+            df_sql[col] = df_sql[col].dt.strftime("%Y-%m-%d %H:%M:%S")
+    df_sql = df_sql.astype(object).where(df_sql.notna(), None)
+    return list(df_sql.itertuples(index=False, name=None))
+
+
+def bulk_upsert(
+    conn: sqlite3.Connection,
     df: pd.DataFrame,
-    db_path: Path,
     table_name: str,
     unique_cols: list[str] | None = None,
-    verbose: bool = True,
-    on_duplicate: str = "skip",  # "skip" または "update"
-):
+    *,
+    on_duplicate: str = "update",
+    method: str = "auto",
+) -> UpsertResult:
     """
-    Pandas DataFrameをSQLiteデータベースに書き込む。
+    ロング形式のDataFrameを一時テーブル経由で一括UPSERTする。
+
+    バッチを一時テーブルにステージングし、1トランザクション内で集合演算の
+    ``INSERT ... ON CONFLICT DO UPDATE``(skip時は ``DO NOTHING``)を1回実行する。
+    既存キーとの照合は主キーインデックスで行うため、コストはテーブル全体ではなく
+    バッチサイズに比例する。
 
     Args:
-        df (pd.DataFrame): 書き込みたいデータフレーム(date, P_SYMBOL, value, variable のカラムを持つ)。
-        db_path (str): 接続するSQLiteデータベースのファイルパス。
-        table_name (str): 書き込み先のテーブル名。
-        unique_cols ([str]): 一意性をチェックするカラム
-        on_duplicate (str): 重複時の動作 - "skip" (スキップ) または "update" (上書き)
+        conn (sqlite3.Connection): データベース接続。
+        df (pd.DataFrame): 書き込むデータ(date, P_SYMBOL, variable, value のカラムを持つ)。
+        table_name (str): 書き込み先のテーブル名(存在しない場合は作成)。
+        unique_cols ([str]): 一意性をチェックするカラム。
+        on_duplicate (str): 重複時の動作 - "skip" (スキップ) または "update" (上書き)。
+        method (str): 書き込み方法 ("auto", "upsert", "delete_insert")
+            - "auto"/"upsert": ON CONFLICT を使用(一意制約がない場合は delete_insert)
+            - "delete_insert": 集合演算の DELETE + INSERT 方式
+
+    Returns:
+        UpsertResult: 追加・上書き・スキップされた行数。
+
+    Raises:
+        ValueError: on_duplicate, method, テーブル名またはカラム名が不正な場合。
     """
     if unique_cols is None:
         unique_cols = ["date", "P_SYMBOL", "variable"]
+    if on_duplicate not in _DUPLICATE_MODES:
+        raise ValueError(f"不正なon_duplicate: {on_duplicate}")
+    if method not in _UPSERT_METHODS:
+        raise ValueError(f"不正なmethod: {method}")
 
     # 必須カラムのチェック
     if not all(col in df.columns for col in unique_cols):
@@ -758,114 +833,182 @@ def store_to_database(
             f"データフレームには必須のカラム {unique_cols} の全てが含まれている必要があります。"
         )
 
-    # テーブル名とカラム名のバリデーション（SQLインジェクション対策）
+    # テーブル名とカラム名のバリデーション(SQLインジェクション対策)
     _validate_sql_identifier(table_name)
-    for col in unique_cols:
+    columns = list(df.columns)
+    for col in columns:
         _validate_sql_identifier(col)
 
-    # 1. データベースに接続
-    conn = sqlite3.connect(db_path)
-    # nosec B608 - table_name, unique_cols は _validate_sql_identifier() で検証済み
-    conn.execute(
+    batch = df.drop_duplicates(subset=unique_cols)
+    if batch.empty:
+        return UpsertResult()
+
+    value_cols = [col for col in columns if col not in unique_cols]
+    col_list = ", ".join(f'"{col}"' for col in columns)
+    key_list = ", ".join(f'"{col}"' for col in unique_cols)
+    key_match = " AND ".join(f't."{col}" = s."{col}"' for col in unique_cols)
+    stage_table = f"_stage_{table_name}"
+
+    apply_write_pragmas(conn)
+    cursor = conn.cursor()
+
+    # table_name, stage_table, カラム名は _validate_sql_identifier() で検証済み
+    cursor.execute(
         f"""
-            CREATE TABLE IF NOT EXISTS {table_name} (
-                date TEXT,
-                P_SYMBOL TEXT,
-                variable TEXT,
-                value REAL,
-                PRIMARY KEY ({",".join(unique_cols)})
-            )
-        """
+        CREATE TABLE IF NOT EXISTS "{table_name}" (
+            date TEXT,
+            P_SYMBOL TEXT,
+            variable TEXT,
+            value REAL,
+            PRIMARY KEY ({key_list})
+        )
+        """  # nosec B608
     )
 
-    # 2. 既存のテーブルから一意性チェックに必要なデータを取得し、重複行を除外
+    # 一意制約があれば ON CONFLICT、なければ集合演算の DELETE + INSERT
+    use_upsert = method != "delete_insert"
+    if use_upsert and not ensure_unique_constraint(conn, table_name, unique_cols):
+        logger.warning(
+            "UPSERT unavailable, falling back to delete_insert", table=table_name
+        )
+        use_upsert = False
+
     try:
-        # テーブルが存在する場合、既存の複合キーデータを取得
-        # table_name, unique_cols は _validate_sql_identifier() で検証済み
-        select_cols = ", ".join(unique_cols)
-        existing_df = pd.read_sql(f"SELECT {select_cols} FROM {table_name}", conn)  # nosec B608
-
-        # 既存データの 'date' カラムも datetime 型に変換する
-        if "date" in unique_cols and "date" in existing_df.columns:
-            existing_df["date"] = pd.to_datetime(existing_df["date"])
-
-        # 重複チェック用に新しいデータと既存データをマージ
-        merged_df = pd.merge(
-            df.drop_duplicates(subset=unique_cols),
-            existing_df,
-            on=unique_cols,
-            how="left",
-            indicator=True,
+        # ステージング用の一時テーブル(書き込み先と同じ型アフィニティ)
+        cursor.execute(f'DROP TABLE IF EXISTS temp."{stage_table}"')  # nosec B608
+        cursor.execute(
+            f'CREATE TEMP TABLE "{stage_table}" AS '
+            f'SELECT {col_list} FROM "{table_name}" WHERE 0'  # nosec B608
         )
 
-        # 新規データと重複データを分離
-        df_to_add = merged_df[merged_df["_merge"] == "left_only"].drop(
-            columns=["_merge"]
+        if not conn.in_transaction:
+            cursor.execute("BEGIN")
+
+        placeholders = ", ".join("?" for _ in columns)
+        cursor.executemany(
+            f'INSERT INTO temp."{stage_table}" ({col_list}) VALUES ({placeholders})',  # nosec B608
+            _to_sql_rows(batch, columns),
         )
-        df_to_update = merged_df[merged_df["_merge"] == "both"].drop(columns=["_merge"])
-
-        if on_duplicate == "update" and not df_to_update.empty:
-            # 重複データを削除してから追加（上書き）
-            # table_name, unique_cols は _validate_sql_identifier() で検証済み
-            delete_count = 0
-            for _, row in df_to_update.iterrows():
-                conditions = " AND ".join([f"{col} = ?" for col in unique_cols])
-                values = tuple(
-                    str(row[col]) if isinstance(row[col], pd.Timestamp) else row[col]
-                    for col in unique_cols
-                )
-                conn.execute(f"DELETE FROM {table_name} WHERE {conditions}", values)  # nosec B608
-                delete_count += 1
 
-            conn.commit()  # DELETEを確定
+        # 既存キーとの重複数(主キーインデックスで照合)
+        cursor.execute(
+            f"""
+            SELECT COUNT(*) FROM temp."{stage_table}" AS s
+            WHERE EXISTS (SELECT 1 FROM "{table_name}" AS t WHERE {key_match})
+            """  # nosec B608
+        )
+        existing = cursor.fetchone()[0]
 
-            if verbose:
-                logger.debug(
-                    "Duplicate rows deleted for overwrite", delete_count=delete_count
+        if use_upsert:
+            if on_duplicate == "update" and value_cols:
+                set_clause = ", ".join(
+                    f'"{col}" = excluded."{col}"' for col in value_cols
                 )
+                conflict_action = f"DO UPDATE SET {set_clause}"
+            else:
+                conflict_action = "DO NOTHING"
+            # "WHERE true" は ON CONFLICT と結合条件の ON の構文上の曖昧さを避けるため
+            cursor.execute(
+                f"""
+                INSERT INTO "{table_name}" ({col_list})
+                SELECT {col_list} FROM temp."{stage_table}" WHERE true
+                ON CONFLICT({key_list}) {conflict_action}
+                """  # nosec B608
+            )
+        elif on_duplicate == "update":
+            cursor.execute(
+                f"""
+                DELETE FROM "{table_name}"
+                WHERE ({key_list}) IN (SELECT {key_list} FROM temp."{stage_table}")
+                """  # nosec B608
+            )
+            cursor.execute(
+                f'INSERT INTO "{table_name}" ({col_list}) '
+                f'SELECT {col_list} FROM temp."{stage_table}"'  # nosec B608
+            )
+        else:
+            cursor.execute(
+                f"""
+                INSERT INTO "{table_name}" ({col_list})
+                SELECT {col_list} FROM temp."{stage_table}" AS s
+                WHERE NOT EXISTS (SELECT 1 FROM "{table_name}" AS t WHERE {key_match})
+                """  # nosec B608
+            )
 
-            # 重複データを追加対象に含める
-            df_to_add = pd.concat([df_to_add, df_to_update], ignore_index=True)
+        conn.commit()
 
-        if df_to_add.empty:
-            logger.info("No new data to add, skipping", table=table_name)
-            conn.close()
-            return
+    except Exception:
+        logger.error("Bulk upsert failed", table=table_name, exc_info=True)
+        conn.rollback()
+        raise
 
-        if verbose:
-            if on_duplicate == "update":
-                logger.debug(
-                    "Rows to add",
-                    table=table_name,
-                    total=len(df_to_add),
-                    overwritten=len(df_to_update),
-                )
-            else:
-                logger.debug(
-                    "Deduplication check completed",
-                    table=table_name,
-                    existing_rows=len(existing_df),
-                    new_rows=len(df_to_add),
-                )
+    finally:
+        with contextlib.suppress(sqlite3.Error):
+            cursor.execute(f'DROP TABLE IF EXISTS temp."{stage_table}"')  # nosec B608
 
-    except pd.io.sql.DatabaseError:  # type: ignore
-        # テーブルがまだ存在しない場合、全ての行を追加
-        df_to_add = df.drop_duplicates(subset=unique_cols)
-        if verbose:
-            logger.debug(
-                "Table does not exist, creating new",
-                table=table_name,
-                rows=len(df_to_add),
-            )
+    if on_duplicate == "update":
+        result = UpsertResult(inserted=len(batch) - existing, updated=existing)
+    else:
+        result = UpsertResult(inserted=len(batch) - existing, skipped=existing)
+
+    logger.debug(
+        "Bulk upsert completed",
+        table=table_name,
+        method="upsert" if use_upsert else "delete_insert",
+        on_duplicate=on_duplicate,
+        inserted=result.inserted,
+        updated=result.updated,
+        skipped=result.skipped,
+    )
+    return result
 
-    # 3. ユニークな行だけをデータベースに書き込み
-    df_to_add.to_sql(table_name, conn, if_exists="append", index=False)
-    conn.commit()  # INSERTを確定
 
-    # 4. 接続を閉じる
-    conn.close()
-    if verbose:
-        logger.info("Data written to database", table=table_name)
+# ============================================================================================
+def store_to_database(
+    df: pd.DataFrame,
+    db_path: Path,
+    table_name: str,
+    unique_cols: list[str] | None = None,
+    verbose: bool = True,
+    on_duplicate: str = "skip",  # "skip" または "update"
+) -> UpsertResult:
+    """
+    Pandas DataFrameをSQLiteデータベースに書き込む。
+
+    バッチは ``bulk_upsert`` で一時テーブルにステージングされ、既存キーとの照合と
+    書き込みは1トランザクション内の集合演算で行われる。
+
+    Args:
+        df (pd.DataFrame): 書き込みたいデータフレーム(date, P_SYMBOL, value, variable のカラムを持つ)。
+        db_path (str): 接続するSQLiteデータベースのファイルパス。
+        table_name (str): 書き込み先のテーブル名。
+        unique_cols ([str]): 一意性をチェックするカラム
+        on_duplicate (str): 重複時の動作 - "skip" (スキップ) または "update" (上書き)
+
+    Returns:
+        UpsertResult: 追加・上書き・スキップされた行数。
+    """
+    with contextlib.closing(sqlite3.connect(db_path)) as conn:
+        result = bulk_upsert(
+            conn,
+            df,
+            table_name,
+            unique_cols=unique_cols,
+            on_duplicate=on_duplicate,
+        )
+
+    if result.written == 0:
+        logger.info("No new data to add, skipping", table=table_name)
+    elif verbose:
+        logger.info(
+            "Data written to database",
+            table=table_name,
+            inserted=result.inserted,
+            updated=result.updated,
+            skipped=result.skipped,
+        )
+
+    return result
 
 
 # ============================================================================================
@@ -1002,9 +1145,7 @@ def store_active_returns_batch_serial_write(
     save_start = time.time()
 
     # 単一の接続を使用(直列処理でロック完全回避)
-    with sqlite3.connect(db_path, timeout=30.0) as conn:
-        cursor = conn.cursor()
-
+    with contextlib.closing(sqlite3.connect(db_path, timeout=30.0)) as conn:
         # 進捗バー
         iterator = (
             tqdm(df_dict.items(), desc="💾 保存中") if verbose else df_dict.items()
@@ -1012,71 +1153,14 @@ def store_active_returns_batch_serial_write(
 
         for table_name, df in iterator:
             try:
-                # テーブル名のバリデーション（SQLインジェクション対策）
-                _validate_sql_identifier(table_name)
+                # 一時テーブル経由の集合演算で書き込み(既存キーは読み込まない)
+                result = bulk_upsert(conn, df, table_name, on_duplicate="skip")
+                row_count = result.inserted
 
-                # テーブル作成(存在しない場合)
-                # nosec B608 - table_name は _validate_sql_identifier() で検証済み
-                cursor.execute(
-                    f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        date TEXT,
-                        P_SYMBOL TEXT,
-                        variable TEXT,
-                        value REAL,
-                        PRIMARY KEY (date, P_SYMBOL, variable)
-                    )
-                    """
-                )
-
-                # 既存データとの重複チェック
-                try:
-                    select_cols = ", ".join(["date", "P_SYMBOL", "variable"])
-                    # table_name は _validate_sql_identifier() で検証済み
-                    query = f'SELECT {select_cols} FROM "{table_name}"'  # nosec B608
-                    existing_df = pd.read_sql(query, conn)
-
-                    # 既存データのdate列も変換
-                    if "date" in existing_df.columns:
-                        existing_df["date"] = pd.to_datetime(existing_df["date"])
-
-                    # 重複チェック
-                    merged_df = pd.merge(
-                        df,
-                        existing_df,
-                        on=["date", "P_SYMBOL", "variable"],
-                        how="left",
-                        indicator=True,
-                    )
-
-                    df_to_add = merged_df[merged_df["_merge"] == "left_only"].drop(
-                        columns=["_merge"]
-                    )
-
-                    if df_to_add.empty:
-                        if verbose:
-                            logger.debug(
-                                "Duplicate data only, skipping", table=table_name
-                            )
-                        continue
-
-                except pd.io.sql.DatabaseError:  # type: ignore
-                    # テーブルが存在しない場合は全データを追加
-                    df_to_add = df
-
-                row_count = len(df_to_add)
-
-                # バッチINSERTで保存
-                df_to_add.to_sql(
-                    table_name,
-                    conn,
-                    if_exists="append",
-                    index=False,
-                    chunksize=batch_size,
-                    method="multi",
-                )
-
-                conn.commit()
+                if row_count == 0:
+                    if verbose:
+                        logger.debug("Duplicate data only, skipping", table=table_name)
+                    continue
 
                 results["success"].append(table_name)
                 results["total_rows"] += row_count
@@ -1329,20 +1413,24 @@ def store_to_database_batch(
     batch_size: int = 10000,
     max_workers: int | None = 1,  # デフォルトを1に変更(ロック回避)
     verbose: bool = True,
+    on_duplicate: str = "skip",  # "skip" または "update"
 ) -> dict[str, Any]:
     """
     複数のDataFrameをバッチ保存でデータベースに書き込む
 
+    各テーブルは ``bulk_upsert`` で書き込まれる(既存キー全件の読み込みは行わない)。
+
     ⚠️ 注意: max_workersを1にすることでロック問題を回避します。
     並列処理が必要な場合は、事前にWALモードを有効化してください。
 
     :param df_dict: {table_name: DataFrame}の辞書
     :param db_path: SQLiteデータベースのファイルパス
     :param unique_cols: 一意性をチェックするカラムのリスト
-    :param batch_size: 一度に挿入する行数
+    :param batch_size: 互換性のため残す(書き込みは1テーブル1回の集合演算)
     :param max_workers: 並列実行する最大スレッド数(1推奨)
     :param verbose: 進捗表示フラグ
-    :return: 処理結果の統計情報
+    :param on_duplicate: 重複時の動作 - "skip" (スキップ) または "update" (上書き)
+    :return: 処理結果の統計情報(total_rows は追加 + 上書きの行数)
     """
     if unique_cols is None:
         unique_cols = ["date", "P_SYMBOL", "variable"]
@@ -1426,69 +1514,21 @@ def store_to_database_batch(
         table_name, df = args
 
         try:
-            with sqlite3.connect(db_path, timeout=30.0) as conn:
-                cursor = conn.cursor()
-
-                # テーブル作成
-                # table_name, unique_cols は関数先頭で _validate_sql_identifier() 検証済み
-                cursor.execute(
-                    f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        date TEXT,
-                        P_SYMBOL TEXT,
-                        variable TEXT,
-                        value REAL,
-                        PRIMARY KEY ({",".join(unique_cols)})
-                    )
-                    """  # nosec B608
-                )
-
-                # 重複チェック
-                try:
-                    select_cols = ", ".join(unique_cols)
-                    # table_name, unique_cols は関数先頭で検証済み
-                    query = f'SELECT {select_cols} FROM "{table_name}"'  # nosec B608
-                    existing_df = pd.read_sql(query, conn)
-
-                    if "date" in unique_cols and "date" in existing_df.columns:
-                        existing_df["date"] = pd.to_datetime(existing_df["date"])
-
-                    merged_df = pd.merge(
-                        df,
-                        existing_df,
-                        on=unique_cols,
-                        how="left",
-                        indicator=True,
-                    )
-
-                    df_to_add = merged_df[merged_df["_merge"] == "left_only"].drop(
-                        columns=["_merge"]
-                    )
-
-                    if df_to_add.empty:
-                        return (table_name, True, 0, "重複データのみ")
-
-                except pd.io.sql.DatabaseError:  # type: ignore
-                    df_to_add = df
-
-                row_count = len(df_to_add)
-
-                # バッチINSERT
-                df_to_add.to_sql(
-                    table_name,
+            with contextlib.closing(sqlite3.connect(db_path, timeout=30.0)) as conn:
+                result = bulk_upsert(
                     conn,
-                    if_exists="append",
-                    index=False,
-                    chunksize=batch_size,
-                    method="multi",
+                    df,
+                    table_name,
+                    unique_cols=unique_cols,
+                    on_duplicate=on_duplicate,
                 )
 
-                conn.commit()
-
-                return (table_name, True, row_count, None)
+            if result.written == 0:
+                return (table_name, result, "重複データのみ")
+            return (table_name, result, None)
 
         except Exception as e:
-            return (table_name, False, 0, str(e))
+            return (table_name, None, str(e))
 
     # --------------------------------------------------------------------------
     # ステップ3: 実行
@@ -1497,11 +1537,37 @@ def store_to_database_batch(
         "success": [],
         "failed": [],
         "total_rows": 0,
+        "inserted_rows": 0,
+        "updated_rows": 0,
         "prep_time": prep_time,
         "save_time": 0,
         "total_time": 0,
     }
 
+    def _record(
+        table_name: str, result: UpsertResult | None, message: str | None
+    ) -> None:
+        """ワーカーの結果を集計する"""
+        if result is None:
+            results["failed"].append({"table": table_name, "error": message})
+            logger.error("Table save failed", table=table_name, error=message)
+            return
+
+        results["success"].append(table_name)
+        results["total_rows"] += result.written
+        results["inserted_rows"] += result.inserted
+        results["updated_rows"] += result.updated
+
+        if verbose and result.written > 0:
+            logger.debug(
+                "Table saved",
+                table=table_name,
+                inserted=result.inserted,
+                updated=result.updated,
+            )
+        elif verbose:
+            logger.debug("Table skipped", table=table_name, reason=message)
+
     save_start = time.time()
     args_list = list(optimized_dict.items())
 
@@ -1510,19 +1576,7 @@ def store_to_database_batch(
         iterator = tqdm(args_list, desc="💾 保存中") if verbose else args_list
 
         for args in iterator:
-            table_name, success, row_count, error_msg = _batch_save_worker(args)
-
-            if success:
-                results["success"].append(table_name)
-                results["total_rows"] += row_count
-
-                if verbose and row_count > 0:
-                    logger.debug("Table saved", table=table_name, rows=row_count)
-                elif verbose:
-                    logger.debug("Table skipped", table=table_name, reason=error_msg)
-            else:
-                results["failed"].append({"table": table_name, "error": error_msg})
-                logger.error("Table save failed", table=table_name, error=error_msg)
+            _record(*_batch_save_worker(args))
 
     else:
         # 並列処理(WALモード推奨)
@@ -1542,31 +1596,7 @@ def store_to_database_batch(
                 table_name = futures[future]
 
                 try:
-                    table_name_result, success, row_count, error_msg = future.result()
-
-                    if success:
-                        results["success"].append(table_name_result)
-                        results["total_rows"] += row_count
-
-                        if verbose and row_count > 0:
-                            logger.debug(
-                                "Table saved", table=table_name_result, rows=row_count
-                            )
-                        elif verbose:
-                            logger.debug(
-                                "Table skipped",
-                                table=table_name_result,
-                                reason=error_msg,
-                            )
-                    else:
-                        results["failed"].append(
-                            {"table": table_name_result, "error": error_msg}
-                        )
-                        logger.error(
-                            "Table save failed",
-                            table=table_name_result,
-                            error=error_msg,
-                        )
+                    _record(*future.result())
 
                 except Exception as e:
                     results["failed"].append({"table": table_name, "error": str(e)})
@@ -1595,6 +1625,8 @@ def store_to_database_batch(
             total_tables=len(df_dict),
             failed_count=len(results["failed"]),
             total_rows=results["total_rows"],
+            inserted_rows=results["inserted_rows"],
+            updated_rows=results["updated_rows"],
             prep_time_sec=round(results["prep_time"], 2),
             save_time_sec=round(results["save_time"], 2),
             total_time_sec=round(results["total_time"], 2),
@@ -1684,28 +1716,38 @@ def store_active_returns_batch(
 
 
 # ============================================================================================
-def ensure_unique_constraint(conn: sqlite3.Connection, table_name: str):
+def ensure_unique_constraint(
+    conn: sqlite3.Connection,
+    table_name: str,
+    unique_cols: list[str] | None = None,
+) -> bool:
     """
-    テーブルにUNIQUE制約があるか確認し、なければ再作成
+    テーブルの unique_cols に PRIMARY KEY または UNIQUE 制約があるか確認する
+
+    :param conn: データベース接続
+    :param table_name: テーブル名
+    :param unique_cols: 制約を確認するカラム(デフォルト: date, P_SYMBOL, variable)
+    :return: 制約がある場合は True
     """
-    cursor = conn.cursor()
+    if unique_cols is None:
+        unique_cols = ["date", "P_SYMBOL", "variable"]
 
-    # テーブル情報を取得
-    cursor.execute(f"PRAGMA table_info('{table_name}')")
-    columns_info = cursor.fetchall()
+    cursor = conn.cursor()
 
     # インデックス情報を取得
     cursor.execute(f"PRAGMA index_list('{table_name}')")
     indexes = cursor.fetchall()
 
-    # PRIMARY KEYまたはUNIQUEインデックスが(date, P_SYMBOL, variable)にあるか確認
+    # PRIMARY KEYまたはUNIQUEインデックスが unique_cols にあるか確認
     has_constraint = False
     for index in indexes:
-        index_name = index[1]
+        index_name, is_unique = index[1], index[2]
+        if not is_unique:
+            continue
         cursor.execute(f"PRAGMA index_info('{index_name}')")
         index_columns = [col[2] for col in cursor.fetchall()]
 
-        if set(index_columns) == {"date", "P_SYMBOL", "variable"}:
+        if set(index_columns) == set(unique_cols):
             has_constraint = True
             break
 
@@ -1722,10 +1764,12 @@ def upsert_financial_data(
     conn: sqlite3.Connection,
     table_name: str,
     method: str = "auto",  # "auto", "upsert", "delete_insert"
-):
+) -> int:
     """
     財務データを更新
 
+    ``bulk_upsert`` により一時テーブル経由の集合演算で1トランザクション内に書き込む。
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -1736,127 +1780,37 @@ def upsert_financial_data(
         テーブル名
     method : str
         更新方法 ("auto", "upsert", "delete_insert")
-        - "auto": SQLiteバージョンに応じて自動選択
-        - "upsert": UPSERT構文を使用(SQLite 3.24.0以降)
+        - "auto": 一意制約があれば UPSERT、なければ DELETE + INSERT
+        - "upsert": UPSERT構文を使用(一意制約がない場合は delete_insert にフォールバック)
         - "delete_insert": DELETE + INSERT方式
+
+    Returns
+    -------
+    int
+        書き込まれた行数(追加 + 上書き)
     """
 
     if df.empty:
         logger.warning("Empty update data", table=table_name)
         return 0
 
-    # テーブル名のバリデーション（SQLインジェクション対策）
-    _validate_sql_identifier(table_name)
-
-    # SQLiteバージョンをチェック
-    sqlite_version = tuple(map(int, sqlite3.sqlite_version.split(".")))
-    supports_upsert = sqlite_version >= (3, 24, 0)
-
-    # methodが"auto"の場合、バージョンに応じて自動選択
-    if method == "auto":
-        method = "upsert" if supports_upsert else "delete_insert"
-        logger.info(
-            "Auto-selected upsert method",
-            sqlite_version=sqlite3.sqlite_version,
-            method=method,
-        )
-
     # 日付を文字列に変換
-    df_copy = df.copy()
+    df_copy = df.loc[:, _LONG_TABLE_COLUMNS].copy()
     df_copy["date"] = pd.to_datetime(df_copy["date"]).dt.strftime("%Y-%m-%d")
 
-    # NaN を None に変換(SQLiteのNULL)
-    df_copy = df_copy.where(pd.notnull(df_copy), None)
-
-    # 一時テーブル名
-    temp_table = f"{table_name}_temp_{np.random.randint(1000, 9999)}"
-
-    try:
-        # 一時テーブルに保存
-        df_copy.to_sql(temp_table, conn, if_exists="replace", index=False)
-
-        cursor = conn.cursor()
-
-        if method == "upsert":
-            if not supports_upsert:
-                logger.warning(
-                    "UPSERT not supported, falling back to delete_insert",
-                    sqlite_version=sqlite3.sqlite_version,
-                )
-                method = "delete_insert"
-            elif not ensure_unique_constraint(conn, table_name):
-                logger.warning(
-                    "UPSERT unavailable, falling back to delete_insert",
-                    table=table_name,
-                )
-                method = "delete_insert"
-
-        if method == "upsert":
-            # UPSERT方式(SQLite 3.24.0以降)
-            # table_name, temp_table は _validate_sql_identifier() で検証済み
-            upsert_query = f"""
-                INSERT INTO "{table_name}" (date, P_SYMBOL, variable, value)
-                SELECT date, P_SYMBOL, variable, value
-                FROM "{temp_table}"
-                ON CONFLICT(date, P_SYMBOL, variable)
-                DO UPDATE SET value = excluded.value
-            """  # nosec B608 - table_name は検証済み
-            cursor.execute(upsert_query)
-            rows_affected = cursor.rowcount
-
-        elif method == "delete_insert":
-            # DELETE + INSERT方式(古いSQLiteでも動作)
-            # table_name, temp_table は _validate_sql_identifier() で検証済み
-            # 1. 該当行を削除
-            delete_query = f"""
-                DELETE FROM "{table_name}"
-                WHERE (date, P_SYMBOL, variable) IN (
-                    SELECT date, P_SYMBOL, variable
-                    FROM "{temp_table}"
-                )
-            """  # nosec B608 - table_name は検証済み
-            cursor.execute(delete_query)
-            deleted = cursor.rowcount
-
-            # 2. 新規データを挿入
-            insert_query = f"""
-                INSERT INTO "{table_name}" (date, P_SYMBOL, variable, value)
-                SELECT date, P_SYMBOL, variable, value
-                FROM "{temp_table}"
-            """  # nosec B608 - table_name は検証済み
-            cursor.execute(insert_query)
-            inserted = cursor.rowcount
-
-            rows_affected = inserted
-
-            logger.info(
-                "Delete-insert completed",
-                table=table_name,
-                deleted=deleted,
-                inserted=inserted,
-            )
-
-        else:
-            raise ValueError(f"不正なmethod: {method}")
-
-        # 一時テーブル削除
-        # nosec B608 - temp_table は table_name から生成された安全な識別子
-        cursor.execute(f'DROP TABLE IF EXISTS "{temp_table}"')
-
-        conn.commit()
-
-        logger.info("Upsert completed", table=table_name, rows_affected=rows_affected)
+    result = bulk_upsert(
+        conn, df_copy, table_name, on_duplicate="update", method=method
+    )
 
-        return rows_affected
+    logger.info(
+        "Upsert completed",
+        table=table_name,
+        rows_affected=result.written,
+        inserted=result.inserted,
+        updated=result.updated,
+    )
 
-    except Exception as e:
-        logger.error("Upsert failed", table=table_name, exc_info=True)
-        conn.rollback()
-        # 一時テーブルのクリーンアップ
-        with contextlib.suppress(BaseException):
-            # nosec B608 - temp_table は table_name から生成された安全な識別子
-            cursor.execute(f'DROP TABLE IF EXISTS "{temp_table}"')  # nosec B608
-        raise
+    return result.written
 
 
 # ============================================================================================
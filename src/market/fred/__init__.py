@@ -34,9 +34,24 @@ For historical data caching:
 >>> df = cache.get_series_df("DGS10")
 """
 
-from .constants import FRED_API_KEY_ENV, FRED_SERIES_PATTERN
-from .fetcher import FREDFetcher
-from .historical_cache import HistoricalCache
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .constants import FRED_API_KEY_ENV, FRED_SERIES_PATTERN
+    from .fetcher import FREDFetcher
+    from .historical_cache import HistoricalCache
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "FRED_API_KEY_ENV": ".constants",
+    "FRED_SERIES_PATTERN": ".constants",
+    "FREDFetcher": ".fetcher",
+    "HistoricalCache": ".historical_cache",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "FRED_API_KEY_ENV",
@@ -13,7 +13,11 @@ FRED_API_KEY_ENV: Final[str] = "FRED_API_KEY"
 # Must start with an uppercase letter
 FRED_SERIES_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[A-Z][A-Z0-9_]*$")
 
+# FRED API rate limit (requests per minute per API key)
+FRED_MAX_REQUESTS_PER_MINUTE: Final[int] = 120
+
 __all__ = [
     "FRED_API_KEY_ENV",
+    "FRED_MAX_REQUESTS_PER_MINUTE",
     "FRED_SERIES_PATTERN",
 ]
@@ -1,22 +1,44 @@
 """FRED historical data local cache management.
 
 This module provides functionality for caching FRED economic indicator data
-locally as JSON files. It supports full historical data retrieval and
-incremental updates.
+locally as Parquet files. It supports full historical data retrieval,
+append-only incremental updates, concurrent rate-limited syncing and loading
+many series at once into an aligned wide DataFrame.
+
+Each series is stored in its own directory::
+
+    <base_path>/
+    ├── _index.json
+    └── DGS10/
+        ├── _meta.json          # preset / FRED / cache metadata
+        ├── part-00000.parquet  # full history (date, value)
+        └── part-00001.parquet  # incremental append
+
+Incremental syncs only write the rows that are new (or revised) since the
+last cached date as a new part file; parts are compacted into one once
+their number exceeds ``MAX_PARTS``. Legacy ``<series_id>.json`` caches are
+still readable and are migrated on the next sync.
 """
 
 import json
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from market.errors import FREDFetchError
 from utils_core.logging import get_logger
+from utils_core.rate_limit import get_rate_scheduler
 from utils_core.settings import load_project_env
 
+from .constants import FRED_MAX_REQUESTS_PER_MINUTE
 from .fetcher import FREDFetcher
 from .types import FetchOptions
 
@@ -79,21 +101,40 @@ def get_default_cache_path() -> Path:
 # Use get_default_cache_path() instead
 DEFAULT_CACHE_PATH = _FALLBACK_CACHE_PATH
 
-# Cache file version
-CACHE_VERSION = 1
+# Cache file version (1: per-series JSON, 2: per-series Parquet parts)
+CACHE_VERSION = 2
+
+# Number of part files per series above which they are compacted into one
+MAX_PARTS = 16
+
+# Default number of series synced concurrently
+DEFAULT_SYNC_WORKERS = 4
+
+_META_FILE = "_meta.json"
+_PART_PREFIX = "part-"
+_PARQUET_SCHEMA = pa.schema([("date", pa.timestamp("ns")), ("value", pa.float64())])
+
+# FRED limits are per API key, so every request in the process shares one
+# schedule, spaced to stay within the per-minute limit
+FRED_RATE_KEY = "api.stlouisfed.org"
+_FRED_REQUEST_INTERVAL = 60.0 / FRED_MAX_REQUESTS_PER_MINUTE
 
 
 class HistoricalCache:
     """Local cache manager for FRED historical data.
 
-    Manages local JSON cache files for FRED economic indicator data.
-    Supports full historical data retrieval and incremental updates.
+    Manages per-series Parquet caches for FRED economic indicator data.
+    Supports full historical data retrieval, append-only incremental
+    updates and concurrent syncing under the FRED API rate limit.
 
     Parameters
     ----------
     base_path : Path | str | None
         Base directory for cache files.
         If None, uses default path: data/raw/fred/indicators/
+    max_workers : int
+        Number of series synced concurrently by ``sync_many``,
+        ``sync_all_presets`` and ``sync_category`` (default: 4)
 
     Attributes
     ----------
@@ -108,7 +149,11 @@ class HistoricalCache:
     >>> print(df.head())
     """
 
-    def __init__(self, base_path: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        base_path: Path | str | None = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> None:
         """Initialize HistoricalCache.
 
         Parameters
@@ -117,7 +162,17 @@ class HistoricalCache:
             Base directory for cache files.
             If None, uses FRED_HISTORICAL_CACHE_DIR environment variable,
             or falls back to data/raw/fred/indicators/.
+        max_workers : int
+            Number of series synced concurrently (default: 4)
+
+        Raises
+        ------
+        ValueError
+            If max_workers is not positive
         """
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+
         if base_path is None:
             self._base_path = get_default_cache_path()
         else:
@@ -126,12 +181,16 @@ class HistoricalCache:
         # Create directory if it doesn't exist
         self._base_path.mkdir(parents=True, exist_ok=True)
 
+        self._max_workers = max_workers
+        self._index_lock = threading.Lock()
+
         # Ensure presets are loaded
         FREDFetcher.load_presets()
 
         logger.debug(
             "HistoricalCache initialized",
             base_path=str(self._base_path),
+            max_workers=max_workers,
         )
 
     @property
@@ -149,7 +208,10 @@ class HistoricalCache:
         """Sync a single FRED series.
 
         For new series, fetches full historical data.
-        For existing series, performs incremental update.
+        For existing series, fetches only the gap since the last cached
+        date and appends it as a new Parquet part. If FRED reports that
+        the series has not been updated since the last sync, no
+        observations are requested at all.
 
         Parameters
         ----------
@@ -186,14 +248,37 @@ class HistoricalCache:
             )
 
         try:
-            # Check for existing cache
-            cache_file = self._base_path / f"{series_id}.json"
-            existing_data = self._load_cache_file(cache_file)
+            self._migrate_legacy_json(series_id)
+            existing_meta = self._load_meta(series_id)
+
+            fetcher = FREDFetcher()
 
-            # Determine start date for fetch
-            if existing_data is not None:
+            # Get FRED metadata first: it tells us whether anything changed
+            get_rate_scheduler().acquire(FRED_RATE_KEY, interval=_FRED_REQUEST_INTERVAL)
+            fred_metadata = fetcher.get_series_info(series_id)
+
+            if existing_meta is not None:
+                existing_points = existing_meta["cache_metadata"]["data_points"]
+                last_date = existing_meta["cache_metadata"]["date_range"][1]
+                last_updated = fred_metadata.get("last_updated")
+                if last_updated is not None and last_updated == existing_meta[
+                    "fred_metadata"
+                ].get("last_updated_api"):
+                    logger.debug(
+                        "Series unchanged since last sync, skipping fetch",
+                        series_id=series_id,
+                        last_updated=last_updated,
+                    )
+                    self._save_sync_metadata(
+                        series_id, preset_info, fred_metadata, existing_meta
+                    )
+                    return {
+                        "series_id": series_id,
+                        "success": True,
+                        "data_points": existing_points,
+                        "new_points": 0,
+                    }
                 # Incremental update: fetch from last data point
-                last_date = existing_data["data"][-1]["date"]
                 start_date = last_date
                 logger.debug(
                     "Performing incremental update",
@@ -201,6 +286,7 @@ class HistoricalCache:
                     last_date=last_date,
                 )
             else:
+                existing_points = 0
                 # Full fetch: no start date (get all history)
                 start_date = None
                 logger.debug(
@@ -209,68 +295,79 @@ class HistoricalCache:
                 )
 
             # Fetch data from FRED API
-            fetcher = FREDFetcher()
             options = FetchOptions(
                 symbols=[series_id],
                 start_date=start_date,
                 use_cache=False,  # Always fetch from API
             )
 
+            get_rate_scheduler().acquire(FRED_RATE_KEY, interval=_FRED_REQUEST_INTERVAL)
             results = fetcher.fetch(options)
             if not results or results[0].is_empty:
                 logger.warning(
                     "No data returned from FRED API",
                     series_id=series_id,
                 )
-                if existing_data is not None:
+                if existing_meta is not None:
                     # No new data, but existing cache is valid
                     return {
                         "series_id": series_id,
                         "success": True,
-                        "data_points": len(existing_data["data"]),
+                        "data_points": existing_points,
                         "new_points": 0,
                     }
                 raise FREDFetchError(f"No data found for series: {series_id}")
 
-            result = results[0]
-            new_df = result.data
+            new_frame = self._to_frame(results[0].data)
 
-            # Get FRED metadata
-            fred_metadata = fetcher.get_series_info(series_id)
-
-            # Merge with existing data if applicable
-            if existing_data is not None:
-                merged_data = self._merge_data(existing_data["data"], new_df)
-                new_points = len(merged_data) - len(existing_data["data"])
+            if existing_meta is not None and start_date is not None:
+                to_append, new_points = self._select_appendable(
+                    series_id, new_frame, cast("pd.Timestamp", pd.Timestamp(start_date))
+                )
+                first_date = existing_meta["cache_metadata"]["date_range"][0]
             else:
-                merged_data = self._df_to_data_list(new_df)
-                new_points = len(merged_data)
+                to_append, new_points = new_frame, len(new_frame)
+                first_date = (
+                    new_frame["date"].iloc[0].strftime("%Y-%m-%d")
+                    if not new_frame.empty
+                    else None
+                )
 
-            # Build cache structure
-            cache_data = self._build_cache_data(
+            if not to_append.empty:
+                self._write_part(series_id, to_append)
+                last_date = to_append["date"].iloc[-1].strftime("%Y-%m-%d")
+            elif existing_meta is None:
+                last_date = None
+
+            data_points = existing_points + new_points
+
+            # Build and save metadata
+            meta = self._build_metadata(
                 series_id=series_id,
                 preset_info=preset_info,
                 fred_metadata=fred_metadata,
-                data=merged_data,
+                data_points=data_points,
+                date_range=[first_date, last_date],
             )
-
-            # Save to file
-            self._save_cache_file(cache_file, cache_data)
+            self._save_meta(series_id, meta)
 
             # Update index
-            self._update_index(series_id, cache_data)
+            self._update_index(series_id, meta)
+
+            if len(self._part_files(series_id)) > MAX_PARTS:
+                self._compact(series_id)
 
             logger.info(
                 "Series synced successfully",
                 series_id=series_id,
-                data_points=len(merged_data),
+                data_points=data_points,
                 new_points=new_points,
             )
 
             return {
                 "series_id": series_id,
                 "success": True,
-                "data_points": len(merged_data),
+                "data_points": data_points,
                 "new_points": new_points,
             }
 
@@ -288,8 +385,46 @@ class HistoricalCache:
                 "error": str(e),
             }
 
+    def sync_many(self, series_ids: list[str]) -> list[dict[str, Any]]:
+        """Sync several series concurrently.
+
+        Series are synced on a thread pool of ``max_workers`` threads.
+        All FRED requests go through a shared limiter that keeps the
+        process within the FRED API limit of 120 requests per minute.
+
+        Parameters
+        ----------
+        series_ids : list[str]
+            FRED series IDs
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Sync results in the same order as ``series_ids``. Series not
+            found in presets are reported as failures.
+        """
+
+        def sync_one(series_id: str) -> dict[str, Any]:
+            try:
+                return self.sync_series(series_id)
+            except ValueError as e:
+                return {
+                    "series_id": series_id,
+                    "success": False,
+                    "error": str(e),
+                }
+
+        if not series_ids:
+            return []
+
+        workers = min(self._max_workers, len(series_ids))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="fred-sync"
+        ) as executor:
+            return list(executor.map(sync_one, series_ids))
+
     def sync_all_presets(self) -> list[dict[str, Any]]:
-        """Sync all preset series.
+        """Sync all preset series concurrently.
 
         Returns
         -------
@@ -299,21 +434,7 @@ class HistoricalCache:
         logger.info("Syncing all preset series")
 
         symbols = FREDFetcher.get_preset_symbols()
-        results = []
-
-        for series_id in symbols:
-            try:
-                result = self.sync_series(series_id)
-                results.append(result)
-            except ValueError:
-                # Series not in presets (shouldn't happen, but handle gracefully)
-                results.append(
-                    {
-                        "series_id": series_id,
-                        "success": False,
-                        "error": f"Series '{series_id}' not found in presets",
-                    }
-                )
+        results = self.sync_many(symbols)
 
         success_count = sum(1 for r in results if r.get("success", False))
         logger.info(
@@ -326,7 +447,7 @@ class HistoricalCache:
         return results
 
     def sync_category(self, category: str) -> list[dict[str, Any]]:
-        """Sync all series in a category.
+        """Sync all series in a category concurrently.
 
         Parameters
         ----------
@@ -346,20 +467,7 @@ class HistoricalCache:
         logger.info("Syncing category", category=category)
 
         symbols = FREDFetcher.get_preset_symbols(category)
-        results = []
-
-        for series_id in symbols:
-            try:
-                result = self.sync_series(series_id)
-                results.append(result)
-            except ValueError as e:
-                results.append(
-                    {
-                        "series_id": series_id,
-                        "success": False,
-                        "error": str(e),
-                    }
-                )
+        results = self.sync_many(symbols)
 
         success_count = sum(1 for r in results if r.get("success", False))
         logger.info(
@@ -383,18 +491,38 @@ class HistoricalCache:
         Returns
         -------
         dict[str, Any] | None
-            Cached data structure, or None if not cached
+            Cached data structure (metadata plus a ``data`` list of
+            ``{"date", "value"}`` points), or None if not cached
         """
-        cache_file = self._base_path / f"{series_id}.json"
-        return self._load_cache_file(cache_file)
+        meta = self._load_meta(series_id)
+        if meta is None:
+            return self._load_legacy_json(series_id)
 
-    def get_series_df(self, series_id: str) -> pd.DataFrame | None:
+        frame = self._read_frame(series_id)
+        return {
+            **meta,
+            "data": [
+                {"date": date.strftime("%Y-%m-%d"), "value": float(value)}
+                for date, value in zip(frame["date"], frame["value"], strict=True)
+            ],
+        }
+
+    def get_series_df(
+        self,
+        series_id: str,
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | None = None,
+    ) -> pd.DataFrame | None:
         """Get cached data as DataFrame.
 
         Parameters
         ----------
         series_id : str
             FRED series ID
+        start_date : str | datetime | None
+            Inclusive lower date bound (default: no bound)
+        end_date : str | datetime | None
+            Inclusive upper date bound (default: no bound)
 
         Returns
         -------
@@ -402,17 +530,72 @@ class HistoricalCache:
             DataFrame with DatetimeIndex and 'value' column,
             or None if not cached
         """
-        data = self.get_series(series_id)
-        if data is None:
-            return None
+        if self._load_meta(series_id) is not None:
+            frame = self._read_frame(series_id, start_date, end_date)
+        else:
+            legacy = self._load_legacy_json(series_id)
+            if legacy is None:
+                return None
+            frame = _points_to_frame(legacy.get("data", []))
+            frame = self._filter_dates(frame, start_date, end_date)
 
-        df = pd.DataFrame(data["data"])
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.set_index("date")
+        df = frame.set_index("date")
         df.index.name = None
 
         return df
 
+    def get_multiple_series_df(
+        self,
+        series_ids: list[str],
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | None = None,
+    ) -> pd.DataFrame:
+        """Load several cached series into one aligned wide DataFrame.
+
+        Parameters
+        ----------
+        series_ids : list[str]
+            FRED series IDs
+        start_date : str | datetime | None
+            Inclusive lower date bound (default: no bound)
+        end_date : str | datetime | None
+            Inclusive upper date bound (default: no bound)
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame indexed by the union of all observation dates, with
+            one column per cached series (in ``series_ids`` order). Dates
+            a series has no observation for are NaN. Series that are not
+            cached are omitted.
+
+        Examples
+        --------
+        >>> cache = HistoricalCache()
+        >>> df = cache.get_multiple_series_df(["DGS2", "DGS10"], "2020-01-01")
+        >>> (df["DGS10"] - df["DGS2"]).dropna().tail()
+        """
+        columns: dict[str, pd.Series] = {}
+        missing: list[str] = []
+
+        for series_id in dict.fromkeys(series_ids):
+            df = self.get_series_df(series_id, start_date, end_date)
+            if df is None:
+                missing.append(series_id)
+                continue
+            columns[series_id] = cast("pd.Series", df["value"])
+
+        if missing:
+            logger.warning(
+                "Series not found in cache",
+                missing=missing,
+            )
+
+        if not columns:
+            return pd.DataFrame(index=pd.DatetimeIndex([]))
+
+        return pd.DataFrame(columns).sort_index()
+
     def get_status(self) -> dict[str, dict[str, Any]]:
         """Get sync status for all preset series.
 
@@ -429,8 +612,7 @@ class HistoricalCache:
         status: dict[str, dict[str, Any]] = {}
 
         for series_id in symbols:
-            cache_file = self._base_path / f"{series_id}.json"
-            data = self._load_cache_file(cache_file)
+            data = self._load_meta(series_id) or self._load_legacy_json(series_id)
 
             if data is not None:
                 cache_meta = data.get("cache_metadata", {})
@@ -464,73 +646,96 @@ class HistoricalCache:
         bool
             True if cache was deleted, False if it didn't exist
         """
-        cache_file = self._base_path / f"{series_id}.json"
-
-        if cache_file.exists():
-            cache_file.unlink()
+        series_dir = self._series_dir(series_id)
+        legacy_file = self._legacy_file(series_id)
+        deleted = False
+
+        if series_dir.is_dir():
+            shutil.rmtree(series_dir)
+            deleted = True
+        if legacy_file.exists():
+            legacy_file.unlink()
+            deleted = True
+
+        if deleted:
             logger.info("Cache invalidated", series_id=series_id)
 
             # Update index
             self._remove_from_index(series_id)
 
-            return True
-
-        return False
+        return deleted
 
     # =========================================================================
     # Private Methods
     # =========================================================================
 
-    def _load_cache_file(self, cache_file: Path) -> dict[str, Any] | None:
-        """Load a cache file.
+    def _series_dir(self, series_id: str) -> Path:
+        """Return the Parquet directory for a series."""
+        return self._base_path / series_id
+
+    def _legacy_file(self, series_id: str) -> Path:
+        """Return the legacy (version 1) JSON cache file for a series."""
+        return self._base_path / f"{series_id}.json"
+
+    def _part_files(self, series_id: str) -> list[Path]:
+        """Return the Parquet part files of a series in write order."""
+        series_dir = self._series_dir(series_id)
+        if not series_dir.is_dir():
+            return []
+        return sorted(series_dir.glob(f"{_PART_PREFIX}*.parquet"))
+
+    def _load_meta(self, series_id: str) -> dict[str, Any] | None:
+        """Load the metadata file of a Parquet-cached series.
 
         Parameters
         ----------
-        cache_file : Path
-            Path to cache file
+        series_id : str
+            FRED series ID
 
         Returns
         -------
         dict[str, Any] | None
-            Loaded data, or None if file doesn't exist
+            Loaded metadata, or None if the series is not cached as Parquet
         """
-        if not cache_file.exists():
+        meta_file = self._series_dir(series_id) / _META_FILE
+        if not meta_file.exists():
             return None
 
         try:
-            with open(cache_file, encoding="utf-8") as f:
+            with open(meta_file, encoding="utf-8") as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(
-                "Failed to load cache file",
-                file=str(cache_file),
+                "Failed to load cache metadata",
+                file=str(meta_file),
                 error=str(e),
             )
             return None
 
-    def _save_cache_file(self, cache_file: Path, data: dict[str, Any]) -> None:
-        """Save data to cache file.
+    def _save_meta(self, series_id: str, meta: dict[str, Any]) -> None:
+        """Atomically save the metadata file of a series.
 
         Parameters
         ----------
-        cache_file : Path
-            Path to cache file
-        data : dict[str, Any]
-            Data to save
+        series_id : str
+            FRED series ID
+        meta : dict[str, Any]
+            Metadata to save
         """
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        series_dir = self._series_dir(series_id)
+        series_dir.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(series_dir / _META_FILE, meta)
 
-        logger.debug("Cache file saved", file=str(cache_file))
+        logger.debug("Cache metadata saved", series_id=series_id)
 
-    def _build_cache_data(
+    def _save_sync_metadata(
         self,
         series_id: str,
         preset_info: dict[str, Any],
         fred_metadata: dict[str, Any],
-        data: list[dict[str, Any]],
-    ) -> dict[str, Any]:
-        """Build cache data structure.
+        existing_meta: dict[str, Any],
+    ) -> None:
+        """Refresh metadata after a sync that found no new observations.
 
         Parameters
         ----------
@@ -540,150 +745,364 @@ class HistoricalCache:
             Preset information from config
         fred_metadata : dict[str, Any]
             Metadata from FRED API
-        data : list[dict[str, Any]]
-            Data points
+        existing_meta : dict[str, Any]
+            Metadata currently on disk
+        """
+        cache_meta = existing_meta["cache_metadata"]
+        meta = self._build_metadata(
+            series_id=series_id,
+            preset_info=preset_info,
+            fred_metadata=fred_metadata,
+            data_points=cache_meta["data_points"],
+            date_range=cache_meta["date_range"],
+        )
+        self._save_meta(series_id, meta)
+        self._update_index(series_id, meta)
+
+    def _load_legacy_json(self, series_id: str) -> dict[str, Any] | None:
+        """Load a legacy (version 1) JSON cache file.
+
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID
 
         Returns
         -------
-        dict[str, Any]
-            Complete cache data structure
+        dict[str, Any] | None
+            Loaded data, or None if file doesn't exist
         """
-        # Extract category_name and remove it from preset_info copy
-        preset_copy = {k: v for k, v in preset_info.items() if k != "category_name"}
+        cache_file = self._legacy_file(series_id)
+        if not cache_file.exists():
+            return None
 
-        # Get date range from data
-        date_range_start = data[0]["date"] if data else None
-        date_range_end = data[-1]["date"] if data else None
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(
+                "Failed to load cache file",
+                file=str(cache_file),
+                error=str(e),
+            )
+            return None
 
-        return {
-            "series_id": series_id,
-            "preset_info": preset_copy,
-            "fred_metadata": {
-                "observation_start": fred_metadata.get(
-                    "observation_start", date_range_start
-                ),
-                "observation_end": fred_metadata.get("observation_end", date_range_end),
-                "title": fred_metadata.get("title"),
-                "last_updated_api": fred_metadata.get("last_updated"),
-            },
-            "cache_metadata": {
-                "last_fetched": datetime.now(timezone.utc).isoformat(),
-                "data_points": len(data),
-                "version": CACHE_VERSION,
-            },
-            "data": data,
-        }
+    def _migrate_legacy_json(self, series_id: str) -> None:
+        """Convert a legacy JSON cache into the Parquet layout.
 
-    def _df_to_data_list(self, df: pd.DataFrame) -> list[dict[str, Any]]:
-        """Convert DataFrame to list of data points.
+        The JSON file is removed once the Parquet part and metadata have
+        been written. Does nothing if the series has no legacy cache.
 
         Parameters
         ----------
-        df : pd.DataFrame
-            DataFrame with DatetimeIndex and 'value' column
+        series_id : str
+            FRED series ID
+        """
+        legacy = self._load_legacy_json(series_id)
+        if legacy is None:
+            return
+
+        if self._load_meta(series_id) is None:
+            frame = _points_to_frame(legacy.get("data", []))
+            if not frame.empty:
+                self._write_part(series_id, frame)
+
+            fred_meta = legacy.get("fred_metadata", {})
+            meta = {
+                "series_id": series_id,
+                "preset_info": legacy.get("preset_info", {}),
+                "fred_metadata": {
+                    "observation_start": fred_meta.get("observation_start"),
+                    "observation_end": fred_meta.get("observation_end"),
+                    "title": fred_meta.get("title"),
+                    "last_updated_api": fred_meta.get("last_updated_api"),
+                },
+                "cache_metadata": {
+                    **legacy.get("cache_metadata", {}),
+                    "data_points": len(frame),
+                    "date_range": _frame_date_range(frame),
+                    "version": CACHE_VERSION,
+                },
+            }
+            self._save_meta(series_id, meta)
+
+        self._legacy_file(series_id).unlink()
+        logger.info("Migrated legacy JSON cache to Parquet", series_id=series_id)
+
+    def _read_frame(
+        self,
+        series_id: str,
+        start_date: str | datetime | None = None,
+        end_date: str | datetime | None = None,
+    ) -> pd.DataFrame:
+        """Read all parts of a series into one ``date``/``value`` frame.
+
+        Later parts take precedence for dates present in several parts.
+        Date bounds are pushed down to the Parquet reader.
+
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID
+        start_date : str | datetime | None
+            Inclusive lower date bound
+        end_date : str | datetime | None
+            Inclusive upper date bound
 
         Returns
         -------
-        list[dict[str, Any]]
-            List of {"date": "YYYY-MM-DD", "value": float}
+        pd.DataFrame
+            Frame with ``date`` and ``value`` columns, sorted by date
         """
-        result: list[dict[str, Any]] = []
+        filters: list[tuple[str, str, Any]] = []
+        if start_date is not None:
+            filters.append(("date", ">=", pd.Timestamp(start_date)))
+        if end_date is not None:
+            filters.append(("date", "<=", pd.Timestamp(end_date)))
+
+        tables = [
+            pq.read_table(part, schema=_PARQUET_SCHEMA, filters=filters or None)
+            for part in self._part_files(series_id)
+        ]
+        if not tables:
+            return _PARQUET_SCHEMA.empty_table().to_pandas()
+
+        frame = pa.concat_tables(tables).to_pandas()
+        return (
+            frame.drop_duplicates(subset="date", keep="last")
+            .sort_values("date")
+            .reset_index(drop=True)
+        )
 
-        # Reset index to have date as a column
-        df_reset = df.reset_index()
-        date_col = df_reset.columns[0]  # First column is the date index
+    def _write_part(self, series_id: str, frame: pd.DataFrame) -> None:
+        """Append a frame to a series as a new Parquet part file.
 
-        for _, row in df_reset.iterrows():
-            date_val = row[date_col]
-            value = row.get("value")
-
-            if value is not None and pd.notna(value):
-                # Cast to str for pd.Timestamp compatibility
-                date_str = str(date_val) if date_val is not None else ""
-                result.append(
-                    {
-                        "date": pd.Timestamp(date_str).strftime("%Y-%m-%d"),
-                        "value": float(value),
-                    }
-                )
-        return result
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID
+        frame : pd.DataFrame
+            Frame with ``date`` and ``value`` columns
+        """
+        series_dir = self._series_dir(series_id)
+        series_dir.mkdir(parents=True, exist_ok=True)
+
+        parts = self._part_files(series_id)
+        next_index = int(parts[-1].stem[len(_PART_PREFIX) :]) + 1 if parts else 0
+        part_file = series_dir / f"{_PART_PREFIX}{next_index:05d}.parquet"
+        tmp_file = part_file.with_suffix(".parquet.tmp")
+
+        table = pa.Table.from_pandas(
+            frame[["date", "value"]], schema=_PARQUET_SCHEMA, preserve_index=False
+        )
+        pq.write_table(table, tmp_file, compression="zstd")
+        tmp_file.replace(part_file)
+
+        logger.debug(
+            "Cache part written",
+            series_id=series_id,
+            file=part_file.name,
+            rows=len(frame),
+        )
+
+    def _compact(self, series_id: str) -> None:
+        """Merge all part files of a series into a single part.
+
+        The merged part is written after the existing ones before they are
+        deleted, so concurrent readers always see complete data.
+
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID
+        """
+        old_parts = self._part_files(series_id)
+        frame = self._read_frame(series_id)
+        self._write_part(series_id, frame)
+        for part in old_parts:
+            part.unlink()
 
-    def _merge_data(
+        logger.debug(
+            "Cache parts compacted",
+            series_id=series_id,
+            merged_parts=len(old_parts),
+            rows=len(frame),
+        )
+
+    def _select_appendable(
         self,
-        existing: list[dict[str, Any]],
-        new_df: pd.DataFrame,
-    ) -> list[dict[str, Any]]:
-        """Merge existing data with new data.
+        series_id: str,
+        new_frame: pd.DataFrame,
+        last_date: pd.Timestamp,
+    ) -> tuple[pd.DataFrame, int]:
+        """Select the fetched rows that must be appended to the cache.
+
+        Rows after the last cached date are always appended. The row on the
+        last cached date is appended only if FRED revised its value.
 
         Parameters
         ----------
-        existing : list[dict[str, Any]]
-            Existing data points
-        new_df : pd.DataFrame
-            New data from API
+        series_id : str
+            FRED series ID
+        new_frame : pd.DataFrame
+            Fetched frame with ``date`` and ``value`` columns
+        last_date : pd.Timestamp
+            Last cached observation date
 
         Returns
         -------
-        list[dict[str, Any]]
-            Merged data points (sorted by date)
+        tuple[pd.DataFrame, int]
+            Rows to append, and the number of new (not revised) dates
+        """
+        newer = new_frame.loc[new_frame["date"] > last_date]
+        overlap = new_frame.loc[new_frame["date"] == last_date]
+
+        if not overlap.empty:
+            stored = self._read_frame(series_id, last_date, last_date)
+            if stored.empty or stored["value"].iloc[-1] != overlap["value"].iloc[-1]:
+                return pd.concat([overlap, newer], ignore_index=True), len(newer)
+
+        return newer.reset_index(drop=True), len(newer)
+
+    @staticmethod
+    def _to_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize fetched data into a ``date``/``value`` frame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame with a date index and 'value' column
+
+        Returns
+        -------
+        pd.DataFrame
+            Frame sorted by date with NaN values dropped
         """
-        # Convert new data to list format
-        new_data = self._df_to_data_list(new_df)
+        # Reset index to have date as a column
+        df_reset = df.reset_index()
+        date_col = df_reset.columns[0]  # First column is the date index
 
-        # Create a dict keyed by date for efficient merging
-        merged: dict[str, dict[str, Any]] = {}
+        frame = pd.DataFrame(
+            {
+                "date": pd.to_datetime(df_reset[date_col])
+                .dt.tz_localize(None)
+                .dt.normalize(),
+                "value": pd.to_numeric(df_reset["value"], errors="coerce").astype(
+                    "float64"
+                ),
+            }
+        )
+        return (
+            frame.dropna(subset=["value"])
+            .drop_duplicates(subset="date", keep="last")
+            .sort_values("date")
+            .reset_index(drop=True)
+        )
 
-        # Add existing data
-        for point in existing:
-            merged[point["date"]] = point
+    @staticmethod
+    def _filter_dates(
+        frame: pd.DataFrame,
+        start_date: str | datetime | None,
+        end_date: str | datetime | None,
+    ) -> pd.DataFrame:
+        """Apply inclusive date bounds to a ``date``/``value`` frame."""
+        if start_date is not None:
+            frame = frame.loc[frame["date"] >= pd.Timestamp(start_date)]
+        if end_date is not None:
+            frame = frame.loc[frame["date"] <= pd.Timestamp(end_date)]
+        return frame.reset_index(drop=True)
+
+    def _build_metadata(
+        self,
+        series_id: str,
+        preset_info: dict[str, Any],
+        fred_metadata: dict[str, Any],
+        data_points: int,
+        date_range: list[str | None],
+    ) -> dict[str, Any]:
+        """Build the metadata structure of a series.
 
-        # Add/update with new data
-        for point in new_data:
-            merged[point["date"]] = point
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID
+        preset_info : dict[str, Any]
+            Preset information from config
+        fred_metadata : dict[str, Any]
+            Metadata from FRED API
+        data_points : int
+            Number of cached observations
+        date_range : list[str | None]
+            First and last cached observation dates
 
-        # Sort by date and return as list
-        return [merged[date] for date in sorted(merged.keys())]
+        Returns
+        -------
+        dict[str, Any]
+            Complete metadata structure
+        """
+        # Extract category_name and remove it from preset_info copy
+        preset_copy = {k: v for k, v in preset_info.items() if k != "category_name"}
 
-    def _update_index(self, series_id: str, cache_data: dict[str, Any]) -> None:
+        return {
+            "series_id": series_id,
+            "preset_info": preset_copy,
+            "fred_metadata": {
+                "observation_start": fred_metadata.get(
+                    "observation_start", date_range[0]
+                ),
+                "observation_end": fred_metadata.get("observation_end", date_range[1]),
+                "title": fred_metadata.get("title"),
+                "last_updated_api": fred_metadata.get("last_updated"),
+            },
+            "cache_metadata": {
+                "last_fetched": datetime.now(timezone.utc).isoformat(),
+                "data_points": data_points,
+                "date_range": date_range,
+                "version": CACHE_VERSION,
+            },
+        }
+
+    def _update_index(self, series_id: str, meta: dict[str, Any]) -> None:
         """Update the index file after sync.
 
         Parameters
         ----------
         series_id : str
             FRED series ID
-        cache_data : dict[str, Any]
-            Cache data that was saved
+        meta : dict[str, Any]
+            Series metadata that was saved
         """
         index_file = self._base_path / "_index.json"
 
-        # Load existing index or create new
-        if index_file.exists():
-            try:
-                with open(index_file, encoding="utf-8") as f:
-                    index_data = json.load(f)
-            except (json.JSONDecodeError, IOError):
+        with self._index_lock:
+            # Load existing index or create new
+            if index_file.exists():
+                try:
+                    with open(index_file, encoding="utf-8") as f:
+                        index_data = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    index_data = {"version": CACHE_VERSION, "series": {}}
+            else:
                 index_data = {"version": CACHE_VERSION, "series": {}}
-        else:
-            index_data = {"version": CACHE_VERSION, "series": {}}
-
-        # Update index entry
-        cache_meta = cache_data.get("cache_metadata", {})
-        fred_meta = cache_data.get("fred_metadata", {})
-
-        index_data["last_updated"] = datetime.now(timezone.utc).isoformat()
-        index_data["series"][series_id] = {
-            "file": f"{series_id}.json",
-            "last_fetched": cache_meta.get("last_fetched"),
-            "data_points": cache_meta.get("data_points"),
-            "date_range": [
-                fred_meta.get("observation_start"),
-                fred_meta.get("observation_end"),
-            ],
-        }
 
-        # Save index
-        with open(index_file, "w", encoding="utf-8") as f:
-            json.dump(index_data, f, ensure_ascii=False, indent=2)
+            # Update index entry
+            cache_meta = meta.get("cache_metadata", {})
+            fred_meta = meta.get("fred_metadata", {})
+
+            index_data["version"] = CACHE_VERSION
+            index_data["last_updated"] = datetime.now(timezone.utc).isoformat()
+            index_data["series"][series_id] = {
+                "file": series_id,
+                "last_fetched": cache_meta.get("last_fetched"),
+                "data_points": cache_meta.get("data_points"),
+                "date_range": [
+                    fred_meta.get("observation_start"),
+                    fred_meta.get("observation_end"),
+                ],
+            }
+
+            # Save index
+            _write_json_atomic(index_file, index_data)
 
     def _remove_from_index(self, series_id: str) -> None:
         """Remove a series from the index file.
@@ -695,26 +1114,51 @@ class HistoricalCache:
         """
         index_file = self._base_path / "_index.json"
 
-        if not index_file.exists():
-            return
+        with self._index_lock:
+            if not index_file.exists():
+                return
 
-        try:
-            with open(index_file, encoding="utf-8") as f:
-                index_data = json.load(f)
+            try:
+                with open(index_file, encoding="utf-8") as f:
+                    index_data = json.load(f)
+
+                if series_id in index_data.get("series", {}):
+                    del index_data["series"][series_id]
+                    index_data["last_updated"] = datetime.now(timezone.utc).isoformat()
+                    _write_json_atomic(index_file, index_data)
+            except (json.JSONDecodeError, IOError):
+                pass
+
+
+def _points_to_frame(points: list[dict[str, Any]]) -> pd.DataFrame:
+    """Convert legacy ``{"date", "value"}`` points to a ``date``/``value`` frame."""
+    if not points:
+        return _PARQUET_SCHEMA.empty_table().to_pandas()
+    return HistoricalCache._to_frame(pd.DataFrame(points).set_index("date"))
+
+
+def _frame_date_range(frame: pd.DataFrame) -> list[str | None]:
+    """Return the first and last dates of a ``date``/``value`` frame."""
+    if frame.empty:
+        return [None, None]
+    return [
+        frame["date"].iloc[0].strftime("%Y-%m-%d"),
+        frame["date"].iloc[-1].strftime("%Y-%m-%d"),
+    ]
 
-            if series_id in index_data.get("series", {}):
-                del index_data["series"][series_id]
-                index_data["last_updated"] = datetime.now(timezone.utc).isoformat()
 
-                with open(index_file, "w", encoding="utf-8") as f:
-                    json.dump(index_data, f, ensure_ascii=False, indent=2)
-        except (json.JSONDecodeError, IOError):
-            pass
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON to a temporary file and rename it over ``path``."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp_path.replace(path)
 
 
 __all__ = [
     "DEFAULT_CACHE_PATH",
     "FRED_HISTORICAL_CACHE_DIR_ENV",
+    "FRED_RATE_KEY",
     "HistoricalCache",
     "get_default_cache_path",
 ]
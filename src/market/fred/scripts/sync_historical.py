@@ -275,8 +275,8 @@ def _auto_sync(cache: HistoricalCache, stale_hours: int) -> int:
     success_count = 0
     fail_count = 0
 
-    for series_id in series_to_sync:
-        result = cache.sync_series(series_id)
+    for result in cache.sync_many(series_to_sync):
+        series_id = result["series_id"]
         if result.get("success", False):
             success_count += 1
             print(f"  [OK] {series_id}: {result.get('data_points', 0)} points")
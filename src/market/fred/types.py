@@ -13,6 +13,8 @@ from typing import Any
 
 import pandas as pd
 
+from market.cache.types import CacheConfig
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -102,34 +104,6 @@ class RetryConfig:
     jitter: bool = True
 
 
-@dataclass(frozen=True)
-class CacheConfig:
-    """Configuration for cache behavior.
-
-    Parameters
-    ----------
-    enabled : bool
-        Whether caching is enabled (default: True)
-    ttl_seconds : int
-        Time-to-live for cache entries in seconds (default: 3600)
-    max_entries : int
-        Maximum number of cache entries (default: 1000)
-    db_path : str | None
-        Path to SQLite database file (default: None, uses in-memory)
-
-    Examples
-    --------
-    >>> config = CacheConfig(ttl_seconds=7200, max_entries=500)
-    >>> config.ttl_seconds
-    7200
-    """
-
-    enabled: bool = True
-    ttl_seconds: int = 3600
-    max_entries: int = 1000
-    db_path: str | None = None
-
-
 @dataclass
 class FetchOptions:
     """Options for data fetching operations.
@@ -75,68 +75,127 @@ See Also
 market.etfcom : ETF.com scraping module (reference implementation for scraping patterns).
 """
 
-from market.industry.api_clients.bls import BLSClient
-from market.industry.api_clients.census import CensusClient
-from market.industry.collector import (
-    CollectionResult,
-    CollectionStats,
-    IndustryCollector,
-)
-from market.industry.competitive_analysis import (
-    CompetitiveAnalyzer,
-    evaluate_advantage_claim,
-    evaluate_porter_forces,
-    score_moat,
-)
-from market.industry.config import (
-    IndustryPreset,
-    IndustryPresetsConfig,
-    SourceConfig,
-    load_presets,
-)
-from market.industry.downloaders.pdf_downloader import PDFDownloader
-from market.industry.downloaders.report_parser import ReportParser
-from market.industry.peer_groups import (
-    get_dynamic_peer_group,
-    get_peer_group,
-    get_preset_peer_group,
-)
-from market.industry.scheduler import IndustryScheduler
-from market.industry.scrapers.base import BaseScraper
-from market.industry.scrapers.consulting import (
-    BCGScraper,
-    ConsultingScraper,
-    DeloitteScraper,
-    McKinseyScraper,
-    PwCScraper,
-)
-from market.industry.scrapers.investment_bank import (
-    GoldmanSachsScraper,
-    InvestmentBankScraper,
-    JPMorganScraper,
-    MorganStanleyScraper,
-)
-from market.industry.types import (
-    AdvantageAssessment,
-    AdvantageClaim,
-    ConfidenceLevel,
-    DogmaRuleResult,
-    DownloadResult,
-    IndustryReport,
-    MoatScore,
-    MoatStrength,
-    MoatType,
-    ParsedContent,
-    PeerGroup,
-    PorterForce,
-    PorterForcesAssessment,
-    PorterForceStrength,
-    ReportMetadata,
-    RetryConfig,
-    ScrapingConfig,
-    ScrapingResult,
-    SourceTier,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from market.industry.api_clients.bls import BLSClient
+    from market.industry.api_clients.census import CensusClient
+    from market.industry.collector import (
+        CollectionResult,
+        CollectionStats,
+        IndustryCollector,
+    )
+    from market.industry.competitive_analysis import (
+        CompetitiveAnalyzer,
+        evaluate_advantage_claim,
+        evaluate_porter_forces,
+        score_moat,
+    )
+    from market.industry.config import (
+        IndustryPreset,
+        IndustryPresetsConfig,
+        SourceConfig,
+        load_presets,
+    )
+    from market.industry.downloaders.pdf_downloader import PDFDownloader
+    from market.industry.downloaders.report_parser import ReportParser
+    from market.industry.peer_groups import (
+        get_dynamic_peer_group,
+        get_peer_group,
+        get_preset_peer_group,
+    )
+    from market.industry.scheduler import IndustryScheduler
+    from market.industry.scrapers.base import BaseScraper
+    from market.industry.scrapers.consulting import (
+        BCGScraper,
+        ConsultingScraper,
+        DeloitteScraper,
+        McKinseyScraper,
+        PwCScraper,
+    )
+    from market.industry.scrapers.investment_bank import (
+        GoldmanSachsScraper,
+        InvestmentBankScraper,
+        JPMorganScraper,
+        MorganStanleyScraper,
+    )
+    from market.industry.types import (
+        AdvantageAssessment,
+        AdvantageClaim,
+        ConfidenceLevel,
+        DogmaRuleResult,
+        DownloadResult,
+        IndustryReport,
+        MoatScore,
+        MoatStrength,
+        MoatType,
+        ParsedContent,
+        PeerGroup,
+        PorterForce,
+        PorterForcesAssessment,
+        PorterForceStrength,
+        ReportMetadata,
+        RetryConfig,
+        ScrapingConfig,
+        ScrapingResult,
+        SourceTier,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BLSClient": "market.industry.api_clients.bls",
+    "CensusClient": "market.industry.api_clients.census",
+    "CollectionResult": "market.industry.collector",
+    "CollectionStats": "market.industry.collector",
+    "IndustryCollector": "market.industry.collector",
+    "CompetitiveAnalyzer": "market.industry.competitive_analysis",
+    "evaluate_advantage_claim": "market.industry.competitive_analysis",
+    "evaluate_porter_forces": "market.industry.competitive_analysis",
+    "score_moat": "market.industry.competitive_analysis",
+    "IndustryPreset": "market.industry.config",
+    "IndustryPresetsConfig": "market.industry.config",
+    "SourceConfig": "market.industry.config",
+    "load_presets": "market.industry.config",
+    "PDFDownloader": "market.industry.downloaders.pdf_downloader",
+    "ReportParser": "market.industry.downloaders.report_parser",
+    "get_dynamic_peer_group": "market.industry.peer_groups",
+    "get_peer_group": "market.industry.peer_groups",
+    "get_preset_peer_group": "market.industry.peer_groups",
+    "IndustryScheduler": "market.industry.scheduler",
+    "BaseScraper": "market.industry.scrapers.base",
+    "BCGScraper": "market.industry.scrapers.consulting",
+    "ConsultingScraper": "market.industry.scrapers.consulting",
+    "DeloitteScraper": "market.industry.scrapers.consulting",
+    "McKinseyScraper": "market.industry.scrapers.consulting",
+    "PwCScraper": "market.industry.scrapers.consulting",
+    "GoldmanSachsScraper": "market.industry.scrapers.investment_bank",
+    "InvestmentBankScraper": "market.industry.scrapers.investment_bank",
+    "JPMorganScraper": "market.industry.scrapers.investment_bank",
+    "MorganStanleyScraper": "market.industry.scrapers.investment_bank",
+    "AdvantageAssessment": "market.industry.types",
+    "AdvantageClaim": "market.industry.types",
+    "ConfidenceLevel": "market.industry.types",
+    "DogmaRuleResult": "market.industry.types",
+    "DownloadResult": "market.industry.types",
+    "IndustryReport": "market.industry.types",
+    "MoatScore": "market.industry.types",
+    "MoatStrength": "market.industry.types",
+    "MoatType": "market.industry.types",
+    "ParsedContent": "market.industry.types",
+    "PeerGroup": "market.industry.types",
+    "PorterForce": "market.industry.types",
+    "PorterForcesAssessment": "market.industry.types",
+    "PorterForceStrength": "market.industry.types",
+    "ReportMetadata": "market.industry.types",
+    "RetryConfig": "market.industry.types",
+    "ScrapingConfig": "market.industry.types",
+    "ScrapingResult": "market.industry.types",
+    "SourceTier": "market.industry.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "AdvantageAssessment",
@@ -16,8 +16,21 @@ market.fred : FRED API client (reference implementation for API clients).
 market.industry.scrapers : Web scraper implementations.
 """
 
-from market.industry.api_clients.bls import BLSClient
-from market.industry.api_clients.census import CensusClient
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from market.industry.api_clients.bls import BLSClient
+    from market.industry.api_clients.census import CensusClient
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BLSClient": "market.industry.api_clients.bls",
+    "CensusClient": "market.industry.api_clients.census",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BLSClient",
@@ -16,7 +16,20 @@ ReportParser
     Parser for extracting text and metadata from PDF and HTML documents.
 """
 
-from market.industry.downloaders.pdf_downloader import PDFDownloader
-from market.industry.downloaders.report_parser import ReportParser
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from market.industry.downloaders.pdf_downloader import PDFDownloader
+    from market.industry.downloaders.report_parser import ReportParser
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "PDFDownloader": "market.industry.downloaders.pdf_downloader",
+    "ReportParser": "market.industry.downloaders.report_parser",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["PDFDownloader", "ReportParser"]
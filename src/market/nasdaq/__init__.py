@@ -55,27 +55,55 @@ Examples
 >>> df = collector.fetch(filter=ScreenerFilter(exchange=Exchange.NASDAQ))
 """
 
-from market.nasdaq.collector import ScreenerCollector
-from market.nasdaq.errors import (
-    NasdaqAPIError,
-    NasdaqError,
-    NasdaqParseError,
-    NasdaqRateLimitError,
-)
-from market.nasdaq.session import NasdaqSession
-from market.nasdaq.types import (
-    Country,
-    Exchange,
-    FilterCategory,
-    MarketCap,
-    NasdaqConfig,
-    Recommendation,
-    Region,
-    RetryConfig,
-    ScreenerFilter,
-    Sector,
-    StockRecord,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from market.nasdaq.collector import ScreenerCollector
+    from market.nasdaq.errors import (
+        NasdaqAPIError,
+        NasdaqError,
+        NasdaqParseError,
+        NasdaqRateLimitError,
+    )
+    from market.nasdaq.session import NasdaqSession
+    from market.nasdaq.types import (
+        Country,
+        Exchange,
+        FilterCategory,
+        MarketCap,
+        NasdaqConfig,
+        Recommendation,
+        Region,
+        RetryConfig,
+        ScreenerFilter,
+        Sector,
+        StockRecord,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "ScreenerCollector": "market.nasdaq.collector",
+    "NasdaqAPIError": "market.nasdaq.errors",
+    "NasdaqError": "market.nasdaq.errors",
+    "NasdaqParseError": "market.nasdaq.errors",
+    "NasdaqRateLimitError": "market.nasdaq.errors",
+    "NasdaqSession": "market.nasdaq.session",
+    "Country": "market.nasdaq.types",
+    "Exchange": "market.nasdaq.types",
+    "FilterCategory": "market.nasdaq.types",
+    "MarketCap": "market.nasdaq.types",
+    "NasdaqConfig": "market.nasdaq.types",
+    "Recommendation": "market.nasdaq.types",
+    "Region": "market.nasdaq.types",
+    "RetryConfig": "market.nasdaq.types",
+    "ScreenerFilter": "market.nasdaq.types",
+    "Sector": "market.nasdaq.types",
+    "StockRecord": "market.nasdaq.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Country",
@@ -44,7 +44,6 @@ market.etfcom.collectors : Reference DataCollector implementations.
 
 from __future__ import annotations
 
-import time
 from datetime import date
 from pathlib import Path
 from typing import Any
@@ -278,8 +277,9 @@ class ScreenerCollector(DataCollector):
 
         Iterates over every member of the given Enum category
         (e.g. ``Exchange``, ``Sector``), creates a ``ScreenerFilter``
-        with that value, and calls ``fetch()``.  A polite delay is
-        inserted between each request.
+        with that value, and calls ``fetch()``.  Requests are spaced by the
+        session's shared per-host scheduler, which waits only for the part
+        of the polite delay not already spent on the previous request.
 
         Parameters
         ----------
@@ -321,10 +321,6 @@ class ScreenerCollector(DataCollector):
             # Build filter with the category value
             filter_ = self._build_category_filter(category, member, base_filter)
 
-            # Polite delay between requests (skip first)
-            if i > 0:
-                time.sleep(1.0)
-
             df = self.fetch(filter=filter_)
             results[value] = df
 
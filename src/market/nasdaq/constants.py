@@ -115,6 +115,15 @@ Adds randomness to request timing to appear more human-like.
 The actual delay is ``DEFAULT_POLITE_DELAY + random(0, DEFAULT_DELAY_JITTER)``.
 """
 
+DEFAULT_BURST: Final[int] = 1
+"""Default number of requests allowed back to back after an idle period.
+
+Requests to the NASDAQ API host are scheduled through the shared
+``utils_core.rate_limit`` scheduler, which waits only for the remainder of
+the polite delay since the previous request. A burst of 1 keeps every pair
+of consecutive requests at least one polite delay apart.
+"""
+
 ALLOWED_HOSTS: Final[frozenset[str]] = frozenset({"api.nasdaq.com"})
 """Whitelist of allowed hostnames for SSRF prevention (CWE-918).
 
@@ -194,6 +203,7 @@ __all__ = [
     "ALLOWED_HOSTS",
     "BROWSER_IMPERSONATE_TARGETS",
     "COLUMN_NAME_MAP",
+    "DEFAULT_BURST",
     "DEFAULT_DELAY_JITTER",
     "DEFAULT_HEADERS",
     "DEFAULT_OUTPUT_DIR",
@@ -51,6 +51,7 @@ from market.nasdaq.constants import (
 from market.nasdaq.errors import NasdaqRateLimitError
 from market.nasdaq.types import NasdaqConfig, RetryConfig
 from utils_core.logging import get_logger
+from utils_core.rate_limit import RateScheduler, get_rate_scheduler
 
 logger = get_logger(__name__)
 
@@ -74,6 +75,9 @@ class NasdaqSession:
         NASDAQ configuration. If None, defaults are used.
     retry_config : RetryConfig | None
         Retry configuration. If None, defaults are used.
+    scheduler : RateScheduler | None
+        Request scheduler. If None, the process-wide scheduler shared by
+        all sessions is used.
 
     Attributes
     ----------
@@ -85,6 +89,8 @@ class NasdaqSession:
         The underlying curl_cffi session instance.
     _user_agents : list[str]
         User-Agent strings for rotation.
+    _scheduler : RateScheduler
+        Per-host request scheduler applying the polite delay.
 
     Examples
     --------
@@ -103,6 +109,7 @@ class NasdaqSession:
         self,
         config: NasdaqConfig | None = None,
         retry_config: RetryConfig | None = None,
+        scheduler: RateScheduler | None = None,
     ) -> None:
         """Initialize NasdaqSession with configuration.
 
@@ -112,9 +119,12 @@ class NasdaqSession:
             NASDAQ configuration. Defaults to ``NasdaqConfig()``.
         retry_config : RetryConfig | None
             Retry configuration. Defaults to ``RetryConfig()``.
+        scheduler : RateScheduler | None
+            Request scheduler. Defaults to ``get_rate_scheduler()``.
         """
         self._config: NasdaqConfig = config or NasdaqConfig()
         self._retry_config: RetryConfig = retry_config or RetryConfig()
+        self._scheduler: RateScheduler = scheduler or get_rate_scheduler()
 
         # Resolve user agents: use config value or fall back to defaults
         self._user_agents: list[str] = (
@@ -144,7 +154,9 @@ class NasdaqSession:
 
         Applies the following before each request:
 
-        1. Polite delay (``config.polite_delay`` + random jitter)
+        1. Polite delay (``config.polite_delay`` + random jitter), waiting
+           only for the part of it not yet elapsed since the previous
+           request to the same host from any session
         2. Random User-Agent header selection
         3. Referer header set to ``NASDAQ_SCREENER_URL``
         4. Default browser-like headers from ``DEFAULT_HEADERS``
@@ -196,11 +208,13 @@ class NasdaqSession:
                 f"Host '{parsed_host}' is not in allowed hosts: {sorted(ALLOWED_HOSTS)}"
             )
 
-        # 1. Apply polite delay
-        delay = self._config.polite_delay + random.uniform(  # nosec B311 (cryptographic randomness not required for delay jitter)
+        # 1. Apply polite delay (residual wait on the shared per-host schedule)
+        interval = self._config.polite_delay + random.uniform(  # nosec B311 (cryptographic randomness not required for delay jitter)
             0, self._config.delay_jitter
         )
-        time.sleep(delay)
+        delay = self._scheduler.acquire(
+            parsed_host, interval=interval, burst=self._config.burst
+        )
         logger.debug("Polite delay applied", delay_seconds=delay, url=url)
 
         # 2. Build headers with User-Agent rotation and Referer
@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from market.nasdaq.constants import (
+    DEFAULT_BURST,
     DEFAULT_DELAY_JITTER,
     DEFAULT_POLITE_DELAY,
     DEFAULT_TIMEOUT,
@@ -231,6 +232,9 @@ class NasdaqConfig:
     timeout : float
         HTTP request timeout in seconds
         (default: ``DEFAULT_TIMEOUT`` = 30.0).
+    burst : int
+        Number of requests allowed back to back after an idle period
+        (default: ``DEFAULT_BURST`` = 1).
 
     Examples
     --------
@@ -244,6 +248,7 @@ class NasdaqConfig:
     user_agents: tuple[str, ...] = ()
     impersonate: str = "chrome"
     timeout: float = DEFAULT_TIMEOUT
+    burst: int = DEFAULT_BURST
 
     def __post_init__(self) -> None:
         """Validate configuration value ranges.
@@ -265,6 +270,8 @@ class NasdaqConfig:
             raise ValueError(
                 f"delay_jitter must be between 0.0 and 30.0, got {self.delay_jitter}"
             )
+        if not (1 <= self.burst <= 10):
+            raise ValueError(f"burst must be between 1 and 10, got {self.burst}")
 
 
 @dataclass(frozen=True)
@@ -15,16 +15,37 @@ Examples
 >>> results = fetcher.fetch(FetchOptions(symbols=["AAPL"]))
 """
 
-from market.errors import DataFetchError, ErrorCode, ValidationError
-from market.yfinance.fetcher import YFinanceFetcher
-from market.yfinance.types import (
-    CacheConfig,
-    DataSource,
-    FetchOptions,
-    Interval,
-    MarketDataResult,
-    RetryConfig,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from market.errors import DataFetchError, ErrorCode, ValidationError
+    from market.yfinance.fetcher import YFinanceFetcher
+    from market.yfinance.types import (
+        CacheConfig,
+        DataSource,
+        FetchOptions,
+        Interval,
+        MarketDataResult,
+        RetryConfig,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "DataFetchError": "market.errors",
+    "ErrorCode": "market.errors",
+    "ValidationError": "market.errors",
+    "YFinanceFetcher": "market.yfinance.fetcher",
+    "CacheConfig": "market.yfinance.types",
+    "DataSource": "market.yfinance.types",
+    "FetchOptions": "market.yfinance.types",
+    "Interval": "market.yfinance.types",
+    "MarketDataResult": "market.yfinance.types",
+    "RetryConfig": "market.yfinance.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "CacheConfig",
@@ -11,13 +11,14 @@ import random
 import re
 import time
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 import pandas as pd
 import yfinance as yf
 from curl_cffi import requests as curl_requests
 from curl_cffi.requests import BrowserTypeLiteral
 
+from market.cache.bar_store import BarStore
 from market.errors import DataFetchError, ErrorCode, ValidationError
 from market.yfinance.session import CurlCffiSession, HttpSessionProtocol
 from market.yfinance.types import (
@@ -84,6 +85,10 @@ class YFinanceFetcher:
         If None, defaults to CurlCffiSession() with the specified impersonate.
         Use this parameter to inject custom session implementations for testing
         or to use alternative HTTP clients.
+    bar_store : BarStore | None
+        Range-aware OHLCV store. When provided (and ``options.use_cache`` is
+        True with a ``start_date``), only date ranges not yet stored are
+        downloaded and every result is served from the store.
 
     Attributes
     ----------
@@ -107,6 +112,11 @@ class YFinanceFetcher:
     >>> from market.yfinance.session import StandardRequestsSession
     >>> custom_session = StandardRequestsSession()
     >>> fetcher = YFinanceFetcher(http_session=custom_session)
+
+    With a bar store, overlapping requests only download the missing gaps:
+
+    >>> from market.cache import BarStore
+    >>> fetcher = YFinanceFetcher(bar_store=BarStore("data/cache/bars.db"))
     """
 
     def __init__(
@@ -115,8 +125,10 @@ class YFinanceFetcher:
         retry_config: RetryConfig | None = None,
         impersonate: BrowserTypeLiteral | None = None,
         http_session: HttpSessionProtocol | None = None,
+        bar_store: BarStore | None = None,
     ) -> None:
         self._cache_config = cache_config
+        self._bar_store = bar_store
         self._retry_config = retry_config or DEFAULT_RETRY_CONFIG
         self._impersonate: BrowserTypeLiteral = (
             impersonate
@@ -135,6 +147,7 @@ class YFinanceFetcher:
             retry_enabled=retry_config is not None,
             impersonate=self._impersonate,
             session_injected=http_session is not None,
+            bar_store_enabled=bar_store is not None,
         )
 
     @property
@@ -282,11 +295,20 @@ class YFinanceFetcher:
             symbol_count=len(options.symbols),
         )
 
-        # Use bulk download for multiple symbols
-        bulk_data = self._fetch_bulk(options)
+        if (
+            self._bar_store is not None
+            and options.use_cache
+            and options.start_date is not None
+        ):
+            results = self._fetch_with_bar_store(
+                options, self._bar_store, options.start_date
+            )
+        else:
+            # Use bulk download for multiple symbols
+            bulk_data = self._fetch_bulk(options)
 
-        # Convert bulk data to individual results
-        results = self._create_results_from_bulk(bulk_data, options)
+            # Convert bulk data to individual results
+            results = self._create_results_from_bulk(bulk_data, options)
 
         logger.info(
             "Fetch completed",
@@ -296,6 +318,175 @@ class YFinanceFetcher:
 
         return results
 
+    def _fetch_with_bar_store(
+        self,
+        options: FetchOptions,
+        store: BarStore,
+        start_date: datetime | str,
+    ) -> list[MarketDataResult]:
+        """Fetch data through the bar store, downloading only missing ranges.
+
+        Symbols sharing the same gap are downloaded together with one
+        yf.download call. Coverage is recorded only up to the start of
+        today, so the current (possibly incomplete) bar is re-fetched on the
+        next request and an open-ended request acts as an incremental
+        "append since last bar" update. A gap that comes back empty (or, in
+        a bulk download, as an all-NaN column) is recorded only if it contains no weekdays, or if it lies between two
+        ranges the store already covers (an exchange holiday): yfinance also
+        returns an empty frame when throttled, and marking any other gap as
+        covered would lose its bars for good.
+
+        Parameters
+        ----------
+        options : FetchOptions
+            Fetch options
+        store : BarStore
+            The bar store to read from and write to
+        start_date : datetime | str
+            Start of the requested range (``options.start_date``)
+
+        Returns
+        -------
+        list[MarketDataResult]
+            List of results for each requested symbol
+        """
+        interval = self._map_interval(options.interval)
+        source = self.source.value
+        start = cast("pd.Timestamp", pd.Timestamp(start_date)).normalize()
+        today = pd.Timestamp.now().normalize()
+        end = cast(
+            "pd.Timestamp",
+            pd.Timestamp(options.end_date)
+            if options.end_date is not None
+            else today + pd.Timedelta(days=1),
+        )
+
+        # Group symbols by identical gaps so each gap is one bulk download
+        gap_groups: dict[tuple[pd.Timestamp, pd.Timestamp], list[str]] = {}
+        fetched_symbols: set[str] = set()
+        for symbol in options.symbols:
+            for gap in store.missing_ranges(
+                symbol, start, end, interval=interval, source=source
+            ):
+                gap_groups.setdefault(gap, []).append(symbol)
+                fetched_symbols.add(symbol)
+
+        logger.debug(
+            "Bar store gap analysis",
+            symbol_count=len(options.symbols),
+            symbols_to_fetch=len(fetched_symbols),
+            download_count=len(gap_groups),
+        )
+
+        for (gap_start, gap_end), symbols in gap_groups.items():
+            gap_options = FetchOptions(
+                symbols=symbols,
+                start_date=gap_start.to_pydatetime(),
+                end_date=gap_end.to_pydatetime(),
+                interval=options.interval,
+                source=options.source,
+                use_cache=False,
+                retry_config=options.retry_config,
+            )
+            bulk_data = self._fetch_bulk(gap_options)
+            coverage_end = min(gap_end, today)
+            # Weekend-only gaps legitimately have no bars
+            no_sessions = (
+                len(pd.bdate_range(gap_start, coverage_end, inclusive="left")) == 0
+            )
+
+            for result in self._create_results_from_bulk(bulk_data, gap_options):
+                # A ticker that failed inside a bulk download comes back as
+                # an all-NaN column; drop those rows so it counts as empty
+                data = (
+                    result.data.dropna(how="all")
+                    if self._symbol_in_bulk(bulk_data, result.symbol, len(symbols))
+                    else result.data.iloc[:0]
+                )
+                if "error" in result.metadata or (
+                    data.empty
+                    and not (
+                        no_sessions
+                        or self._gap_between_coverage(
+                            store,
+                            result.symbol,
+                            (gap_start, coverage_end),
+                            interval=interval,
+                            source=source,
+                        )
+                    )
+                ):
+                    logger.warning(
+                        "Skipping bar store update for symbol",
+                        symbol=result.symbol,
+                        gap_start=str(gap_start),
+                        gap_end=str(gap_end),
+                        empty_download=bulk_data.empty,
+                    )
+                    continue
+                store.write(
+                    result.symbol,
+                    data,
+                    gap_start,
+                    coverage_end,
+                    interval=interval,
+                    source=source,
+                )
+
+        results: list[MarketDataResult] = []
+        for symbol in options.symbols:
+            data = store.read(symbol, start, end, interval=interval, source=source)
+            results.append(
+                self._create_result(
+                    symbol=symbol,
+                    data=data,
+                    from_cache=symbol not in fetched_symbols,
+                    metadata={
+                        "interval": options.interval.value,
+                        "source": "yfinance",
+                        "bulk_download": symbol in fetched_symbols,
+                        "bar_store": True,
+                    },
+                )
+            )
+
+        return results
+
+    @staticmethod
+    def _gap_between_coverage(
+        store: BarStore,
+        symbol: str,
+        gap: tuple[pd.Timestamp, pd.Timestamp],
+        *,
+        interval: str,
+        source: str,
+    ) -> bool:
+        """Check whether a gap is bounded by stored coverage on both sides.
+
+        yfinance has answered for the dates on either side of such a gap, so
+        an empty download for it means the exchange was closed (a holiday),
+        not that the request was throttled.
+        """
+        ranges = store.coverage(symbol, interval=interval, source=source)
+        return any(end == gap[0] for _, end in ranges) and any(
+            start == gap[1] for start, _ in ranges
+        )
+
+    @staticmethod
+    def _symbol_in_bulk(
+        bulk_data: pd.DataFrame,
+        symbol: str,
+        symbol_count: int,
+    ) -> bool:
+        """Check whether a download actually contains data for a symbol."""
+        if bulk_data.empty:
+            return False
+        if symbol_count == 1:
+            return True
+        if not isinstance(bulk_data.columns, pd.MultiIndex):
+            return False
+        return symbol in bulk_data.columns.get_level_values(1)
+
     def _validate_options(self, options: FetchOptions) -> None:
         """Validate fetch options before processing.
 
@@ -29,13 +29,37 @@ SinkType
     Enumeration of sink types.
 """
 
-from utils_core.logging import get_logger
+from typing import TYPE_CHECKING
 
-from .core.article import Article, ArticleSource, ContentType, Provider, Thumbnail
-from .core.result import FetchResult, RetryConfig
-from .core.sink import SinkProtocol, SinkType
-from .sinks.file import FileSink, WriteMode
-from .summarizer import Summarizer
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from utils_core.logging import get_logger
+
+    from .core.article import Article, ArticleSource, ContentType, Provider, Thumbnail
+    from .core.result import FetchResult, RetryConfig
+    from .core.sink import SinkProtocol, SinkType
+    from .sinks.file import FileSink, WriteMode
+    from .summarizer import Summarizer
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "get_logger": "utils_core.logging",
+    "Article": ".core.article",
+    "ArticleSource": ".core.article",
+    "ContentType": ".core.article",
+    "Provider": ".core.article",
+    "Thumbnail": ".core.article",
+    "FetchResult": ".core.result",
+    "RetryConfig": ".core.result",
+    "SinkProtocol": ".core.sink",
+    "SinkType": ".core.sink",
+    "FileSink": ".sinks.file",
+    "WriteMode": ".sinks.file",
+    "Summarizer": ".summarizer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Article",
@@ -6,7 +6,20 @@ from various sources (RSS feeds, yfinance, web scraping).
 The BaseCollector ABC defines the interface that all collectors must implement.
 """
 
-from news.collectors.base import BaseCollector
-from news.collectors.rss import RSSCollector
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from news.collectors.base import BaseCollector
+    from news.collectors.rss import RSSCollector
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BaseCollector": "news.collectors.base",
+    "RSSCollector": "news.collectors.rss",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["BaseCollector", "RSSCollector"]
@@ -17,6 +17,7 @@ Examples
 import asyncio
 import json
 import random
+from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -148,6 +149,33 @@ class RSSCollector(BaseCollector):
         - HTTP errors for individual feeds are logged but don't stop processing
         - Articles older than max_age_hours are filtered out
         """
+        all_articles: list[CollectedArticle] = []
+        async for articles in self.iter_collect(max_age_hours=max_age_hours):
+            all_articles.extend(articles)
+        return all_articles
+
+    async def iter_collect(
+        self,
+        max_age_hours: int = 168,
+    ) -> AsyncGenerator[list[CollectedArticle], None]:
+        """Collect articles feed by feed, yielding each feed's articles.
+
+        Same processing as ``collect()``, but the articles of every feed are
+        yielded as soon as that feed has been fetched, so that downstream
+        stages can start before the remaining feeds are collected.
+
+        Parameters
+        ----------
+        max_age_hours : int, optional
+            Maximum age of articles to collect in hours.
+            Default is 168 (7 days).
+
+        Yields
+        ------
+        list[CollectedArticle]
+            Articles of one feed after age and domain filtering.
+            Feeds that fail or have no remaining articles yield nothing.
+        """
         logger.info(
             "Starting RSS collection",
             max_age_hours=max_age_hours,
@@ -168,10 +196,9 @@ class RSSCollector(BaseCollector):
 
         if not enabled_presets:
             logger.info("No enabled presets found, returning empty list")
-            return []
+            return
 
-        # Collect articles from all enabled feeds
-        all_articles: list[CollectedArticle] = []
+        total_articles = 0
         cutoff_time = self._calculate_cutoff_time(max_age_hours)
 
         headers = self._build_headers()
@@ -183,7 +210,6 @@ class RSSCollector(BaseCollector):
                         preset=preset,
                         cutoff_time=cutoff_time,
                     )
-                    all_articles.extend(articles)
                     logger.debug(
                         "Feed processed",
                         feed_title=preset.title,
@@ -193,6 +219,12 @@ class RSSCollector(BaseCollector):
                     self._record_feed_error(preset, e, self._classify_error(e))
                     continue
 
+                # Apply domain filtering
+                filtered_articles = self._filter_blocked_domains(articles)
+                if filtered_articles:
+                    total_articles += len(filtered_articles)
+                    yield filtered_articles
+
         # Log summary if there were feed errors
         if self._feed_errors:
             logger.warning(
@@ -202,18 +234,13 @@ class RSSCollector(BaseCollector):
                 error_types=self._count_error_types(),
             )
 
-        # Apply domain filtering
-        filtered_articles = self._filter_blocked_domains(all_articles)
-
         logger.info(
             "RSS collection completed",
-            total_articles=len(filtered_articles),
+            total_articles=total_articles,
             successful_feeds=len(enabled_presets) - len(self._feed_errors),
             failed_feeds=len(self._feed_errors),
         )
 
-        return filtered_articles
-
     def _load_presets(self) -> list[PresetFeed]:
         """Load RSS feed presets from configuration file.
 
@@ -17,40 +17,80 @@ Examples
 '1.0'
 """
 
-from .models import (
-    DEFAULT_CONFIG_PATH,
-    # Category configuration models
-    CategoryLabelsConfig,
-    # Exception classes
-    ConfigError,
-    # Loader
-    ConfigLoader,
-    ConfigParseError,
-    ConfigValidationError,
-    # Workflow configuration models
-    DomainFilteringConfig,
-    ExtractionConfig,
-    # Basic configuration models
-    FileSinkConfig,
-    FilteringConfig,
-    GitHubConfig,
-    GitHubSinkConfig,
-    NewsConfig,
-    NewsWorkflowConfig,
-    OutputConfig,
-    PlaywrightFallbackConfig,
-    PublishingConfig,
-    RetryConfig,
-    RssConfig,
-    SettingsConfig,
-    SinksConfig,
-    SourcesConfig,
-    SummarizationConfig,
-    UserAgentRotationConfig,
-    YFinanceSearchSourceConfig,
-    YFinanceTickerSourceConfig,
-    load_config,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .models import (
+        DEFAULT_CONFIG_PATH,
+        # Category configuration models
+        CategoryLabelsConfig,
+        # Exception classes
+        ConfigError,
+        # Loader
+        ConfigLoader,
+        ConfigParseError,
+        ConfigValidationError,
+        # Workflow configuration models
+        DomainFilteringConfig,
+        ExtractionConfig,
+        # Basic configuration models
+        FileSinkConfig,
+        FilteringConfig,
+        GitHubConfig,
+        GitHubSinkConfig,
+        NewsConfig,
+        NewsWorkflowConfig,
+        OutputConfig,
+        PipelineConfig,
+        PlaywrightFallbackConfig,
+        PublishingConfig,
+        RetryConfig,
+        RssConfig,
+        SettingsConfig,
+        SinksConfig,
+        SourcesConfig,
+        SummarizationConfig,
+        UserAgentRotationConfig,
+        YFinanceSearchSourceConfig,
+        YFinanceTickerSourceConfig,
+        load_config,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "DEFAULT_CONFIG_PATH": ".models",
+    "CategoryLabelsConfig": ".models",
+    "ConfigError": ".models",
+    "ConfigLoader": ".models",
+    "ConfigParseError": ".models",
+    "ConfigValidationError": ".models",
+    "DomainFilteringConfig": ".models",
+    "ExtractionConfig": ".models",
+    "FileSinkConfig": ".models",
+    "FilteringConfig": ".models",
+    "GitHubConfig": ".models",
+    "GitHubSinkConfig": ".models",
+    "NewsConfig": ".models",
+    "NewsWorkflowConfig": ".models",
+    "OutputConfig": ".models",
+    "PipelineConfig": ".models",
+    "PlaywrightFallbackConfig": ".models",
+    "PublishingConfig": ".models",
+    "RetryConfig": ".models",
+    "RssConfig": ".models",
+    "SettingsConfig": ".models",
+    "SinksConfig": ".models",
+    "SourcesConfig": ".models",
+    "SummarizationConfig": ".models",
+    "UserAgentRotationConfig": ".models",
+    "YFinanceSearchSourceConfig": ".models",
+    "YFinanceTickerSourceConfig": ".models",
+    "load_config": ".models",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "DEFAULT_CONFIG_PATH",
@@ -68,6 +108,7 @@ __all__ = [
     "NewsConfig",
     "NewsWorkflowConfig",
     "OutputConfig",
+    "PipelineConfig",
     "PlaywrightFallbackConfig",
     "PublishingConfig",
     "RetryConfig",
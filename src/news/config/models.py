@@ -747,6 +747,9 @@ class SummarizationConfig(BaseModel):
         Maximum retry attempts for failed summarizations (default: 3).
     prompt_template : str
         Prompt template for the AI summarization.
+    cache_dir : str | None
+        Directory of the content-addressed summary cache. None disables
+        caching (default: None).
 
     Examples
     --------
@@ -755,6 +758,8 @@ class SummarizationConfig(BaseModel):
     3
     >>> config.timeout_seconds
     60
+    >>> config.cache_dir is None
+    True
     """
 
     concurrency: int = Field(
@@ -776,6 +781,10 @@ class SummarizationConfig(BaseModel):
         ...,
         description="Prompt template for AI summarization",
     )
+    cache_dir: str | None = Field(
+        default=None,
+        description="Directory of the summary cache (None disables caching)",
+    )
 
 
 class GitHubConfig(BaseModel):
@@ -1011,6 +1020,48 @@ class PublishingConfig(BaseModel):
     )
 
 
+class PipelineConfig(BaseModel):
+    """Execution mode configuration for the news workflow pipeline.
+
+    In the default staged mode each stage waits for the previous stage to
+    finish. In streaming mode collection, extraction, summarization and
+    (per_article) publishing run concurrently, connected by bounded queues,
+    so each article moves on as soon as its previous stage is done.
+
+    Parameters
+    ----------
+    streaming : bool
+        Whether to run the stages as an overlapping stream (default: False).
+    queue_size : int
+        Maximum number of articles waiting between two stages (default: 20).
+        A full queue blocks the upstream stage (backpressure).
+    publish_concurrency : int
+        Number of concurrent per-article publishing tasks in streaming
+        mode (default: 1).
+
+    Examples
+    --------
+    >>> config = PipelineConfig(streaming=True)
+    >>> config.queue_size
+    20
+    """
+
+    streaming: bool = Field(
+        default=False,
+        description="Whether to run the stages as an overlapping stream",
+    )
+    queue_size: int = Field(
+        default=20,
+        ge=1,
+        description="Maximum number of articles waiting between two stages",
+    )
+    publish_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Number of concurrent per-article publishing tasks",
+    )
+
+
 class CategoryLabelsConfig(BaseModel):
     """Category label mapping configuration.
 
@@ -1121,6 +1172,10 @@ class NewsWorkflowConfig(BaseModel):
         Output file configuration.
     domain_filtering : DomainFilteringConfig
         Domain filtering configuration for blocking specific sources.
+    publishing : PublishingConfig
+        Publishing format configuration.
+    pipeline : PipelineConfig
+        Pipeline execution mode configuration.
 
     Examples
     --------
@@ -1199,6 +1254,10 @@ class NewsWorkflowConfig(BaseModel):
         default_factory=PublishingConfig,
         description="Publishing format configuration",
     )
+    pipeline: PipelineConfig = Field(
+        default_factory=PipelineConfig,
+        description="Pipeline execution mode configuration",
+    )
     category_labels: CategoryLabelsConfig = Field(
         default_factory=CategoryLabelsConfig,
         description="Category label mapping configuration",
@@ -1,42 +1,74 @@
 """Core functionality of the news package."""
 
-from .article import (
-    Article,
-    ArticleSource,
-    ContentType,
-    Provider,
-    Thumbnail,
-)
-from .dedup import (
-    DuplicateChecker,
-)
-from .errors import (
-    NewsError,
-    RateLimitError,
-    SourceError,
-    ValidationError,
-)
-from .history import (
-    CollectionHistory,
-    CollectionRun,
-    SinkResult,
-    SourceStats,
-)
-from .processor import (
-    ProcessorProtocol,
-    ProcessorType,
-)
-from .result import (
-    FetchResult,
-    RetryConfig,
-)
-from .sink import (
-    SinkProtocol,
-    SinkType,
-)
-from .source import (
-    SourceProtocol,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .article import (
+        Article,
+        ArticleSource,
+        ContentType,
+        Provider,
+        Thumbnail,
+    )
+    from .dedup import (
+        DuplicateChecker,
+    )
+    from .errors import (
+        NewsError,
+        RateLimitError,
+        SourceError,
+        ValidationError,
+    )
+    from .history import (
+        CollectionHistory,
+        CollectionRun,
+        SinkResult,
+        SourceStats,
+    )
+    from .processor import (
+        ProcessorProtocol,
+        ProcessorType,
+    )
+    from .result import (
+        FetchResult,
+        RetryConfig,
+    )
+    from .sink import (
+        SinkProtocol,
+        SinkType,
+    )
+    from .source import (
+        SourceProtocol,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "Article": ".article",
+    "ArticleSource": ".article",
+    "ContentType": ".article",
+    "Provider": ".article",
+    "Thumbnail": ".article",
+    "DuplicateChecker": ".dedup",
+    "NewsError": ".errors",
+    "RateLimitError": ".errors",
+    "SourceError": ".errors",
+    "ValidationError": ".errors",
+    "CollectionHistory": ".history",
+    "CollectionRun": ".history",
+    "SinkResult": ".history",
+    "SourceStats": ".history",
+    "ProcessorProtocol": ".processor",
+    "ProcessorType": ".processor",
+    "FetchResult": ".result",
+    "RetryConfig": ".result",
+    "SinkProtocol": ".sink",
+    "SinkType": ".sink",
+    "SourceProtocol": ".source",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__: list[str] = [
     "Article",
@@ -32,10 +32,25 @@ Examples
 ...     result = await extractor.extract(article)
 """
 
-from news.extractors.base import BaseExtractor
-from news.extractors.playwright import PlaywrightExtractor
-from news.extractors.rate_limiter import DomainRateLimiter
-from news.extractors.trafilatura import TrafilaturaExtractor
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from news.extractors.base import BaseExtractor
+    from news.extractors.playwright import PlaywrightExtractor
+    from news.extractors.rate_limiter import DomainRateLimiter
+    from news.extractors.trafilatura import TrafilaturaExtractor
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BaseExtractor": "news.extractors.base",
+    "PlaywrightExtractor": "news.extractors.playwright",
+    "DomainRateLimiter": "news.extractors.rate_limiter",
+    "TrafilaturaExtractor": "news.extractors.trafilatura",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BaseExtractor",
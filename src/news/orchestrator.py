@@ -10,6 +10,10 @@ Pipeline formats:
 The orchestrator manages the workflow execution, filtering only successful
 articles at each stage, and constructing comprehensive WorkflowResult.
 
+With ``pipeline.streaming`` enabled the stages up to summarization (and
+per-article publishing) run concurrently, connected by bounded queues, so
+the end-to-end time approaches that of the slowest stage.
+
 Examples
 --------
 >>> from news.orchestrator import NewsWorkflowOrchestrator
@@ -23,9 +27,10 @@ Examples
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections import defaultdict
-from contextlib import contextmanager
+from contextlib import aclosing, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -56,6 +61,8 @@ from news.summarizer import Summarizer
 from utils_core.logging import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from news.config.models import NewsWorkflowConfig
 
 logger = get_logger(__name__, module="orchestrator")
@@ -113,6 +120,7 @@ class NewsWorkflowOrchestrator:
     - Supports status filtering and max_articles limit
     - dry_run mode skips actual Issue creation
     - export_only mode exports Markdown without creating Issues
+    - pipeline.streaming overlaps the stages through bounded queues
     """
 
     def __init__(
@@ -152,6 +160,7 @@ class NewsWorkflowOrchestrator:
             extraction_concurrency=config.extraction.concurrency,
             summarization_concurrency=config.summarization.concurrency,
             publish_format=self._publish_format,
+            streaming=config.pipeline.streaming,
         )
 
     def _log_stage_start(self, stage: str, description: str) -> None:
@@ -253,7 +262,18 @@ class NewsWorkflowOrchestrator:
         WorkflowResult
             Comprehensive result containing statistics, failure records,
             timestamps, published articles, and category results.
+
+        Notes
+        -----
+        When ``config.pipeline.streaming`` is True, the stages are run
+        concurrently by ``_run_streaming()``. Results are the same as in the
+        staged run, except that articles appear in completion order.
         """
+        if self._config.pipeline.streaming:
+            return await self._run_streaming(
+                statuses, max_articles, dry_run, export_only
+            )
+
         is_per_category = self._publish_format == "per_category"
         total_stages = 6 if is_per_category else 4
         started_at = datetime.now(timezone.utc)
@@ -652,6 +672,359 @@ class NewsWorkflowOrchestrator:
             extra=f"({', '.join(extra_parts)})",
         )
 
+    # ------------------------------------------------------------------
+    # Streaming mode
+    # ------------------------------------------------------------------
+
+    async def _run_streaming(
+        self,
+        statuses: list[str] | None,
+        max_articles: int | None,
+        dry_run: bool,
+        export_only: bool,
+    ) -> WorkflowResult:
+        """Execute the workflow with overlapping stages.
+
+        Collection, extraction, summarization and (per_article) publishing
+        run as concurrent stages connected by ``asyncio.Queue`` instances of
+        size ``pipeline.queue_size``. Each stage has its own number of
+        workers (``extraction.concurrency``, ``summarization.concurrency``,
+        ``pipeline.publish_concurrency``) and a full queue blocks the stage
+        feeding it. Grouping, export and category publishing need every
+        summary, so in per_category format they run after the stream.
+
+        Parameters
+        ----------
+        statuses : list[str] | None
+            Filter articles by status. None means no filtering.
+        max_articles : int | None
+            Maximum number of articles to process. None means no limit.
+        dry_run : bool
+            If True, skip actual Issue creation.
+        export_only : bool
+            If True, export Markdown only without creating Issues.
+
+        Returns
+        -------
+        WorkflowResult
+            Same result as ``run()`` in staged mode. Each StageMetrics
+            covers the time from the start of the stream until the stage
+            has processed its last article.
+        """
+        is_per_category = self._publish_format == "per_category"
+        total_stages = 6 if is_per_category else 4
+        streamed_stages = 3 if is_per_category else 4
+        started_at = datetime.now(timezone.utc)
+        stage_metrics_list: list[StageMetrics] = []
+        pipeline = self._config.pipeline
+
+        self._log_config(statuses, max_articles, dry_run, export_only, is_per_category)
+        self._callback.on_info(
+            f"  実行モード: ストリーミング (キュー上限: {pipeline.queue_size}件)"
+        )
+        self._log_stage_start(
+            f"1-{streamed_stages}/{total_stages}",
+            "収集・抽出・要約"
+            + ("" if is_per_category else "・公開")
+            + "をストリーミング実行",
+        )
+
+        existing_urls = await self._publisher.get_existing_urls()
+
+        collected: list[CollectedArticle] = []
+        extracted: list[ExtractedArticle] = []
+        summarized: list[SummarizedArticle] = []
+        published: list[PublishedArticle] = []
+        early_dedup = {"count": 0}
+
+        extract_queue: asyncio.Queue[CollectedArticle | None] = asyncio.Queue(
+            maxsize=pipeline.queue_size
+        )
+        summarize_queue: asyncio.Queue[ExtractedArticle | None] = asyncio.Queue(
+            maxsize=pipeline.queue_size
+        )
+        publish_queue: asyncio.Queue[SummarizedArticle | None] | None = (
+            None if is_per_category else asyncio.Queue(maxsize=pipeline.queue_size)
+        )
+
+        async def extract(article: CollectedArticle) -> ExtractedArticle | None:
+            result = await self._extractor.extract(article)
+            extracted.append(result)
+            self._log_item_result(
+                len(extracted),
+                len(collected),
+                article.title,
+                url=str(article.url),
+                failure_event="Extraction failed",
+                error_message=result.error_message,
+                is_error=result.extraction_status != ExtractionStatus.SUCCESS,
+            )
+            if result.extraction_status == ExtractionStatus.SUCCESS:
+                return result
+            return None
+
+        async def summarize(article: ExtractedArticle) -> SummarizedArticle | None:
+            result = await self._summarizer.summarize(article)
+            summarized.append(result)
+            self._log_item_result(
+                len(summarized),
+                len(collected),
+                article.collected.title,
+                url=str(article.collected.url),
+                failure_event="Summarization failed",
+                error_message=result.error_message,
+                is_error=result.summarization_status != SummarizationStatus.SUCCESS,
+            )
+            if result.summarization_status == SummarizationStatus.SUCCESS:
+                return result
+            return None
+
+        async def publish(article: SummarizedArticle) -> None:
+            result = await self._publisher.publish_checked(
+                article, existing_urls, dry_run=dry_run
+            )
+            published.append(result)
+            self._log_item_result(
+                len(published),
+                len(collected),
+                article.extracted.collected.title,
+                url=str(article.extracted.collected.url),
+                failure_event="Publication failed",
+                error_message=result.error_message,
+                is_error=result.publication_status == PublicationStatus.FAILED,
+            )
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(
+                self._stream_collection(
+                    statuses,
+                    max_articles,
+                    existing_urls,
+                    outbox=extract_queue,
+                    collected=collected,
+                    early_dedup=early_dedup,
+                    stage_metrics_list=stage_metrics_list,
+                )
+            )
+            tg.create_task(
+                self._stream_stage(
+                    "extraction",
+                    extract_queue,
+                    summarize_queue,
+                    extract,
+                    concurrency=self._config.extraction.concurrency,
+                    stage_metrics_list=stage_metrics_list,
+                )
+            )
+            tg.create_task(
+                self._stream_stage(
+                    "summarization",
+                    summarize_queue,
+                    publish_queue,
+                    summarize,
+                    concurrency=self._config.summarization.concurrency,
+                    stage_metrics_list=stage_metrics_list,
+                )
+            )
+            if publish_queue is not None:
+                tg.create_task(
+                    self._stream_stage(
+                        "publishing",
+                        publish_queue,
+                        None,
+                        publish,
+                        concurrency=pipeline.publish_concurrency,
+                        stage_metrics_list=stage_metrics_list,
+                    )
+                )
+
+        feed_errors = self._collector.feed_errors
+        if not collected:
+            logger.info("No articles to process after filtering")
+            self._callback.on_info("  -> 処理対象の記事がありません")
+            return self._finalize_empty(started_at, feed_errors, stage_metrics_list)
+
+        domain_rates = self._compute_domain_extraction_rates(extracted)
+        summarized_success = [
+            s
+            for s in summarized
+            if s.summarization_status == SummarizationStatus.SUCCESS
+        ]
+        self._log_streaming_result(
+            collected, extracted, summarized_success, published, stage_metrics_list
+        )
+
+        category_results: list[CategoryPublishResult] = []
+        if not summarized_success:
+            self._callback.on_info("  -> 要約成功した記事がありません")
+        elif is_per_category:
+            category_results = await self._run_per_category_publishing(
+                summarized_success,
+                dry_run,
+                export_only,
+                total_stages,
+                stage_metrics_list,
+            )
+
+        finished_at = datetime.now(timezone.utc)
+        result = self._build_result(
+            collected=collected,
+            extracted=extracted,
+            summarized=summarized,
+            published=published,
+            started_at=started_at,
+            finished_at=finished_at,
+            early_duplicates=early_dedup["count"],
+            feed_errors=feed_errors,
+            category_results=category_results,
+            stage_metrics=stage_metrics_list,
+            domain_extraction_rates=domain_rates,
+        )
+        self._save_result(result)
+        self._log_final_summary(result)
+        return result
+
+    async def _stream_collection(
+        self,
+        statuses: list[str] | None,
+        max_articles: int | None,
+        existing_urls: set[str],
+        *,
+        outbox: asyncio.Queue[CollectedArticle | None],
+        collected: list[CollectedArticle],
+        early_dedup: dict[str, int],
+        stage_metrics_list: list[StageMetrics],
+    ) -> None:
+        """Collect feed by feed and queue every article that passes the filters.
+
+        Applies the same status filter, ``max_articles`` limit and early
+        duplicate check as ``_run_collection()``, article by article. Once
+        the limit is reached the remaining feeds are not fetched.
+        """
+        with self._timed_stage(stage_metrics_list, "collection") as ctx:
+            accepted = 0
+            feeds = self._collector.iter_collect(
+                max_age_hours=self._config.filtering.max_age_hours
+            )
+            async with aclosing(feeds):
+                async for feed_articles in feeds:
+                    ctx["item_count"] += len(feed_articles)
+                    if statuses:
+                        feed_articles = self._filter_by_status(feed_articles, statuses)
+                    for article in feed_articles:
+                        if max_articles and accepted >= max_articles:
+                            break
+                        accepted += 1
+                        if self._publisher.is_duplicate_url(
+                            str(article.url), existing_urls
+                        ):
+                            early_dedup["count"] += 1
+                            continue
+                        collected.append(article)
+                        await outbox.put(article)
+                    if max_articles and accepted >= max_articles:
+                        logger.info("Article limit applied", limit=max_articles)
+                        break
+
+        # End of stream. On failure the task group cancels the other stages.
+        await outbox.put(None)
+        logger.info(
+            "Collection completed",
+            count=len(collected),
+            early_duplicates=early_dedup["count"],
+        )
+
+    async def _stream_stage[T, R](
+        self,
+        stage_name: str,
+        inbox: asyncio.Queue[T | None],
+        outbox: asyncio.Queue[R | None] | None,
+        process: Callable[[T], Awaitable[R | None]],
+        *,
+        concurrency: int,
+        stage_metrics_list: list[StageMetrics],
+    ) -> None:
+        """Run ``concurrency`` workers that move items from inbox to outbox.
+
+        Each worker takes an item from ``inbox``, awaits ``process`` and
+        puts a non-None result into ``outbox`` (blocking while it is full).
+        ``None`` in the inbox marks the end of the stream: the worker that
+        receives it puts it back for the other workers and stops. When all
+        workers have stopped, the end marker is forwarded downstream.
+        """
+
+        async def worker() -> None:
+            while True:
+                item = await inbox.get()
+                if item is None:
+                    # The slot just freed cannot be taken: upstream has finished
+                    inbox.put_nowait(None)
+                    return
+                result = await process(item)
+                ctx["item_count"] += 1
+                if outbox is not None and result is not None:
+                    await outbox.put(result)
+
+        with self._timed_stage(
+            stage_metrics_list, stage_name, concurrency=concurrency
+        ) as ctx:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(concurrency):
+                    tg.create_task(worker())
+
+        if outbox is not None:
+            await outbox.put(None)
+
+    def _log_item_result(
+        self,
+        current: int,
+        total: int,
+        title: str,
+        *,
+        url: str,
+        failure_event: str,
+        error_message: str | None,
+        is_error: bool,
+    ) -> None:
+        """Report the outcome of one streamed article."""
+        title = title[:40] + "..." if len(title) > 40 else title
+        if not is_error:
+            self._log_progress(current, total, title)
+            return
+        self._log_progress(current, total, f"{title} - {error_message}", is_error=True)
+        logger.error(failure_event, url=url, error=error_message)
+
+    def _log_streaming_result(
+        self,
+        collected: list[CollectedArticle],
+        extracted: list[ExtractedArticle],
+        summarized_success: list[SummarizedArticle],
+        published: list[PublishedArticle],
+        stage_metrics_list: list[StageMetrics],
+    ) -> None:
+        """Report per-stage completion after the stream has drained."""
+        elapsed = {m.stage: m.elapsed_seconds for m in stage_metrics_list}
+        extracted_success = sum(
+            1 for e in extracted if e.extraction_status == ExtractionStatus.SUCCESS
+        )
+        self._callback.on_info(
+            f"  収集完了: {len(collected)}件 ({elapsed['collection']:.1f}秒)"
+        )
+        self._log_stage_complete(
+            "抽出",
+            extracted_success,
+            len(extracted),
+            extra=f"({elapsed['extraction']:.1f}秒)",
+        )
+        self._log_stage_complete(
+            "要約",
+            len(summarized_success),
+            extracted_success,
+            extra=f"({elapsed['summarization']:.1f}秒)",
+        )
+        if "publishing" in elapsed:
+            self._log_publish_result_article(published, stage_metrics_list)
+
     def _finalize_empty(
         self,
         started_at: datetime,
@@ -6,16 +6,37 @@ It also provides the Pipeline class for orchestrating Source -> Processor -> Sin
 chain execution.
 """
 
-from .agent_base import AgentProcessor, AgentProcessorError, SDKNotInstalledError
-from .classifier import ClassifierProcessor
-from .pipeline import (
-    Pipeline,
-    PipelineConfig,
-    PipelineError,
-    PipelineResult,
-    StageError,
-)
-from .summarizer import SummarizerProcessor
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent_base import AgentProcessor, AgentProcessorError, SDKNotInstalledError
+    from .classifier import ClassifierProcessor
+    from .pipeline import (
+        Pipeline,
+        PipelineConfig,
+        PipelineError,
+        PipelineResult,
+        StageError,
+    )
+    from .summarizer import SummarizerProcessor
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "AgentProcessor": ".agent_base",
+    "AgentProcessorError": ".agent_base",
+    "SDKNotInstalledError": ".agent_base",
+    "ClassifierProcessor": ".classifier",
+    "Pipeline": ".pipeline",
+    "PipelineConfig": ".pipeline",
+    "PipelineError": ".pipeline",
+    "PipelineResult": ".pipeline",
+    "StageError": ".pipeline",
+    "SummarizerProcessor": ".summarizer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "AgentProcessor",
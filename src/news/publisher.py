@@ -289,53 +289,14 @@ class Publisher:
         existing_urls = await self._get_existing_issues(days=7)
 
         results: list[PublishedArticle] = []
-        duplicate_count = 0
-
         for article in articles:
-            # 要約がない場合はスキップ
-            if article.summary is None:
-                result = PublishedArticle(
-                    summarized=article,
-                    issue_number=None,
-                    issue_url=None,
-                    publication_status=PublicationStatus.SKIPPED,
-                    error_message="No summary available",
-                )
-                results.append(result)
-                continue
-
-            # 重複チェック
-            if self._is_duplicate(article, existing_urls):
-                duplicate_count += 1
-                result = PublishedArticle(
-                    summarized=article,
-                    issue_number=None,
-                    issue_url=None,
-                    publication_status=PublicationStatus.DUPLICATE,
-                    error_message="Duplicate article detected",
-                )
-                results.append(result)
-                continue
-
-            # ドライランの場合は Issue 作成をスキップ
-            if dry_run:
-                logger.info(
-                    "[DRY RUN] Would create issue",
-                    title=article.extracted.collected.title,
-                    url=str(article.extracted.collected.url),
-                )
-                result = PublishedArticle(
-                    summarized=article,
-                    issue_number=None,
-                    issue_url=None,
-                    publication_status=PublicationStatus.SUCCESS,
-                )
-                results.append(result)
-                continue
-
-            result = await self.publish(article)
+            result = await self.publish_checked(article, existing_urls, dry_run=dry_run)
             results.append(result)
 
+        duplicate_count = sum(
+            1 for r in results if r.publication_status == PublicationStatus.DUPLICATE
+        )
+
         logger.info(
             "Batch publish completed",
             total=len(results),
@@ -353,6 +314,77 @@ class Publisher:
 
         return results
 
+    async def publish_checked(
+        self,
+        article: SummarizedArticle,
+        existing_urls: set[str],
+        dry_run: bool = False,
+    ) -> PublishedArticle:
+        """重複チェック付きで単一記事を公開。
+
+        publish_batch() の記事単位の処理。既存 Issue の URL セットを
+        呼び出し側で一度だけ取得しておき、記事ごとに呼び出す用途
+        （ストリーミング実行など）で使用する。
+
+        Parameters
+        ----------
+        article : SummarizedArticle
+            要約済み記事。
+        existing_urls : set[str]
+            既存 Issue の URL セット。get_existing_urls() で取得する。
+        dry_run : bool, optional
+            True の場合、実際の Issue 作成をスキップする。
+            デフォルトは False。
+
+        Returns
+        -------
+        PublishedArticle
+            公開結果。要約なしは SKIPPED、重複は DUPLICATE、
+            dry_run 時は Issue 番号なしの SUCCESS となる。
+
+        Examples
+        --------
+        >>> existing = await publisher.get_existing_urls()
+        >>> result = await publisher.publish_checked(article, existing, dry_run=True)
+        >>> result.publication_status
+        <PublicationStatus.SUCCESS: 'success'>
+        """
+        # 要約がない場合はスキップ
+        if article.summary is None:
+            return PublishedArticle(
+                summarized=article,
+                issue_number=None,
+                issue_url=None,
+                publication_status=PublicationStatus.SKIPPED,
+                error_message="No summary available",
+            )
+
+        # 重複チェック
+        if self._is_duplicate(article, existing_urls):
+            return PublishedArticle(
+                summarized=article,
+                issue_number=None,
+                issue_url=None,
+                publication_status=PublicationStatus.DUPLICATE,
+                error_message="Duplicate article detected",
+            )
+
+        # ドライランの場合は Issue 作成をスキップ
+        if dry_run:
+            logger.info(
+                "[DRY RUN] Would create issue",
+                title=article.extracted.collected.title,
+                url=str(article.extracted.collected.url),
+            )
+            return PublishedArticle(
+                summarized=article,
+                issue_number=None,
+                issue_url=None,
+                publication_status=PublicationStatus.SUCCESS,
+            )
+
+        return await self.publish(article)
+
     async def publish_category_batch(
         self,
         groups: list[CategoryGroup],
@@ -37,6 +37,10 @@ Enable verbose logging:
 
     python -m news.scripts.finance_news_workflow --verbose
 
+Overlap collection, extraction, summarization and publishing:
+
+    python -m news.scripts.finance_news_workflow --streaming
+
 Use a specific config file:
 
     python -m news.scripts.finance_news_workflow --config data/config/news-collection-config.yaml
@@ -168,6 +172,7 @@ examples:
   %(prog)s --export-only                  Export Markdown only, skip Issue creation
   %(prog)s --status index,stock           Filter by status
   %(prog)s --max-articles 10              Limit to 10 articles
+  %(prog)s --streaming                    Overlap stages through bounded queues
   %(prog)s --config config.yaml           Use specific config file
 """,
     )
@@ -215,6 +220,13 @@ examples:
         help="Export Markdown files only, skip GitHub Issue creation",
     )
 
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=False,
+        help="Run stages concurrently through bounded queues (overrides config)",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -309,6 +321,7 @@ async def run_workflow(
     max_articles: int | None = None,
     publish_format: str = "per-category",
     export_only: bool = False,
+    streaming: bool = False,
 ) -> int:
     """Run the workflow asynchronously.
 
@@ -326,6 +339,9 @@ async def run_workflow(
         Publishing format: "per-category" (default) or "per-article" (legacy).
     export_only : bool, optional
         If True, export Markdown only without creating Issues. Default is False.
+    streaming : bool, optional
+        If True, enable the streaming pipeline regardless of the config file.
+        Default is False (use ``pipeline.streaming`` from the config).
 
     Returns
     -------
@@ -340,6 +356,7 @@ async def run_workflow(
         max_articles=max_articles,
         publish_format=publish_format,
         export_only=export_only,
+        streaming=streaming,
     )
 
     try:
@@ -349,6 +366,8 @@ async def run_workflow(
         # Convert CLI format ("per-category") to config format ("per_category")
         config_format = publish_format.replace("-", "_")
         config.publishing.format = config_format
+        if streaming:
+            config.pipeline.streaming = True
 
         orchestrator = NewsWorkflowOrchestrator(config)
 
@@ -423,6 +442,7 @@ def main(argv: list[str] | None = None) -> int:
         verbose=args.verbose,
         format=args.format,
         export_only=args.export_only,
+        streaming=args.streaming,
     )
 
     # Determine config path
@@ -440,6 +460,7 @@ def main(argv: list[str] | None = None) -> int:
             max_articles=args.max_articles,
             publish_format=args.format,
             export_only=args.export_only,
+            streaming=args.streaming,
         )
     )
 
@@ -11,8 +11,23 @@ GitHubSink
     GitHub Issue/Project output with duplicate checking and Project integration.
 """
 
-from .file import FileSink, WriteMode
-from .github import GitHubSink, GitHubSinkConfig
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .file import FileSink, WriteMode
+    from .github import GitHubSink, GitHubSinkConfig
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "FileSink": ".file",
+    "WriteMode": ".file",
+    "GitHubSink": ".github",
+    "GitHubSinkConfig": ".github",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "FileSink",
@@ -21,24 +21,51 @@ stock
     StockNewsSource for individual stocks (MAG7 and sector representatives).
 """
 
-from .base import (
-    DEFAULT_DELAY_JITTER,
-    DEFAULT_POLITE_DELAY,
-    DEFAULT_YFINANCE_RETRY_CONFIG,
-    apply_polite_delay,
-    fetch_all_with_polite_delay,
-    fetch_with_retry,
-    search_news_to_article,
-    ticker_news_to_article,
-    validate_query,
-    validate_ticker,
-)
-from .commodity import CommodityNewsSource
-from .index import IndexNewsSource
-from .macro import MacroNewsSource
-from .search import SearchNewsSource
-from .sector import SectorNewsSource
-from .stock import StockNewsSource
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import (
+        DEFAULT_DELAY_JITTER,
+        DEFAULT_POLITE_DELAY,
+        DEFAULT_YFINANCE_RETRY_CONFIG,
+        apply_polite_delay,
+        fetch_all_with_polite_delay,
+        fetch_with_retry,
+        search_news_to_article,
+        ticker_news_to_article,
+        validate_query,
+        validate_ticker,
+    )
+    from .commodity import CommodityNewsSource
+    from .index import IndexNewsSource
+    from .macro import MacroNewsSource
+    from .search import SearchNewsSource
+    from .sector import SectorNewsSource
+    from .stock import StockNewsSource
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "DEFAULT_DELAY_JITTER": ".base",
+    "DEFAULT_POLITE_DELAY": ".base",
+    "DEFAULT_YFINANCE_RETRY_CONFIG": ".base",
+    "apply_polite_delay": ".base",
+    "fetch_all_with_polite_delay": ".base",
+    "fetch_with_retry": ".base",
+    "search_news_to_article": ".base",
+    "ticker_news_to_article": ".base",
+    "validate_query": ".base",
+    "validate_ticker": ".base",
+    "CommodityNewsSource": ".commodity",
+    "IndexNewsSource": ".index",
+    "MacroNewsSource": ".macro",
+    "SearchNewsSource": ".search",
+    "SectorNewsSource": ".sector",
+    "StockNewsSource": ".stock",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "DEFAULT_DELAY_JITTER",
@@ -7,7 +7,7 @@ polite delay between requests, and input validation.
 Functions
 ---------
 apply_polite_delay
-    Apply a polite delay between requests (NasdaqSession pattern).
+    Wait for the next Yahoo Finance request slot (NasdaqSession pattern).
 ticker_news_to_article
     Convert yfinance Ticker.news data to Article model.
 search_news_to_article
@@ -41,6 +41,7 @@ from pydantic import HttpUrl
 from pydantic import ValidationError as PydanticValidationError
 
 from utils_core.logging import get_logger
+from utils_core.rate_limit import get_rate_scheduler
 
 from ...core.article import (
     Article,
@@ -77,6 +78,9 @@ _MAX_QUERY_LENGTH = 200
 DEFAULT_POLITE_DELAY: float = 1.0
 DEFAULT_DELAY_JITTER: float = 0.5
 
+# Scheduler key shared by all yfinance sources in the process
+YFINANCE_RATE_KEY: str = "finance.yahoo.com"
+
 
 def _get_yfinance_retry_config() -> RetryConfig:
     """Build the default retry configuration for yfinance sources.
@@ -113,10 +117,14 @@ def apply_polite_delay(
     polite_delay: float = DEFAULT_POLITE_DELAY,
     jitter: float = DEFAULT_DELAY_JITTER,
 ) -> float:
-    """Apply a polite delay between requests.
+    """Wait for the next Yahoo Finance request slot.
 
-    Follows the NasdaqSession pattern for rate-limiting courtesy.
-    The actual delay is ``polite_delay + random.uniform(0, jitter)``.
+    Follows the NasdaqSession pattern for rate-limiting courtesy. All
+    yfinance sources share one schedule (``YFINANCE_RATE_KEY``) in the
+    process-wide rate scheduler. Each call reserves a slot
+    ``polite_delay + random.uniform(0, jitter)`` seconds after the previous
+    one and waits only for the part of that interval not yet elapsed, so
+    the first request after an idle period is sent immediately.
 
     Parameters
     ----------
@@ -134,13 +142,15 @@ def apply_polite_delay(
     Examples
     --------
     >>> from unittest.mock import patch
-    >>> with patch("news.sources.yfinance.base.time.sleep"):
-    ...     delay = apply_polite_delay(polite_delay=1.0, jitter=0.0)
-    >>> delay
-    1.0
+    >>> get_rate_scheduler().reset(YFINANCE_RATE_KEY)
+    >>> with patch("utils_core.rate_limit.time.sleep"):
+    ...     first = apply_polite_delay(polite_delay=1.0, jitter=0.0)
+    ...     second = apply_polite_delay(polite_delay=1.0, jitter=0.0)
+    >>> first, round(second, 1)
+    (0.0, 1.0)
     """
-    actual_delay = polite_delay + random.uniform(0, jitter)  # nosec B311 - not used for security/crypto
-    time.sleep(actual_delay)
+    interval = max(0.0, polite_delay + random.uniform(0, jitter))  # nosec B311 - not used for security/crypto
+    actual_delay = get_rate_scheduler().acquire(YFINANCE_RATE_KEY, interval=interval)
     logger.debug("Polite delay applied", delay_seconds=actual_delay)
     return actual_delay
 
@@ -524,8 +534,9 @@ def fetch_all_with_polite_delay(
     """Fetch multiple identifiers with polite delays between requests.
 
     This is the common implementation for all yfinance source ``fetch_all``
-    methods.  A polite delay is inserted between each request to avoid
-    triggering Yahoo Finance rate limits.
+    methods.  Each request waits for its Yahoo Finance slot via
+    ``apply_polite_delay()`` to avoid triggering rate limits; the slots are
+    shared with every other yfinance source in the process.
 
     Parameters
     ----------
@@ -547,9 +558,8 @@ def fetch_all_with_polite_delay(
         return []
 
     results: list[FetchResult] = []
-    for i, identifier in enumerate(identifiers):
-        if i > 0:
-            apply_polite_delay()
+    for identifier in identifiers:
+        apply_polite_delay()
         result = fetch_func(identifier, count)
         results.append(result)
 
@@ -5,7 +5,9 @@ structured 4-section Japanese summaries of news articles.
 
 The Summarizer works with ExtractedArticle inputs (articles that have undergone
 body text extraction) and produces SummarizedArticle outputs with structured
-summaries.
+summaries. When ``summarization.cache_dir`` is configured, summaries are
+stored in a content-addressed cache (see ``news.summary_cache``) and reused
+for articles with the same normalized body and prompt version.
 
 Claude Agent SDK Types
 ----------------------
@@ -31,9 +33,11 @@ Examples
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import re
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from pydantic import ValidationError
 
@@ -43,6 +47,7 @@ from news.models import (
     SummarizationStatus,
     SummarizedArticle,
 )
+from news.summary_cache import CachedSummary, SummaryCache
 from utils_core.logging import get_logger
 
 if TYPE_CHECKING:
@@ -50,6 +55,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__, module="summarizer")
 
+# 要約キャッシュのキーに含めるプロンプトバージョン。
+# _build_prompt / _parse_response の出力が変わる変更をしたら上げること。
+PROMPT_VERSION = 1
+
 
 class EmptyResponseError(Exception):
     """Claude Agent SDK が空レスポンスを返した場合の例外。
@@ -90,12 +99,19 @@ class Summarizer:
         最大リトライ回数。
     _timeout_seconds : int
         タイムアウト秒数。
+    _prompt_version : str
+        キャッシュキーに使うプロンプトバージョン（PROMPT_VERSION と
+        プロンプトテンプレートのハッシュ）。
+    _cache : SummaryCache | None
+        要約キャッシュ。summarization.cache_dir 未設定時は None。
 
     Notes
     -----
     - 事前に `claude` コマンドで認証が必要
     - CI/CD では環境変数 ANTHROPIC_API_KEY を設定
     - 本文抽出が失敗している記事（body_text が None）は SKIPPED ステータスで返す
+    - キャッシュ有効時、正規化した本文とプロンプトバージョンが同じ記事は
+      Claude を呼び出さずキャッシュ済みの要約を返す
 
     Examples
     --------
@@ -120,6 +136,12 @@ class Summarizer:
         self._prompt_template = config.summarization.prompt_template
         self._max_retries = config.summarization.max_retries
         self._timeout_seconds = config.summarization.timeout_seconds
+        template_hash = hashlib.sha256(self._prompt_template.encode()).hexdigest()
+        self._prompt_version = f"{PROMPT_VERSION}:{template_hash[:12]}"
+        cache_dir = config.summarization.cache_dir
+        self._cache = SummaryCache(cache_dir) if cache_dir else None
+        # プロンプト -> 直近の SDK 呼び出しのメタデータ（モデル、トークン使用量）
+        self._call_metadata: dict[str, dict[str, Any]] = {}
 
         logger.debug(
             "Summarizer initialized",
@@ -127,6 +149,7 @@ class Summarizer:
             concurrency=config.summarization.concurrency,
             timeout_seconds=self._timeout_seconds,
             max_retries=self._max_retries,
+            cache_dir=cache_dir,
         )
 
     async def summarize(self, article: ExtractedArticle) -> SummarizedArticle:
@@ -155,6 +178,7 @@ class Summarizer:
         - 非同期メソッドとして実装されており、await が必要
         - Claude Agent SDK を使用して Claude API を呼び出す
         - asyncio.timeout でタイムアウト処理を実装
+        - キャッシュにヒットした場合は Claude を呼び出さない
 
         Examples
         --------
@@ -183,6 +207,97 @@ class Summarizer:
                 error_message="No body text available",
             )
 
+        cache_key = self._cache_key(article.body_text)
+        cached = self._lookup_cache(article, cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._generate_summary(article, cache_key)
+
+    def _cache_key(self, body_text: str) -> str:
+        """本文とプロンプトバージョンからキャッシュキーを計算する。"""
+        return SummaryCache.key_for(body_text, self._prompt_version)
+
+    def _lookup_cache(
+        self, article: ExtractedArticle, cache_key: str
+    ) -> SummarizedArticle | None:
+        """キャッシュ済みの要約があれば SUCCESS の結果として返す。
+
+        Parameters
+        ----------
+        article : ExtractedArticle
+            本文抽出済み記事。
+        cache_key : str
+            _cache_key で計算したキー。
+
+        Returns
+        -------
+        SummarizedArticle | None
+            キャッシュヒット時は要約結果、キャッシュ無効またはミス時は None。
+        """
+        if self._cache is None:
+            return None
+
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+
+        logger.info(
+            "Summary cache hit",
+            article_url=str(article.collected.url),
+            cached_from=entry.source_url,
+            model=entry.model,
+        )
+        return SummarizedArticle(
+            extracted=article,
+            summary=entry.summary,
+            summarization_status=SummarizationStatus.SUCCESS,
+            error_message=None,
+        )
+
+    def _store_cache(
+        self,
+        article: ExtractedArticle,
+        cache_key: str,
+        summary: StructuredSummary,
+        *,
+        metadata: dict[str, Any],
+        duration_ms: int,
+    ) -> None:
+        """成功した要約を SDK 呼び出しのメタデータと共にキャッシュする。"""
+        if self._cache is None:
+            return
+
+        self._cache.put(
+            CachedSummary(
+                key=cache_key,
+                prompt_version=self._prompt_version,
+                summary=summary,
+                source_url=str(article.collected.url),
+                model=metadata.get("model"),
+                duration_ms=duration_ms,
+                usage=metadata.get("usage") or {},
+                total_cost_usd=metadata.get("total_cost_usd"),
+            )
+        )
+
+    async def _generate_summary(
+        self, article: ExtractedArticle, cache_key: str
+    ) -> SummarizedArticle:
+        """Claude Agent SDK で要約を生成する（リトライ付き）。
+
+        Parameters
+        ----------
+        article : ExtractedArticle
+            本文を持つ抽出済み記事。
+        cache_key : str
+            成功時に要約を保存するキャッシュキー。
+
+        Returns
+        -------
+        SummarizedArticle
+            要約結果（SUCCESS / FAILED / TIMEOUT）。
+        """
         # プロンプトを構築
         prompt = self._build_prompt(article)
 
@@ -191,10 +306,19 @@ class Summarizer:
 
         for attempt in range(self._max_retries):
             try:
+                started = time.perf_counter()
                 async with asyncio.timeout(self._timeout_seconds):
                     response_text = await self._call_claude_sdk(prompt)
+                metadata = self._call_metadata.pop(prompt, {})
 
                 summary = self._parse_response(response_text)
+                self._store_cache(
+                    article,
+                    cache_key,
+                    summary,
+                    metadata=metadata,
+                    duration_ms=round((time.perf_counter() - started) * 1000),
+                )
 
                 logger.info(
                     "Summarization completed",
@@ -380,6 +504,7 @@ JSONのみを出力し、他のテキストは含めないでください。"""
         - allowed_tools=[] でツール使用を無効化（テキスト生成のみ）
         - max_turns=1 で1ターンのみの対話
         - SDK固有の例外は適切にログ出力後、呼び出し元に再送出する
+        - モデル名・トークン使用量・コストを _call_metadata[prompt] に記録する
         """
         try:
             from claude_agent_sdk import (
@@ -418,9 +543,12 @@ JSONのみを出力し、他のテキストは含めないでください。"""
             response_parts: list[str] = []
             assistant_error: str | None = None
             result_message: ResultMessage | None = None
+            model: str | None = None
 
             async for message in query(prompt=prompt, options=options):
                 if isinstance(message, AssistantMessage):
+                    # メタデータは古い SDK バージョンでは存在しない場合がある
+                    model = getattr(message, "model", None)
                     # AssistantMessage.error のチェック
                     if message.error is not None:
                         assistant_error = str(message.error)
@@ -459,6 +587,11 @@ JSONのみを出力し、他のテキストは含めないでください。"""
                 "Claude Agent SDK response received",
                 response_length=len(result),
             )
+            self._call_metadata[prompt] = {
+                "model": model,
+                "usage": getattr(result_message, "usage", None),
+                "total_cost_usd": getattr(result_message, "total_cost_usd", None),
+            }
 
             return result
 
@@ -552,6 +685,9 @@ JSONのみを出力し、他のテキストは含めないでください。"""
         - セマフォを使用して並列数を制限
         - 個々の要約が失敗しても他の要約は継続
         - 各記事の結果は独立して成功/失敗を判定
+        - 送信前にキャッシュを参照し、ヒットした記事は Claude を呼び出さない
+        - 本文が同じ記事（別 URL で配信された同一記事など）は1回だけ要約し、
+          結果を共有する
 
         Examples
         --------
@@ -572,43 +708,82 @@ JSONのみを出力し、他のテキストは含めないでください。"""
             concurrency=concurrency,
         )
 
+        # 送信前にキャッシュを参照し、同じ本文の記事をまとめる
+        results: list[SummarizedArticle | None] = [None] * len(articles)
+        pending: dict[str, list[int]] = {}
+        cache_hits = 0
+        for i, article in enumerate(articles):
+            if article.body_text is None:
+                continue
+            cache_key = self._cache_key(article.body_text)
+            if cache_key in pending:
+                pending[cache_key].append(i)
+                continue
+            cached = self._lookup_cache(article, cache_key)
+            if cached is not None:
+                results[i] = cached
+                cache_hits += 1
+            else:
+                pending[cache_key] = [i]
+
         # セマフォで並列数を制限
         semaphore = asyncio.Semaphore(concurrency)
 
         async def _summarize_with_semaphore(
             article: ExtractedArticle,
+            cache_key: str | None,
         ) -> SummarizedArticle:
             async with semaphore:
-                return await self.summarize(article)
-
-        # 全記事を並列処理
-        tasks = [_summarize_with_semaphore(article) for article in articles]
-        results = await asyncio.gather(*tasks)
+                if cache_key is None:
+                    # 本文なし → summarize() が SKIPPED を返す
+                    return await self.summarize(article)
+                return await self._generate_summary(article, cache_key)
+
+        dispatch: list[tuple[int, str | None]] = [
+            (i, None) for i, a in enumerate(articles) if a.body_text is None
+        ]
+        dispatch.extend((indices[0], key) for key, indices in pending.items())
+
+        # キャッシュミスの記事を並列処理
+        tasks = [_summarize_with_semaphore(articles[i], key) for i, key in dispatch]
+        for (i, key), result in zip(
+            dispatch, await asyncio.gather(*tasks), strict=True
+        ):
+            for j in pending[key] if key is not None else [i]:
+                results[j] = (
+                    result
+                    if j == i
+                    else result.model_copy(update={"extracted": articles[j]})
+                )
+        summarized = [result for result in results if result is not None]
 
         logger.info(
             "Batch summarization completed",
-            total=len(results),
+            total=len(summarized),
+            cache_hits=cache_hits,
+            deduplicated=sum(len(indices) - 1 for indices in pending.values()),
             success=sum(
                 1
-                for r in results
+                for r in summarized
                 if r.summarization_status == SummarizationStatus.SUCCESS
             ),
             skipped=sum(
                 1
-                for r in results
+                for r in summarized
                 if r.summarization_status == SummarizationStatus.SKIPPED
             ),
             failed=sum(
                 1
-                for r in results
+                for r in summarized
                 if r.summarization_status == SummarizationStatus.FAILED
             ),
         )
 
-        return list(results)
+        return summarized
 
 
 __all__ = [
+    "PROMPT_VERSION",
     "EmptyResponseError",
     "Summarizer",
 ]
@@ -0,0 +1,234 @@
+"""Content-addressed cache of AI article summaries.
+
+Summaries are keyed on a hash of the normalized article body plus the
+prompt version, so a syndicated story that reappears under another URL,
+or an article re-processed after a partial failure, reuses the stored
+summary instead of calling Claude again. Each entry also records the
+model, timing and token usage of the call that produced it.
+
+Entries are stored as one JSON file per key under a cache directory
+(``<cache_dir>/<key[:2]>/<key>.json``), so concurrent writers never
+rewrite a shared file.
+
+Examples
+--------
+>>> cache = SummaryCache("data/cache/news-summaries")
+>>> key = cache.key_for(article.body_text, prompt_version="1:3f2a9c0d1e7b")
+>>> cache.get(key) is None
+True
+>>> cache.put(CachedSummary(key=key, prompt_version="1:3f2a9c0d1e7b", summary=s))
+>>> cache.get(key).summary == s
+True
+"""
+
+import hashlib
+import os
+import re
+import unicodedata
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field, ValidationError
+
+from news.models import StructuredSummary
+from utils_core.logging import get_logger
+
+logger = get_logger(__name__, module="summary_cache")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_content(text: str) -> str:
+    """Normalize article text for content addressing.
+
+    Applies Unicode NFKC normalization (full-width/half-width variants,
+    compatibility characters) and collapses all whitespace runs, so copies
+    of a story that differ only in formatting map to the same key.
+
+    Parameters
+    ----------
+    text : str
+        Article body text.
+
+    Returns
+    -------
+    str
+        Normalized text.
+
+    Examples
+    --------
+    >>> normalize_content("  Ｓ＆Ｐ 500\\n\\n  rose ")
+    'S&P 500 rose'
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class CachedSummary(BaseModel):
+    """A cached summary and the metadata of the call that produced it.
+
+    Attributes
+    ----------
+    key : str
+        Cache key (SHA-256 of prompt version and normalized content).
+    prompt_version : str
+        Prompt version the summary was generated with.
+    summary : StructuredSummary
+        The structured summary.
+    source_url : str | None
+        URL of the article first summarized with this content.
+    model : str | None
+        Model reported by the Claude Agent SDK.
+    duration_ms : int | None
+        Wall-clock duration of the SDK call in milliseconds.
+    usage : dict[str, Any]
+        Token usage reported by the SDK (input_tokens, output_tokens, ...).
+    total_cost_usd : float | None
+        Cost reported by the SDK.
+    created_at : datetime
+        When the entry was written (UTC).
+    """
+
+    key: str = Field(..., description="Cache key")
+    prompt_version: str = Field(..., description="Prompt version")
+    summary: StructuredSummary = Field(..., description="Structured summary")
+    source_url: str | None = Field(default=None, description="First article URL")
+    model: str | None = Field(default=None, description="Model used")
+    duration_ms: int | None = Field(default=None, description="Call duration (ms)")
+    usage: dict[str, Any] = Field(default_factory=dict, description="Token usage")
+    total_cost_usd: float | None = Field(default=None, description="Call cost (USD)")
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Entry creation time (UTC)",
+    )
+
+
+class SummaryCache:
+    """Persistent content-addressed summary cache.
+
+    Parameters
+    ----------
+    cache_dir : str | Path
+        Directory holding the cache entries. Created on first write.
+
+    Attributes
+    ----------
+    cache_dir : Path
+        Directory holding the cache entries.
+    hits : int
+        Number of successful lookups since creation.
+    misses : int
+        Number of failed lookups since creation.
+
+    Examples
+    --------
+    >>> cache = SummaryCache("data/cache/news-summaries")
+    >>> cache.get("0" * 64) is None
+    True
+    >>> cache.misses
+    1
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Initialize SummaryCache.
+
+        Parameters
+        ----------
+        cache_dir : str | Path
+            Directory holding the cache entries.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+        logger.debug("SummaryCache initialized", cache_dir=str(self.cache_dir))
+
+    @staticmethod
+    def key_for(content: str, prompt_version: str) -> str:
+        """Compute the cache key of an article body.
+
+        Parameters
+        ----------
+        content : str
+            Article body text (normalized internally).
+        prompt_version : str
+            Version of the prompt used to summarize it.
+
+        Returns
+        -------
+        str
+            Hex SHA-256 digest.
+        """
+        digest = hashlib.sha256(prompt_version.encode())
+        digest.update(b"\0")
+        digest.update(normalize_content(content).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CachedSummary | None:
+        """Look up a cached summary.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from ``key_for``.
+
+        Returns
+        -------
+        CachedSummary | None
+            The entry, or None if absent or unreadable.
+        """
+        path = self._path(key)
+        try:
+            entry = CachedSummary.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning(
+                "Ignoring unreadable summary cache entry",
+                path=str(path),
+                error=str(e),
+            )
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def put(self, entry: CachedSummary) -> None:
+        """Store a summary.
+
+        The entry is written to a temporary file and renamed into place, so
+        readers never see a partial entry. Write failures are logged and
+        otherwise ignored: the cache must not fail summarization.
+
+        Parameters
+        ----------
+        entry : CachedSummary
+            Entry to store under ``entry.key``.
+        """
+        path = self._path(entry.key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(entry.model_dump_json(indent=2), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(
+                "Failed to write summary cache entry",
+                path=str(path),
+                error=str(e),
+            )
+            return
+
+        logger.debug("Summary cached", key=entry.key, model=entry.model)
+
+
+__all__ = [
+    "CachedSummary",
+    "SummaryCache",
+    "normalize_content",
+]
@@ -30,11 +30,27 @@ Examples
 ...     notebooks = await notebook_svc.list_notebooks()
 """
 
-from notebooklm.browser.manager import NotebookLMBrowserManager
-from notebooklm.selectors import SelectorManager
-from notebooklm.services.chat import ChatService
-from notebooklm.services.notebook import NotebookService
-from notebooklm.services.source import SourceService
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from notebooklm.browser.manager import NotebookLMBrowserManager
+    from notebooklm.selectors import SelectorManager
+    from notebooklm.services.chat import ChatService
+    from notebooklm.services.notebook import NotebookService
+    from notebooklm.services.source import SourceService
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "NotebookLMBrowserManager": "notebooklm.browser.manager",
+    "SelectorManager": "notebooklm.selectors",
+    "ChatService": "notebooklm.services.chat",
+    "NotebookService": "notebooklm.services.notebook",
+    "SourceService": "notebooklm.services.source",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "ChatService",
@@ -40,13 +40,31 @@ Examples
 ...     notebooks = await notebook_svc.list_notebooks()
 """
 
-from notebooklm.services.audio import AudioService
-from notebooklm.services.batch import BatchService
-from notebooklm.services.chat import ChatService
-from notebooklm.services.note import NoteService
-from notebooklm.services.notebook import NotebookService
-from notebooklm.services.source import SourceService
-from notebooklm.services.studio import StudioService
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from notebooklm.services.audio import AudioService
+    from notebooklm.services.batch import BatchService
+    from notebooklm.services.chat import ChatService
+    from notebooklm.services.note import NoteService
+    from notebooklm.services.notebook import NotebookService
+    from notebooklm.services.source import SourceService
+    from notebooklm.services.studio import StudioService
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "AudioService": "notebooklm.services.audio",
+    "BatchService": "notebooklm.services.batch",
+    "ChatService": "notebooklm.services.chat",
+    "NoteService": "notebooklm.services.note",
+    "NotebookService": "notebooklm.services.notebook",
+    "SourceService": "notebooklm.services.source",
+    "StudioService": "notebooklm.services.studio",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "AudioService",
@@ -59,27 +59,66 @@ Examples
 >>> from rss import ArticleExtractor, ExtractedArticle, ExtractionStatus
 """
 
-from utils_core.logging import get_logger
+from typing import TYPE_CHECKING
 
-from .exceptions import (
-    FeedAlreadyExistsError,
-    FeedFetchError,
-    FeedNotFoundError,
-    FeedParseError,
-    FileLockError,
-    InvalidURLError,
-    RSSError,
-)
-from .services import (
-    ArticleExtractor,
-    BatchScheduler,
-    ExtractedArticle,
-    ExtractionStatus,
-    FeedFetcher,
-    FeedManager,
-    FeedReader,
-)
-from .types import BatchStats, Feed, FeedItem, FetchInterval, FetchResult, FetchStatus
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from utils_core.logging import get_logger
+
+    from .exceptions import (
+        FeedAlreadyExistsError,
+        FeedFetchError,
+        FeedNotFoundError,
+        FeedParseError,
+        FileLockError,
+        InvalidURLError,
+        RSSError,
+    )
+    from .services import (
+        ArticleExtractor,
+        BatchScheduler,
+        ExtractedArticle,
+        ExtractionStatus,
+        FeedFetcher,
+        FeedManager,
+        FeedReader,
+    )
+    from .types import (
+        BatchStats,
+        Feed,
+        FeedItem,
+        FetchInterval,
+        FetchResult,
+        FetchStatus,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "get_logger": "utils_core.logging",
+    "FeedAlreadyExistsError": ".exceptions",
+    "FeedFetchError": ".exceptions",
+    "FeedNotFoundError": ".exceptions",
+    "FeedParseError": ".exceptions",
+    "FileLockError": ".exceptions",
+    "InvalidURLError": ".exceptions",
+    "RSSError": ".exceptions",
+    "ArticleExtractor": ".services",
+    "BatchScheduler": ".services",
+    "ExtractedArticle": ".services",
+    "ExtractionStatus": ".services",
+    "FeedFetcher": ".services",
+    "FeedManager": ".services",
+    "FeedReader": ".services",
+    "BatchStats": ".types",
+    "Feed": ".types",
+    "FeedItem": ".types",
+    "FetchInterval": ".types",
+    "FetchResult": ".types",
+    "FetchStatus": ".types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "ArticleExtractor",
@@ -1,12 +1,12 @@
 """RSS CLI main module.
 
 This module provides the command-line interface for RSS feed management.
-Implements 7 subcommands: add, list, update, remove, fetch, items, search.
+Implements 8 subcommands: add, list, update, remove, fetch, items, search,
+migrate.
 """
 
 from __future__ import annotations
 
-import asyncio
 import json
 import sys
 from pathlib import Path
@@ -24,9 +24,9 @@ from ..exceptions import (
     InvalidURLError,
     RSSError,
 )
-from ..services.feed_fetcher import FeedFetcher
 from ..services.feed_manager import FeedManager
 from ..services.feed_reader import FeedReader
+from ..storage.sqlite_storage import migrate_json_to_sqlite
 from ..types import Feed, FeedItem, FetchInterval, FetchResult
 
 
@@ -447,6 +447,12 @@ def fetch(
             console.print("[red]Error: Specify feed_id or --all[/red]")
         sys.exit(1)
 
+    # Deferred: the fetcher pulls in httpx and feedparser, which the other
+    # subcommands never need
+    import asyncio
+
+    from ..services.feed_fetcher import FeedFetcher
+
     data_dir = _get_data_dir(ctx)
     fetcher = FeedFetcher(data_dir)
 
@@ -628,6 +634,58 @@ def search(
     logger.info("Search completed", query=query, count=len(item_list))
 
 
+@cli.command()
+@click.option(
+    "--overwrite",
+    is_flag=True,
+    help="Replace an existing rss.db",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@click.pass_context
+def migrate(
+    ctx: click.Context,
+    overwrite: bool,
+    json_output: bool,
+) -> None:
+    """Migrate JSON storage (feeds.json, items.json) to SQLite (rss.db)."""
+    data_dir = _get_data_dir(ctx)
+    logger.info("Migrating storage", data_dir=str(data_dir), overwrite=overwrite)
+
+    try:
+        result = migrate_json_to_sqlite(data_dir, overwrite=overwrite)
+
+        if json_output:
+            _output_json(
+                {
+                    "feeds": result.feeds,
+                    "items": result.items,
+                    "skipped_items": result.skipped_items,
+                    "db_path": str(result.db_path),
+                }
+            )
+        else:
+            console.print("[green]Storage migrated successfully[/green]")
+            console.print(f"  Database: {result.db_path}")
+            console.print(f"  Feeds: {result.feeds}")
+            console.print(f"  Items: {result.items}")
+            if result.skipped_items:
+                console.print(
+                    f"  [yellow]Skipped duplicate links: {result.skipped_items}[/yellow]"
+                )
+
+        logger.info("Storage migrated", feeds=result.feeds, items=result.items)
+
+    except FileExistsError as e:
+        _handle_error(
+            RSSError(f"{e}. Use --overwrite to replace it."),
+            "Database already exists",
+            json_output,
+        )
+
+    except RSSError as e:
+        _handle_error(e, "RSS error", json_output)
+
+
 @cli.group()
 def preset() -> None:
     """Manage preset feeds."""
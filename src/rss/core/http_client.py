@@ -1,15 +1,21 @@
-"""HTTP/HTTPS client with retry mechanism."""
+"""HTTP/HTTPS client with retry mechanism and optional pooled session."""
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import importlib.util
+from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import urlparse
 
 import httpx
 
 from ..exceptions import FeedFetchError
 from ..types import HTTPResponse
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import TracebackType
+
 
 def _get_logger() -> Any:
     """Get logger with fallback to standard logging.
@@ -35,6 +41,15 @@ DEFAULT_USER_AGENT = "rss-feed-collector/0.1.0"
 DEFAULT_TIMEOUT = 10
 DEFAULT_MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+KEEPALIVE_EXPIRY = 30.0
+HTTP_NOT_MODIFIED = 304
+
+
+def _http2_available() -> bool:
+    """Whether the optional ``h2`` package required for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
 
 
 class HTTPClient:
@@ -48,12 +63,25 @@ class HTTPClient:
     - Retry on timeout, connection error, and 5xx errors
     - No retry on 4xx errors
 
+    Used as an async context manager, the client keeps one pooled
+    ``httpx.AsyncClient`` open for every request made inside the block, so
+    connections (and TLS sessions) are reused across feeds. Requests to the
+    same host are limited to ``max_connections_per_host`` at a time, and
+    HTTP/2 is used when the optional ``h2`` package is installed. Outside a
+    session each request opens its own connection, as before.
+
     Attributes
     ----------
     user_agent : str
         User-Agent header value
     verify_ssl : bool
         Whether to verify SSL certificates
+    http2 : bool
+        Whether the pooled session negotiates HTTP/2
+    max_connections : int
+        Maximum number of connections in the pooled session
+    max_connections_per_host : int
+        Maximum number of concurrent requests per host
 
     Examples
     --------
@@ -61,12 +89,20 @@ class HTTPClient:
     ...     client = HTTPClient()
     ...     response = await client.fetch("https://example.com")
     ...     print(response.status_code)
+
+    >>> async def pooled(urls):
+    ...     async with HTTPClient() as client:
+    ...         return [await client.fetch(url) for url in urls]
     """
 
     def __init__(
         self,
         user_agent: str = DEFAULT_USER_AGENT,
         verify_ssl: bool = True,
+        *,
+        http2: bool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
     ) -> None:
         """Initialize HTTPClient.
 
@@ -76,20 +112,76 @@ class HTTPClient:
             User-Agent header value
         verify_ssl : bool, default=True
             Whether to verify SSL certificates
+        http2 : bool | None, default=None
+            Whether to use HTTP/2 in the pooled session. None enables it
+            when the ``h2`` package is installed.
+        max_connections : int, default=20
+            Maximum number of connections in the pooled session
+        max_connections_per_host : int, default=4
+            Maximum number of concurrent requests per host
         """
+        self.user_agent = user_agent
+        self.verify_ssl = verify_ssl
+        self.http2 = _http2_available() if http2 is None else http2
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self._client: httpx.AsyncClient | None = None
+        self._session_depth = 0
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
         logger.debug(
             "Initializing HTTPClient",
             user_agent=user_agent,
             verify_ssl=verify_ssl,
+            http2=self.http2,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
         )
-        self.user_agent = user_agent
-        self.verify_ssl = verify_ssl
+
+    async def __aenter__(self) -> Self:
+        """Open the pooled session (nested sessions share the outer one).
+
+        Returns
+        -------
+        Self
+            This client
+        """
+        if self._session_depth == 0:
+            self._client = httpx.AsyncClient(
+                verify=self.verify_ssl,
+                timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+                headers={"User-Agent": self.user_agent},
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
+            logger.debug("Pooled HTTP session opened", http2=self.http2)
+        self._session_depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the pooled session when the outermost block exits."""
+        self._session_depth -= 1
+        if self._session_depth == 0 and self._client is not None:
+            client, self._client = self._client, None
+            self._host_semaphores.clear()
+            await client.aclose()
+            logger.debug("Pooled HTTP session closed")
 
     async def fetch(
         self,
         url: str,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        *,
+        headers: Mapping[str, str] | None = None,
     ) -> HTTPResponse:
         """Fetch content from URL with retry mechanism.
 
@@ -101,11 +193,16 @@ class HTTPClient:
             Request timeout in seconds
         max_retries : int, default=3
             Maximum number of retry attempts
+        headers : Mapping[str, str] | None, default=None
+            Extra request headers, e.g. ``If-None-Match`` /
+            ``If-Modified-Since`` for a conditional GET
 
         Returns
         -------
         HTTPResponse
-            Response containing status_code, content, and headers
+            Response containing status_code, content, and headers.
+            A conditional GET on an unchanged resource returns status 304
+            with empty content.
 
         Raises
         ------
@@ -125,7 +222,10 @@ class HTTPClient:
             is_last_attempt = attempt >= max_retries
 
             try:
-                response = await self._make_request(url, timeout)
+                if headers:
+                    response = await self._make_request(url, timeout, headers=headers)
+                else:
+                    response = await self._make_request(url, timeout)
                 result = await self._handle_response(
                     response, url, attempt, max_retries, is_last_attempt
                 )
@@ -213,6 +313,10 @@ class HTTPClient:
             )
             raise FeedFetchError(f"Failed to fetch {url}: HTTP {response.status_code}")
 
+        if response.status_code == HTTP_NOT_MODIFIED:
+            logger.debug("Resource not modified", url=url)
+            return response
+
         # Success
         logger.debug(
             "Fetch completed successfully",
@@ -328,33 +432,62 @@ class HTTPClient:
         self,
         url: str,
         timeout: int,
+        headers: Mapping[str, str] | None = None,
     ) -> HTTPResponse:
         """Make HTTP GET request.
 
+        Inside a session the pooled client is used and requests are limited
+        per host; otherwise a one-off client is opened for the request.
+
         Parameters
         ----------
         url : str
             URL to fetch
         timeout : int
             Request timeout in seconds
+        headers : Mapping[str, str] | None, default=None
+            Extra request headers
 
         Returns
         -------
         HTTPResponse
             Response object
         """
+        if self._client is not None:
+            async with self._host_semaphore(url):
+                response = await self._client.get(
+                    url,
+                    headers=headers,
+                    timeout=httpx.Timeout(timeout),
+                    follow_redirects=True,
+                )
+            return HTTPResponse(
+                status_code=response.status_code,
+                content=response.text,
+                headers=dict(response.headers),
+            )
+
         async with httpx.AsyncClient(
             verify=self.verify_ssl,
             timeout=httpx.Timeout(timeout),
             headers={"User-Agent": self.user_agent},
         ) as client:
-            response = await client.get(url, follow_redirects=True)
+            response = await client.get(url, headers=headers, follow_redirects=True)
             return HTTPResponse(
                 status_code=response.status_code,
                 content=response.text,
                 headers=dict(response.headers),
             )
 
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Semaphore limiting concurrent requests to the host of ``url``."""
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay.
 
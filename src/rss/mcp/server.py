@@ -274,10 +274,14 @@ def rss_search_items(
     category: str | None = None,
     fields: list[str] | None = None,
     limit: int = 50,
+    since: str | None = None,
+    until: str | None = None,
 ) -> dict[str, Any]:
     """Search feed items by keyword.
 
     Performs case-insensitive partial matching on specified fields.
+    When the data directory uses SQLite storage, results come from the
+    full-text index ranked by relevance.
 
     Parameters
     ----------
@@ -289,6 +293,10 @@ def rss_search_items(
         Fields to search in (optional, defaults to ["title", "summary", "content"])
     limit : int
         Maximum number of results to return (default: 50)
+    since : str | None
+        Only items published at or after this ISO 8601 timestamp (optional)
+    until : str | None
+        Only items published before this ISO 8601 timestamp (optional)
 
     Returns
     -------
@@ -304,6 +312,8 @@ def rss_search_items(
         category=category,
         fields=fields,
         limit=limit,
+        since=since,
+        until=until,
     )
 
     try:
@@ -314,6 +324,8 @@ def rss_search_items(
             category=category,
             fields=fields,
             limit=limit,
+            since=since,
+            until=until,
         )
 
         result = {
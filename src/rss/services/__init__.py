@@ -1,19 +1,40 @@
 """Services for RSS feed management."""
 
-from .article_extractor import (
-    ArticleExtractor,
-    ExtractedArticle,
-    ExtractionStatus,
-)
-from .batch_scheduler import BatchScheduler
-from .feed_fetcher import FeedFetcher
-from .feed_manager import FeedManager
-from .feed_reader import FeedReader
-from .news_categorizer import (
-    CategorizationResult,
-    NewsCategorizer,
-    NewsCategory,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .article_extractor import (
+        ArticleExtractor,
+        ExtractedArticle,
+        ExtractionStatus,
+    )
+    from .batch_scheduler import BatchScheduler
+    from .feed_fetcher import FeedFetcher
+    from .feed_manager import FeedManager
+    from .feed_reader import FeedReader
+    from .news_categorizer import (
+        CategorizationResult,
+        NewsCategorizer,
+        NewsCategory,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "ArticleExtractor": ".article_extractor",
+    "ExtractedArticle": ".article_extractor",
+    "ExtractionStatus": ".article_extractor",
+    "BatchScheduler": ".batch_scheduler",
+    "FeedFetcher": ".feed_fetcher",
+    "FeedManager": ".feed_manager",
+    "FeedReader": ".feed_reader",
+    "CategorizationResult": ".news_categorizer",
+    "NewsCategorizer": ".news_categorizer",
+    "NewsCategory": ".news_categorizer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "ArticleExtractor",
@@ -9,14 +9,17 @@ from __future__ import annotations
 import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..core.diff_detector import DiffDetector
-from ..core.http_client import HTTPClient
+from ..core.http_client import HTTP_NOT_MODIFIED, HTTPClient
 from ..core.parser import FeedParser
 from ..exceptions import FeedFetchError, FeedParseError
-from ..storage.json_storage import JSONStorage
-from ..types import Feed, FeedItemsData, FetchResult, FetchStatus
+from ..storage.backend import FeedStorage, open_storage
+from ..types import Feed, FetchResult, FetchStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 def _get_logger() -> Any:
@@ -40,8 +43,9 @@ MAX_CONCURRENT_LIMIT = 10
 class FeedFetcher:
     """Service for fetching, parsing, and storing RSS feeds.
 
-    This class integrates HTTPClient, FeedParser, DiffDetector, and JSONStorage
-    to provide a complete feed fetching workflow.
+    This class integrates HTTPClient, FeedParser, DiffDetector, and the feed
+    storage (JSON or SQLite, see ``open_storage``) to provide a complete feed
+    fetching workflow.
 
     Parameters
     ----------
@@ -58,8 +62,8 @@ class FeedFetcher:
     ----------
     data_dir : Path
         Root directory for RSS feed data
-    storage : JSONStorage
-        JSON storage for persistence
+    storage : FeedStorage
+        Storage for persistence (``JSONStorage`` or ``SQLiteStorage``)
     http_client : HTTPClient
         HTTP client for fetching feeds
     parser : FeedParser
@@ -111,7 +115,7 @@ class FeedFetcher:
             raise ValueError(f"data_dir must be a Path object, got {type(data_dir)}")
 
         self.data_dir = data_dir
-        self.storage = JSONStorage(data_dir)
+        self.storage: FeedStorage = open_storage(data_dir)
         self.http_client = http_client or HTTPClient()
         self.parser = parser or FeedParser()
         self.diff_detector = diff_detector or DiffDetector()
@@ -123,11 +127,15 @@ class FeedFetcher:
 
         This method performs the complete fetch workflow:
         1. Get feed information from storage
-        2. Fetch content via HTTPClient
+        2. Fetch content via HTTPClient (a conditional GET when the feed has
+           stored ETag/Last-Modified validators)
         3. Parse content via FeedParser
         4. Detect new items via DiffDetector
         5. Merge and save items
-        6. Update feed status (last_fetched, last_status)
+        6. Update feed status (last_fetched, last_status, validators)
+
+        When the server answers 304 Not Modified, steps 3-5 are skipped and
+        only the feed status is updated.
 
         Parameters
         ----------
@@ -168,8 +176,11 @@ class FeedFetcher:
                 title=feed.title,
             )
 
-            # 2. Fetch content
-            response = await self.http_client.fetch(feed.url)
+            # 2. Fetch content (conditional GET when validators are stored)
+            conditional_headers = self._conditional_headers(feed)
+            response = await self.http_client.fetch(
+                feed.url, headers=conditional_headers or None
+            )
             logger.debug(
                 "Content fetched",
                 feed_id=feed_id,
@@ -177,6 +188,22 @@ class FeedFetcher:
                 content_length=len(response.content),
             )
 
+            if response.status_code == HTTP_NOT_MODIFIED:
+                self._update_feed_status(feed_id, FetchStatus.SUCCESS)
+                logger.info(
+                    "Feed not modified",
+                    feed_id=feed_id,
+                    title=feed.title,
+                )
+                return FetchResult(
+                    feed_id=feed_id,
+                    success=True,
+                    items_count=0,
+                    new_items=0,
+                    error_message=None,
+                    not_modified=True,
+                )
+
             # 3. Parse content
             fetched_items = self.parser.parse(response.content.encode("utf-8"))
             logger.debug(
@@ -185,42 +212,42 @@ class FeedFetcher:
                 fetched_count=len(fetched_items),
             )
 
-            # 4. Load existing items and detect new ones
-            existing_data = self.storage.load_items(feed_id)
+            # 4. Look up stored items sharing a link and detect new ones
+            existing_items = self.storage.find_items_by_link(
+                feed_id, (item.link for item in fetched_items)
+            )
             new_items = self.diff_detector.detect_new_items(
-                existing_data.items, fetched_items
+                existing_items, fetched_items
             )
             logger.debug(
                 "Diff detected",
                 feed_id=feed_id,
-                existing_count=len(existing_data.items),
+                existing_count=len(existing_items),
                 new_count=len(new_items),
             )
 
-            # 5. Merge and save items (new items at the beginning)
-            merged_items = new_items + existing_data.items
-            items_data = FeedItemsData(
-                version="1.0",
-                feed_id=feed_id,
-                items=merged_items,
-            )
-            self.storage.save_items(feed_id, items_data)
+            # 5. Store new items (at the beginning)
+            items_count = self.storage.append_items(feed_id, new_items)
 
-            # 6. Update feed status
-            self._update_feed_status(feed_id, FetchStatus.SUCCESS)
+            # 6. Update feed status and cache validators
+            self._update_feed_status(
+                feed_id,
+                FetchStatus.SUCCESS,
+                validators=self._response_validators(response.headers),
+            )
 
             logger.info(
                 "Feed fetched successfully",
                 feed_id=feed_id,
                 title=feed.title,
-                items_count=len(merged_items),
+                items_count=items_count,
                 new_items=len(new_items),
             )
 
             return FetchResult(
                 feed_id=feed_id,
                 success=True,
-                items_count=len(merged_items),
+                items_count=items_count,
                 new_items=len(new_items),
                 error_message=None,
             )
@@ -258,7 +285,8 @@ class FeedFetcher:
         """Fetch all feeds asynchronously with concurrency control.
 
         This method fetches multiple feeds in parallel using asyncio.gather
-        with semaphore-based concurrency control.
+        with semaphore-based concurrency control. All fetches share one
+        pooled HTTP session, so connections are reused across feeds.
 
         Parameters
         ----------
@@ -332,8 +360,9 @@ class FeedFetcher:
         # Create tasks for all feeds
         tasks = [fetch_with_semaphore(feed.feed_id) for feed in feeds]
 
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        # Execute all tasks concurrently over one pooled session
+        async with self.http_client:
+            results = await asyncio.gather(*tasks, return_exceptions=False)
 
         # Count successes and failures
         success_count = sum(1 for r in results if r.success)
@@ -403,11 +432,49 @@ class FeedFetcher:
         Feed | None
             Feed object if found, None otherwise
         """
-        feeds_data = self.storage.load_feeds()
-        for feed in feeds_data.feeds:
-            if feed.feed_id == feed_id:
-                return feed
-        return None
+        return self.storage.get_feed(feed_id)
+
+    @staticmethod
+    def _conditional_headers(feed: Feed) -> dict[str, str]:
+        """Build conditional GET headers from the feed's stored validators.
+
+        Parameters
+        ----------
+        feed : Feed
+            Feed information
+
+        Returns
+        -------
+        dict[str, str]
+            ``If-None-Match`` / ``If-Modified-Since`` headers (empty when no
+            validator is stored)
+        """
+        headers: dict[str, str] = {}
+        if feed.etag:
+            headers["If-None-Match"] = feed.etag
+        if feed.last_modified:
+            headers["If-Modified-Since"] = feed.last_modified
+        return headers
+
+    @staticmethod
+    def _response_validators(headers: Mapping[str, str]) -> dict[str, str | None]:
+        """Extract ETag/Last-Modified validators from response headers.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            Response headers
+
+        Returns
+        -------
+        dict[str, str | None]
+            ``etag`` and ``last_modified`` values (None when absent)
+        """
+        lowered = {key.lower(): value for key, value in headers.items()}
+        return {
+            "etag": lowered.get("etag"),
+            "last_modified": lowered.get("last-modified"),
+        }
 
     def _handle_fetch_error(
         self,
@@ -452,7 +519,13 @@ class FeedFetcher:
             error_message=error_msg,
         )
 
-    def _update_feed_status(self, feed_id: str, status: FetchStatus) -> None:
+    def _update_feed_status(
+        self,
+        feed_id: str,
+        status: FetchStatus,
+        *,
+        validators: dict[str, str | None] | None = None,
+    ) -> None:
         """Update feed's last_fetched and last_status.
 
         Parameters
@@ -461,25 +534,29 @@ class FeedFetcher:
             Feed identifier
         status : FetchStatus
             New fetch status
+        validators : dict[str, str | None] | None, default=None
+            ``etag``/``last_modified`` values to store for the next
+            conditional GET (None leaves the stored validators unchanged)
         """
         try:
-            feeds_data = self.storage.load_feeds()
-
-            for i, feed in enumerate(feeds_data.feeds):
-                if feed.feed_id == feed_id:
-                    feed.last_fetched = datetime.now(UTC).isoformat()
-                    feed.last_status = status
-                    feed.updated_at = datetime.now(UTC).isoformat()
-                    feeds_data.feeds[i] = feed
-                    self.storage.save_feeds(feeds_data)
-
-                    logger.debug(
-                        "Feed status updated",
-                        feed_id=feed_id,
-                        status=status.value,
-                        last_fetched=feed.last_fetched,
-                    )
-                    return
+            now = datetime.now(UTC).isoformat()
+            changes: dict[str, object] = {
+                "last_fetched": now,
+                "last_status": status,
+                "updated_at": now,
+            }
+            if validators is not None:
+                changes["etag"] = validators.get("etag")
+                changes["last_modified"] = validators.get("last_modified")
+
+            if self.storage.update_feed(feed_id, changes):
+                logger.debug(
+                    "Feed status updated",
+                    feed_id=feed_id,
+                    status=status.value,
+                    last_fetched=now,
+                )
+                return
 
             logger.warning(
                 "Feed not found for status update",
@@ -5,7 +5,6 @@ listing, updating, and deletion.
 """
 
 import json
-import shutil
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
@@ -14,7 +13,7 @@ from typing import Any
 import httpx
 
 from ..exceptions import FeedAlreadyExistsError, FeedFetchError, FeedNotFoundError
-from ..storage.json_storage import JSONStorage
+from ..storage.backend import FeedStorage, open_storage
 from ..types import (
     Feed,
     FetchInterval,
@@ -45,7 +44,7 @@ class FeedManager:
     """Service for managing RSS feeds.
 
     This class provides methods for feed registration, listing, retrieval,
-    updating, and deletion. All operations are persisted to JSON storage.
+    updating, and deletion. All operations are persisted to the feed storage.
 
     Parameters
     ----------
@@ -56,8 +55,8 @@ class FeedManager:
     ----------
     data_dir : Path
         Root directory for RSS feed data
-    storage : JSONStorage
-        JSON storage for persistence
+    storage : FeedStorage
+        Storage for persistence (``JSONStorage`` or ``SQLiteStorage``)
     validator : URLValidator
         Validator for URLs, titles, and categories
 
@@ -96,7 +95,7 @@ class FeedManager:
             raise ValueError(f"data_dir must be a Path object, got {type(data_dir)}")
 
         self.data_dir = data_dir
-        self.storage = JSONStorage(data_dir)
+        self.storage: FeedStorage = open_storage(data_dir)
         self.validator = URLValidator()
         logger.debug("FeedManager initialized", data_dir=str(data_dir))
 
@@ -517,11 +516,8 @@ class FeedManager:
         # Save updated feeds
         self.storage.save_feeds(feeds_data)
 
-        # Delete items directory if exists
-        items_dir = self.data_dir / feed_id
-        if items_dir.exists():
-            shutil.rmtree(items_dir)
-            logger.debug("Items directory deleted", items_dir=str(items_dir))
+        # Delete stored items
+        self.storage.delete_items(feed_id)
 
         logger.info(
             "Feed removed successfully",
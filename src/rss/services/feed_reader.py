@@ -1,13 +1,13 @@
 """Feed reading service for RSS feed items.
 
 This module provides the FeedReader class for retrieving, searching,
-and filtering feed items from the JSON storage.
+and filtering feed items from the feed storage.
 """
 
 from pathlib import Path
 from typing import Any
 
-from ..storage.json_storage import JSONStorage
+from ..storage.backend import FeedStorage, open_storage
 from ..types import FeedItem
 
 
@@ -41,8 +41,8 @@ class FeedReader:
     ----------
     data_dir : Path
         Root directory for RSS feed data
-    storage : JSONStorage
-        JSON storage for persistence
+    storage : FeedStorage
+        Storage for persistence (``JSONStorage`` or ``SQLiteStorage``)
 
     Examples
     --------
@@ -76,7 +76,7 @@ class FeedReader:
             raise ValueError(f"data_dir must be a Path object, got {type(data_dir)}")
 
         self.data_dir = data_dir
-        self.storage = JSONStorage(data_dir)
+        self.storage: FeedStorage = open_storage(data_dir)
         logger.debug("FeedReader initialized", data_dir=str(data_dir))
 
     def get_items(
@@ -122,27 +122,8 @@ class FeedReader:
             offset=offset,
         )
 
-        items: list[FeedItem] = []
-
-        if feed_id is not None:
-            # Get items from specific feed
-            items_data = self.storage.load_items(feed_id)
-            items = list(items_data.items)
-        else:
-            # Get items from all feeds
-            feeds_data = self.storage.load_feeds()
-            for feed in feeds_data.feeds:
-                items_data = self.storage.load_items(feed.feed_id)
-                items.extend(items_data.items)
-
-        # Sort by published date descending (None values go to the end)
-        items = self._sort_by_published_desc(items)
-
-        # Apply pagination
-        if offset > 0:
-            items = items[offset:]
-        if limit is not None:
-            items = items[:limit]
+        # Sorting and pagination are done by the storage (SQL for SQLite)
+        items = self.storage.list_items(feed_id, limit=limit, offset=offset)
 
         logger.info(
             "Items retrieved",
@@ -161,12 +142,18 @@ class FeedReader:
         category: str | None = None,
         fields: list[str] | None = None,
         limit: int | None = None,
+        since: str | None = None,
+        until: str | None = None,
     ) -> list[FeedItem]:
         """Search feed items by keyword.
 
         Performs case-insensitive partial matching on specified fields.
         By default, searches in title, summary, and content fields.
 
+        With ``SQLiteStorage`` the query is answered from the full-text index
+        and results are ranked by relevance; with ``JSONStorage`` every
+        items.json is scanned and results are sorted by published date.
+
         Parameters
         ----------
         query : str
@@ -177,11 +164,15 @@ class FeedReader:
             Fields to search in. If None, defaults to ["title", "summary", "content"].
         limit : int | None, default=None
             Maximum number of results to return.
+        since : str | None, default=None
+            Only items published at or after this ISO 8601 timestamp.
+        until : str | None, default=None
+            Only items published before this ISO 8601 timestamp.
 
         Returns
         -------
         list[FeedItem]
-            List of matching items sorted by published date descending
+            List of matching items
 
         Examples
         --------
@@ -190,8 +181,10 @@ class FeedReader:
         >>> items = reader.search_items(query="Bitcoin")
         >>> # Search only in title field
         >>> items = reader.search_items(query="Bitcoin", fields=["title"])
-        >>> # Filter by category
-        >>> items = reader.search_items(query="market", category="finance")
+        >>> # Filter by category and publication date
+        >>> items = reader.search_items(
+        ...     query="market", category="finance", since="2026-01-01"
+        ... )
         """
         logger.debug(
             "Searching items",
@@ -199,37 +192,18 @@ class FeedReader:
             category=category,
             fields=fields,
             limit=limit,
+            since=since,
+            until=until,
         )
 
-        if fields is None:
-            fields = ["title", "summary", "content"]
-
-        # Get feeds filtered by category if specified
-        feeds_data = self.storage.load_feeds()
-        target_feeds = feeds_data.feeds
-        if category is not None:
-            target_feeds = [f for f in target_feeds if f.category == category]
-
-        # Collect items from target feeds
-        all_items: list[FeedItem] = []
-        for feed in target_feeds:
-            items_data = self.storage.load_items(feed.feed_id)
-            all_items.extend(items_data.items)
-
-        # Filter by query
-        query_lower = query.lower()
-        matched_items: list[FeedItem] = []
-
-        for item in all_items:
-            if self._item_matches_query(item, query_lower, fields):
-                matched_items.append(item)
-
-        # Sort by published date descending
-        matched_items = self._sort_by_published_desc(matched_items)
-
-        # Apply limit
-        if limit is not None:
-            matched_items = matched_items[:limit]
+        matched_items = self.storage.search_items(
+            query,
+            category=category,
+            fields=fields,
+            since=since,
+            until=until,
+            limit=limit,
+        )
 
         logger.info(
             "Search completed",
@@ -241,56 +215,3 @@ class FeedReader:
         )
 
         return matched_items
-
-    def _item_matches_query(
-        self,
-        item: FeedItem,
-        query_lower: str,
-        fields: list[str],
-    ) -> bool:
-        """Check if an item matches the search query.
-
-        Parameters
-        ----------
-        item : FeedItem
-            Feed item to check
-        query_lower : str
-            Lowercase search query
-        fields : list[str]
-            Fields to search in
-
-        Returns
-        -------
-        bool
-            True if item matches the query in any of the specified fields
-        """
-        for field in fields:
-            value = getattr(item, field, None)
-            if value is not None and query_lower in value.lower():
-                return True
-        return False
-
-    def _sort_by_published_desc(self, items: list[FeedItem]) -> list[FeedItem]:
-        """Sort items by published date in descending order.
-
-        Items with None published date are placed at the end.
-
-        Parameters
-        ----------
-        items : list[FeedItem]
-            Items to sort
-
-        Returns
-        -------
-        list[FeedItem]
-            Sorted items (newest first, None published at end)
-        """
-        # Split into items with and without published date
-        with_date = [x for x in items if x.published is not None]
-        without_date = [x for x in items if x.published is None]
-
-        # Sort those with dates in descending order
-        with_date.sort(key=lambda x: x.published, reverse=True)  # type: ignore[arg-type]
-
-        # Append those without dates at the end
-        return with_date + without_date
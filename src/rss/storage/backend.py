@@ -0,0 +1,126 @@
+"""Storage backend selection for RSS feed data.
+
+This module defines the interface shared by ``JSONStorage`` and
+``SQLiteStorage`` and selects the backend for a data directory.
+"""
+
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+from utils_core.logging import get_logger
+
+from ..types import Feed, FeedItem, FeedItemsData, FeedsData
+from .json_storage import JSONStorage
+from .sqlite_storage import DB_FILENAME, SQLiteStorage
+
+logger = get_logger(__name__)
+
+StorageBackend = Literal["auto", "json", "sqlite"]
+
+
+class FeedStorage(Protocol):
+    """Interface implemented by ``JSONStorage`` and ``SQLiteStorage``."""
+
+    data_dir: Path
+
+    def save_feeds(self, data: FeedsData) -> None:
+        """Replace the feed registry."""
+        ...
+
+    def load_feeds(self) -> FeedsData:
+        """Load the feed registry."""
+        ...
+
+    def get_feed(self, feed_id: str) -> Feed | None:
+        """Get a single feed."""
+        ...
+
+    def update_feed(self, feed_id: str, changes: Mapping[str, Any]) -> bool:
+        """Update fields of a single feed."""
+        ...
+
+    def save_items(self, feed_id: str, data: FeedItemsData) -> None:
+        """Replace all items of a feed."""
+        ...
+
+    def load_items(self, feed_id: str) -> FeedItemsData:
+        """Load all items of a feed."""
+        ...
+
+    def find_items_by_link(self, feed_id: str, links: Iterable[str]) -> list[FeedItem]:
+        """Get stored items of a feed whose link is in links."""
+        ...
+
+    def append_items(self, feed_id: str, items: list[FeedItem]) -> int:
+        """Prepend new items and return the total item count."""
+        ...
+
+    def list_items(
+        self,
+        feed_id: str | None = None,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[FeedItem]:
+        """Get items sorted by published date descending with pagination."""
+        ...
+
+    def search_items(
+        self,
+        query: str,
+        *,
+        category: str | None = None,
+        fields: list[str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+    ) -> list[FeedItem]:
+        """Search items of registered feeds."""
+        ...
+
+    def count_items(self, feed_id: str) -> int:
+        """Get the number of stored items for a feed."""
+        ...
+
+    def delete_items(self, feed_id: str) -> None:
+        """Delete all stored items of a feed."""
+        ...
+
+
+def open_storage(data_dir: Path, backend: StorageBackend = "auto") -> FeedStorage:
+    """Open the storage backend for a data directory.
+
+    Parameters
+    ----------
+    data_dir : Path
+        Root directory for RSS feed data
+    backend : {"auto", "json", "sqlite"}, default="auto"
+        Backend to use. ``"auto"`` selects SQLite when ``rss.db`` exists in
+        data_dir (i.e. after ``migrate_json_to_sqlite``) and JSON otherwise.
+
+    Returns
+    -------
+    FeedStorage
+        Storage instance
+
+    Raises
+    ------
+    ValueError
+        If backend is not one of the supported values
+
+    Examples
+    --------
+    >>> storage = open_storage(Path("data/raw/rss"))
+    >>> type(storage).__name__
+    'JSONStorage'
+    """
+    if backend == "auto":
+        backend = "sqlite" if (data_dir / DB_FILENAME).exists() else "json"
+
+    if backend == "sqlite":
+        return SQLiteStorage(data_dir)
+    if backend == "json":
+        return JSONStorage(data_dir)
+
+    raise ValueError(f"Unknown storage backend: {backend}")
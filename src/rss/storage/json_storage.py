@@ -5,15 +5,18 @@ All operations use file locking to ensure safe concurrent access.
 """
 
 import json
-from dataclasses import asdict
+import shutil
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, fields
 from pathlib import Path
+from typing import Any
 
 from utils_core.errors import log_and_reraise
 from utils_core.logging import get_logger
 
 from ..exceptions import RSSError
 from ..storage.lock_manager import LockManager
-from ..types import FeedItemsData, FeedsData
+from ..types import Feed, FeedItem, FeedItemsData, FeedsData
 
 logger = get_logger(__name__)
 
@@ -406,3 +409,242 @@ class JSONStorage:
             )
 
             return items_data
+
+    def get_feed(self, feed_id: str) -> Feed | None:
+        """Get a single feed from the registry.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+
+        Returns
+        -------
+        Feed | None
+            Feed object if found, None otherwise
+        """
+        return next(
+            (feed for feed in self.load_feeds().feeds if feed.feed_id == feed_id),
+            None,
+        )
+
+    def update_feed(self, feed_id: str, changes: Mapping[str, Any]) -> bool:
+        """Update fields of a single feed.
+
+        The whole feeds.json is rewritten; ``SQLiteStorage`` updates one row.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        changes : Mapping[str, Any]
+            Feed field names and their new values
+
+        Returns
+        -------
+        bool
+            True if the feed was found and updated
+
+        Raises
+        ------
+        ValueError
+            If changes contain an unknown or immutable field
+        """
+        validate_feed_changes(changes)
+
+        feeds_data = self.load_feeds()
+        for feed in feeds_data.feeds:
+            if feed.feed_id == feed_id:
+                for name, value in changes.items():
+                    setattr(feed, name, value)
+                self.save_feeds(feeds_data)
+                return True
+        return False
+
+    def find_items_by_link(self, feed_id: str, links: Iterable[str]) -> list[FeedItem]:
+        """Get stored items of a feed whose link is in links.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        links : Iterable[str]
+            Links to look up
+
+        Returns
+        -------
+        list[FeedItem]
+            Stored items with a matching link
+        """
+        targets = set(links)
+        return [item for item in self.load_items(feed_id).items if item.link in targets]
+
+    def append_items(self, feed_id: str, items: list[FeedItem]) -> int:
+        """Prepend new items to a feed's items.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        items : list[FeedItem]
+            New items (newest first)
+
+        Returns
+        -------
+        int
+            Total number of stored items for the feed
+        """
+        existing = self.load_items(feed_id)
+        merged = items + existing.items
+        self.save_items(
+            feed_id, FeedItemsData(version="1.0", feed_id=feed_id, items=merged)
+        )
+        return len(merged)
+
+    def list_items(
+        self,
+        feed_id: str | None = None,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[FeedItem]:
+        """Get items sorted by published date descending with pagination.
+
+        Parameters
+        ----------
+        feed_id : str | None, default=None
+            Feed identifier. If None, returns items from all registered feeds.
+        limit : int | None, default=None
+            Maximum number of items to return. If None, returns all items.
+        offset : int, default=0
+            Number of items to skip before returning results.
+
+        Returns
+        -------
+        list[FeedItem]
+            Items sorted by published date descending (None published at end)
+        """
+        if feed_id is not None:
+            items = list(self.load_items(feed_id).items)
+        else:
+            items = []
+            for feed in self.load_feeds().feeds:
+                items.extend(self.load_items(feed.feed_id).items)
+
+        end = None if limit is None else offset + limit
+        return _sort_by_published_desc(items)[offset:end]
+
+    def search_items(
+        self,
+        query: str,
+        *,
+        category: str | None = None,
+        fields: list[str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+    ) -> list[FeedItem]:
+        """Search items of registered feeds by case-insensitive partial match.
+
+        Every items.json of the target feeds is scanned; ``SQLiteStorage``
+        answers the same query from its full-text index.
+
+        Parameters
+        ----------
+        query : str
+            Search query string (empty matches every item)
+        category : str | None, default=None
+            Filter by feed category
+        fields : list[str] | None, default=None
+            Fields to search in (default: title, summary, content)
+        since : str | None, default=None
+            Only items published at or after this ISO 8601 timestamp
+        until : str | None, default=None
+            Only items published before this ISO 8601 timestamp
+        limit : int | None, default=None
+            Maximum number of results to return
+
+        Returns
+        -------
+        list[FeedItem]
+            Matching items sorted by published date descending
+        """
+        search_fields = fields or ["title", "summary", "content"]
+        query_lower = query.lower()
+
+        matched: list[FeedItem] = []
+        for feed in self.load_feeds().feeds:
+            if category is not None and feed.category != category:
+                continue
+            for item in self.load_items(feed.feed_id).items:
+                if since is not None and (
+                    item.published is None or item.published < since
+                ):
+                    continue
+                if until is not None and (
+                    item.published is None or item.published >= until
+                ):
+                    continue
+                if any(
+                    (value := getattr(item, field, None)) is not None
+                    and query_lower in value.lower()
+                    for field in search_fields
+                ):
+                    matched.append(item)
+
+        return _sort_by_published_desc(matched)[:limit]
+
+    def count_items(self, feed_id: str) -> int:
+        """Get the number of stored items for a feed.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+
+        Returns
+        -------
+        int
+            Number of stored items
+        """
+        return len(self.load_items(feed_id).items)
+
+    def delete_items(self, feed_id: str) -> None:
+        """Delete all stored items of a feed.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        """
+        items_dir = self.data_dir / feed_id
+        if items_dir.exists():
+            shutil.rmtree(items_dir)
+            logger.debug("Items directory deleted", items_dir=str(items_dir))
+
+
+def _sort_by_published_desc(items: list[FeedItem]) -> list[FeedItem]:
+    """Sort items by published date descending (None published at end)."""
+    with_date = [x for x in items if x.published is not None]
+    without_date = [x for x in items if x.published is None]
+    with_date.sort(key=lambda x: x.published, reverse=True)  # type: ignore[arg-type]
+    return with_date + without_date
+
+
+def validate_feed_changes(changes: Mapping[str, Any]) -> None:
+    """Validate field names passed to ``update_feed``.
+
+    Parameters
+    ----------
+    changes : Mapping[str, Any]
+        Feed field names and their new values
+
+    Raises
+    ------
+    ValueError
+        If changes contain an unknown field or ``feed_id``
+    """
+    allowed = {field.name for field in fields(Feed)} - {"feed_id"}
+    unknown = set(changes) - allowed
+    if unknown:
+        raise ValueError(f"Cannot update feed fields: {sorted(unknown)}")
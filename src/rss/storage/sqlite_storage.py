@@ -0,0 +1,867 @@
+"""SQLite storage for RSS feed data.
+
+This module provides an indexed alternative to ``JSONStorage``. Feeds and
+items live in a single SQLite database (``rss.db``) in WAL mode, so a poll
+inserts only the new items and updates only one feed row instead of
+rewriting ``items.json`` and ``feeds.json``. An FTS5 full-text index over
+title/summary/content is kept in sync with the items table by triggers.
+"""
+
+import sqlite3
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import closing, contextmanager
+from dataclasses import astuple, dataclass, fields
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from utils_core.errors import log_and_reraise
+from utils_core.logging import get_logger
+
+from ..exceptions import RSSError
+from ..types import (
+    Feed,
+    FeedItem,
+    FeedItemsData,
+    FeedsData,
+    FetchInterval,
+    FetchStatus,
+)
+from .json_storage import JSONStorage, validate_feed_changes
+
+logger = get_logger(__name__)
+
+DB_FILENAME = "rss.db"
+SCHEMA_VERSION = "1.0"
+
+# SQLite のバインド変数上限を下回るチャンクサイズ
+_IN_CHUNK_SIZE = 500
+
+# 全文検索インデックスの対象フィールド
+SEARCH_FIELDS: tuple[str, ...] = ("title", "summary", "content")
+
+# trigram トークナイザーは3文字未満のクエリを索引で検索できない
+_MIN_INDEXED_QUERY_LENGTH = 3
+
+# カテゴリ・公開日で絞り込むときに順位付けする候補の倍率
+_FILTER_OVERFETCH = 4
+
+FEED_COLUMNS: tuple[str, ...] = tuple(field.name for field in fields(Feed))
+ITEM_COLUMNS: tuple[str, ...] = tuple(field.name for field in fields(FeedItem))
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feeds (
+    feed_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    {", ".join(f"{name} TEXT" for name in FEED_COLUMNS[1:])}
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    feed_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    {", ".join(f"{name} TEXT" for name in ITEM_COLUMNS)}
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_items_feed_link ON items (feed_id, link);
+CREATE INDEX IF NOT EXISTS idx_items_feed_seq ON items (feed_id, seq);
+CREATE INDEX IF NOT EXISTS idx_items_item_id ON items (item_id);
+CREATE INDEX IF NOT EXISTS idx_items_published ON items (published);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5 (
+    {", ".join(SEARCH_FIELDS)},
+    content='items',
+    content_rowid='id',
+    tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, {", ".join(SEARCH_FIELDS)})
+    VALUES (new.id, {", ".join(f"new.{name}" for name in SEARCH_FIELDS)});
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, {", ".join(SEARCH_FIELDS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{name}" for name in SEARCH_FIELDS)});
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_update AFTER UPDATE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, {", ".join(SEARCH_FIELDS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{name}" for name in SEARCH_FIELDS)});
+    INSERT INTO items_fts (rowid, {", ".join(SEARCH_FIELDS)})
+    VALUES (new.id, {", ".join(f"new.{name}" for name in SEARCH_FIELDS)});
+END;
+"""
+
+# JSONStorage と同じ並び順: published 降順（None は末尾）、同順位は格納順
+_ORDER_BY = "items.published IS NULL, items.published DESC"
+
+
+@dataclass(frozen=True)
+class MigrationResult:
+    """Result of migrating the JSON layout to SQLite.
+
+    Attributes
+    ----------
+    feeds : int
+        Number of migrated feeds
+    items : int
+        Number of migrated items
+    skipped_items : int
+        Number of items dropped because their link was duplicated in a feed
+    db_path : Path
+        Path of the created database
+    """
+
+    feeds: int
+    items: int
+    skipped_items: int
+    db_path: Path
+
+
+def _feed_to_row(feed: Feed) -> tuple[Any, ...]:
+    """Convert a Feed to column values (Enum to value, bool to int)."""
+    return tuple(
+        value.value if isinstance(value, Enum) else value for value in astuple(feed)
+    )
+
+
+def _row_to_feed(row: sqlite3.Row) -> Feed:
+    """Convert a feeds row to a Feed."""
+    values = {name: row[name] for name in FEED_COLUMNS}
+    values["fetch_interval"] = FetchInterval(values["fetch_interval"])
+    values["last_status"] = FetchStatus(values["last_status"])
+    values["enabled"] = bool(int(values["enabled"]))
+    return Feed(**values)
+
+
+def _row_to_item(row: sqlite3.Row) -> FeedItem:
+    """Convert an items row to a FeedItem."""
+    return FeedItem(**{name: row[name] for name in ITEM_COLUMNS})
+
+
+class SQLiteStorage:
+    """SQLite storage for RSS feed data.
+
+    Provides the same interface as ``JSONStorage`` so that ``FeedManager``,
+    ``FeedFetcher``, ``FeedReader``, the CLI and the MCP server work unchanged,
+    plus incremental operations backed by indexes:
+
+    - ``append_items`` inserts only new rows (unique index on feed_id + link)
+    - ``update_feed`` updates a single feed row
+    - ``list_items`` pages through items with ``LIMIT``/``OFFSET``
+    - ``search_items`` queries the FTS5 index ranked by BM25
+
+    Each operation opens its own connection, so the storage can be shared
+    across threads. WAL mode lets readers proceed while a poll is writing.
+
+    Parameters
+    ----------
+    data_dir : Path
+        Root directory for RSS feed data (e.g., data/raw/rss/)
+    db_path : Path | None, default=None
+        Database file path (default: ``data_dir / "rss.db"``)
+
+    Attributes
+    ----------
+    data_dir : Path
+        Root directory for RSS feed data
+    db_path : Path
+        Database file path
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> storage = SQLiteStorage(Path("data/raw/rss"))
+    >>> storage.list_items(limit=10)
+    []
+    """
+
+    def __init__(self, data_dir: Path, db_path: Path | None = None) -> None:
+        """Initialize SQLiteStorage and create the schema if needed.
+
+        Parameters
+        ----------
+        data_dir : Path
+            Root directory for RSS feed data
+        db_path : Path | None, default=None
+            Database file path (default: ``data_dir / "rss.db"``)
+
+        Raises
+        ------
+        ValueError
+            If data_dir is not a Path object
+        RSSError
+            If the database cannot be initialized
+        """
+        if not isinstance(data_dir, Path):  # type: ignore[reportUnnecessaryIsInstance]
+            logger.error(
+                "Invalid data_dir type",
+                data_dir=str(data_dir),
+                expected_type="Path",
+                actual_type=type(data_dir).__name__,
+            )
+            raise ValueError(f"data_dir must be a Path object, got {type(data_dir)}")
+
+        self.data_dir = data_dir
+        self.db_path = db_path or data_dir / DB_FILENAME
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with (
+            log_and_reraise(
+                logger,
+                f"initialize database {self.db_path}",
+                context={"db_path": str(self.db_path)},
+                reraise_as=RSSError,
+            ),
+            self._connect() as conn,
+        ):
+            conn.execute("PRAGMA journal_mode=WAL")
+            has_index = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'items_fts'"
+            ).fetchone()
+            conn.executescript(_SCHEMA)
+            if not has_index:
+                # 既存の items から全文検索インデックスを構築する
+                conn.execute("INSERT INTO items_fts (items_fts) VALUES ('rebuild')")
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('version', ?)",
+                (SCHEMA_VERSION,),
+            )
+
+        logger.debug("SQLiteStorage initialized", db_path=str(self.db_path))
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Open a connection, commit on success and always close it."""
+        with closing(sqlite3.connect(self.db_path, timeout=30.0)) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+
+    def save_feeds(self, data: FeedsData) -> None:
+        """Replace the feed registry.
+
+        Parameters
+        ----------
+        data : FeedsData
+            Feed registry data to save
+
+        Raises
+        ------
+        RSSError
+            If the database write fails
+        """
+        logger.debug("Saving feeds", db_path=str(self.db_path), count=len(data.feeds))
+
+        placeholders = ", ".join("?" * (len(FEED_COLUMNS) + 1))
+        with (
+            log_and_reraise(
+                logger,
+                "save feeds",
+                context={"db_path": str(self.db_path)},
+                reraise_as=RSSError,
+            ),
+            self._connect() as conn,
+        ):
+            conn.execute("DELETE FROM feeds")
+            conn.executemany(
+                f"INSERT INTO feeds (position, {', '.join(FEED_COLUMNS)}) "  # nosec B608
+                f"VALUES ({placeholders})",
+                [
+                    (position, *_feed_to_row(feed))
+                    for position, feed in enumerate(data.feeds)
+                ],
+            )
+
+        logger.info("Feeds saved successfully", feeds_count=len(data.feeds))
+
+    def load_feeds(self) -> FeedsData:
+        """Load the feed registry.
+
+        Returns
+        -------
+        FeedsData
+            Feed registry data in registration order
+
+        Raises
+        ------
+        RSSError
+            If the database read fails
+        """
+        with (
+            log_and_reraise(
+                logger,
+                "load feeds",
+                context={"db_path": str(self.db_path)},
+                reraise_as=RSSError,
+            ),
+            self._connect() as conn,
+        ):
+            rows = conn.execute("SELECT * FROM feeds ORDER BY position").fetchall()
+
+        feeds = [_row_to_feed(row) for row in rows]
+        logger.debug("Feeds loaded", feeds_count=len(feeds))
+        return FeedsData(version=SCHEMA_VERSION, feeds=feeds)
+
+    def get_feed(self, feed_id: str) -> Feed | None:
+        """Get a single feed by primary key.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+
+        Returns
+        -------
+        Feed | None
+            Feed object if found, None otherwise
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM feeds WHERE feed_id = ?", (feed_id,)
+            ).fetchone()
+        return None if row is None else _row_to_feed(row)
+
+    def update_feed(self, feed_id: str, changes: Mapping[str, Any]) -> bool:
+        """Update fields of a single feed row.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        changes : Mapping[str, Any]
+            Feed field names and their new values
+
+        Returns
+        -------
+        bool
+            True if the feed was found and updated
+
+        Raises
+        ------
+        ValueError
+            If changes contain an unknown or immutable field
+        """
+        validate_feed_changes(changes)
+        if not changes:
+            return self.get_feed(feed_id) is not None
+
+        assignments = ", ".join(f"{name} = ?" for name in changes)
+        values = [
+            value.value if isinstance(value, Enum) else value
+            for value in changes.values()
+        ]
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE feeds SET {assignments} WHERE feed_id = ?",  # nosec B608
+                (*values, feed_id),
+            )
+        return cursor.rowcount > 0
+
+    def save_items(self, feed_id: str, data: FeedItemsData) -> None:
+        """Replace all items of a feed.
+
+        Items whose link already appeared earlier in ``data.items`` are
+        dropped (links are unique per feed).
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        data : FeedItemsData
+            Feed items data to save
+
+        Raises
+        ------
+        ValueError
+            If feed_id is empty or data.feed_id doesn't match feed_id
+        RSSError
+            If the database write fails
+        """
+        self._validate_feed_id(feed_id)
+        if data.feed_id != feed_id:
+            logger.error("Feed ID mismatch", expected=feed_id, actual=data.feed_id)
+            raise ValueError(
+                f"data.feed_id ({data.feed_id}) must match feed_id ({feed_id})"
+            )
+
+        with (
+            log_and_reraise(
+                logger,
+                f"save items for feed {feed_id}",
+                context={"feed_id": feed_id, "db_path": str(self.db_path)},
+                reraise_as=RSSError,
+            ),
+            self._connect() as conn,
+        ):
+            conn.execute("DELETE FROM items WHERE feed_id = ?", (feed_id,))
+            self._insert_items(conn, feed_id, data.items, first_seq=0)
+
+        logger.info(
+            "Items saved successfully", feed_id=feed_id, items_count=len(data.items)
+        )
+
+    def load_items(self, feed_id: str) -> FeedItemsData:
+        """Load all items of a feed in stored order (newest first).
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+
+        Returns
+        -------
+        FeedItemsData
+            Feed items data (empty if the feed has no items)
+
+        Raises
+        ------
+        ValueError
+            If feed_id is empty
+        RSSError
+            If the database read fails
+        """
+        self._validate_feed_id(feed_id)
+
+        with (
+            log_and_reraise(
+                logger,
+                f"load items for feed {feed_id}",
+                context={"feed_id": feed_id, "db_path": str(self.db_path)},
+                reraise_as=RSSError,
+            ),
+            self._connect() as conn,
+        ):
+            rows = conn.execute(
+                "SELECT * FROM items WHERE feed_id = ? ORDER BY seq", (feed_id,)
+            ).fetchall()
+
+        return FeedItemsData(
+            version=SCHEMA_VERSION,
+            feed_id=feed_id,
+            items=[_row_to_item(row) for row in rows],
+        )
+
+    def find_items_by_link(self, feed_id: str, links: Iterable[str]) -> list[FeedItem]:
+        """Get stored items of a feed whose link is in links.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        links : Iterable[str]
+            Links to look up
+
+        Returns
+        -------
+        list[FeedItem]
+            Stored items with a matching link
+        """
+        unique_links = list(dict.fromkeys(links))
+        found: list[FeedItem] = []
+        with self._connect() as conn:
+            for start in range(0, len(unique_links), _IN_CHUNK_SIZE):
+                chunk = unique_links[start : start + _IN_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT * FROM items WHERE feed_id = ? "  # nosec B608
+                    f"AND link IN ({', '.join('?' * len(chunk))})",
+                    (feed_id, *chunk),
+                ).fetchall()
+                found.extend(_row_to_item(row) for row in rows)
+        return found
+
+    def append_items(self, feed_id: str, items: list[FeedItem]) -> int:
+        """Insert new items ahead of the stored ones.
+
+        Items whose link is already stored for the feed are ignored.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        items : list[FeedItem]
+            New items (newest first)
+
+        Returns
+        -------
+        int
+            Total number of stored items for the feed
+        """
+        self._validate_feed_id(feed_id)
+
+        with (
+            log_and_reraise(
+                logger,
+                f"append items for feed {feed_id}",
+                context={"feed_id": feed_id, "db_path": str(self.db_path)},
+                reraise_as=RSSError,
+            ),
+            self._connect() as conn,
+        ):
+            if items:
+                (min_seq,) = conn.execute(
+                    "SELECT COALESCE(MIN(seq), 0) FROM items WHERE feed_id = ?",
+                    (feed_id,),
+                ).fetchone()
+                self._insert_items(conn, feed_id, items, first_seq=min_seq - len(items))
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM items WHERE feed_id = ?", (feed_id,)
+            ).fetchone()
+
+        logger.debug(
+            "Items appended", feed_id=feed_id, appended=len(items), items_count=count
+        )
+        return int(count)
+
+    def list_items(
+        self,
+        feed_id: str | None = None,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[FeedItem]:
+        """Get items sorted by published date descending with pagination.
+
+        Parameters
+        ----------
+        feed_id : str | None, default=None
+            Feed identifier. If None, returns items from all registered feeds.
+        limit : int | None, default=None
+            Maximum number of items to return. If None, returns all items.
+        offset : int, default=0
+            Number of items to skip before returning results.
+
+        Returns
+        -------
+        list[FeedItem]
+            Items sorted by published date descending (None published at end)
+        """
+        page = (-1 if limit is None else limit, offset)
+        with self._connect() as conn:
+            if feed_id is not None:
+                rows = conn.execute(
+                    f"SELECT * FROM items WHERE feed_id = ? "  # nosec B608
+                    f"ORDER BY {_ORDER_BY}, seq LIMIT ? OFFSET ?",
+                    (feed_id, *page),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT items.* FROM items "  # nosec B608
+                    f"JOIN feeds ON feeds.feed_id = items.feed_id "
+                    f"ORDER BY {_ORDER_BY}, feeds.position, items.seq "
+                    f"LIMIT ? OFFSET ?",
+                    page,
+                ).fetchall()
+        return [_row_to_item(row) for row in rows]
+
+    def search_items(
+        self,
+        query: str,
+        *,
+        category: str | None = None,
+        fields: list[str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+    ) -> list[FeedItem]:
+        """Search items of registered feeds with the full-text index.
+
+        The index uses the trigram tokenizer, so matching is case-insensitive
+        partial matching like ``JSONStorage.search_items`` (including Japanese
+        text). A trailing ``*`` is accepted as a prefix marker. Results are
+        ranked by BM25 relevance, then by published date descending.
+
+        Queries shorter than 3 characters and fields outside the index
+        (e.g. ``author``) fall back to a ``LIKE`` scan ordered by published
+        date.
+
+        Parameters
+        ----------
+        query : str
+            Search query string (empty matches every item)
+        category : str | None, default=None
+            Filter by feed category
+        fields : list[str] | None, default=None
+            Fields to search in (default: title, summary, content)
+        since : str | None, default=None
+            Only items published at or after this ISO 8601 timestamp
+        until : str | None, default=None
+            Only items published before this ISO 8601 timestamp
+        limit : int | None, default=None
+            Maximum number of results to return
+
+        Returns
+        -------
+        list[FeedItem]
+            Matching items
+        """
+        text = query.strip().rstrip("*").strip()
+        search_fields = [
+            field for field in (fields or SEARCH_FIELDS) if field in ITEM_COLUMNS
+        ]
+        if text and not search_fields:
+            return []
+
+        conditions: list[str] = []
+        params: list[Any] = []
+        if category is not None:
+            conditions.append("feeds.category = ?")
+            params.append(category)
+        if since is not None:
+            conditions.append("items.published >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("items.published < ?")
+            params.append(until)
+
+        use_index = len(text) >= _MIN_INDEXED_QUERY_LENGTH and set(
+            search_fields
+        ) <= set(SEARCH_FIELDS)
+
+        with (
+            log_and_reraise(
+                logger,
+                "search items",
+                context={"query": query, "db_path": str(self.db_path)},
+                reraise_as=RSSError,
+            ),
+            self._connect() as conn,
+        ):
+            if use_index:
+                phrase = '"' + text.replace('"', '""') + '"'
+                rows = self._search_index(
+                    conn,
+                    f"{{{' '.join(search_fields)}}} : {phrase}",
+                    conditions,
+                    params,
+                    limit=limit,
+                )
+            else:
+                if text:
+                    escaped = (
+                        text.replace("\\", "\\\\")
+                        .replace("%", "\\%")
+                        .replace("_", "\\_")
+                    )
+                    likes = " OR ".join(
+                        f"items.{field} LIKE ? ESCAPE '\\'" for field in search_fields
+                    )
+                    conditions.insert(0, f"({likes})")
+                    params[0:0] = [f"%{escaped}%"] * len(search_fields)
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                rows = conn.execute(
+                    f"SELECT items.* FROM items "  # nosec B608
+                    f"JOIN feeds ON feeds.feed_id = items.feed_id {where} "
+                    f"ORDER BY {_ORDER_BY} LIMIT ?",
+                    (*params, -1 if limit is None else limit),
+                ).fetchall()
+
+        logger.debug(
+            "Items searched",
+            query=query,
+            category=category,
+            indexed=use_index,
+            matched_count=len(rows),
+        )
+        return [_row_to_item(row) for row in rows]
+
+    @staticmethod
+    def _search_index(
+        conn: sqlite3.Connection,
+        match: str,
+        conditions: list[str],
+        params: list[Any],
+        *,
+        limit: int | None,
+    ) -> list[sqlite3.Row]:
+        """Query the FTS5 index, ranking only as many hits as needed.
+
+        FTS5 picks the best ``fts_limit`` hits by rank before they are joined
+        with items/feeds. When filters leave fewer than limit rows, the hit
+        window grows until it covers every match.
+        """
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = (
+            "WITH hits AS ("
+            "SELECT rowid, rank FROM items_fts WHERE items_fts MATCH ? "
+            "ORDER BY rank LIMIT ?) "
+            "SELECT items.* FROM hits JOIN items ON items.id = hits.rowid "  # nosec B608
+            f"JOIN feeds ON feeds.feed_id = items.feed_id {where} "
+            f"ORDER BY hits.rank, {_ORDER_BY} LIMIT ?"
+        )
+        if limit is None:
+            return conn.execute(sql, (match, -1, *params, -1)).fetchall()
+
+        fts_limit = limit * (_FILTER_OVERFETCH if conditions else 1)
+        total_hits: int | None = None
+        while True:
+            rows = conn.execute(sql, (match, fts_limit, *params, limit)).fetchall()
+            if len(rows) >= limit:
+                return rows
+            if total_hits is None:
+                (count,) = conn.execute(
+                    "SELECT COUNT(*) FROM items_fts WHERE items_fts MATCH ?", (match,)
+                ).fetchone()
+                total_hits = int(count)
+            if fts_limit >= total_hits:
+                return rows
+            fts_limit *= _FILTER_OVERFETCH
+
+    def count_items(self, feed_id: str) -> int:
+        """Get the number of stored items for a feed.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+
+        Returns
+        -------
+        int
+            Number of stored items
+        """
+        with self._connect() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM items WHERE feed_id = ?", (feed_id,)
+            ).fetchone()
+        return int(count)
+
+    def delete_items(self, feed_id: str) -> None:
+        """Delete all stored items of a feed.
+
+        Parameters
+        ----------
+        feed_id : str
+            Feed identifier
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM items WHERE feed_id = ?", (feed_id,))
+
+    @staticmethod
+    def _validate_feed_id(feed_id: str) -> None:
+        """Raise ValueError for an empty feed_id."""
+        if not feed_id:
+            logger.error("Invalid feed_id", feed_id=feed_id)
+            raise ValueError("feed_id cannot be empty")
+
+    @staticmethod
+    def _insert_items(
+        conn: sqlite3.Connection,
+        feed_id: str,
+        items: list[FeedItem],
+        *,
+        first_seq: int,
+    ) -> None:
+        """Insert items with consecutive seq values, ignoring known links."""
+        placeholders = ", ".join("?" * (len(ITEM_COLUMNS) + 2))
+        conn.executemany(
+            f"INSERT OR IGNORE INTO items (feed_id, seq, {', '.join(ITEM_COLUMNS)}) "  # nosec B608
+            f"VALUES ({placeholders})",
+            [(feed_id, first_seq + i, *astuple(item)) for i, item in enumerate(items)],
+        )
+
+
+def _remove_database(db_path: Path) -> None:
+    """Delete a database file together with its WAL and shared-memory files."""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+
+def migrate_json_to_sqlite(
+    data_dir: Path,
+    *,
+    db_path: Path | None = None,
+    overwrite: bool = False,
+) -> MigrationResult:
+    """Migrate the JSON layout (feeds.json, {feed_id}/items.json) to SQLite.
+
+    The JSON files are left untouched. The database is built under a
+    temporary name and renamed to ``rss.db`` only after every feed has been
+    migrated, so ``open_storage`` never selects a partially migrated
+    database. An existing database is kept if the migration fails.
+
+    Parameters
+    ----------
+    data_dir : Path
+        Root directory for RSS feed data
+    db_path : Path | None, default=None
+        Database file path (default: ``data_dir / "rss.db"``)
+    overwrite : bool, default=False
+        Replace an existing database
+
+    Returns
+    -------
+    MigrationResult
+        Numbers of migrated feeds and items
+
+    Raises
+    ------
+    FileExistsError
+        If the database already exists and overwrite is False
+
+    Examples
+    --------
+    >>> result = migrate_json_to_sqlite(Path("data/raw/rss"))
+    >>> print(f"{result.feeds} feeds, {result.items} items")
+    """
+    db_path = db_path or data_dir / DB_FILENAME
+    if db_path.exists() and not overwrite:
+        raise FileExistsError(f"Database already exists: {db_path}")
+
+    build_path = db_path.with_name(f"{db_path.name}.migrating")
+    # 前回中断した移行の残骸を消してから構築する
+    _remove_database(build_path)
+
+    logger.info("Migrating JSON storage", data_dir=str(data_dir), db_path=str(db_path))
+
+    try:
+        source = JSONStorage(data_dir)
+        target = SQLiteStorage(data_dir, build_path)
+
+        feeds_data = source.load_feeds()
+        target.save_feeds(feeds_data)
+
+        # 未登録フィードの items.json も移行してデータを失わないようにする
+        feed_ids = [feed.feed_id for feed in feeds_data.feeds]
+        registered = set(feed_ids)
+        feed_ids += sorted(
+            path.parent.name
+            for path in data_dir.glob("*/items.json")
+            if path.parent.name not in registered
+        )
+
+        total_items = 0
+        stored_items = 0
+        for feed_id in feed_ids:
+            items_data = source.load_items(feed_id)
+            if not items_data.items:
+                continue
+            target.save_items(feed_id, items_data)
+            total_items += len(items_data.items)
+            stored_items += target.count_items(feed_id)
+
+        # WAL を本体に書き戻し、リネームするファイルを1つにする
+        with closing(sqlite3.connect(build_path)) as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+    except BaseException:
+        _remove_database(build_path)
+        raise
+
+    # 旧 DB の WAL が新しい DB に適用されないよう、まとめて削除してから置き換える
+    _remove_database(db_path)
+    build_path.replace(db_path)
+
+    result = MigrationResult(
+        feeds=len(feeds_data.feeds),
+        items=stored_items,
+        skipped_items=total_items - stored_items,
+        db_path=db_path,
+    )
+    logger.info(
+        "JSON storage migrated",
+        feeds=result.feeds,
+        items=result.items,
+        skipped_items=result.skipped_items,
+        db_path=str(db_path),
+    )
+    return result
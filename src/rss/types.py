@@ -153,6 +153,10 @@ class Feed:
         Last fetch status
     enabled : bool
         Whether the feed is enabled
+    etag : str | None
+        ``ETag`` validator from the last successful fetch
+    last_modified : str | None
+        ``Last-Modified`` validator from the last successful fetch
     """
 
     feed_id: str
@@ -165,6 +169,8 @@ class Feed:
     last_fetched: str | None
     last_status: FetchStatus
     enabled: bool
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 @dataclass
@@ -271,6 +277,9 @@ class FetchResult:
         Number of new items (not duplicates)
     error_message : str | None
         Error message if failed
+    not_modified : bool
+        Whether the server answered 304 Not Modified (nothing was parsed
+        or stored)
     """
 
     feed_id: str
@@ -278,6 +287,7 @@ class FetchResult:
     items_count: int
     new_items: int
     error_message: str | None
+    not_modified: bool = False
 
 
 @dataclass
@@ -2,29 +2,59 @@
 
 This package provides portfolio strategy analysis tools including:
 - Risk calculation and metrics
+- Vectorized backtesting of weight schedules
 - Portfolio optimization
 - Result formatting and output
 - Portfolio visualization
 - Integration with market, analyze, and factor packages
 """
 
-from utils_core.logging import get_logger
-
-from .integration import (
-    FactorBasedRiskCalculator,
-    IntegratedStrategyBuilder,
-    StrategyMarketDataProvider,
-    TechnicalSignalProvider,
-    create_factor_risk_calculator,
-    create_integrated_builder,
-    create_signal_provider,
-    create_strategy_market_provider,
-)
-from .output import ResultFormatter
-from .risk import RiskCalculator, RiskMetricsResult
-from .visualization import ChartGenerator
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from utils_core.logging import get_logger
+
+    from .backtest import BacktestEngine, BacktestResult
+    from .integration import (
+        FactorBasedRiskCalculator,
+        IntegratedStrategyBuilder,
+        StrategyMarketDataProvider,
+        TechnicalSignalProvider,
+        create_factor_risk_calculator,
+        create_integrated_builder,
+        create_signal_provider,
+        create_strategy_market_provider,
+    )
+    from .output import ResultFormatter
+    from .risk import RiskCalculator, RiskMetricsResult
+    from .visualization import ChartGenerator
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "get_logger": "utils_core.logging",
+    "BacktestEngine": ".backtest",
+    "BacktestResult": ".backtest",
+    "FactorBasedRiskCalculator": ".integration",
+    "IntegratedStrategyBuilder": ".integration",
+    "StrategyMarketDataProvider": ".integration",
+    "TechnicalSignalProvider": ".integration",
+    "create_factor_risk_calculator": ".integration",
+    "create_integrated_builder": ".integration",
+    "create_signal_provider": ".integration",
+    "create_strategy_market_provider": ".integration",
+    "ResultFormatter": ".output",
+    "RiskCalculator": ".risk",
+    "RiskMetricsResult": ".risk",
+    "ChartGenerator": ".visualization",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "BacktestEngine",
+    "BacktestResult",
     "ChartGenerator",
     # Integration
     "FactorBasedRiskCalculator",
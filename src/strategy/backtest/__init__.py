@@ -0,0 +1,33 @@
+"""Backtest module for simulating portfolio weight schedules.
+
+This module simulates many portfolios over a shared price panel in a single
+vectorized pass.
+
+Classes
+-------
+BacktestEngine
+    Vectorized multi-portfolio backtest engine.
+BacktestResult
+    Data class holding simulated returns, turnover and costs.
+"""
+
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from strategy.backtest.engine import BacktestEngine
+    from strategy.backtest.types import BacktestResult
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "BacktestEngine": "strategy.backtest.engine",
+    "BacktestResult": "strategy.backtest.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "BacktestEngine",
+    "BacktestResult",
+]
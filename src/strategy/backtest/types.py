@@ -0,0 +1,89 @@
+"""Type definitions for the backtest module.
+
+This module contains the result container returned by ``BacktestEngine``.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """Simulated performance of a set of portfolios.
+
+    Every frame has one column (or index level) per portfolio, named by the
+    key the portfolio's weight schedule was passed under.
+
+    Parameters
+    ----------
+    returns : pd.DataFrame
+        Daily net returns (index: dates from the first rebalance date,
+        columns: portfolios). Transaction costs are deducted on the day of
+        the rebalance that incurs them. A portfolio whose first rebalance
+        is later than the others' is NaN until that date.
+    turnover : pd.DataFrame
+        Two-way turnover ``sum(|target - drifted|)`` per rebalance date
+        (index: rebalance dates, columns: portfolios)
+    costs : pd.DataFrame
+        Transaction cost as a fraction of portfolio value per rebalance date
+    drifted_weights : pd.DataFrame
+        Pre-trade (drifted) weights at every rebalance date
+        (index: (date, portfolio), columns: assets)
+    final_weights : pd.DataFrame
+        Drifted weights at the last date (index: portfolios, columns: assets)
+
+    Examples
+    --------
+    >>> result = engine.run(prices, {"equal": equal_weights, "value": value_weights})
+    >>> result.returns["equal"].tail()
+    >>> result.summary()[["total_return", "total_turnover"]]
+    """
+
+    returns: pd.DataFrame
+    turnover: pd.DataFrame
+    costs: pd.DataFrame
+    drifted_weights: pd.DataFrame
+    final_weights: pd.DataFrame
+
+    @property
+    def portfolios(self) -> list[str]:
+        """Names of the simulated portfolios."""
+        return list(self.returns.columns)
+
+    @property
+    def equity_curves(self) -> pd.DataFrame:
+        """Cumulative value of 1 invested at each portfolio's first rebalance."""
+        return (1 + self.returns).cumprod()
+
+    def summary(self, annualization_factor: int = 252) -> pd.DataFrame:
+        """Headline statistics for every portfolio.
+
+        Parameters
+        ----------
+        annualization_factor : int, default=252
+            Periods per year of ``returns``
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per portfolio with ``total_return``,
+            ``annualized_return``, ``annualized_volatility``,
+            ``total_turnover`` and ``total_cost``
+        """
+        n_periods = self.returns.count()
+        growth = (1 + self.returns).prod()
+        annualized = (growth ** (annualization_factor / n_periods) - 1).where(
+            n_periods > 0
+        )
+        return pd.DataFrame(
+            {
+                "total_return": growth - 1,
+                "annualized_return": annualized,
+                "annualized_volatility": self.returns.std()
+                * np.sqrt(annualization_factor),
+                "total_turnover": self.turnover.sum(),
+                "total_cost": self.costs.sum(),
+            }
+        )
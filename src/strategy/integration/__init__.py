@@ -18,13 +18,35 @@ create_integrated_builder
     Factory function to create an IntegratedStrategyBuilder
 """
 
-from .analyze_integration import TechnicalSignalProvider, create_signal_provider
-from .builder import IntegratedStrategyBuilder, create_integrated_builder
-from .factor_integration import FactorBasedRiskCalculator, create_factor_risk_calculator
-from .market_integration import (
-    StrategyMarketDataProvider,
-    create_strategy_market_provider,
-)
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .analyze_integration import TechnicalSignalProvider, create_signal_provider
+    from .builder import IntegratedStrategyBuilder, create_integrated_builder
+    from .factor_integration import (
+        FactorBasedRiskCalculator,
+        create_factor_risk_calculator,
+    )
+    from .market_integration import (
+        StrategyMarketDataProvider,
+        create_strategy_market_provider,
+    )
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "TechnicalSignalProvider": ".analyze_integration",
+    "create_signal_provider": ".analyze_integration",
+    "IntegratedStrategyBuilder": ".builder",
+    "create_integrated_builder": ".builder",
+    "FactorBasedRiskCalculator": ".factor_integration",
+    "create_factor_risk_calculator": ".factor_integration",
+    "StrategyMarketDataProvider": ".market_integration",
+    "create_strategy_market_provider": ".market_integration",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "FactorBasedRiskCalculator",
@@ -4,6 +4,18 @@ This module provides formatters to convert analysis results
 to various formats including DataFrame, dict, and Markdown.
 """
 
-from .formatter import ResultFormatter
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .formatter import ResultFormatter
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "ResultFormatter": ".formatter",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["ResultFormatter"]
@@ -4,7 +4,19 @@ This module provides abstract interfaces and concrete implementations
 for data providers used in portfolio strategy analysis.
 """
 
-from .protocol import DataProvider
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .protocol import DataProvider
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "DataProvider": ".protocol",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "DataProvider",
@@ -11,8 +11,21 @@ DriftResult
     Data class representing drift detection results.
 """
 
-from strategy.rebalance.rebalancer import Rebalancer
-from strategy.rebalance.types import DriftResult
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from strategy.rebalance.rebalancer import Rebalancer
+    from strategy.rebalance.types import DriftResult
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "Rebalancer": "strategy.rebalance.rebalancer",
+    "DriftResult": "strategy.rebalance.types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "DriftResult",
@@ -7,10 +7,26 @@ This module provides tools for calculating various risk metrics including:
 - Downside Deviation
 - VaR (Value at Risk)
 - Maximum Drawdown
+
+RiskCalculator.metrics_table computes all metrics for every column of a
+return matrix in one vectorized pass.
 """
 
-from .calculator import RiskCalculator
-from .metrics import RiskMetricsResult
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .calculator import RiskCalculator
+    from .metrics import RiskMetricsResult
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "RiskCalculator": ".calculator",
+    "RiskMetricsResult": ".metrics",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "RiskCalculator",
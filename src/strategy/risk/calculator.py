@@ -1,10 +1,13 @@
 """Risk calculator for portfolio risk metrics.
 
 This module provides the RiskCalculator class for computing various
-risk metrics from portfolio returns data.
+risk metrics from portfolio returns data, either for a single return
+series or, via ``RiskCalculator.metrics_table``, for every column of a
+return matrix at once.
 """
 
 import math
+from collections.abc import Sequence
 from typing import Literal
 
 import numpy as np
@@ -446,7 +449,7 @@ class RiskCalculator:
         Notes
         -----
         Formula (Historical):
-            var = percentile(returns, (1 - confidence) * 100)
+            var = nanpercentile(returns, (1 - confidence) * 100)
 
         Formula (Parametric):
             var = mean(returns) + z_score * std(returns)
@@ -476,7 +479,7 @@ class RiskCalculator:
             )
 
         if method == "historical":
-            var = float(np.percentile(self._returns, (1 - confidence) * 100))
+            var = float(np.nanpercentile(self._returns, (1 - confidence) * 100))
         else:
             z_score = stats.norm.ppf(1 - confidence)
             var = float(self._returns.mean() + z_score * self._returns.std())
@@ -733,3 +736,259 @@ class RiskCalculator:
         )
 
         return float(ir)
+
+    @classmethod
+    def metrics_table(
+        cls,
+        returns: pd.DataFrame,
+        benchmark_returns: pd.Series | None = None,
+        *,
+        risk_free_rate: float = 0.0,
+        annualization_factor: int = 252,
+        var_confidences: Sequence[float] = (0.95, 0.99),
+        var_method: Literal["historical", "parametric"] = "historical",
+    ) -> pd.DataFrame:
+        """Calculate every risk metric for every column of a return matrix.
+
+        Matrix mode of the calculator: each column of ``returns`` (a
+        portfolio, an asset, or a parameter variant) gets the same values as
+        ``RiskCalculator(returns[column], ...)`` would return, but the
+        benchmark is aligned once and all moments, drawdowns and quantiles
+        are computed column-wise in NumPy, without a calculator per column.
+
+        Parameters
+        ----------
+        returns : pd.DataFrame
+            Daily returns (index: dates, columns: portfolios). NaN marks a
+            missing observation and is skipped, as in the Series methods.
+        benchmark_returns : pd.Series | None, optional
+            Benchmark returns. When given, ``beta``, ``treynor_ratio`` and
+            ``information_ratio`` columns are added; each column is aligned
+            with the benchmark on the dates where both are present.
+        risk_free_rate : float, default=0.0
+            Annual risk-free rate
+        annualization_factor : int, default=252
+            Factor for annualization (252 for daily, 52 for weekly, 12 for monthly)
+        var_confidences : Sequence[float], default=(0.95, 0.99)
+            Confidence levels of the VaR columns (``var_95``, ``var_99``, ...)
+        var_method : {"historical", "parametric"}, default="historical"
+            VaR calculation method, as in :meth:`var`
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per column of ``returns`` with ``volatility``,
+            ``sharpe_ratio``, ``sortino_ratio``, ``downside_deviation``,
+            ``max_drawdown``, one ``var_*`` column per confidence level,
+            ``annualized_return`` (mean * annualization_factor) and
+            ``cumulative_return``, plus the benchmark-relative metrics
+            when ``benchmark_returns`` is given
+
+        Raises
+        ------
+        ValueError
+            If returns or benchmark_returns is empty, annualization_factor
+            is not positive, var_method is invalid, or the benchmark shares
+            no dates with returns
+
+        Examples
+        --------
+        >>> table = RiskCalculator.metrics_table(
+        ...     sweep_returns, benchmark_returns=spy, risk_free_rate=0.02
+        ... )
+        >>> table.sort_values("sharpe_ratio", ascending=False).head()
+        """
+        logger.debug(
+            "Calculating metrics table",
+            shape=returns.shape,
+            has_benchmark=benchmark_returns is not None,
+        )
+
+        if returns.empty:
+            logger.error("Cannot calculate metrics table for empty returns")
+            raise ValueError("returns must not be empty")
+
+        if annualization_factor <= 0:
+            logger.error(
+                "Invalid annualization_factor",
+                annualization_factor=annualization_factor,
+            )
+            raise ValueError(
+                f"annualization_factor must be positive, got {annualization_factor}"
+            )
+
+        if var_method not in ("historical", "parametric"):
+            logger.error("Invalid VaR method", method=var_method)
+            raise ValueError(
+                f"method must be 'historical' or 'parametric', got {var_method!r}"
+            )
+
+        values = returns.to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        count, mean, std = _masked_moments(values, valid)
+        sqrt_factor = np.sqrt(annualization_factor)
+        daily_rf = risk_free_rate / annualization_factor
+        excess_mean = mean - daily_rf
+
+        negative = valid & (values < 0)
+        negative_count, _, downside_std = _masked_moments(values, negative)
+        no_downside = (negative_count <= 1) | np.isnan(downside_std)
+        no_downside |= downside_std < _EPSILON
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            table: dict[str, np.ndarray] = {
+                "volatility": np.where(std < _EPSILON, 0.0, std * sqrt_factor),
+                "sharpe_ratio": np.where(
+                    std < _EPSILON,
+                    _signed_inf(excess_mean),
+                    excess_mean / std * sqrt_factor,
+                ),
+                "sortino_ratio": np.where(
+                    no_downside,
+                    _signed_inf(excess_mean),
+                    excess_mean / downside_std * sqrt_factor,
+                ),
+                "downside_deviation": np.where(
+                    no_downside, 0.0, downside_std * sqrt_factor
+                ),
+                "max_drawdown": np.where(count > 0, _max_drawdown(values), np.nan),
+            }
+
+        for confidence in var_confidences:
+            if var_method == "historical":
+                var = _column_percentile(values, count, 1 - confidence)
+            else:
+                var = mean + stats.norm.ppf(1 - confidence) * std
+            table[f"var_{round(confidence * 100):d}"] = var
+
+        annualized_return = mean * annualization_factor
+        table["annualized_return"] = annualized_return
+        growth = np.prod(np.where(valid, 1 + values, 1.0), axis=0)
+        table["cumulative_return"] = np.where(count > 0, growth - 1, np.nan)
+
+        if benchmark_returns is not None:
+            table.update(
+                _benchmark_metrics(
+                    values,
+                    valid,
+                    _align_benchmark(returns.index, benchmark_returns),
+                    annualized_return - risk_free_rate,
+                    sqrt_factor,
+                )
+            )
+
+        result = pd.DataFrame(table, index=returns.columns)
+
+        logger.info(
+            "Metrics table calculated",
+            column_count=len(result),
+            metric_count=len(result.columns),
+        )
+
+        return result
+
+
+def _signed_inf(value: np.ndarray) -> np.ndarray:
+    """Return +inf / -inf / NaN by the sign of ``value`` (zero-scale ratios)."""
+    return np.where(
+        value > _EPSILON, np.inf, np.where(value < -_EPSILON, -np.inf, np.nan)
+    )
+
+
+def _masked_moments(
+    values: np.ndarray, mask: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Column-wise count, mean and sample std (ddof=1) of the masked values."""
+    count = mask.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(mask, values, 0.0).sum(axis=0) / count
+        squares = np.where(mask, (values - mean) ** 2, 0.0).sum(axis=0)
+        std = np.sqrt(squares / (count - 1))
+    return count, mean, np.where(count > 1, std, np.nan)
+
+
+def _max_drawdown(values: np.ndarray) -> np.ndarray:
+    """Column-wise maximum drawdown; missing returns leave the value unchanged."""
+    cumulative = np.cumprod(1 + np.nan_to_num(values), axis=0)
+    running_max = np.maximum.accumulate(cumulative, axis=0)
+    return ((cumulative - running_max) / running_max).min(axis=0)
+
+
+def _column_percentile(values: np.ndarray, count: np.ndarray, q: float) -> np.ndarray:
+    """Column-wise linear-interpolation quantile of the non-NaN values.
+
+    Equivalent to ``np.percentile(column.dropna(), q * 100)`` for every
+    column; NaN sorts last, so each column's valid values are a prefix.
+    """
+    ordered = np.sort(values, axis=0)
+    virtual = np.maximum(count - 1, 0) * q
+    lower = np.floor(virtual).astype(np.intp)
+    upper = np.minimum(lower + 1, np.maximum(count - 1, 0))
+    gamma = virtual - lower
+    a = np.take_along_axis(ordered, lower[None, :], axis=0)[0]
+    b = np.take_along_axis(ordered, upper[None, :], axis=0)[0]
+    # Same formula as NumPy's interpolation so results are bit-identical
+    diff = b - a
+    result = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+    return np.where(count > 0, result, np.nan)
+
+
+def _align_benchmark(index: pd.Index, benchmark_returns: pd.Series) -> np.ndarray:
+    """Align the benchmark to the return dates once for all columns."""
+    if len(benchmark_returns) == 0:
+        logger.error("benchmark_returns is empty")
+        raise ValueError("benchmark_returns must not be empty")
+
+    aligned = benchmark_returns.reindex(index).to_numpy(dtype=float)
+    if np.isnan(aligned).all():
+        logger.error(
+            "No common dates between returns and benchmark",
+            returns_dates=len(index),
+            benchmark_dates=len(benchmark_returns),
+        )
+        raise ValueError(
+            "No common or overlapping dates between portfolio and benchmark returns"
+        )
+    return aligned
+
+
+def _benchmark_metrics(
+    values: np.ndarray,
+    valid: np.ndarray,
+    benchmark: np.ndarray,
+    annualized_excess: np.ndarray,
+    sqrt_factor: float,
+) -> dict[str, np.ndarray]:
+    """Beta, Treynor and information ratios against an aligned benchmark."""
+    paired = valid & ~np.isnan(benchmark)[:, None]
+    count = paired.sum(axis=0)
+    bench = np.broadcast_to(benchmark[:, None], values.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _, bench_mean, bench_std = _masked_moments(bench, paired)
+        _, value_mean, _ = _masked_moments(values, paired)
+        co_moment = np.where(
+            paired, (values - value_mean) * (bench - bench_mean), 0.0
+        ).sum(axis=0)
+        covariance = co_moment / (count - 1)
+        bench_var = bench_std**2
+        beta = np.where(bench_var < _EPSILON, np.nan, covariance / bench_var)
+
+        treynor = np.where(
+            np.abs(beta) < _EPSILON,
+            _signed_inf(annualized_excess),
+            annualized_excess / beta,
+        )
+
+        _, active_mean, active_std = _masked_moments(values - bench, paired)
+        information_ratio = np.where(
+            active_std < _EPSILON,
+            _signed_inf(active_mean),
+            active_mean / active_std * sqrt_factor,
+        )
+
+    return {
+        "beta": beta,
+        "treynor_ratio": treynor,
+        "information_ratio": information_ratio,
+    }
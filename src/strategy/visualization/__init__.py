@@ -4,6 +4,18 @@ This module provides chart generation functionality for visualizing
 portfolio allocations, asset distributions, and drift analysis.
 """
 
-from .charts import ChartGenerator
+from typing import TYPE_CHECKING
+
+from utils_core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .charts import ChartGenerator
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    "ChartGenerator": ".charts",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["ChartGenerator"]
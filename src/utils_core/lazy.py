@@ -0,0 +1,93 @@
+"""Lazy re-exports for package ``__init__`` modules.
+
+Package ``__init__`` files re-export their public API so that users can
+write ``from market import DataExporter``. Importing those names eagerly
+means ``import market`` (and therefore ``import market.errors``) also loads
+every data source and its third-party dependencies. ``lazy_exports`` builds
+a module-level ``__getattr__`` (PEP 562) that imports the defining submodule
+only when a name is first accessed, and caches it in the package namespace.
+
+Examples
+--------
+In ``market/__init__.py``::
+
+    from typing import TYPE_CHECKING
+
+    from utils_core.lazy import lazy_exports
+
+    if TYPE_CHECKING:
+        from .export import DataExporter
+
+    _EXPORTS = {"DataExporter": ".export"}
+
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+    __all__ = ["DataExporter"]
+
+The ``TYPE_CHECKING`` imports keep static analysis and IDE completion
+working; at runtime only the mapping is used.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create ``__getattr__`` and ``__dir__`` for lazily re-exported names.
+
+    Parameters
+    ----------
+    package : str
+        ``__name__`` of the package whose namespace is populated
+    exports : Mapping[str, str]
+        Public name to the module that defines it, relative to ``package``
+        (e.g. ``".errors"``) or absolute. A name whose module is
+        ``package.<name>`` itself (e.g. ``{"sector": ".sector"}``) exports
+        the submodule.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        Module-level ``__getattr__`` and ``__dir__`` functions
+
+    Raises
+    ------
+    AttributeError
+        From the returned ``__getattr__``, for names that are neither in
+        ``exports`` nor a submodule of ``package``
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            # Eager re-exports used to import submodules as a side effect, so
+            # keep ``package.submodule`` attribute access working
+            if importlib.util.find_spec(f"{package}.{name}") is None:
+                msg = f"module {package!r} has no attribute {name!r}"
+                raise AttributeError(msg)
+            module_name = f"{package}.{name}"
+
+        module = importlib.import_module(module_name, package)
+        value = (
+            module if module.__name__ == f"{package}.{name}" else getattr(module, name)
+        )
+        # Cache in the package namespace so later lookups bypass __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+__all__ = ["lazy_exports"]
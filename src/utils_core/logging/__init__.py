@@ -1,6 +1,7 @@
 """Logging utilities for the finance project."""
 
 from utils_core.logging.config import (
+    AsyncLogHandler,
     LoggerProtocol,
     get_logger,
     log_context,
@@ -10,6 +11,7 @@ from utils_core.logging.config import (
 )
 
 __all__ = [
+    "AsyncLogHandler",
     "LoggerProtocol",
     "get_logger",
     "log_context",
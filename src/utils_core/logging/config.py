@@ -9,13 +9,16 @@ Features
 - 環境変数による設定（LOG_DIR, LOG_FILE_ENABLED, LOG_LEVEL, LOG_FORMAT）
 - 重複ハンドラー追加の防止
 - ProcessorFormatter による logging ハンドラー連携
+- sys._getframe ベースの低オーバーヘッドな呼び出し元情報
+- キュー経由でバックグラウンドスレッドが書き込む非同期ファイル出力（LOG_ASYNC）
 """
 
 import contextlib
 import functools
-import inspect
 import logging
+import logging.handlers
 import os
+import queue
 import stat
 import sys
 import time
@@ -23,6 +26,7 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
+from types import CodeType
 from typing import Any, Protocol
 
 import structlog
@@ -40,6 +44,13 @@ from ..types import LogFormat, LogLevel
 
 _initialized = False
 
+# 呼び出し元の探索でスキップするモジュール（完全一致またはサブモジュール）
+_CALLER_SKIP_MODULES = ("structlog", "logging")
+# 呼び出し元を探索する最大フレーム数
+_CALLER_MAX_DEPTH = 32
+# コードオブジェクト → 表示用ファイル名（スキップ対象は None）
+_caller_code_cache: dict[CodeType, str | None] = {}
+
 
 def _create_secure_log_file(log_file: Path) -> None:
     """Create log file atomically with secure permissions (CWE-732, TOCTOU).
@@ -185,9 +196,49 @@ def add_timestamp(_: Any, __: Any, event_dict: dict[str, Any]) -> dict[str, Any]
     return event_dict
 
 
+def _caller_filename(code: CodeType, module_name: str) -> str | None:
+    """呼び出し元として表示するファイル名を返す（スキップ対象は None）.
+
+    判定結果はコードオブジェクトごとにキャッシュする。
+
+    Parameters
+    ----------
+    code : CodeType
+        フレームのコードオブジェクト
+    module_name : str
+        フレームのモジュール名
+
+    Returns
+    -------
+    str | None
+        ファイル名。structlog / logging / site-packages のフレームは None
+    """
+    try:
+        return _caller_code_cache[code]
+    except KeyError:
+        pass
+
+    filename = code.co_filename
+    skip = (
+        not filename
+        or "site-packages" in filename
+        or any(
+            module_name == name or module_name.startswith(f"{name}.")
+            for name in _CALLER_SKIP_MODULES
+        )
+    )
+    result = None if skip else Path(filename).name
+    _caller_code_cache[code] = result
+    return result
+
+
 def add_caller_info(_: Any, __: Any, event_dict: dict[str, Any]) -> dict[str, Any]:
     """ログエントリに呼び出し元情報（ファイル、関数、行番号）を追加する.
 
+    ``inspect.stack()`` は全フレームのソース行をディスクから読むため使わず、
+    ``sys._getframe`` でフレームを辿る。スキップ判定はコードオブジェクトごとに
+    キャッシュする。標準 logging 由来のレコードはレコードの位置情報を使う。
+
     Parameters
     ----------
     _ : Any
@@ -202,34 +253,107 @@ def add_caller_info(_: Any, __: Any, event_dict: dict[str, Any]) -> dict[str, An
     dict[str, Any]
         呼び出し元情報を追加したイベント辞書
     """
-    try:
-        frame = None
-        stack = inspect.stack()
-
-        for f in stack[4:12]:
-            if f.filename and f.function:
-                module = inspect.getmodule(f.frame)
-                if (
-                    module
-                    and not module.__name__.startswith("structlog")
-                    and not module.__name__.startswith("logging")
-                    and "site-packages" not in f.filename
-                ):
-                    frame = f
-                    break
-
-        if frame:
+    record = event_dict.get("_record")
+    if isinstance(record, logging.LogRecord) and not event_dict.get("_from_structlog"):
+        event_dict["caller"] = {
+            "filename": record.filename,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        return event_dict
+
+    frame = sys._getframe(1)
+    for _depth in range(_CALLER_MAX_DEPTH):
+        if frame is None:
+            break
+        code = frame.f_code
+        filename = _caller_filename(code, frame.f_globals.get("__name__", ""))
+        if filename is not None:
             event_dict["caller"] = {
-                "filename": Path(frame.filename).name,
-                "function": frame.function,
-                "line": frame.lineno,
+                "filename": filename,
+                "function": code.co_name,
+                "line": frame.f_lineno,
             }
-    except Exception:  # nosec B110
-        pass
+            break
+        frame = frame.f_back
 
     return event_dict
 
 
+class AsyncLogHandler(logging.handlers.QueueHandler):
+    """キュー経由でバックグラウンドスレッドに書き込みを委譲するハンドラー.
+
+    呼び出し元スレッドはレコードをキューに積むだけで、フォーマット（JSON などの
+    レンダリング）とディスク I/O はリスナースレッドで行う。
+    ``close()`` はキューに残ったレコードを書き出してからスレッドを停止する。
+
+    Parameters
+    ----------
+    *handlers : logging.Handler
+        リスナースレッドで実行するハンドラー（FileHandler など）
+
+    Notes
+    -----
+    structlog のプロセッサーチェーン（contextvars のマージ、呼び出し元情報）は
+    呼び出し元スレッドで実行される。標準 logging 由来のレコードの
+    ``foreign_pre_chain`` はリスナースレッドで実行されるため、contextvars は付与されない。
+
+    Examples
+    --------
+    >>> handler = AsyncLogHandler(logging.FileHandler("app.log"))  # doctest: +SKIP
+    >>> logging.getLogger().addHandler(handler)  # doctest: +SKIP
+    """
+
+    def __init__(self, *handlers: logging.Handler) -> None:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        super().__init__(log_queue)
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._listener.start()
+        self._stopped = False
+
+    @property
+    def handlers(self) -> tuple[logging.Handler, ...]:
+        """リスナースレッドで実行するハンドラー."""
+        return self._listener.handlers
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """フォーマットせずにレコードをそのままキューに積む.
+
+        QueueHandler の既定実装は呼び出し元スレッドでメッセージをフォーマットするため、
+        ProcessorFormatter 用のイベント辞書を保ったまま渡す。
+        """
+        return record
+
+    def close(self) -> None:
+        """キューを書き出してリスナーを停止し、内部ハンドラーを閉じる."""
+        if not self._stopped:
+            self._stopped = True
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+        super().close()
+
+
+def _find_file_handler(
+    root_logger: logging.Logger, log_file: Path
+) -> logging.FileHandler | None:
+    """log_file に書き込むハンドラーを探す（非同期ハンドラーの内側も含む）."""
+    target = str(log_file.resolve())
+    for handler in root_logger.handlers:
+        inner = handler.handlers if isinstance(handler, AsyncLogHandler) else (handler,)
+        for h in inner:
+            if isinstance(h, logging.FileHandler) and h.baseFilename == target:
+                return h
+    return None
+
+
+def _close_async_handlers(root_logger: logging.Logger) -> None:
+    """ルートロガーの非同期ハンドラーを閉じる（キューを書き出す）."""
+    for handler in root_logger.handlers:
+        if isinstance(handler, AsyncLogHandler):
+            handler.close()
+
+
 def add_log_level_upper(_: Any, __: Any, event_dict: dict[str, Any]) -> dict[str, Any]:
     """ログレベルを大文字に変換する.
 
@@ -277,6 +401,7 @@ def setup_logging(
     log_file: str | Path | None = None,
     include_timestamp: bool = True,
     include_caller_info: bool = True,
+    async_file: bool | None = None,
     force: bool = False,
 ) -> None:
     """構造化ロギングの設定をセットアップする.
@@ -301,6 +426,9 @@ def setup_logging(
         ISO タイムスタンプをログに追加するか
     include_caller_info : bool
         呼び出し元情報（ファイル、関数、行番号）を追加するか
+    async_file : bool | None
+        ファイル出力を ``AsyncLogHandler`` でバックグラウンドスレッドに委譲するか。
+        None の場合は LOG_ASYNC 環境変数（"true" で有効）に従う。
     force : bool
         既存の設定があっても強制的に再設定するか
     """
@@ -332,6 +460,8 @@ def setup_logging(
 
     env_log_dir = get_log_dir()
     log_file_enabled = os.environ.get("LOG_FILE_ENABLED", "true").lower() != "false"
+    if async_file is None:
+        async_file = os.environ.get("LOG_ASYNC", "false").lower() == "true"
 
     final_log_file: Path | None = None
     if log_file:
@@ -391,6 +521,7 @@ def setup_logging(
     root_logger = logging.getLogger()
 
     if force:
+        _close_async_handlers(root_logger)
         root_logger.handlers.clear()
         _initialized = False
 
@@ -423,14 +554,7 @@ def setup_logging(
         # TOCTOU対策: FileHandler作成前に安全なパーミッションでファイルを作成（CWE-732）
         _create_secure_log_file(final_log_file)
 
-        existing_file_handlers = [
-            h
-            for h in root_logger.handlers
-            if isinstance(h, logging.FileHandler)
-            and h.baseFilename == str(final_log_file.resolve())
-        ]
-
-        if not existing_file_handlers:
+        if _find_file_handler(root_logger, final_log_file) is None:
             file_formatter = structlog.stdlib.ProcessorFormatter(
                 foreign_pre_chain=shared_processors,
                 processors=[
@@ -438,8 +562,13 @@ def setup_logging(
                     file_renderer,
                 ],
             )
-            file_handler = logging.FileHandler(final_log_file, encoding="utf-8")
+            file_handler: logging.Handler = logging.FileHandler(
+                final_log_file, encoding="utf-8"
+            )
             file_handler.setFormatter(file_formatter)
+            if async_file:
+                # フォーマットとディスク I/O をバックグラウンドスレッドで行う
+                file_handler = AsyncLogHandler(file_handler)
             file_handler.setLevel(file_level_value)
             root_logger.addHandler(file_handler)
 
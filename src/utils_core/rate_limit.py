@@ -0,0 +1,248 @@
+"""Shared per-host request scheduler for polite scraping.
+
+This module provides ``RateScheduler``, a minimum-interval scheduler with
+burst allowance (GCRA, the virtual-scheduling form of a token bucket) keyed
+by host. Each request reserves the next free slot for its host and only
+waits for the time still remaining until that slot, so time spent on the
+previous response already counts towards the polite interval.
+
+A single process-wide instance is returned by ``get_rate_scheduler()`` so
+that every session object and worker thread targeting the same host shares
+one budget.
+
+Examples
+--------
+>>> scheduler = get_rate_scheduler()
+>>> scheduler.acquire("api.nasdaq.com", interval=1.0)  # first request
+0.0
+>>> wait = scheduler.acquire("api.nasdaq.com", interval=1.0)  # waits ~1.0s
+>>> scheduler.stats("api.nasdaq.com").requests
+2
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from utils_core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """Wait-time metrics for one scheduler key.
+
+    Attributes
+    ----------
+    requests : int
+        Number of reserved request slots
+    waited : int
+        Number of requests that had to wait
+    total_wait : float
+        Total time spent waiting in seconds
+    max_wait : float
+        Longest single wait in seconds
+    """
+
+    requests: int = 0
+    waited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean wait per request in seconds."""
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class RateScheduler:
+    """Thread-safe per-key minimum-interval scheduler with bursts.
+
+    For each key the scheduler tracks the theoretical arrival time (TAT) of
+    the next request. A request may start ``(burst - 1) * interval`` seconds
+    before the TAT, so up to ``burst`` requests can be sent back to back
+    after an idle period while the long-run rate stays at one request per
+    ``interval``. Slots are reserved under a lock and the wait happens
+    outside it, so sync callers in several threads and async callers in
+    several event loops can share one instance.
+
+    Parameters
+    ----------
+    clock : Callable[[], float], default=time.monotonic
+        Monotonic clock in seconds
+
+    Examples
+    --------
+    >>> scheduler = RateScheduler()
+    >>> scheduler.acquire("www.etf.com", interval=2.0, burst=2)
+    0.0
+    >>> scheduler.acquire("www.etf.com", interval=2.0, burst=2)  # burst
+    0.0
+    >>> wait = scheduler.acquire("www.etf.com", interval=2.0, burst=2)  # ~2s
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._tat: dict[str, float] = {}
+        self._stats: dict[str, RateLimitStats] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, *, interval: float, burst: int = 1) -> float:
+        """Reserve the next request slot for a key without waiting.
+
+        Parameters
+        ----------
+        key : str
+            Scheduler key, usually the request host
+        interval : float
+            Minimum average spacing between requests in seconds. May vary
+            per call (e.g. a polite delay with random jitter).
+        burst : int, default=1
+            Number of requests allowed back to back after an idle period
+
+        Returns
+        -------
+        float
+            Seconds the caller must wait before sending the request
+
+        Raises
+        ------
+        ValueError
+            If interval is negative or burst is less than 1
+        """
+        if interval < 0:
+            raise ValueError(f"interval must be >= 0, got {interval}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat.get(key, now), now)
+            wait = max(0.0, tat - (burst - 1) * interval - now)
+            self._tat[key] = tat + interval
+
+            stats = self._stats.get(key, RateLimitStats())
+            self._stats[key] = RateLimitStats(
+                requests=stats.requests + 1,
+                waited=stats.waited + (wait > 0),
+                total_wait=stats.total_wait + wait,
+                max_wait=max(stats.max_wait, wait),
+            )
+        return wait
+
+    def acquire(self, key: str, *, interval: float, burst: int = 1) -> float:
+        """Wait until the next request slot for a key is due.
+
+        Parameters
+        ----------
+        key : str
+            Scheduler key, usually the request host
+        interval : float
+            Minimum average spacing between requests in seconds
+        burst : int, default=1
+            Number of requests allowed back to back after an idle period
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        wait = self.reserve(key, interval=interval, burst=burst)
+        if wait > 0:
+            logger.debug(
+                "Rate limit: waiting for request slot",
+                key=key,
+                wait_ms=round(wait * 1000, 1),
+            )
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(
+        self, key: str, *, interval: float, burst: int = 1
+    ) -> float:
+        """Async variant of ``acquire()`` that awaits instead of sleeping.
+
+        Parameters
+        ----------
+        key : str
+            Scheduler key, usually the request host
+        interval : float
+            Minimum average spacing between requests in seconds
+        burst : int, default=1
+            Number of requests allowed back to back after an idle period
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        wait = self.reserve(key, interval=interval, burst=burst)
+        if wait > 0:
+            logger.debug(
+                "Rate limit: waiting for request slot",
+                key=key,
+                wait_ms=round(wait * 1000, 1),
+            )
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self, key: str) -> RateLimitStats:
+        """Get wait-time metrics for a key.
+
+        Parameters
+        ----------
+        key : str
+            Scheduler key
+
+        Returns
+        -------
+        RateLimitStats
+            Metrics snapshot (all zero for an unknown key)
+        """
+        with self._lock:
+            return self._stats.get(key, RateLimitStats())
+
+    def reset(self, key: str | None = None) -> None:
+        """Forget the slot state and metrics of one key or of all keys.
+
+        Parameters
+        ----------
+        key : str | None, default=None
+            Key to reset. If None, all keys are reset.
+        """
+        with self._lock:
+            if key is None:
+                self._tat.clear()
+                self._stats.clear()
+            else:
+                self._tat.pop(key, None)
+                self._stats.pop(key, None)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"RateScheduler(keys={sorted(self._tat)})"
+
+
+_shared_scheduler = RateScheduler()
+
+
+def get_rate_scheduler() -> RateScheduler:
+    """Get the process-wide scheduler shared by all scraping sessions.
+
+    Returns
+    -------
+    RateScheduler
+        Shared scheduler instance
+    """
+    return _shared_scheduler
+
+
+__all__ = ["RateLimitStats", "RateScheduler", "get_rate_scheduler"]
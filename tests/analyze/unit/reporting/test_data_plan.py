@@ -0,0 +1,212 @@
+"""Unit tests for analyze.reporting.data_plan.
+
+ダウンロード関数をフェイクに差し替え、セクション横断の取得計画が
+重複シンボルを1回だけ取得することを確認する。
+"""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyze.reporting.data_plan import (
+    ReportDataPlan,
+    SectionRequest,
+    download_close_prices,
+    plan_downloads,
+)
+from market.yfinance import DataSource, MarketDataResult
+
+
+class FakeDownloader:
+    """呼び出しを記録し、日次の連番価格を返すダウンロード関数."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], date, date]] = []
+
+    def __call__(self, symbols: list[str], start: date, end: date) -> pd.DataFrame:
+        self.calls.append((symbols, start, end))
+        dates = pd.date_range(start, end, freq="D")
+        data = {
+            symbol: np.arange(len(dates), dtype=float) + 100 * (i + 1)
+            for i, symbol in enumerate(symbols)
+        }
+        return pd.DataFrame(data, index=dates)
+
+
+AS_OF = date(2026, 1, 21)
+
+
+class TestPlanDownloads:
+    """Tests for plan_downloads."""
+
+    def test_正常系_同じ期間のシンボルは1バッチにまとまる(self) -> None:
+        """重複シンボルは1回だけ、期間の和集合で取得されることを確認。"""
+        requests = [
+            SectionRequest("a", ("X", "Y"), date(2026, 1, 1), date(2026, 1, 21)),
+            SectionRequest("b", ("Y", "Z"), date(2026, 1, 1), date(2026, 1, 21)),
+            SectionRequest("c", ("W",), date(2025, 1, 1), date(2026, 1, 21)),
+        ]
+
+        batches = plan_downloads(requests)
+
+        assert [batch.symbols for batch in batches] == [("W",), ("X", "Y", "Z")]
+        assert batches[0].start == date(2025, 1, 1)
+
+    def test_正常系_シンボルの期間は全要求を包含する(self) -> None:
+        """長い期間を要求したセクションに合わせて取得されることを確認。"""
+        requests = [
+            SectionRequest("long", ("X",), date(2020, 1, 1), date(2026, 1, 10)),
+            SectionRequest("short", ("X",), date(2026, 1, 1), date(2026, 1, 21)),
+        ]
+
+        (batch,) = plan_downloads(requests)
+
+        assert (batch.start, batch.end) == (date(2020, 1, 1), date(2026, 1, 21))
+
+    def test_エッジケース_空の要求で空のバッチ(self) -> None:
+        """要求がなければバッチもないことを確認。"""
+        assert plan_downloads([]) == []
+
+
+class TestReportDataPlan:
+    """Tests for ReportDataPlan."""
+
+    def test_正常系_複数セクションを1回のダウンロードで取得できる(self) -> None:
+        """重複するセクションが共有パネルから読み出されることを確認。"""
+        downloader = FakeDownloader()
+        plan = ReportDataPlan(downloader, as_of=AS_OF)
+        plan.request("indices", ["^GSPC", "XLK"], lookback_days=30)
+        plan.request("sectors", ["XLK", "XLF"], lookback_days=30)
+
+        indices = plan.close_prices(["^GSPC", "XLK"])
+        sectors = plan.close_prices(["XLK", "XLF"])
+
+        assert plan.download_count == 1
+        assert downloader.calls[0][0] == ["^GSPC", "XLK", "XLF"]
+        assert list(indices.columns) == ["^GSPC", "XLK"]
+        pd.testing.assert_series_equal(indices["XLK"], sectors["XLK"])
+
+    def test_正常系_読み出すまでダウンロードしない(self) -> None:
+        """宣言だけではダウンロードが発生しないことを確認。"""
+        downloader = FakeDownloader()
+        plan = ReportDataPlan(downloader, as_of=AS_OF)
+        plan.request("indices", ["^GSPC"], lookback_days=30)
+
+        assert downloader.calls == []
+        plan.execute()
+        plan.execute()
+        assert plan.download_count == 1
+
+    def test_正常系_期間指定で読み出せる(self) -> None:
+        """start/end で共有パネルの期間を絞り込めることを確認。"""
+        plan = ReportDataPlan(FakeDownloader(), as_of=AS_OF)
+        plan.request("weekly", ["A"], lookback_days=30)
+
+        close = plan.close_prices(["A"], start=date(2026, 1, 14), end=AS_OF)
+
+        assert close.index[0] == pd.Timestamp("2026-01-14")
+        assert close.index[-1] == pd.Timestamp("2026-01-21")
+
+    def test_正常系_計画外のシンボルは追加で取得される(self) -> None:
+        """計画にないシンボルだけが追加でダウンロードされることを確認。"""
+        downloader = FakeDownloader()
+        plan = ReportDataPlan(downloader, as_of=AS_OF)
+        plan.request("indices", ["A"], lookback_days=30)
+        plan.execute()
+
+        close = plan.close_prices(["A", "B"])
+
+        assert plan.download_count == 2
+        assert downloader.calls[1][0] == ["B"]
+        assert list(close.columns) == ["A", "B"]
+
+    def test_正常系_空の計画ではlookback_daysの期間で取得される(self) -> None:
+        """要求のない計画では呼び出し元の lookback_days で取得されることを確認。"""
+        downloader = FakeDownloader()
+        plan = ReportDataPlan(downloader, as_of=AS_OF)
+
+        close = plan.close_prices(["A"], lookback_days=7)
+
+        assert downloader.calls == [(["A"], date(2026, 1, 14), AS_OF)]
+        assert len(close) == 8
+
+    def test_正常系_計画外のシンボルは呼び出し元のlookback_daysまで遡る(self) -> None:
+        """計画が短い期間だけでも、計画外シンボルは lookback_days の期間で取得されることを確認。"""
+        downloader = FakeDownloader()
+        plan = ReportDataPlan(downloader, as_of=AS_OF)
+        plan.request("weekly", ["A"], lookback_days=10)
+
+        close = plan.close_prices(["B"], lookback_days=400)
+
+        assert (["B"], date(2024, 12, 17), AS_OF) in downloader.calls
+        assert close.index[0] == pd.Timestamp("2024-12-17")
+
+    def test_異常系_空の計画で期間を決められずValueError(self) -> None:
+        """要求のない計画で期間も lookback_days もない場合に ValueError になることを確認。"""
+        plan = ReportDataPlan(FakeDownloader(), as_of=AS_OF)
+
+        with pytest.raises(ValueError, match="lookback_days"):
+            plan.close_prices(["A"])
+
+    def test_正常系_縦持ち形式で読み出せる(self) -> None:
+        """close_long が PerformanceAnalyzer と同じ形式を返すことを確認。"""
+        plan = ReportDataPlan(FakeDownloader(), as_of=AS_OF)
+        plan.request("mag7", ["A", "B"], lookback_days=2)
+
+        long_df = plan.close_long(["A", "B"])
+
+        assert list(long_df.columns) == ["Date", "symbol", "variable", "value"]
+        assert len(long_df) == 6
+        assert set(long_df["variable"]) == {"close"}
+
+    def test_異常系_期間未指定でValueError(self) -> None:
+        """start も lookback_days もない場合に ValueError になることを確認。"""
+        plan = ReportDataPlan(FakeDownloader(), as_of=AS_OF)
+
+        with pytest.raises(ValueError, match="lookback_days"):
+            plan.request("indices", ["A"])
+
+
+class TestDownloadClosePrices:
+    """Tests for download_close_prices."""
+
+    @patch("analyze.reporting.data_plan.YFinanceFetcher")
+    def test_正常系_YFinanceFetcher経由で一括取得する(
+        self, mock_fetcher_cls: MagicMock
+    ) -> None:
+        """バッチ全体が1回の fetch で取得され、終値の横持ちになることを確認。"""
+        dates = pd.date_range("2026-01-19", periods=3, freq="D")
+
+        def result(symbol: str, close: list[float]) -> MarketDataResult:
+            return MarketDataResult(
+                symbol=symbol,
+                data=pd.DataFrame({"close": close}, index=dates),
+                source=DataSource.YFINANCE,
+                fetched_at=datetime(2026, 1, 21),
+            )
+
+        mock_fetcher_cls.return_value.fetch.return_value = [
+            result("A", [1.0, 2.0, 3.0]),
+            MarketDataResult(
+                symbol="B",
+                data=pd.DataFrame(columns=pd.Index(["close"])),
+                source=DataSource.YFINANCE,
+                fetched_at=datetime(2026, 1, 21),
+            ),
+            result("C", [4.0, 5.0, 6.0]),
+        ]
+
+        close = download_close_prices(
+            ["A", "B", "C"], date(2026, 1, 19), date(2026, 1, 21)
+        )
+
+        mock_fetcher_cls.return_value.fetch.assert_called_once()
+        options = mock_fetcher_cls.return_value.fetch.call_args.args[0]
+        assert options.symbols == ["A", "B", "C"]
+        assert options.start_date == "2026-01-19"
+        assert options.end_date == "2026-01-22"
+        assert list(close.columns) == ["A", "C"]
+        assert close["C"].tolist() == [4.0, 5.0, 6.0]
@@ -0,0 +1,127 @@
+"""Unit tests for analyze.returns.period_returns.
+
+The vectorized engine must agree with the per-series ``calculate_return``
+for every symbol and period, including symbols with holidays (NaN cells).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyze.returns import calculate_return
+from analyze.returns.period_returns import calculate_period_returns, pivot_prices
+
+PERIODS: dict[str, int | str] = {
+    "1D": 1,
+    "1W": 5,
+    "MTD": "mtd",
+    "1M": 21,
+    "YTD": "ytd",
+    "1Y": 252,
+}
+
+
+@pytest.fixture
+def wide_prices() -> pd.DataFrame:
+    """3銘柄の横持ち価格（一部に休日のNaN、1銘柄は短い履歴）。"""
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range("2023-11-01", periods=120)
+    values = 100 * np.cumprod(1 + rng.normal(0, 0.01, (120, 3)), axis=0)
+    prices = pd.DataFrame(values, index=dates, columns=pd.Index(["AAA", "BBB", "CCC"]))
+    prices.iloc[rng.random(120) < 0.1, 0] = np.nan
+    prices.iloc[:100, 2] = np.nan
+    return prices
+
+
+class TestPivotPrices:
+    """Tests for pivot_prices."""
+
+    def test_正常系_縦持ちを日付昇順の横持ちに変換できる(self) -> None:
+        """Date × symbol の行列になり、欠損行はNaNセルになることを確認。"""
+        long_df = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2024-01-03", "2024-01-02", "2024-01-02"]),
+                "symbol": ["A", "A", "B"],
+                "variable": "close",
+                "value": [101.0, 100.0, np.nan],
+            }
+        )
+
+        wide = pivot_prices(long_df)
+
+        assert list(wide.columns) == ["A"]
+        assert list(wide.index) == list(pd.to_datetime(["2024-01-02", "2024-01-03"]))
+        assert wide["A"].tolist() == [100.0, 101.0]
+
+
+class TestCalculatePeriodReturns:
+    """Tests for calculate_period_returns."""
+
+    def test_正常系_銘柄ごとの計算結果と一致する(
+        self, wide_prices: pd.DataFrame
+    ) -> None:
+        """全銘柄・全期間が calculate_return と一致することを確認。"""
+        result = calculate_period_returns(wide_prices, PERIODS)
+
+        for symbol in wide_prices.columns:
+            for period_name, period_value in PERIODS.items():
+                expected = calculate_return(wide_prices.loc[:, symbol], period_value)
+                actual = result.loc[symbol, period_name]
+                if expected is None:
+                    assert np.isnan(actual), (symbol, period_name)
+                else:
+                    assert actual == pytest.approx(expected, rel=1e-12)
+
+    def test_正常系_休日は銘柄ごとに除外される(self) -> None:
+        """他銘柄の休日で営業日数の窓がずれないことを確認。"""
+        dates = pd.bdate_range("2024-03-04", periods=4)
+        prices = pd.DataFrame(
+            {"US": [100.0, 101.0, 102.0, 103.0], "JP": [200.0, np.nan, 210.0, 220.0]},
+            index=dates,
+        )
+
+        result = calculate_period_returns(prices, {"1D": 1, "2D": 2})
+
+        assert result.loc["JP", "1D"] == pytest.approx(220.0 / 210.0 - 1)
+        assert result.loc["JP", "2D"] == pytest.approx(220.0 / 200.0 - 1)
+        assert result.loc["US", "2D"] == pytest.approx(103.0 / 101.0 - 1)
+
+    def test_正常系_WoWは先週火曜日以降の最初の価格を基準にする(self) -> None:
+        """prev_tue が最新日の前週火曜日を起点にすることを確認。"""
+        # 2024-03-13 (水) の前週火曜日は 2024-03-05
+        dates = pd.to_datetime(["2024-03-04", "2024-03-06", "2024-03-13"])
+        prices = pd.DataFrame({"A": [100.0, 110.0, 121.0]}, index=dates)
+
+        result = calculate_period_returns(prices, {"WoW": "prev_tue"})
+
+        assert result.loc["A", "WoW"] == pytest.approx(0.1)
+
+    def test_異常系_正でない整数期間でValueError(
+        self, wide_prices: pd.DataFrame
+    ) -> None:
+        """0以下の整数期間で ValueError になることを確認。"""
+        with pytest.raises(ValueError, match="period must be positive"):
+            calculate_period_returns(wide_prices, {"0D": 0})
+
+    def test_エッジケース_未知の期間とゼロ基準価格はNaN(self) -> None:
+        """未知の文字列期間と基準価格0の期間がNaNになることを確認。"""
+        prices = pd.DataFrame(
+            {"A": [0.0, 1.0]}, index=pd.bdate_range("2024-01-02", periods=2)
+        )
+
+        result = calculate_period_returns(prices, {"1D": 1, "QTD": "qtd"})
+
+        assert np.isnan(result.loc["A", "1D"])
+        assert np.isnan(result.loc["A", "QTD"])
+
+    def test_エッジケース_全て欠損の銘柄はNaN(self) -> None:
+        """データのない銘柄は全期間NaNになることを確認。"""
+        prices = pd.DataFrame(
+            {"A": [1.0, 2.0], "B": [np.nan, np.nan]},
+            index=pd.bdate_range("2024-01-02", periods=2),
+        )
+
+        result = calculate_period_returns(prices, {"1D": 1, "MTD": "mtd"})
+
+        assert result.loc["B"].isna().all()
+        assert result.loc["A", "1D"] == pytest.approx(1.0)
@@ -0,0 +1,173 @@
+"""Unit tests for the batched Kalman beta engine.
+
+This module tests BatchKalmanBeta, which filters the random-walk beta
+(and optionally alpha) of many assets against one benchmark at once.
+
+Test patterns follow t-wada TDD approach.
+"""
+
+import numpy as np
+import pytest
+
+from analyze.statistics.kalman import BatchKalmanBeta, KalmanBetaState
+
+
+@pytest.fixture
+def returns() -> tuple[np.ndarray, np.ndarray]:
+    """ベータが0.5〜1.5の5銘柄と市場リターン（200期間）。"""
+    rng = np.random.default_rng(42)
+    n_obs = 200
+    market = rng.normal(0, 0.01, n_obs)
+    betas = np.array([0.5, 0.8, 1.0, 1.2, 1.5])
+    assets = market[:, np.newaxis] * betas + rng.normal(0, 0.002, (n_obs, 5))
+    return assets, market
+
+
+class TestBatchKalmanBetaFit:
+    """Test fit method."""
+
+    def test_正常系_全銘柄のベータが真値に近い(
+        self, returns: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """一括推定したベータが各銘柄の真のベータに近いことを確認。"""
+        assets, market = returns
+
+        result = BatchKalmanBeta().fit(assets, market)
+
+        assert result.beta.shape == (200, 5)
+        np.testing.assert_allclose(
+            result.beta[100:].mean(axis=0), [0.5, 0.8, 1.0, 1.2, 1.5], atol=0.1
+        )
+
+    def test_正常系_一括推定と銘柄ごとの推定が一致する(
+        self, returns: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """N銘柄を一括で推定した結果が1銘柄ずつ推定した結果と一致することを確認。"""
+        assets, market = returns
+        engine = BatchKalmanBeta()
+
+        batch = engine.fit(assets, market).beta
+        single = np.column_stack(
+            [engine.fit(assets[:, i], market).beta[:, 0] for i in range(5)]
+        )
+
+        np.testing.assert_allclose(batch, single, rtol=1e-10)
+
+    def test_正常系_pykalmanと同じ結果になる(
+        self, returns: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """EM推定を含めてpykalmanのfilter結果と一致することを確認。"""
+        pykalman = pytest.importorskip("pykalman")
+        assets, market = returns
+        asset = assets[:, 3]
+        slope = np.polyfit(market, asset, 1)[0]
+
+        kf = pykalman.KalmanFilter(
+            transition_matrices=np.array([[1.0]]),
+            observation_matrices=market.reshape(-1, 1, 1),
+            transition_covariance=np.array([[0.001]]),
+            observation_covariance=np.array([[np.var(asset)]]),
+            initial_state_mean=np.array([slope]),
+            initial_state_covariance=np.array([[1.0]]),
+            n_dim_state=1,
+            n_dim_obs=1,
+        )
+        kf = kf.em(asset.reshape(-1, 1), n_iter=5)
+        expected, _ = kf.filter(asset.reshape(-1, 1))
+
+        result = BatchKalmanBeta(em_iterations=5).fit(asset, market)
+
+        np.testing.assert_allclose(result.beta[:, 0], expected[:, 0], rtol=1e-8)
+
+    def test_正常系_欠損値の日は状態が更新されない(
+        self, returns: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """欠損日は観測なしとなり、欠損を除いた系列の推定と一致することを確認。"""
+        assets, market = returns
+        with_gaps = assets.copy()
+        with_gaps[:30, 0] = np.nan
+        with_gaps[100:110, 0] = np.nan
+        keep = ~np.isnan(with_gaps[:, 0])
+        engine = BatchKalmanBeta()
+
+        result = engine.fit(with_gaps, market)
+        dropped = engine.fit(assets[keep, 0], market[keep])
+
+        assert not result.observed[:30, 0].any()
+        assert result.observed[:, 1:].all()
+        np.testing.assert_allclose(result.beta[keep, 0], dropped.beta[:, 0], rtol=1e-10)
+
+    def test_正常系_アルファも推定できる(self) -> None:
+        """include_alpha=Trueで一定のアルファとベータを推定できることを確認。"""
+        rng = np.random.default_rng(0)
+        market = rng.normal(0, 0.01, 300)
+        asset = 0.002 + 1.3 * market + rng.normal(0, 0.001, 300)
+
+        result = BatchKalmanBeta(
+            transition_covariance=1e-6, include_alpha=True, em_iterations=0
+        ).fit(asset, market, smooth=True)
+
+        assert result.alpha is not None
+        assert result.alpha[-1, 0] == pytest.approx(0.002, abs=5e-4)
+        assert result.beta[-1, 0] == pytest.approx(1.3, abs=0.05)
+
+    def test_正常系_固定パラメータではEMを行わない(
+        self, returns: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """em_iterations=0ではノイズパラメータが指定値のまま保持されることを確認。"""
+        assets, market = returns
+
+        result = BatchKalmanBeta(
+            transition_covariance=1e-4, observation_covariance=1e-5, em_iterations=0
+        ).fit(assets, market)
+
+        np.testing.assert_array_equal(result.state.transition_covariance, 1e-4)
+        np.testing.assert_array_equal(result.state.observation_covariance, 1e-5)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"transition_covariance": 0.0},
+            {"observation_covariance": -1.0},
+            {"initial_state_covariance": 0.0},
+            {"em_iterations": -1},
+        ],
+    )
+    def test_異常系_不正なパラメータでValueError(self, kwargs: dict) -> None:
+        """不正なパラメータでValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError):
+            BatchKalmanBeta(**kwargs)
+
+
+class TestBatchKalmanBetaUpdate:
+    """Test update method."""
+
+    def test_正常系_増分更新が全期間のフィルタと一致する(
+        self, returns: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """前回の状態から新しいリターンだけを処理した結果が一括処理と一致することを確認。"""
+        assets, market = returns
+        engine = BatchKalmanBeta(
+            observation_covariance=4e-6, em_iterations=0, warmup=50
+        )
+
+        full = engine.fit(assets, market)
+        head = engine.fit(assets[:150], market[:150])
+        tail = engine.update(head.state, assets[150:], market[150:])
+
+        assert isinstance(tail.state, KalmanBetaState)
+        np.testing.assert_allclose(tail.beta, full.beta[150:], rtol=1e-12)
+        np.testing.assert_allclose(
+            tail.state.state_mean, full.state.state_mean, rtol=1e-12
+        )
+
+    def test_異常系_銘柄数が異なるとValueError(
+        self, returns: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """状態と銘柄数が一致しない場合にValueErrorが発生することを確認。"""
+        assets, market = returns
+        engine = BatchKalmanBeta(em_iterations=0)
+        state = engine.fit(assets, market).state
+
+        with pytest.raises(ValueError, match="assets"):
+            engine.update(state, assets[:, :3], market)
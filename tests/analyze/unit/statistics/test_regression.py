@@ -0,0 +1,140 @@
+"""Unit tests for the rolling regression kernel.
+
+This module tests rolling_regression, which regresses every column of a
+DataFrame on a benchmark over a rolling window in one vectorized pass.
+
+Test patterns follow t-wada TDD approach.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyze.statistics.regression import RollingRegressionResult, rolling_regression
+
+
+@pytest.fixture
+def returns() -> tuple[pd.DataFrame, pd.Series]:
+    """3銘柄とベンチマークのリターン（300期間、一部欠損あり）。"""
+    rng = np.random.default_rng(7)
+    n_obs = 300
+    dates = pd.date_range("2024-01-01", periods=n_obs, freq="D")
+    benchmark = pd.Series(rng.normal(0.0005, 0.01, n_obs), index=dates, name="SPY")
+    assets = pd.DataFrame(
+        {
+            name: 0.0002 + beta * benchmark.to_numpy() + rng.normal(0, 0.005, n_obs)
+            for name, beta in [("AAPL", 1.2), ("MSFT", 0.9), ("XOM", 0.6)]
+        },
+        index=dates,
+    )
+    assets.iloc[10:40, 1] = np.nan
+    assets.iloc[rng.integers(0, n_obs, 20), 2] = np.nan
+    return assets, benchmark
+
+
+def _paired_reference(
+    asset: pd.Series, benchmark: pd.Series, window: int, min_periods: int
+) -> tuple[pd.Series, pd.Series]:
+    """ペアで観測された行だけを使ったpandasのローリングベータと決定係数。"""
+    paired = benchmark.where(asset.notna())
+    rolling = asset.rolling(window=window, min_periods=min_periods)
+    beta = rolling.cov(paired) / paired.rolling(window, min_periods=min_periods).var()
+    r_squared = rolling.corr(paired) ** 2
+    return beta, r_squared
+
+
+class TestRollingRegression:
+    """Test rolling_regression function."""
+
+    def test_正常系_pandasのローリング計算と一致する(
+        self, returns: tuple[pd.DataFrame, pd.Series]
+    ) -> None:
+        """ベータと決定係数がペア観測ベースのpandas計算と一致することを確認。"""
+        assets, benchmark = returns
+
+        result = rolling_regression(assets, benchmark, window=60, min_periods=20)
+
+        assert isinstance(result, RollingRegressionResult)
+        for col in assets.columns:
+            beta, r_squared = _paired_reference(assets.loc[:, col], benchmark, 60, 20)
+            pd.testing.assert_series_equal(
+                result.beta[col], beta, check_names=False, rtol=1e-9
+            )
+            pd.testing.assert_series_equal(
+                result.r_squared[col], r_squared, check_names=False, rtol=1e-9
+            )
+
+    def test_正常系_アルファと残差ボラがOLSと一致する(
+        self, returns: tuple[pd.DataFrame, pd.Series]
+    ) -> None:
+        """最終ウィンドウのアルファと残差標準偏差がOLSの結果と一致することを確認。"""
+        assets, benchmark = returns
+        window = assets["XOM"].iloc[-60:]
+        observed = window.notna()
+        x = benchmark.iloc[-60:][observed].to_numpy()
+        y = window[observed].to_numpy()
+        slope, intercept = np.polyfit(x, y, 1)
+        residuals = y - (intercept + slope * x)
+        expected_vol = np.sqrt((residuals**2).sum() / (len(y) - 2))
+
+        result = rolling_regression(assets, benchmark, window=60, min_periods=20)
+
+        assert result.beta["XOM"].iloc[-1] == pytest.approx(slope, rel=1e-9)
+        assert result.alpha["XOM"].iloc[-1] == pytest.approx(intercept, rel=1e-6)
+        assert result.residual_vol["XOM"].iloc[-1] == pytest.approx(
+            expected_vol, rel=1e-9
+        )
+
+    def test_正常系_min_periodsに満たないウィンドウはNaN(
+        self, returns: tuple[pd.DataFrame, pd.Series]
+    ) -> None:
+        """ペア観測数がmin_periods未満のウィンドウがNaNになることを確認。"""
+        assets, benchmark = returns
+
+        result = rolling_regression(assets, benchmark, window=30)
+
+        assert result.beta["AAPL"].iloc[:29].isna().all()
+        assert result.beta["AAPL"].iloc[29:].notna().all()
+        # MSFTは10〜39行目が欠損のため、そのウィンドウではNaN
+        assert result.beta["MSFT"].iloc[39:68].isna().all()
+        assert result.n_obs["MSFT"].iloc[69] == 30
+
+    def test_正常系_Seriesを1列のDataFrameとして扱う(
+        self, returns: tuple[pd.DataFrame, pd.Series]
+    ) -> None:
+        """Seriesを渡した場合に同名の1列の結果が返されることを確認。"""
+        assets, benchmark = returns
+
+        result = rolling_regression(assets["AAPL"], benchmark, window=60)
+
+        assert list(result.beta.columns) == ["AAPL"]
+        pd.testing.assert_series_equal(
+            result.beta["AAPL"],
+            rolling_regression(assets, benchmark, window=60).beta["AAPL"],
+        )
+
+    def test_エッジケース_ベンチマーク分散がゼロでNaN(self) -> None:
+        """ベンチマークが一定のウィンドウでは全指標がNaNになることを確認。"""
+        benchmark = pd.Series([0.01] * 10 + [0.02, -0.01, 0.03, 0.0, 0.01])
+        asset = pd.Series(np.linspace(-0.02, 0.02, 15))
+
+        result = rolling_regression(asset, benchmark, window=5)
+
+        assert result.beta.iloc[:10, 0].isna().all()
+        assert result.r_squared.iloc[:10, 0].isna().all()
+        assert result.beta.iloc[-1, 0] == pytest.approx(
+            asset.iloc[-5:].cov(benchmark.iloc[-5:]) / benchmark.iloc[-5:].var()
+        )
+
+    @pytest.mark.parametrize(
+        "window,min_periods",
+        [(1, None), (10, 1)],
+    )
+    def test_異常系_不正なwindowとmin_periodsでValueError(
+        self, window: int, min_periods: int | None
+    ) -> None:
+        """windowまたはmin_periodsが2未満の場合にValueErrorが発生することを確認。"""
+        series = pd.Series([0.01, 0.02, 0.03])
+
+        with pytest.raises(ValueError, match="at least 2"):
+            rolling_regression(series, series, window=window, min_periods=min_periods)
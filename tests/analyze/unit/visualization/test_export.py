@@ -0,0 +1,277 @@
+"""Unit tests for export module."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import plotly.graph_objects as go
+import pytest
+
+from analyze.visualization.charts import ChartBuilder, ExportFormat
+from analyze.visualization.export import (
+    MANIFEST_NAME,
+    ChartExporter,
+    ExportJob,
+    _KaleidoRenderer,
+    figure_spec_hash,
+)
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class ConcreteChartBuilder(ChartBuilder):
+    """Concrete implementation of ChartBuilder for testing."""
+
+    def __init__(self, data: list[float] | None = None) -> None:
+        """Initialize with optional data."""
+        super().__init__()
+        self.data = data or [1, 2, 3]
+
+    def build(self) -> "ConcreteChartBuilder":
+        """Build a simple line chart."""
+        self._figure = go.Figure(data=[go.Scatter(y=self.data, mode="lines")])
+        self._apply_theme()
+        return self
+
+
+def _write_outputs(jobs: list) -> None:
+    """Stand-in for the Kaleido renderer that writes placeholder files."""
+    for job in jobs:
+        job.path.write_bytes(b"image")
+
+
+@pytest.fixture
+def renderer() -> Iterator[MagicMock]:
+    """Patch the Kaleido renderer so no browser is started."""
+    with patch("analyze.visualization.export._KaleidoRenderer") as mock_cls:
+        mock_cls.return_value.render.side_effect = _write_outputs
+        yield mock_cls
+
+
+@pytest.fixture
+def kaleido_cls() -> Iterator[MagicMock]:
+    """Patch kaleido.Kaleido with an autospec so call signatures are checked."""
+    with patch(
+        "analyze.visualization.export.kaleido.Kaleido", autospec=True
+    ) as mock_cls:
+        yield mock_cls
+
+
+@pytest.fixture
+def figure() -> go.Figure:
+    """Create a simple figure."""
+    return ConcreteChartBuilder().build().figure  # type: ignore[return-value]
+
+
+# =============================================================================
+# figure_spec_hash
+# =============================================================================
+
+
+class TestFigureSpecHash:
+    """Tests for figure_spec_hash function."""
+
+    def test_正常系_同じ仕様は同じハッシュ(self) -> None:
+        """同じデータから作った図は同じハッシュになることを確認。"""
+        first = ConcreteChartBuilder([1, 2]).build().figure
+        second = ConcreteChartBuilder([1, 2]).build().figure
+        assert first is not None and second is not None
+
+        assert figure_spec_hash(first, "png") == figure_spec_hash(second, "png")
+
+    def test_正常系_データ変更でハッシュが変わる(self, figure: go.Figure) -> None:
+        """データが変わるとハッシュが変わることを確認。"""
+        other = ConcreteChartBuilder([1, 2, 4]).build().figure
+        assert other is not None
+
+        assert figure_spec_hash(figure, "png") != figure_spec_hash(other, "png")
+
+    def test_正常系_形式とスケールがハッシュに含まれる(self, figure: go.Figure) -> None:
+        """PNG のスケールと形式がハッシュに反映されることを確認。"""
+        png = figure_spec_hash(figure, ExportFormat.PNG, scale=2.0)
+
+        assert png != figure_spec_hash(figure, ExportFormat.PNG, scale=1.0)
+        assert png != figure_spec_hash(figure, ExportFormat.SVG)
+        assert figure_spec_hash(figure, "svg", scale=1.0) == figure_spec_hash(
+            figure, "svg", scale=3.0
+        )
+
+
+# =============================================================================
+# _KaleidoRenderer
+# =============================================================================
+
+
+class TestKaleidoRenderer:
+    """Tests for _KaleidoRenderer against the Kaleido API."""
+
+    def test_正常系_ジョブを1回のwrite_fig_from_objectで渡す(
+        self, kaleido_cls: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """全ジョブが Kaleido のシグネチャどおり1回の呼び出しで渡されることを確認。"""
+        jobs = [
+            ExportJob(figure, tmp_path / "a.png", ExportFormat.PNG, 3.0),
+            ExportJob(figure, tmp_path / "b.svg", ExportFormat.SVG, 3.0),
+        ]
+        renderer = _KaleidoRenderer(workers=2, timeout=30)
+        try:
+            renderer.render(jobs)
+        finally:
+            renderer.close()
+
+        kaleido_cls.assert_called_once_with(n=2, timeout=30)
+        browser = kaleido_cls.return_value
+        browser.open.assert_awaited_once()
+        browser.close.assert_awaited_once()
+        specs = browser.write_fig_from_object.call_args.args[0]
+        assert [spec["path"] for spec in specs] == [job.path for job in jobs]
+        assert [spec["opts"] for spec in specs] == [
+            {"format": "png", "scale": 3.0},
+            {"format": "svg", "scale": 1},
+        ]
+
+    def test_異常系_エラーログに記録があればRuntimeError(
+        self, kaleido_cls: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """Kaleido が error_log に記録したエラーで RuntimeError が発生することを確認。"""
+
+        def _fail(generator: object, *, error_log: list, profiler: None = None) -> None:
+            error_log.append("a.png: render timed out")
+
+        kaleido_cls.return_value.write_fig_from_object.side_effect = _fail
+        renderer = _KaleidoRenderer(workers=1, timeout=None)
+        try:
+            with pytest.raises(RuntimeError, match="render timed out"):
+                renderer.render(
+                    [ExportJob(figure, tmp_path / "a.png", ExportFormat.PNG, 2.0)]
+                )
+        finally:
+            renderer.close()
+
+
+# =============================================================================
+# ChartExporter
+# =============================================================================
+
+
+class TestChartExporter:
+    """Tests for ChartExporter class."""
+
+    def test_正常系_画像は1回のレンダリングでまとめて出力(
+        self, renderer: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """複数の画像が1つのレンダラーの1回の呼び出しで出力されることを確認。"""
+        exporter = ChartExporter(workers=3)
+        exporter.add(figure, tmp_path / "a.png").add(figure, tmp_path / "b.svg")
+
+        report = exporter.export()
+
+        renderer.assert_called_once_with(3, 90)
+        jobs = renderer.return_value.render.call_args.args[0]
+        assert [job.format for job in jobs] == [ExportFormat.PNG, ExportFormat.SVG]
+        assert report.rendered == [tmp_path / "a.png", tmp_path / "b.svg"]
+        assert report.skipped == []
+        renderer.return_value.close.assert_called_once()
+
+    def test_正常系_ChartBuilderとHTMLを出力(
+        self, renderer: MagicMock, tmp_path: Path
+    ) -> None:
+        """ChartBuilder を受け付け、HTML はレンダラーを使わず出力することを確認。"""
+        output = tmp_path / "nested" / "chart.html"
+
+        report = ChartExporter().add(ConcreteChartBuilder().build(), output).export()
+
+        assert output.exists()
+        assert report.rendered == [output]
+        renderer.assert_not_called()
+
+    def test_正常系_仕様が変わらなければ再レンダリングしない(
+        self, renderer: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """マニフェストのハッシュが一致するファイルはスキップされることを確認。"""
+        output = tmp_path / "chart.png"
+        ChartExporter().add(figure, output).export()
+
+        report = ChartExporter().add(figure, output).export()
+
+        assert report.rendered == []
+        assert report.skipped == [output]
+        assert renderer.return_value.render.call_count == 1
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert manifest == {"chart.png": figure_spec_hash(figure, "png")}
+
+    def test_正常系_仕様変更やファイル削除で再レンダリング(
+        self, renderer: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """図の変更・出力ファイルの削除・skip_unchanged=False で再出力されることを確認。"""
+        output = tmp_path / "chart.png"
+        ChartExporter().add(figure, output).export()
+
+        figure.update_layout(title="Updated")
+        assert ChartExporter().add(figure, output).export().rendered == [output]
+
+        output.unlink()
+        assert ChartExporter().add(figure, output).export().rendered == [output]
+
+        exporter = ChartExporter(skip_unchanged=False)
+        assert exporter.add(figure, output).export().rendered == [output]
+
+    def test_正常系_withブロック内ではレンダラーを再利用(
+        self, renderer: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """コンテキストマネージャ内では1つのレンダラーを使い回すことを確認。"""
+        with ChartExporter(skip_unchanged=False) as exporter:
+            exporter.add(figure, tmp_path / "a.png").export()
+            exporter.add(figure, tmp_path / "b.png").export()
+            renderer.return_value.close.assert_not_called()
+
+        renderer.assert_called_once()
+        assert renderer.return_value.render.call_count == 2
+        renderer.return_value.close.assert_called_once()
+
+    def test_正常系_同じパスは後から追加したジョブで置き換え(
+        self, renderer: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """同じ出力パスを再度追加すると後のジョブだけが残ることを確認。"""
+        exporter = ChartExporter()
+        exporter.add(figure, tmp_path / "chart.png", scale=1.0)
+        exporter.add(figure, tmp_path / "chart.png", scale=3.0)
+
+        assert [job.scale for job in exporter.pending] == [3.0]
+        exporter.export()
+        assert exporter.pending == []
+
+    def test_異常系_レンダリング失敗時は成功分だけマニフェストに記録(
+        self, renderer: MagicMock, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """画像のレンダリングが失敗したら例外を送出し、HTML だけ記録することを確認。"""
+        renderer.return_value.render.side_effect = RuntimeError("render failed")
+        exporter = ChartExporter()
+        exporter.add(figure, tmp_path / "a.html").add(figure, tmp_path / "b.png")
+
+        with pytest.raises(RuntimeError, match="render failed"):
+            exporter.export()
+
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert list(manifest) == ["a.html"]
+        renderer.return_value.close.assert_called_once()
+
+    def test_異常系_ビルド前のChartBuilderでRuntimeError(self, tmp_path: Path) -> None:
+        """ビルド前の ChartBuilder を追加すると RuntimeError が発生することを確認。"""
+        with pytest.raises(RuntimeError, match="Chart not built"):
+            ChartExporter().add(ConcreteChartBuilder(), tmp_path / "chart.png")
+
+    def test_異常系_未対応の拡張子でValueError(
+        self, figure: go.Figure, tmp_path: Path
+    ) -> None:
+        """形式を推定できない拡張子で ValueError が発生することを確認。"""
+        with pytest.raises(ValueError, match="Cannot infer format"):
+            ChartExporter().add(figure, tmp_path / "chart.unknown")
+
+    def test_異常系_workersが0でValueError(self) -> None:
+        """workers が1未満だと ValueError が発生することを確認。"""
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            ChartExporter(workers=0)
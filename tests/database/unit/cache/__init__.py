@@ -0,0 +1 @@
+"""Unit tests for database.cache package."""
@@ -0,0 +1,226 @@
+"""Unit tests for database.cache.store module.
+
+テスト対象:
+- CacheStoreConfig: 設定値のバリデーション
+- CacheStore: TTL、バイト・件数上限、LRU/LFU 退避、一括取得・保存、統計
+"""
+
+import threading
+from collections.abc import Generator
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from database.cache import CacheStore, CacheStoreConfig
+
+
+@pytest.fixture
+def store() -> Generator[CacheStore, None, None]:
+    """上限なしのインメモリストア。"""
+    store = CacheStore(CacheStoreConfig(namespace="test"))
+    yield store
+    store.close()
+
+
+class TestCacheStoreConfig:
+    """CacheStoreConfig のテスト。"""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_bytes": 0}, "max_bytes"),
+            ({"max_entries": -1}, "max_entries"),
+            ({"ttl_seconds": -1}, "ttl_seconds"),
+            ({"eviction_policy": "fifo"}, "eviction_policy"),
+            ({"dataframe_format": "csv"}, "dataframe_format"),
+        ],
+    )
+    def test_パラメトライズ_不正な設定でValueError(
+        self, kwargs: dict[str, object], match: str
+    ) -> None:
+        with pytest.raises(ValueError, match=match):
+            CacheStoreConfig(**kwargs)  # type: ignore[arg-type]
+
+
+class TestCacheStoreBasic:
+    """基本操作のテスト。"""
+
+    def test_正常系_保存と取得(self, store: CacheStore) -> None:
+        store.set("a", {"price": 1.5})
+        assert store.get("a") == {"price": 1.5}
+        assert "a" in store
+
+    def test_正常系_存在しないキーはdefaultを返す(self, store: CacheStore) -> None:
+        assert store.get("missing") is None
+        assert store.get("missing", default=0) == 0
+
+    def test_正常系_DataFrameを列と期間指定で取得(self, store: CacheStore) -> None:
+        df = pd.DataFrame(
+            {"open": range(10), "close": range(10, 20)},
+            index=pd.date_range("2024-01-01", periods=10, name="date"),
+            dtype=float,
+        )
+        store.set("AAPL", df)
+
+        result = store.get(
+            "AAPL", columns=["close"], start="2024-01-03", end="2024-01-04"
+        )
+
+        assert result["close"].tolist() == [12.0, 13.0]
+
+    def test_正常系_get_manyとset_manyで一括処理(self, store: CacheStore) -> None:
+        store.set_many({"a": 1, "b": 2, "c": 3})
+
+        assert store.get_many(["a", "c", "missing"]) == {"a": 1, "c": 3}
+        stats = store.stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+
+    def test_正常系_メタデータを保存できる(self, store: CacheStore) -> None:
+        store.set("a", 1, metadata={"source": "yfinance"})
+        assert store.get_metadata("a") == {"source": "yfinance"}
+
+    def test_正常系_namespaceごとに独立(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.db"
+        market = CacheStore(CacheStoreConfig(db_path=db_path, namespace="market"))
+        fred = CacheStore(CacheStoreConfig(db_path=db_path, namespace="fred"))
+        market.set("key", "market")
+        fred.set("key", "fred")
+
+        assert market.get("key") == "market"
+        assert fred.get("key") == "fred"
+        assert market.clear() == 1
+        assert fred.get("key") == "fred"
+
+    def test_正常系_永続ストアがセッションをまたいで保持される(
+        self, tmp_path: Path
+    ) -> None:
+        config = CacheStoreConfig(db_path=tmp_path / "cache.db", namespace="test")
+        with CacheStore(config) as store:
+            store.set("a", [1, 2, 3])
+
+        with CacheStore(config) as store:
+            assert store.get("a") == [1, 2, 3]
+
+
+class TestCacheStoreExpiration:
+    """TTL のテスト。"""
+
+    def test_正常系_TTL0のエントリは即座に期限切れ(self, store: CacheStore) -> None:
+        store.set("a", 1, ttl=0)
+
+        assert store.get("a") is None
+        assert store.stats().expirations == 1
+
+    def test_正常系_ttl_seconds_Noneでは期限切れにならない(self) -> None:
+        store = CacheStore(CacheStoreConfig(ttl_seconds=None))
+        store.set("a", 1)
+        assert store.cleanup_expired() == 0
+        assert store.get("a") == 1
+
+    def test_正常系_cleanup_expiredで期限切れのみ削除(self, store: CacheStore) -> None:
+        store.set("old", 1, ttl=0)
+        store.set("new", 2)
+
+        assert store.cleanup_expired() == 1
+        assert store.stats().entries == 1
+
+
+class TestCacheStoreEviction:
+    """容量上限と退避のテスト。"""
+
+    def test_正常系_LRUでは最も古く参照されたエントリを退避(self) -> None:
+        store = CacheStore(CacheStoreConfig(max_entries=2))
+        store.set("a", 1)
+        store.set("b", 2)
+        store.get("a")
+        store.set("c", 3)
+
+        assert store.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+        assert store.stats().evictions == 1
+
+    def test_正常系_LFUでは参照回数の少ないエントリを退避(self) -> None:
+        store = CacheStore(CacheStoreConfig(max_entries=2, eviction_policy="lfu"))
+        store.set("a", 1)
+        store.set("b", 2)
+        for _ in range(3):
+            store.get("a")
+        store.get("b")
+        store.set("c", 3)
+
+        assert "a" in store
+        assert "b" not in store
+        assert "c" in store
+
+    def test_正常系_バイト上限を超えないよう退避(self) -> None:
+        payload = "x" * 1000
+        store = CacheStore(CacheStoreConfig(max_bytes=3500))
+        for i in range(10):
+            store.set(f"k{i}", payload)
+
+        stats = store.stats()
+        assert stats.total_bytes <= 3500
+        assert stats.entries == 3
+        assert store.get_many([f"k{i}" for i in range(7, 10)]).keys() == {
+            "k7",
+            "k8",
+            "k9",
+        }
+
+    def test_エッジケース_上限を超える単一エントリは保持される(self) -> None:
+        store = CacheStore(CacheStoreConfig(max_bytes=100))
+        store.set("small", "x")
+        store.set("large", "x" * 1000)
+
+        assert "large" in store
+        assert "small" not in store
+
+    def test_正常系_期限切れエントリが優先して退避される(self) -> None:
+        store = CacheStore(CacheStoreConfig(max_entries=2))
+        store.set("fresh", 1)
+        store.set("stale", 2, ttl=0)
+        store.set("new", 3)
+
+        assert "fresh" in store
+        assert store.stats().evictions == 0
+
+    def test_正常系_上書きでバイト数が更新される(self, store: CacheStore) -> None:
+        store.set("a", "x" * 1000)
+        before = store.stats().total_bytes
+        store.set("a", "x")
+
+        stats = store.stats()
+        assert stats.entries == 1
+        assert stats.total_bytes < before
+        store.delete("a")
+        assert store.stats().total_bytes == 0
+
+
+class TestCacheStoreConcurrency:
+    """スレッドセーフ性のテスト。"""
+
+    def test_エッジケース_複数スレッドから同時に書き込める(
+        self, tmp_path: Path
+    ) -> None:
+        store = CacheStore(
+            CacheStoreConfig(db_path=tmp_path / "cache.db", max_entries=50)
+        )
+        errors: list[Exception] = []
+
+        def worker(offset: int) -> None:
+            try:
+                for i in range(20):
+                    store.set(f"k{offset}-{i}", i)
+                    store.get(f"k{offset}-{i}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert store.stats().entries == 50
@@ -17,6 +17,7 @@ from datetime import date
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -888,6 +889,59 @@ class TestRunEqualWeightPipeline:
         call_kwargs = mock_gen.generate_all.call_args
         assert call_kwargs.kwargs.get("evaluation") == eval_result
 
+    @patch.object(Orchestrator, "_run_phase3_neutralization")
+    @patch.object(Orchestrator, "_run_phase2_scoring")
+    @patch.object(Orchestrator, "_run_phase1_extraction")
+    def test_正常系_pricesを渡すとバックテストのリターンで評価される(
+        self,
+        mock_phase1: MagicMock,
+        mock_phase2: MagicMock,
+        mock_phase3: MagicMock,
+        orchestrator: Orchestrator,
+    ) -> None:
+        mock_phase1.return_value = _make_claims()
+        mock_phase2.return_value = _make_scored_claims()
+        mock_phase3.return_value = _make_ranked_df()
+
+        dates = pd.bdate_range("2015-09-28", periods=10)
+        prices = pd.DataFrame(
+            {
+                "AAPL": np.linspace(100, 110, len(dates)),
+                "JPM": np.linspace(50, 45, len(dates)),
+            },
+            index=dates,
+        )
+        benchmark = pd.Series(0.001, index=dates)
+
+        with (
+            patch("dev.ca_strategy.orchestrator.PortfolioBuilder") as mock_builder_cls,
+            patch("dev.ca_strategy.orchestrator.StrategyEvaluator") as mock_eval_cls,
+            patch("dev.ca_strategy.orchestrator.OutputGenerator"),
+        ):
+            mock_builder = MagicMock()
+            mock_builder.build_equal_weight.return_value = _make_portfolio_result()
+            mock_builder_cls.return_value = mock_builder
+
+            mock_eval = MagicMock()
+            mock_eval.evaluate.return_value = _make_evaluation_result()
+            mock_eval_cls.return_value = mock_eval
+
+            orchestrator.run_equal_weight_pipeline(
+                thresholds=[0.3, 0.5],
+                prices=prices,
+                benchmark_returns=benchmark,
+            )
+
+        assert mock_eval.evaluate.call_count == 2
+        kwargs = mock_eval.evaluate.call_args.kwargs
+        returns = kwargs["portfolio_returns"]
+        # 2015-09-30 (as_of_date) に購入し最終日まで保有
+        assert returns.index[0] == pd.Timestamp("2015-09-30")
+        growth = prices.iloc[-1] / prices.loc["2015-09-30"]
+        expected = 0.6 * growth["AAPL"] + 0.4 * growth["JPM"]
+        assert (1 + returns).prod() == pytest.approx(expected)
+        pd.testing.assert_series_equal(kwargs["benchmark_returns"], benchmark)
+
     @patch.object(Orchestrator, "_run_phase1_extraction")
     def test_異常系_Phase1でエラーが発生した場合ログに記録される(
         self,
@@ -78,12 +78,16 @@ class TestEndToEndTextExtraction:
         assert item1a is not None
         assert "Risk Factors" in item1a or "factors" in item1a.lower()
 
-        # Verify cache has section-specific keys
-        cached_1 = cache.get_cached_text("section_0000320193-24-000001_item_1")
-        assert cached_1 == item1
-
-        cached_1a = cache.get_cached_text("section_0000320193-24-000001_item_1a")
-        assert cached_1a == item1a
+        # The filing is downloaded and scanned once for both sections
+        assert filing.text.call_count == 1
+
+        # A new extractor serves both sections from the cached index
+        cached_filing = MagicMock()
+        cached_filing.accession_number = "0000320193-24-000001"
+        fresh = SectionExtractor(cache=cache)
+        assert fresh.extract_section(cached_filing, "item_1") == item1
+        assert fresh.extract_section(cached_filing, "item_1a") == item1a
+        cached_filing.text.assert_not_called()
 
     def test_E2E_Fetcherからテキスト抽出まで(
         self,
@@ -276,7 +276,10 @@ class TestBatchExtractor:
     def test_正常系_extract_sections_batchで複数セクション並列抽出(self) -> None:
         """extract_sections_batch should extract sections from multiple filings."""
         mock_section_ext = MagicMock()
-        mock_section_ext.extract_section.return_value = "Section text"
+        mock_section_ext.extract_sections.return_value = {
+            "item_1": "Section text",
+            "item_7": "Section text",
+        }
 
         filing1 = MagicMock()
         filing1.accession_number = "0001-24-000001"
@@ -288,6 +291,11 @@ class TestBatchExtractor:
             max_workers=2,
         )
 
+        mock_section_ext.load_cached_indexes.assert_called_once_with([filing1])
+        mock_section_ext.extract_sections.assert_called_once_with(
+            filing1, ["item_1", "item_7"]
+        )
+
         assert len(results) == 1
         assert "0001-24-000001" in results
         section_result = results["0001-24-000001"]
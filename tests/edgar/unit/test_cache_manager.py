@@ -108,7 +108,7 @@ class TestCacheManagerSaveAndGet:
         # Force expiration by directly updating expires_at in the DB
         conn = sqlite3.connect(str(cache.db_path))
         conn.execute(
-            "UPDATE edgar_cache SET expires_at = ? WHERE filing_id = ?",
+            "UPDATE cache_entries SET expires_at = ? WHERE key = ?",
             (int(time.time()) - 1, "filing-001"),
         )
         conn.commit()
@@ -131,7 +131,7 @@ class TestCacheManagerSaveAndGet:
         # Force expiration
         conn = sqlite3.connect(str(cache.db_path))
         conn.execute(
-            "UPDATE edgar_cache SET expires_at = ? WHERE filing_id = ?",
+            "UPDATE cache_entries SET expires_at = ? WHERE key = ?",
             (int(time.time()) - 1, "filing-001"),
         )
         conn.commit()
@@ -143,7 +143,7 @@ class TestCacheManagerSaveAndGet:
         # Verify entry was deleted from DB
         conn = sqlite3.connect(str(cache.db_path))
         cursor = conn.execute(
-            "SELECT COUNT(*) FROM edgar_cache WHERE filing_id = ?",
+            "SELECT COUNT(*) FROM cache_entries WHERE key = ?",
             ("filing-001",),
         )
         count = cursor.fetchone()[0]
@@ -179,7 +179,7 @@ class TestCacheManagerClearExpired:
         # Force expiration for filing-001 only
         conn = sqlite3.connect(str(cache.db_path))
         conn.execute(
-            "UPDATE edgar_cache SET expires_at = ? WHERE filing_id = ?",
+            "UPDATE cache_entries SET expires_at = ? WHERE key = ?",
             (int(time.time()) - 1, "filing-001"),
         )
         conn.commit()
@@ -248,22 +248,62 @@ class TestCacheManagerInit:
         assert cache.db_path.exists()
 
     def test_正常系_DBスキーマが正しく作成される(self, tmp_path: Path) -> None:
-        """CacheManager should create the edgar_cache table with correct schema.
+        """CacheManager should store entries in the shared cache_entries table.
 
-        Verify that the database table has the expected columns:
-        filing_id (TEXT PK), text (TEXT), cached_at (INT), expires_at (INT).
+        Verify that saved filings are stored under the "edgar" namespace
+        with an expiration timestamp.
         """
-        CacheManager(cache_dir=tmp_path, ttl_days=90)
+        cache = CacheManager(cache_dir=tmp_path, ttl_days=90)
+        cache.save_text("filing-001", "Some text")
 
         conn = sqlite3.connect(str(tmp_path / "edgar_cache.db"))
-        cursor = conn.execute("PRAGMA table_info(edgar_cache)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
+        row = conn.execute(
+            "SELECT namespace, key, expires_at FROM cache_entries"
+        ).fetchone()
         conn.close()
 
-        assert "filing_id" in columns
-        assert "text" in columns
-        assert "cached_at" in columns
-        assert "expires_at" in columns
+        assert row[0] == "edgar"
+        assert row[1] == "filing-001"
+        assert row[2] > time.time() + 89 * 86400
+
+    def test_正常系_旧edgar_cacheテーブルを移行して削除する(
+        self, tmp_path: Path
+    ) -> None:
+        """Unexpired rows of the legacy table should move into the store.
+
+        Expired rows are dropped with the legacy table, and entries already
+        in the store are not replaced.
+        """
+        CacheManager(cache_dir=tmp_path).save_text("filing-new", "Current text")
+        now = int(time.time())
+        conn = sqlite3.connect(str(tmp_path / "edgar_cache.db"))
+        conn.execute(
+            "CREATE TABLE edgar_cache (filing_id TEXT PRIMARY KEY, "
+            "text TEXT NOT NULL, cached_at INTEGER NOT NULL, "
+            "expires_at INTEGER NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO edgar_cache VALUES (?, ?, ?, ?)",
+            [
+                ("filing-live", "Live text", now, now + 86400),
+                ("filing-expired", "Old text", now - 200, now - 100),
+                ("filing-new", "Stale text", now, now + 86400),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        cache = CacheManager(cache_dir=tmp_path)
+
+        assert cache.get_cached_text("filing-live") == "Live text"
+        assert cache.get_cached_text("filing-expired") is None
+        assert cache.get_cached_text("filing-new") == "Current text"
+        conn = sqlite3.connect(str(tmp_path / "edgar_cache.db"))
+        tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'edgar_cache'"
+        ).fetchall()
+        conn.close()
+        assert tables == []
 
 
 class TestCacheManagerConcurrency:
@@ -331,7 +371,7 @@ class TestCacheManagerErrorHandling:
         cache = CacheManager(cache_dir=tmp_path, ttl_days=90)
 
         with (
-            patch.object(cache, "_connection", side_effect=RuntimeError("DB error")),
+            patch.object(cache._store, "get", side_effect=RuntimeError("DB error")),
             pytest.raises(CacheError, match="get cached text for filing.*failed"),
         ):
             cache.get_cached_text("filing-001")
@@ -345,7 +385,7 @@ class TestCacheManagerErrorHandling:
         cache = CacheManager(cache_dir=tmp_path, ttl_days=90)
 
         with (
-            patch.object(cache, "_connection", side_effect=RuntimeError("DB error")),
+            patch.object(cache._store, "set", side_effect=RuntimeError("DB error")),
             pytest.raises(CacheError, match="save text for filing.*failed"),
         ):
             cache.save_text("filing-001", "Some text")
@@ -361,36 +401,33 @@ class TestCacheManagerErrorHandling:
         cache = CacheManager(cache_dir=tmp_path, ttl_days=90)
 
         with (
-            patch.object(cache, "_connection", side_effect=RuntimeError("DB error")),
+            patch.object(
+                cache._store, "cleanup_expired", side_effect=RuntimeError("DB error")
+            ),
             pytest.raises(CacheError, match="clear expired cache entries failed"),
         ):
             cache.clear_expired()
 
-    def test_異常系_connectionでsqlite3Errorがロールバックされる(
-        self, tmp_path: Path
-    ) -> None:
-        """_connection should rollback and raise CacheError on sqlite3.Error.
+    def test_異常系_sqlite3ErrorがCacheErrorに変換される(self, tmp_path: Path) -> None:
+        """save_text should wrap sqlite3.Error in CacheError.
 
-        Verify that a sqlite3.Error during a transaction triggers
-        a rollback and is wrapped in CacheError.
+        Verify that a database failure in the underlying store surfaces
+        as CacheError and leaves the existing entry intact.
         """
         cache = CacheManager(cache_dir=tmp_path, ttl_days=90)
-
-        # Save initial data
         cache.save_text("filing-001", "Original text")
 
-        # Manually trigger sqlite3.Error within a transaction
         with (
-            pytest.raises(CacheError, match="Database transaction failed"),
-            cache._connection() as conn,
+            patch.object(
+                cache._store,
+                "set",
+                side_effect=sqlite3.OperationalError("database is locked"),
+            ),
+            pytest.raises(CacheError, match=r"save text for filing.*failed"),
         ):
-            conn.execute(
-                "INSERT INTO edgar_cache (filing_id, text, cached_at, expires_at) "
-                "VALUES (?, ?, ?, ?)",
-                ("filing-001", "Conflict", 0, 0),
-            )
-            # Force a sqlite3 error by querying a nonexistent table
-            conn.execute("INSERT INTO nonexistent_table VALUES (1)")
+            cache.save_text("filing-001", "Conflict")
+
+        assert cache.get_cached_text("filing-001") == "Original text"
 
     def test_異常系_init_dbで非CacheError例外がCacheErrorに変換(
         self, tmp_path: Path
@@ -402,7 +439,7 @@ class TestCacheManagerErrorHandling:
         """
         with (
             patch(
-                "edgar.cache.manager.CacheManager._connection",
+                "edgar.cache.manager.CacheStore",
                 side_effect=RuntimeError("Unexpected init error"),
             ),
             pytest.raises(CacheError, match="initialize cache database failed"),
@@ -421,9 +458,56 @@ class TestCacheManagerErrorHandling:
         original_error = CacheError("Original cache error")
 
         with (
-            patch.object(cache, "_connection", side_effect=original_error),
+            patch.object(cache._store, "get", side_effect=original_error),
             pytest.raises(CacheError) as exc_info,
         ):
             cache.get_cached_text("filing-001")
 
         assert exc_info.value is original_error
+
+
+class TestCacheManagerCompression:
+    """Tests for compressed storage and binary payloads."""
+
+    def test_正常系_テキストは圧縮して保存される(self, tmp_path: Path) -> None:
+        """save_text should store fewer bytes than the raw text."""
+        cache = CacheManager(cache_dir=tmp_path)
+        text = "Item 1. Business\n" + "The company designs products. " * 2000
+
+        cache.save_text("filing-001", text)
+
+        assert cache.get_cached_text("filing-001") == text
+        assert cache.get_stats()["total_bytes"] < len(text.encode()) // 5
+
+    def test_正常系_旧形式の非圧縮テキストも読める(self, tmp_path: Path) -> None:
+        """get_cached_text should read plain str entries written before compression."""
+        cache = CacheManager(cache_dir=tmp_path)
+        cache._store.set("filing-legacy", "Legacy text")
+
+        assert cache.get_cached_text("filing-legacy") == "Legacy text"
+        assert cache.get_many_cached_texts(["filing-legacy"]) == {
+            "filing-legacy": "Legacy text"
+        }
+
+    def test_正常系_バイト列の保存と一括取得(self, tmp_path: Path) -> None:
+        """save_bytes/get_many_cached_bytes should round-trip payloads."""
+        cache = CacheManager(cache_dir=tmp_path)
+        cache.save_bytes("a", b"\x00payload-a")
+        cache.save_bytes("b", b"payload-b" * 100)
+
+        assert cache.get_cached_bytes("a") == b"\x00payload-a"
+        assert cache.get_cached_bytes("missing") is None
+        assert cache.get_many_cached_bytes(["a", "b", "missing"]) == {
+            "a": b"\x00payload-a",
+            "b": b"payload-b" * 100,
+        }
+
+    def test_異常系_save_bytesでDB例外がCacheErrorに変換(self, tmp_path: Path) -> None:
+        """save_bytes should wrap unexpected exceptions in CacheError."""
+        cache = CacheManager(cache_dir=tmp_path)
+
+        with (
+            patch.object(cache._store, "set", side_effect=RuntimeError("DB error")),
+            pytest.raises(CacheError, match=r"save bytes for.*failed"),
+        ):
+            cache.save_bytes("a", b"data")
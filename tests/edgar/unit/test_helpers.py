@@ -40,6 +40,18 @@ class TestGetAccessionNumber:
 
         assert result is None
 
+    def test_エッジケース_Noneの属性は未設定として扱う(self) -> None:
+        """get_accession_number should skip attributes set to None."""
+        filing = MagicMock(spec=["accession_number", "accession_no"])
+        filing.accession_number = None
+        filing.accession_no = "0001234567-24-000001"
+
+        assert get_accession_number(filing) == "0001234567-24-000001"
+
+        filing.accession_no = None
+
+        assert get_accession_number(filing) is None
+
     def test_エッジケース_例外発生時にNone(self) -> None:
         """get_accession_number should return None on exception."""
         filing = MagicMock()
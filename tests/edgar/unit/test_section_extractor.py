@@ -7,20 +7,26 @@ section-level text extraction from SEC EDGAR filings.
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 
+from edgar.cache.manager import CacheManager
 from edgar.extractors._helpers import get_accession_number, get_filing_text
 from edgar.extractors.section import (
     DEFAULT_SECTION_PATTERNS,
     SECTION_PATTERNS,
     SectionExtractor,
-    _build_cache_key,
+    SectionIndex,
+    _build_index_cache_key,
     _extract_section_text,
     _find_section_positions,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # Sample filing text that mimics a real 10-K filing structure.
 SAMPLE_FILING_TEXT = (
     "HEADER CONTENT\n\n"
@@ -125,14 +131,14 @@ class TestGetAccessionNumber:
         assert result is None
 
 
-class TestBuildCacheKey:
-    """Tests for _build_cache_key helper function."""
+class TestBuildIndexCacheKey:
+    """Tests for _build_index_cache_key helper function."""
 
-    def test_正常系_セクションキャッシュキー生成(self) -> None:
-        """Cache key should be formatted as section_accession_section_key."""
-        result = _build_cache_key("0001234567-24-000001", "item_1")
+    def test_正常系_インデックスキャッシュキー生成(self) -> None:
+        """Cache key should be formatted as section_index_accession_fingerprint."""
+        result = _build_index_cache_key("0001234567-24-000001", "abc123")
 
-        assert result == "section_0001234567-24-000001_item_1"
+        assert result == "section_index_0001234567-24-000001_abc123"
 
 
 class TestFindSectionPositions:
@@ -278,8 +284,9 @@ class TestSectionExtractor:
 
     def test_正常系_キャッシュヒットで再抽出しない(self) -> None:
         """extract_section should return cached result without extraction."""
+        cached_index = SectionIndex.parse(SAMPLE_FILING_TEXT)
         mock_cache = MagicMock()
-        mock_cache.get_cached_text.return_value = "Cached section text"
+        mock_cache.get_cached_bytes.return_value = cached_index.to_bytes()
 
         filing = MagicMock()
         filing.accession_number = "0001234567-24-000001"
@@ -287,13 +294,13 @@ class TestSectionExtractor:
         extractor = SectionExtractor(cache=mock_cache)
         result = extractor.extract_section(filing, "item_1")
 
-        assert result == "Cached section text"
+        assert result == cached_index.section("item_1")
         filing.text.assert_not_called()
 
     def test_正常系_キャッシュミス時はキャッシュに保存(self) -> None:
-        """extract_section should save to cache on cache miss."""
+        """extract_section should save the filing index to cache on cache miss."""
         mock_cache = MagicMock()
-        mock_cache.get_cached_text.return_value = None
+        mock_cache.get_cached_bytes.return_value = None
 
         filing = MagicMock()
         filing.accession_number = "0001234567-24-000001"
@@ -302,7 +309,7 @@ class TestSectionExtractor:
         extractor = SectionExtractor(cache=mock_cache)
         extractor.extract_section(filing, "item_1")
 
-        mock_cache.save_text.assert_called_once()
+        mock_cache.save_bytes.assert_called_once()
 
     def test_異常系_不明なセクションキーでNone(self) -> None:
         """extract_section should return None for unknown section key."""
@@ -345,8 +352,8 @@ class TestSectionExtractor:
     def test_エッジケース_キャッシュ書き込みエラーは無視(self) -> None:
         """extract_section should succeed even if cache write fails."""
         mock_cache = MagicMock()
-        mock_cache.get_cached_text.return_value = None
-        mock_cache.save_text.side_effect = RuntimeError("Cache write error")
+        mock_cache.get_cached_bytes.return_value = None
+        mock_cache.save_bytes.side_effect = RuntimeError("Cache write error")
 
         filing = MagicMock()
         filing.accession_number = "0001234567-24-000001"
@@ -529,7 +536,7 @@ class TestSectionExtractorCustomPatterns:
         }
 
         mock_cache = MagicMock()
-        mock_cache.get_cached_text.return_value = None
+        mock_cache.get_cached_bytes.return_value = None
 
         filing = MagicMock()
         filing.accession_number = "0001234567-24-000001"
@@ -542,7 +549,7 @@ class TestSectionExtractorCustomPatterns:
         result = extractor.extract_section(filing, "part_1")
 
         assert result is not None
-        mock_cache.save_text.assert_called_once()
+        mock_cache.save_bytes.assert_called_once()
 
     def test_正常系_カスタムパターンでreprは変わらない(self) -> None:
         """__repr__ should still show cache status with custom patterns."""
@@ -552,3 +559,134 @@ class TestSectionExtractorCustomPatterns:
         extractor = SectionExtractor(custom_patterns=custom_patterns)
 
         assert "cache_enabled=False" in repr(extractor)
+
+
+class TestSectionIndex:
+    """Tests for SectionIndex."""
+
+    def test_正常系_全セクションの範囲を1回で記録(self) -> None:
+        """parse should record a span for every found section."""
+        index = SectionIndex.parse(SAMPLE_FILING_TEXT)
+
+        assert list(index.spans) == ["item_1", "item_1a", "item_7", "item_8"]
+        assert index.spans["item_8"][1] == len(SAMPLE_FILING_TEXT)
+
+    def test_正常系_既存の抽出関数と同じテキストを返す(self) -> None:
+        """section should match _extract_section_text for every section."""
+        index = SectionIndex.parse(SAMPLE_FILING_TEXT)
+        positions = _find_section_positions(SAMPLE_FILING_TEXT)
+
+        for key in DEFAULT_SECTION_PATTERNS:
+            assert index.section(key) == _extract_section_text(
+                SAMPLE_FILING_TEXT, key, positions
+            )
+
+    def test_正常系_バイト列との相互変換(self) -> None:
+        """to_bytes/from_bytes should round-trip text and spans."""
+        index = SectionIndex.parse("前文\n" + SAMPLE_FILING_TEXT)
+
+        assert SectionIndex.from_bytes(index.to_bytes()) == index
+
+    def test_エッジケース_存在しないセクションでNone(self) -> None:
+        """section should return None for a section that was not found."""
+        index = SectionIndex.parse("Item 1. Business\n\nOnly one section.")
+
+        assert index.section("item_7") is None
+
+
+class TestSectionExtractorParseOnce:
+    """Tests for parse-once extraction of several sections."""
+
+    def test_正常系_複数セクションを1回の取得で抽出(self) -> None:
+        """extract_sections should fetch the filing text only once."""
+        filing = MagicMock()
+        filing.accession_number = "0001234567-24-000001"
+        filing.text.return_value = SAMPLE_FILING_TEXT
+
+        extractor = SectionExtractor()
+        sections = extractor.extract_sections(
+            filing, ["item_1", "item_1a", "item_7", "item_99"]
+        )
+
+        assert filing.text.call_count == 1
+        assert sections["item_1"] == "Item 1. Business\n\nWe are a technology company."
+        assert sections["item_1a"] is not None
+        assert sections["item_7"] is not None
+        assert sections["item_99"] is None
+
+    def test_正常系_同じFilingの再抽出はメモから返す(self) -> None:
+        """Repeated extract_section calls should not refetch the filing."""
+        filing = MagicMock()
+        filing.accession_number = "0001234567-24-000001"
+        filing.text.return_value = SAMPLE_FILING_TEXT
+
+        extractor = SectionExtractor()
+        for key in ["item_1", "item_1a", "item_7", "item_8"]:
+            assert extractor.extract_section(filing, key) is not None
+
+        assert filing.text.call_count == 1
+
+    def test_正常系_メモ無効時は毎回取得(self) -> None:
+        """index_memo_size=0 without cache should refetch every time."""
+        filing = MagicMock()
+        filing.accession_number = "0001234567-24-000001"
+        filing.text.return_value = SAMPLE_FILING_TEXT
+
+        extractor = SectionExtractor(index_memo_size=0)
+        extractor.extract_section(filing, "item_1")
+        extractor.extract_section(filing, "item_7")
+
+        assert filing.text.call_count == 2
+
+    def test_正常系_バッチ抽出はキャッシュ済みインデックスを一括取得(
+        self, tmp_path: Path
+    ) -> None:
+        """extract_sections_batch should serve cached filings without fetching."""
+        cache = CacheManager(cache_dir=tmp_path)
+        filings = []
+        for i in range(3):
+            filing = MagicMock()
+            filing.accession_number = f"0001234567-24-00000{i}"
+            filing.text.return_value = SAMPLE_FILING_TEXT
+            filings.append(filing)
+        SectionExtractor(cache=cache).extract_section(filings[0], "item_1")
+
+        extractor = SectionExtractor(cache=cache)
+        results = extractor.extract_sections_batch(filings, ["item_1", "item_8"])
+
+        assert list(results) == [f.accession_number for f in filings]
+        assert filings[0].text.call_count == 1
+        assert filings[1].text.call_count == 1
+        assert all(r["item_8"] is not None for r in results.values())
+
+    def test_正常系_バッチ抽出のキーはaccession_noと位置を使う(self) -> None:
+        """Batch keys should use accession_no and fall back to the position."""
+        filings = [MagicMock(spec=["accession_no", "text"]) for _ in range(3)]
+        filings[0].accession_no = "0001234567-24-000001"
+        filings[1].accession_no = None
+        filings[2].accession_no = None
+        for filing in filings:
+            filing.text.return_value = SAMPLE_FILING_TEXT
+
+        results = SectionExtractor().extract_sections_batch(filings, ["item_1"])
+
+        assert list(results) == ["0001234567-24-000001", "1", "2"]
+
+    def test_正常系_パターンが異なるとキャッシュを共有しない(
+        self, tmp_path: Path
+    ) -> None:
+        """Indexes built with other patterns should not be reused."""
+        cache = CacheManager(cache_dir=tmp_path)
+        filing = MagicMock()
+        filing.accession_number = "0001234567-24-000001"
+        filing.text.return_value = SAMPLE_FILING_TEXT
+        SectionExtractor(cache=cache).extract_section(filing, "item_1")
+
+        custom = {"item_1": re.compile(r"(?i)item\s+1a[\.\s]+risk")}
+        result = SectionExtractor(cache=cache, custom_patterns=custom).extract_section(
+            filing, "item_1"
+        )
+
+        assert filing.text.call_count == 2
+        assert result is not None
+        assert result.startswith("Item 1A.")
@@ -0,0 +1,232 @@
+"""Unit tests for BatchFactorEngine.
+
+このテストモジュールは、複数ファクターのバッチ計算エンジンを検証します。
+
+テスト対象:
+- Factor.data_requirements: ファクターごとの必要データ
+- BatchFactorEngine: 共有データパネルを使った複数ファクターの一括計算
+"""
+
+import zlib
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from factor.core.base import Factor
+from factor.core.batch import BatchComputeResult, BatchFactorEngine
+from factor.core.registry import FactorNotFoundError, FactorRegistry
+from factor.enums import FactorCategory
+from factor.errors import ValidationError
+from factor.factors.price import MomentumFactor, VolatilityFactor
+from factor.factors.quality import CompositeQualityFactor
+from factor.factors.size import SizeFactor
+from factor.factors.value import ValueFactor
+from factor.providers.base import DataProvider
+from factor.providers.panel import DataRequirements
+
+SYMBOLS = ["AAPL", "GOOGL", "MSFT", "AMZN"]
+START = "2023-01-01"
+END = "2024-01-31"
+
+
+class CountingProvider:
+    """呼び出し回数を記録するDataProviderモック。"""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.metrics: list[list[str]] = []
+
+    def get_prices(
+        self, symbols: list[str], start_date: datetime | str, end_date: datetime | str
+    ) -> pd.DataFrame:
+        self.calls["prices"] += 1
+        dates = pd.bdate_range(start_date, end_date, name="Date")
+        rng = np.random.default_rng(42)
+        columns = pd.MultiIndex.from_product(
+            [symbols, ["Open", "High", "Low", "Close", "Volume"]],
+            names=["symbol", "price_type"],
+        )
+        data = 100 * np.exp(
+            np.cumsum(rng.normal(0, 0.01, (len(dates), len(columns))), 0)
+        )
+        return pd.DataFrame(data, index=dates, columns=columns)
+
+    def get_volumes(
+        self, symbols: list[str], start_date: datetime | str, end_date: datetime | str
+    ) -> pd.DataFrame:
+        self.calls["volumes"] += 1
+        dates = pd.bdate_range(start_date, end_date, name="Date")
+        return pd.DataFrame(1e6, index=dates, columns=pd.Index(symbols))
+
+    def get_fundamentals(
+        self,
+        symbols: list[str],
+        metrics: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        self.calls["fundamentals"] += 1
+        self.metrics.append(list(metrics))
+        dates = pd.bdate_range(start_date, end_date, name="Date")
+        columns = pd.MultiIndex.from_product(
+            [symbols, metrics], names=["symbol", "metric"]
+        )
+        # 取得する指標の組み合わせに依存しないよう列ごとに固定シードで生成
+        data = {
+            column: np.random.default_rng(
+                zlib.crc32("/".join(column).encode())
+            ).uniform(1, 30, len(dates))
+            for column in columns
+        }
+        return pd.DataFrame(data, index=dates, columns=columns)
+
+    def get_market_cap(
+        self, symbols: list[str], start_date: datetime | str, end_date: datetime | str
+    ) -> pd.DataFrame:
+        self.calls["market_cap"] += 1
+        dates = pd.bdate_range(start_date, end_date, name="Date")
+        values = np.linspace(1e9, 5e9, len(symbols))[None, :].repeat(len(dates), 0)
+        return pd.DataFrame(values, index=dates, columns=pd.Index(symbols))
+
+
+class FailingFactor(Factor):
+    """常に失敗するテスト用ファクター。"""
+
+    name = "failing"
+    description = "Always fails"
+    category = FactorCategory.PRICE
+
+    def compute(
+        self,
+        provider: DataProvider,
+        universe: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        raise RuntimeError("boom")
+
+
+def _factors() -> dict[str, Factor]:
+    return {
+        "mom_12_1": MomentumFactor(lookback=63, skip_recent=5),
+        "mom_6_1": MomentumFactor(lookback=21, skip_recent=5),
+        "vol_20": VolatilityFactor(lookback=20),
+        "per": ValueFactor(metric="per"),
+        "quality": CompositeQualityFactor(metrics=["roe", "roa"]),
+        "size": SizeFactor(),
+    }
+
+
+class TestDataRequirementsOfFactors:
+    """Factor.data_requirements のテスト。"""
+
+    def test_正常系_価格ファクターは価格のみ必要(self) -> None:
+        assert MomentumFactor().data_requirements == DataRequirements(prices=True)
+
+    def test_正常系_ファンダメンタルズファクターは指標を列挙する(self) -> None:
+        assert ValueFactor(metric="pbr").data_requirements == DataRequirements(
+            fundamentals=frozenset({"pbr"})
+        )
+        assert CompositeQualityFactor(
+            metrics=["roe", "roa"]
+        ).data_requirements == DataRequirements(fundamentals=frozenset({"roe", "roa"}))
+
+    def test_正常系_SizeFactorは指標に応じたデータのみ必要(self) -> None:
+        assert SizeFactor().data_requirements == DataRequirements(market_cap=True)
+        assert SizeFactor(metric="revenue").data_requirements == DataRequirements(
+            fundamentals=frozenset({"revenue"})
+        )
+
+
+class TestBatchFactorEngine:
+    """BatchFactorEngine のテスト。"""
+
+    def test_正常系_各データセットを1回だけ取得する(self) -> None:
+        provider = CountingProvider()
+
+        result = BatchFactorEngine(provider).compute(_factors(), SYMBOLS, START, END)
+
+        assert isinstance(result, BatchComputeResult)
+        assert result.succeeded
+        assert provider.calls == Counter(prices=1, fundamentals=1, market_cap=1)
+        assert provider.metrics == [["per", "roa", "roe"]]
+        assert result.requirements.datasets == ["prices", "market_cap", "fundamentals"]
+
+    def test_正常系_個別計算と同じ結果を返す(self) -> None:
+        factors = _factors()
+
+        result = BatchFactorEngine(CountingProvider()).compute(
+            factors, SYMBOLS, START, END
+        )
+
+        assert sorted(result.values) == sorted(factors)
+        for key, factor in factors.items():
+            expected = factor.compute(CountingProvider(), SYMBOLS, START, END)
+            pd.testing.assert_frame_equal(
+                result.values[key], expected, check_names=False, check_freq=False
+            )
+
+    def test_正常系_プロセスプールでも同じ結果を返す(self) -> None:
+        factors = _factors()
+
+        sequential = BatchFactorEngine(CountingProvider()).compute(
+            factors, SYMBOLS, START, END
+        )
+        provider = CountingProvider()
+        parallel = BatchFactorEngine(provider, max_workers=2).compute(
+            factors, SYMBOLS, START, END
+        )
+
+        assert provider.calls == Counter(prices=1, fundamentals=1, market_cap=1)
+        for key in factors:
+            pd.testing.assert_frame_equal(
+                parallel.values[key], sequential.values[key], check_freq=False
+            )
+
+    def test_正常系_レジストリ名からファクターを解決する(self) -> None:
+        registry = FactorRegistry()
+        registry.register(MomentumFactor)
+        registry.register(VolatilityFactor)
+
+        result = BatchFactorEngine(CountingProvider(), registry=registry).compute(
+            ["momentum", "volatility"], SYMBOLS, START, END
+        )
+
+        assert sorted(result.values) == ["momentum", "volatility"]
+
+    def test_正常系_失敗したファクターはerrorsに記録される(self) -> None:
+        result = BatchFactorEngine(CountingProvider()).compute(
+            [MomentumFactor(), FailingFactor()], SYMBOLS, START, END
+        )
+
+        assert not result.succeeded
+        assert list(result.values) == ["momentum"]
+        assert result.errors == {"failing": "RuntimeError: boom"}
+
+    def test_異常系_名前が重複するとValidationError(self) -> None:
+        engine = BatchFactorEngine(CountingProvider())
+
+        with pytest.raises(ValidationError, match="duplicate factor key"):
+            engine.compute(
+                [MomentumFactor(lookback=42), MomentumFactor(lookback=63)],
+                SYMBOLS,
+                START,
+                END,
+            )
+
+    def test_異常系_空のファクターリストでValidationError(self) -> None:
+        with pytest.raises(ValidationError, match="must not be empty"):
+            BatchFactorEngine(CountingProvider()).compute([], SYMBOLS, START, END)
+
+    def test_異常系_未登録のファクター名でFactorNotFoundError(self) -> None:
+        engine = BatchFactorEngine(CountingProvider(), registry=FactorRegistry())
+
+        with pytest.raises(FactorNotFoundError):
+            engine.compute(["unknown"], SYMBOLS, START, END)
+
+    def test_異常系_max_workersが0でValidationError(self) -> None:
+        with pytest.raises(ValidationError, match="max_workers"):
+            BatchFactorEngine(CountingProvider(), max_workers=0)
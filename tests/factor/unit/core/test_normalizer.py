@@ -1,9 +1,10 @@
 """Unit tests for Normalizer class."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from factor.core.normalizer import Normalizer
+from factor.core.normalizer import NormalizeMethod, Normalizer
 from factor.errors import ValidationError
 
 
@@ -217,3 +218,150 @@ class TestNormalizeByGroup:
                 ["date"],
                 method="invalid_method",
             )
+
+
+class TestRowWiseNormalization:
+    """Tests for axis=1 (one cross-section per row)."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.normalizer = Normalizer(min_samples=3)
+        rng = np.random.default_rng(0)
+        self.panel = pd.DataFrame(
+            rng.normal(size=(6, 8)),
+            index=pd.date_range("2024-01-01", periods=6, name="Date"),
+            columns=pd.Index([f"S{i}" for i in range(8)]),
+        )
+        self.panel.iloc[1, :6] = np.nan  # too few samples in one row
+        self.panel.iloc[2, 3] = self.panel.iloc[2, 4]  # tie
+
+    @pytest.mark.parametrize(
+        ("method", "kwargs"),
+        [
+            ("zscore", {"robust": True}),
+            ("zscore", {"robust": False}),
+            ("percentile_rank", {}),
+            ("quintile_rank", {}),
+            ("winsorize", {"limits": (0.1, 0.1)}),
+        ],
+    )
+    def test_axis1_matches_per_row_series(
+        self, method: str, kwargs: dict[str, object]
+    ) -> None:
+        """Row-wise results equal normalizing each row as a Series."""
+        result = getattr(self.normalizer, method)(self.panel, axis=1, **kwargs)
+
+        expected = pd.DataFrame(
+            [
+                getattr(self.normalizer, method)(row, **kwargs)
+                for _, row in self.panel.iterrows()
+            ],
+            index=self.panel.index,
+        )
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_invalid_axis_raises_error(self) -> None:
+        """Invalid axis raises ValidationError."""
+        with pytest.raises(ValidationError):
+            self.normalizer.zscore(self.panel, axis=2)  # type: ignore[arg-type]
+
+
+class TestNormalizePanel:
+    """Tests for normalize_panel method."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.normalizer = Normalizer(min_samples=2)
+        rng = np.random.default_rng(1)
+        symbols = ["AAPL", "MSFT", "GOOGL", "JPM", "BAC", "XOM", "CVX", "NEW"]
+        self.panel = pd.DataFrame(
+            rng.normal(size=(5, len(symbols))),
+            index=pd.date_range("2024-01-01", periods=5, name="Date"),
+            columns=pd.Index(symbols),
+        )
+        self.sectors = pd.Series(
+            {
+                "AAPL": "Tech",
+                "MSFT": "Tech",
+                "GOOGL": "Tech",
+                "JPM": "Finance",
+                "BAC": "Finance",
+                "XOM": "Energy",
+                "CVX": "Energy",
+            }
+        )
+
+    def _expected(self, method: str, labels: pd.DataFrame) -> pd.DataFrame:
+        long = pd.DataFrame(
+            {
+                "Date": np.repeat(self.panel.index, self.panel.shape[1]),
+                "symbol": np.tile(self.panel.columns, self.panel.shape[0]),
+                "sector": labels.to_numpy().ravel(),
+                "value": self.panel.to_numpy().ravel(),
+            }
+        )
+        result = self.normalizer.normalize_by_group(
+            long, "value", ["Date", "sector"], method=method
+        )
+        return (
+            result.set_index(["Date", "symbol"])[f"value_{method}"]
+            .unstack()
+            .reindex(index=self.panel.index, columns=self.panel.columns)
+        )
+
+    @pytest.mark.parametrize(
+        "method", ["zscore", "percentile_rank", "quintile_rank", "winsorize"]
+    )
+    def test_sector_neutral_matches_normalize_by_group(
+        self, method: NormalizeMethod
+    ) -> None:
+        """Grouped panel equals per-(date, sector) normalize_by_group."""
+        result = self.normalizer.normalize_panel(
+            self.panel, method=method, groups=self.sectors
+        )
+
+        labels = pd.DataFrame(
+            np.tile(self.sectors.reindex(self.panel.columns).to_numpy(), (5, 1)),
+            index=self.panel.index,
+            columns=self.panel.columns,
+        )
+        pd.testing.assert_frame_equal(
+            result, self._expected(method, labels), check_dtype=False, check_names=False
+        )
+
+    def test_symbols_without_group_are_nan(self) -> None:
+        """Symbols missing from groups are NaN."""
+        result = self.normalizer.normalize_panel(self.panel, groups=self.sectors)
+
+        assert result.loc[:, "NEW"].isna().all()
+        assert result.drop(columns="NEW").notna().all().all()
+
+    def test_time_varying_groups(self) -> None:
+        """A DataFrame of groups assigns labels per date."""
+        labels = pd.DataFrame(
+            np.tile(self.sectors.reindex(self.panel.columns).to_numpy(), (5, 1)),
+            index=self.panel.index,
+            columns=self.panel.columns,
+        )
+        labels.iloc[3, 0] = "Finance"  # AAPL reclassified on one date
+
+        result = self.normalizer.normalize_panel(
+            self.panel, method="zscore", groups=labels
+        )
+
+        pd.testing.assert_frame_equal(
+            result, self._expected("zscore", labels), check_names=False
+        )
+
+    def test_without_groups_matches_axis1(self) -> None:
+        """No groups normalizes each date like zscore(axis=1)."""
+        result = self.normalizer.normalize_panel(self.panel, method="zscore")
+
+        pd.testing.assert_frame_equal(
+            result, self.normalizer.zscore(self.panel, axis=1)
+        )
+
+    def test_invalid_method_raises_error(self) -> None:
+        """Invalid method raises ValidationError."""
+        with pytest.raises(ValidationError):
+            self.normalizer.normalize_panel(self.panel, method="invalid")  # type: ignore[arg-type]
@@ -1,25 +1,36 @@
 """Unit tests for Cache class.
 
 Tests for providers/cache.py based on Issue #115 acceptance criteria:
-1. Generate file path from cache key
-2. TTL (Time To Live) based cache invalidation
-3. Save/load data in Parquet format
-4. Auto-create cache directory if not exists
+1. TTL (Time To Live) based cache invalidation
+2. Save/load data in Parquet format
+3. Auto-create cache directory if not exists
+4. Byte budget with LRU eviction
 """
 
-import os
+import sqlite3
 import time
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
-from factor.providers.cache import Cache
+from factor.providers.cache import CACHE_DB_FILENAME, Cache
 from utils_core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _expire(cache_dir: Path, key: str) -> None:
+    """Move the expiration time of a cache entry into the past."""
+    conn = sqlite3.connect(str(cache_dir / CACHE_DB_FILENAME))
+    conn.execute(
+        "UPDATE cache_entries SET expires_at = ? WHERE key = ?",
+        (time.time() - 3600, key),
+    )
+    conn.commit()
+    conn.close()
+
+
 @pytest.fixture
 def cache_dir(tmp_path: Path) -> Path:
     """Create a temporary cache directory.
@@ -113,45 +124,20 @@ class TestCacheInit:
 
         assert cache.cache_path == cache_dir
 
-
-class TestCacheKeyToPath:
-    """Tests for cache key to file path conversion."""
-
-    def test_正常系_キャッシュキーからファイルパスを生成できる(
-        self, cache: Cache, cache_dir: Path
+    def test_正常系_キャッシュディレクトリ内の既存ファイルを削除しない(
+        self, cache_dir: Path
     ) -> None:
-        """キャッシュキーから正しいファイルパスが生成されることを確認。"""
-        key = "test_key"
-
-        file_path = cache._key_to_path(key)
-
-        assert file_path.parent == cache_dir
-        assert file_path.suffix == ".parquet"
-        assert "test_key" in str(file_path)
-
-    def test_正常系_異なるキーで異なるパスが生成される(self, cache: Cache) -> None:
-        """異なるキーに対して異なるファイルパスが生成されることを確認。"""
-        path1 = cache._key_to_path("key1")
-        path2 = cache._key_to_path("key2")
-
-        assert path1 != path2
+        """旧レイアウトのファイルも含め、既存ファイルに触れないことを確認。"""
+        cache_dir.mkdir(parents=True)
+        legacy = cache_dir / "yfinance_AAPL_0123456789abcdef.parquet"
+        other = cache_dir / "prices.parquet"
+        pd.DataFrame({"a": [1]}).to_parquet(legacy)
+        pd.DataFrame({"a": [1]}).to_parquet(other)
 
-    def test_正常系_同じキーで同じパスが生成される(self, cache: Cache) -> None:
-        """同じキーに対して常に同じファイルパスが生成されることを確認。"""
-        path1 = cache._key_to_path("same_key")
-        path2 = cache._key_to_path("same_key")
-
-        assert path1 == path2
-
-    def test_正常系_特殊文字を含むキーでもパスが生成できる(self, cache: Cache) -> None:
-        """特殊文字を含むキーでもファイルパスが正しく生成されることを確認。"""
-        key = "stock/AAPL/2024-01-01"
-
-        file_path = cache._key_to_path(key)
+        Cache(cache_path=cache_dir, ttl_hours=24)
 
-        assert file_path.suffix == ".parquet"
-        # ファイルシステムで有効なパスになっていることを確認
-        assert "/" not in file_path.name or file_path.exists() is False
+        assert legacy.exists()
+        assert other.exists()
 
 
 class TestCacheSetAndGet:
@@ -242,10 +228,8 @@ class TestCacheTTL:
         key = "old_data"
         cache.set(key, sample_dataframe)
 
-        # ファイルの更新時刻を2時間前に変更
-        file_path = cache._key_to_path(key)
-        old_time = time.time() - 2 * 3600  # 2 hours ago
-        os.utime(file_path, (old_time, old_time))
+        # 有効期限を過去に変更
+        _expire(cache_dir, key)
 
         assert cache.is_valid(key) is False
 
@@ -257,10 +241,8 @@ class TestCacheTTL:
         key = "expired_data"
         cache.set(key, sample_dataframe)
 
-        # ファイルの更新時刻を2時間前に変更
-        file_path = cache._key_to_path(key)
-        old_time = time.time() - 2 * 3600
-        os.utime(file_path, (old_time, old_time))
+        # 有効期限を過去に変更
+        _expire(cache_dir, key)
 
         result = cache.get(key)
 
@@ -387,3 +369,25 @@ class TestCacheEdgeCases:
 
         assert result is not None
         assert len(result) == 5
+
+
+class TestCacheBudget:
+    """Tests for the byte budget."""
+
+    def test_正常系_容量超過で最も古く参照されたエントリが削除される(
+        self, cache_dir: Path, sample_dataframe: pd.DataFrame
+    ) -> None:
+        """max_bytesを超えると最も長く参照されていないエントリが削除されることを確認。"""
+        probe = Cache(cache_path=cache_dir / "probe", ttl_hours=24)
+        probe.set("probe", sample_dataframe)
+        entry_size = probe._store.stats().total_bytes
+
+        cache = Cache(cache_path=cache_dir, ttl_hours=24, max_bytes=entry_size * 2)
+        cache.set("a", sample_dataframe)
+        cache.set("b", sample_dataframe)
+        assert cache.get("a") is not None  # "b" becomes least recently used
+        cache.set("c", sample_dataframe)
+
+        assert cache.is_valid("a") is True
+        assert cache.is_valid("b") is False
+        assert cache.is_valid("c") is True
@@ -0,0 +1,200 @@
+"""Unit tests for FactorDataPanel and DataRequirements.
+
+このテストモジュールは、複数ファクターで共有するデータパネルを検証します。
+
+テスト対象:
+- DataRequirements: 必要データセットの和集合
+- FactorDataPanel: 一括ロードしたデータのスライス提供と派生データのキャッシュ
+"""
+
+import pickle
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from factor.errors import DataFetchError
+from factor.providers.base import DataProvider
+from factor.providers.panel import DataRequirements, FactorDataPanel
+
+SYMBOLS = ["AAPL", "GOOGL", "MSFT"]
+START = "2024-01-01"
+END = "2024-03-29"
+
+
+class CountingProvider:
+    """呼び出し回数を記録するDataProviderモック。"""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+
+    def _dates(self, start: datetime | str, end: datetime | str) -> pd.DatetimeIndex:
+        return pd.bdate_range(start, end, name="Date")
+
+    def get_prices(
+        self, symbols: list[str], start_date: datetime | str, end_date: datetime | str
+    ) -> pd.DataFrame:
+        self.calls["prices"] += 1
+        dates = self._dates(start_date, end_date)
+        rng = np.random.default_rng(0)
+        columns = pd.MultiIndex.from_product(
+            [symbols, ["Open", "High", "Low", "Close", "Volume"]],
+            names=["symbol", "price_type"],
+        )
+        data = 100 * np.exp(
+            np.cumsum(rng.normal(0, 0.01, (len(dates), len(columns))), 0)
+        )
+        return pd.DataFrame(data, index=dates, columns=columns)
+
+    def get_volumes(
+        self, symbols: list[str], start_date: datetime | str, end_date: datetime | str
+    ) -> pd.DataFrame:
+        self.calls["volumes"] += 1
+        dates = self._dates(start_date, end_date)
+        return pd.DataFrame(1e6, index=dates, columns=pd.Index(symbols))
+
+    def get_fundamentals(
+        self,
+        symbols: list[str],
+        metrics: list[str],
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> pd.DataFrame:
+        self.calls["fundamentals"] += 1
+        dates = self._dates(start_date, end_date)
+        columns = pd.MultiIndex.from_product(
+            [symbols, metrics], names=["symbol", "metric"]
+        )
+        return pd.DataFrame(
+            np.arange(len(columns), dtype=float)[None, :].repeat(len(dates), 0),
+            index=dates,
+            columns=columns,
+        )
+
+    def get_market_cap(
+        self, symbols: list[str], start_date: datetime | str, end_date: datetime | str
+    ) -> pd.DataFrame:
+        self.calls["market_cap"] += 1
+        dates = self._dates(start_date, end_date)
+        return pd.DataFrame(1e9, index=dates, columns=pd.Index(symbols))
+
+
+@pytest.fixture
+def provider() -> CountingProvider:
+    return CountingProvider()
+
+
+@pytest.fixture
+def panel(provider: CountingProvider) -> FactorDataPanel:
+    requirements = DataRequirements(
+        prices=True, market_cap=True, fundamentals=frozenset({"per", "roe"})
+    )
+    return FactorDataPanel.load(provider, requirements, SYMBOLS, START, END)
+
+
+class TestDataRequirements:
+    """DataRequirementsのテスト。"""
+
+    def test_正常系_和集合を取る(self) -> None:
+        a = DataRequirements(prices=True, fundamentals=frozenset({"per"}))
+        b = DataRequirements(market_cap=True, fundamentals=frozenset({"roe"}))
+
+        merged = a | b
+
+        assert merged == DataRequirements(
+            prices=True, market_cap=True, fundamentals=frozenset({"per", "roe"})
+        )
+        assert merged.datasets == ["prices", "market_cap", "fundamentals"]
+
+    def test_正常系_空の要件はデータセットなし(self) -> None:
+        assert DataRequirements().datasets == []
+
+
+class TestFactorDataPanel:
+    """FactorDataPanelのテスト。"""
+
+    def test_正常系_DataProviderプロトコルを満たす(
+        self, panel: FactorDataPanel
+    ) -> None:
+        assert isinstance(panel, DataProvider)
+
+    def test_正常系_必要なデータセットだけを1回ずつロードする(
+        self, provider: CountingProvider, panel: FactorDataPanel
+    ) -> None:
+        assert provider.calls == Counter(prices=1, market_cap=1, fundamentals=1)
+
+    def test_正常系_範囲内のリクエストは上流を呼ばない(
+        self, provider: CountingProvider, panel: FactorDataPanel
+    ) -> None:
+        full = panel.get_prices(SYMBOLS, START, END)
+        subset = panel.get_prices(["MSFT"], "2024-02-01", "2024-02-29")
+        fundamentals = panel.get_fundamentals(["AAPL"], ["roe"], START, END)
+        market_cap = panel.get_market_cap(["GOOGL", "AAPL"], START, END)
+
+        assert provider.calls == Counter(prices=1, market_cap=1, fundamentals=1)
+        assert full.shape == (65, 15)
+        assert subset.index.min() >= pd.Timestamp("2024-02-01")  # type: ignore[operator]
+        assert subset.index.max() <= pd.Timestamp("2024-02-29")  # type: ignore[operator]
+        assert set(subset.columns.get_level_values(0)) == {"MSFT"}
+        assert list(fundamentals.columns) == [("AAPL", "roe")]
+        assert list(market_cap.columns) == ["GOOGL", "AAPL"]
+
+    def test_正常系_範囲外のリクエストは上流に委譲する(
+        self, provider: CountingProvider, panel: FactorDataPanel
+    ) -> None:
+        panel.get_prices(["TSLA"], START, END)
+        panel.get_prices(SYMBOLS, "2023-01-01", END)
+        panel.get_fundamentals(SYMBOLS, ["pbr"], START, END)
+        panel.get_volumes(SYMBOLS, START, END)
+
+        assert provider.calls == Counter(
+            prices=3, market_cap=1, fundamentals=2, volumes=1
+        )
+
+    def test_正常系_終値と派生データをキャッシュする(
+        self, panel: FactorDataPanel
+    ) -> None:
+        close = panel.close_prices(SYMBOLS, START, END)
+        returns = panel.returns(SYMBOLS, START, END)
+        log_prices = panel.log_prices(SYMBOLS, START, END)
+
+        prices = panel.get_prices(SYMBOLS, START, END)
+        expected_close = pd.DataFrame(
+            {s: prices[(s, "Close")] for s in SYMBOLS}, index=prices.index
+        )
+        pd.testing.assert_frame_equal(close, expected_close, check_names=False)
+        pd.testing.assert_frame_equal(
+            returns, expected_close.pct_change(), check_names=False
+        )
+        pd.testing.assert_frame_equal(
+            log_prices, np.log(expected_close), check_names=False
+        )
+        assert panel.returns(SYMBOLS, START, END) is returns
+        assert panel.close_prices(SYMBOLS, START, END) is close
+
+    def test_正常系_存在しない銘柄の終値はNaN列になる(
+        self, provider: CountingProvider
+    ) -> None:
+        prices = provider.get_prices(["AAPL"], START, END)
+        panel = FactorDataPanel({"prices": prices}, ["AAPL", "ZZZZ"], START, END)
+
+        close = panel.close_prices(["AAPL", "ZZZZ"], START, END)
+
+        assert list(close.columns) == ["AAPL", "ZZZZ"]
+        assert close.loc[:, "ZZZZ"].isna().all()
+
+    def test_正常系_pickle時は上流プロバイダと派生データを含めない(
+        self, panel: FactorDataPanel
+    ) -> None:
+        panel.returns(SYMBOLS, START, END)
+
+        restored = pickle.loads(pickle.dumps(panel))
+
+        pd.testing.assert_frame_equal(
+            restored.get_prices(SYMBOLS, START, END),
+            panel.get_prices(SYMBOLS, START, END),
+        )
+        with pytest.raises(DataFetchError, match="outside the loaded"):
+            restored.get_volumes(SYMBOLS, START, END)
@@ -11,8 +11,12 @@ Tests for providers/yfinance.py based on Issue #116 acceptance criteria:
 8. Retry logic works
 9. DataFetchError is raised appropriately
 10. Logging is performed correctly
+11. Ticker info is fetched concurrently, cached per symbol, and partial
+    failures are reported
 """
 
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -23,7 +27,8 @@ import pytest
 
 from factor.errors import DataFetchError
 from factor.providers.base import DataProvider
-from factor.providers.yfinance import YFinanceProvider
+from factor.providers.yfinance import RATE_LIMIT_KEY, YFinanceProvider
+from utils_core.rate_limit import RateScheduler
 
 # ============================================================================
 # Fixtures
@@ -962,3 +967,149 @@ class TestYFinanceProviderEdgeCases:
         if ("TEST", "roa") in result.columns:
             # 欠損値が許容される
             pass
+
+
+# ============================================================================
+# TestYFinanceProviderConcurrentInfo - Concurrent Ticker Info Fetching
+# ============================================================================
+
+
+class TestYFinanceProviderConcurrentInfo:
+    """Tests for concurrent ticker info fetching."""
+
+    @staticmethod
+    def _ticker_factory(
+        infos: dict[str, dict[str, Any]],
+        calls: list[str],
+        delay: float = 0.0,
+    ) -> Any:
+        lock = threading.Lock()
+
+        def make_ticker(symbol: str) -> MagicMock:
+            with lock:
+                calls.append(symbol)
+            if delay:
+                time.sleep(delay)
+            if symbol not in infos:
+                raise ConnectionError(f"no data for {symbol}")
+            ticker = MagicMock()
+            ticker.info = infos[symbol]
+            return ticker
+
+        return make_ticker
+
+    @patch("factor.providers.yfinance.yf.Ticker")
+    def test_正常系_複数銘柄のinfoを並列に取得する(
+        self, mock_ticker_class: MagicMock, sample_dates: tuple[str, str]
+    ) -> None:
+        """max_workers分のスレッドで並列に取得され、逐次より速いことを確認。"""
+        symbols = [f"S{i:02d}" for i in range(16)]
+        infos = {s: {"trailingPE": float(i)} for i, s in enumerate(symbols)}
+        calls: list[str] = []
+        mock_ticker_class.side_effect = self._ticker_factory(infos, calls, 0.05)
+        provider = YFinanceProvider(max_workers=8, requests_per_second=None)
+
+        start = time.perf_counter()
+        result = provider.get_fundamentals(symbols, ["per"], *sample_dates)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 16 * 0.05 / 2
+        assert sorted(calls) == symbols
+        assert result[("S03", "per")].iloc[0] == 3.0
+
+    @patch("factor.providers.yfinance.yf.Ticker")
+    def test_正常系_同一銘柄のinfoは一度だけ取得される(
+        self, mock_ticker_class: MagicMock, sample_dates: tuple[str, str]
+    ) -> None:
+        """get_fundamentalsとget_market_capで同じinfoを再利用することを確認。"""
+        infos = {
+            "AAPL": {"trailingPE": 28.5, "priceToBook": 45.0, "marketCap": 3e12},
+            "MSFT": {"trailingPE": 35.0, "priceToBook": 12.0, "marketCap": 2.8e12},
+        }
+        calls: list[str] = []
+        mock_ticker_class.side_effect = self._ticker_factory(infos, calls)
+        provider = YFinanceProvider(requests_per_second=None)
+
+        provider.get_fundamentals(["AAPL", "MSFT"], ["per"], *sample_dates)
+        provider.get_fundamentals(["AAPL", "MSFT"], ["pbr"], *sample_dates)
+        market_cap = provider.get_market_cap(["AAPL", "MSFT"], *sample_dates)
+
+        assert sorted(calls) == ["AAPL", "MSFT"]
+        assert market_cap["MSFT"].iloc[0] == 2.8e12
+
+        provider.clear_info_cache()
+        provider.get_market_cap(["AAPL"], *sample_dates)
+        assert calls.count("AAPL") == 2
+
+    @patch("factor.providers.yfinance.yf.Ticker")
+    def test_異常系_一部銘柄の失敗はlast_failed_symbolsで報告される(
+        self, mock_ticker_class: MagicMock, sample_dates: tuple[str, str]
+    ) -> None:
+        """失敗した銘柄のみNaNとなり、失敗理由が記録されることを確認。"""
+        infos = {"AAPL": {"trailingPE": 28.5}}
+        calls: list[str] = []
+        mock_ticker_class.side_effect = self._ticker_factory(infos, calls)
+        provider = YFinanceProvider(
+            max_retries=2, retry_base_delay=0.0, requests_per_second=None
+        )
+
+        result = provider.get_fundamentals(["AAPL", "BAD"], ["per"], *sample_dates)
+
+        assert result[("AAPL", "per")].iloc[0] == 28.5
+        assert bool(result[("BAD", "per")].isna().all())
+        assert list(provider.last_failed_symbols) == ["BAD"]
+        assert "no data for BAD" in provider.last_failed_symbols["BAD"]
+        assert calls.count("BAD") == 2
+
+    def test_異常系_max_workersが0以下でValueError(self) -> None:
+        """max_workersが正でない場合にValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="max_workers"):
+            YFinanceProvider(max_workers=0)
+
+
+class TestRateLimit:
+    """Tests for rate limiting of ticker info requests."""
+
+    @patch("factor.providers.yfinance.get_rate_scheduler")
+    @patch("factor.providers.yfinance.yf.Ticker")
+    def test_正常系_共有スケジューラで間隔を空ける(
+        self,
+        mock_ticker_class: MagicMock,
+        mock_get_scheduler: MagicMock,
+        sample_dates: tuple[str, str],
+    ) -> None:
+        """infoの取得ごとに共有スケジューラの枠を予約することを確認。"""
+        mock_ticker_class.return_value.info = {"trailingPE": 20.0}
+        provider = YFinanceProvider(requests_per_second=4)
+
+        provider.get_fundamentals(["AAPL", "MSFT"], ["per"], *sample_dates)
+
+        scheduler = mock_get_scheduler.return_value
+        assert scheduler.acquire.call_count == 2
+        scheduler.acquire.assert_called_with(RATE_LIMIT_KEY, interval=0.25)
+
+    def test_正常系_スレッド間で最小間隔が守られる(self) -> None:
+        """複数スレッドから呼んでも全体のレートが上限以下になることを確認。"""
+        scheduler = RateScheduler()
+        timestamps: list[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            for _ in range(5):
+                scheduler.acquire(RATE_LIMIT_KEY, interval=0.02)
+                with lock:
+                    timestamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        timestamps.sort()
+        assert timestamps[-1] - timestamps[0] >= 19 * 0.02 * 0.9
+
+    def test_異常系_レートが0以下でValueError(self) -> None:
+        """requests_per_secondが正でない場合にValueErrorを確認。"""
+        with pytest.raises(ValueError, match="requests_per_second"):
+            YFinanceProvider(requests_per_second=0)
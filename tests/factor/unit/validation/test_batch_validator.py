@@ -0,0 +1,168 @@
+"""Unit tests for BatchFactorValidator class.
+
+BatchFactorValidator は複数ファクター・複数ホライズンの IC 分析と
+分位分析を 1 回の呼び出しでまとめて行うクラスで、
+結果は ICAnalyzer / QuantileAnalyzer と一致する。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from factor.errors import InsufficientDataError, ValidationError
+from factor.validation import (
+    BatchFactorValidator,
+    BatchValidationResult,
+    ICAnalyzer,
+    QuantileAnalyzer,
+)
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def prices() -> pd.DataFrame:
+    """30銘柄・80日分の価格データ。
+
+    Returns
+    -------
+    pd.DataFrame
+        日付をインデックス、銘柄をカラムとする価格のDataFrame
+    """
+    rng = np.random.default_rng(21)
+    dates = pd.date_range("2024-01-01", periods=80, freq="B")
+    symbols = [f"S{i:02d}" for i in range(30)]
+    returns = rng.normal(0.0005, 0.02, (80, 30))
+    return pd.DataFrame(
+        100 * np.cumprod(1 + returns, axis=0), index=dates, columns=pd.Index(symbols)
+    )
+
+
+@pytest.fixture
+def factors(prices: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """モメンタム・リバーサル・ノイズの3ファクター（一部欠損あり）。
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        ファクター名をキーとするファクター値
+    """
+    rng = np.random.default_rng(22)
+    momentum = prices.pct_change(5)
+    noise = pd.DataFrame(
+        rng.normal(size=prices.shape), index=prices.index, columns=prices.columns
+    )
+    noise.iloc[:, :3] = np.nan
+    return {"momentum": momentum, "reversal": -momentum, "noise": noise}
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestBatchFactorValidatorInit:
+    """初期化のテスト。"""
+
+    def test_異常系_不正なmethodでValidationError(self) -> None:
+        """不正な相関手法でValidationErrorが発生することを確認。"""
+        with pytest.raises(ValidationError):
+            BatchFactorValidator(method="kendall")  # type: ignore[arg-type]
+
+    def test_異常系_分位数が1以下でValidationError(self) -> None:
+        """分位数が2未満でValidationErrorが発生することを確認。"""
+        with pytest.raises(ValidationError):
+            BatchFactorValidator(n_quantiles=1)
+
+
+class TestBatchFactorValidatorValidate:
+    """validate メソッドのテスト。"""
+
+    @pytest.mark.parametrize("method", ["spearman", "pearson"])
+    def test_正常系_ICがICAnalyzerと一致する(
+        self,
+        prices: pd.DataFrame,
+        factors: dict[str, pd.DataFrame],
+        method: str,
+    ) -> None:
+        """全ファクター・全ホライズンのIC系列と統計量がICAnalyzerと一致することを確認。"""
+        forward_returns = BatchFactorValidator.compute_forward_returns(prices, [1, 5])
+
+        result = BatchFactorValidator(method=method).validate(  # type: ignore[arg-type]
+            factors, forward_returns
+        )
+
+        assert isinstance(result, BatchValidationResult)
+        analyzer = ICAnalyzer(method=method)  # type: ignore[arg-type]
+        for name, values in factors.items():
+            for horizon, returns in forward_returns.items():
+                expected = analyzer.analyze(values, returns)
+                pd.testing.assert_series_equal(
+                    result.ic[(name, horizon)],
+                    expected.ic_series,
+                    check_names=False,
+                    atol=1e-12,
+                )
+                summary = result.ic_summary.loc[(name, horizon)]
+                assert summary["mean_ic"] == pytest.approx(expected.mean_ic)
+                assert summary["ir"] == pytest.approx(expected.ir)
+                assert summary["p_value"] == pytest.approx(expected.p_value, abs=1e-12)
+                assert summary["n_periods"] == expected.n_periods
+
+    def test_正常系_分位分析がQuantileAnalyzerと一致する(
+        self, prices: pd.DataFrame, factors: dict[str, pd.DataFrame]
+    ) -> None:
+        """分位別リターン・LongShort・単調性スコアがQuantileAnalyzerと一致することを確認。"""
+        forward_returns = BatchFactorValidator.compute_forward_returns(prices, [1, 5])
+
+        result = BatchFactorValidator(n_quantiles=4).validate(factors, forward_returns)
+
+        analyzer = QuantileAnalyzer(n_quantiles=4)
+        for name, values in factors.items():
+            for horizon, returns in forward_returns.items():
+                expected = analyzer.analyze(values, returns)
+                actual = result.quantile_returns.loc[(name, horizon)]
+                pd.testing.assert_frame_equal(
+                    actual,
+                    expected.quantile_returns,
+                    check_names=False,
+                    check_freq=False,
+                    atol=1e-12,
+                )
+                summary = result.quantile_summary.loc[(name, horizon)]
+                assert summary["long_short_return"] == pytest.approx(
+                    expected.long_short_return
+                )
+                assert summary["monotonicity_score"] == pytest.approx(
+                    expected.monotonicity_score
+                )
+
+    def test_正常系_単一のリターンDataFrameも受け付ける(
+        self, prices: pd.DataFrame, factors: dict[str, pd.DataFrame]
+    ) -> None:
+        """リターンをDataFrameで渡した場合はホライズン1として扱うことを確認。"""
+        returns = ICAnalyzer.compute_forward_returns(prices, periods=1)
+
+        result = BatchFactorValidator().validate(factors, returns)
+
+        assert list(result.ic.columns) == [
+            ("momentum", 1),
+            ("reversal", 1),
+            ("noise", 1),
+        ]
+
+    def test_異常系_共通銘柄が不足でInsufficientDataError(
+        self, prices: pd.DataFrame, factors: dict[str, pd.DataFrame]
+    ) -> None:
+        """共通銘柄が5未満の場合にInsufficientDataErrorが発生することを確認。"""
+        returns = prices.iloc[:, :3].pct_change()
+
+        with pytest.raises(InsufficientDataError):
+            BatchFactorValidator().validate(factors, returns)
+
+    def test_異常系_ファクターが空でValidationError(self, prices: pd.DataFrame) -> None:
+        """ファクターが空の場合にValidationErrorが発生することを確認。"""
+        with pytest.raises(ValidationError):
+            BatchFactorValidator().validate({}, prices.pct_change())
@@ -0,0 +1,197 @@
+"""Unit tests for cross-sectional validation kernels.
+
+cross_section モジュールは日付×銘柄パネル全体を一括で処理する
+ランク付け・IC・分位割り当て・分位別リターン集計の関数を提供する。
+"""
+
+from typing import Literal, cast
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from factor.validation.cross_section import (
+    assign_quantile_buckets,
+    cross_sectional_ic,
+    quantile_mean_returns,
+    rank_cross_section,
+)
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def panel() -> tuple[np.ndarray, np.ndarray]:
+    """欠損値と同順位を含むファクター値とリターンのパネル（60日×40銘柄）。
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (ファクター値, フォワードリターン)
+    """
+    rng = np.random.default_rng(11)
+    factors = rng.normal(size=(60, 40))
+    returns = 0.3 * factors + rng.normal(size=(60, 40))
+    factors[rng.random((60, 40)) < 0.2] = np.nan
+    returns[rng.random((60, 40)) < 0.1] = np.nan
+    factors[3] = np.round(factors[3])
+    return factors, returns
+
+
+# =============================================================================
+# rank_cross_section
+# =============================================================================
+
+
+class TestRankCrossSection:
+    """rank_cross_section のテスト。"""
+
+    @pytest.mark.parametrize("method", ["average", "min"])
+    def test_正常系_pandasのrankと一致する(
+        self,
+        panel: tuple[np.ndarray, np.ndarray],
+        method: Literal["average", "min"],
+    ) -> None:
+        """同順位・欠損値を含めてDataFrame.rank(axis=1)と一致することを確認。"""
+        factors, _ = panel
+
+        ranks = rank_cross_section(factors, method=method)
+        expected = pd.DataFrame(factors).rank(axis=1, method=method).to_numpy()
+
+        np.testing.assert_array_equal(ranks, expected)
+
+    def test_エッジケース_全て欠損の行はNaN(self) -> None:
+        """全て欠損の行はNaNのまま返されることを確認。"""
+        ranks = rank_cross_section(np.full((2, 3), np.nan))
+
+        assert np.isnan(ranks).all()
+
+
+# =============================================================================
+# cross_sectional_ic
+# =============================================================================
+
+
+class TestCrossSectionalIC:
+    """cross_sectional_ic のテスト。"""
+
+    @pytest.mark.parametrize(
+        ("method", "reference"),
+        [("spearman", stats.spearmanr), ("pearson", stats.pearsonr)],
+    )
+    def test_正常系_日付ごとのscipy計算と一致する(
+        self,
+        panel: tuple[np.ndarray, np.ndarray],
+        method: str,
+        reference: object,
+    ) -> None:
+        """全日付のICが日付ごとのscipy相関と一致することを確認。"""
+        factors, returns = panel
+
+        ic = cross_sectional_ic(factors, returns, method=method)  # type: ignore[arg-type]
+
+        for t in range(len(factors)):
+            paired = ~np.isnan(factors[t]) & ~np.isnan(returns[t])
+            expected = reference(factors[t][paired], returns[t][paired]).statistic  # type: ignore[operator]
+            assert ic[t] == pytest.approx(expected, abs=1e-12)
+
+    def test_正常系_複数ファクターを一括計算できる(
+        self, panel: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """(ファクター, 日付, 銘柄)の3次元入力で各ファクターのICを返すことを確認。"""
+        factors, returns = panel
+        stacked = np.stack([factors, -factors])
+
+        ic = cross_sectional_ic(stacked, returns[np.newaxis])
+
+        assert ic.shape == (2, 60)
+        np.testing.assert_allclose(ic[1], -ic[0], atol=1e-12)
+
+    def test_エッジケース_銘柄数不足と定数値はNaN(self) -> None:
+        """有効銘柄が5未満の日と定数ファクターの日はNaNになることを確認。"""
+        factors = np.array(
+            [
+                [1.0, 2.0, 3.0, np.nan, np.nan, np.nan],
+                [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+                [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            ]
+        )
+        returns = np.array([[0.1, 0.2, 0.3, 0.4, 0.5, 0.6]] * 3)
+
+        ic = cross_sectional_ic(factors, returns)
+
+        assert np.isnan(ic[0])
+        assert np.isnan(ic[1])
+        assert ic[2] == pytest.approx(1.0)
+
+
+# =============================================================================
+# assign_quantile_buckets / quantile_mean_returns
+# =============================================================================
+
+
+class TestAssignQuantileBuckets:
+    """assign_quantile_buckets のテスト。"""
+
+    @pytest.mark.parametrize("n_quantiles", [2, 4, 5])
+    def test_正常系_qcutと同じ分位になる(self, n_quantiles: int) -> None:
+        """重複のない値ではpd.qcutと同じ分位番号になることを確認。"""
+        rng = np.random.default_rng(5)
+        factors = rng.normal(size=(30, 41))
+        factors[rng.random((30, 41)) < 0.2] = np.nan
+
+        buckets = assign_quantile_buckets(factors, n_quantiles)
+
+        for t in range(len(factors)):
+            valid = pd.Series(factors[t]).dropna()
+            expected = (
+                cast("pd.Series", pd.qcut(valid, q=n_quantiles, labels=False)) + 1
+            )
+            np.testing.assert_array_equal(buckets[t][valid.index], expected)
+            assert np.isnan(buckets[t][np.isnan(factors[t])]).all()
+
+    def test_エッジケース_同値は同じ分位になる(self) -> None:
+        """同値の銘柄が同じ分位に割り当てられることを確認。"""
+        factors = np.array([[1.0, 1.0, 1.0, 1.0, 2.0, 3.0]])
+
+        buckets = assign_quantile_buckets(factors, 3)
+
+        np.testing.assert_array_equal(buckets, [[1.0, 1.0, 1.0, 1.0, 3.0, 3.0]])
+
+    def test_エッジケース_有効値が2未満の行はNaN(self) -> None:
+        """有効値が1つ以下の行は全てNaNになることを確認。"""
+        factors = np.array([[np.nan, 1.0, np.nan], [1.0, 2.0, 3.0]])
+
+        buckets = assign_quantile_buckets(factors, 5)
+
+        assert np.isnan(buckets[0]).all()
+        # 有効値が3つなら3分位
+        np.testing.assert_array_equal(buckets[1], [1.0, 2.0, 3.0])
+
+
+class TestQuantileMeanReturns:
+    """quantile_mean_returns のテスト。"""
+
+    def test_正常系_日付と分位ごとの平均リターン(self) -> None:
+        """各日付・分位の平均リターンを返し、該当銘柄がない分位はNaNになることを確認。"""
+        buckets = np.array([[1.0, 1.0, 2.0, np.nan], [2.0, 2.0, 2.0, 1.0]])
+        returns = np.array([[0.01, 0.03, 0.05, 0.07], [0.02, np.nan, 0.04, 0.06]])
+
+        means = quantile_mean_returns(buckets, returns, n_quantiles=3)
+
+        np.testing.assert_allclose(
+            means,
+            [[0.02, 0.05, np.nan], [0.06, 0.03, np.nan]],
+        )
+
+    def test_エッジケース_範囲外の分位番号は無視される(self) -> None:
+        """1..n_quantiles 以外の分位番号が他の日付の平均に混ざらないことを確認。"""
+        buckets = np.array([[1.0, 3.0, 0.0], [1.0, 2.0, 2.0]])
+        returns = np.array([[0.01, 0.50, 0.70], [0.02, 0.04, 0.06]])
+
+        means = quantile_mean_returns(buckets, returns, n_quantiles=2)
+
+        np.testing.assert_allclose(means, [[0.01, np.nan], [0.02, 0.05]])
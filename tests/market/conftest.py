@@ -21,6 +21,7 @@ from market.types import (
     DataSource,
     MarketDataResult,
 )
+from utils_core.rate_limit import get_rate_scheduler
 
 # Check if blpapi is available
 try:
@@ -74,6 +75,14 @@ def reset_environment(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv(var, raising=False)
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_scheduler() -> Iterator[None]:
+    """Reset the shared request scheduler so slots do not leak between tests."""
+    get_rate_scheduler().reset()
+    yield
+    get_rate_scheduler().reset()
+
+
 @pytest.fixture
 def capture_logs(caplog: pytest.LogCaptureFixture) -> pytest.LogCaptureFixture:
     """Capture logs for testing with proper level."""
@@ -361,10 +361,14 @@ class TestNavigate:
             mixin = ETFComBrowserMixin(config=config)
             await mixin._ensure_browser()
             await mixin._navigate("https://www.etf.com/SPY")
+            # 最初のナビゲーションは待機しない
+            mock_sleep.assert_not_awaited()
+
+            await mixin._navigate("https://www.etf.com/VOO")
 
             mock_sleep.assert_awaited_once()
             actual_delay = mock_sleep.call_args[0][0]
-            assert actual_delay >= 2.0
+            assert actual_delay == pytest.approx(2.0, abs=0.05)
 
     @pytest.mark.asyncio
     async def test_異常系_タイムアウト時にETFComTimeoutError(self) -> None:
@@ -51,6 +51,7 @@ from market.etfcom.constants import (
 from market.etfcom.errors import ETFComBlockedError
 from market.etfcom.session import ETFComSession
 from market.etfcom.types import RetryConfig, ScrapingConfig
+from utils_core.rate_limit import RateScheduler
 
 # =============================================================================
 # Initialization tests
@@ -174,11 +175,39 @@ class TestETFComSessionGet:
                 patch("market.etfcom.session.random.uniform", return_value=0.5),
             ):
                 session = ETFComSession(config=config)
+                session.get("https://www.etf.com/SPY")
+                # 最初のリクエストは待機しない
+                mock_sleep.assert_not_called()
+
                 session.get("https://www.etf.com/SPY")
 
                 mock_sleep.assert_called_once()
                 actual_delay = mock_sleep.call_args[0][0]
-                assert actual_delay == pytest.approx(2.5, abs=0.01)
+                assert actual_delay == pytest.approx(2.5, abs=0.05)
+
+    def test_正常系_ホストごとに独立したスケジュールで待機する(self) -> None:
+        """別ホストへのリクエストは互いの間隔に影響しないこと。"""
+        now = [0.0]
+        scheduler = RateScheduler(clock=lambda: now[0])
+        config = ScrapingConfig(polite_delay=2.0, delay_jitter=0.0)
+
+        with patch("market.etfcom.session.curl_requests") as mock_curl:
+            mock_session = MagicMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_session.request.return_value = mock_response
+            mock_curl.Session.return_value = mock_session
+
+            with patch("market.etfcom.session.time.sleep") as mock_sleep:
+                session = ETFComSession(config=config, scheduler=scheduler)
+                session.get("https://www.etf.com/SPY")
+                session.post("https://api-prod.etf.com/private/apps/fundflows/test")
+                now[0] += 0.5
+                session.get("https://www.etf.com/VOO")
+
+            mock_sleep.assert_called_once_with(pytest.approx(1.5))
+            assert scheduler.stats("www.etf.com").requests == 2
+            assert scheduler.stats("api-prod.etf.com").requests == 1
 
     def test_正常系_User_Agentヘッダーが設定される(self) -> None:
         """ランダムな User-Agent がヘッダーに設定されること。"""
@@ -574,11 +603,15 @@ class TestRequest:
                 patch("market.etfcom.session.random.uniform", return_value=0.5),
             ):
                 session = ETFComSession(config=config)
+                session._request("GET", "https://www.etf.com/SPY")
+                # 最初のリクエストは待機しない
+                mock_sleep.assert_not_called()
+
                 session._request("GET", "https://www.etf.com/SPY")
 
                 mock_sleep.assert_called_once()
                 actual_delay = mock_sleep.call_args[0][0]
-                assert actual_delay == pytest.approx(2.5, abs=0.01)
+                assert actual_delay == pytest.approx(2.5, abs=0.05)
 
     def test_正常系_User_Agentヘッダーが設定される(self) -> None:
         """_request() でランダム User-Agent がヘッダーに設定されること。"""
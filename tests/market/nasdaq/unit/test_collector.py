@@ -285,16 +285,16 @@ class TestFetchByCategory:
         for key, df in result.items():
             assert isinstance(df, pd.DataFrame)
 
-    def test_正常系_ポライトディレイ挿入確認(self) -> None:
-        """リクエスト間にポライトディレイが挿入されること。"""
+    def test_正常系_コレクター側では追加の待機をしない(self) -> None:
+        """リクエスト間隔はセッションのスケジューラーに任せ、二重に待機しないこと。"""
         mock_session = _make_mock_session()
         collector = ScreenerCollector(session=mock_session)
 
-        with patch("market.nasdaq.collector.time.sleep") as mock_sleep:
+        with patch("time.sleep") as mock_sleep:
             collector.fetch_by_category(Exchange)
 
-        # There should be sleep calls between requests (n-1 sleeps for n requests)
-        assert mock_sleep.call_count >= len(Exchange) - 1
+        mock_sleep.assert_not_called()
+        assert mock_session.get_with_retry.call_count == len(Exchange)
 
     def test_異常系_fetch_by_categoryで一部失敗時に即座に例外伝播(self) -> None:
         """fetch_by_category() 内で一部の fetch() が失敗した場合、即座に例外が伝播すること。
@@ -318,10 +318,7 @@ class TestFetchByCategory:
         ]
         collector = ScreenerCollector(session=mock_session)
 
-        with (
-            patch("market.nasdaq.collector.time.sleep"),
-            pytest.raises(NasdaqAPIError, match="HTTP 500"),
-        ):
+        with pytest.raises(NasdaqAPIError, match="HTTP 500"):
             collector.fetch_by_category(Exchange)
 
 
@@ -11,6 +11,7 @@ Test TODO List:
 - [x] Bot-blocking: DEFAULT_USER_AGENTS count, Mozilla prefix, uniqueness
 - [x] Bot-blocking: BROWSER_IMPERSONATE_TARGETS count and non-empty
 - [x] Bot-blocking: DEFAULT_POLITE_DELAY, DEFAULT_TIMEOUT, DEFAULT_DELAY_JITTER values
+- [x] Bot-blocking: DEFAULT_BURST value
 - [x] Headers: DEFAULT_HEADERS required keys and values
 - [x] Output: DEFAULT_OUTPUT_DIR format
 - [x] Column mapping: COLUMN_NAME_MAP keys and values
@@ -22,6 +23,7 @@ from typing import get_type_hints
 from market.nasdaq.constants import (
     BROWSER_IMPERSONATE_TARGETS,
     COLUMN_NAME_MAP,
+    DEFAULT_BURST,
     DEFAULT_DELAY_JITTER,
     DEFAULT_HEADERS,
     DEFAULT_OUTPUT_DIR,
@@ -60,9 +62,9 @@ class TestModuleExports:
                 f"{name} is not defined in constants module"
             )
 
-    def test_正常系_allが10項目を含む(self) -> None:
-        """__all__ が全10定数をエクスポートしていること。"""
-        assert len(__all__) == 10
+    def test_正常系_allが11項目を含む(self) -> None:
+        """__all__ が全11定数をエクスポートしていること。"""
+        assert len(__all__) == 11
 
     def test_正常系_モジュールDocstringが存在する(self) -> None:
         """モジュールの docstring が存在すること。"""
@@ -163,6 +165,11 @@ class TestBotBlockingConstants:
         assert DEFAULT_DELAY_JITTER > 0
         assert DEFAULT_DELAY_JITTER == 0.5
 
+    def test_正常系_DEFAULT_BURSTが1(self) -> None:
+        """DEFAULT_BURST が 1 (連続リクエストを許可しない) であること。"""
+        assert isinstance(DEFAULT_BURST, int)
+        assert DEFAULT_BURST == 1
+
 
 # =============================================================================
 # HTTP Headers constants
@@ -10,6 +10,8 @@ Test TODO List:
 - [x] NasdaqSession: context manager プロトコル
 - [x] NasdaqSession: 例外発生時も close が呼ばれる
 - [x] get(): ポライトディレイ + ジッター適用
+- [x] get(): 経過済みの時間を差し引いた残りだけ待機する
+- [x] get(): セッションインスタンス間でスケジュールを共有する
 - [x] get(): ランダム User-Agent ヘッダー設定
 - [x] get(): デフォルトヘッダーが含まれる
 - [x] get(): params が curl_cffi に渡される
@@ -47,6 +49,7 @@ from market.nasdaq.constants import (
 from market.nasdaq.errors import NasdaqRateLimitError
 from market.nasdaq.session import NasdaqSession
 from market.nasdaq.types import NasdaqConfig, RetryConfig
+from utils_core.rate_limit import RateScheduler
 
 # =============================================================================
 # Initialization tests
@@ -155,7 +158,7 @@ class TestNasdaqSessionGet:
             assert response.status_code == 200
 
     def test_正常系_ポライトディレイが適用される(self) -> None:
-        """polite_delay + ジッターが適用されること。"""
+        """連続リクエストの間に polite_delay + ジッターが適用されること。"""
         config = NasdaqConfig(polite_delay=2.0, delay_jitter=1.0)
 
         with patch("market.nasdaq.session.curl_requests") as mock_curl:
@@ -170,11 +173,63 @@ class TestNasdaqSessionGet:
                 patch("market.nasdaq.session.random.uniform", return_value=0.5),
             ):
                 session = NasdaqSession(config=config)
+                session.get(NASDAQ_SCREENER_URL)
+                # 最初のリクエストは待機しない
+                mock_sleep.assert_not_called()
+
                 session.get(NASDAQ_SCREENER_URL)
 
                 mock_sleep.assert_called_once()
                 actual_delay = mock_sleep.call_args[0][0]
-                assert actual_delay == pytest.approx(2.5, abs=0.01)
+                assert actual_delay == pytest.approx(2.5, abs=0.05)
+
+    def test_正常系_経過済みの時間を差し引いた残りだけ待機する(self) -> None:
+        """前回リクエストからの経過時間分だけ待機時間が短くなること。"""
+        now = [100.0]
+        scheduler = RateScheduler(clock=lambda: now[0])
+        config = NasdaqConfig(polite_delay=2.0, delay_jitter=0.0)
+
+        with patch("market.nasdaq.session.curl_requests") as mock_curl:
+            mock_session = MagicMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_session.request.return_value = mock_response
+            mock_curl.Session.return_value = mock_session
+
+            with patch("market.nasdaq.session.time.sleep") as mock_sleep:
+                session = NasdaqSession(config=config, scheduler=scheduler)
+                session.get(NASDAQ_SCREENER_URL)
+                now[0] += 1.5  # レスポンス処理に 1.5 秒かかった
+                session.get(NASDAQ_SCREENER_URL)
+                now[0] += 3.0  # 間隔以上空いた
+                session.get(NASDAQ_SCREENER_URL)
+
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args[0][0] == pytest.approx(0.5)
+
+    def test_正常系_セッションインスタンス間でスケジュールを共有する(self) -> None:
+        """別インスタンスのセッションでも同じホストの間隔が守られること。"""
+        now = [0.0]
+        scheduler = RateScheduler(clock=lambda: now[0])
+        config = NasdaqConfig(polite_delay=1.0, delay_jitter=0.0)
+
+        with patch("market.nasdaq.session.curl_requests") as mock_curl:
+            mock_session = MagicMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_session.request.return_value = mock_response
+            mock_curl.Session.return_value = mock_session
+
+            with patch("market.nasdaq.session.time.sleep") as mock_sleep:
+                NasdaqSession(config=config, scheduler=scheduler).get(
+                    NASDAQ_SCREENER_URL
+                )
+                NasdaqSession(config=config, scheduler=scheduler).get(
+                    NASDAQ_SCREENER_URL
+                )
+
+            mock_sleep.assert_called_once_with(pytest.approx(1.0))
+            assert scheduler.stats("api.nasdaq.com").requests == 2
 
     def test_正常系_User_Agentヘッダーが設定される(self) -> None:
         """ランダムな User-Agent がヘッダーに設定されること。"""
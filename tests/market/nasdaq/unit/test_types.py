@@ -399,6 +399,14 @@ class TestNasdaqConfig:
         ):
             NasdaqConfig(delay_jitter=31.0)
 
+    def test_異常系_burstが範囲外でValueError(self) -> None:
+        """burst が範囲外の場合 ValueError が発生すること。"""
+        assert NasdaqConfig(burst=10).burst == 10
+        with pytest.raises(ValueError, match="burst must be between 1 and 10"):
+            NasdaqConfig(burst=0)
+        with pytest.raises(ValueError, match="burst must be between 1 and 10"):
+            NasdaqConfig(burst=11)
+
 
 # =============================================================================
 # RetryConfig dataclass
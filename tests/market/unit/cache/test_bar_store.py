@@ -0,0 +1,384 @@
+"""Tests for market.cache.bar_store module.
+
+テスト対象:
+- merge_ranges / subtract_ranges: 半開区間の結合と差分
+- BarStore: 期間カバレッジ付き OHLCV ストア
+- YFinanceFetcher(bar_store=...): 不足期間のみの取得
+"""
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from market.cache import BarStore, create_persistent_bar_store
+from market.cache.bar_store import merge_ranges, subtract_ranges
+from market.yfinance import FetchOptions, YFinanceFetcher
+
+
+def _ts(value: str) -> pd.Timestamp:
+    return cast("pd.Timestamp", pd.Timestamp(value))
+
+
+def _bars(start: str, end: str) -> pd.DataFrame:
+    """Create daily OHLCV bars for business days in [start, end)."""
+    index = pd.bdate_range(start=start, end=end, inclusive="left")
+    n = len(index)
+    return pd.DataFrame(
+        {
+            "open": [100.0 + i for i in range(n)],
+            "high": [101.0 + i for i in range(n)],
+            "low": [99.0 + i for i in range(n)],
+            "close": [100.5 + i for i in range(n)],
+            "volume": [1_000_000.0] * n,
+        },
+        index=index,
+    )
+
+
+def _download_frame(symbols: list[str], start: str, end: str) -> pd.DataFrame:
+    """Create a yf.download-style MultiIndex frame."""
+    bars = _bars(start, end)
+    frames = {
+        (col.capitalize(), symbol): bars[col] for symbol in symbols for col in bars
+    }
+    return pd.DataFrame(frames)
+
+
+class TestRangeHelpers:
+    """merge_ranges / subtract_ranges のテスト。"""
+
+    def test_正常系_重複と隣接区間が結合される(self) -> None:
+        merged = merge_ranges(
+            [
+                (_ts("2024-03-01"), _ts("2024-04-01")),
+                (_ts("2024-01-01"), _ts("2024-02-01")),
+                (_ts("2024-02-01"), _ts("2024-02-15")),
+            ]
+        )
+        assert merged == [
+            (_ts("2024-01-01"), _ts("2024-02-15")),
+            (_ts("2024-03-01"), _ts("2024-04-01")),
+        ]
+
+    def test_正常系_カバー済み区間を除いた不足区間を返す(self) -> None:
+        gaps = subtract_ranges(
+            (_ts("2024-01-01"), _ts("2024-12-31")),
+            [(_ts("2024-03-01"), _ts("2024-06-01"))],
+        )
+        assert gaps == [
+            (_ts("2024-01-01"), _ts("2024-03-01")),
+            (_ts("2024-06-01"), _ts("2024-12-31")),
+        ]
+
+    def test_エッジケース_完全にカバーされていれば空(self) -> None:
+        gaps = subtract_ranges(
+            (_ts("2023-01-01"), _ts("2024-01-01")),
+            [(_ts("2020-01-01"), _ts("2025-01-01"))],
+        )
+        assert gaps == []
+
+
+class TestBarStore:
+    """BarStore クラスのテスト。"""
+
+    @pytest.fixture
+    def store(self) -> Generator[BarStore, None, None]:
+        store = BarStore()
+        yield store
+        store.close()
+
+    def test_正常系_未保存シンボルは全期間が不足(self, store: BarStore) -> None:
+        gaps = store.missing_ranges("AAPL", "2020-01-01", "2025-01-01")
+        assert gaps == [(_ts("2020-01-01"), _ts("2025-01-01"))]
+
+    def test_正常系_保存済み期間の部分範囲をローカルで返す(
+        self, store: BarStore
+    ) -> None:
+        store.write(
+            "AAPL", _bars("2020-01-01", "2025-01-01"), "2020-01-01", "2025-01-01"
+        )
+
+        assert store.missing_ranges("AAPL", "2023-01-01", "2024-01-01") == []
+        df = store.read("AAPL", "2023-01-01", "2024-01-01")
+        assert (df.index >= _ts("2023-01-01")).all()
+        assert (df.index < _ts("2024-01-01")).all()
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+
+    def test_正常系_延長リクエストは末尾の不足分のみ(self, store: BarStore) -> None:
+        store.write(
+            "AAPL", _bars("2024-01-01", "2024-06-01"), "2024-01-01", "2024-06-01"
+        )
+
+        gaps = store.missing_ranges("AAPL", "2024-03-01", "2024-09-01")
+        assert gaps == [(_ts("2024-06-01"), _ts("2024-09-01"))]
+
+    def test_正常系_隣接する書き込みでカバレッジが結合される(
+        self, store: BarStore
+    ) -> None:
+        store.write(
+            "AAPL", _bars("2024-01-01", "2024-02-01"), "2024-01-01", "2024-02-01"
+        )
+        store.write(
+            "AAPL", _bars("2024-02-01", "2024-03-01"), "2024-02-01", "2024-03-01"
+        )
+
+        assert store.coverage("AAPL") == [(_ts("2024-01-01"), _ts("2024-03-01"))]
+
+    def test_正常系_シンボルとインターバルごとに独立(self, store: BarStore) -> None:
+        store.write(
+            "AAPL", _bars("2024-01-01", "2024-02-01"), "2024-01-01", "2024-02-01"
+        )
+
+        assert store.missing_ranges("aapl", "2024-01-01", "2024-02-01") == []
+        assert store.missing_ranges("MSFT", "2024-01-01", "2024-02-01") != []
+        assert (
+            store.missing_ranges("AAPL", "2024-01-01", "2024-02-01", interval="1wk")
+            != []
+        )
+
+    def test_正常系_同一日時のバーは上書きされる(self, store: BarStore) -> None:
+        bars = _bars("2024-01-01", "2024-01-06")
+        store.write("AAPL", bars, "2024-01-01", "2024-01-06")
+        updated = bars.copy()
+        updated["close"] = 999.0
+        store.write("AAPL", updated, "2024-01-01", "2024-01-06")
+
+        df = store.read("AAPL")
+        assert len(df) == len(bars)
+        assert (df["close"] == 999.0).all()
+
+    def test_正常系_last_barが最新日時を返す(self, store: BarStore) -> None:
+        assert store.last_bar("AAPL") is None
+        store.write(
+            "AAPL", _bars("2024-01-01", "2024-01-06"), "2024-01-01", "2024-01-06"
+        )
+        assert store.last_bar("AAPL") == _ts("2024-01-05")
+
+    def test_正常系_タイムゾーン付きインデックスを保存できる(
+        self, store: BarStore
+    ) -> None:
+        bars = _bars("2024-01-01", "2024-01-06")
+        bars.index = bars.index.tz_localize("America/New_York")
+        store.write("AAPL", bars, "2024-01-01", "2024-01-06")
+
+        df = store.read("AAPL", "2024-01-01", "2024-01-06")
+        assert len(df) == len(bars)
+        assert df.index[0] == _ts("2024-01-01")
+
+    def test_正常系_deleteでバーとカバレッジが削除される(self, store: BarStore) -> None:
+        store.write(
+            "AAPL", _bars("2024-01-01", "2024-01-06"), "2024-01-01", "2024-01-06"
+        )
+
+        assert store.delete("AAPL") == 5
+        assert store.coverage("AAPL") == []
+        assert store.read("AAPL").empty
+
+    def test_正常系_永続ストアがセッションをまたいで保持される(
+        self, tmp_path: Path
+    ) -> None:
+        db_path = tmp_path / "bars.db"
+        with create_persistent_bar_store(db_path) as store:
+            store.write(
+                "AAPL", _bars("2024-01-01", "2024-01-06"), "2024-01-01", "2024-01-06"
+            )
+
+        with BarStore(db_path) as store:
+            assert store.missing_ranges("AAPL", "2024-01-01", "2024-01-06") == []
+            assert len(store.read("AAPL")) == 5
+
+    def test_異常系_NaTになる日付でValueError(self, store: BarStore) -> None:
+        with pytest.raises(ValueError, match="Invalid date"):
+            store.missing_ranges("AAPL", "NaT", "2024-01-01")
+
+
+class TestYFinanceFetcherWithBarStore:
+    """YFinanceFetcher と BarStore の連携テスト。"""
+
+    @pytest.fixture
+    def store(self) -> Generator[BarStore, None, None]:
+        store = BarStore()
+        yield store
+        store.close()
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_正常系_部分範囲の再リクエストでダウンロードしない(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        mock_download.return_value = _download_frame(
+            ["AAPL"], "2020-01-01", "2024-12-31"
+        )
+        fetcher = YFinanceFetcher(bar_store=store)
+
+        fetcher.fetch(
+            FetchOptions(
+                symbols=["AAPL"], start_date="2020-01-01", end_date="2024-12-31"
+            )
+        )
+        results = fetcher.fetch(
+            FetchOptions(
+                symbols=["AAPL"], start_date="2023-01-01", end_date="2024-01-01"
+            )
+        )
+
+        assert mock_download.call_count == 1
+        assert results[0].from_cache is True
+        assert (results[0].data.index >= _ts("2023-01-01")).all()
+        assert (results[0].data.index < _ts("2024-01-01")).all()
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_正常系_不足期間のみダウンロードされる(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        store.write(
+            "AAPL", _bars("2024-01-01", "2024-06-01"), "2024-01-01", "2024-06-01"
+        )
+        mock_download.return_value = _download_frame(
+            ["AAPL"], "2024-06-01", "2024-09-01"
+        )
+        fetcher = YFinanceFetcher(bar_store=store)
+
+        results = fetcher.fetch(
+            FetchOptions(
+                symbols=["AAPL"], start_date="2024-01-01", end_date="2024-09-01"
+            )
+        )
+
+        mock_download.assert_called_once()
+        kwargs = mock_download.call_args.kwargs
+        assert kwargs["start"] == "2024-06-01"
+        assert kwargs["end"] == "2024-09-01"
+        assert results[0].from_cache is False
+        assert results[0].data.index.min() == _ts("2024-01-01")
+        assert results[0].data.index.max() == _ts("2024-08-30")
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_正常系_同じ不足期間のシンボルはまとめて取得(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        mock_download.return_value = _download_frame(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-02-01"
+        )
+        fetcher = YFinanceFetcher(bar_store=store)
+
+        results = fetcher.fetch(
+            FetchOptions(
+                symbols=["AAPL", "MSFT"],
+                start_date="2024-01-01",
+                end_date="2024-02-01",
+            )
+        )
+
+        mock_download.assert_called_once()
+        assert mock_download.call_args.kwargs["tickers"] == ["AAPL", "MSFT"]
+        assert all(len(r.data) == 23 for r in results)
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_正常系_use_cache無効時はストアを使わない(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        mock_download.return_value = _download_frame(
+            ["AAPL"], "2024-01-01", "2024-02-01"
+        )
+        fetcher = YFinanceFetcher(bar_store=store)
+
+        fetcher.fetch(
+            FetchOptions(
+                symbols=["AAPL"],
+                start_date="2024-01-01",
+                end_date="2024-02-01",
+                use_cache=False,
+            )
+        )
+
+        assert store.coverage("AAPL") == []
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_異常系_空のダウンロード結果はカバー済みにしない(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        mock_download.return_value = pd.DataFrame()
+        fetcher = YFinanceFetcher(bar_store=store)
+        options = FetchOptions(
+            symbols=["AAPL", "MSFT"], start_date="2024-01-01", end_date="2024-02-01"
+        )
+
+        fetcher.fetch(options)
+        assert store.coverage("AAPL") == []
+        assert store.coverage("MSFT") == []
+
+        mock_download.return_value = _download_frame(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-02-01"
+        )
+        results = fetcher.fetch(options)
+
+        assert mock_download.call_count == 2
+        assert all(len(r.data) == 23 for r in results)
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_異常系_一括取得で全NaNのシンボルはカバー済みにしない(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        bulk = _download_frame(["AAPL", "MSFT"], "2024-01-01", "2024-02-01")
+        failed = bulk.columns.get_level_values(1) == "MSFT"
+        bulk.loc[:, failed] = float("nan")
+        mock_download.return_value = bulk
+        fetcher = YFinanceFetcher(bar_store=store)
+        options = FetchOptions(
+            symbols=["AAPL", "MSFT"], start_date="2024-01-01", end_date="2024-02-01"
+        )
+
+        fetcher.fetch(options)
+        assert store.coverage("AAPL") == [(_ts("2024-01-01"), _ts("2024-02-01"))]
+        assert store.coverage("MSFT") == []
+
+        mock_download.return_value = _download_frame(
+            ["MSFT"], "2024-01-01", "2024-02-01"
+        )
+        results = fetcher.fetch(options)
+
+        assert mock_download.call_count == 2
+        assert mock_download.call_args.kwargs["tickers"] == ["MSFT"]
+        assert all(len(r.data) == 23 for r in results)
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_エッジケース_週末のみの不足期間は空でもカバー済みにする(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        mock_download.return_value = pd.DataFrame()
+        fetcher = YFinanceFetcher(bar_store=store)
+
+        fetcher.fetch(
+            FetchOptions(
+                symbols=["AAPL"], start_date="2024-01-06", end_date="2024-01-08"
+            )
+        )
+
+        assert store.coverage("AAPL") == [(_ts("2024-01-06"), _ts("2024-01-08"))]
+
+    @patch("market.yfinance.fetcher.yf.download")
+    def test_エッジケース_カバー済み区間に挟まれた祝日は空でもカバー済みにする(
+        self, mock_download: MagicMock, store: BarStore
+    ) -> None:
+        # 2024-07-04 (木) は独立記念日で休場
+        store.write(
+            "AAPL", _bars("2024-07-01", "2024-07-04"), "2024-07-01", "2024-07-04"
+        )
+        store.write(
+            "AAPL", _bars("2024-07-05", "2024-07-10"), "2024-07-05", "2024-07-10"
+        )
+        mock_download.return_value = pd.DataFrame()
+        fetcher = YFinanceFetcher(bar_store=store)
+        options = FetchOptions(
+            symbols=["AAPL"], start_date="2024-07-01", end_date="2024-07-10"
+        )
+
+        fetcher.fetch(options)
+        fetcher.fetch(options)
+
+        mock_download.assert_called_once()
+        assert store.coverage("AAPL") == [(_ts("2024-07-01"), _ts("2024-07-10"))]
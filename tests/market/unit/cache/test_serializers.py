@@ -0,0 +1,140 @@
+"""Tests for market.cache.serializers module.
+
+テスト対象:
+- serialize_value / deserialize_value: 列形式（Parquet / Arrow IPC）のシリアライズ
+- SQLiteCache.get_frame: 列・期間を指定した部分読み込み
+"""
+
+import pickle
+from collections.abc import Generator
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market.cache import CacheConfig, SQLiteCache
+from market.cache.serializers import deserialize_value, serialize_value
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    """100営業日分の OHLCV データ。"""
+    index = pd.bdate_range("2024-01-01", periods=100, name="date")
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.random((100, 5)),
+        index=index,
+        columns=pd.Index(["open", "high", "low", "close", "volume"]),
+    )
+
+
+class TestSerializeValue:
+    """serialize_value / deserialize_value のテスト。"""
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow", "pickle"])
+    def test_パラメトライズ_DataFrameの往復変換(
+        self, ohlcv: pd.DataFrame, fmt: str
+    ) -> None:
+        data, value_type = serialize_value(ohlcv, fmt)
+        restored = deserialize_value(data, value_type)
+        pd.testing.assert_frame_equal(restored, ohlcv, check_freq=False)
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_パラメトライズ_列と期間を指定して読み込み(
+        self, ohlcv: pd.DataFrame, fmt: str
+    ) -> None:
+        data, value_type = serialize_value(ohlcv, fmt)
+        restored = deserialize_value(
+            data, value_type, columns=["close"], start="2024-02-01", end="2024-02-29"
+        )
+        expected = ohlcv.loc["2024-02-01":"2024-02-29", ["close"]]
+        pd.testing.assert_frame_equal(restored, expected, check_freq=False)
+
+    def test_正常系_Seriesはnameを保持して往復変換(self) -> None:
+        series = pd.Series(
+            [1.0, 2.0, 3.0],
+            index=pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            name="GDP",
+        )
+        data, value_type = serialize_value(series)
+        assert value_type == "parquet-series"
+        restored = deserialize_value(data, value_type, start="2024-01-02")
+        assert restored.name == "GDP"
+        assert restored.tolist() == [2.0, 3.0]
+
+    def test_正常系_タプル名のSeriesはpickleで往復変換(self) -> None:
+        df = pd.DataFrame(
+            {("Close", "AAPL"): [1.0, 2.0], ("Close", "MSFT"): [3.0, 4.0]},
+            index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        )
+        series = df[("Close", "AAPL")]
+        data, value_type = serialize_value(series)
+        assert value_type == "series"
+        restored = deserialize_value(data, value_type)
+        assert restored.name == ("Close", "AAPL")
+        pd.testing.assert_series_equal(restored, series)
+
+    def test_正常系_MultiIndex列を往復変換(self) -> None:
+        df = pd.DataFrame(
+            {("Close", "AAPL"): [1.0, 2.0], ("Close", "MSFT"): [3.0, 4.0]},
+            index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        )
+        data, value_type = serialize_value(df)
+        pd.testing.assert_frame_equal(deserialize_value(data, value_type), df)
+
+    def test_正常系_Arrow非対応のDataFrameはpickleにフォールバック(self) -> None:
+        df = pd.DataFrame({"mixed": [1, "x", 2.0]})
+        data, value_type = serialize_value(df)
+        assert value_type == "dataframe"
+        pd.testing.assert_frame_equal(deserialize_value(data, value_type), df)
+
+    def test_正常系_dictはJSONでその他はpickle(self) -> None:
+        assert serialize_value({"a": 1})[1] == "json"
+        assert serialize_value(42)[1] == "pickle"
+
+    def test_正常系_旧形式のpickleエントリを読み込める(
+        self, ohlcv: pd.DataFrame
+    ) -> None:
+        restored = deserialize_value(
+            pickle.dumps(ohlcv), "dataframe", columns=["close"], end="2024-01-31"
+        )
+        pd.testing.assert_frame_equal(restored, ohlcv.loc[:"2024-01-31", ["close"]])
+
+    def test_異常系_未対応のフォーマットでValueError(self, ohlcv: pd.DataFrame) -> None:
+        with pytest.raises(ValueError, match="dataframe_format"):
+            serialize_value(ohlcv, "csv")
+
+
+class TestSQLiteCacheGetFrame:
+    """SQLiteCache.get_frame のテスト。"""
+
+    @pytest.fixture
+    def cache(self) -> Generator[SQLiteCache, None, None]:
+        cache = SQLiteCache(CacheConfig(ttl_seconds=3600, max_entries=100))
+        yield cache
+        cache.close()
+
+    def test_正常系_列と期間を指定して取得(
+        self, cache: SQLiteCache, ohlcv: pd.DataFrame
+    ) -> None:
+        cache.set("AAPL", ohlcv)
+
+        result = cache.get_frame(
+            "AAPL", columns=["open", "close"], start="2024-03-01", end="2024-03-31"
+        )
+
+        expected = ohlcv.loc["2024-03-01":"2024-03-31", ["open", "close"]]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_正常系_存在しないキーでNone返却(self, cache: SQLiteCache) -> None:
+        assert cache.get_frame("missing") is None
+
+    def test_正常系_Parquetがpickleより小さい(self, ohlcv: pd.DataFrame) -> None:
+        frame = pd.concat([ohlcv.round(2)] * 50, ignore_index=True)
+        parquet_size = len(serialize_value(frame, "parquet")[0])
+        pickle_size = len(serialize_value(frame, "pickle")[0])
+        assert parquet_size < pickle_size
+
+    def test_異常系_CacheConfigで未対応のフォーマットを拒否(self) -> None:
+        with pytest.raises(ValueError, match="dataframe_format"):
+            CacheConfig(dataframe_format="csv")
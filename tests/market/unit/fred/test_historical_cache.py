@@ -248,9 +248,12 @@ class TestSyncSeries:
         assert result["data_points"] == 5
         assert result["success"] is True
 
-        # ファイルが作成されていることを確認
-        cache_file = temp_cache_dir / "DGS10.json"
-        assert cache_file.exists()
+        # Parquet パートとメタデータが作成されていることを確認
+        series_dir = temp_cache_dir / "DGS10"
+        assert (series_dir / "_meta.json").exists()
+        assert [p.name for p in series_dir.glob("part-*.parquet")] == [
+            "part-00000.parquet"
+        ]
 
     @patch("market.fred.historical_cache.FREDFetcher")
     def test_正常系_既存シリーズの増分更新(
@@ -308,10 +311,15 @@ class TestSyncSeries:
         assert result["data_points"] == 5  # 3 + 2 = 5
         assert result["new_points"] == 2
 
-        # キャッシュファイルの内容を検証
-        with open(cache_file, encoding="utf-8") as f:
-            cached = json.load(f)
-        assert len(cached["data"]) == 5
+        # 旧 JSON キャッシュは Parquet に移行され、増分のみ追記される
+        assert not cache_file.exists()
+        parts = sorted((temp_cache_dir / "DGS10").glob("part-*.parquet"))
+        assert [p.name for p in parts] == ["part-00000.parquet", "part-00001.parquet"]
+        assert len(pd.read_parquet(parts[1])) == 2
+
+        df = cache.get_series_df("DGS10")
+        assert df is not None
+        assert df["value"].tolist() == [4.0, 4.1, 4.2, 4.3, 4.4]
 
     @patch("market.fred.historical_cache.FREDFetcher")
     def test_異常系_無効なシリーズIDでエラー(
@@ -731,3 +739,214 @@ class TestIndexFile:
         assert "last_updated" in index_data
         assert "series" in index_data
         assert "DGS10" in index_data["series"]
+
+
+# =============================================================================
+# Parquet 増分同期・一括読み込みのテスト
+# =============================================================================
+
+
+def _setup_fetcher(
+    mock_fetcher_class: MagicMock,
+    fred_metadata: dict[str, Any],
+    series: pd.Series,
+) -> MagicMock:
+    """FREDFetcher のモックを設定する。"""
+    mock_fetcher = MagicMock()
+    mock_fetcher_class.return_value = mock_fetcher
+    mock_fetcher_class.get_preset_info.return_value = {
+        "name_ja": "テスト",
+        "category_name": "Treasury Yields",
+    }
+    mock_fetcher.get_series_info.return_value = fred_metadata
+
+    mock_result = MagicMock()
+    mock_result.data = pd.DataFrame({"value": series})
+    mock_result.is_empty = False
+    mock_fetcher.fetch.return_value = [mock_result]
+    return mock_fetcher
+
+
+class TestIncrementalParquetSync:
+    """Parquet レイアウトでの増分同期のテスト。"""
+
+    @patch("market.fred.historical_cache.FREDFetcher")
+    def test_正常系_最終日の改訂値のみ追記される(
+        self,
+        mock_fetcher_class: MagicMock,
+        temp_cache_dir: Path,
+        sample_fred_series: pd.Series,
+        sample_fred_metadata: dict[str, Any],
+        mock_api_key: str,
+    ) -> None:
+        """最終日の値が改訂された場合、その行と新しい行だけが追記されることを確認。"""
+        mock_fetcher = _setup_fetcher(
+            mock_fetcher_class, sample_fred_metadata, sample_fred_series
+        )
+        cache = HistoricalCache(base_path=temp_cache_dir)
+        cache.sync_series("DGS10")
+
+        # 2024-01-05 が改訂され、2024-01-06 が追加される
+        revised = pd.Series(
+            [4.45, 4.5], index=pd.to_datetime(["2024-01-05", "2024-01-06"])
+        )
+        mock_fetcher.fetch.return_value[0].data = pd.DataFrame({"value": revised})
+        mock_fetcher.get_series_info.return_value = {
+            **sample_fred_metadata,
+            "last_updated": "2026-01-29 15:16:00-05:00",
+        }
+        result = cache.sync_series("DGS10")
+
+        assert result["new_points"] == 1
+        assert result["data_points"] == 6
+        options = mock_fetcher.fetch.call_args.args[0]
+        assert options.start_date == "2024-01-05"
+
+        df = cache.get_series_df("DGS10")
+        assert df is not None
+        assert df["value"].tolist() == [4.0, 4.1, 4.2, 4.3, 4.45, 4.5]
+
+    @patch("market.fred.historical_cache.FREDFetcher")
+    def test_正常系_FRED側の更新がなければ観測値を取得しない(
+        self,
+        mock_fetcher_class: MagicMock,
+        temp_cache_dir: Path,
+        sample_fred_series: pd.Series,
+        sample_fred_metadata: dict[str, Any],
+        mock_api_key: str,
+    ) -> None:
+        """last_updated が前回同期時と同じ場合、fetch を呼ばないことを確認。"""
+        mock_fetcher = _setup_fetcher(
+            mock_fetcher_class, sample_fred_metadata, sample_fred_series
+        )
+        cache = HistoricalCache(base_path=temp_cache_dir)
+        cache.sync_series("DGS10")
+        mock_fetcher.fetch.reset_mock()
+
+        result = cache.sync_series("DGS10")
+
+        assert result == {
+            "series_id": "DGS10",
+            "success": True,
+            "data_points": 5,
+            "new_points": 0,
+        }
+        mock_fetcher.fetch.assert_not_called()
+
+    @patch("market.fred.historical_cache.MAX_PARTS", 2)
+    @patch("market.fred.historical_cache.FREDFetcher")
+    def test_正常系_パート数が上限を超えると圧縮される(
+        self,
+        mock_fetcher_class: MagicMock,
+        temp_cache_dir: Path,
+        sample_fred_series: pd.Series,
+        sample_fred_metadata: dict[str, Any],
+        mock_api_key: str,
+    ) -> None:
+        """パートファイル数が MAX_PARTS を超えると 1 ファイルにまとめられることを確認。"""
+        mock_fetcher = _setup_fetcher(
+            mock_fetcher_class, sample_fred_metadata, sample_fred_series
+        )
+        cache = HistoricalCache(base_path=temp_cache_dir)
+        cache.sync_series("DGS10")
+
+        for i, day in enumerate(["2024-01-06", "2024-01-07"]):
+            new_series = pd.Series([5.0 + i], index=pd.to_datetime([day]))
+            mock_fetcher.fetch.return_value[0].data = pd.DataFrame(
+                {"value": new_series}
+            )
+            mock_fetcher.get_series_info.return_value = {
+                **sample_fred_metadata,
+                "last_updated": day,
+            }
+            cache.sync_series("DGS10")
+
+        parts = list((temp_cache_dir / "DGS10").glob("part-*.parquet"))
+        assert len(parts) == 1
+        df = cache.get_series_df("DGS10")
+        assert df is not None
+        assert len(df) == 7
+
+
+class TestSyncMany:
+    """sync_many メソッドのテスト。"""
+
+    @patch("market.fred.historical_cache.FREDFetcher")
+    def test_正常系_並列同期でも入力順に結果を返す(
+        self,
+        mock_fetcher_class: MagicMock,
+        temp_cache_dir: Path,
+        sample_fred_series: pd.Series,
+        sample_fred_metadata: dict[str, Any],
+        mock_api_key: str,
+    ) -> None:
+        """複数シリーズを並列同期し、結果が入力順で返りインデックスに全件載ることを確認。"""
+        _setup_fetcher(mock_fetcher_class, sample_fred_metadata, sample_fred_series)
+        series_ids = [f"S{i}" for i in range(8)]
+
+        cache = HistoricalCache(base_path=temp_cache_dir, max_workers=4)
+        results = cache.sync_many(series_ids)
+
+        assert [r["series_id"] for r in results] == series_ids
+        assert all(r["success"] for r in results)
+        with open(temp_cache_dir / "_index.json", encoding="utf-8") as f:
+            index_data = json.load(f)
+        assert sorted(index_data["series"]) == series_ids
+
+    def test_異常系_max_workersが0以下でValueError(
+        self, temp_cache_dir: Path, mock_api_key: str
+    ) -> None:
+        """max_workers が正でない場合に ValueError が発生することを確認。"""
+        with (
+            patch("market.fred.historical_cache.FREDFetcher"),
+            pytest.raises(ValueError, match="max_workers"),
+        ):
+            HistoricalCache(base_path=temp_cache_dir, max_workers=0)
+
+
+class TestGetMultipleSeriesDf:
+    """get_multiple_series_df メソッドのテスト。"""
+
+    @patch("market.fred.historical_cache.FREDFetcher")
+    def test_正常系_複数シリーズを日付で揃えたワイド形式で取得(
+        self,
+        mock_fetcher_class: MagicMock,
+        temp_cache_dir: Path,
+        sample_fred_series: pd.Series,
+        sample_fred_metadata: dict[str, Any],
+        mock_api_key: str,
+    ) -> None:
+        """日付の和集合で揃えられ、欠損日は NaN、未キャッシュ系列は除外されることを確認。"""
+        mock_fetcher = _setup_fetcher(
+            mock_fetcher_class, sample_fred_metadata, sample_fred_series
+        )
+        cache = HistoricalCache(base_path=temp_cache_dir)
+        cache.sync_series("DGS10")
+
+        weekly = pd.Series(
+            [1.0, 2.0], index=pd.to_datetime(["2024-01-03", "2024-01-08"])
+        )
+        mock_fetcher.fetch.return_value[0].data = pd.DataFrame({"value": weekly})
+        cache.sync_series("DGS2")
+
+        df = cache.get_multiple_series_df(
+            ["DGS2", "DGS10", "MISSING"], start_date="2024-01-02"
+        )
+
+        assert list(df.columns) == ["DGS2", "DGS10"]
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df.index.min() == pd.Timestamp("2024-01-02")
+        assert len(df) == 5
+        assert df.loc["2024-01-03", "DGS2"] == 1.0
+        assert pd.isna(df.loc["2024-01-04", "DGS2"])
+        assert pd.isna(df.loc["2024-01-08", "DGS10"])
+
+    def test_正常系_キャッシュがなければ空のDataFrame(
+        self, temp_cache_dir: Path, mock_api_key: str
+    ) -> None:
+        """キャッシュされた系列がない場合に空の DataFrame が返ることを確認。"""
+        with patch("market.fred.historical_cache.FREDFetcher"):
+            cache = HistoricalCache(base_path=temp_cache_dir)
+            df = cache.get_multiple_series_df(["DGS10"])
+
+        assert df.empty
@@ -302,11 +302,9 @@ class TestAutoMode:
                 "cached": False,
             },
         }
-        mock_cache.sync_series.return_value = {
-            "series_id": "test",
-            "success": True,
-            "data_points": 100,
-        }
+        mock_cache.sync_many.side_effect = lambda series_ids: [
+            {"series_id": s, "success": True, "data_points": 100} for s in series_ids
+        ]
         mock_cache_class.return_value = mock_cache
 
         args = parse_args(["--auto", "--stale-hours", "24"])
@@ -314,7 +312,7 @@ class TestAutoMode:
 
         assert result == 0
         # GDP と UNRATE のみ同期されるべき
-        assert mock_cache.sync_series.call_count == 2
+        mock_cache.sync_many.assert_called_once_with(["GDP", "UNRATE"])
 
 
 # =============================================================================
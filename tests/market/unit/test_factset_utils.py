@@ -0,0 +1,181 @@
+"""Tests for the bulk UPSERT write path in factset_utils.
+
+store_to_database / store_to_database_batch / upsert_financial_data が
+一時テーブル経由の集合演算 (bulk_upsert) で書き込むことを検証する。
+"""
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market.factset.factset_utils import (
+    UpsertResult,
+    bulk_upsert,
+    store_to_database,
+    store_to_database_batch,
+    upsert_financial_data,
+)
+
+
+@pytest.fixture
+def temp_db(tmp_path: Path) -> Path:
+    """一時的なSQLiteデータベースファイルのパス。"""
+    return tmp_path / "factset.db"
+
+
+def _long_df(dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(dates),
+            "P_SYMBOL": "AAPL",
+            "variable": "FF_ROIC",
+            "value": values,
+        }
+    )
+
+
+def _read_table(db_path: Path, table_name: str) -> pd.DataFrame:
+    with sqlite3.connect(db_path) as conn:
+        return pd.read_sql(f"SELECT * FROM {table_name} ORDER BY date", conn)
+
+
+class TestBulkUpsert:
+    """bulk_upsert の検証。"""
+
+    def test_正常系_updateで追加行と上書き行を集計する(self) -> None:
+        conn = sqlite3.connect(":memory:")
+        bulk_upsert(conn, _long_df(["2024-01-31", "2024-02-29"], [1.0, 2.0]), "t")
+
+        result = bulk_upsert(
+            conn, _long_df(["2024-02-29", "2024-03-31"], [20.0, 3.0]), "t"
+        )
+
+        assert result == UpsertResult(inserted=1, updated=1, skipped=0)
+        values = [row[0] for row in conn.execute("SELECT value FROM t ORDER BY date")]
+        assert values == [1.0, 20.0, 3.0]
+
+    def test_正常系_skipで既存キーは上書きしない(self) -> None:
+        conn = sqlite3.connect(":memory:")
+        bulk_upsert(conn, _long_df(["2024-01-31"], [1.0]), "t")
+
+        result = bulk_upsert(
+            conn,
+            _long_df(["2024-01-31", "2024-02-29"], [10.0, 2.0]),
+            "t",
+            on_duplicate="skip",
+        )
+
+        assert result == UpsertResult(inserted=1, updated=0, skipped=1)
+        values = [row[0] for row in conn.execute("SELECT value FROM t ORDER BY date")]
+        assert values == [1.0, 2.0]
+
+    def test_正常系_一意制約のないテーブルはdelete_insertで上書きする(self) -> None:
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE t (date TEXT, P_SYMBOL TEXT, variable TEXT, value REAL)"
+        )
+        bulk_upsert(conn, _long_df(["2024-01-31"], [1.0]), "t")
+
+        result = bulk_upsert(conn, _long_df(["2024-01-31"], [5.0]), "t")
+
+        assert result.updated == 1
+        assert conn.execute("SELECT COUNT(*), MAX(value) FROM t").fetchone() == (1, 5.0)
+
+    def test_正常系_NaNはNULLとして保存される(self) -> None:
+        conn = sqlite3.connect(":memory:")
+
+        bulk_upsert(conn, _long_df(["2024-01-31"], [np.nan]), "t")
+
+        assert conn.execute("SELECT value FROM t").fetchone() == (None,)
+
+    def test_異常系_不正なon_duplicateでValueError(self) -> None:
+        conn = sqlite3.connect(":memory:")
+
+        with pytest.raises(ValueError, match="不正なon_duplicate"):
+            bulk_upsert(conn, _long_df(["2024-01-31"], [1.0]), "t", on_duplicate="x")
+
+    def test_異常系_不正なテーブル名でValueError(self) -> None:
+        conn = sqlite3.connect(":memory:")
+
+        with pytest.raises(ValueError, match="SQL識別子に不正な文字が含まれています"):
+            bulk_upsert(conn, _long_df(["2024-01-31"], [1.0]), "t; DROP TABLE t")
+
+
+class TestStoreToDatabase:
+    """store_to_database の検証。"""
+
+    def test_正常系_to_sqlで作成した既存行と重複を判定できる(
+        self, temp_db: Path
+    ) -> None:
+        """従来の to_sql 書き込みと同じ日付形式でキーが一致することを確認。"""
+        existing = _long_df(["2024-01-31"], [1.0])
+        with sqlite3.connect(temp_db) as conn:
+            conn.execute(
+                "CREATE TABLE FF_ROIC (date TEXT, P_SYMBOL TEXT, variable TEXT, "
+                "value REAL, PRIMARY KEY (date, P_SYMBOL, variable))"
+            )
+            existing.to_sql("FF_ROIC", conn, if_exists="append", index=False)
+
+        result = store_to_database(
+            _long_df(["2024-01-31", "2024-02-29"], [9.0, 2.0]), temp_db, "FF_ROIC"
+        )
+
+        assert result == UpsertResult(inserted=1, updated=0, skipped=1)
+        assert _read_table(temp_db, "FF_ROIC")["value"].tolist() == [1.0, 2.0]
+
+    def test_正常系_WALモードで書き込まれる(self, temp_db: Path) -> None:
+        store_to_database(_long_df(["2024-01-31"], [1.0]), temp_db, "FF_ROIC")
+
+        with sqlite3.connect(temp_db) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestStoreToDatabaseBatch:
+    """store_to_database_batch の検証。"""
+
+    def test_正常系_テーブルごとの追加行と上書き行を返す(self, temp_db: Path) -> None:
+        store_to_database(_long_df(["2024-01-31"], [1.0]), temp_db, "FF_ROIC")
+
+        results = store_to_database_batch(
+            {
+                "FF_ROIC": _long_df(["2024-01-31", "2024-02-29"], [5.0, 2.0]),
+                "FF_ROE": _long_df(["2024-01-31"], [3.0]),
+            },
+            temp_db,
+            verbose=False,
+            on_duplicate="update",
+        )
+
+        assert sorted(results["success"]) == ["FF_ROE", "FF_ROIC"]
+        assert results["inserted_rows"] == 2
+        assert results["updated_rows"] == 1
+        assert results["total_rows"] == 3
+        assert _read_table(temp_db, "FF_ROIC")["value"].tolist() == [5.0, 2.0]
+
+
+class TestUpsertFinancialData:
+    """upsert_financial_data の検証。"""
+
+    @pytest.mark.parametrize("method", ["auto", "upsert", "delete_insert"])
+    def test_正常系_全方式で同じ結果になる(self, method: str) -> None:
+        conn = sqlite3.connect(":memory:")
+        upsert_financial_data(_long_df(["2024-01-31"], [1.0]), conn, "t")
+
+        rows = upsert_financial_data(
+            _long_df(["2024-01-31", "2024-02-29"], [5.0, 2.0]), conn, "t", method
+        )
+
+        assert rows == 2
+        assert conn.execute("SELECT date, value FROM t ORDER BY date").fetchall() == [
+            ("2024-01-31", 5.0),
+            ("2024-02-29", 2.0),
+        ]
+
+    def test_異常系_不正なmethodでValueError(self) -> None:
+        conn = sqlite3.connect(":memory:")
+
+        with pytest.raises(ValueError, match="不正なmethod"):
+            upsert_financial_data(_long_df(["2024-01-31"], [1.0]), conn, "t", "merge")
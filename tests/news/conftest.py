@@ -9,6 +9,8 @@ from typing import Any
 
 import pytest
 
+from utils_core.rate_limit import get_rate_scheduler
+
 
 @pytest.fixture
 def sample_data() -> list[dict[str, Any]]:
@@ -35,6 +37,14 @@ def reset_environment(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv(var, raising=False)
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_scheduler() -> Iterator[None]:
+    """Reset the shared request scheduler so slots do not leak between tests."""
+    get_rate_scheduler().reset()
+    yield
+    get_rate_scheduler().reset()
+
+
 @pytest.fixture
 def capture_logs(caplog: pytest.LogCaptureFixture) -> pytest.LogCaptureFixture:
     """Capture logs for testing with proper level."""
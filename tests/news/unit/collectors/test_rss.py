@@ -208,6 +208,65 @@ class TestRSSCollectorCollect:
                     assert article.source.source_type == SourceType.RSS
 
 
+class TestRSSCollectorIterCollect:
+    """Tests for RSSCollector iter_collect method."""
+
+    @staticmethod
+    def _article(url: str, category: str) -> CollectedArticle:
+        return CollectedArticle(
+            url=url,  # type: ignore[arg-type]
+            title="Article",
+            source=ArticleSource(
+                source_type=SourceType.RSS,
+                source_name="Feed",
+                category=category,
+            ),
+            collected_at=datetime.now(timezone.utc),
+        )
+
+    @pytest.mark.asyncio
+    async def test_正常系_フィードごとに記事をyieldする(
+        self,
+        mock_config: NewsWorkflowConfig,
+    ) -> None:
+        """iter_collect should yield the articles of each feed separately."""
+        presets = [
+            PresetFeed(
+                url=f"https://example.com/feed{i}.xml",
+                title=f"Feed {i}",
+                category="market",
+                fetch_interval="daily",
+                enabled=True,
+            )
+            for i in range(3)
+        ]
+        feed_articles = [
+            [self._article("https://example.com/a1", "market")],
+            [],
+            [
+                self._article("https://example.com/b1", "market"),
+                self._article("https://example.com/b2", "market"),
+            ],
+        ]
+
+        collector = RSSCollector(config=mock_config)
+        with (
+            patch.object(collector, "_load_presets", return_value=presets),
+            patch.object(collector, "_fetch_feed", side_effect=feed_articles),
+            patch("httpx.AsyncClient") as mock_client_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client_class.return_value = mock_client
+
+            batches = [batch async for batch in collector.iter_collect()]
+
+        # Feeds without articles yield nothing
+        assert [len(batch) for batch in batches] == [1, 2]
+        assert str(batches[1][0].url) == "https://example.com/b1"
+
+
 class TestRSSCollectorConfigHandling:
     """Tests for RSSCollector configuration handling."""
 
@@ -1605,6 +1605,65 @@ class TestPublishBatchDryRun:
             assert results[1].issue_number is None
 
 
+class TestPublishChecked:
+    """Tests for publish_checked() (single article with duplicate check)."""
+
+    @pytest.mark.asyncio
+    async def test_正常系_既存URLに含まれる記事はDUPLICATE(
+        self,
+        sample_config: NewsWorkflowConfig,
+        summarized_article_with_summary: SummarizedArticle,
+    ) -> None:
+        """publish_checked should mark an article in existing_urls as DUPLICATE."""
+        from news.publisher import Publisher
+
+        publisher = Publisher(config=sample_config)
+
+        with patch.object(publisher, "publish") as mock_publish:
+            result = await publisher.publish_checked(
+                summarized_article_with_summary,
+                {"https://www.cnbc.com/article/123"},
+            )
+
+        assert result.publication_status == PublicationStatus.DUPLICATE
+        mock_publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_正常系_dry_runでIssue作成をスキップ(
+        self,
+        sample_config: NewsWorkflowConfig,
+        summarized_article_with_summary: SummarizedArticle,
+    ) -> None:
+        """publish_checked should return SUCCESS without creating an Issue."""
+        from news.publisher import Publisher
+
+        publisher = Publisher(config=sample_config)
+
+        with patch("news.publisher.subprocess.run") as mock_run:
+            result = await publisher.publish_checked(
+                summarized_article_with_summary, set(), dry_run=True
+            )
+
+        assert result.publication_status == PublicationStatus.SUCCESS
+        assert result.issue_number is None
+        mock_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_正常系_要約なしはSKIPPED(
+        self,
+        sample_config: NewsWorkflowConfig,
+        summarized_article_no_summary: SummarizedArticle,
+    ) -> None:
+        """publish_checked should skip an article without summary."""
+        from news.publisher import Publisher
+
+        publisher = Publisher(config=sample_config)
+
+        result = await publisher.publish_checked(summarized_article_no_summary, set())
+
+        assert result.publication_status == PublicationStatus.SKIPPED
+
+
 class TestGetExistingProjectItem:
     """Tests for _get_existing_project_item() method (P10-004).
 
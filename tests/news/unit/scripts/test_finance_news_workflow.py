@@ -67,6 +67,13 @@ class TestCreateParser:
         args = parser.parse_args(["--max-articles", "10"])
         assert args.max_articles == 10
 
+    def test_正常系_streaming引数を指定できる(self) -> None:
+        from news.scripts.finance_news_workflow import create_parser
+
+        parser = create_parser()
+        assert parser.parse_args([]).streaming is False
+        assert parser.parse_args(["--streaming"]).streaming is True
+
     def test_正常系_verbose引数を指定できる(self) -> None:
         from news.scripts.finance_news_workflow import create_parser
 
@@ -312,6 +319,33 @@ output:
         _, kwargs = mock_orchestrator.run.call_args
         assert kwargs.get("max_articles") == 10
 
+    def test_正常系_streaming指定で設定のストリーミング実行が有効になる(
+        self,
+        mock_config_path: Path,
+        mock_workflow_result: MagicMock,
+    ) -> None:
+        from news.scripts.finance_news_workflow import main
+
+        mock_orchestrator = AsyncMock()
+        mock_orchestrator.run.return_value = mock_workflow_result
+        config = MagicMock()
+        config.pipeline.streaming = False
+
+        with (
+            patch(
+                "news.scripts.finance_news_workflow.load_config",
+                return_value=config,
+            ),
+            patch(
+                "news.scripts.finance_news_workflow.NewsWorkflowOrchestrator",
+                return_value=mock_orchestrator,
+            ) as mock_orchestrator_cls,
+        ):
+            result = main(["--config", str(mock_config_path), "--streaming"])
+
+        assert result == 0
+        assert mock_orchestrator_cls.call_args.args[0].pipeline.streaming is True
+
     def test_異常系_設定ファイルが見つからないと終了コード1(self) -> None:
         from news.scripts.finance_news_workflow import main
 
@@ -19,6 +19,7 @@ from news.sources.yfinance.base import (
     DEFAULT_DELAY_JITTER,
     DEFAULT_POLITE_DELAY,
     DEFAULT_YFINANCE_RETRY_CONFIG,
+    YFINANCE_RATE_KEY,
     _try_raise_rate_limit_error,
     apply_polite_delay,
     fetch_all_with_polite_delay,
@@ -28,6 +29,7 @@ from news.sources.yfinance.base import (
     validate_query,
     validate_ticker,
 )
+from utils_core.rate_limit import RateScheduler, get_rate_scheduler
 
 # ============================================================================
 # Test Fixtures
@@ -616,57 +618,76 @@ class TestFetchWithRetry:
 class TestApplyPoliteDelay:
     """Tests for apply_polite_delay function."""
 
+    def test_正常系_最初のリクエストは待機しない(self) -> None:
+        """Test that the first request after an idle period is not delayed."""
+        with patch("news.sources.yfinance.base.time.sleep") as mock_sleep:
+            actual_delay = apply_polite_delay()
+
+        mock_sleep.assert_not_called()
+        assert actual_delay == 0.0
+
     def test_正常系_デフォルト値でディレイが適用される(self) -> None:
-        """Test that polite delay is applied with default values."""
+        """Test that consecutive requests are spaced with default values."""
         with patch("news.sources.yfinance.base.time.sleep") as mock_sleep:
+            apply_polite_delay()
             actual_delay = apply_polite_delay()
 
             mock_sleep.assert_called_once()
             slept_value = mock_sleep.call_args[0][0]
             assert slept_value == actual_delay
-            assert (
-                DEFAULT_POLITE_DELAY
-                <= actual_delay
-                <= DEFAULT_POLITE_DELAY + DEFAULT_DELAY_JITTER
-            )
+            assert actual_delay <= DEFAULT_POLITE_DELAY + DEFAULT_DELAY_JITTER
+            assert actual_delay >= DEFAULT_POLITE_DELAY - 0.05
 
     def test_正常系_カスタム値でディレイが適用される(self) -> None:
-        """Test that polite delay is applied with custom values."""
+        """Test that consecutive requests are spaced with custom values."""
         with patch("news.sources.yfinance.base.time.sleep") as mock_sleep:
+            apply_polite_delay(polite_delay=2.0, jitter=1.0)
             actual_delay = apply_polite_delay(polite_delay=2.0, jitter=1.0)
 
             mock_sleep.assert_called_once()
-            assert 2.0 <= actual_delay <= 3.0
+            assert 1.95 <= actual_delay <= 3.0
 
     def test_正常系_jitterが0のとき固定ディレイ(self) -> None:
         """Test that delay is fixed when jitter is 0."""
         with patch("news.sources.yfinance.base.time.sleep") as mock_sleep:
+            apply_polite_delay(polite_delay=1.5, jitter=0.0)
             actual_delay = apply_polite_delay(polite_delay=1.5, jitter=0.0)
 
             mock_sleep.assert_called_once()
-            assert actual_delay == pytest.approx(1.5, abs=0.01)
+            assert actual_delay == pytest.approx(1.5, abs=0.05)
 
-    def test_正常系_戻り値が実際の待機時間(self) -> None:
-        """Test that return value matches the actual sleep time."""
-        with patch("news.sources.yfinance.base.time.sleep") as mock_sleep:
-            actual_delay = apply_polite_delay(polite_delay=1.0, jitter=0.5)
+    def test_正常系_経過済みの時間は待機から差し引かれる(self) -> None:
+        """Test that only the remainder of the interval is waited."""
+        scheduler = RateScheduler(clock=MagicMock(side_effect=[0.0, 0.4]))
+        with (
+            patch(
+                "news.sources.yfinance.base.get_rate_scheduler",
+                return_value=scheduler,
+            ),
+            patch("news.sources.yfinance.base.time.sleep") as mock_sleep,
+        ):
+            apply_polite_delay(polite_delay=1.0, jitter=0.0)
+            actual_delay = apply_polite_delay(polite_delay=1.0, jitter=0.0)
 
-            slept_value = mock_sleep.call_args[0][0]
-            assert actual_delay == slept_value
+        mock_sleep.assert_called_once_with(pytest.approx(0.6))
+        assert actual_delay == pytest.approx(0.6)
+        assert scheduler.stats(YFINANCE_RATE_KEY).requests == 2
 
     @given(
         polite_delay=st.floats(min_value=0.0, max_value=10.0),
         jitter=st.floats(min_value=0.0, max_value=5.0),
     )
     @settings(max_examples=50)
-    def test_プロパティ_戻り値がdelay以上delay_plus_jitter以下(
+    def test_プロパティ_戻り値が0以上delay_plus_jitter以下(
         self, polite_delay: float, jitter: float
     ) -> None:
         """Property test: return value is within expected range."""
+        get_rate_scheduler().reset()
         with patch("news.sources.yfinance.base.time.sleep"):
+            apply_polite_delay(polite_delay=polite_delay, jitter=jitter)
             actual_delay = apply_polite_delay(polite_delay=polite_delay, jitter=jitter)
 
-            assert actual_delay >= polite_delay
+            assert actual_delay >= 0.0
             assert actual_delay <= polite_delay + jitter
 
 
@@ -730,22 +751,23 @@ class TestApplyPoliteDelayEdgeCases:
     """Edge case tests for apply_polite_delay function."""
 
     def test_エッジケース_負のpolite_delayでも動作する(self) -> None:
-        """Test that negative polite_delay still works (jitter makes it positive)."""
-        with patch("news.sources.yfinance.base.time.sleep") as mock_sleep:
+        """Test that negative polite_delay still works (interval clamped to 0)."""
+        with patch("news.sources.yfinance.base.time.sleep"):
+            apply_polite_delay(polite_delay=-0.5, jitter=1.0)
             actual_delay = apply_polite_delay(polite_delay=-0.5, jitter=1.0)
 
-            mock_sleep.assert_called_once()
-            # -0.5 + uniform(0, 1.0) → range: -0.5 to 0.5
-            assert -0.5 <= actual_delay <= 0.5
+            # max(0, -0.5 + uniform(0, 1.0)) → range: 0.0 to 0.5
+            assert 0.0 <= actual_delay <= 0.5
 
     def test_エッジケース_負のjitterでも動作する(self) -> None:
         """Test that negative jitter still works (uniform handles negative range)."""
         with patch("news.sources.yfinance.base.time.sleep") as mock_sleep:
+            apply_polite_delay(polite_delay=1.0, jitter=-0.5)
             actual_delay = apply_polite_delay(polite_delay=1.0, jitter=-0.5)
 
             mock_sleep.assert_called_once()
             # 1.0 + uniform(0, -0.5) → range: 0.5 to 1.0
-            assert 0.5 <= actual_delay <= 1.0
+            assert 0.45 <= actual_delay <= 1.0
 
 
 # ============================================================================
@@ -765,15 +787,17 @@ class TestFetchAllWithPoliteDelay:
         mock_fetch.assert_not_called()
 
     @patch("news.sources.yfinance.base.apply_polite_delay")
-    def test_正常系_単一識別子ではディレイなし(self, mock_delay: MagicMock) -> None:
-        """Test that single identifier does not trigger polite delay."""
+    def test_正常系_単一識別子ではスロット待機が1回(
+        self, mock_delay: MagicMock
+    ) -> None:
+        """Test that a single identifier waits for one request slot only."""
         mock_fetch = MagicMock(
             return_value=FetchResult(articles=[], success=True, ticker="AAPL")
         )
         results = fetch_all_with_polite_delay(["AAPL"], mock_fetch, count=5)
 
         assert len(results) == 1
-        mock_delay.assert_not_called()
+        mock_delay.assert_called_once()
 
     @patch("news.sources.yfinance.base.apply_polite_delay")
     def test_正常系_複数識別子でディレイが挿入される(
@@ -789,8 +813,8 @@ class TestFetchAllWithPoliteDelay:
 
         assert len(results) == 3
         assert mock_fetch.call_count == 3
-        # Delay is called between requests (2 times for 3 identifiers)
-        assert mock_delay.call_count == 2
+        # A request slot is awaited before each identifier
+        assert mock_delay.call_count == 3
 
     @patch("news.sources.yfinance.base.apply_polite_delay")
     def test_正常系_エラーでも次の識別子に進む(self, mock_delay: MagicMock) -> None:
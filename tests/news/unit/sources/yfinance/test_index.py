@@ -341,13 +341,13 @@ class TestFetchAllPoliteDelay:
     """Tests for polite delay behavior in IndexNewsSource.fetch_all."""
 
     @patch("news.sources.yfinance.base.apply_polite_delay")
-    def test_正常系_複数ティッカーで2回目以降にディレイが適用される(
+    def test_正常系_複数ティッカーで各リクエスト前にディレイが適用される(
         self,
         mock_delay: MagicMock,
         sample_symbols_file: Path,
         sample_index_news_data: list[dict[str, Any]],
     ) -> None:
-        """Test that polite delay is applied before 2nd and subsequent requests."""
+        """Test that polite delay is applied before every request."""
         source = IndexNewsSource(symbols_file=sample_symbols_file)
 
         mock_instance = MagicMock()
@@ -357,17 +357,17 @@ class TestFetchAllPoliteDelay:
             mock_yf.Ticker.return_value = mock_instance
             source.fetch_all(["^GSPC", "^DJI", "^IXIC"], count=5)
 
-        # apply_polite_delay should be called 2 times (before 2nd and 3rd requests)
-        assert mock_delay.call_count == 2
+        # apply_polite_delay waits for a Yahoo Finance slot before each request
+        assert mock_delay.call_count == 3
 
     @patch("news.sources.yfinance.base.apply_polite_delay")
-    def test_正常系_単一ティッカーでディレイが適用されない(
+    def test_正常系_単一ティッカーではスロット待機が1回(
         self,
         mock_delay: MagicMock,
         sample_symbols_file: Path,
         sample_index_news_data: list[dict[str, Any]],
     ) -> None:
-        """Test that polite delay is not applied for a single ticker."""
+        """Test that a single ticker waits for one request slot only."""
         source = IndexNewsSource(symbols_file=sample_symbols_file)
 
         mock_instance = MagicMock()
@@ -377,8 +377,8 @@ class TestFetchAllPoliteDelay:
             mock_yf.Ticker.return_value = mock_instance
             source.fetch_all(["^GSPC"], count=5)
 
-        # apply_polite_delay should not be called for a single ticker
-        mock_delay.assert_not_called()
+        # The first request slot is free after an idle period
+        mock_delay.assert_called_once()
 
 
 class TestIndexNewsSourceProtocol:
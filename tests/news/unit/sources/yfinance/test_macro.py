@@ -396,13 +396,13 @@ class TestFetchAllPoliteDelay:
     """Tests for polite delay behavior in MacroNewsSource.fetch_all."""
 
     @patch("news.sources.yfinance.base.apply_polite_delay")
-    def test_正常系_複数クエリで2回目以降にディレイが適用される(
+    def test_正常系_複数クエリで各リクエスト前にディレイが適用される(
         self,
         mock_delay: MagicMock,
         sample_keywords_file: Path,
         sample_search_news_data: list[dict[str, Any]],
     ) -> None:
-        """Test that polite delay is applied before 2nd and subsequent requests."""
+        """Test that polite delay is applied before every request."""
         source = MacroNewsSource(keywords_file=sample_keywords_file)
 
         mock_search = MagicMock()
@@ -412,17 +412,17 @@ class TestFetchAllPoliteDelay:
             mock_yf.Search.return_value = mock_search
             source.fetch_all(["Federal Reserve", "GDP growth", "trade war"], count=5)
 
-        # apply_polite_delay should be called 2 times (before 2nd and 3rd requests)
-        assert mock_delay.call_count == 2
+        # apply_polite_delay waits for a Yahoo Finance slot before each request
+        assert mock_delay.call_count == 3
 
     @patch("news.sources.yfinance.base.apply_polite_delay")
-    def test_正常系_単一クエリでディレイが適用されない(
+    def test_正常系_単一クエリではスロット待機が1回(
         self,
         mock_delay: MagicMock,
         sample_keywords_file: Path,
         sample_search_news_data: list[dict[str, Any]],
     ) -> None:
-        """Test that polite delay is not applied for a single query."""
+        """Test that a single query waits for one request slot only."""
         source = MacroNewsSource(keywords_file=sample_keywords_file)
 
         mock_search = MagicMock()
@@ -432,8 +432,8 @@ class TestFetchAllPoliteDelay:
             mock_yf.Search.return_value = mock_search
             source.fetch_all(["Federal Reserve"], count=5)
 
-        # apply_polite_delay should not be called for a single query
-        mock_delay.assert_not_called()
+        # The first request slot is free after an idle period
+        mock_delay.assert_called_once()
 
 
 class TestMacroNewsSourceProtocol:
@@ -3089,3 +3089,194 @@ class TestSummarizerEmptyResponseAndRetry:
                 await summarizer._call_claude_sdk("テスト")
 
             assert exc_info.value.reason == "result_message_error"
+
+
+class TestSummarizerCache:
+    """Tests for the content-addressed summary cache in Summarizer."""
+
+    RESPONSE = """{
+        "overview": "S&P 500が上昇した。",
+        "key_points": ["ポイント1"],
+        "market_impact": "市場への影響"
+    }"""
+
+    @pytest.fixture
+    def cache_config(
+        self, sample_config: NewsWorkflowConfig, tmp_path: Any
+    ) -> NewsWorkflowConfig:
+        """Config with the summary cache enabled under tmp_path."""
+        summarization = sample_config.summarization.model_copy(
+            update={"cache_dir": str(tmp_path / "summaries")}
+        )
+        return sample_config.model_copy(update={"summarization": summarization})
+
+    @staticmethod
+    def _with_url(article: ExtractedArticle, url: str) -> ExtractedArticle:
+        collected = article.collected.model_copy(update={"url": url})
+        return article.model_copy(update={"collected": collected})
+
+    def _mock_sdk(self, summarizer: Any) -> AsyncMock:
+        async def call(prompt: str) -> str:
+            summarizer._call_metadata[prompt] = {
+                "model": "claude-test",
+                "usage": {"input_tokens": 120, "output_tokens": 40},
+                "total_cost_usd": 0.002,
+            }
+            return self.RESPONSE
+
+        return AsyncMock(side_effect=call)
+
+    def test_正常系_cache_dir未設定ではキャッシュ無効(
+        self, sample_config: NewsWorkflowConfig
+    ) -> None:
+        """Cache should be disabled unless cache_dir is configured."""
+        from news.summarizer import Summarizer
+
+        assert Summarizer(config=sample_config)._cache is None
+
+    @pytest.mark.asyncio
+    async def test_正常系_2回目の要約はキャッシュから返す(
+        self,
+        cache_config: NewsWorkflowConfig,
+        extracted_article_with_body: ExtractedArticle,
+    ) -> None:
+        """A second summarize() of the same content should not call Claude."""
+        from news.summarizer import Summarizer
+
+        summarizer = Summarizer(config=cache_config)
+        mock_call = self._mock_sdk(summarizer)
+
+        with patch.object(summarizer, "_call_claude_sdk", mock_call):
+            first = await summarizer.summarize(extracted_article_with_body)
+            second = await Summarizer(config=cache_config).summarize(
+                extracted_article_with_body
+            )
+
+        assert mock_call.await_count == 1
+        assert second.summarization_status == SummarizationStatus.SUCCESS
+        assert second.summary == first.summary
+
+    @pytest.mark.asyncio
+    async def test_正常系_モデルと使用量を記録する(
+        self,
+        cache_config: NewsWorkflowConfig,
+        extracted_article_with_body: ExtractedArticle,
+    ) -> None:
+        """Cache entries should record model, timing and token usage."""
+        from news.summarizer import Summarizer
+
+        summarizer = Summarizer(config=cache_config)
+        assert extracted_article_with_body.body_text is not None
+
+        with patch.object(summarizer, "_call_claude_sdk", self._mock_sdk(summarizer)):
+            await summarizer.summarize(extracted_article_with_body)
+
+        assert summarizer._cache is not None
+        entry = summarizer._cache.get(
+            summarizer._cache_key(extracted_article_with_body.body_text)
+        )
+        assert entry is not None
+        assert entry.model == "claude-test"
+        assert entry.usage == {"input_tokens": 120, "output_tokens": 40}
+        assert entry.total_cost_usd == 0.002
+        assert entry.duration_ms is not None
+        assert entry.source_url == "https://www.cnbc.com/article/123"
+        assert summarizer._call_metadata == {}
+
+    @pytest.mark.asyncio
+    async def test_正常系_バッチ内の同一本文は1回だけ要約する(
+        self,
+        cache_config: NewsWorkflowConfig,
+        extracted_article_with_body: ExtractedArticle,
+        extracted_article_no_body: ExtractedArticle,
+    ) -> None:
+        """Syndicated copies in one batch should share a single Claude call."""
+        from news.summarizer import Summarizer
+
+        syndicated = self._with_url(
+            extracted_article_with_body, "https://finance.yahoo.com/news/123"
+        )
+        articles = [extracted_article_with_body, extracted_article_no_body, syndicated]
+        summarizer = Summarizer(config=cache_config)
+        mock_call = self._mock_sdk(summarizer)
+
+        with patch.object(summarizer, "_call_claude_sdk", mock_call):
+            results = await summarizer.summarize_batch(articles)
+
+        assert mock_call.await_count == 1
+        assert [r.summarization_status for r in results] == [
+            SummarizationStatus.SUCCESS,
+            SummarizationStatus.SKIPPED,
+            SummarizationStatus.SUCCESS,
+        ]
+        assert [r.extracted for r in results] == articles
+
+    @pytest.mark.asyncio
+    async def test_正常系_再実行のバッチはClaudeを呼び出さない(
+        self,
+        cache_config: NewsWorkflowConfig,
+        extracted_article_with_body: ExtractedArticle,
+    ) -> None:
+        """A re-run over the same articles should be served from the cache."""
+        from news.summarizer import Summarizer
+
+        other = extracted_article_with_body.model_copy(
+            update={"body_text": "Another article about bond yields."}
+        )
+        first_run = Summarizer(config=cache_config)
+        with patch.object(first_run, "_call_claude_sdk", self._mock_sdk(first_run)):
+            await first_run.summarize_batch([extracted_article_with_body, other])
+
+        rerun = Summarizer(config=cache_config)
+        mock_call = self._mock_sdk(rerun)
+        with patch.object(rerun, "_call_claude_sdk", mock_call):
+            results = await rerun.summarize_batch([extracted_article_with_body, other])
+
+        mock_call.assert_not_awaited()
+        assert all(
+            r.summarization_status == SummarizationStatus.SUCCESS for r in results
+        )
+
+    @pytest.mark.asyncio
+    async def test_正常系_プロンプトテンプレート変更でキャッシュミス(
+        self,
+        cache_config: NewsWorkflowConfig,
+        extracted_article_with_body: ExtractedArticle,
+    ) -> None:
+        """Changing the prompt template should invalidate cached summaries."""
+        from news.summarizer import Summarizer
+
+        summarizer = Summarizer(config=cache_config)
+        with patch.object(summarizer, "_call_claude_sdk", self._mock_sdk(summarizer)):
+            await summarizer.summarize(extracted_article_with_body)
+
+        summarization = cache_config.summarization.model_copy(
+            update={"prompt_template": "New template: {body}"}
+        )
+        updated = Summarizer(
+            config=cache_config.model_copy(update={"summarization": summarization})
+        )
+        mock_call = self._mock_sdk(updated)
+        with patch.object(updated, "_call_claude_sdk", mock_call):
+            await updated.summarize(extracted_article_with_body)
+
+        assert mock_call.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_異常系_失敗した要約はキャッシュしない(
+        self,
+        cache_config: NewsWorkflowConfig,
+        extracted_article_with_body: ExtractedArticle,
+    ) -> None:
+        """Failed summaries should not be written to the cache."""
+        from news.summarizer import Summarizer
+
+        summarizer = Summarizer(config=cache_config)
+        with patch.object(
+            summarizer, "_call_claude_sdk", AsyncMock(return_value="not json")
+        ):
+            result = await summarizer.summarize(extracted_article_with_body)
+
+        assert result.summarization_status == SummarizationStatus.FAILED
+        assert summarizer._cache is not None
+        assert not summarizer._cache.cache_dir.exists()
@@ -0,0 +1,99 @@
+"""Unit tests for the summary_cache module."""
+
+from pathlib import Path
+
+import pytest
+
+from news.models import StructuredSummary
+from news.summary_cache import CachedSummary, SummaryCache, normalize_content
+
+
+@pytest.fixture
+def summary() -> StructuredSummary:
+    """Create a sample StructuredSummary."""
+    return StructuredSummary(
+        overview="S&P 500が上昇した。",
+        key_points=["ポイント1", "ポイント2"],
+        market_impact="市場への影響",
+    )
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> SummaryCache:
+    """Create a SummaryCache under tmp_path."""
+    return SummaryCache(tmp_path / "summaries")
+
+
+class TestNormalizeContent:
+    """Tests for normalize_content()."""
+
+    def test_正常系_空白と全角文字を正規化する(self) -> None:
+        """Whitespace runs collapse and full-width characters are NFKC-normalized."""
+        assert normalize_content("  Ｓ＆Ｐ 500\n\n\t rose ") == "S&P 500 rose"
+
+
+class TestSummaryCacheKey:
+    """Tests for SummaryCache.key_for()."""
+
+    def test_正常系_書式だけ異なる本文は同じキー(self) -> None:
+        """Bodies differing only in whitespace should share a key."""
+        assert SummaryCache.key_for("Stocks  rose.\n", "1:abc") == (
+            SummaryCache.key_for("Stocks rose.", "1:abc")
+        )
+
+    def test_正常系_本文またはプロンプトバージョンが異なればキーも異なる(self) -> None:
+        """Key should change with the content and the prompt version."""
+        key = SummaryCache.key_for("Stocks rose.", "1:abc")
+
+        assert key != SummaryCache.key_for("Stocks fell.", "1:abc")
+        assert key != SummaryCache.key_for("Stocks rose.", "2:abc")
+
+
+class TestSummaryCacheStorage:
+    """Tests for SummaryCache.get() / put()."""
+
+    def test_正常系_保存した要約を取得できる(
+        self, cache: SummaryCache, summary: StructuredSummary
+    ) -> None:
+        """put() then get() should round-trip the entry."""
+        key = SummaryCache.key_for("body", "1:abc")
+        entry = CachedSummary(
+            key=key,
+            prompt_version="1:abc",
+            summary=summary,
+            model="claude-test",
+            usage={"input_tokens": 100, "output_tokens": 20},
+        )
+
+        cache.put(entry)
+
+        assert cache.get(key) == entry
+        assert (cache.cache_dir / key[:2] / f"{key}.json").exists()
+        assert cache.hits == 1
+
+    def test_正常系_未登録のキーはNone(self, cache: SummaryCache) -> None:
+        """get() should return None and count a miss for unknown keys."""
+        assert cache.get("0" * 64) is None
+        assert cache.misses == 1
+
+    def test_異常系_壊れたエントリは無視する(self, cache: SummaryCache) -> None:
+        """Unreadable entries should be treated as misses."""
+        key = "ab" + "0" * 62
+        path = cache.cache_dir / key[:2] / f"{key}.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{broken")
+
+        assert cache.get(key) is None
+        assert cache.misses == 1
+
+    def test_異常系_書き込み失敗でも例外を送出しない(
+        self, tmp_path: Path, summary: StructuredSummary
+    ) -> None:
+        """put() should log and swallow write errors."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = SummaryCache(blocker)
+
+        cache.put(CachedSummary(key="ab" * 32, prompt_version="1", summary=summary))
+
+        assert cache.get("ab" * 32) is None
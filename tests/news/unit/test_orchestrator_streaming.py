@@ -0,0 +1,362 @@
+"""Unit tests for the streaming execution mode of NewsWorkflowOrchestrator.
+
+With ``pipeline.streaming`` enabled, collection, extraction, summarization
+and per-article publishing run concurrently, connected by bounded queues.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from news.config.models import (
+    NewsWorkflowConfig,
+    PipelineConfig,
+    PublishingConfig,
+    SummarizationConfig,
+)
+from news.models import (
+    ArticleSource,
+    CategoryPublishResult,
+    CollectedArticle,
+    ExtractedArticle,
+    ExtractionStatus,
+    PublicationStatus,
+    PublishedArticle,
+    SourceType,
+    StructuredSummary,
+    SummarizationStatus,
+    SummarizedArticle,
+)
+
+# --- Helpers ---
+
+
+def _make_config(
+    tmp_path: Path,
+    publish_format: str = "per_article",
+    queue_size: int = 20,
+) -> NewsWorkflowConfig:
+    return NewsWorkflowConfig(
+        version="1.0",
+        status_mapping={"market": "index", "tech": "ai"},
+        github_status_ids={"index": "test-index-id", "ai": "test-ai-id"},
+        rss={"presets_file": "data/config/rss-presets.json"},  # type: ignore[arg-type]
+        summarization=SummarizationConfig(
+            prompt_template="Summarize this article in Japanese: {body}",
+        ),
+        github={  # type: ignore[arg-type]
+            "project_number": 15,
+            "project_id": "PVT_test",
+            "status_field_id": "PVTSSF_test",
+            "published_date_field_id": "PVTF_test",
+            "repository": "YH-05/finance",
+        },
+        output={"result_dir": str(tmp_path)},  # type: ignore[arg-type]
+        publishing=PublishingConfig(format=publish_format, export_markdown=False),
+        pipeline=PipelineConfig(streaming=True, queue_size=queue_size),
+    )
+
+
+def _collected(index: int, category: str = "market") -> CollectedArticle:
+    return CollectedArticle(
+        url=f"https://www.cnbc.com/article/{index}",  # type: ignore[arg-type]
+        title=f"Article {index}",
+        source=ArticleSource(
+            source_type=SourceType.RSS,
+            source_name="CNBC",
+            category=category,
+        ),
+        collected_at=datetime.now(tz=timezone.utc),
+    )
+
+
+async def _extract(article: CollectedArticle) -> ExtractedArticle:
+    failed = article.title.endswith("fail")
+    return ExtractedArticle(
+        collected=article,
+        body_text=None if failed else "Content",
+        extraction_status=ExtractionStatus.FAILED
+        if failed
+        else ExtractionStatus.SUCCESS,
+        extraction_method="trafilatura",
+        error_message="extraction error" if failed else None,
+    )
+
+
+async def _summarize(article: ExtractedArticle) -> SummarizedArticle:
+    return SummarizedArticle(
+        extracted=article,
+        summary=StructuredSummary(
+            overview="Test", key_points=["Point"], market_impact="Impact"
+        ),
+        summarization_status=SummarizationStatus.SUCCESS,
+    )
+
+
+async def _publish(
+    article: SummarizedArticle, existing_urls: set[str], dry_run: bool = False
+) -> PublishedArticle:
+    return PublishedArticle(
+        summarized=article,
+        issue_number=None,
+        issue_url=None,
+        publication_status=PublicationStatus.SUCCESS,
+    )
+
+
+def _feeds(*batches: list[CollectedArticle]) -> MagicMock:
+    """iter_collect のモック（フィードごとに記事リストをyieldする）。"""
+
+    async def iter_collect(max_age_hours: int = 168) -> AsyncIterator:
+        for batch in batches:
+            await asyncio.sleep(0)
+            yield batch
+
+    return MagicMock(side_effect=iter_collect)
+
+
+@pytest.fixture
+def components() -> dict[str, MagicMock]:
+    """ストリーミング実行用にモックしたパイプラインコンポーネント。"""
+    collector = MagicMock()
+    collector.feed_errors = []
+    collector.iter_collect = _feeds([_collected(1), _collected(2)], [_collected(3)])
+
+    extractor = MagicMock()
+    extractor.extract = AsyncMock(side_effect=_extract)
+
+    summarizer = MagicMock()
+    summarizer.summarize = AsyncMock(side_effect=_summarize)
+
+    publisher = MagicMock()
+    publisher.get_existing_urls = AsyncMock(return_value=set())
+    publisher.is_duplicate_url = MagicMock(
+        side_effect=lambda url, existing: url in existing
+    )
+    publisher.publish_checked = AsyncMock(side_effect=_publish)
+    return {
+        "collector": collector,
+        "extractor": extractor,
+        "summarizer": summarizer,
+        "publisher": publisher,
+    }
+
+
+async def _run(
+    config: NewsWorkflowConfig, components: dict[str, MagicMock], **kwargs: object
+):
+    from news.orchestrator import NewsWorkflowOrchestrator
+
+    with (
+        patch("news.orchestrator.RSSCollector", return_value=components["collector"]),
+        patch(
+            "news.orchestrator.TrafilaturaExtractor",
+            return_value=components["extractor"],
+        ),
+        patch("news.orchestrator.Summarizer", return_value=components["summarizer"]),
+        patch("news.orchestrator.Publisher", return_value=components["publisher"]),
+    ):
+        orchestrator = NewsWorkflowOrchestrator(config=config)
+        return await orchestrator.run(**kwargs)  # type: ignore[arg-type]
+
+
+# --- Tests ---
+
+
+class TestPipelineConfig:
+    """Tests for the PipelineConfig model."""
+
+    def test_正常系_デフォルトはステージ実行(self) -> None:
+        """PipelineConfig should default to the staged mode."""
+        config = PipelineConfig()
+
+        assert config.streaming is False
+        assert config.queue_size == 20
+        assert config.publish_concurrency == 1
+
+    def test_異常系_queue_sizeが0でValidationError(self) -> None:
+        """queue_size must be at least 1."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            PipelineConfig(queue_size=0)
+
+
+class TestOrchestratorStreaming:
+    """Tests for run() with pipeline.streaming enabled."""
+
+    @pytest.mark.asyncio
+    async def test_正常系_全記事が全ステージを通過する(
+        self, tmp_path: Path, components: dict[str, MagicMock]
+    ) -> None:
+        """Every article should be extracted, summarized and published."""
+        result = await _run(_make_config(tmp_path), components)
+
+        assert result.total_collected == 3
+        assert result.total_extracted == 3
+        assert result.total_summarized == 3
+        assert result.total_published == 3
+        assert components["summarizer"].summarize_batch.call_count == 0
+        assert [m.stage for m in result.stage_metrics] == [
+            "collection",
+            "extraction",
+            "summarization",
+            "publishing",
+        ]
+        assert [m.item_count for m in result.stage_metrics] == [3, 3, 3, 3]
+
+    @pytest.mark.asyncio
+    async def test_正常系_抽出失敗の記事は要約に渡さない(
+        self, tmp_path: Path, components: dict[str, MagicMock]
+    ) -> None:
+        """Failed extractions should be recorded and not summarized."""
+        failed = _collected(9)
+        failed = failed.model_copy(update={"title": "Article fail"})
+        components["collector"].iter_collect = _feeds([_collected(1), failed])
+
+        result = await _run(_make_config(tmp_path), components)
+
+        assert result.total_extracted == 1
+        assert components["summarizer"].summarize.call_count == 1
+        assert len(result.extraction_failures) == 1
+        assert result.extraction_failures[0].error == "extraction error"
+
+    @pytest.mark.asyncio
+    async def test_正常系_ステータスフィルタと件数制限と重複除外を適用する(
+        self, tmp_path: Path, components: dict[str, MagicMock]
+    ) -> None:
+        """Status filter, max_articles and early dedup should match staged mode."""
+        components["collector"].iter_collect = _feeds(
+            [_collected(1), _collected(2, "tech"), _collected(3)],
+            [_collected(4), _collected(5)],
+        )
+        components["publisher"].get_existing_urls = AsyncMock(
+            return_value={"https://www.cnbc.com/article/3"}
+        )
+
+        result = await _run(
+            _make_config(tmp_path), components, statuses=["index"], max_articles=3
+        )
+
+        # index の記事 1, 3, 4 が上限3件に入り、3は既存Issueと重複
+        processed = [
+            str(p.summarized.extracted.collected.url) for p in result.published_articles
+        ]
+        assert sorted(processed) == [
+            "https://www.cnbc.com/article/1",
+            "https://www.cnbc.com/article/4",
+        ]
+        assert result.total_early_duplicates == 1
+
+    @pytest.mark.asyncio
+    async def test_正常系_抽出と要約が並行して進む(
+        self, tmp_path: Path, components: dict[str, MagicMock]
+    ) -> None:
+        """Summarization should start before the last extraction finishes."""
+        events: list[str] = []
+
+        async def slow_extract(article: CollectedArticle) -> ExtractedArticle:
+            await asyncio.sleep(0.02)
+            events.append(f"extracted:{article.title}")
+            return await _extract(article)
+
+        async def record_summarize(article: ExtractedArticle) -> SummarizedArticle:
+            events.append(f"summarize:{article.collected.title}")
+            return await _summarize(article)
+
+        components["collector"].iter_collect = _feeds(
+            [_collected(i) for i in range(1, 5)]
+        )
+        components["extractor"].extract = AsyncMock(side_effect=slow_extract)
+        components["summarizer"].summarize = AsyncMock(side_effect=record_summarize)
+        config = _make_config(tmp_path)
+        config.extraction.concurrency = 1
+
+        await _run(config, components)
+
+        assert events.index("summarize:Article 1") < events.index("extracted:Article 4")
+
+    @pytest.mark.asyncio
+    async def test_正常系_キューが満杯なら上流が待機する(
+        self, tmp_path: Path, components: dict[str, MagicMock]
+    ) -> None:
+        """A blocked summarizer should stop extraction via bounded queues."""
+        release = asyncio.Event()
+        extracted_count = {"count": 0}
+
+        async def counting_extract(article: CollectedArticle) -> ExtractedArticle:
+            extracted_count["count"] += 1
+            return await _extract(article)
+
+        async def blocked_summarize(article: ExtractedArticle) -> SummarizedArticle:
+            await release.wait()
+            return await _summarize(article)
+
+        components["collector"].iter_collect = _feeds(
+            [_collected(i) for i in range(1, 21)]
+        )
+        components["extractor"].extract = AsyncMock(side_effect=counting_extract)
+        components["summarizer"].summarize = AsyncMock(side_effect=blocked_summarize)
+        config = _make_config(tmp_path, queue_size=1)
+        config.extraction.concurrency = 1
+        config.summarization.concurrency = 1
+
+        task = asyncio.create_task(_run(config, components))
+        for _ in range(50):
+            await asyncio.sleep(0)
+
+        # 要約中1件 + キュー1件 + キューへの投入待ち1件
+        assert extracted_count["count"] == 3
+        release.set()
+        result = await task
+        assert result.total_published == 20
+
+    @pytest.mark.asyncio
+    async def test_正常系_per_categoryはストリーム後にグループ化して公開する(
+        self, tmp_path: Path, components: dict[str, MagicMock]
+    ) -> None:
+        """per_category format should group and publish after the stream."""
+        components["publisher"].publish_category_batch = AsyncMock(
+            return_value=[
+                CategoryPublishResult(
+                    category="index",
+                    category_label="株価指数",
+                    date="2026-01-15",
+                    issue_number=1,
+                    issue_url="https://github.com/YH-05/finance/issues/1",
+                    article_count=3,
+                    status=PublicationStatus.SUCCESS,
+                )
+            ]
+        )
+
+        result = await _run(_make_config(tmp_path, "per_category"), components)
+
+        assert components["publisher"].publish_checked.call_count == 0
+        groups = components["publisher"].publish_category_batch.call_args.args[0]
+        assert sum(len(g.articles) for g in groups) == 3
+        assert len(result.category_results) == 1
+        assert [m.stage for m in result.stage_metrics] == [
+            "collection",
+            "extraction",
+            "summarization",
+            "grouping",
+            "publishing",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_エッジケース_記事なしで空の結果を返す(
+        self, tmp_path: Path, components: dict[str, MagicMock]
+    ) -> None:
+        """No collected articles should produce an empty result."""
+        components["collector"].iter_collect = _feeds()
+
+        result = await _run(_make_config(tmp_path), components)
+
+        assert result.total_collected == 0
+        assert components["extractor"].extract.call_count == 0
+        assert result.stage_metrics[0].stage == "collection"
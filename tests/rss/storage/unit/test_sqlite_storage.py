@@ -0,0 +1,373 @@
+"""Unit tests for SQLiteStorage, open_storage and the JSON migration."""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from rss.storage.backend import open_storage
+from rss.storage.json_storage import JSONStorage
+from rss.storage.sqlite_storage import (
+    DB_FILENAME,
+    SQLiteStorage,
+    migrate_json_to_sqlite,
+)
+from rss.types import (
+    Feed,
+    FeedItem,
+    FeedItemsData,
+    FeedsData,
+    FetchInterval,
+    FetchStatus,
+)
+
+
+def _feed(feed_id: str, category: str = "finance") -> Feed:
+    return Feed(
+        feed_id=feed_id,
+        url=f"https://example.com/{feed_id}.xml",
+        title=f"Feed {feed_id}",
+        category=category,
+        fetch_interval=FetchInterval.DAILY,
+        created_at="2026-01-14T10:00:00Z",
+        updated_at="2026-01-14T10:00:00Z",
+        last_fetched=None,
+        last_status=FetchStatus.PENDING,
+        enabled=True,
+    )
+
+
+def _item(item_id: str, published: str | None = "2026-01-14T10:00:00Z") -> FeedItem:
+    return FeedItem(
+        item_id=item_id,
+        title=f"Article {item_id}",
+        link=f"https://example.com/{item_id}",
+        published=published,
+        summary="Summary",
+        content=None,
+        author="Author",
+        fetched_at="2026-01-14T12:00:00Z",
+    )
+
+
+class TestSQLiteStorageInit:
+    """Test SQLiteStorage initialization."""
+
+    def test_init_creates_database_in_wal_mode(self, tmp_path: Path) -> None:
+        """Test that the database is created in WAL mode."""
+        storage = SQLiteStorage(tmp_path)
+
+        assert storage.db_path == tmp_path / DB_FILENAME
+        with sqlite3.connect(storage.db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_init_invalid_data_dir_type(self) -> None:
+        """Test initialization with invalid data_dir type."""
+        with pytest.raises(ValueError, match="data_dir must be a Path object"):
+            SQLiteStorage("invalid")  # type: ignore[arg-type]
+
+
+class TestFeeds:
+    """Test feed registry operations."""
+
+    def test_save_and_load_feeds_roundtrip(self, tmp_path: Path) -> None:
+        """Test that feeds round-trip with Enum and bool values and order."""
+        storage = SQLiteStorage(tmp_path)
+        feeds = [_feed("b"), _feed("a")]
+        feeds[1].enabled = False
+        feeds[1].etag = '"v1"'
+
+        storage.save_feeds(FeedsData(version="1.0", feeds=feeds))
+        loaded = storage.load_feeds()
+
+        assert loaded.feeds == feeds
+
+    def test_update_feed_updates_single_row(self, tmp_path: Path) -> None:
+        """Test that update_feed changes only the target feed."""
+        storage = SQLiteStorage(tmp_path)
+        storage.save_feeds(FeedsData(version="1.0", feeds=[_feed("a"), _feed("b")]))
+
+        updated = storage.update_feed(
+            "a",
+            {"last_status": FetchStatus.SUCCESS, "last_fetched": "2026-01-15"},
+        )
+
+        assert updated is True
+        feed_a = storage.get_feed("a")
+        assert feed_a is not None
+        assert feed_a.last_status == FetchStatus.SUCCESS
+        assert feed_a.last_fetched == "2026-01-15"
+        assert storage.get_feed("b") == _feed("b")
+
+    def test_update_feed_not_found(self, tmp_path: Path) -> None:
+        """Test that update_feed returns False for an unknown feed."""
+        storage = SQLiteStorage(tmp_path)
+
+        assert storage.update_feed("missing", {"title": "x"}) is False
+
+    def test_update_feed_rejects_unknown_field(self, tmp_path: Path) -> None:
+        """Test that update_feed rejects fields that are not Feed attributes."""
+        storage = SQLiteStorage(tmp_path)
+
+        with pytest.raises(ValueError, match="Cannot update feed fields"):
+            storage.update_feed("a", {"title = 'x'; --": "x"})
+
+
+class TestItems:
+    """Test item operations."""
+
+    def test_append_items_ignores_known_links(self, tmp_path: Path) -> None:
+        """Test that append_items inserts only new links ahead of stored ones."""
+        storage = SQLiteStorage(tmp_path)
+        storage.append_items("feed", [_item("1"), _item("2")])
+
+        count = storage.append_items("feed", [_item("3"), _item("1")])
+
+        assert count == 3
+        ids = [item.item_id for item in storage.load_items("feed").items]
+        assert ids == ["3", "1", "2"]
+
+    def test_find_items_by_link(self, tmp_path: Path) -> None:
+        """Test looking up stored items by link."""
+        storage = SQLiteStorage(tmp_path)
+        storage.append_items("feed", [_item("1"), _item("2")])
+
+        found = storage.find_items_by_link(
+            "feed", ["https://example.com/2", "https://example.com/9"]
+        )
+
+        assert [item.item_id for item in found] == ["2"]
+
+    def test_list_items_matches_json_storage(self, tmp_path: Path) -> None:
+        """Test that sorting and pagination match JSONStorage."""
+        items_a = [
+            _item("a1", "2026-01-10T00:00:00Z"),
+            _item("a2", None),
+            _item("a3", "2026-01-12T00:00:00Z"),
+        ]
+        items_b = [_item("b1", "2026-01-12T00:00:00Z"), _item("b2", None)]
+        feeds = FeedsData(version="1.0", feeds=[_feed("a"), _feed("b")])
+
+        json_storage = JSONStorage(tmp_path / "json")
+        sqlite_storage = SQLiteStorage(tmp_path / "sqlite")
+        for storage in (json_storage, sqlite_storage):
+            storage.save_feeds(feeds)
+            storage.save_items("a", FeedItemsData("1.0", "a", items_a))
+            storage.save_items("b", FeedItemsData("1.0", "b", items_b))
+
+        for limit, offset in ((None, 0), (2, 0), (2, 3)):
+            assert sqlite_storage.list_items(
+                limit=limit, offset=offset
+            ) == json_storage.list_items(limit=limit, offset=offset)
+        assert sqlite_storage.list_items("a") == json_storage.list_items("a")
+
+    def test_delete_items(self, tmp_path: Path) -> None:
+        """Test deleting all items of a feed."""
+        storage = SQLiteStorage(tmp_path)
+        storage.append_items("feed", [_item("1")])
+
+        storage.delete_items("feed")
+
+        assert storage.count_items("feed") == 0
+
+    def test_save_items_feed_id_mismatch(self, tmp_path: Path) -> None:
+        """Test that save_items validates feed_id like JSONStorage."""
+        storage = SQLiteStorage(tmp_path)
+
+        with pytest.raises(ValueError, match="must match feed_id"):
+            storage.save_items("a", FeedItemsData("1.0", "b", []))
+
+
+class TestOpenStorage:
+    """Test storage backend selection."""
+
+    def test_auto_selects_json_without_database(self, tmp_path: Path) -> None:
+        """Test that JSON is used when rss.db does not exist."""
+        assert isinstance(open_storage(tmp_path), JSONStorage)
+
+    def test_auto_selects_sqlite_with_database(self, tmp_path: Path) -> None:
+        """Test that SQLite is used once rss.db exists."""
+        SQLiteStorage(tmp_path)
+
+        assert isinstance(open_storage(tmp_path), SQLiteStorage)
+
+    def test_unknown_backend(self, tmp_path: Path) -> None:
+        """Test that an unknown backend raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown storage backend"):
+            open_storage(tmp_path, "yaml")  # type: ignore[arg-type]
+
+
+class TestMigrateJsonToSqlite:
+    """Test migrate_json_to_sqlite."""
+
+    def test_migrate_copies_feeds_and_items(self, tmp_path: Path) -> None:
+        """Test that feeds and items (including unregistered feeds) migrate."""
+        json_storage = JSONStorage(tmp_path)
+        json_storage.save_feeds(FeedsData(version="1.0", feeds=[_feed("a")]))
+        json_storage.save_items("a", FeedItemsData("1.0", "a", [_item("1")]))
+        json_storage.save_items(
+            "orphan", FeedItemsData("1.0", "orphan", [_item("2"), _item("2")])
+        )
+
+        result = migrate_json_to_sqlite(tmp_path)
+
+        assert (result.feeds, result.items, result.skipped_items) == (1, 2, 1)
+        storage = open_storage(tmp_path)
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.load_feeds().feeds == json_storage.load_feeds().feeds
+        assert storage.load_items("a") == json_storage.load_items("a")
+        # JSON ファイルはバックアップとして残る
+        assert json.loads((tmp_path / "feeds.json").read_text())["feeds"]
+
+    def test_migrate_refuses_existing_database(self, tmp_path: Path) -> None:
+        """Test that an existing database is not replaced without overwrite."""
+        SQLiteStorage(tmp_path)
+
+        with pytest.raises(FileExistsError):
+            migrate_json_to_sqlite(tmp_path)
+
+        result = migrate_json_to_sqlite(tmp_path, overwrite=True)
+        assert result.feeds == 0
+
+    def test_migrate_failure_leaves_no_partial_database(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an interrupted migration is never picked up by open_storage."""
+        json_storage = JSONStorage(tmp_path)
+        json_storage.save_feeds(FeedsData(version="1.0", feeds=[_feed("a")]))
+        json_storage.save_items("a", FeedItemsData("1.0", "a", [_item("1")]))
+
+        def fail(*_args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(SQLiteStorage, "save_items", fail)
+
+        with pytest.raises(OSError, match="disk full"):
+            migrate_json_to_sqlite(tmp_path)
+
+        assert list(tmp_path.glob(f"{DB_FILENAME}*")) == []
+        assert isinstance(open_storage(tmp_path), JSONStorage)
+
+
+class TestSearchItems:
+    """Test full-text search with the FTS5 index."""
+
+    @pytest.fixture
+    def storages(self, tmp_path: Path) -> tuple[JSONStorage, SQLiteStorage]:
+        """JSON and SQLite storages holding the same feeds and items."""
+        items_a = [
+            FeedItem(
+                item_id="a1",
+                title="Bitcoin surges to record",
+                link="https://example.com/a1",
+                published="2026-01-10T00:00:00Z",
+                summary="Bitcoin and bitcoin ETFs rally",
+                content=None,
+                author="Alice",
+                fetched_at="2026-01-14T12:00:00Z",
+            ),
+            FeedItem(
+                item_id="a2",
+                title="日銀が金融政策を維持",
+                link="https://example.com/a2",
+                published="2026-01-12T00:00:00Z",
+                summary="ビットコイン市場は横ばい",
+                content="Bitcoin mentioned once",
+                author="Bob",
+                fetched_at="2026-01-14T12:00:00Z",
+            ),
+        ]
+        items_b = [
+            FeedItem(
+                item_id="b1",
+                title="Fed holds rates",
+                link="https://example.com/b1",
+                published=None,
+                summary="FOMC statement",
+                content=None,
+                author="Carol",
+                fetched_at="2026-01-14T12:00:00Z",
+            ),
+        ]
+        feeds = FeedsData(
+            version="1.0", feeds=[_feed("a", "crypto"), _feed("b", "macro")]
+        )
+        json_storage = JSONStorage(tmp_path / "json")
+        sqlite_storage = SQLiteStorage(tmp_path / "sqlite")
+        for storage in (json_storage, sqlite_storage):
+            storage.save_feeds(feeds)
+            storage.save_items("a", FeedItemsData("1.0", "a", items_a))
+            storage.save_items("b", FeedItemsData("1.0", "b", items_b))
+        return json_storage, sqlite_storage
+
+    @pytest.mark.parametrize(
+        "query, kwargs",
+        [
+            ("bitcoin", {}),
+            ("BITCOIN", {"fields": ["title"]}),
+            ("ビットコイン", {}),
+            ("fo", {}),
+            ("bob", {"fields": ["author"]}),
+            ("", {"category": "macro"}),
+            ("bitcoin", {"since": "2026-01-11", "until": "2026-01-13"}),
+            ("nothing-matches", {}),
+        ],
+    )
+    def test_search_matches_json_storage(
+        self,
+        storages: tuple[JSONStorage, SQLiteStorage],
+        query: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Test that the index returns the same items as the JSON scan."""
+        json_storage, sqlite_storage = storages
+
+        expected = {item.item_id for item in json_storage.search_items(query, **kwargs)}
+        actual = {item.item_id for item in sqlite_storage.search_items(query, **kwargs)}
+
+        assert actual == expected
+
+    def test_search_ranks_by_relevance(
+        self, storages: tuple[JSONStorage, SQLiteStorage]
+    ) -> None:
+        """Test that items with more matches rank first."""
+        _, sqlite_storage = storages
+
+        results = sqlite_storage.search_items("bitcoin")
+
+        assert [item.item_id for item in results] == ["a1", "a2"]
+
+    def test_search_prefix_query(
+        self, storages: tuple[JSONStorage, SQLiteStorage]
+    ) -> None:
+        """Test that a trailing * is accepted as a prefix marker."""
+        _, sqlite_storage = storages
+
+        results = sqlite_storage.search_items("Bitc*", limit=1)
+
+        assert [item.item_id for item in results] == ["a1"]
+
+    def test_index_follows_append_and_delete(self, tmp_path: Path) -> None:
+        """Test that the index is updated incrementally by item writes."""
+        storage = SQLiteStorage(tmp_path)
+        storage.save_feeds(FeedsData(version="1.0", feeds=[_feed("feed")]))
+
+        storage.append_items("feed", [_item("inflation")])
+        assert [i.item_id for i in storage.search_items("inflation")] == ["inflation"]
+
+        storage.delete_items("feed")
+        assert storage.search_items("inflation") == []
+
+    def test_index_is_built_for_existing_items(self, tmp_path: Path) -> None:
+        """Test that a database without the index gets it rebuilt on open."""
+        storage = SQLiteStorage(tmp_path)
+        storage.save_feeds(FeedsData(version="1.0", feeds=[_feed("feed")]))
+        storage.append_items("feed", [_item("tariffs")])
+        with sqlite3.connect(storage.db_path) as conn:
+            conn.execute("DROP TABLE items_fts")
+
+        reopened = SQLiteStorage(tmp_path)
+
+        assert [i.item_id for i in reopened.search_items("tariffs")] == ["tariffs"]
@@ -593,6 +593,44 @@ class TestSearchCommand:
         assert "No items found" in result.output
 
 
+class TestMigrateCommand:
+    """Tests for migrate command."""
+
+    def test_migrate_json_output(
+        self,
+        cli_runner: CliRunner,
+        data_dir: Path,
+        sample_feed: str,
+        sample_items: list[FeedItem],
+    ) -> None:
+        """Test migrating to SQLite and reading items from the new backend."""
+        result = cli_runner.invoke(
+            cli,
+            ["--data-dir", str(data_dir), "migrate", "--json"],
+        )
+        assert result.exit_code == 0
+        data = extract_json(result.output)
+        assert data["feeds"] == 1
+        assert data["items"] == 2
+
+        result = cli_runner.invoke(
+            cli,
+            ["--data-dir", str(data_dir), "search", "-q", "finance"],
+        )
+        assert "Test Article 1" in result.output
+
+    def test_migrate_existing_database(
+        self,
+        cli_runner: CliRunner,
+        data_dir: Path,
+    ) -> None:
+        """Test that migrating twice without --overwrite fails."""
+        cli_runner.invoke(cli, ["--data-dir", str(data_dir), "migrate"])
+        result = cli_runner.invoke(cli, ["--data-dir", str(data_dir), "migrate"])
+        assert result.exit_code == 1
+        assert "--overwrite" in result.output
+
+
 class TestExitCodes:
     """Tests for exit codes."""
 
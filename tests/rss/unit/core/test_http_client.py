@@ -1,5 +1,6 @@
 """Unit tests for HTTPClient."""
 
+import asyncio
 from collections.abc import Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,6 +12,7 @@ from rss.core.http_client import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
     DEFAULT_USER_AGENT,
+    HTTP_NOT_MODIFIED,
     HTTPClient,
 )
 from rss.exceptions import FeedFetchError
@@ -436,3 +438,119 @@ class TestHTTPClientLogging:
         response = await client.fetch("https://example.com")
 
         assert response.status_code == 200
+
+
+class TestHTTPClientConditionalRequest:
+    """Test conditional GET support."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_passes_extra_headers(
+        self,
+        mock_httpx_client: tuple[MagicMock, AsyncMock],
+    ) -> None:
+        """Test that extra headers are sent with the request."""
+        _mock_client_class, mock_client = mock_httpx_client
+        mock_client.get = AsyncMock(return_value=create_mock_response())
+        client = HTTPClient()
+
+        await client.fetch("https://example.com", headers={"If-None-Match": '"v1"'})
+
+        assert mock_client.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_not_modified_without_error(
+        self,
+        mock_httpx_client: tuple[MagicMock, AsyncMock],
+    ) -> None:
+        """Test that 304 Not Modified is returned as a normal response."""
+        _mock_client_class, mock_client = mock_httpx_client
+        mock_client.get = AsyncMock(
+            return_value=create_mock_response(status_code=HTTP_NOT_MODIFIED, text="")
+        )
+        client = HTTPClient()
+
+        response = await client.fetch(
+            "https://example.com", headers={"If-None-Match": '"v1"'}
+        )
+
+        assert response.status_code == HTTP_NOT_MODIFIED
+        assert mock_client.get.call_count == 1
+
+
+class TestHTTPClientPooledSession:
+    """Test the pooled session opened by the async context manager."""
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_one_client(self) -> None:
+        """Test that requests inside a session share one AsyncClient."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            pooled = mock_client_class.return_value
+            pooled.get = AsyncMock(return_value=create_mock_response())
+            pooled.aclose = AsyncMock()
+
+            async with HTTPClient(http2=False) as client:
+                await client.fetch("https://example.com/a")
+                await client.fetch("https://example.com/b")
+
+            assert mock_client_class.call_count == 1
+            assert pooled.get.call_count == 2
+            pooled.aclose.assert_awaited_once()
+            assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_session_configures_limits_and_http2(self) -> None:
+        """Test that the pooled client gets connection limits and HTTP/2."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value.aclose = AsyncMock()
+
+            async with HTTPClient(http2=True, max_connections=8):
+                pass
+
+            kwargs = mock_client_class.call_args.kwargs
+            assert kwargs["http2"] is True
+            assert kwargs["limits"].max_connections == 8
+
+    @pytest.mark.asyncio
+    async def test_nested_sessions_share_outer_client(self) -> None:
+        """Test that nested sessions do not reopen or close the client."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value.aclose = AsyncMock()
+            client = HTTPClient(http2=False)
+
+            async with client:
+                async with client:
+                    pass
+                assert client._client is not None
+
+            assert mock_client_class.call_count == 1
+            mock_client_class.return_value.aclose.assert_awaited_once()
+
+    def test_http2_auto_follows_h2_availability(self) -> None:
+        """Test that http2=None enables HTTP/2 only when h2 is installed."""
+        with patch("rss.core.http_client._http2_available", return_value=False):
+            assert HTTPClient().http2 is False
+        with patch("rss.core.http_client._http2_available", return_value=True):
+            assert HTTPClient().http2 is True
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit_bounds_concurrency(self) -> None:
+        """Test that requests to one host are limited by max_connections_per_host."""
+        active = {"now": 0, "peak": 0}
+
+        async def slow_get(url: str, **kwargs: Any) -> MagicMock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return create_mock_response()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value.get = AsyncMock(side_effect=slow_get)
+            mock_client_class.return_value.aclose = AsyncMock()
+
+            async with HTTPClient(http2=False, max_connections_per_host=2) as client:
+                await asyncio.gather(
+                    *(client.fetch(f"https://example.com/{i}") for i in range(6))
+                )
+
+        assert active["peak"] == 2
@@ -210,6 +210,21 @@ class TestRssSearchItems:
             assert result["query"] == "Bitcoin"
             assert len(result["items"]) == 1
 
+    def test_passes_date_filters(
+        self, monkeypatch: pytest.MonkeyPatch, temp_dir: Path
+    ) -> None:
+        """Should pass since/until to FeedReader.search_items."""
+        monkeypatch.setenv("RSS_DATA_DIR", str(temp_dir))
+
+        with patch("rss.mcp.server.FeedReader") as mock_reader:
+            mock_reader.return_value.search_items.return_value = []
+
+            rss_search_items(query="Fed", since="2026-01-01", until="2026-02-01")
+
+            kwargs = mock_reader.return_value.search_items.call_args.kwargs
+            assert kwargs["since"] == "2026-01-01"
+            assert kwargs["until"] == "2026-02-01"
+
 
 class TestRssAddFeed:
     """Tests for rss_add_feed tool."""
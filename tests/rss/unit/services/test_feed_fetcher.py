@@ -16,6 +16,7 @@ from rss.services.feed_fetcher import (
     FeedFetcher,
 )
 from rss.storage.json_storage import JSONStorage
+from rss.storage.sqlite_storage import SQLiteStorage
 from rss.types import (
     Feed,
     FeedItem,
@@ -150,7 +151,7 @@ class TestFetchFeed:
         assert result.error_message is None
 
         # Verify HTTP client was called
-        mock_http_client.fetch.assert_called_once_with(sample_feed.url)
+        mock_http_client.fetch.assert_called_once_with(sample_feed.url, headers=None)
 
         # Verify parser was called
         mock_parser.parse.assert_called_once()
@@ -521,7 +522,9 @@ class TestFetchAllAsync:
         concurrent_count = 0
         max_observed_concurrent = 0
 
-        async def mock_fetch(url: str) -> HTTPResponse:
+        async def mock_fetch(
+            url: str, headers: dict[str, str] | None = None
+        ) -> HTTPResponse:
             nonlocal concurrent_count, max_observed_concurrent
             concurrent_count += 1
             max_observed_concurrent = max(max_observed_concurrent, concurrent_count)
@@ -598,7 +601,9 @@ class TestFetchAllAsync:
         """Test that one feed failure doesn't affect other feeds."""
         call_count = 0
 
-        async def mock_fetch(url: str) -> HTTPResponse:
+        async def mock_fetch(
+            url: str, headers: dict[str, str] | None = None
+        ) -> HTTPResponse:
             nonlocal call_count
             call_count += 1
             if "feed0" in url:
@@ -772,6 +777,142 @@ class TestFetchAll:
         assert results[0].feed_id == "feed-0"
 
 
+class TestConditionalFetch:
+    """Test conditional GET with stored ETag/Last-Modified validators."""
+
+    @pytest.fixture
+    def cached_feed(self) -> Feed:
+        """Create a feed with stored validators."""
+        return Feed(
+            feed_id="cached-feed",
+            url="https://example.com/feed.xml",
+            title="Cached Feed",
+            category="finance",
+            fetch_interval=FetchInterval.DAILY,
+            created_at="2026-01-14T10:00:00+00:00",
+            updated_at="2026-01-14T10:00:00+00:00",
+            last_fetched="2026-01-14T10:00:00+00:00",
+            last_status=FetchStatus.SUCCESS,
+            enabled=True,
+            etag='"abc123"',
+            last_modified="Wed, 14 Jan 2026 10:00:00 GMT",
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_feed_sends_conditional_headers(
+        self, tmp_path: Path, cached_feed: Feed
+    ) -> None:
+        """Test that stored validators are sent as conditional headers."""
+        mock_http_client = AsyncMock(spec=HTTPClient)
+        mock_http_client.fetch.return_value = HTTPResponse(
+            status_code=304, content="", headers={}
+        )
+        fetcher = FeedFetcher(tmp_path, http_client=mock_http_client)
+        fetcher.storage.save_feeds(FeedsData(version="1.0", feeds=[cached_feed]))
+
+        await fetcher.fetch_feed(cached_feed.feed_id)
+
+        mock_http_client.fetch.assert_called_once_with(
+            cached_feed.url,
+            headers={
+                "If-None-Match": '"abc123"',
+                "If-Modified-Since": "Wed, 14 Jan 2026 10:00:00 GMT",
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_feed_not_modified_skips_parse_and_storage(
+        self, tmp_path: Path, cached_feed: Feed
+    ) -> None:
+        """Test that a 304 response skips parsing, diffing and item writes."""
+        mock_http_client = AsyncMock(spec=HTTPClient)
+        mock_http_client.fetch.return_value = HTTPResponse(
+            status_code=304, content="", headers={}
+        )
+        mock_parser = Mock(spec=FeedParser)
+        mock_diff_detector = Mock(spec=DiffDetector)
+        fetcher = FeedFetcher(
+            tmp_path,
+            http_client=mock_http_client,
+            parser=mock_parser,
+            diff_detector=mock_diff_detector,
+        )
+        fetcher.storage.save_feeds(FeedsData(version="1.0", feeds=[cached_feed]))
+
+        with patch.object(fetcher.storage, "save_items") as mock_save_items:
+            result = await fetcher.fetch_feed(cached_feed.feed_id)
+
+        assert result.success is True
+        assert result.not_modified is True
+        assert result.new_items == 0
+        mock_parser.parse.assert_not_called()
+        mock_diff_detector.detect_new_items.assert_not_called()
+        mock_save_items.assert_not_called()
+
+        feed = fetcher.storage.load_feeds().feeds[0]
+        assert feed.last_status == FetchStatus.SUCCESS
+        assert feed.etag == '"abc123"'
+
+    @pytest.mark.asyncio
+    async def test_fetch_feed_stores_validators_from_response(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that ETag/Last-Modified response headers are persisted."""
+        feed = Feed(
+            feed_id="new-feed",
+            url="https://example.com/feed.xml",
+            title="New Feed",
+            category="finance",
+            fetch_interval=FetchInterval.DAILY,
+            created_at="2026-01-14T10:00:00+00:00",
+            updated_at="2026-01-14T10:00:00+00:00",
+            last_fetched=None,
+            last_status=FetchStatus.PENDING,
+            enabled=True,
+        )
+        mock_http_client = AsyncMock(spec=HTTPClient)
+        mock_http_client.fetch.return_value = HTTPResponse(
+            status_code=200,
+            content="<rss>...</rss>",
+            headers={"etag": '"v2"', "last-modified": "Thu, 15 Jan 2026 10:00:00 GMT"},
+        )
+        mock_parser = Mock(spec=FeedParser)
+        mock_parser.parse.return_value = []
+        fetcher = FeedFetcher(
+            tmp_path, http_client=mock_http_client, parser=mock_parser
+        )
+        fetcher.storage.save_feeds(FeedsData(version="1.0", feeds=[feed]))
+
+        await fetcher.fetch_feed(feed.feed_id)
+
+        mock_http_client.fetch.assert_called_once_with(feed.url, headers=None)
+        stored = fetcher.storage.load_feeds().feeds[0]
+        assert stored.etag == '"v2"'
+        assert stored.last_modified == "Thu, 15 Jan 2026 10:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_async_uses_one_pooled_session(
+        self, tmp_path: Path, cached_feed: Feed
+    ) -> None:
+        """Test that fetch_all_async fetches every feed inside one session."""
+        client = HTTPClient()
+        fetcher = FeedFetcher(tmp_path, http_client=client)
+        fetcher.storage.save_feeds(FeedsData(version="1.0", feeds=[cached_feed]))
+
+        sessions: list[bool] = []
+
+        async def fake_fetch(url: str, **kwargs: object) -> HTTPResponse:
+            sessions.append(client._client is not None)
+            return HTTPResponse(status_code=304, content="", headers={})
+
+        with patch.object(client, "fetch", side_effect=fake_fetch):
+            results = await fetcher.fetch_all_async()
+
+        assert sessions == [True]
+        assert results[0].not_modified is True
+        assert client._client is None
+
+
 class TestDefaultConstants:
     """Test default constants."""
 
@@ -874,3 +1015,64 @@ class TestLogging:
 
         # Verify the method handled the error correctly
         assert result.success is False
+
+
+class TestFetchFeedSQLiteStorage:
+    """Test fetch_feed with the SQLite storage backend."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_feed_appends_new_items_and_updates_status(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that only new items are inserted and the feed row is updated."""
+        SQLiteStorage(tmp_path)
+        feed = Feed(
+            feed_id="sqlite-feed",
+            url="https://example.com/feed.xml",
+            title="SQLite Feed",
+            category="finance",
+            fetch_interval=FetchInterval.DAILY,
+            created_at="2026-01-14T10:00:00+00:00",
+            updated_at="2026-01-14T10:00:00+00:00",
+            last_fetched=None,
+            last_status=FetchStatus.PENDING,
+            enabled=True,
+        )
+
+        def item(item_id: str) -> FeedItem:
+            return FeedItem(
+                item_id=item_id,
+                title=item_id,
+                link=f"https://example.com/{item_id}",
+                published=None,
+                summary=None,
+                content=None,
+                author=None,
+                fetched_at="2026-01-14T10:00:00+00:00",
+            )
+
+        mock_http_client = AsyncMock(spec=HTTPClient)
+        mock_http_client.fetch.return_value = HTTPResponse(
+            status_code=200, content="<rss>...</rss>", headers={"ETag": '"v2"'}
+        )
+        mock_parser = Mock(spec=FeedParser)
+        mock_parser.parse.return_value = [item("new"), item("old")]
+
+        fetcher = FeedFetcher(
+            tmp_path, http_client=mock_http_client, parser=mock_parser
+        )
+        assert isinstance(fetcher.storage, SQLiteStorage)
+        fetcher.storage.save_feeds(FeedsData(version="1.0", feeds=[feed]))
+        fetcher.storage.append_items(feed.feed_id, [item("old")])
+
+        with patch.object(fetcher.storage, "save_feeds") as mock_save_feeds:
+            result = await fetcher.fetch_feed(feed.feed_id)
+
+        assert (result.success, result.items_count, result.new_items) == (True, 2, 1)
+        mock_save_feeds.assert_not_called()
+        ids = [i.item_id for i in fetcher.storage.load_items(feed.feed_id).items]
+        assert ids == ["new", "old"]
+        stored_feed = fetcher.storage.get_feed(feed.feed_id)
+        assert stored_feed is not None
+        assert stored_feed.last_status == FetchStatus.SUCCESS
+        assert stored_feed.etag == '"v2"'
@@ -0,0 +1 @@
+"""Unit tests for backtest module."""
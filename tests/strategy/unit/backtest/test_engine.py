@@ -0,0 +1,224 @@
+"""Unit tests for BacktestEngine.
+
+Tests for BacktestEngine.run:
+- Equivalence with a naive per-portfolio daily loop
+- Turnover and transaction costs
+- Static (buy-and-hold) weights
+- Rebalance date alignment
+- Error handling
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategy.backtest import BacktestEngine, BacktestResult
+from strategy.errors import ValidationError
+
+TICKERS = ["AAPL", "MSFT", "GOOGL", "AMZN", "META"]
+
+# =============================================================================
+# Test fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def prices() -> pd.DataFrame:
+    """100営業日分の価格データを作成."""
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range("2024-01-01", periods=100)
+    returns = rng.normal(0.0005, 0.02, (len(dates), len(TICKERS)))
+    return pd.DataFrame(
+        100 * np.cumprod(1 + returns, axis=0), index=dates, columns=pd.Index(TICKERS)
+    )
+
+
+def _random_schedule(
+    prices: pd.DataFrame, seed: int, every: int, tickers: list[str]
+) -> pd.DataFrame:
+    """every営業日ごとにランダムな目標ウェイトを持つスケジュールを作成."""
+    rng = np.random.default_rng(seed)
+    dates = prices.index[::every]
+    weights = rng.uniform(0, 1, (len(dates), len(tickers)))
+    weights /= weights.sum(axis=1, keepdims=True)
+    return pd.DataFrame(weights, index=dates, columns=pd.Index(tickers))
+
+
+def _naive_backtest(
+    prices: pd.DataFrame, schedule: pd.DataFrame, cost_bps: float
+) -> tuple[pd.Series, pd.Series]:
+    """1日ずつ保有金額を更新する素朴な参照実装."""
+    holdings = pd.Series(0.0, index=prices.columns)
+    cash = 1.0
+    values: list[float] = []
+    turnover: dict[pd.Timestamp, float] = {}
+    for i, date in enumerate(prices.index):
+        if i > 0:
+            holdings = holdings * prices.iloc[i] / prices.iloc[i - 1]
+        value = cash + holdings.sum()
+        if date in schedule.index:
+            current = holdings / value
+            target = schedule.loc[date].reindex(prices.columns).fillna(0.0)
+            traded = float((target - current).abs().sum())
+            turnover[date] = traded
+            value *= 1 - traded * cost_bps / 10_000
+            holdings = target * value
+            cash = value - holdings.sum()
+        values.append(value)
+    series = pd.Series(values, index=prices.index)
+    start = schedule.index[0]
+    returns = series.pct_change().loc[start:]
+    returns.iloc[0] = series[start] - 1
+    return returns, pd.Series(turnover)
+
+
+# =============================================================================
+# BacktestEngine.run
+# =============================================================================
+
+
+class TestBacktestEngineRun:
+    """BacktestEngine.run のテスト."""
+
+    def test_正常系_素朴な日次ループと同じリターンを返す(
+        self, prices: pd.DataFrame
+    ) -> None:
+        schedules = {
+            "monthly": _random_schedule(prices, seed=1, every=21, tickers=TICKERS),
+            "weekly": _random_schedule(prices, seed=2, every=5, tickers=TICKERS[:3]),
+            "quarterly": _random_schedule(prices, seed=3, every=63, tickers=TICKERS),
+        }
+
+        result = BacktestEngine(transaction_cost_bps=15).run(prices, schedules)
+
+        assert isinstance(result, BacktestResult)
+        assert result.portfolios == ["monthly", "weekly", "quarterly"]
+        for name, schedule in schedules.items():
+            expected_returns, expected_turnover = _naive_backtest(prices, schedule, 15)
+            pd.testing.assert_series_equal(
+                result.returns[name], expected_returns, check_names=False
+            )
+            pd.testing.assert_series_equal(
+                result.turnover[name].loc[schedule.index],
+                expected_turnover,
+                check_names=False,
+                check_freq=False,
+            )
+
+    def test_正常系_リバランスしない日はドリフトしたウェイトを維持する(
+        self, prices: pd.DataFrame
+    ) -> None:
+        schedules = {
+            "monthly": _random_schedule(prices, seed=1, every=21, tickers=TICKERS),
+            "weekly": _random_schedule(prices, seed=2, every=5, tickers=TICKERS),
+        }
+
+        result = BacktestEngine().run(prices, schedules)
+
+        # weekly だけがリバランスする日は monthly の売買は発生しない
+        weekly_only = schedules["weekly"].index.difference(schedules["monthly"].index)
+        assert (result.turnover.loc[weekly_only, "monthly"] == 0).all()
+        assert (result.turnover.loc[weekly_only, "weekly"] > 0).all()
+
+    def test_正常系_初回リバランス前のリターンはNaN(self, prices: pd.DataFrame) -> None:
+        early = _random_schedule(prices, seed=1, every=21, tickers=TICKERS)
+        late = _random_schedule(prices, seed=2, every=21, tickers=TICKERS).iloc[2:]
+
+        result = BacktestEngine().run(prices, {"early": early, "late": late})
+
+        late_start = late.index[0]
+        assert (
+            result.returns.loc[: late_start - pd.Timedelta(days=1), "late"].isna().all()
+        )
+        expected, _ = _naive_backtest(prices, late, 0)
+        pd.testing.assert_series_equal(
+            result.returns["late"].dropna(), expected, check_names=False
+        )
+        summary = result.summary()
+        assert summary.loc["late", "annualized_volatility"] == pytest.approx(
+            expected.std() * np.sqrt(252)
+        )
+
+    def test_正常系_初回の購入もターンオーバーに含まれる(
+        self, prices: pd.DataFrame
+    ) -> None:
+        schedule = _random_schedule(prices, seed=1, every=21, tickers=TICKERS)
+
+        result = BacktestEngine(transaction_cost_bps=10).run(prices, {"p": schedule})
+
+        first = prices.index[0]
+        assert result.turnover.loc[first, "p"] == pytest.approx(1.0)
+        assert result.costs.loc[first, "p"] == pytest.approx(0.001)
+        assert result.returns.loc[first, "p"] == pytest.approx(-0.001)
+
+    def test_正常系_取引コストはリターンを下げる(self, prices: pd.DataFrame) -> None:
+        schedule = _random_schedule(prices, seed=1, every=5, tickers=TICKERS)
+
+        free = BacktestEngine().run(prices, {"p": schedule}).summary()
+        costly = BacktestEngine(transaction_cost_bps=50).run(prices, {"p": schedule})
+
+        summary = costly.summary()
+        assert summary.loc["p", "total_return"] < free.loc["p", "total_return"]
+        assert summary.loc["p", "total_cost"] == pytest.approx(
+            summary.loc["p", "total_turnover"] * 0.005
+        )
+
+    def test_正常系_固定ウェイトは初日に購入して保有する(
+        self, prices: pd.DataFrame
+    ) -> None:
+        weights = {"AAPL": 0.5, "MSFT": 0.3}
+
+        result = BacktestEngine().run(prices, {"static": weights})
+
+        # 現金 20% を含むバイ・アンド・ホールド
+        growth = prices.iloc[-1] / prices.iloc[0]
+        expected = 0.2 + 0.5 * growth["AAPL"] + 0.3 * growth["MSFT"]
+        assert result.equity_curves["static"].iloc[-1] == pytest.approx(expected)
+        assert len(result.turnover) == 1
+        final = result.final_weights.loc["static"]
+        assert final["AAPL"] == pytest.approx(0.5 * growth["AAPL"] / expected)
+
+    def test_正常系_営業日以外のリバランス日は翌営業日に寄せる(
+        self, prices: pd.DataFrame
+    ) -> None:
+        saturday = pd.Timestamp("2024-01-06")
+        schedule = pd.DataFrame({"AAPL": [1.0]}, index=pd.DatetimeIndex([saturday]))
+
+        result = BacktestEngine().run(prices, {"p": schedule})
+
+        assert result.returns.index[0] == pd.Timestamp("2024-01-08")
+        assert list(result.turnover.index) == [pd.Timestamp("2024-01-08")]
+
+    def test_正常系_ドリフト後ウェイトをリバランス日ごとに記録する(
+        self, prices: pd.DataFrame
+    ) -> None:
+        schedule = _random_schedule(prices, seed=1, every=21, tickers=TICKERS)
+
+        result = BacktestEngine().run(prices, {"p": schedule})
+
+        drifted = result.drifted_weights.xs("p", level="portfolio")
+        assert list(drifted.index) == list(schedule.index)
+        assert (drifted.iloc[0] == 0).all()
+        assert drifted.iloc[1].sum() == pytest.approx(1.0)
+
+    def test_異常系_価格にない銘柄でValidationError(self, prices: pd.DataFrame) -> None:
+        with pytest.raises(ValidationError, match="not in prices"):
+            BacktestEngine().run(prices, {"p": {"UNKNOWN": 1.0}})
+
+    def test_異常系_価格期間外のリバランス日のみでValidationError(
+        self, prices: pd.DataFrame
+    ) -> None:
+        schedule = pd.DataFrame({"AAPL": [1.0]}, index=pd.DatetimeIndex(["2030-01-01"]))
+
+        with pytest.raises(ValidationError, match="No rebalance date"):
+            BacktestEngine().run(prices, {"p": schedule})
+
+    def test_異常系_空の入力でValidationError(self, prices: pd.DataFrame) -> None:
+        with pytest.raises(ValidationError, match="prices must not be empty"):
+            BacktestEngine().run(pd.DataFrame(), {"p": {"AAPL": 1.0}})
+        with pytest.raises(ValidationError, match="schedules must not be empty"):
+            BacktestEngine().run(prices, {})
+
+    def test_異常系_負の取引コストでValidationError(self) -> None:
+        with pytest.raises(ValidationError, match="non-negative"):
+            BacktestEngine(transaction_cost_bps=-1)
@@ -9,6 +9,7 @@ RiskCalculator はポートフォリオのリターンデータから各種リ
 """
 
 import math
+from typing import cast
 
 import numpy as np
 import pandas as pd
@@ -836,6 +837,21 @@ class TestVaR:
 
         assert math.isclose(var_95, expected, rel_tol=1e-10)
 
+    def test_正常系_VaRヒストリカルは欠損値を除外する(
+        self,
+        sample_returns: pd.Series,
+    ) -> None:
+        """NaN を含むリターンでも欠損値を除いた VaR を返すことを確認."""
+        with_nan = sample_returns.copy()
+        with_nan.iloc[[3, 10]] = np.nan
+
+        var_95 = RiskCalculator(with_nan).var(confidence=0.95)
+        expected = RiskCalculator(with_nan.dropna()).var(confidence=0.95)
+        table = RiskCalculator.metrics_table(with_nan.to_frame("p"))
+
+        assert math.isclose(var_95, expected, rel_tol=1e-10)
+        assert math.isclose(table.loc["p", "var_95"], var_95, rel_tol=1e-10)
+
     def test_正常系_VaRパラメトリックの計算式が正しい(
         self,
         sample_returns: pd.Series,
@@ -1340,3 +1356,124 @@ class TestBenchmarkMetricsErrors:
 
         with pytest.raises(ValueError, match=r"common|overlapping"):
             calculator.beta(benchmark_returns)
+
+
+class TestMetricsTable:
+    """RiskCalculator.metrics_table（行列モード）のテスト."""
+
+    @pytest.fixture
+    def returns_matrix(self) -> pd.DataFrame:
+        """欠損値やエッジケースを含む日付 × ポートフォリオのリターン行列."""
+        rng = np.random.default_rng(42)
+        dates = pd.date_range("2023-01-02", periods=120, freq="B")
+        frame = pd.DataFrame(
+            rng.normal(0.0005, 0.015, (len(dates), 6)),
+            index=dates,
+            columns=pd.Index([f"p{i}" for i in range(6)]),
+        )
+        frame.iloc[:30, 1] = np.nan  # 遅れて開始
+        frame.iloc[::7, 2] = np.nan  # 散発的な欠損
+        frame["constant"] = 0.001  # 標準偏差ゼロ
+        frame["all_positive"] = np.abs(frame["p0"]) + 1e-4  # 負のリターンなし
+        frame["one_negative"] = frame["all_positive"]
+        frame.iloc[10, frame.columns.get_loc("one_negative")] = -0.01
+        return frame
+
+    @pytest.fixture
+    def benchmark_returns(self, returns_matrix: pd.DataFrame) -> pd.Series:
+        """一部の日付が欠けたベンチマークリターン."""
+        rng = np.random.default_rng(7)
+        series = pd.Series(
+            rng.normal(0.0004, 0.01, len(returns_matrix)), index=returns_matrix.index
+        )
+        return series.loc[np.arange(len(series)) % 11 != 0]
+
+    def test_正常系_列ごとの計算結果と一致する(
+        self,
+        returns_matrix: pd.DataFrame,
+        benchmark_returns: pd.Series,
+    ) -> None:
+        table = RiskCalculator.metrics_table(
+            returns_matrix, benchmark_returns=benchmark_returns, risk_free_rate=0.02
+        )
+
+        assert list(table.index) == list(returns_matrix.columns)
+        for column in returns_matrix.columns:
+            series = cast("pd.Series", returns_matrix[column]).dropna()
+            calc = RiskCalculator(series, risk_free_rate=0.02)
+            expected = {
+                "volatility": calc.volatility(),
+                "sharpe_ratio": calc.sharpe_ratio(),
+                "sortino_ratio": calc.sortino_ratio(),
+                "downside_deviation": calc.downside_deviation(),
+                "max_drawdown": calc.max_drawdown(),
+                "var_95": calc.var(0.95),
+                "var_99": calc.var(0.99),
+                "annualized_return": float(series.mean()) * 252,
+                "cumulative_return": float((1 + series).prod() - 1),
+                "beta": calc.beta(benchmark_returns),
+                "treynor_ratio": calc.treynor_ratio(benchmark_returns),
+                "information_ratio": calc.information_ratio(benchmark_returns),
+            }
+            for metric, value in expected.items():
+                assert table.loc[column, metric] == pytest.approx(
+                    value, rel=1e-9, abs=1e-12, nan_ok=True
+                ), f"{column}.{metric}"
+
+    def test_正常系_パラメトリックVaRが列ごとの計算と一致する(
+        self,
+        returns_matrix: pd.DataFrame,
+    ) -> None:
+        table = RiskCalculator.metrics_table(
+            returns_matrix, var_confidences=(0.9,), var_method="parametric"
+        )
+
+        for column in returns_matrix.columns:
+            calc = RiskCalculator(cast("pd.Series", returns_matrix[column]).dropna())
+            assert table.loc[column, "var_90"] == pytest.approx(
+                calc.var(0.9, method="parametric")
+            )
+
+    def test_正常系_ベンチマークなしでは相対指標を含まない(
+        self,
+        returns_matrix: pd.DataFrame,
+    ) -> None:
+        table = RiskCalculator.metrics_table(returns_matrix)
+
+        assert "beta" not in table.columns
+        assert table.loc["constant", "volatility"] == 0.0
+        assert math.isinf(table.loc["all_positive", "sortino_ratio"])
+        assert table.loc["one_negative", "downside_deviation"] == 0.0
+
+    def test_異常系_空のDataFrameでValueError(self) -> None:
+        with pytest.raises(ValueError, match="returns must not be empty"):
+            RiskCalculator.metrics_table(pd.DataFrame())
+
+    def test_異常系_不正なパラメータでValueError(
+        self,
+        returns_matrix: pd.DataFrame,
+    ) -> None:
+        with pytest.raises(ValueError, match="annualization_factor"):
+            RiskCalculator.metrics_table(returns_matrix, annualization_factor=0)
+
+        with pytest.raises(ValueError, match="method must be"):
+            RiskCalculator.metrics_table(
+                returns_matrix,
+                var_method="invalid",  # type: ignore[arg-type]
+            )
+
+    def test_異常系_共通日付のないベンチマークでValueError(
+        self,
+        returns_matrix: pd.DataFrame,
+    ) -> None:
+        benchmark = pd.Series(
+            0.001, index=pd.date_range("2030-01-01", periods=10, freq="B")
+        )
+
+        with pytest.raises(ValueError, match=r"common|overlapping"):
+            RiskCalculator.metrics_table(returns_matrix, benchmark_returns=benchmark)
+
+        with pytest.raises(ValueError, match=r"benchmark.*empty"):
+            RiskCalculator.metrics_table(
+                returns_matrix, benchmark_returns=pd.Series([], dtype=float)
+            )
@@ -102,6 +102,36 @@ class TestFetchWeeklyReturns:
         assert result == []
         mock_download.assert_not_called()
 
+    @patch("scripts.weekly_comment_data.yf.download")
+    def test_正常系_データ計画から全セクションを1回の取得で読み出せる(
+        self, mock_download: MagicMock
+    ) -> None:
+        from scripts.weekly_comment_data import (
+            INDICES_TICKERS,
+            SECTOR_ETFS,
+            build_data_plan,
+            fetch_weekly_returns,
+        )
+
+        symbols = [*INDICES_TICKERS, *SECTOR_ETFS]
+        dates = pd.date_range("2026-01-07", periods=17, freq="D")
+        mock_df = pd.DataFrame(
+            {("Close", s): [100.0 + i for i in range(17)] for s in symbols},
+            index=dates,
+        )
+        mock_df.columns = pd.MultiIndex.from_tuples(mock_df.columns)
+        mock_download.return_value = mock_df
+
+        start_date, end_date = date(2026, 1, 14), date(2026, 1, 21)
+        data_plan = build_data_plan(start_date, end_date)
+
+        indices = fetch_weekly_returns(INDICES_TICKERS, start_date, end_date, data_plan)
+        sectors = fetch_weekly_returns(SECTOR_ETFS, start_date, end_date, data_plan)
+
+        assert len(indices) == len(INDICES_TICKERS)
+        assert len(sectors) == len(SECTOR_ETFS)
+        mock_download.assert_called_once()
+
 
 class TestCollectIndicesData:
     """Tests for collect_indices_data function."""
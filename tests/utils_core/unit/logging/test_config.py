@@ -20,8 +20,11 @@ Issue #1690: logging/config.py の作成（ログ設定本体）
 4. 重複ハンドラー追加が防止される
 """
 
+import inspect
+import json
 import logging
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -432,6 +435,65 @@ class TestProcessors:
         # 注: テスト環境では正確な呼び出し元情報が取得できない場合がある
         # 実装によっては caller キーが追加されない場合もある
 
+    def test_正常系_呼び出し元の関数と行番号が記録される(self) -> None:
+        from utils_core.logging.config import add_caller_info
+
+        event_dict: dict[str, Any] = {"event": "test"}
+        line = inspect.currentframe().f_lineno + 1  # type: ignore[union-attr]
+        result = add_caller_info(None, None, event_dict)
+
+        assert result["caller"] == {
+            "filename": "test_config.py",
+            "function": "test_正常系_呼び出し元の関数と行番号が記録される",
+            "line": line,
+        }
+
+    def test_正常系_logger経由でもアプリケーションの呼び出し元が記録される(
+        self,
+    ) -> None:
+        import structlog
+
+        from utils_core.logging.config import add_caller_info
+
+        captured: list[dict[str, Any]] = []
+
+        def capture(_: Any, __: str, event_dict: dict[str, Any]) -> str:
+            captured.append(event_dict)
+            return ""
+
+        processors: list[Any] = [add_caller_info, capture]
+        logger = structlog.wrap_logger(
+            structlog.PrintLogger(open(os.devnull, "w")),  # noqa: SIM115
+            processors=processors,
+        )
+        logger.info("event")
+
+        assert captured[0]["caller"]["function"] == (
+            "test_正常系_logger経由でもアプリケーションの呼び出し元が記録される"
+        )
+
+    def test_正常系_標準loggingのレコードは発生元の位置を使う(self) -> None:
+        from utils_core.logging.config import add_caller_info
+
+        record = logging.LogRecord(
+            "app",
+            logging.INFO,
+            "/src/app/service.py",
+            42,
+            "msg",
+            None,
+            None,
+            func="run",
+        )
+        event_dict: dict[str, Any] = {"event": "msg", "_record": record}
+        result = add_caller_info(None, None, event_dict)
+
+        assert result["caller"] == {
+            "filename": "service.py",
+            "function": "run",
+            "line": 42,
+        }
+
     def test_正常系_ログレベルが大文字に変換される(self) -> None:
         from utils_core.logging.config import add_log_level_upper
 
@@ -786,3 +848,101 @@ class TestFileLevelParameter:
             assert file_handler.level == getattr(logging, level), (
                 f"file_level={level} でファイルハンドラーレベルが一致する必要がある"
             )
+
+
+class TestAsyncLogHandler:
+    """AsyncLogHandler と async_file パラメータのテスト."""
+
+    def test_正常系_リスナースレッドでファイルに書き込まれる(
+        self, tmp_path: Path
+    ) -> None:
+        from utils_core.logging.config import AsyncLogHandler
+
+        log_file = tmp_path / "async.log"
+        threads: list[int] = []
+
+        class RecordingHandler(logging.FileHandler):
+            def emit(self, record: logging.LogRecord) -> None:
+                threads.append(threading.get_ident())
+                super().emit(record)
+
+        handler = AsyncLogHandler(RecordingHandler(log_file))
+        test_logger = logging.getLogger("test_async_handler")
+        test_logger.addHandler(handler)
+        test_logger.propagate = False
+        try:
+            test_logger.warning("queued message")
+        finally:
+            test_logger.removeHandler(handler)
+            handler.close()
+
+        assert "queued message" in log_file.read_text()
+        assert threads
+        assert threading.get_ident() not in threads
+
+    def test_正常系_closeは複数回呼んでもエラーにならない(self, tmp_path: Path) -> None:
+        from utils_core.logging.config import AsyncLogHandler
+
+        handler = AsyncLogHandler(logging.FileHandler(tmp_path / "async.log"))
+        handler.close()
+        handler.close()
+
+    def test_正常系_async_fileでファイルハンドラーが非同期になる(
+        self, tmp_path: Path
+    ) -> None:
+        from utils_core.logging.config import (
+            AsyncLogHandler,
+            get_logger,
+            setup_logging,
+        )
+
+        log_file = tmp_path / "async.log"
+        setup_logging(
+            level="WARNING",
+            file_level="DEBUG",
+            format="json",
+            log_file=log_file,
+            async_file=True,
+            force=True,
+        )
+
+        async_handlers = [
+            h for h in logging.root.handlers if isinstance(h, AsyncLogHandler)
+        ]
+        assert len(async_handlers) == 1
+        assert async_handlers[0].level == logging.DEBUG
+
+        get_logger("test.async").debug("async event", key="value")
+        # force で再設定すると既存の非同期ハンドラーは書き出してから閉じられる
+        setup_logging(level="WARNING", force=True)
+
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        event = next(r for r in records if r["event"] == "async event")
+        assert event["key"] == "value"
+        assert event["caller"]["function"] == (
+            "test_正常系_async_fileでファイルハンドラーが非同期になる"
+        )
+
+    def test_正常系_同じファイルで再設定してもハンドラーが重複しない(
+        self, tmp_path: Path
+    ) -> None:
+        from utils_core.logging.config import AsyncLogHandler, setup_logging
+
+        log_file = tmp_path / "async.log"
+        setup_logging(log_file=log_file, async_file=True, force=True)
+        setup_logging(log_file=log_file, async_file=True)
+
+        async_handlers = [
+            h for h in logging.root.handlers if isinstance(h, AsyncLogHandler)
+        ]
+        assert len(async_handlers) == 1
+        setup_logging(force=True)
+
+    def test_正常系_LOG_ASYNC環境変数で非同期になる(self, tmp_path: Path) -> None:
+        from utils_core.logging.config import AsyncLogHandler, setup_logging
+
+        with patch.dict(os.environ, {"LOG_ASYNC": "true"}):
+            setup_logging(log_file=tmp_path / "async.log", force=True)
+
+        assert any(isinstance(h, AsyncLogHandler) for h in logging.root.handlers)
+        setup_logging(force=True)
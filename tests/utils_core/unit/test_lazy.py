@@ -0,0 +1,119 @@
+"""Tests for utils_core.lazy module.
+
+パッケージ ``__init__`` の遅延再エクスポート (lazy_exports) を検証する。
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[3] / "src"
+
+
+@pytest.fixture
+def lazy_package(tmp_path: Path) -> Iterator[str]:
+    """遅延エクスポートを使うテスト用パッケージを作成."""
+    package = tmp_path / "lazy_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        textwrap.dedent(
+            """
+            from utils_core.lazy import lazy_exports
+
+            _EXPORTS = {"Heavy": ".heavy", "helpers": ".helpers"}
+
+            __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+            __all__ = ["Heavy", "helpers"]
+            """
+        )
+    )
+    (package / "heavy.py").write_text("class Heavy:\n    pass\n")
+    (package / "helpers.py").write_text("VALUE = 1\n")
+    (package / "extra.py").write_text("VALUE = 2\n")
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield "lazy_pkg"
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in [m for m in sys.modules if m.split(".")[0] == "lazy_pkg"]:
+            del sys.modules[name]
+
+
+class TestLazyExports:
+    """lazy_exports() のテスト."""
+
+    def test_正常系_属性アクセスまでサブモジュールを読み込まない(
+        self, lazy_package: str
+    ) -> None:
+        package = importlib.import_module(lazy_package)
+
+        assert f"{lazy_package}.heavy" not in sys.modules
+        heavy = package.Heavy
+        assert f"{lazy_package}.heavy" in sys.modules
+        assert heavy is sys.modules[f"{lazy_package}.heavy"].Heavy
+
+    def test_正常系_解決した属性はパッケージにキャッシュされる(
+        self, lazy_package: str
+    ) -> None:
+        package = importlib.import_module(lazy_package)
+
+        first = package.Heavy
+
+        assert vars(package)["Heavy"] is first
+
+    def test_正常系_サブモジュール自体を再エクスポートできる(
+        self, lazy_package: str
+    ) -> None:
+        package = importlib.import_module(lazy_package)
+
+        assert package.helpers.VALUE == 1
+
+    def test_正常系_未登録のサブモジュールも属性として参照できる(
+        self, lazy_package: str
+    ) -> None:
+        package = importlib.import_module(lazy_package)
+
+        assert package.extra.VALUE == 2
+
+    def test_正常系_from_importとdirで公開名を扱える(self, lazy_package: str) -> None:
+        namespace: dict[str, object] = {}
+        exec(f"from {lazy_package} import *", namespace)  # nosec B102
+
+        assert {"Heavy", "helpers"} <= set(namespace)
+        assert {"Heavy", "helpers"} <= set(dir(sys.modules[lazy_package]))
+
+    def test_異常系_存在しない属性でAttributeError(self, lazy_package: str) -> None:
+        package = importlib.import_module(lazy_package)
+
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            _ = package.missing
+
+
+@pytest.mark.parametrize(
+    "package",
+    ["market", "analyze", "factor", "strategy", "news", "edgar", "rss", "notebooklm"],
+)
+def test_正常系_パッケージのimportで重い依存を読み込まない(package: str) -> None:
+    code = textwrap.dedent(
+        f"""
+        import sys
+        import {package}
+        heavy = {{"pandas", "numpy", "yfinance", "plotly", "scipy", "httpx"}}
+        print(sorted(heavy & set(sys.modules)))
+        """
+    )
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,201 @@
+"""Tests for utils_core.rate_limit module.
+
+ホスト単位の共有リクエストスケジューラー (RateScheduler) を検証する。
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from utils_core.rate_limit import RateLimitStats, RateScheduler, get_rate_scheduler
+
+
+class FakeClock:
+    """テスト用の手動で進める単調時計."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateSchedulerReserve:
+    """RateScheduler.reserve() のテスト."""
+
+    def test_正常系_最初のリクエストは待機しない(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+
+        assert scheduler.reserve("example.com", interval=2.0) == 0.0
+
+    def test_正常系_連続リクエストは間隔分待機する(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+
+        scheduler.reserve("example.com", interval=2.0)
+
+        assert scheduler.reserve("example.com", interval=2.0) == pytest.approx(2.0)
+
+    def test_正常系_経過済みの時間を差し引いた残りだけ待機する(self) -> None:
+        clock = FakeClock()
+        scheduler = RateScheduler(clock=clock)
+
+        scheduler.reserve("example.com", interval=2.0)
+        clock.now = 1.5
+
+        assert scheduler.reserve("example.com", interval=2.0) == pytest.approx(0.5)
+
+    def test_正常系_間隔以上空いていれば待機しない(self) -> None:
+        clock = FakeClock()
+        scheduler = RateScheduler(clock=clock)
+
+        scheduler.reserve("example.com", interval=2.0)
+        clock.now = 10.0
+
+        assert scheduler.reserve("example.com", interval=2.0) == 0.0
+
+    def test_正常系_同時リクエストは順番にスロットが割り当てられる(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+
+        waits = [scheduler.reserve("example.com", interval=1.0) for _ in range(4)]
+
+        assert waits == pytest.approx([0.0, 1.0, 2.0, 3.0])
+
+    def test_正常系_burst分は待機なしで送信できる(self) -> None:
+        clock = FakeClock()
+        scheduler = RateScheduler(clock=clock)
+
+        waits = [
+            scheduler.reserve("example.com", interval=1.0, burst=3) for _ in range(5)
+        ]
+
+        # 3件まで即時、その後は1秒間隔
+        assert waits == pytest.approx([0.0, 0.0, 0.0, 1.0, 2.0])
+
+    def test_正常系_アイドル後にburstが回復する(self) -> None:
+        clock = FakeClock()
+        scheduler = RateScheduler(clock=clock)
+        for _ in range(3):
+            scheduler.reserve("example.com", interval=1.0, burst=3)
+
+        clock.now = 10.0
+        waits = [
+            scheduler.reserve("example.com", interval=1.0, burst=3) for _ in range(3)
+        ]
+
+        assert waits == pytest.approx([0.0, 0.0, 0.0])
+
+    def test_正常系_キーごとに独立している(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+
+        scheduler.reserve("a.example.com", interval=5.0)
+
+        assert scheduler.reserve("b.example.com", interval=5.0) == 0.0
+
+    def test_異常系_負のintervalでValueError(self) -> None:
+        scheduler = RateScheduler()
+
+        with pytest.raises(ValueError, match="interval must be >= 0"):
+            scheduler.reserve("example.com", interval=-1.0)
+
+    def test_異常系_burstが1未満でValueError(self) -> None:
+        scheduler = RateScheduler()
+
+        with pytest.raises(ValueError, match="burst must be >= 1"):
+            scheduler.reserve("example.com", interval=1.0, burst=0)
+
+
+class TestRateSchedulerAcquire:
+    """RateScheduler.acquire() / acquire_async() のテスト."""
+
+    def test_正常系_残り時間だけsleepする(self) -> None:
+        clock = FakeClock()
+        scheduler = RateScheduler(clock=clock)
+
+        with patch("utils_core.rate_limit.time.sleep") as mock_sleep:
+            assert scheduler.acquire("example.com", interval=2.0) == 0.0
+            clock.now = 0.5
+            wait = scheduler.acquire("example.com", interval=2.0)
+
+        mock_sleep.assert_called_once_with(pytest.approx(1.5))
+        assert wait == pytest.approx(1.5)
+
+    def test_正常系_非同期版はasyncio_sleepで待機する(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+
+        async def run() -> list[float]:
+            return [
+                await scheduler.acquire_async("example.com", interval=1.0)
+                for _ in range(3)
+            ]
+
+        with patch(
+            "utils_core.rate_limit.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            waits = asyncio.run(run())
+
+        assert waits == pytest.approx([0.0, 1.0, 2.0])
+        assert mock_sleep.await_count == 2
+
+    def test_正常系_スレッド間で重複しないスロットが割り当てられる(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+        waits: list[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            for _ in range(25):
+                wait = scheduler.reserve("example.com", interval=0.1)
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(waits) == pytest.approx([i * 0.1 for i in range(200)])
+
+
+class TestRateSchedulerStats:
+    """RateScheduler.stats() / reset() のテスト."""
+
+    def test_正常系_待機時間の統計を返す(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+        for _ in range(3):
+            scheduler.reserve("example.com", interval=1.0)
+
+        stats = scheduler.stats("example.com")
+
+        assert stats.requests == 3
+        assert stats.waited == 2
+        assert stats.total_wait == pytest.approx(3.0)
+        assert stats.max_wait == pytest.approx(2.0)
+        assert stats.mean_wait == pytest.approx(1.0)
+
+    def test_正常系_未知のキーは空の統計(self) -> None:
+        assert RateScheduler().stats("unknown") == RateLimitStats()
+        assert RateLimitStats().mean_wait == 0.0
+
+    def test_正常系_resetでスロットと統計が消える(self) -> None:
+        scheduler = RateScheduler(clock=FakeClock())
+        scheduler.reserve("a.example.com", interval=1.0)
+        scheduler.reserve("b.example.com", interval=1.0)
+
+        scheduler.reset("a.example.com")
+
+        assert scheduler.stats("a.example.com").requests == 0
+        assert scheduler.reserve("a.example.com", interval=1.0) == 0.0
+        assert scheduler.stats("b.example.com").requests == 1
+
+        scheduler.reset()
+
+        assert scheduler.reserve("b.example.com", interval=1.0) == 0.0
+
+
+class TestGetRateScheduler:
+    """get_rate_scheduler() のテスト."""
+
+    def test_正常系_同じインスタンスを返す(self) -> None:
+        assert get_rate_scheduler() is get_rate_scheduler()